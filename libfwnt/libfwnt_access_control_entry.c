@@ -175,6 +175,14 @@ int libfwnt_internal_access_control_entry_free(
 				result = -1;
 			}
 		}
+		/* The application data of an entry parsed on demand is part of the byte stream
+		 */
+		if( ( ( *internal_access_control_entry )->application_data != NULL )
+		 && ( ( *internal_access_control_entry )->is_lazy == 0 ) )
+		{
+			memory_free(
+			 (uint8_t *) ( *internal_access_control_entry )->application_data );
+		}
 		memory_free(
 		 *internal_access_control_entry );
 
@@ -195,8 +203,12 @@ int libfwnt_access_control_entry_copy_from_byte_stream(
 {
 	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
 	static char *function                                                  = "libfwnt_access_control_entry_copy_from_byte_stream";
+	uint8_t *application_data                                              = NULL;
 	size_t access_mask_offset                                              = 0;
+	size_t application_data_offset                                         = 0;
+	size_t object_flags_offset                                             = 0;
 	size_t sid_offset                                                      = 0;
+	uint8_t has_application_data                                           = 0;
 
 #if defined( HAVE_DEBUG_OUTPUT )
 	system_character_t *sid_string                                         = NULL;
@@ -340,13 +352,19 @@ int libfwnt_access_control_entry_copy_from_byte_stream(
 		case LIBFWNT_ACCESS_DENIED:
 		case LIBFWNT_SYSTEM_AUDIT:
 		case LIBFWNT_SYSTEM_ALARM:
+		case LIBFWNT_SYSTEM_MANDATORY_LABEL:
+			access_mask_offset = 4;
+			sid_offset         = 8;
+			break;
+
+		/* Basic callback types */
 		case LIBFWNT_ACCESS_ALLOWED_CALLBACK:
 		case LIBFWNT_ACCESS_DENIED_CALLBACK:
 		case LIBFWNT_SYSTEM_AUDIT_CALLBACK:
 		case LIBFWNT_SYSTEM_ALARM_CALLBACK:
-		case LIBFWNT_SYSTEM_MANDATORY_LABEL:
-			access_mask_offset = 4;
-			sid_offset         = 8;
+			access_mask_offset   = 4;
+			sid_offset           = 8;
+			has_application_data = 1;
 			break;
 
 		/* Object types */
@@ -354,12 +372,18 @@ int libfwnt_access_control_entry_copy_from_byte_stream(
 		case LIBFWNT_ACCESS_DENIED_OBJECT:
 		case LIBFWNT_SYSTEM_AUDIT_OBJECT:
 		case LIBFWNT_SYSTEM_ALARM_OBJECT:
+			access_mask_offset  = 4;
+			object_flags_offset = 8;
+			break;
+
+		/* Object callback types */
 		case LIBFWNT_ACCESS_ALLOWED_CALLBACK_OBJECT:
 		case LIBFWNT_ACCESS_DENIED_CALLBACK_OBJECT:
 		case LIBFWNT_SYSTEM_AUDIT_CALLBACK_OBJECT:
 		case LIBFWNT_SYSTEM_ALARM_CALLBACK_OBJECT:
-			access_mask_offset = 4;
-			sid_offset         = 40;
+			access_mask_offset   = 4;
+			object_flags_offset  = 8;
+			has_application_data = 1;
 			break;
 
 		/* Unknown types */
@@ -369,6 +393,17 @@ int libfwnt_access_control_entry_copy_from_byte_stream(
 	}
 	if( access_mask_offset > 0 )
 	{
+		if( ( access_mask_offset + 4 ) > (size_t) internal_access_control_entry->size )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: access mask offset value out of bounds.",
+			 function );
+
+			goto on_error;
+		}
 		byte_stream_copy_to_uint32_little_endian(
 		 &( byte_stream[ access_mask_offset ] ),
 		 internal_access_control_entry->access_mask );
@@ -385,6 +420,202 @@ int libfwnt_access_control_entry_copy_from_byte_stream(
 			libcnotify_printf(
 			 "\n" );
 		}
+#endif
+	}
+	/* The object flags indicate which of the object type GUIDs precede the SID
+	 */
+	if( object_flags_offset > 0 )
+	{
+		if( ( object_flags_offset + 4 ) > (size_t) internal_access_control_entry->size )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: object flags offset value out of bounds.",
+			 function );
+
+			goto on_error;
+		}
+		byte_stream_copy_to_uint32_little_endian(
+		 &( byte_stream[ object_flags_offset ] ),
+		 internal_access_control_entry->object_flags );
+
+#if defined( HAVE_DEBUG_OUTPUT )
+		if( libcnotify_verbose != 0 )
+		{
+			libcnotify_printf(
+			 "%s: object flags\t\t: 0x%08" PRIx32 "\n",
+			 function,
+			 internal_access_control_entry->object_flags );
+		}
+#endif
+		sid_offset = object_flags_offset + 4;
+
+		if( ( internal_access_control_entry->object_flags & LIBFWNT_OBJECT_FLAG_OBJECT_TYPE_PRESENT ) != 0 )
+		{
+			if( ( sid_offset + 16 ) > (size_t) internal_access_control_entry->size )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+				 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+				 "%s: object type offset value out of bounds.",
+				 function );
+
+				goto on_error;
+			}
+			if( memory_copy(
+			     internal_access_control_entry->object_type,
+			     &( byte_stream[ sid_offset ] ),
+			     16 ) == NULL )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_MEMORY,
+				 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+				 "%s: unable to copy object type.",
+				 function );
+
+				goto on_error;
+			}
+#if defined( HAVE_DEBUG_OUTPUT )
+			if( libcnotify_verbose != 0 )
+			{
+				libcnotify_printf(
+				 "%s: object type:\n",
+				 function );
+				libcnotify_print_data(
+				 internal_access_control_entry->object_type,
+				 16,
+				 0 );
+			}
+#endif
+			sid_offset += 16;
+		}
+		if( ( internal_access_control_entry->object_flags & LIBFWNT_OBJECT_FLAG_INHERITED_OBJECT_TYPE_PRESENT ) != 0 )
+		{
+			if( ( sid_offset + 16 ) > (size_t) internal_access_control_entry->size )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+				 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+				 "%s: inherited object type offset value out of bounds.",
+				 function );
+
+				goto on_error;
+			}
+			if( memory_copy(
+			     internal_access_control_entry->inherited_object_type,
+			     &( byte_stream[ sid_offset ] ),
+			     16 ) == NULL )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_MEMORY,
+				 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+				 "%s: unable to copy inherited object type.",
+				 function );
+
+				goto on_error;
+			}
+#if defined( HAVE_DEBUG_OUTPUT )
+			if( libcnotify_verbose != 0 )
+			{
+				libcnotify_printf(
+				 "%s: inherited object type:\n",
+				 function );
+				libcnotify_print_data(
+				 internal_access_control_entry->inherited_object_type,
+				 16,
+				 0 );
+			}
+#endif
+			sid_offset += 16;
+		}
+	}
+	/* The application data of callback types follows the SID and fills the remainder of the entry
+	 */
+	if( has_application_data != 0 )
+	{
+		if( ( sid_offset + 8 ) > (size_t) internal_access_control_entry->size )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: security identifier offset value out of bounds.",
+			 function );
+
+			goto on_error;
+		}
+		application_data_offset = sid_offset + 8 + ( 4 * (size_t) byte_stream[ sid_offset + 1 ] );
+
+		if( application_data_offset > (size_t) internal_access_control_entry->size )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: application data offset value out of bounds.",
+			 function );
+
+			goto on_error;
+		}
+		internal_access_control_entry->application_data_size = (size_t) internal_access_control_entry->size - application_data_offset;
+
+		if( internal_access_control_entry->application_data_size > 0 )
+		{
+			if( internal_access_control_entry->is_lazy != 0 )
+			{
+				internal_access_control_entry->application_data = &( byte_stream[ application_data_offset ] );
+			}
+			else
+			{
+				application_data = (uint8_t *) memory_allocate(
+				                                sizeof( uint8_t ) * internal_access_control_entry->application_data_size );
+
+				if( application_data == NULL )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_MEMORY,
+					 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+					 "%s: unable to create application data.",
+					 function );
+
+					goto on_error;
+				}
+				internal_access_control_entry->application_data = application_data;
+
+				if( memory_copy(
+				     application_data,
+				     &( byte_stream[ application_data_offset ] ),
+				     internal_access_control_entry->application_data_size ) == NULL )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_MEMORY,
+					 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+					 "%s: unable to copy application data.",
+					 function );
+
+					goto on_error;
+				}
+			}
+		}
+#if defined( HAVE_DEBUG_OUTPUT )
+		if( libcnotify_verbose != 0 )
+		{
+			libcnotify_printf(
+			 "%s: application data:\n",
+			 function );
+			libcnotify_print_data(
+			 &( byte_stream[ application_data_offset ] ),
+			 internal_access_control_entry->application_data_size,
+			 0 );
+		}
 #endif
 	}
 	if( sid_offset > 0 )
@@ -401,6 +632,16 @@ int libfwnt_access_control_entry_copy_from_byte_stream(
 
 			goto on_error;
 		}
+		if( internal_access_control_entry->is_lazy != 0 )
+		{
+			/* The security identifier is decoded by get_security_identifier
+			 */
+			internal_access_control_entry->data                       = byte_stream;
+			internal_access_control_entry->data_size                  = (size_t) internal_access_control_entry->size;
+			internal_access_control_entry->security_identifier_offset = sid_offset;
+
+			return( 1 );
+		}
 		if( libfwnt_security_identifier_initialize(
 		     &( internal_access_control_entry->security_identifier ),
 		     error ) != 1 )
@@ -538,6 +779,15 @@ on_error:
 		 sid_string );
 	}
 #endif
+	if( application_data != NULL )
+	{
+		memory_free(
+		 application_data );
+
+		internal_access_control_entry->application_data = NULL;
+	}
+	internal_access_control_entry->application_data_size = 0;
+
 	if( internal_access_control_entry->security_identifier != NULL )
 	{
 		libfwnt_internal_security_identifier_free(
@@ -547,18 +797,24 @@ on_error:
 	return( -1 );
 }
 
-/* Retrieves the type
+/* Retrieves the size of the access control entry data
+ * The data size is the size of the header and values without any trailing padding
  * Returns 1 if successful or -1 on error
  */
-int libfwnt_access_control_entry_get_type(
-     libfwnt_access_control_entry_t *access_control_entry,
-     uint8_t *type,
+int libfwnt_internal_access_control_entry_get_data_size(
+     libfwnt_internal_access_control_entry_t *internal_access_control_entry,
+     size_t *data_size,
      libcerror_error_t **error )
 {
-	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
-	static char *function                                                  = "libfwnt_access_control_entry_get_type";
+	libfwnt_security_identifier_t *security_identifier = NULL;
+	static char *function                              = "libfwnt_internal_access_control_entry_get_data_size";
+	size_t safe_data_size                              = 0;
+	size_t security_identifier_size                    = 0;
+	uint8_t has_application_data                       = 0;
+	uint8_t has_object_flags                           = 0;
+	int result                                         = 0;
 
-	if( access_control_entry == NULL )
+	if( internal_access_control_entry == NULL )
 	{
 		libcerror_error_set(
 		 error,
@@ -569,74 +825,142 @@ int libfwnt_access_control_entry_get_type(
 
 		return( -1 );
 	}
-	internal_access_control_entry = (libfwnt_internal_access_control_entry_t *) access_control_entry;
-
-	if( type == NULL )
+	if( data_size == NULL )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
 		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid type.",
+		 "%s: invalid data size.",
 		 function );
 
 		return( -1 );
 	}
-	*type = internal_access_control_entry->type;
+	switch( internal_access_control_entry->type )
+	{
+		case LIBFWNT_ACCESS_ALLOWED:
+		case LIBFWNT_ACCESS_DENIED:
+		case LIBFWNT_SYSTEM_AUDIT:
+		case LIBFWNT_SYSTEM_ALARM:
+		case LIBFWNT_SYSTEM_MANDATORY_LABEL:
+			break;
 
-	return( 1 );
-}
+		case LIBFWNT_ACCESS_ALLOWED_CALLBACK:
+		case LIBFWNT_ACCESS_DENIED_CALLBACK:
+		case LIBFWNT_SYSTEM_AUDIT_CALLBACK:
+		case LIBFWNT_SYSTEM_ALARM_CALLBACK:
+			has_application_data = 1;
+			break;
 
-/* Retrieves the flags
- * Returns 1 if successful or -1 on error
- */
-int libfwnt_access_control_entry_get_flags(
-     libfwnt_access_control_entry_t *access_control_entry,
-     uint8_t *flags,
-     libcerror_error_t **error )
-{
-	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
-	static char *function                                                  = "libfwnt_access_control_entry_get_flags";
+		case LIBFWNT_ACCESS_ALLOWED_OBJECT:
+		case LIBFWNT_ACCESS_DENIED_OBJECT:
+		case LIBFWNT_SYSTEM_AUDIT_OBJECT:
+		case LIBFWNT_SYSTEM_ALARM_OBJECT:
+			has_object_flags = 1;
+			break;
 
-	if( access_control_entry == NULL )
+		case LIBFWNT_ACCESS_ALLOWED_CALLBACK_OBJECT:
+		case LIBFWNT_ACCESS_DENIED_CALLBACK_OBJECT:
+		case LIBFWNT_SYSTEM_AUDIT_CALLBACK_OBJECT:
+		case LIBFWNT_SYSTEM_ALARM_CALLBACK_OBJECT:
+			has_object_flags     = 1;
+			has_application_data = 1;
+			break;
+
+		/* The values of unknown types are not retained
+		 */
+		case LIBFWNT_ACCESS_ALLOWED_COMPOUND:
+		default:
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_UNSUPPORTED_VALUE,
+			 "%s: unsupported access control entry type: 0x%02" PRIx8 ".",
+			 function,
+			 internal_access_control_entry->type );
+
+			return( -1 );
+	}
+	/* The header and access mask
+	 */
+	safe_data_size = 8;
+
+	if( has_object_flags != 0 )
+	{
+		safe_data_size += 4;
+
+		if( ( internal_access_control_entry->object_flags & LIBFWNT_OBJECT_FLAG_OBJECT_TYPE_PRESENT ) != 0 )
+		{
+			safe_data_size += 16;
+		}
+		if( ( internal_access_control_entry->object_flags & LIBFWNT_OBJECT_FLAG_INHERITED_OBJECT_TYPE_PRESENT ) != 0 )
+		{
+			safe_data_size += 16;
+		}
+	}
+	result = libfwnt_access_control_entry_get_security_identifier(
+	          (libfwnt_access_control_entry_t *) internal_access_control_entry,
+	          &security_identifier,
+	          error );
+
+	if( result == -1 )
 	{
 		libcerror_error_set(
 		 error,
-		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid access control entry.",
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve security identifier.",
 		 function );
 
 		return( -1 );
 	}
-	internal_access_control_entry = (libfwnt_internal_access_control_entry_t *) access_control_entry;
+	else if( result == 0 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_MISSING,
+		 "%s: invalid access control entry - missing security identifier.",
+		 function );
 
-	if( flags == NULL )
+		return( -1 );
+	}
+	if( libfwnt_security_identifier_get_size(
+	     security_identifier,
+	     &security_identifier_size,
+	     error ) != 1 )
 	{
 		libcerror_error_set(
 		 error,
-		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid flags.",
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve security identifier size.",
 		 function );
 
 		return( -1 );
 	}
-	*flags = internal_access_control_entry->flags;
+	safe_data_size += security_identifier_size;
+
+	if( has_application_data != 0 )
+	{
+		safe_data_size += internal_access_control_entry->application_data_size;
+	}
+	*data_size = safe_data_size;
 
 	return( 1 );
 }
 
-/* Retrieves the access mask
- * Returns 1 if successful, 0 if not available or -1 on error
+/* Retrieves the size of the access control entry when stored in a byte stream
+ * Returns 1 if successful or -1 on error
  */
-int libfwnt_access_control_entry_get_access_mask(
+int libfwnt_access_control_entry_get_byte_stream_size(
      libfwnt_access_control_entry_t *access_control_entry,
-     uint32_t *access_mask,
+     size_t *byte_stream_size,
      libcerror_error_t **error )
 {
 	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
-	static char *function                                                  = "libfwnt_access_control_entry_get_access_mask";
+	static char *function                                                  = "libfwnt_access_control_entry_get_byte_stream_size";
+	size_t data_size                                                       = 0;
 
 	if( access_control_entry == NULL )
 	{
@@ -651,26 +975,448 @@ int libfwnt_access_control_entry_get_access_mask(
 	}
 	internal_access_control_entry = (libfwnt_internal_access_control_entry_t *) access_control_entry;
 
-	if( access_mask == NULL )
+	if( byte_stream_size == NULL )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
 		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid access mask.",
+		 "%s: invalid byte stream size.",
 		 function );
 
 		return( -1 );
 	}
-	switch( internal_access_control_entry->type )
+	/* An entry parsed on demand is stored as it was read
+	 */
+	if( ( internal_access_control_entry->is_lazy != 0 )
+	 && ( internal_access_control_entry->data != NULL ) )
 	{
-		/* Basic types */
-		case LIBFWNT_ACCESS_ALLOWED:
-		case LIBFWNT_ACCESS_DENIED:
-		case LIBFWNT_SYSTEM_AUDIT:
-		case LIBFWNT_SYSTEM_ALARM:
-		case LIBFWNT_ACCESS_ALLOWED_CALLBACK:
-		case LIBFWNT_ACCESS_DENIED_CALLBACK:
+		*byte_stream_size = internal_access_control_entry->data_size;
+
+		return( 1 );
+	}
+	if( libfwnt_internal_access_control_entry_get_data_size(
+	     internal_access_control_entry,
+	     &data_size,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve data size.",
+		 function );
+
+		return( -1 );
+	}
+	/* Trailing padding in the original entry is retained
+	 */
+	if( data_size < (size_t) internal_access_control_entry->size )
+	{
+		data_size = (size_t) internal_access_control_entry->size;
+	}
+	if( data_size > (size_t) UINT16_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid access control entry - data size value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+	*byte_stream_size = data_size;
+
+	return( 1 );
+}
+
+/* Converts an access control entry into a byte stream
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_access_control_entry_copy_to_byte_stream(
+     libfwnt_access_control_entry_t *access_control_entry,
+     uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
+	libfwnt_security_identifier_t *security_identifier                     = NULL;
+	static char *function                                                  = "libfwnt_access_control_entry_copy_to_byte_stream";
+	size_t byte_stream_offset                                              = 0;
+	size_t entry_size                                                      = 0;
+	size_t security_identifier_size                                        = 0;
+
+	if( access_control_entry == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control entry.",
+		 function );
+
+		return( -1 );
+	}
+	internal_access_control_entry = (libfwnt_internal_access_control_entry_t *) access_control_entry;
+
+	if( byte_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid byte stream.",
+		 function );
+
+		return( -1 );
+	}
+	if( byte_stream_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: byte stream size exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( byte_order != LIBFWNT_ENDIAN_LITTLE )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported byte order.",
+		 function );
+
+		return( -1 );
+	}
+	if( libfwnt_access_control_entry_get_byte_stream_size(
+	     access_control_entry,
+	     &entry_size,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve byte stream size.",
+		 function );
+
+		return( -1 );
+	}
+	if( byte_stream_size < entry_size )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+		 "%s: byte stream too small.",
+		 function );
+
+		return( -1 );
+	}
+	if( ( internal_access_control_entry->is_lazy != 0 )
+	 && ( internal_access_control_entry->data != NULL ) )
+	{
+		if( memory_copy(
+		     byte_stream,
+		     internal_access_control_entry->data,
+		     entry_size ) == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+			 "%s: unable to copy data.",
+			 function );
+
+			return( -1 );
+		}
+		return( 1 );
+	}
+	if( memory_set(
+	     byte_stream,
+	     0,
+	     entry_size ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+		 "%s: unable to clear byte stream.",
+		 function );
+
+		return( -1 );
+	}
+	byte_stream[ 0 ] = internal_access_control_entry->type;
+	byte_stream[ 1 ] = internal_access_control_entry->flags;
+
+	byte_stream_copy_from_uint16_little_endian(
+	 &( byte_stream[ 2 ] ),
+	 (uint16_t) entry_size );
+
+	byte_stream_copy_from_uint32_little_endian(
+	 &( byte_stream[ 4 ] ),
+	 internal_access_control_entry->access_mask );
+
+	byte_stream_offset = 8;
+
+	/* The get_byte_stream_size call has validated that the type is supported
+	 */
+	switch( internal_access_control_entry->type )
+	{
+		case LIBFWNT_ACCESS_ALLOWED_OBJECT:
+		case LIBFWNT_ACCESS_DENIED_OBJECT:
+		case LIBFWNT_SYSTEM_AUDIT_OBJECT:
+		case LIBFWNT_SYSTEM_ALARM_OBJECT:
+		case LIBFWNT_ACCESS_ALLOWED_CALLBACK_OBJECT:
+		case LIBFWNT_ACCESS_DENIED_CALLBACK_OBJECT:
+		case LIBFWNT_SYSTEM_AUDIT_CALLBACK_OBJECT:
+		case LIBFWNT_SYSTEM_ALARM_CALLBACK_OBJECT:
+			byte_stream_copy_from_uint32_little_endian(
+			 &( byte_stream[ byte_stream_offset ] ),
+			 internal_access_control_entry->object_flags );
+
+			byte_stream_offset += 4;
+
+			if( ( internal_access_control_entry->object_flags & LIBFWNT_OBJECT_FLAG_OBJECT_TYPE_PRESENT ) != 0 )
+			{
+				if( memory_copy(
+				     &( byte_stream[ byte_stream_offset ] ),
+				     internal_access_control_entry->object_type,
+				     16 ) == NULL )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_MEMORY,
+					 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+					 "%s: unable to copy object type.",
+					 function );
+
+					return( -1 );
+				}
+				byte_stream_offset += 16;
+			}
+			if( ( internal_access_control_entry->object_flags & LIBFWNT_OBJECT_FLAG_INHERITED_OBJECT_TYPE_PRESENT ) != 0 )
+			{
+				if( memory_copy(
+				     &( byte_stream[ byte_stream_offset ] ),
+				     internal_access_control_entry->inherited_object_type,
+				     16 ) == NULL )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_MEMORY,
+					 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+					 "%s: unable to copy inherited object type.",
+					 function );
+
+					return( -1 );
+				}
+				byte_stream_offset += 16;
+			}
+			break;
+
+		default:
+			break;
+	}
+	if( libfwnt_access_control_entry_get_security_identifier(
+	     access_control_entry,
+	     &security_identifier,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve security identifier.",
+		 function );
+
+		return( -1 );
+	}
+	if( libfwnt_security_identifier_get_size(
+	     security_identifier,
+	     &security_identifier_size,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve security identifier size.",
+		 function );
+
+		return( -1 );
+	}
+	if( libfwnt_security_identifier_copy_to_byte_stream(
+	     security_identifier,
+	     &( byte_stream[ byte_stream_offset ] ),
+	     entry_size - byte_stream_offset,
+	     LIBFWNT_ENDIAN_LITTLE,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+		 "%s: unable to copy security identifier to byte stream.",
+		 function );
+
+		return( -1 );
+	}
+	byte_stream_offset += security_identifier_size;
+
+	/* Only callback types retain application data
+	 */
+	if( ( internal_access_control_entry->application_data != NULL )
+	 && ( internal_access_control_entry->application_data_size > 0 ) )
+	{
+		if( memory_copy(
+		     &( byte_stream[ byte_stream_offset ] ),
+		     internal_access_control_entry->application_data,
+		     internal_access_control_entry->application_data_size ) == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+			 "%s: unable to copy application data.",
+			 function );
+
+			return( -1 );
+		}
+	}
+	return( 1 );
+}
+
+/* Retrieves the type
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_access_control_entry_get_type(
+     libfwnt_access_control_entry_t *access_control_entry,
+     uint8_t *type,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
+	static char *function                                                  = "libfwnt_access_control_entry_get_type";
+
+	if( access_control_entry == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control entry.",
+		 function );
+
+		return( -1 );
+	}
+	internal_access_control_entry = (libfwnt_internal_access_control_entry_t *) access_control_entry;
+
+	if( type == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid type.",
+		 function );
+
+		return( -1 );
+	}
+	*type = internal_access_control_entry->type;
+
+	return( 1 );
+}
+
+/* Retrieves the flags
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_access_control_entry_get_flags(
+     libfwnt_access_control_entry_t *access_control_entry,
+     uint8_t *flags,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
+	static char *function                                                  = "libfwnt_access_control_entry_get_flags";
+
+	if( access_control_entry == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control entry.",
+		 function );
+
+		return( -1 );
+	}
+	internal_access_control_entry = (libfwnt_internal_access_control_entry_t *) access_control_entry;
+
+	if( flags == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid flags.",
+		 function );
+
+		return( -1 );
+	}
+	*flags = internal_access_control_entry->flags;
+
+	return( 1 );
+}
+
+/* Retrieves the access mask
+ * Returns 1 if successful, 0 if not available or -1 on error
+ */
+int libfwnt_access_control_entry_get_access_mask(
+     libfwnt_access_control_entry_t *access_control_entry,
+     uint32_t *access_mask,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
+	static char *function                                                  = "libfwnt_access_control_entry_get_access_mask";
+
+	if( access_control_entry == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control entry.",
+		 function );
+
+		return( -1 );
+	}
+	internal_access_control_entry = (libfwnt_internal_access_control_entry_t *) access_control_entry;
+
+	if( access_mask == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access mask.",
+		 function );
+
+		return( -1 );
+	}
+	switch( internal_access_control_entry->type )
+	{
+		/* Basic types */
+		case LIBFWNT_ACCESS_ALLOWED:
+		case LIBFWNT_ACCESS_DENIED:
+		case LIBFWNT_SYSTEM_AUDIT:
+		case LIBFWNT_SYSTEM_ALARM:
+		case LIBFWNT_ACCESS_ALLOWED_CALLBACK:
+		case LIBFWNT_ACCESS_DENIED_CALLBACK:
 		case LIBFWNT_SYSTEM_AUDIT_CALLBACK:
 		case LIBFWNT_SYSTEM_ALARM_CALLBACK:
 		case LIBFWNT_SYSTEM_MANDATORY_LABEL:
@@ -685,26 +1431,184 @@ int libfwnt_access_control_entry_get_access_mask(
 		case LIBFWNT_SYSTEM_ALARM_CALLBACK_OBJECT:
 			break;
 
-		/* Unknown types */
-		case LIBFWNT_ACCESS_ALLOWED_COMPOUND:
+		/* Unknown types */
+		case LIBFWNT_ACCESS_ALLOWED_COMPOUND:
+		default:
+			return( 0 );
+	}
+	*access_mask = internal_access_control_entry->access_mask;
+
+	return( 1 );
+}
+
+/* Retrieves the security identifier
+ * If the access control entry is parsed on demand the security identifier is decoded on first retrieval
+ * Returns 1 if successful, 0 if not available or -1 on error
+ */
+int libfwnt_access_control_entry_get_security_identifier(
+     libfwnt_access_control_entry_t *access_control_entry,
+     libfwnt_security_identifier_t **security_identifier,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
+	static char *function                                                  = "libfwnt_access_control_entry_get_security_identifier";
+
+	if( access_control_entry == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control entry.",
+		 function );
+
+		return( -1 );
+	}
+	internal_access_control_entry = (libfwnt_internal_access_control_entry_t *) access_control_entry;
+
+	if( security_identifier == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security identifier.",
+		 function );
+
+		return( -1 );
+	}
+	if( *security_identifier != NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid security identifier value already set.",
+		 function );
+
+		return( -1 );
+	}
+	if( ( internal_access_control_entry->security_identifier == NULL )
+	 && ( internal_access_control_entry->security_identifier_offset > 0 ) )
+	{
+		if( internal_access_control_entry->data == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_MISSING,
+			 "%s: invalid access control entry - missing data.",
+			 function );
+
+			return( -1 );
+		}
+		if( internal_access_control_entry->security_identifier_offset > internal_access_control_entry->data_size )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: security identifier offset value out of bounds.",
+			 function );
+
+			return( -1 );
+		}
+		internal_access_control_entry->security_identifier_value.is_managed = 1;
+
+		if( libfwnt_security_identifier_copy_from_byte_stream(
+		     (libfwnt_security_identifier_t *) &( internal_access_control_entry->security_identifier_value ),
+		     &( internal_access_control_entry->data[ internal_access_control_entry->security_identifier_offset ] ),
+		     internal_access_control_entry->data_size - internal_access_control_entry->security_identifier_offset,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+			 "%s: unable to copy security identifier from byte stream.",
+			 function );
+
+			return( -1 );
+		}
+		internal_access_control_entry->security_identifier = (libfwnt_security_identifier_t *) &( internal_access_control_entry->security_identifier_value );
+	}
+	if( internal_access_control_entry->security_identifier == NULL )
+	{
+		return( 0 );
+	}
+	*security_identifier = internal_access_control_entry->security_identifier;
+
+	return( 1 );
+}
+
+/* Retrieves the object flags
+ * Returns 1 if successful, 0 if not available or -1 on error
+ */
+int libfwnt_access_control_entry_get_object_flags(
+     libfwnt_access_control_entry_t *access_control_entry,
+     uint32_t *object_flags,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
+	static char *function                                                  = "libfwnt_access_control_entry_get_object_flags";
+
+	if( access_control_entry == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control entry.",
+		 function );
+
+		return( -1 );
+	}
+	internal_access_control_entry = (libfwnt_internal_access_control_entry_t *) access_control_entry;
+
+	if( object_flags == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid object flags.",
+		 function );
+
+		return( -1 );
+	}
+	switch( internal_access_control_entry->type )
+	{
+		case LIBFWNT_ACCESS_ALLOWED_OBJECT:
+		case LIBFWNT_ACCESS_DENIED_OBJECT:
+		case LIBFWNT_SYSTEM_AUDIT_OBJECT:
+		case LIBFWNT_SYSTEM_ALARM_OBJECT:
+		case LIBFWNT_ACCESS_ALLOWED_CALLBACK_OBJECT:
+		case LIBFWNT_ACCESS_DENIED_CALLBACK_OBJECT:
+		case LIBFWNT_SYSTEM_AUDIT_CALLBACK_OBJECT:
+		case LIBFWNT_SYSTEM_ALARM_CALLBACK_OBJECT:
+			break;
+
 		default:
 			return( 0 );
 	}
-	*access_mask = internal_access_control_entry->access_mask;
+	*object_flags = internal_access_control_entry->object_flags;
 
 	return( 1 );
 }
 
-/* Retrieves the security identifier
+/* Retrieves the object type GUID
+ * The GUID is stored in little-endian
  * Returns 1 if successful, 0 if not available or -1 on error
  */
-int libfwnt_access_control_entry_get_security_identifier(
+int libfwnt_access_control_entry_get_object_type(
      libfwnt_access_control_entry_t *access_control_entry,
-     libfwnt_security_identifier_t **security_identifier,
+     uint8_t *guid_data,
+     size_t guid_data_size,
      libcerror_error_t **error )
 {
 	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
-	static char *function                                                  = "libfwnt_access_control_entry_get_security_identifier";
+	static char *function                                                  = "libfwnt_access_control_entry_get_object_type";
 
 	if( access_control_entry == NULL )
 	{
@@ -719,34 +1623,264 @@ int libfwnt_access_control_entry_get_security_identifier(
 	}
 	internal_access_control_entry = (libfwnt_internal_access_control_entry_t *) access_control_entry;
 
-	if( security_identifier == NULL )
+	if( guid_data == NULL )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
 		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid security identifier.",
+		 "%s: invalid GUID data.",
 		 function );
 
 		return( -1 );
 	}
-	if( *security_identifier != NULL )
+	if( guid_data_size < 16 )
 	{
 		libcerror_error_set(
 		 error,
-		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
-		 "%s: invalid security identifier value already set.",
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+		 "%s: invalid GUID data size value too small.",
 		 function );
 
 		return( -1 );
 	}
-	if( internal_access_control_entry->security_identifier == NULL )
+	if( guid_data_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid GUID data size value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	/* The object flags are only set for object types
+	 */
+	if( ( internal_access_control_entry->object_flags & LIBFWNT_OBJECT_FLAG_OBJECT_TYPE_PRESENT ) == 0 )
 	{
 		return( 0 );
 	}
-	*security_identifier = internal_access_control_entry->security_identifier;
+	if( memory_copy(
+	     guid_data,
+	     internal_access_control_entry->object_type,
+	     16 ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+		 "%s: unable to copy object type.",
+		 function );
+
+		return( -1 );
+	}
+	return( 1 );
+}
+
+/* Retrieves the inherited object type GUID
+ * The GUID is stored in little-endian
+ * Returns 1 if successful, 0 if not available or -1 on error
+ */
+int libfwnt_access_control_entry_get_inherited_object_type(
+     libfwnt_access_control_entry_t *access_control_entry,
+     uint8_t *guid_data,
+     size_t guid_data_size,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
+	static char *function                                                  = "libfwnt_access_control_entry_get_inherited_object_type";
+
+	if( access_control_entry == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control entry.",
+		 function );
+
+		return( -1 );
+	}
+	internal_access_control_entry = (libfwnt_internal_access_control_entry_t *) access_control_entry;
+
+	if( guid_data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid GUID data.",
+		 function );
 
+		return( -1 );
+	}
+	if( guid_data_size < 16 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+		 "%s: invalid GUID data size value too small.",
+		 function );
+
+		return( -1 );
+	}
+	if( guid_data_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid GUID data size value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	/* The object flags are only set for object types
+	 */
+	if( ( internal_access_control_entry->object_flags & LIBFWNT_OBJECT_FLAG_INHERITED_OBJECT_TYPE_PRESENT ) == 0 )
+	{
+		return( 0 );
+	}
+	if( memory_copy(
+	     guid_data,
+	     internal_access_control_entry->inherited_object_type,
+	     16 ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+		 "%s: unable to copy inherited object type.",
+		 function );
+
+		return( -1 );
+	}
+	return( 1 );
+}
+
+/* Retrieves the application data size
+ * Returns 1 if successful, 0 if not available or -1 on error
+ */
+int libfwnt_access_control_entry_get_application_data_size(
+     libfwnt_access_control_entry_t *access_control_entry,
+     size_t *data_size,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
+	static char *function                                                  = "libfwnt_access_control_entry_get_application_data_size";
+
+	if( access_control_entry == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control entry.",
+		 function );
+
+		return( -1 );
+	}
+	internal_access_control_entry = (libfwnt_internal_access_control_entry_t *) access_control_entry;
+
+	if( data_size == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid data size.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_access_control_entry->application_data == NULL )
+	{
+		return( 0 );
+	}
+	*data_size = internal_access_control_entry->application_data_size;
+
+	return( 1 );
+}
+
+/* Retrieves the application data
+ * Returns 1 if successful, 0 if not available or -1 on error
+ */
+int libfwnt_access_control_entry_get_application_data(
+     libfwnt_access_control_entry_t *access_control_entry,
+     uint8_t *data,
+     size_t data_size,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
+	static char *function                                                  = "libfwnt_access_control_entry_get_application_data";
+
+	if( access_control_entry == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control entry.",
+		 function );
+
+		return( -1 );
+	}
+	internal_access_control_entry = (libfwnt_internal_access_control_entry_t *) access_control_entry;
+
+	if( data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid data.",
+		 function );
+
+		return( -1 );
+	}
+	if( data_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid data size value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_access_control_entry->application_data == NULL )
+	{
+		return( 0 );
+	}
+	if( data_size < internal_access_control_entry->application_data_size )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+		 "%s: invalid data size value too small.",
+		 function );
+
+		return( -1 );
+	}
+	if( memory_copy(
+	     data,
+	     internal_access_control_entry->application_data,
+	     internal_access_control_entry->application_data_size ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+		 "%s: unable to copy application data.",
+		 function );
+
+		return( -1 );
+	}
 	return( 1 );
 }
 
@@ -59,9 +59,49 @@ struct libfwnt_internal_access_control_entry
 	 */
 	uint32_t access_mask;
 
+	/* The object flags
+	 */
+	uint32_t object_flags;
+
+	/* The object type GUID
+	 */
+	uint8_t object_type[ 16 ];
+
+	/* The inherited object type GUID
+	 */
+	uint8_t inherited_object_type[ 16 ];
+
 	/* The security identifier
 	 */
 	libfwnt_security_identifier_t *security_identifier;
+
+	/* The application data
+	 */
+	const uint8_t *application_data;
+
+	/* The application data size
+	 */
+	size_t application_data_size;
+
+	/* The data, used when the security identifier is decoded on demand
+	 */
+	const uint8_t *data;
+
+	/* The data size
+	 */
+	size_t data_size;
+
+	/* The security identifier offset relative to the start of the data
+	 */
+	size_t security_identifier_offset;
+
+	/* The security identifier value, used when the security identifier is decoded on demand
+	 */
+	libfwnt_internal_security_identifier_t security_identifier_value;
+
+	/* Value to indicate if the security identifier is decoded on demand
+	 */
+	uint8_t is_lazy;
 };
 
 int libfwnt_access_control_entry_initialize(
@@ -84,6 +124,25 @@ int libfwnt_access_control_entry_copy_from_byte_stream(
      int byte_order,
      libcerror_error_t **error );
 
+int libfwnt_internal_access_control_entry_get_data_size(
+     libfwnt_internal_access_control_entry_t *internal_access_control_entry,
+     size_t *data_size,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_access_control_entry_get_byte_stream_size(
+     libfwnt_access_control_entry_t *access_control_entry,
+     size_t *byte_stream_size,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_access_control_entry_copy_to_byte_stream(
+     libfwnt_access_control_entry_t *access_control_entry,
+     uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     libcerror_error_t **error );
+
 LIBFWNT_EXTERN \
 int libfwnt_access_control_entry_get_type(
      libfwnt_access_control_entry_t *access_control_entry,
@@ -108,6 +167,39 @@ int libfwnt_access_control_entry_get_security_identifier(
      libfwnt_security_identifier_t **security_identifier,
      libcerror_error_t **error );
 
+LIBFWNT_EXTERN \
+int libfwnt_access_control_entry_get_object_flags(
+     libfwnt_access_control_entry_t *access_control_entry,
+     uint32_t *object_flags,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_access_control_entry_get_object_type(
+     libfwnt_access_control_entry_t *access_control_entry,
+     uint8_t *guid_data,
+     size_t guid_data_size,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_access_control_entry_get_inherited_object_type(
+     libfwnt_access_control_entry_t *access_control_entry,
+     uint8_t *guid_data,
+     size_t guid_data_size,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_access_control_entry_get_application_data_size(
+     libfwnt_access_control_entry_t *access_control_entry,
+     size_t *data_size,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_access_control_entry_get_application_data(
+     libfwnt_access_control_entry_t *access_control_entry,
+     uint8_t *data,
+     size_t data_size,
+     libcerror_error_t **error );
+
 #if defined( __cplusplus )
 }
 #endif
@@ -92,6 +92,10 @@ int libfwnt_access_control_list_initialize(
 
 		goto on_error;
 	}
+	/* A new list uses the basic access control list revision
+	 */
+	internal_access_control_list->revision_number = 2;
+
 	*access_control_list = (libfwnt_access_control_list_t *) internal_access_control_list;
 
 	return( 1 );
@@ -112,7 +116,9 @@ int libfwnt_access_control_list_free(
      libfwnt_access_control_list_t **access_control_list,
      libcerror_error_t **error )
 {
-	static char *function = "libfwnt_access_control_list_free";
+	libfwnt_internal_access_control_list_t *internal_access_control_list = NULL;
+	static char *function                                                = "libfwnt_access_control_list_free";
+	int result                                                           = 1;
 
 	if( access_control_list == NULL )
 	{
@@ -127,9 +133,29 @@ int libfwnt_access_control_list_free(
 	}
 	if( *access_control_list != NULL )
 	{
+		internal_access_control_list = (libfwnt_internal_access_control_list_t *) *access_control_list;
+
+		/* A list retrieved from a security descriptor is freed by the descriptor
+		 */
+		if( internal_access_control_list->is_managed == 0 )
+		{
+			if( libfwnt_internal_access_control_list_free(
+			     &internal_access_control_list,
+			     error ) != 1 )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+				 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+				 "%s: unable to free access control list.",
+				 function );
+
+				result = -1;
+			}
+		}
 		*access_control_list = NULL;
 	}
-	return( 1 );
+	return( result );
 }
 
 /* Frees an access control list
@@ -155,22 +181,18 @@ int libfwnt_internal_access_control_list_free(
 	}
 	if( *internal_access_control_list != NULL )
 	{
-		if( ( *internal_access_control_list )->entries_array != NULL )
+		if( libfwnt_internal_access_control_list_clear(
+		     *internal_access_control_list,
+		     error ) != 1 )
 		{
-			if( libcdata_array_free(
-			     &( ( *internal_access_control_list )->entries_array ),
-			     (int (*)(intptr_t **, libcerror_error_t **)) &libfwnt_internal_access_control_entry_free,
-			     error ) != 1 )
-			{
-				libcerror_error_set(
-				 error,
-				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-				 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
-				 "%s: unable to free entries array.",
-				 function );
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+			 "%s: unable to clear access control list.",
+			 function );
 
-				result = -1;
-			}
+			result = -1;
 		}
 		memory_free(
 		 *internal_access_control_list );
@@ -180,6 +202,64 @@ int libfwnt_internal_access_control_list_free(
 	return( result );
 }
 
+/* Clears an access control list
+ * Frees the entries but not the access control list itself, which allows
+ * an access control list embedded in a security descriptor to be cleared
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_access_control_list_clear(
+     libfwnt_internal_access_control_list_t *internal_access_control_list,
+     libcerror_error_t **error )
+{
+	static char *function = "libfwnt_internal_access_control_list_clear";
+	int result            = 1;
+
+	if( internal_access_control_list == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control list.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_access_control_list->entries_array != NULL )
+	{
+		if( libcdata_array_free(
+		     &( internal_access_control_list->entries_array ),
+		     (int (*)(intptr_t **, libcerror_error_t **)) &libfwnt_internal_access_control_entry_free,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+			 "%s: unable to free entries array.",
+			 function );
+
+			result = -1;
+		}
+	}
+	/* The security identifiers of entries parsed on demand are embedded
+	 * so the entries are freed as a single block
+	 */
+	if( internal_access_control_list->entries != NULL )
+	{
+		memory_free(
+		 internal_access_control_list->entries );
+
+		internal_access_control_list->entries = NULL;
+	}
+	internal_access_control_list->entries_data      = NULL;
+	internal_access_control_list->entries_data_size = 0;
+	internal_access_control_list->number_of_entries = 0;
+	internal_access_control_list->is_lazy           = 0;
+
+	return( result );
+}
+
 /* Converts an access control list stored in a byte stream into a runtime version
  * Returns 1 if successful or -1 on error
  */
@@ -190,16 +270,13 @@ int libfwnt_access_control_list_copy_from_byte_stream(
      int byte_order,
      libcerror_error_t **error )
 {
-	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
-	libfwnt_internal_access_control_list_t *internal_access_control_list   = NULL;
-	static char *function                                                  = "libfwnt_access_control_list_copy_from_byte_stream";
-	size_t byte_stream_offset                                              = 0;
-	uint16_t entry_index                                                   = 0;
-	uint16_t number_of_entries                                             = 0;
-	uint16_t size                                                          = 0;
+	libfwnt_internal_access_control_list_t *internal_access_control_list = NULL;
+	static char *function                                                = "libfwnt_access_control_list_copy_from_byte_stream";
+	uint16_t number_of_entries                                           = 0;
+	uint16_t size                                                        = 0;
 
 #if defined( HAVE_DEBUG_OUTPUT )
-	uint16_t value_16bit                                                   = 0;
+	uint16_t value_16bit                                                 = 0;
 #endif
 
 	if( access_control_list == NULL )
@@ -226,6 +303,17 @@ int libfwnt_access_control_list_copy_from_byte_stream(
 
 		return( -1 );
 	}
+	if( internal_access_control_list->is_lazy != 0 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid access control list - entries data value already set.",
+		 function );
+
+		return( -1 );
+	}
 	if( byte_stream == NULL )
 	{
 		libcerror_error_set(
@@ -327,120 +415,50 @@ int libfwnt_access_control_list_copy_from_byte_stream(
 		 "\n" );
 	}
 #endif
-	byte_stream_offset = 8;
-
 /* TODO check bounds of number_of_entries */
-	if( libcdata_array_initialize(
-	     &( internal_access_control_list->entries_array ),
-	     (int) number_of_entries,
+	internal_access_control_list->entries_data      = &( byte_stream[ 8 ] );
+	internal_access_control_list->entries_data_size = byte_stream_size - 8;
+	internal_access_control_list->number_of_entries = number_of_entries;
+
+	if( libfwnt_internal_access_control_list_read_entries_array(
+	     internal_access_control_list,
 	     error ) != 1 )
 	{
 		libcerror_error_set(
 		 error,
-		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-		 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
-		 "%s: unable to create entries array.",
+		 LIBCERROR_ERROR_DOMAIN_IO,
+		 LIBCERROR_IO_ERROR_READ_FAILED,
+		 "%s: unable to read access control entries.",
 		 function );
 
-		goto on_error;
-	}
-	for( entry_index = 0;
-	     entry_index < number_of_entries;
-	     entry_index++ )
-	{
-		if( libfwnt_access_control_entry_initialize(
-		     (libfwnt_access_control_entry_t **) &internal_access_control_entry,
-		     error ) != 1 )
-		{
-			libcerror_error_set(
-			 error,
-			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-			 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
-			 "%s: unable to create access control entry: %" PRIu16 ".",
-			 function,
-			 entry_index );
-
-			goto on_error;
-		}
-		if( libfwnt_access_control_entry_copy_from_byte_stream(
-		     (libfwnt_access_control_entry_t *) internal_access_control_entry,
-		     &( byte_stream[ byte_stream_offset ] ),
-		     byte_stream_size - byte_stream_offset,
-		     byte_order,
-		     error ) != 1 )
-		{
-			libcerror_error_set(
-			 error,
-			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-			 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
-			 "%s: unable to access control entry: %" PRIu16 " from byte stream.",
-			 function,
-			 entry_index );
-
-			goto on_error;
-		}
-		if( (size_t) internal_access_control_entry->size > byte_stream_size )
-
-		{
-			libcerror_error_set(
-			 error,
-			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
-			 "%s: access control entry: %" PRIu16 " size value out of bounds.",
-			 function,
-			 entry_index );
-
-			goto on_error;
-		}
-		byte_stream_offset += internal_access_control_entry->size;
-
-		if( libcdata_array_set_entry_by_index(
-		     internal_access_control_list->entries_array,
-		     (int) entry_index,
-		     (intptr_t *) internal_access_control_entry,
-		     error ) != 1 )
-		{
-			libcerror_error_set(
-			 error,
-			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-			 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
-			 "%s: unable to set access control entry: %" PRIu16 ".",
-			 function,
-			 entry_index );
+		internal_access_control_list->entries_data      = NULL;
+		internal_access_control_list->entries_data_size = 0;
+		internal_access_control_list->number_of_entries = 0;
 
-			goto on_error;
-		}
-		internal_access_control_entry = NULL;
+		return( -1 );
 	}
 	return( 1 );
-
-on_error:
-	if( internal_access_control_entry != NULL )
-	{
-		libfwnt_internal_access_control_entry_free(
-		 &internal_access_control_entry,
-		 NULL );
-	}
-	if( internal_access_control_list->entries_array != NULL )
-	{
-		libcdata_array_free(
-		 &( internal_access_control_list->entries_array ),
-		 (int (*)(intptr_t **, libcerror_error_t **)) &libfwnt_internal_access_control_entry_free,
-		 NULL );
-	}
-	return( -1 );
 }
 
-/* Retrieves the number of access control entries (ACE)
+/* Sets an access control list stored in a byte stream to be parsed on demand
+ * The entry headers are validated but the entries are not decoded until retrieved,
+ * the byte stream must remain available while the access control list is used
  * Returns 1 if successful or -1 on error
  */
-int libfwnt_access_control_list_get_number_of_entries(
+int libfwnt_access_control_list_set_byte_stream(
      libfwnt_access_control_list_t *access_control_list,
-     int *number_of_entries,
+     const uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
      libcerror_error_t **error )
 {
 	libfwnt_internal_access_control_list_t *internal_access_control_list = NULL;
-	static char *function                                                = "libfwnt_access_control_list_get_number_of_entries";
+	static char *function                                                = "libfwnt_access_control_list_set_byte_stream";
+	size_t byte_stream_offset                                            = 0;
+	uint16_t entry_index                                                 = 0;
+	uint16_t entry_size                                                  = 0;
+	uint16_t number_of_entries                                           = 0;
+	uint16_t size                                                        = 0;
 
 	if( access_control_list == NULL )
 	{
@@ -455,61 +473,1305 @@ int libfwnt_access_control_list_get_number_of_entries(
 	}
 	internal_access_control_list = (libfwnt_internal_access_control_list_t *) access_control_list;
 
-	if( libcdata_array_get_number_of_entries(
-	     internal_access_control_list->entries_array,
-	     number_of_entries,
-	     error ) != 1 )
+	if( ( internal_access_control_list->entries_array != NULL )
+	 || ( internal_access_control_list->is_lazy != 0 ) )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
-		 "%s: unable to retrieve number of access control entries in array.",
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid access control list - entries value already set.",
 		 function );
 
 		return( -1 );
 	}
-	return( 1 );
-}
+	if( byte_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid byte stream.",
+		 function );
 
-/* Retrieves a specific access control entries (ACE)
- * Returns 1 if successful or -1 on error
- */
-int libfwnt_access_control_list_get_entry_by_index(
-     libfwnt_access_control_list_t *access_control_list,
-     int entry_index,
-     libfwnt_access_control_entry_t **access_control_entry,
-     libcerror_error_t **error )
-{
-	libfwnt_internal_access_control_list_t *internal_access_control_list = NULL;
-	static char *function                                                = "libfwnt_access_control_list_get_entry_by_index";
+		return( -1 );
+	}
+	if( byte_stream_size < 8 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+		 "%s: byte stream too small.",
+		 function );
 
-	if( access_control_list == NULL )
+		return( -1 );
+	}
+	if( byte_stream_size > (size_t) SSIZE_MAX )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid access control list.",
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: byte stream size exceeds maximum.",
 		 function );
 
 		return( -1 );
 	}
-	internal_access_control_list = (libfwnt_internal_access_control_list_t *) access_control_list;
+	if( byte_order != LIBFWNT_ENDIAN_LITTLE )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported byte order.",
+		 function );
 
-	if( libcdata_array_get_entry_by_index(
-	     internal_access_control_list->entries_array,
-	     entry_index,
-	     (intptr_t **) access_control_entry,
-	     error ) != 1 )
+		return( -1 );
+	}
+	byte_stream_copy_to_uint16_little_endian(
+	 &( byte_stream[ 2 ] ),
+	 size );
+
+	byte_stream_copy_to_uint16_little_endian(
+	 &( byte_stream[ 4 ] ),
+	 number_of_entries );
+
+	if( ( size < 8 )
+	 || ( (size_t) size > byte_stream_size ) )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
-		 "%s: unable to retrieve access control entry: %d from array.",
-		 function,
-		 entry_index );
+		 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: access control list size value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+	/* Walk the entry headers once so that retrieving an entry cannot run past the list
+	 */
+	byte_stream_offset = 8;
+
+	for( entry_index = 0;
+	     entry_index < number_of_entries;
+	     entry_index++ )
+	{
+		if( ( (size_t) size - byte_stream_offset ) < 4 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: access control entry: %" PRIu16 " offset value out of bounds.",
+			 function,
+			 entry_index );
+
+			return( -1 );
+		}
+		byte_stream_copy_to_uint16_little_endian(
+		 &( byte_stream[ byte_stream_offset + 2 ] ),
+		 entry_size );
+
+		if( ( entry_size < 4 )
+		 || ( (size_t) entry_size > ( (size_t) size - byte_stream_offset ) ) )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: access control entry: %" PRIu16 " size value out of bounds.",
+			 function,
+			 entry_index );
+
+			return( -1 );
+		}
+		byte_stream_offset += entry_size;
+	}
+	internal_access_control_list->revision_number   = byte_stream[ 0 ];
+	internal_access_control_list->entries_data      = &( byte_stream[ 8 ] );
+	internal_access_control_list->entries_data_size = (size_t) size - 8;
+	internal_access_control_list->number_of_entries = number_of_entries;
+	internal_access_control_list->is_lazy           = 1;
+
+	return( 1 );
+}
+
+/* Reads the entries of an access control list that is parsed on demand
+ * The entries are stored in a single block, their security identifiers are
+ * decoded when retrieved
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_access_control_list_read_entries(
+     libfwnt_internal_access_control_list_t *internal_access_control_list,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_access_control_entry_t *entries = NULL;
+	static char *function                            = "libfwnt_internal_access_control_list_read_entries";
+	size_t entries_data_offset                       = 0;
+	size_t entries_size                              = 0;
+	uint16_t entry_index                             = 0;
+
+	if( internal_access_control_list == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control list.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_access_control_list->entries != NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid access control list - entries value already set.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_access_control_list->entries_data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_MISSING,
+		 "%s: invalid access control list - missing entries data.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_access_control_list->number_of_entries == 0 )
+	{
+		return( 1 );
+	}
+	entries_size = sizeof( libfwnt_internal_access_control_entry_t ) * internal_access_control_list->number_of_entries;
+
+	entries = (libfwnt_internal_access_control_entry_t *) memory_allocate(
+	                                                       entries_size );
+
+	if( entries == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+		 "%s: unable to create entries.",
+		 function );
+
+		goto on_error;
+	}
+	if( memory_set(
+	     entries,
+	     0,
+	     entries_size ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+		 "%s: unable to clear entries.",
+		 function );
+
+		goto on_error;
+	}
+	for( entry_index = 0;
+	     entry_index < internal_access_control_list->number_of_entries;
+	     entry_index++ )
+	{
+		entries[ entry_index ].is_lazy = 1;
+
+		if( libfwnt_access_control_entry_copy_from_byte_stream(
+		     (libfwnt_access_control_entry_t *) &( entries[ entry_index ] ),
+		     &( internal_access_control_list->entries_data[ entries_data_offset ] ),
+		     internal_access_control_list->entries_data_size - entries_data_offset,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+			 "%s: unable to access control entry: %" PRIu16 " from byte stream.",
+			 function,
+			 entry_index );
+
+			goto on_error;
+		}
+		entries_data_offset += entries[ entry_index ].size;
+	}
+	internal_access_control_list->entries = entries;
+
+	return( 1 );
+
+on_error:
+	if( entries != NULL )
+	{
+		memory_free(
+		 entries );
+	}
+	return( -1 );
+}
+
+/* Reads the entries data of an access control list into an entries array
+ * This converts an access control list that is parsed on demand into one that can be modified,
+ * entries previously retrieved from the list are freed
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_access_control_list_read_entries_array(
+     libfwnt_internal_access_control_list_t *internal_access_control_list,
+     libcerror_error_t **error )
+{
+	libcdata_array_t *entries_array                                        = NULL;
+	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
+	static char *function                                                  = "libfwnt_internal_access_control_list_read_entries_array";
+	size_t entries_data_offset                                             = 0;
+	uint16_t entry_index                                                   = 0;
+
+	if( internal_access_control_list == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control list.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_access_control_list->entries_array != NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid access control list - entries array value already set.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_access_control_list->entries_data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_MISSING,
+		 "%s: invalid access control list - missing entries data.",
+		 function );
+
+		return( -1 );
+	}
+	if( libcdata_array_initialize(
+	     &entries_array,
+	     (int) internal_access_control_list->number_of_entries,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
+		 "%s: unable to create entries array.",
+		 function );
+
+		goto on_error;
+	}
+	for( entry_index = 0;
+	     entry_index < internal_access_control_list->number_of_entries;
+	     entry_index++ )
+	{
+		if( libfwnt_access_control_entry_initialize(
+		     (libfwnt_access_control_entry_t **) &internal_access_control_entry,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
+			 "%s: unable to create access control entry: %" PRIu16 ".",
+			 function,
+			 entry_index );
+
+			goto on_error;
+		}
+		if( libfwnt_access_control_entry_copy_from_byte_stream(
+		     (libfwnt_access_control_entry_t *) internal_access_control_entry,
+		     &( internal_access_control_list->entries_data[ entries_data_offset ] ),
+		     internal_access_control_list->entries_data_size - entries_data_offset,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+			 "%s: unable to access control entry: %" PRIu16 " from byte stream.",
+			 function,
+			 entry_index );
+
+			goto on_error;
+		}
+		entries_data_offset += internal_access_control_entry->size;
+
+		if( libcdata_array_set_entry_by_index(
+		     entries_array,
+		     (int) entry_index,
+		     (intptr_t *) internal_access_control_entry,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+			 "%s: unable to set access control entry: %" PRIu16 ".",
+			 function,
+			 entry_index );
+
+			goto on_error;
+		}
+		internal_access_control_entry = NULL;
+	}
+	/* The security identifiers of entries parsed on demand are embedded
+	 * so the entries are freed as a single block
+	 */
+	if( internal_access_control_list->entries != NULL )
+	{
+		memory_free(
+		 internal_access_control_list->entries );
+
+		internal_access_control_list->entries = NULL;
+	}
+	internal_access_control_list->entries_array     = entries_array;
+	internal_access_control_list->entries_data      = NULL;
+	internal_access_control_list->entries_data_size = 0;
+	internal_access_control_list->number_of_entries = 0;
+	internal_access_control_list->is_lazy           = 0;
+
+	return( 1 );
+
+on_error:
+	if( internal_access_control_entry != NULL )
+	{
+		libfwnt_internal_access_control_entry_free(
+		 &internal_access_control_entry,
+		 NULL );
+	}
+	if( entries_array != NULL )
+	{
+		libcdata_array_free(
+		 &entries_array,
+		 (int (*)(intptr_t **, libcerror_error_t **)) &libfwnt_internal_access_control_entry_free,
+		 NULL );
+	}
+	return( -1 );
+}
+
+/* Retrieves the size of the access control list when stored in a byte stream
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_access_control_list_get_byte_stream_size(
+     libfwnt_access_control_list_t *access_control_list,
+     size_t *byte_stream_size,
+     libcerror_error_t **error )
+{
+	libfwnt_access_control_entry_t *access_control_entry                 = NULL;
+	libfwnt_internal_access_control_list_t *internal_access_control_list = NULL;
+	static char *function                                                = "libfwnt_access_control_list_get_byte_stream_size";
+	size_t entry_size                                                    = 0;
+	size_t safe_byte_stream_size                                         = 0;
+	int entry_index                                                      = 0;
+	int number_of_entries                                                = 0;
+
+	if( access_control_list == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control list.",
+		 function );
+
+		return( -1 );
+	}
+	internal_access_control_list = (libfwnt_internal_access_control_list_t *) access_control_list;
+
+	if( byte_stream_size == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid byte stream size.",
+		 function );
+
+		return( -1 );
+	}
+	/* A list parsed on demand is stored as it was read
+	 */
+	if( internal_access_control_list->is_lazy != 0 )
+	{
+		*byte_stream_size = 8 + internal_access_control_list->entries_data_size;
+
+		return( 1 );
+	}
+	if( libfwnt_access_control_list_get_number_of_entries(
+	     access_control_list,
+	     &number_of_entries,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve number of access control entries.",
+		 function );
+
+		return( -1 );
+	}
+	safe_byte_stream_size = 8;
+
+	for( entry_index = 0;
+	     entry_index < number_of_entries;
+	     entry_index++ )
+	{
+		if( libcdata_array_get_entry_by_index(
+		     internal_access_control_list->entries_array,
+		     entry_index,
+		     (intptr_t **) &access_control_entry,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve access control entry: %d from array.",
+			 function,
+			 entry_index );
+
+			return( -1 );
+		}
+		if( libfwnt_access_control_entry_get_byte_stream_size(
+		     access_control_entry,
+		     &entry_size,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve access control entry: %d byte stream size.",
+			 function,
+			 entry_index );
+
+			return( -1 );
+		}
+		safe_byte_stream_size += entry_size;
+	}
+	if( safe_byte_stream_size > (size_t) UINT16_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid access control list - size value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+	*byte_stream_size = safe_byte_stream_size;
+
+	return( 1 );
+}
+
+/* Converts an access control list into a byte stream
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_access_control_list_copy_to_byte_stream(
+     libfwnt_access_control_list_t *access_control_list,
+     uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     libcerror_error_t **error )
+{
+	libfwnt_access_control_entry_t *access_control_entry                 = NULL;
+	libfwnt_internal_access_control_list_t *internal_access_control_list = NULL;
+	static char *function                                                = "libfwnt_access_control_list_copy_to_byte_stream";
+	size_t byte_stream_offset                                            = 0;
+	size_t entry_size                                                    = 0;
+	size_t list_size                                                     = 0;
+	int entry_index                                                      = 0;
+	int number_of_entries                                                = 0;
+
+	if( access_control_list == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control list.",
+		 function );
+
+		return( -1 );
+	}
+	internal_access_control_list = (libfwnt_internal_access_control_list_t *) access_control_list;
+
+	if( byte_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid byte stream.",
+		 function );
+
+		return( -1 );
+	}
+	if( byte_stream_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: byte stream size exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( byte_order != LIBFWNT_ENDIAN_LITTLE )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported byte order.",
+		 function );
+
+		return( -1 );
+	}
+	if( libfwnt_access_control_list_get_byte_stream_size(
+	     access_control_list,
+	     &list_size,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve byte stream size.",
+		 function );
+
+		return( -1 );
+	}
+	if( byte_stream_size < list_size )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+		 "%s: byte stream too small.",
+		 function );
+
+		return( -1 );
+	}
+	if( libfwnt_access_control_list_get_number_of_entries(
+	     access_control_list,
+	     &number_of_entries,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve number of access control entries.",
+		 function );
+
+		return( -1 );
+	}
+	byte_stream[ 0 ] = internal_access_control_list->revision_number;
+	byte_stream[ 1 ] = 0;
+
+	byte_stream_copy_from_uint16_little_endian(
+	 &( byte_stream[ 2 ] ),
+	 (uint16_t) list_size );
+
+	byte_stream_copy_from_uint16_little_endian(
+	 &( byte_stream[ 4 ] ),
+	 (uint16_t) number_of_entries );
+
+	byte_stream_copy_from_uint16_little_endian(
+	 &( byte_stream[ 6 ] ),
+	 0 );
+
+	if( internal_access_control_list->is_lazy != 0 )
+	{
+		if( memory_copy(
+		     &( byte_stream[ 8 ] ),
+		     internal_access_control_list->entries_data,
+		     internal_access_control_list->entries_data_size ) == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+			 "%s: unable to copy entries data.",
+			 function );
+
+			return( -1 );
+		}
+		return( 1 );
+	}
+	byte_stream_offset = 8;
+
+	for( entry_index = 0;
+	     entry_index < number_of_entries;
+	     entry_index++ )
+	{
+		if( libcdata_array_get_entry_by_index(
+		     internal_access_control_list->entries_array,
+		     entry_index,
+		     (intptr_t **) &access_control_entry,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve access control entry: %d from array.",
+			 function,
+			 entry_index );
+
+			return( -1 );
+		}
+		if( libfwnt_access_control_entry_get_byte_stream_size(
+		     access_control_entry,
+		     &entry_size,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve access control entry: %d byte stream size.",
+			 function,
+			 entry_index );
+
+			return( -1 );
+		}
+		if( libfwnt_access_control_entry_copy_to_byte_stream(
+		     access_control_entry,
+		     &( byte_stream[ byte_stream_offset ] ),
+		     list_size - byte_stream_offset,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+			 "%s: unable to copy access control entry: %d to byte stream.",
+			 function,
+			 entry_index );
+
+			return( -1 );
+		}
+		byte_stream_offset += entry_size;
+	}
+	return( 1 );
+}
+
+/* Retrieves the number of access control entries (ACE)
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_access_control_list_get_number_of_entries(
+     libfwnt_access_control_list_t *access_control_list,
+     int *number_of_entries,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_access_control_list_t *internal_access_control_list = NULL;
+	static char *function                                                = "libfwnt_access_control_list_get_number_of_entries";
+
+	if( access_control_list == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control list.",
+		 function );
+
+		return( -1 );
+	}
+	internal_access_control_list = (libfwnt_internal_access_control_list_t *) access_control_list;
+
+	if( internal_access_control_list->is_lazy != 0 )
+	{
+		if( number_of_entries == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+			 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+			 "%s: invalid number of entries.",
+			 function );
+
+			return( -1 );
+		}
+		*number_of_entries = (int) internal_access_control_list->number_of_entries;
+
+		return( 1 );
+	}
+	/* A new list has no entries array until an entry is inserted
+	 */
+	if( internal_access_control_list->entries_array == NULL )
+	{
+		if( number_of_entries == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+			 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+			 "%s: invalid number of entries.",
+			 function );
+
+			return( -1 );
+		}
+		*number_of_entries = 0;
+
+		return( 1 );
+	}
+	if( libcdata_array_get_number_of_entries(
+	     internal_access_control_list->entries_array,
+	     number_of_entries,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve number of access control entries in array.",
+		 function );
+
+		return( -1 );
+	}
+	return( 1 );
+}
+
+/* Retrieves a specific access control entries (ACE)
+ * If the access control list is parsed on demand the entries are decoded on first retrieval
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_access_control_list_get_entry_by_index(
+     libfwnt_access_control_list_t *access_control_list,
+     int entry_index,
+     libfwnt_access_control_entry_t **access_control_entry,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_access_control_list_t *internal_access_control_list = NULL;
+	static char *function                                                = "libfwnt_access_control_list_get_entry_by_index";
+
+	if( access_control_list == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control list.",
+		 function );
+
+		return( -1 );
+	}
+	internal_access_control_list = (libfwnt_internal_access_control_list_t *) access_control_list;
+
+	if( internal_access_control_list->is_lazy != 0 )
+	{
+		if( ( entry_index < 0 )
+		 || ( entry_index >= (int) internal_access_control_list->number_of_entries ) )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+			 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: invalid entry index value out of bounds.",
+			 function );
+
+			return( -1 );
+		}
+		if( access_control_entry == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+			 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+			 "%s: invalid access control entry.",
+			 function );
+
+			return( -1 );
+		}
+		if( internal_access_control_list->entries == NULL )
+		{
+			if( libfwnt_internal_access_control_list_read_entries(
+			     internal_access_control_list,
+			     error ) != 1 )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+				 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+				 "%s: unable to read access control entries.",
+				 function );
+
+				return( -1 );
+			}
+		}
+		*access_control_entry = (libfwnt_access_control_entry_t *) &( internal_access_control_list->entries[ entry_index ] );
+
+		return( 1 );
+	}
+	if( libcdata_array_get_entry_by_index(
+	     internal_access_control_list->entries_array,
+	     entry_index,
+	     (intptr_t **) access_control_entry,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve access control entry: %d from array.",
+		 function,
+		 entry_index );
+
+		return( -1 );
+	}
+	return( 1 );
+}
+
+/* Inserts an access control entry (ACE) stored in a byte stream at a specific index
+ * If the access control list is parsed on demand its entries are read first,
+ * entries previously retrieved from the list are no longer valid after the insert
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_access_control_list_insert_entry_from_byte_stream(
+     libfwnt_access_control_list_t *access_control_list,
+     int entry_index,
+     const uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
+	libfwnt_internal_access_control_list_t *internal_access_control_list   = NULL;
+	intptr_t *entry                                                        = NULL;
+	static char *function                                                  = "libfwnt_access_control_list_insert_entry_from_byte_stream";
+	size_t data_size                                                       = 0;
+	int array_entry_index                                                  = 0;
+	int number_of_entries                                                  = 0;
+	uint8_t entry_type                                                     = 0;
+
+	if( access_control_list == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control list.",
+		 function );
+
+		return( -1 );
+	}
+	internal_access_control_list = (libfwnt_internal_access_control_list_t *) access_control_list;
+
+	if( libfwnt_access_control_list_get_number_of_entries(
+	     access_control_list,
+	     &number_of_entries,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve number of access control entries.",
+		 function );
+
+		return( -1 );
+	}
+	if( ( entry_index < 0 )
+	 || ( entry_index > number_of_entries ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid entry index value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+	if( number_of_entries >= (int) UINT16_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid number of access control entries value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( libfwnt_access_control_entry_initialize(
+	     (libfwnt_access_control_entry_t **) &internal_access_control_entry,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
+		 "%s: unable to create access control entry.",
+		 function );
+
+		goto on_error;
+	}
+	if( libfwnt_access_control_entry_copy_from_byte_stream(
+	     (libfwnt_access_control_entry_t *) internal_access_control_entry,
+	     byte_stream,
+	     byte_stream_size,
+	     byte_order,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+		 "%s: unable to copy access control entry from byte stream.",
+		 function );
+
+		goto on_error;
+	}
+	/* Make sure the list can be stored again, which fails for unsupported entry types
+	 */
+	if( libfwnt_internal_access_control_entry_get_data_size(
+	     internal_access_control_entry,
+	     &data_size,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve access control entry data size.",
+		 function );
+
+		goto on_error;
+	}
+	entry_type = internal_access_control_entry->type;
+
+	if( internal_access_control_list->is_lazy != 0 )
+	{
+		if( libfwnt_internal_access_control_list_read_entries_array(
+		     internal_access_control_list,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_IO,
+			 LIBCERROR_IO_ERROR_READ_FAILED,
+			 "%s: unable to read access control entries.",
+			 function );
+
+			goto on_error;
+		}
+	}
+	if( internal_access_control_list->entries_array == NULL )
+	{
+		if( libcdata_array_initialize(
+		     &( internal_access_control_list->entries_array ),
+		     0,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
+			 "%s: unable to create entries array.",
+			 function );
+
+			goto on_error;
+		}
+	}
+	if( libcdata_array_resize(
+	     internal_access_control_list->entries_array,
+	     number_of_entries + 1,
+	     (int (*)(intptr_t **, libcerror_error_t **)) &libfwnt_internal_access_control_entry_free,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_RESIZE_FAILED,
+		 "%s: unable to resize entries array.",
+		 function );
+
+		goto on_error;
+	}
+	for( array_entry_index = number_of_entries;
+	     array_entry_index > entry_index;
+	     array_entry_index-- )
+	{
+		if( libcdata_array_get_entry_by_index(
+		     internal_access_control_list->entries_array,
+		     array_entry_index - 1,
+		     &entry,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve access control entry: %d from array.",
+			 function,
+			 array_entry_index - 1 );
+
+			goto on_error;
+		}
+		if( libcdata_array_set_entry_by_index(
+		     internal_access_control_list->entries_array,
+		     array_entry_index,
+		     entry,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+			 "%s: unable to set access control entry: %d in array.",
+			 function,
+			 array_entry_index );
+
+			goto on_error;
+		}
+	}
+	if( libcdata_array_set_entry_by_index(
+	     internal_access_control_list->entries_array,
+	     entry_index,
+	     (intptr_t *) internal_access_control_entry,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to set access control entry: %d in array.",
+		 function,
+		 entry_index );
+
+		goto on_error;
+	}
+	internal_access_control_entry = NULL;
+
+	/* Object entry types require the directory service access control list revision
+	 */
+	switch( entry_type )
+	{
+		case LIBFWNT_ACCESS_ALLOWED_OBJECT:
+		case LIBFWNT_ACCESS_DENIED_OBJECT:
+		case LIBFWNT_SYSTEM_AUDIT_OBJECT:
+		case LIBFWNT_SYSTEM_ALARM_OBJECT:
+		case LIBFWNT_ACCESS_ALLOWED_CALLBACK_OBJECT:
+		case LIBFWNT_ACCESS_DENIED_CALLBACK_OBJECT:
+		case LIBFWNT_SYSTEM_AUDIT_CALLBACK_OBJECT:
+		case LIBFWNT_SYSTEM_ALARM_CALLBACK_OBJECT:
+			if( internal_access_control_list->revision_number < 4 )
+			{
+				internal_access_control_list->revision_number = 4;
+			}
+			break;
+
+		default:
+			break;
+	}
+	return( 1 );
+
+on_error:
+	if( internal_access_control_entry != NULL )
+	{
+		libfwnt_internal_access_control_entry_free(
+		 &internal_access_control_entry,
+		 NULL );
+	}
+	return( -1 );
+}
+
+/* Removes a specific access control entry (ACE)
+ * If the access control list is parsed on demand its entries are read first,
+ * entries previously retrieved from the list are no longer valid after the removal
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_access_control_list_remove_entry(
+     libfwnt_access_control_list_t *access_control_list,
+     int entry_index,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_access_control_entry_t *internal_access_control_entry = NULL;
+	libfwnt_internal_access_control_list_t *internal_access_control_list   = NULL;
+	intptr_t *entry                                                        = NULL;
+	static char *function                                                  = "libfwnt_access_control_list_remove_entry";
+	int array_entry_index                                                  = 0;
+	int number_of_entries                                                  = 0;
+
+	if( access_control_list == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control list.",
+		 function );
+
+		return( -1 );
+	}
+	internal_access_control_list = (libfwnt_internal_access_control_list_t *) access_control_list;
+
+	if( libfwnt_access_control_list_get_number_of_entries(
+	     access_control_list,
+	     &number_of_entries,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve number of access control entries.",
+		 function );
+
+		return( -1 );
+	}
+	if( ( entry_index < 0 )
+	 || ( entry_index >= number_of_entries ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid entry index value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_access_control_list->is_lazy != 0 )
+	{
+		if( libfwnt_internal_access_control_list_read_entries_array(
+		     internal_access_control_list,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_IO,
+			 LIBCERROR_IO_ERROR_READ_FAILED,
+			 "%s: unable to read access control entries.",
+			 function );
+
+			return( -1 );
+		}
+	}
+	if( libcdata_array_get_entry_by_index(
+	     internal_access_control_list->entries_array,
+	     entry_index,
+	     (intptr_t **) &internal_access_control_entry,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve access control entry: %d from array.",
+		 function,
+		 entry_index );
+
+		return( -1 );
+	}
+	for( array_entry_index = entry_index + 1;
+	     array_entry_index < number_of_entries;
+	     array_entry_index++ )
+	{
+		if( libcdata_array_get_entry_by_index(
+		     internal_access_control_list->entries_array,
+		     array_entry_index,
+		     &entry,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve access control entry: %d from array.",
+			 function,
+			 array_entry_index );
+
+			return( -1 );
+		}
+		if( libcdata_array_set_entry_by_index(
+		     internal_access_control_list->entries_array,
+		     array_entry_index - 1,
+		     entry,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+			 "%s: unable to set access control entry: %d in array.",
+			 function,
+			 array_entry_index - 1 );
+
+			return( -1 );
+		}
+	}
+	/* Clear the last entry so that resizing the array does not free it
+	 */
+	if( libcdata_array_set_entry_by_index(
+	     internal_access_control_list->entries_array,
+	     number_of_entries - 1,
+	     NULL,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to set access control entry: %d in array.",
+		 function,
+		 number_of_entries - 1 );
+
+		return( -1 );
+	}
+	if( libcdata_array_resize(
+	     internal_access_control_list->entries_array,
+	     number_of_entries - 1,
+	     (int (*)(intptr_t **, libcerror_error_t **)) &libfwnt_internal_access_control_entry_free,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_RESIZE_FAILED,
+		 "%s: unable to resize entries array.",
+		 function );
+
+		return( -1 );
+	}
+	if( libfwnt_internal_access_control_entry_free(
+	     &internal_access_control_entry,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+		 "%s: unable to free access control entry.",
+		 function );
 
 		return( -1 );
 	}
@@ -25,6 +25,7 @@
 #include <common.h>
 #include <types.h>
 
+#include "libfwnt_access_control_entry.h"
 #include "libfwnt_extern.h"
 #include "libfwnt_libcdata.h"
 #include "libfwnt_libcerror.h"
@@ -50,8 +51,33 @@ struct libfwnt_internal_access_control_list
 	/* The (access control) entries array
 	 */
 	libcdata_array_t *entries_array;
+
+	/* The (access control) entries data, used when the list is parsed on demand
+	 */
+	const uint8_t *entries_data;
+
+	/* The (access control) entries data size
+	 */
+	size_t entries_data_size;
+
+	/* The number of (access control) entries
+	 */
+	uint16_t number_of_entries;
+
+	/* The (access control) entries, used when the list is parsed on demand
+	 */
+	libfwnt_internal_access_control_entry_t *entries;
+
+	/* Value to indicate if the list is parsed on demand
+	 */
+	uint8_t is_lazy;
+
+	/* Value to indicate if the list is managed by the descriptor
+	 */
+	uint8_t is_managed;
 };
 
+LIBFWNT_EXTERN \
 int libfwnt_access_control_list_initialize(
      libfwnt_access_control_list_t **access_control_list,
      libcerror_error_t **error );
@@ -65,6 +91,10 @@ int libfwnt_internal_access_control_list_free(
      libfwnt_internal_access_control_list_t **internal_access_control_list,
      libcerror_error_t **error );
 
+int libfwnt_internal_access_control_list_clear(
+     libfwnt_internal_access_control_list_t *internal_access_control_list,
+     libcerror_error_t **error );
+
 int libfwnt_access_control_list_copy_from_byte_stream(
      libfwnt_access_control_list_t *access_control_list,
      const uint8_t *byte_stream,
@@ -72,6 +102,35 @@ int libfwnt_access_control_list_copy_from_byte_stream(
      int byte_order,
      libcerror_error_t **error );
 
+int libfwnt_access_control_list_set_byte_stream(
+     libfwnt_access_control_list_t *access_control_list,
+     const uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     libcerror_error_t **error );
+
+int libfwnt_internal_access_control_list_read_entries(
+     libfwnt_internal_access_control_list_t *internal_access_control_list,
+     libcerror_error_t **error );
+
+int libfwnt_internal_access_control_list_read_entries_array(
+     libfwnt_internal_access_control_list_t *internal_access_control_list,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_access_control_list_get_byte_stream_size(
+     libfwnt_access_control_list_t *access_control_list,
+     size_t *byte_stream_size,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_access_control_list_copy_to_byte_stream(
+     libfwnt_access_control_list_t *access_control_list,
+     uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     libcerror_error_t **error );
+
 LIBFWNT_EXTERN \
 int libfwnt_access_control_list_get_number_of_entries(
      libfwnt_access_control_list_t *access_control_list,
@@ -85,6 +144,21 @@ int libfwnt_access_control_list_get_entry_by_index(
      libfwnt_access_control_entry_t **access_control_entry,
      libcerror_error_t **error );
 
+LIBFWNT_EXTERN \
+int libfwnt_access_control_list_insert_entry_from_byte_stream(
+     libfwnt_access_control_list_t *access_control_list,
+     int entry_index,
+     const uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_access_control_list_remove_entry(
+     libfwnt_access_control_list_t *access_control_list,
+     int entry_index,
+     libcerror_error_t **error );
+
 #if defined( __cplusplus )
 }
 #endif
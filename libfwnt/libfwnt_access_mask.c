@@ -0,0 +1,108 @@
+/*
+ * Access mask functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <types.h>
+
+#include "libfwnt_access_mask.h"
+#include "libfwnt_definitions.h"
+#include "libfwnt_libcerror.h"
+
+/* Maps the generic rights of access masks to object specific rights
+ * The generic rights of each access mask are replaced by the rights they map to,
+ * the same as MapGenericMask does with a GENERIC_MAPPING of the object class
+ * The rights of all 16 combinations of generic rights are determined upfront,
+ * hence every access mask is mapped with a single table lookup
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_access_mask_map_generic_rights(
+     uint32_t *access_masks,
+     size_t number_of_access_masks,
+     uint32_t generic_read_mapping,
+     uint32_t generic_write_mapping,
+     uint32_t generic_execute_mapping,
+     uint32_t generic_all_mapping,
+     libcerror_error_t **error )
+{
+	uint32_t mapped_rights[ 16 ];
+
+	static char *function    = "libfwnt_access_mask_map_generic_rights";
+	size_t access_mask_index = 0;
+	uint32_t access_mask     = 0;
+	uint8_t generic_rights   = 0;
+
+	if( access_masks == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access masks.",
+		 function );
+
+		return( -1 );
+	}
+	if( number_of_access_masks > (size_t) ( SSIZE_MAX / sizeof( uint32_t ) ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid number of access masks value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	for( generic_rights = 0;
+	     generic_rights < 16;
+	     generic_rights++ )
+	{
+		mapped_rights[ generic_rights ] = 0;
+
+		if( ( generic_rights & ( LIBFWNT_ACCESS_MASK_GENERIC_READ >> 28 ) ) != 0 )
+		{
+			mapped_rights[ generic_rights ] |= generic_read_mapping;
+		}
+		if( ( generic_rights & ( LIBFWNT_ACCESS_MASK_GENERIC_WRITE >> 28 ) ) != 0 )
+		{
+			mapped_rights[ generic_rights ] |= generic_write_mapping;
+		}
+		if( ( generic_rights & ( LIBFWNT_ACCESS_MASK_GENERIC_EXECUTE >> 28 ) ) != 0 )
+		{
+			mapped_rights[ generic_rights ] |= generic_execute_mapping;
+		}
+		if( ( generic_rights & ( LIBFWNT_ACCESS_MASK_GENERIC_ALL >> 28 ) ) != 0 )
+		{
+			mapped_rights[ generic_rights ] |= generic_all_mapping;
+		}
+	}
+	for( access_mask_index = 0;
+	     access_mask_index < number_of_access_masks;
+	     access_mask_index++ )
+	{
+		access_mask = access_masks[ access_mask_index ];
+
+		access_masks[ access_mask_index ] = ( access_mask & 0x0fffffffUL )
+		                                  | mapped_rights[ access_mask >> 28 ];
+	}
+	return( 1 );
+}
+
@@ -0,0 +1,2482 @@
+/*
+ * NTFS compressed attribute functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <memory.h>
+#include <types.h>
+
+#include "libfwnt_compressed_attribute.h"
+#include "libfwnt_definitions.h"
+#include "libfwnt_libcerror.h"
+#include "libfwnt_lznt1.h"
+#include "libfwnt_types.h"
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+#include "libfwnt_libcthreads.h"
+#endif
+
+#define LIBFWNT_COMPRESSED_ATTRIBUTE_DEFAULT_MAXIMUM_CACHE_SIZE		( 1024 * 1024 )
+#define LIBFWNT_COMPRESSED_ATTRIBUTE_MAXIMUM_NUMBER_OF_CACHED_UNITS	4096
+#define LIBFWNT_COMPRESSED_ATTRIBUTE_MINIMUM_COMPRESSION_UNIT_SIZE	4096
+#define LIBFWNT_COMPRESSED_ATTRIBUTE_MAXIMUM_COMPRESSION_UNIT_SIZE	( 1024 * 1024 )
+
+/* Creates a compressed attribute
+ * Make sure the value compressed_attribute is referencing, is set to NULL
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_compressed_attribute_initialize(
+     libfwnt_compressed_attribute_t **compressed_attribute,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_compressed_attribute_t *internal_compressed_attribute = NULL;
+	static char *function                                                  = "libfwnt_compressed_attribute_initialize";
+
+	if( compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	if( *compressed_attribute != NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid compressed attribute value already set.",
+		 function );
+
+		return( -1 );
+	}
+	internal_compressed_attribute = memory_allocate_structure(
+	                                 libfwnt_internal_compressed_attribute_t );
+
+	if( internal_compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+		 "%s: unable to create compressed attribute.",
+		 function );
+
+		goto on_error;
+	}
+	if( memory_set(
+	     internal_compressed_attribute,
+	     0,
+	     sizeof( libfwnt_internal_compressed_attribute_t ) ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+		 "%s: unable to clear compressed attribute.",
+		 function );
+
+		memory_free(
+		 internal_compressed_attribute );
+
+		return( -1 );
+	}
+	internal_compressed_attribute->maximum_cache_size = LIBFWNT_COMPRESSED_ATTRIBUTE_DEFAULT_MAXIMUM_CACHE_SIZE;
+	internal_compressed_attribute->read_ahead         = 1;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_initialize(
+	     &( internal_compressed_attribute->read_write_lock ),
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
+		 "%s: unable to initialize read/write lock.",
+		 function );
+
+		goto on_error;
+	}
+#endif
+	*compressed_attribute = (libfwnt_compressed_attribute_t *) internal_compressed_attribute;
+
+	return( 1 );
+
+on_error:
+	if( internal_compressed_attribute != NULL )
+	{
+		memory_free(
+		 internal_compressed_attribute );
+	}
+	return( -1 );
+}
+
+/* Frees a compressed attribute
+ * The data is referenced and is not freed
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_compressed_attribute_free(
+     libfwnt_compressed_attribute_t **compressed_attribute,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_compressed_attribute_t *internal_compressed_attribute = NULL;
+	static char *function                                                  = "libfwnt_compressed_attribute_free";
+	int result                                                             = 1;
+
+	if( compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	if( *compressed_attribute != NULL )
+	{
+		internal_compressed_attribute = (libfwnt_internal_compressed_attribute_t *) *compressed_attribute;
+		*compressed_attribute         = NULL;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+		/* Make sure the read-ahead thread no longer references the compressed attribute
+		 */
+		if( libfwnt_internal_compressed_attribute_complete_read_ahead(
+		     internal_compressed_attribute,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+			 "%s: unable to complete read-ahead.",
+			 function );
+
+			result = -1;
+		}
+		if( libcthreads_read_write_lock_free(
+		     &( internal_compressed_attribute->read_write_lock ),
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+			 "%s: unable to free read/write lock.",
+			 function );
+
+			result = -1;
+		}
+		if( internal_compressed_attribute->read_ahead_job.compressed_data != NULL )
+		{
+			memory_free(
+			 internal_compressed_attribute->read_ahead_job.compressed_data );
+		}
+		if( internal_compressed_attribute->read_ahead_job.uncompressed_data != NULL )
+		{
+			memory_free(
+			 internal_compressed_attribute->read_ahead_job.uncompressed_data );
+		}
+#endif
+		if( libfwnt_internal_compressed_attribute_free_cache(
+		     internal_compressed_attribute,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+			 "%s: unable to free cache.",
+			 function );
+
+			result = -1;
+		}
+		if( internal_compressed_attribute->compressed_unit_data != NULL )
+		{
+			memory_free(
+			 internal_compressed_attribute->compressed_unit_data );
+		}
+		if( internal_compressed_attribute->extents != NULL )
+		{
+			memory_free(
+			 internal_compressed_attribute->extents );
+		}
+		memory_free(
+		 internal_compressed_attribute );
+	}
+	return( result );
+}
+
+/* Frees the cache entries of a compressed attribute
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_compressed_attribute_free_cache(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     libcerror_error_t **error )
+{
+	static char *function = "libfwnt_internal_compressed_attribute_free_cache";
+	int entry_index       = 0;
+
+	if( internal_compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_compressed_attribute->cache_entries != NULL )
+	{
+		for( entry_index = 0;
+		     entry_index < internal_compressed_attribute->maximum_number_of_cached_units;
+		     entry_index++ )
+		{
+			if( internal_compressed_attribute->cache_entries[ entry_index ].data != NULL )
+			{
+				memory_free(
+				 internal_compressed_attribute->cache_entries[ entry_index ].data );
+			}
+		}
+		memory_free(
+		 internal_compressed_attribute->cache_entries );
+
+		internal_compressed_attribute->cache_entries                  = NULL;
+		internal_compressed_attribute->maximum_number_of_cached_units = 0;
+	}
+	return( 1 );
+}
+
+/* Sets the data of a compressed attribute
+ * The data, such as the content of the volume, is referenced and must remain
+ * available until the compressed attribute is freed. The extents of the attribute
+ * in the data are set with libfwnt_compressed_attribute_append_extent
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_compressed_attribute_set_data(
+     libfwnt_compressed_attribute_t *compressed_attribute,
+     const uint8_t *data,
+     size_t data_size,
+     size64_t uncompressed_data_size,
+     size_t compression_unit_size,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_compressed_attribute_t *internal_compressed_attribute = NULL;
+	static char *function                                                  = "libfwnt_compressed_attribute_set_data";
+	int result                                                             = 1;
+
+	if( compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	internal_compressed_attribute = (libfwnt_internal_compressed_attribute_t *) compressed_attribute;
+
+	if( data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid data.",
+		 function );
+
+		return( -1 );
+	}
+	if( data_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid data size value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( uncompressed_data_size > (size64_t) INT64_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid uncompressed data size value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	/* The compression unit size is a power of 2 multiple of the cluster size
+	 */
+	if( ( compression_unit_size < LIBFWNT_COMPRESSED_ATTRIBUTE_MINIMUM_COMPRESSION_UNIT_SIZE )
+	 || ( compression_unit_size > LIBFWNT_COMPRESSED_ATTRIBUTE_MAXIMUM_COMPRESSION_UNIT_SIZE )
+	 || ( ( compression_unit_size & ( compression_unit_size - 1 ) ) != 0 ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported compression unit size: %" PRIzd ".",
+		 function,
+		 compression_unit_size );
+
+		return( -1 );
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_write(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	if( internal_compressed_attribute->data != NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid compressed attribute - data value already set.",
+		 function );
+
+		result = -1;
+	}
+	else
+	{
+		internal_compressed_attribute->data                   = data;
+		internal_compressed_attribute->data_size              = data_size;
+		internal_compressed_attribute->uncompressed_data_size = uncompressed_data_size;
+		internal_compressed_attribute->compression_unit_size  = compression_unit_size;
+		internal_compressed_attribute->number_of_units        = (size_t) ( uncompressed_data_size / compression_unit_size );
+
+		if( ( uncompressed_data_size % compression_unit_size ) != 0 )
+		{
+			internal_compressed_attribute->number_of_units += 1;
+		}
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_write(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( result );
+}
+
+/* Appends an extent to a compressed attribute
+ * The extents describe the attribute data in order, like the runlist of the attribute.
+ * The data offset is relative to the start of the data and ignored for a sparse extent
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_compressed_attribute_append_extent(
+     libfwnt_compressed_attribute_t *compressed_attribute,
+     off64_t data_offset,
+     size64_t extent_size,
+     uint32_t extent_flags,
+     libcerror_error_t **error )
+{
+	libfwnt_compressed_attribute_extent_t *extent                          = NULL;
+	libfwnt_compressed_attribute_extent_t *extents                         = NULL;
+	libfwnt_internal_compressed_attribute_t *internal_compressed_attribute = NULL;
+	static char *function                                                  = "libfwnt_compressed_attribute_append_extent";
+	int number_of_allocated_entries                                        = 0;
+	int result                                                             = 1;
+
+	if( compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	internal_compressed_attribute = (libfwnt_internal_compressed_attribute_t *) compressed_attribute;
+
+	if( ( extent_size == 0 )
+	 || ( extent_size > (size64_t) INT64_MAX ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid extent size value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+	if( ( extent_flags & ~( LIBFWNT_EXTENT_FLAG_IS_SPARSE ) ) != 0 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported extent flags: 0x%08" PRIx32 ".",
+		 function,
+		 extent_flags );
+
+		return( -1 );
+	}
+	if( ( extent_flags & LIBFWNT_EXTENT_FLAG_IS_SPARSE ) != 0 )
+	{
+		data_offset = 0;
+	}
+	else if( data_offset < 0 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_LESS_THAN_ZERO,
+		 "%s: invalid data offset value less than zero.",
+		 function );
+
+		return( -1 );
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_write(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+	/* The extents are reallocated hence the read-ahead thread must no longer reference them
+	 */
+	if( libfwnt_internal_compressed_attribute_complete_read_ahead(
+	     internal_compressed_attribute,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+		 "%s: unable to complete read-ahead.",
+		 function );
+
+		result = -1;
+	}
+#endif
+	if( result == 1 )
+	{
+		if( internal_compressed_attribute->data == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_MISSING,
+			 "%s: invalid compressed attribute - missing data.",
+			 function );
+
+			result = -1;
+		}
+		else if( ( ( extent_flags & LIBFWNT_EXTENT_FLAG_IS_SPARSE ) == 0 )
+		      && ( ( (size64_t) data_offset > internal_compressed_attribute->data_size )
+		        || ( extent_size > ( internal_compressed_attribute->data_size - (size64_t) data_offset ) ) ) )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+			 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: invalid extent value out of bounds.",
+			 function );
+
+			result = -1;
+		}
+		else if( extent_size > ( (size64_t) INT64_MAX - internal_compressed_attribute->extents_size ) )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+			 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+			 "%s: invalid extent size value exceeds maximum.",
+			 function );
+
+			result = -1;
+		}
+	}
+	if( ( result == 1 )
+	 && ( internal_compressed_attribute->number_of_extents >= internal_compressed_attribute->number_of_allocated_entries ) )
+	{
+		if( internal_compressed_attribute->number_of_allocated_entries == 0 )
+		{
+			number_of_allocated_entries = 16;
+		}
+		else if( internal_compressed_attribute->number_of_allocated_entries <= ( INT_MAX / 2 / (int) sizeof( libfwnt_compressed_attribute_extent_t ) ) )
+		{
+			number_of_allocated_entries = internal_compressed_attribute->number_of_allocated_entries * 2;
+		}
+		if( number_of_allocated_entries == 0 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_EXCEEDS_MAXIMUM,
+			 "%s: invalid number of extents value exceeds maximum.",
+			 function );
+
+			result = -1;
+		}
+		else
+		{
+			extents = (libfwnt_compressed_attribute_extent_t *) memory_reallocate(
+			                                                     internal_compressed_attribute->extents,
+			                                                     sizeof( libfwnt_compressed_attribute_extent_t ) * number_of_allocated_entries );
+
+			if( extents == NULL )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_MEMORY,
+				 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+				 "%s: unable to resize extents.",
+				 function );
+
+				result = -1;
+			}
+			else
+			{
+				internal_compressed_attribute->extents                     = extents;
+				internal_compressed_attribute->number_of_allocated_entries = number_of_allocated_entries;
+			}
+		}
+	}
+	if( result == 1 )
+	{
+		extent = &( internal_compressed_attribute->extents[ internal_compressed_attribute->number_of_extents ] );
+
+		extent->offset      = (off64_t) internal_compressed_attribute->extents_size;
+		extent->data_offset = data_offset;
+		extent->size        = extent_size;
+		extent->flags       = extent_flags;
+
+		internal_compressed_attribute->number_of_extents += 1;
+		internal_compressed_attribute->extents_size      += extent_size;
+
+		/* The extent can change the type of the last compression unit
+		 */
+		if( libfwnt_internal_compressed_attribute_free_cache(
+		     internal_compressed_attribute,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+			 "%s: unable to free cache.",
+			 function );
+
+			result = -1;
+		}
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_write(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( result );
+}
+
+/* Sets the maximum size of the decompressed compression units that are cached
+ * At least 1 compression unit is cached
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_compressed_attribute_set_maximum_cache_size(
+     libfwnt_compressed_attribute_t *compressed_attribute,
+     size_t maximum_cache_size,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_compressed_attribute_t *internal_compressed_attribute = NULL;
+	static char *function                                                  = "libfwnt_compressed_attribute_set_maximum_cache_size";
+	int result                                                             = 1;
+
+	if( compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	internal_compressed_attribute = (libfwnt_internal_compressed_attribute_t *) compressed_attribute;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_write(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+	if( libfwnt_internal_compressed_attribute_complete_read_ahead(
+	     internal_compressed_attribute,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+		 "%s: unable to complete read-ahead.",
+		 function );
+
+		result = -1;
+	}
+#endif
+	if( libfwnt_internal_compressed_attribute_free_cache(
+	     internal_compressed_attribute,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+		 "%s: unable to free cache.",
+		 function );
+
+		result = -1;
+	}
+	internal_compressed_attribute->maximum_cache_size = maximum_cache_size;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_write(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( result );
+}
+
+/* Sets the read-ahead value of a compressed attribute
+ * If set the compressed compression unit that follows a sequential read is decompressed
+ * in a separate thread while the caller processes the data. Read-ahead requires multi-threading
+ * support and is ignored otherwise
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_compressed_attribute_set_read_ahead(
+     libfwnt_compressed_attribute_t *compressed_attribute,
+     uint8_t read_ahead,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_compressed_attribute_t *internal_compressed_attribute = NULL;
+	static char *function                                                  = "libfwnt_compressed_attribute_set_read_ahead";
+
+	if( compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	internal_compressed_attribute = (libfwnt_internal_compressed_attribute_t *) compressed_attribute;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_write(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	internal_compressed_attribute->read_ahead = read_ahead;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_write(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( 1 );
+}
+
+/* Retrieves the index of the extent that contains a specific offset in the attribute data
+ * Returns 1 if successful, 0 if no such extent or -1 on error
+ */
+int libfwnt_internal_compressed_attribute_get_extent_index(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     off64_t offset,
+     int *extent_index,
+     libcerror_error_t **error )
+{
+	libfwnt_compressed_attribute_extent_t *extent = NULL;
+	static char *function                         = "libfwnt_internal_compressed_attribute_get_extent_index";
+	int first_extent_index                        = 0;
+	int last_extent_index                         = 0;
+	int middle_extent_index                       = 0;
+
+	if( internal_compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	if( extent_index == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid extent index.",
+		 function );
+
+		return( -1 );
+	}
+	if( ( offset < 0 )
+	 || ( (size64_t) offset >= internal_compressed_attribute->extents_size ) )
+	{
+		return( 0 );
+	}
+	/* The extents are stored in order of their offset
+	 */
+	last_extent_index = internal_compressed_attribute->number_of_extents - 1;
+
+	while( first_extent_index < last_extent_index )
+	{
+		middle_extent_index = first_extent_index + ( ( last_extent_index - first_extent_index + 1 ) / 2 );
+
+		extent = &( internal_compressed_attribute->extents[ middle_extent_index ] );
+
+		if( offset < extent->offset )
+		{
+			last_extent_index = middle_extent_index - 1;
+		}
+		else
+		{
+			first_extent_index = middle_extent_index;
+		}
+	}
+	*extent_index = first_extent_index;
+
+	return( 1 );
+}
+
+/* Determines the type of a compression unit from the extents it consists of
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_compressed_attribute_get_unit_type(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     size_t unit_index,
+     int *unit_type,
+     libcerror_error_t **error )
+{
+	libfwnt_compressed_attribute_extent_t *extent = NULL;
+	static char *function                         = "libfwnt_internal_compressed_attribute_get_unit_type";
+	size64_t allocated_size                       = 0;
+	size64_t overlap_size                         = 0;
+	off64_t overlap_offset                        = 0;
+	off64_t unit_end_offset                       = 0;
+	off64_t unit_offset                           = 0;
+	int extent_index                              = 0;
+	int result                                    = 0;
+
+	if( internal_compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	if( unit_type == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid unit type.",
+		 function );
+
+		return( -1 );
+	}
+	unit_offset     = (off64_t) unit_index * internal_compressed_attribute->compression_unit_size;
+	unit_end_offset = unit_offset + internal_compressed_attribute->compression_unit_size;
+
+	if( (size64_t) unit_end_offset > internal_compressed_attribute->extents_size )
+	{
+		unit_end_offset = (off64_t) internal_compressed_attribute->extents_size;
+	}
+	result = libfwnt_internal_compressed_attribute_get_extent_index(
+	          internal_compressed_attribute,
+	          unit_offset,
+	          &extent_index,
+	          error );
+
+	if( result != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve extent of compression unit: %" PRIzd ".",
+		 function,
+		 unit_index );
+
+		return( -1 );
+	}
+	while( extent_index < internal_compressed_attribute->number_of_extents )
+	{
+		extent = &( internal_compressed_attribute->extents[ extent_index ] );
+
+		if( extent->offset >= unit_end_offset )
+		{
+			break;
+		}
+		if( ( extent->flags & LIBFWNT_EXTENT_FLAG_IS_SPARSE ) == 0 )
+		{
+			overlap_offset = extent->offset;
+
+			if( overlap_offset < unit_offset )
+			{
+				overlap_offset = unit_offset;
+			}
+			overlap_size = extent->size - (size64_t) ( overlap_offset - extent->offset );
+
+			if( overlap_size > (size64_t) ( unit_end_offset - overlap_offset ) )
+			{
+				overlap_size = (size64_t) ( unit_end_offset - overlap_offset );
+			}
+			allocated_size += overlap_size;
+		}
+		extent_index++;
+	}
+	if( allocated_size == 0 )
+	{
+		*unit_type = LIBFWNT_COMPRESSION_UNIT_TYPE_SPARSE;
+	}
+	else if( allocated_size == (size64_t) ( unit_end_offset - unit_offset ) )
+	{
+		*unit_type = LIBFWNT_COMPRESSION_UNIT_TYPE_UNCOMPRESSED;
+	}
+	else
+	{
+		*unit_type = LIBFWNT_COMPRESSION_UNIT_TYPE_COMPRESSED;
+	}
+	return( 1 );
+}
+
+/* Copies attribute data as stored in the extents, sparse extents are filled with 0-byte values
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_compressed_attribute_copy_extents_data(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     off64_t offset,
+     uint8_t *buffer,
+     size_t size,
+     libcerror_error_t **error )
+{
+	libfwnt_compressed_attribute_extent_t *extent = NULL;
+	static char *function                         = "libfwnt_internal_compressed_attribute_copy_extents_data";
+	size64_t copy_size                            = 0;
+	size64_t extent_data_offset                   = 0;
+	size_t buffer_offset                          = 0;
+	int extent_index                              = 0;
+	int result                                    = 0;
+
+	if( internal_compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	if( buffer == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid buffer.",
+		 function );
+
+		return( -1 );
+	}
+	if( size == 0 )
+	{
+		return( 1 );
+	}
+	result = libfwnt_internal_compressed_attribute_get_extent_index(
+	          internal_compressed_attribute,
+	          offset,
+	          &extent_index,
+	          error );
+
+	if( result != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve extent of offset: %" PRIi64 ".",
+		 function,
+		 offset );
+
+		return( -1 );
+	}
+	while( buffer_offset < size )
+	{
+		if( extent_index >= internal_compressed_attribute->number_of_extents )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: invalid size value out of bounds.",
+			 function );
+
+			return( -1 );
+		}
+		extent = &( internal_compressed_attribute->extents[ extent_index ] );
+
+		extent_data_offset = (size64_t) ( offset - extent->offset );
+		copy_size          = extent->size - extent_data_offset;
+
+		if( copy_size > (size64_t) ( size - buffer_offset ) )
+		{
+			copy_size = (size64_t) ( size - buffer_offset );
+		}
+		if( ( extent->flags & LIBFWNT_EXTENT_FLAG_IS_SPARSE ) != 0 )
+		{
+			if( memory_set(
+			     &( buffer[ buffer_offset ] ),
+			     0,
+			     (size_t) copy_size ) == NULL )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_MEMORY,
+				 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+				 "%s: unable to clear sparse data.",
+				 function );
+
+				return( -1 );
+			}
+		}
+		else
+		{
+			if( memory_copy(
+			     &( buffer[ buffer_offset ] ),
+			     &( internal_compressed_attribute->data[ extent->data_offset + extent_data_offset ] ),
+			     (size_t) copy_size ) == NULL )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_MEMORY,
+				 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+				 "%s: unable to copy extent: %d data.",
+				 function,
+				 extent_index );
+
+				return( -1 );
+			}
+		}
+		buffer_offset += (size_t) copy_size;
+		offset        += (off64_t) copy_size;
+
+		extent_index++;
+	}
+	return( 1 );
+}
+
+/* Decompresses a compressed compression unit
+ * The compressed data is used to gather the compressed data when it is stored in multiple
+ * extents, both the compressed and uncompressed data must be of the compression unit size
+ * Only data that does not change after the extents are set is accessed, hence this function
+ * can be used by the read-ahead thread
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_compressed_attribute_decompress_unit(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     size_t unit_index,
+     uint8_t *compressed_data,
+     uint8_t *uncompressed_data,
+     libcerror_error_t **error )
+{
+	libfwnt_compressed_attribute_extent_t *extent = NULL;
+	const uint8_t *extent_data                    = NULL;
+	const uint8_t *unit_data                      = NULL;
+	static char *function                         = "libfwnt_internal_compressed_attribute_decompress_unit";
+	size_t compressed_data_size                   = 0;
+	size_t uncompressed_data_size                 = 0;
+	size64_t overlap_size                         = 0;
+	off64_t overlap_offset                        = 0;
+	off64_t unit_end_offset                       = 0;
+	off64_t unit_offset                           = 0;
+	int extent_index                              = 0;
+	int result                                    = 0;
+
+	if( internal_compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	if( compressed_data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed data.",
+		 function );
+
+		return( -1 );
+	}
+	if( uncompressed_data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid uncompressed data.",
+		 function );
+
+		return( -1 );
+	}
+	unit_offset     = (off64_t) unit_index * internal_compressed_attribute->compression_unit_size;
+	unit_end_offset = unit_offset + internal_compressed_attribute->compression_unit_size;
+
+	if( (size64_t) unit_end_offset > internal_compressed_attribute->extents_size )
+	{
+		unit_end_offset = (off64_t) internal_compressed_attribute->extents_size;
+	}
+	result = libfwnt_internal_compressed_attribute_get_extent_index(
+	          internal_compressed_attribute,
+	          unit_offset,
+	          &extent_index,
+	          error );
+
+	if( result != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve extent of compression unit: %" PRIzd ".",
+		 function,
+		 unit_index );
+
+		return( -1 );
+	}
+	/* The compressed data is used as-is when it is stored in a single extent
+	 * and otherwise gathered into the compressed data buffer
+	 */
+	while( extent_index < internal_compressed_attribute->number_of_extents )
+	{
+		extent = &( internal_compressed_attribute->extents[ extent_index ] );
+
+		if( extent->offset >= unit_end_offset )
+		{
+			break;
+		}
+		if( ( extent->flags & LIBFWNT_EXTENT_FLAG_IS_SPARSE ) == 0 )
+		{
+			overlap_offset = extent->offset;
+
+			if( overlap_offset < unit_offset )
+			{
+				overlap_offset = unit_offset;
+			}
+			overlap_size = extent->size - (size64_t) ( overlap_offset - extent->offset );
+
+			if( overlap_size > (size64_t) ( unit_end_offset - overlap_offset ) )
+			{
+				overlap_size = (size64_t) ( unit_end_offset - overlap_offset );
+			}
+			extent_data = &( internal_compressed_attribute->data[ extent->data_offset + ( overlap_offset - extent->offset ) ] );
+
+			if( compressed_data_size == 0 )
+			{
+				unit_data = extent_data;
+			}
+			else
+			{
+				if( unit_data != compressed_data )
+				{
+					if( memory_copy(
+					     compressed_data,
+					     unit_data,
+					     compressed_data_size ) == NULL )
+					{
+						libcerror_error_set(
+						 error,
+						 LIBCERROR_ERROR_DOMAIN_MEMORY,
+						 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+						 "%s: unable to copy compressed data.",
+						 function );
+
+						return( -1 );
+					}
+					unit_data = compressed_data;
+				}
+				if( memory_copy(
+				     &( compressed_data[ compressed_data_size ] ),
+				     extent_data,
+				     (size_t) overlap_size ) == NULL )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_MEMORY,
+					 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+					 "%s: unable to copy compressed data.",
+					 function );
+
+					return( -1 );
+				}
+			}
+			compressed_data_size += (size_t) overlap_size;
+		}
+		extent_index++;
+	}
+	if( compressed_data_size == 0 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_MISSING,
+		 "%s: missing compressed data of compression unit: %" PRIzd ".",
+		 function,
+		 unit_index );
+
+		return( -1 );
+	}
+	uncompressed_data_size = internal_compressed_attribute->compression_unit_size;
+
+	if( libfwnt_lznt1_decompress(
+	     unit_data,
+	     compressed_data_size,
+	     uncompressed_data,
+	     &uncompressed_data_size,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_COMPRESSION,
+		 LIBCERROR_COMPRESSION_ERROR_DECOMPRESS_FAILED,
+		 "%s: unable to decompress compression unit: %" PRIzd ".",
+		 function,
+		 unit_index );
+
+		return( -1 );
+	}
+	/* The data that follows the decompressed data is sparse
+	 */
+	if( uncompressed_data_size < internal_compressed_attribute->compression_unit_size )
+	{
+		if( memory_set(
+		     &( uncompressed_data[ uncompressed_data_size ] ),
+		     0,
+		     internal_compressed_attribute->compression_unit_size - uncompressed_data_size ) == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+			 "%s: unable to clear remainder of compression unit: %" PRIzd ".",
+			 function,
+			 unit_index );
+
+			return( -1 );
+		}
+	}
+	return( 1 );
+}
+
+/* Retrieves the cache entry of a compression unit and marks it as most recently used
+ * Returns 1 if successful, 0 if the compression unit is not cached or -1 on error
+ */
+int libfwnt_internal_compressed_attribute_get_cache_entry(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     size_t unit_index,
+     libfwnt_compressed_attribute_cache_entry_t **cache_entry,
+     libcerror_error_t **error )
+{
+	static char *function = "libfwnt_internal_compressed_attribute_get_cache_entry";
+	int entry_index       = 0;
+
+	if( internal_compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	if( cache_entry == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid cache entry.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_compressed_attribute->cache_entries == NULL )
+	{
+		return( 0 );
+	}
+	for( entry_index = 0;
+	     entry_index < internal_compressed_attribute->maximum_number_of_cached_units;
+	     entry_index++ )
+	{
+		if( ( internal_compressed_attribute->cache_entries[ entry_index ].is_set != 0 )
+		 && ( internal_compressed_attribute->cache_entries[ entry_index ].unit_index == unit_index ) )
+		{
+			internal_compressed_attribute->cache_access_time += 1;
+
+			internal_compressed_attribute->cache_entries[ entry_index ].access_time = internal_compressed_attribute->cache_access_time;
+
+			*cache_entry = &( internal_compressed_attribute->cache_entries[ entry_index ] );
+
+			return( 1 );
+		}
+	}
+	return( 0 );
+}
+
+/* Retrieves an unused or otherwise the least recently used cache entry
+ * The cache entries are created on first use, the entry is marked as unused
+ * and its data is created if needed
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_compressed_attribute_get_free_cache_entry(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     libfwnt_compressed_attribute_cache_entry_t **cache_entry,
+     libcerror_error_t **error )
+{
+	libfwnt_compressed_attribute_cache_entry_t *least_recently_used_entry = NULL;
+	static char *function                                                 = "libfwnt_internal_compressed_attribute_get_free_cache_entry";
+	size_t maximum_number_of_cached_units                                 = 0;
+	int entry_index                                                       = 0;
+
+	if( internal_compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	if( cache_entry == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid cache entry.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_compressed_attribute->cache_entries == NULL )
+	{
+		maximum_number_of_cached_units = internal_compressed_attribute->maximum_cache_size / internal_compressed_attribute->compression_unit_size;
+
+		if( maximum_number_of_cached_units < 1 )
+		{
+			maximum_number_of_cached_units = 1;
+		}
+		else if( maximum_number_of_cached_units > LIBFWNT_COMPRESSED_ATTRIBUTE_MAXIMUM_NUMBER_OF_CACHED_UNITS )
+		{
+			maximum_number_of_cached_units = LIBFWNT_COMPRESSED_ATTRIBUTE_MAXIMUM_NUMBER_OF_CACHED_UNITS;
+		}
+		internal_compressed_attribute->cache_entries = (libfwnt_compressed_attribute_cache_entry_t *) memory_allocate(
+		                                                                                               sizeof( libfwnt_compressed_attribute_cache_entry_t ) * maximum_number_of_cached_units );
+
+		if( internal_compressed_attribute->cache_entries == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+			 "%s: unable to create cache entries.",
+			 function );
+
+			return( -1 );
+		}
+		if( memory_set(
+		     internal_compressed_attribute->cache_entries,
+		     0,
+		     sizeof( libfwnt_compressed_attribute_cache_entry_t ) * maximum_number_of_cached_units ) == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+			 "%s: unable to clear cache entries.",
+			 function );
+
+			memory_free(
+			 internal_compressed_attribute->cache_entries );
+
+			internal_compressed_attribute->cache_entries = NULL;
+
+			return( -1 );
+		}
+		internal_compressed_attribute->maximum_number_of_cached_units = (int) maximum_number_of_cached_units;
+	}
+	for( entry_index = 0;
+	     entry_index < internal_compressed_attribute->maximum_number_of_cached_units;
+	     entry_index++ )
+	{
+		if( internal_compressed_attribute->cache_entries[ entry_index ].is_set == 0 )
+		{
+			least_recently_used_entry = &( internal_compressed_attribute->cache_entries[ entry_index ] );
+
+			break;
+		}
+		if( ( least_recently_used_entry == NULL )
+		 || ( internal_compressed_attribute->cache_entries[ entry_index ].access_time < least_recently_used_entry->access_time ) )
+		{
+			least_recently_used_entry = &( internal_compressed_attribute->cache_entries[ entry_index ] );
+		}
+	}
+	least_recently_used_entry->is_set = 0;
+
+	*cache_entry = least_recently_used_entry;
+
+	return( 1 );
+}
+
+/* Retrieves the cache entry of a compressed compression unit, the compression unit
+ * is decompressed into the least recently used cache entry if it is not cached
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_compressed_attribute_get_cached_unit(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     size_t unit_index,
+     libfwnt_compressed_attribute_cache_entry_t **cache_entry,
+     libcerror_error_t **error )
+{
+	libfwnt_compressed_attribute_cache_entry_t *free_cache_entry = NULL;
+	static char *function                                        = "libfwnt_internal_compressed_attribute_get_cached_unit";
+	int result                                                   = 0;
+
+	result = libfwnt_internal_compressed_attribute_get_cache_entry(
+	          internal_compressed_attribute,
+	          unit_index,
+	          cache_entry,
+	          error );
+
+	if( result != 0 )
+	{
+		return( result );
+	}
+	if( internal_compressed_attribute->compressed_unit_data == NULL )
+	{
+		internal_compressed_attribute->compressed_unit_data = (uint8_t *) memory_allocate(
+		                                                                   sizeof( uint8_t ) * internal_compressed_attribute->compression_unit_size );
+
+		if( internal_compressed_attribute->compressed_unit_data == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+			 "%s: unable to create compressed unit data.",
+			 function );
+
+			return( -1 );
+		}
+	}
+	if( libfwnt_internal_compressed_attribute_get_free_cache_entry(
+	     internal_compressed_attribute,
+	     &free_cache_entry,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve free cache entry.",
+		 function );
+
+		return( -1 );
+	}
+	if( free_cache_entry->data == NULL )
+	{
+		free_cache_entry->data = (uint8_t *) memory_allocate(
+		                                      sizeof( uint8_t ) * internal_compressed_attribute->compression_unit_size );
+
+		if( free_cache_entry->data == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+			 "%s: unable to create cache entry data.",
+			 function );
+
+			return( -1 );
+		}
+	}
+	if( libfwnt_internal_compressed_attribute_decompress_unit(
+	     internal_compressed_attribute,
+	     unit_index,
+	     internal_compressed_attribute->compressed_unit_data,
+	     free_cache_entry->data,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_COMPRESSION,
+		 LIBCERROR_COMPRESSION_ERROR_DECOMPRESS_FAILED,
+		 "%s: unable to decompress compression unit: %" PRIzd ".",
+		 function,
+		 unit_index );
+
+		return( -1 );
+	}
+	internal_compressed_attribute->cache_access_time += 1;
+
+	free_cache_entry->unit_index  = unit_index;
+	free_cache_entry->is_set      = 1;
+	free_cache_entry->access_time = internal_compressed_attribute->cache_access_time;
+
+	*cache_entry = free_cache_entry;
+
+	return( 1 );
+}
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+
+/* Decompresses the compression unit of a read-ahead job
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_compressed_attribute_read_ahead_job_callback(
+     libfwnt_compressed_attribute_read_ahead_job_t *read_ahead_job )
+{
+	read_ahead_job->result = libfwnt_internal_compressed_attribute_decompress_unit(
+	                          read_ahead_job->internal_compressed_attribute,
+	                          read_ahead_job->unit_index,
+	                          read_ahead_job->compressed_data,
+	                          read_ahead_job->uncompressed_data,
+	                          NULL );
+
+	return( read_ahead_job->result );
+}
+
+/* Starts decompressing a compression unit in the read-ahead thread
+ * Only compressed compression units that are not cached are read ahead
+ * Returns 1 if successful, 0 if the compression unit is not read ahead or -1 on error
+ */
+int libfwnt_internal_compressed_attribute_start_read_ahead(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     size_t unit_index,
+     libcerror_error_t **error )
+{
+	libfwnt_compressed_attribute_cache_entry_t *cache_entry = NULL;
+	static char *function                                   = "libfwnt_internal_compressed_attribute_start_read_ahead";
+	int result                                              = 0;
+	int unit_type                                           = 0;
+
+	if( internal_compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	if( ( internal_compressed_attribute->read_ahead_thread != NULL )
+	 || ( unit_index >= internal_compressed_attribute->number_of_units ) )
+	{
+		return( 0 );
+	}
+	if( libfwnt_internal_compressed_attribute_get_unit_type(
+	     internal_compressed_attribute,
+	     unit_index,
+	     &unit_type,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve type of compression unit: %" PRIzd ".",
+		 function,
+		 unit_index );
+
+		return( -1 );
+	}
+	if( unit_type != LIBFWNT_COMPRESSION_UNIT_TYPE_COMPRESSED )
+	{
+		return( 0 );
+	}
+	result = libfwnt_internal_compressed_attribute_get_cache_entry(
+	          internal_compressed_attribute,
+	          unit_index,
+	          &cache_entry,
+	          error );
+
+	if( result != 0 )
+	{
+		if( result == -1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve cache entry of compression unit: %" PRIzd ".",
+			 function,
+			 unit_index );
+
+			return( -1 );
+		}
+		return( 0 );
+	}
+	if( internal_compressed_attribute->read_ahead_job.compressed_data == NULL )
+	{
+		internal_compressed_attribute->read_ahead_job.compressed_data = (uint8_t *) memory_allocate(
+		                                                                             sizeof( uint8_t ) * internal_compressed_attribute->compression_unit_size );
+
+		if( internal_compressed_attribute->read_ahead_job.compressed_data == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+			 "%s: unable to create read-ahead compressed data.",
+			 function );
+
+			return( -1 );
+		}
+	}
+	if( internal_compressed_attribute->read_ahead_job.uncompressed_data == NULL )
+	{
+		internal_compressed_attribute->read_ahead_job.uncompressed_data = (uint8_t *) memory_allocate(
+		                                                                               sizeof( uint8_t ) * internal_compressed_attribute->compression_unit_size );
+
+		if( internal_compressed_attribute->read_ahead_job.uncompressed_data == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+			 "%s: unable to create read-ahead uncompressed data.",
+			 function );
+
+			return( -1 );
+		}
+	}
+	internal_compressed_attribute->read_ahead_job.internal_compressed_attribute = internal_compressed_attribute;
+	internal_compressed_attribute->read_ahead_job.unit_index                    = unit_index;
+	internal_compressed_attribute->read_ahead_job.result                        = -1;
+
+	if( libcthreads_thread_create(
+	     &( internal_compressed_attribute->read_ahead_thread ),
+	     NULL,
+	     (int (*)(void *)) &libfwnt_compressed_attribute_read_ahead_job_callback,
+	     (void *) &( internal_compressed_attribute->read_ahead_job ),
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
+		 "%s: unable to create read-ahead thread.",
+		 function );
+
+		return( -1 );
+	}
+	return( 1 );
+}
+
+/* Waits for the read-ahead thread, if any, and stores the decompressed compression unit
+ * in the cache. A compression unit that failed to decompress is not cached so that the
+ * error is reported when the compression unit is read
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_compressed_attribute_complete_read_ahead(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     libcerror_error_t **error )
+{
+	libfwnt_compressed_attribute_cache_entry_t *cache_entry = NULL;
+	static char *function                                   = "libfwnt_internal_compressed_attribute_complete_read_ahead";
+	uint8_t *cache_entry_data                               = NULL;
+
+	if( internal_compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_compressed_attribute->read_ahead_thread == NULL )
+	{
+		return( 1 );
+	}
+	if( libcthreads_thread_join(
+	     &( internal_compressed_attribute->read_ahead_thread ),
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+		 "%s: unable to join read-ahead thread.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_compressed_attribute->read_ahead_job.result != 1 )
+	{
+		return( 1 );
+	}
+	if( libfwnt_internal_compressed_attribute_get_free_cache_entry(
+	     internal_compressed_attribute,
+	     &cache_entry,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve free cache entry.",
+		 function );
+
+		return( -1 );
+	}
+	/* Swap the data buffers instead of copying the decompressed data
+	 */
+	cache_entry_data  = cache_entry->data;
+	cache_entry->data = internal_compressed_attribute->read_ahead_job.uncompressed_data;
+
+	internal_compressed_attribute->read_ahead_job.uncompressed_data = cache_entry_data;
+
+	internal_compressed_attribute->cache_access_time += 1;
+
+	cache_entry->unit_index  = internal_compressed_attribute->read_ahead_job.unit_index;
+	cache_entry->is_set      = 1;
+	cache_entry->access_time = internal_compressed_attribute->cache_access_time;
+
+	return( 1 );
+}
+
+#endif /* defined( HAVE_MULTI_THREAD_SUPPORT ) */
+
+/* Reads data at a specific offset from the uncompressed data of a compressed attribute
+ * Sparse and uncompressed compression units are copied directly into the buffer,
+ * compressed compression units are decompressed into the cache unless they are read completely
+ * Returns the number of bytes read or -1 on error
+ */
+ssize_t libfwnt_internal_compressed_attribute_read_buffer_at_offset(
+         libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+         uint8_t *buffer,
+         size_t buffer_size,
+         off64_t offset,
+         libcerror_error_t **error )
+{
+	libfwnt_compressed_attribute_cache_entry_t *cache_entry = NULL;
+	static char *function                                   = "libfwnt_internal_compressed_attribute_read_buffer_at_offset";
+	size_t buffer_offset                                    = 0;
+	size_t read_size                                        = 0;
+	size_t unit_data_offset                                 = 0;
+	size_t unit_data_size                                   = 0;
+	size_t unit_index                                       = 0;
+	off64_t read_offset                                     = 0;
+	int result                                              = 0;
+	int unit_type                                           = 0;
+
+	if( internal_compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_compressed_attribute->data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_MISSING,
+		 "%s: invalid compressed attribute - missing data.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_compressed_attribute->extents_size < internal_compressed_attribute->uncompressed_data_size )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid compressed attribute - extents do not cover uncompressed data.",
+		 function );
+
+		return( -1 );
+	}
+	if( buffer == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid buffer.",
+		 function );
+
+		return( -1 );
+	}
+	if( buffer_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid buffer size value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( offset < 0 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_LESS_THAN_ZERO,
+		 "%s: invalid offset value less than zero.",
+		 function );
+
+		return( -1 );
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libfwnt_internal_compressed_attribute_complete_read_ahead(
+	     internal_compressed_attribute,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+		 "%s: unable to complete read-ahead.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	if( (size64_t) offset >= internal_compressed_attribute->uncompressed_data_size )
+	{
+		return( 0 );
+	}
+	if( (size64_t) buffer_size > ( internal_compressed_attribute->uncompressed_data_size - offset ) )
+	{
+		buffer_size = (size_t) ( internal_compressed_attribute->uncompressed_data_size - offset );
+	}
+	read_offset = offset;
+
+	while( buffer_offset < buffer_size )
+	{
+		unit_index       = (size_t) ( read_offset / internal_compressed_attribute->compression_unit_size );
+		unit_data_offset = (size_t) ( read_offset % internal_compressed_attribute->compression_unit_size );
+		unit_data_size   = internal_compressed_attribute->compression_unit_size;
+
+		if( unit_index == ( internal_compressed_attribute->number_of_units - 1 ) )
+		{
+			unit_data_size = (size_t) ( internal_compressed_attribute->uncompressed_data_size - ( (size64_t) unit_index * internal_compressed_attribute->compression_unit_size ) );
+		}
+		read_size = unit_data_size - unit_data_offset;
+
+		if( read_size > ( buffer_size - buffer_offset ) )
+		{
+			read_size = buffer_size - buffer_offset;
+		}
+		if( libfwnt_internal_compressed_attribute_get_unit_type(
+		     internal_compressed_attribute,
+		     unit_index,
+		     &unit_type,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve type of compression unit: %" PRIzd ".",
+			 function,
+			 unit_index );
+
+			return( -1 );
+		}
+		if( unit_type != LIBFWNT_COMPRESSION_UNIT_TYPE_COMPRESSED )
+		{
+			/* Sparse and uncompressed data is stored as-is in the extents
+			 */
+			if( libfwnt_internal_compressed_attribute_copy_extents_data(
+			     internal_compressed_attribute,
+			     read_offset,
+			     &( buffer[ buffer_offset ] ),
+			     read_size,
+			     error ) != 1 )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+				 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+				 "%s: unable to copy data of compression unit: %" PRIzd ".",
+				 function,
+				 unit_index );
+
+				return( -1 );
+			}
+		}
+		else
+		{
+			result = libfwnt_internal_compressed_attribute_get_cache_entry(
+			          internal_compressed_attribute,
+			          unit_index,
+			          &cache_entry,
+			          error );
+
+			if( result == -1 )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+				 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+				 "%s: unable to retrieve cache entry of compression unit: %" PRIzd ".",
+				 function,
+				 unit_index );
+
+				return( -1 );
+			}
+			else if( ( result == 0 )
+			      && ( read_size == internal_compressed_attribute->compression_unit_size ) )
+			{
+				/* A compression unit that is read completely is decompressed directly into the buffer
+				 */
+				if( internal_compressed_attribute->compressed_unit_data == NULL )
+				{
+					internal_compressed_attribute->compressed_unit_data = (uint8_t *) memory_allocate(
+					                                                                   sizeof( uint8_t ) * internal_compressed_attribute->compression_unit_size );
+
+					if( internal_compressed_attribute->compressed_unit_data == NULL )
+					{
+						libcerror_error_set(
+						 error,
+						 LIBCERROR_ERROR_DOMAIN_MEMORY,
+						 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+						 "%s: unable to create compressed unit data.",
+						 function );
+
+						return( -1 );
+					}
+				}
+				if( libfwnt_internal_compressed_attribute_decompress_unit(
+				     internal_compressed_attribute,
+				     unit_index,
+				     internal_compressed_attribute->compressed_unit_data,
+				     &( buffer[ buffer_offset ] ),
+				     error ) != 1 )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_COMPRESSION,
+					 LIBCERROR_COMPRESSION_ERROR_DECOMPRESS_FAILED,
+					 "%s: unable to decompress compression unit: %" PRIzd ".",
+					 function,
+					 unit_index );
+
+					return( -1 );
+				}
+			}
+			else
+			{
+				if( result == 0 )
+				{
+					if( libfwnt_internal_compressed_attribute_get_cached_unit(
+					     internal_compressed_attribute,
+					     unit_index,
+					     &cache_entry,
+					     error ) != 1 )
+					{
+						libcerror_error_set(
+						 error,
+						 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+						 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+						 "%s: unable to retrieve cached compression unit: %" PRIzd ".",
+						 function,
+						 unit_index );
+
+						return( -1 );
+					}
+				}
+				if( memory_copy(
+				     &( buffer[ buffer_offset ] ),
+				     &( cache_entry->data[ unit_data_offset ] ),
+				     read_size ) == NULL )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_MEMORY,
+					 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+					 "%s: unable to copy data of compression unit: %" PRIzd ".",
+					 function,
+					 unit_index );
+
+					return( -1 );
+				}
+			}
+		}
+		buffer_offset += read_size;
+		read_offset   += read_size;
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	/* Decompress the compression unit that follows a sequential read in advance
+	 */
+	if( ( internal_compressed_attribute->read_ahead != 0 )
+	 && ( offset == internal_compressed_attribute->last_read_end_offset ) )
+	{
+		unit_index = (size_t) ( read_offset / internal_compressed_attribute->compression_unit_size );
+
+		if( ( read_offset % internal_compressed_attribute->compression_unit_size ) != 0 )
+		{
+			unit_index += 1;
+		}
+		if( libfwnt_internal_compressed_attribute_start_read_ahead(
+		     internal_compressed_attribute,
+		     unit_index,
+		     error ) == -1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
+			 "%s: unable to start read-ahead of compression unit: %" PRIzd ".",
+			 function,
+			 unit_index );
+
+			return( -1 );
+		}
+	}
+#endif
+	internal_compressed_attribute->last_read_end_offset = read_offset;
+
+	return( (ssize_t) buffer_offset );
+}
+
+/* Reads data at the current offset from the uncompressed data of a compressed attribute
+ * Returns the number of bytes read or -1 on error
+ */
+ssize_t libfwnt_compressed_attribute_read_buffer(
+         libfwnt_compressed_attribute_t *compressed_attribute,
+         uint8_t *buffer,
+         size_t buffer_size,
+         libcerror_error_t **error )
+{
+	libfwnt_internal_compressed_attribute_t *internal_compressed_attribute = NULL;
+	static char *function                                                  = "libfwnt_compressed_attribute_read_buffer";
+	ssize_t read_count                                                     = 0;
+
+	if( compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	internal_compressed_attribute = (libfwnt_internal_compressed_attribute_t *) compressed_attribute;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_write(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	read_count = libfwnt_internal_compressed_attribute_read_buffer_at_offset(
+	              internal_compressed_attribute,
+	              buffer,
+	              buffer_size,
+	              internal_compressed_attribute->current_offset,
+	              error );
+
+	if( read_count == -1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_IO,
+		 LIBCERROR_IO_ERROR_READ_FAILED,
+		 "%s: unable to read buffer.",
+		 function );
+	}
+	else
+	{
+		internal_compressed_attribute->current_offset += (off64_t) read_count;
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_write(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( read_count );
+}
+
+/* Reads data at a specific offset from the uncompressed data of a compressed attribute
+ * The current offset is not changed
+ * Returns the number of bytes read or -1 on error
+ */
+ssize_t libfwnt_compressed_attribute_read_buffer_at_offset(
+         libfwnt_compressed_attribute_t *compressed_attribute,
+         uint8_t *buffer,
+         size_t buffer_size,
+         off64_t offset,
+         libcerror_error_t **error )
+{
+	libfwnt_internal_compressed_attribute_t *internal_compressed_attribute = NULL;
+	static char *function                                                  = "libfwnt_compressed_attribute_read_buffer_at_offset";
+	ssize_t read_count                                                     = 0;
+
+	if( compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	internal_compressed_attribute = (libfwnt_internal_compressed_attribute_t *) compressed_attribute;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_write(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	read_count = libfwnt_internal_compressed_attribute_read_buffer_at_offset(
+	              internal_compressed_attribute,
+	              buffer,
+	              buffer_size,
+	              offset,
+	              error );
+
+	if( read_count == -1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_IO,
+		 LIBCERROR_IO_ERROR_READ_FAILED,
+		 "%s: unable to read buffer at offset: %" PRIi64 ".",
+		 function,
+		 offset );
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_write(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( read_count );
+}
+
+/* Seeks a certain offset in the uncompressed data of a compressed attribute
+ * Returns the offset if seek is successful or -1 on error
+ */
+off64_t libfwnt_compressed_attribute_seek_offset(
+         libfwnt_compressed_attribute_t *compressed_attribute,
+         off64_t offset,
+         int whence,
+         libcerror_error_t **error )
+{
+	libfwnt_internal_compressed_attribute_t *internal_compressed_attribute = NULL;
+	static char *function                                                  = "libfwnt_compressed_attribute_seek_offset";
+
+	if( compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	internal_compressed_attribute = (libfwnt_internal_compressed_attribute_t *) compressed_attribute;
+
+	if( ( whence != SEEK_CUR )
+	 && ( whence != SEEK_END )
+	 && ( whence != SEEK_SET ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported whence.",
+		 function );
+
+		return( -1 );
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_write(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	if( whence == SEEK_CUR )
+	{
+		offset += internal_compressed_attribute->current_offset;
+	}
+	else if( whence == SEEK_END )
+	{
+		offset += (off64_t) internal_compressed_attribute->uncompressed_data_size;
+	}
+	if( offset < 0 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid offset value out of bounds.",
+		 function );
+
+		offset = -1;
+	}
+	else
+	{
+		internal_compressed_attribute->current_offset = offset;
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_write(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( offset );
+}
+
+/* Retrieves the current offset in the uncompressed data of a compressed attribute
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_compressed_attribute_get_offset(
+     libfwnt_compressed_attribute_t *compressed_attribute,
+     off64_t *offset,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_compressed_attribute_t *internal_compressed_attribute = NULL;
+	static char *function                                                  = "libfwnt_compressed_attribute_get_offset";
+
+	if( compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	internal_compressed_attribute = (libfwnt_internal_compressed_attribute_t *) compressed_attribute;
+
+	if( offset == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid offset.",
+		 function );
+
+		return( -1 );
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_read(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for reading.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	*offset = internal_compressed_attribute->current_offset;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_read(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for reading.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( 1 );
+}
+
+/* Retrieves the size of the uncompressed data of a compressed attribute
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_compressed_attribute_get_size(
+     libfwnt_compressed_attribute_t *compressed_attribute,
+     size64_t *size,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_compressed_attribute_t *internal_compressed_attribute = NULL;
+	static char *function                                                  = "libfwnt_compressed_attribute_get_size";
+
+	if( compressed_attribute == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed attribute.",
+		 function );
+
+		return( -1 );
+	}
+	internal_compressed_attribute = (libfwnt_internal_compressed_attribute_t *) compressed_attribute;
+
+	if( size == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid size.",
+		 function );
+
+		return( -1 );
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_read(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for reading.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	*size = internal_compressed_attribute->uncompressed_data_size;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_read(
+	     internal_compressed_attribute->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for reading.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( 1 );
+}
+
@@ -0,0 +1,355 @@
+/*
+ * NTFS compressed attribute functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _LIBFWNT_INTERNAL_COMPRESSED_ATTRIBUTE_H )
+#define _LIBFWNT_INTERNAL_COMPRESSED_ATTRIBUTE_H
+
+#include <common.h>
+#include <types.h>
+
+#include "libfwnt_extern.h"
+#include "libfwnt_libcerror.h"
+#include "libfwnt_types.h"
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+#include "libfwnt_libcthreads.h"
+#endif
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+/* The data of a compressed NTFS attribute is divided into compression units,
+ * typically of 16 clusters, which are described by the runlist of the attribute:
+ * sparse: the compression unit contains no allocated clusters and is filled with 0-byte values
+ * uncompressed: all clusters of the compression unit are allocated and contain the data as-is
+ * compressed: the allocated clusters at the start of the compression unit contain
+ *             LZNT1 compressed data, the remainder of the compression unit is sparse
+ */
+
+typedef struct libfwnt_compressed_attribute_extent libfwnt_compressed_attribute_extent_t;
+
+struct libfwnt_compressed_attribute_extent
+{
+	/* The offset of the extent in the attribute data
+	 */
+	off64_t offset;
+
+	/* The offset of the extent in the data
+	 */
+	off64_t data_offset;
+
+	/* The size of the extent
+	 */
+	size64_t size;
+
+	/* The extent flags
+	 */
+	uint32_t flags;
+};
+
+typedef struct libfwnt_compressed_attribute_cache_entry libfwnt_compressed_attribute_cache_entry_t;
+
+struct libfwnt_compressed_attribute_cache_entry
+{
+	/* The compression unit index
+	 */
+	size_t unit_index;
+
+	/* The compression unit data
+	 */
+	uint8_t *data;
+
+	/* Value to indicate the entry contains a compression unit
+	 */
+	uint8_t is_set;
+
+	/* The last time the entry was accessed
+	 */
+	uint64_t access_time;
+};
+
+typedef struct libfwnt_internal_compressed_attribute libfwnt_internal_compressed_attribute_t;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+
+typedef struct libfwnt_compressed_attribute_read_ahead_job libfwnt_compressed_attribute_read_ahead_job_t;
+
+struct libfwnt_compressed_attribute_read_ahead_job
+{
+	/* The compressed attribute
+	 */
+	libfwnt_internal_compressed_attribute_t *internal_compressed_attribute;
+
+	/* The compression unit index
+	 */
+	size_t unit_index;
+
+	/* The compressed data of the compression unit
+	 */
+	uint8_t *compressed_data;
+
+	/* The uncompressed data of the compression unit
+	 */
+	uint8_t *uncompressed_data;
+
+	/* The result of the job
+	 */
+	int result;
+};
+
+#endif /* defined( HAVE_MULTI_THREAD_SUPPORT ) */
+
+struct libfwnt_internal_compressed_attribute
+{
+	/* The data the extents refer to, such as the volume, which is referenced and not copied
+	 */
+	const uint8_t *data;
+
+	/* The data size
+	 */
+	size_t data_size;
+
+	/* The uncompressed data size
+	 */
+	size64_t uncompressed_data_size;
+
+	/* The compression unit size
+	 */
+	size_t compression_unit_size;
+
+	/* The number of compression units
+	 */
+	size_t number_of_units;
+
+	/* The extents
+	 */
+	libfwnt_compressed_attribute_extent_t *extents;
+
+	/* The number of extents
+	 */
+	int number_of_extents;
+
+	/* The number of allocated extent entries
+	 */
+	int number_of_allocated_entries;
+
+	/* The size of the attribute data described by the extents
+	 */
+	size64_t extents_size;
+
+	/* The compressed data of the compression unit that is decompressed,
+	 * used when the compressed data is stored in multiple extents
+	 */
+	uint8_t *compressed_unit_data;
+
+	/* The current offset in the uncompressed data
+	 */
+	off64_t current_offset;
+
+	/* The cache entries of recently decompressed compression units
+	 */
+	libfwnt_compressed_attribute_cache_entry_t *cache_entries;
+
+	/* The maximum number of cached compression units
+	 */
+	int maximum_number_of_cached_units;
+
+	/* The maximum cache size
+	 */
+	size_t maximum_cache_size;
+
+	/* The cache access time, used to determine the least recently used entry
+	 */
+	uint64_t cache_access_time;
+
+	/* The offset of the end of the last read, used to detect sequential reads
+	 */
+	off64_t last_read_end_offset;
+
+	/* Value to indicate the compression unit after a sequential read is decompressed in advance
+	 */
+	uint8_t read_ahead;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	/* The read-ahead job
+	 */
+	libfwnt_compressed_attribute_read_ahead_job_t read_ahead_job;
+
+	/* The read-ahead thread, NULL if no read-ahead is in progress
+	 */
+	libcthreads_thread_t *read_ahead_thread;
+
+	/* The read/write lock
+	 */
+	libcthreads_read_write_lock_t *read_write_lock;
+#endif
+};
+
+LIBFWNT_EXTERN \
+int libfwnt_compressed_attribute_initialize(
+     libfwnt_compressed_attribute_t **compressed_attribute,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_compressed_attribute_free(
+     libfwnt_compressed_attribute_t **compressed_attribute,
+     libcerror_error_t **error );
+
+int libfwnt_internal_compressed_attribute_free_cache(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_compressed_attribute_set_data(
+     libfwnt_compressed_attribute_t *compressed_attribute,
+     const uint8_t *data,
+     size_t data_size,
+     size64_t uncompressed_data_size,
+     size_t compression_unit_size,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_compressed_attribute_append_extent(
+     libfwnt_compressed_attribute_t *compressed_attribute,
+     off64_t data_offset,
+     size64_t extent_size,
+     uint32_t extent_flags,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_compressed_attribute_set_maximum_cache_size(
+     libfwnt_compressed_attribute_t *compressed_attribute,
+     size_t maximum_cache_size,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_compressed_attribute_set_read_ahead(
+     libfwnt_compressed_attribute_t *compressed_attribute,
+     uint8_t read_ahead,
+     libcerror_error_t **error );
+
+int libfwnt_internal_compressed_attribute_get_extent_index(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     off64_t offset,
+     int *extent_index,
+     libcerror_error_t **error );
+
+int libfwnt_internal_compressed_attribute_get_unit_type(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     size_t unit_index,
+     int *unit_type,
+     libcerror_error_t **error );
+
+int libfwnt_internal_compressed_attribute_copy_extents_data(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     off64_t offset,
+     uint8_t *buffer,
+     size_t size,
+     libcerror_error_t **error );
+
+int libfwnt_internal_compressed_attribute_decompress_unit(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     size_t unit_index,
+     uint8_t *compressed_data,
+     uint8_t *uncompressed_data,
+     libcerror_error_t **error );
+
+int libfwnt_internal_compressed_attribute_get_cache_entry(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     size_t unit_index,
+     libfwnt_compressed_attribute_cache_entry_t **cache_entry,
+     libcerror_error_t **error );
+
+int libfwnt_internal_compressed_attribute_get_free_cache_entry(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     libfwnt_compressed_attribute_cache_entry_t **cache_entry,
+     libcerror_error_t **error );
+
+int libfwnt_internal_compressed_attribute_get_cached_unit(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     size_t unit_index,
+     libfwnt_compressed_attribute_cache_entry_t **cache_entry,
+     libcerror_error_t **error );
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+
+int libfwnt_compressed_attribute_read_ahead_job_callback(
+     libfwnt_compressed_attribute_read_ahead_job_t *read_ahead_job );
+
+int libfwnt_internal_compressed_attribute_start_read_ahead(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     size_t unit_index,
+     libcerror_error_t **error );
+
+int libfwnt_internal_compressed_attribute_complete_read_ahead(
+     libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+     libcerror_error_t **error );
+
+#endif /* defined( HAVE_MULTI_THREAD_SUPPORT ) */
+
+ssize_t libfwnt_internal_compressed_attribute_read_buffer_at_offset(
+         libfwnt_internal_compressed_attribute_t *internal_compressed_attribute,
+         uint8_t *buffer,
+         size_t buffer_size,
+         off64_t offset,
+         libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+ssize_t libfwnt_compressed_attribute_read_buffer(
+         libfwnt_compressed_attribute_t *compressed_attribute,
+         uint8_t *buffer,
+         size_t buffer_size,
+         libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+ssize_t libfwnt_compressed_attribute_read_buffer_at_offset(
+         libfwnt_compressed_attribute_t *compressed_attribute,
+         uint8_t *buffer,
+         size_t buffer_size,
+         off64_t offset,
+         libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+off64_t libfwnt_compressed_attribute_seek_offset(
+         libfwnt_compressed_attribute_t *compressed_attribute,
+         off64_t offset,
+         int whence,
+         libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_compressed_attribute_get_offset(
+     libfwnt_compressed_attribute_t *compressed_attribute,
+     off64_t *offset,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_compressed_attribute_get_size(
+     libfwnt_compressed_attribute_t *compressed_attribute,
+     size64_t *size,
+     libcerror_error_t **error );
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _LIBFWNT_INTERNAL_COMPRESSED_ATTRIBUTE_H ) */
+
@@ -23,8 +23,13 @@
 #include <memory.h>
 #include <types.h>
 
+#include "libfwnt_definitions.h"
+#include "libfwnt_libcerror.h"
 #include "libfwnt_locale_identifier.h"
 
+/* The table is sorted by LCID language tag value and terminated by an unknown entry
+ */
+
 libfwnt_locale_identifier_language_tag_t libfwnt_locale_identifier_language_tags[ ] = {
 	{ 0x0001, "ar",			"Arabic" },
 	{ 0x0002, "bg",			"Bulgarian" },
@@ -430,41 +435,320 @@ libfwnt_locale_identifier_language_tag_t libfwnt_locale_identifier_language_tags
 
 	{ (uint16_t) -1, "_UNKNOWN_", "Unknown" } };
 
-/* Retrieves a string containing the language tag identifier
+/* The number of entries in the language tags table, without the unknown entry
  */
-const char *libfwnt_locale_identifier_language_tag_get_identifier(
-             uint16_t lcid_language_tag )
+#define LIBFWNT_LOCALE_IDENTIFIER_NUMBER_OF_LANGUAGE_TAGS \
+	( ( sizeof( libfwnt_locale_identifier_language_tags ) / sizeof( libfwnt_locale_identifier_language_tag_t ) ) - 1 )
+
+/* Indexes into the language tags table sorted case-insensitive by identifier
+ */
+static const uint16_t libfwnt_locale_identifier_language_tags_identifier_index[ ] = {
+	50, 168, 85, 206, 0, 347, 351, 296, 278, 247, 333, 343,
+	338, 288, 304, 316, 355, 115, 328, 310, 322, 101, 232, 72,
+	189, 43, 370, 262, 375, 158, 96, 220, 34, 149, 1, 116,
+	213, 64, 268, 181, 76, 271, 193, 103, 234, 374, 365, 320,
+	366, 302, 2, 117, 204, 107, 238, 4, 119, 77, 194, 5,
+	120, 6, 280, 249, 121, 298, 290, 384, 263, 91, 212, 7,
+	122, 8, 281, 329, 291, 323, 250, 352, 348, 305, 356, 317,
+	358, 299, 344, 360, 334, 123, 311, 339, 9, 335, 357, 345,
+	324, 300, 312, 340, 282, 124, 292, 361, 251, 362, 306, 330,
+	363, 353, 359, 364, 349, 318, 36, 151, 44, 159, 40, 155,
+	10, 125, 90, 211, 52, 170, 11, 252, 283, 325, 293, 341,
+	336, 126, 354, 301, 350, 307, 346, 319, 331, 313, 214, 88,
+	209, 56, 265, 225, 114, 246, 80, 198, 227, 108, 239, 66,
+	183, 92, 390, 215, 228, 12, 127, 53, 171, 25, 294, 140,
+	45, 13, 128, 42, 157, 216, 32, 147, 99, 223, 100, 230,
+	14, 129, 15, 253, 130, 84, 379, 205, 388, 273, 16, 131,
+	51, 169, 58, 175, 98, 222, 78, 195, 70, 187, 17, 132,
+	81, 199, 224, 59, 176, 97, 221, 79, 196, 38, 153, 37,
+	152, 105, 236, 46, 161, 71, 188, 75, 378, 192, 387, 270,
+	200, 102, 233, 73, 190, 57, 266, 174, 54, 172, 197, 381,
+	134, 87, 275, 208, 18, 254, 133, 373, 255, 19, 95, 219,
+	106, 237, 67, 184, 65, 182, 269, 231, 20, 135, 245, 113,
+	244, 89, 210, 21, 136, 256, 110, 241, 94, 218, 276, 287,
+	22, 137, 23, 257, 138, 24, 258, 139, 111, 242, 74, 191,
+	109, 240, 201, 272, 55, 285, 173, 264, 83, 203, 26, 141,
+	35, 150, 376, 309, 315, 385, 295, 303, 369, 327, 371, 321,
+	229, 27, 142, 382, 367, 314, 284, 342, 332, 368, 308, 259,
+	337, 326, 162, 28, 260, 143, 60, 177, 82, 202, 68, 185,
+	69, 186, 39, 383, 154, 29, 144, 226, 277, 61, 178, 207,
+	286, 47, 164, 30, 145, 163, 63, 180, 86, 389, 274, 104,
+	235, 33, 148, 31, 261, 146, 62, 377, 267, 386, 179, 165,
+	41, 156, 160, 112, 243, 48, 166, 93, 217, 372, 248, 3,
+	380, 279, 297, 289, 118, 49, 167 };
+
+/* Retrieves the table index of a LCID language tag value
+ * Returns the index of the unknown entry if the language tag is not in the table
+ */
+static size_t libfwnt_locale_identifier_language_tag_get_index(
+               uint16_t lcid_language_tag )
 {
-	int iterator = 0;
+	size_t lower_index  = 0;
+	size_t middle_index = 0;
+	size_t upper_index  = LIBFWNT_LOCALE_IDENTIFIER_NUMBER_OF_LANGUAGE_TAGS;
 
-	while( ( libfwnt_locale_identifier_language_tags[ iterator ] ).lcid_language_tag != (uint16_t) -1 )
+	while( lower_index < upper_index )
 	{
-		if( ( libfwnt_locale_identifier_language_tags[ iterator ] ).lcid_language_tag == lcid_language_tag )
+		middle_index = lower_index + ( ( upper_index - lower_index ) / 2 );
+
+		if( libfwnt_locale_identifier_language_tags[ middle_index ].lcid_language_tag == lcid_language_tag )
+		{
+			return( middle_index );
+		}
+		if( libfwnt_locale_identifier_language_tags[ middle_index ].lcid_language_tag < lcid_language_tag )
 		{
-			break;
+			lower_index = middle_index + 1;
+		}
+		else
+		{
+			upper_index = middle_index;
 		}
-		iterator++;
 	}
+	return( LIBFWNT_LOCALE_IDENTIFIER_NUMBER_OF_LANGUAGE_TAGS );
+}
+
+/* Retrieves a string containing the language tag identifier
+ * Returns the identifier of the unknown entry if the language tag is not supported
+ */
+const char *libfwnt_locale_identifier_language_tag_get_identifier(
+             uint16_t lcid_language_tag )
+{
+	size_t table_index = 0;
+
+	table_index = libfwnt_locale_identifier_language_tag_get_index(
+	               lcid_language_tag );
+
 	return(
-	 ( libfwnt_locale_identifier_language_tags[ iterator ] ).identifier );
+	 libfwnt_locale_identifier_language_tags[ table_index ].identifier );
 }
 
 /* Retrieves a string containing the language tag description
+ * Returns the description of the unknown entry if the language tag is not supported
  */
 const char *libfwnt_locale_identifier_language_tag_get_description(
              uint16_t lcid_language_tag )
 {
-	int iterator = 0;
+	size_t table_index = 0;
 
-	while( ( libfwnt_locale_identifier_language_tags[ iterator ] ).lcid_language_tag != (uint16_t) -1 )
+	table_index = libfwnt_locale_identifier_language_tag_get_index(
+	               lcid_language_tag );
+
+	return(
+	 libfwnt_locale_identifier_language_tags[ table_index ].description );
+}
+
+/* Compares an identifier with the identifier of a language tags table entry
+ * The comparison is case-insensitive for the ASCII letters, which is the order of the identifier index
+ * Returns LIBFWNT_COMPARE_LESS, LIBFWNT_COMPARE_EQUAL or LIBFWNT_COMPARE_GREATER
+ */
+static int libfwnt_locale_identifier_language_tag_compare_identifier(
+            const char *identifier,
+            size_t identifier_length,
+            size_t table_index )
+{
+	const char *table_identifier = NULL;
+	size_t string_index          = 0;
+	uint8_t character            = 0;
+	uint8_t table_character      = 0;
+
+	table_identifier = libfwnt_locale_identifier_language_tags[ table_index ].identifier;
+
+	for( string_index = 0;
+	     string_index < identifier_length;
+	     string_index++ )
 	{
-		if( ( libfwnt_locale_identifier_language_tags[ iterator ] ).lcid_language_tag == lcid_language_tag )
+		table_character = (uint8_t) table_identifier[ string_index ];
+
+		if( table_character == 0 )
+		{
+			return( LIBFWNT_COMPARE_GREATER );
+		}
+		character = (uint8_t) identifier[ string_index ];
+
+		if( ( character >= (uint8_t) 'A' )
+		 && ( character <= (uint8_t) 'Z' ) )
+		{
+			character += (uint8_t) ( 'a' - 'A' );
+		}
+		if( ( table_character >= (uint8_t) 'A' )
+		 && ( table_character <= (uint8_t) 'Z' ) )
 		{
-			break;
+			table_character += (uint8_t) ( 'a' - 'A' );
+		}
+		if( character < table_character )
+		{
+			return( LIBFWNT_COMPARE_LESS );
+		}
+		else if( character > table_character )
+		{
+			return( LIBFWNT_COMPARE_GREATER );
 		}
-		iterator++;
 	}
-	return(
-	 ( libfwnt_locale_identifier_language_tags[ iterator ] ).description );
+	if( table_identifier[ identifier_length ] != 0 )
+	{
+		return( LIBFWNT_COMPARE_LESS );
+	}
+	return( LIBFWNT_COMPARE_EQUAL );
+}
+
+/* Retrieves the LCID language tag value of a language tag identifier
+ * The identifier is matched case-insensitive, e.g. "en-US" and "en-us" both map to 0x0409
+ * Returns 1 if successful, 0 if not available or -1 on error
+ */
+int libfwnt_locale_identifier_language_tag_get_lcid_from_identifier(
+     const char *identifier,
+     size_t identifier_length,
+     uint16_t *lcid_language_tag,
+     libcerror_error_t **error )
+{
+	static char *function = "libfwnt_locale_identifier_language_tag_get_lcid_from_identifier";
+	size_t lower_index    = 0;
+	size_t middle_index   = 0;
+	size_t table_index    = 0;
+	size_t upper_index    = LIBFWNT_LOCALE_IDENTIFIER_NUMBER_OF_LANGUAGE_TAGS;
+	int result            = 0;
+
+	if( identifier == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid identifier.",
+		 function );
+
+		return( -1 );
+	}
+	if( identifier_length > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid identifier length value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( lcid_language_tag == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid LCID language tag.",
+		 function );
+
+		return( -1 );
+	}
+	while( lower_index < upper_index )
+	{
+		middle_index = lower_index + ( ( upper_index - lower_index ) / 2 );
+		table_index  = libfwnt_locale_identifier_language_tags_identifier_index[ middle_index ];
+
+		result = libfwnt_locale_identifier_language_tag_compare_identifier(
+		          identifier,
+		          identifier_length,
+		          table_index );
+
+		if( result == LIBFWNT_COMPARE_EQUAL )
+		{
+			*lcid_language_tag = libfwnt_locale_identifier_language_tags[ table_index ].lcid_language_tag;
+
+			return( 1 );
+		}
+		else if( result == LIBFWNT_COMPARE_GREATER )
+		{
+			lower_index = middle_index + 1;
+		}
+		else
+		{
+			upper_index = middle_index;
+		}
+	}
+	return( 0 );
+}
+
+/* Retrieves the identifiers and descriptions of multiple LCID language tag values
+ * Either identifiers or descriptions can be NULL if they are not needed
+ * The entries of unsupported language tags are set to NULL
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_locale_identifier_language_tags_get_identifiers(
+     const uint16_t *lcid_language_tags,
+     size_t number_of_language_tags,
+     const char **identifiers,
+     const char **descriptions,
+     libcerror_error_t **error )
+{
+	static char *function = "libfwnt_locale_identifier_language_tags_get_identifiers";
+	size_t language_tag_index = 0;
+	size_t table_index        = 0;
+
+	if( lcid_language_tags == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid LCID language tags.",
+		 function );
+
+		return( -1 );
+	}
+	if( number_of_language_tags > (size_t) ( SSIZE_MAX / sizeof( const char * ) ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid number of language tags value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( ( identifiers == NULL )
+	 && ( descriptions == NULL ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid identifiers and descriptions.",
+		 function );
+
+		return( -1 );
+	}
+	for( language_tag_index = 0;
+	     language_tag_index < number_of_language_tags;
+	     language_tag_index++ )
+	{
+		table_index = libfwnt_locale_identifier_language_tag_get_index(
+		               lcid_language_tags[ language_tag_index ] );
+
+		if( table_index == LIBFWNT_LOCALE_IDENTIFIER_NUMBER_OF_LANGUAGE_TAGS )
+		{
+			if( identifiers != NULL )
+			{
+				identifiers[ language_tag_index ] = NULL;
+			}
+			if( descriptions != NULL )
+			{
+				descriptions[ language_tag_index ] = NULL;
+			}
+		}
+		else
+		{
+			if( identifiers != NULL )
+			{
+				identifiers[ language_tag_index ] = libfwnt_locale_identifier_language_tags[ table_index ].identifier;
+			}
+			if( descriptions != NULL )
+			{
+				descriptions[ language_tag_index ] = libfwnt_locale_identifier_language_tags[ table_index ].description;
+			}
+		}
+	}
+	return( 1 );
 }
 
@@ -25,6 +25,9 @@
 #include <common.h>
 #include <types.h>
 
+#include "libfwnt_extern.h"
+#include "libfwnt_libcerror.h"
+
 #if defined( __cplusplus )
 extern "C" {
 #endif
@@ -46,12 +49,29 @@ struct libfwnt_locale_identifier_language_tag
 	const char *description;
 };
 
+LIBFWNT_EXTERN \
 const char *libfwnt_locale_identifier_language_tag_get_identifier(
              uint16_t lcid_language_tag );
 
+LIBFWNT_EXTERN \
 const char *libfwnt_locale_identifier_language_tag_get_description(
              uint16_t lcid_language_tag );
 
+LIBFWNT_EXTERN \
+int libfwnt_locale_identifier_language_tag_get_lcid_from_identifier(
+     const char *identifier,
+     size_t identifier_length,
+     uint16_t *lcid_language_tag,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_locale_identifier_language_tags_get_identifiers(
+     const uint16_t *lcid_language_tags,
+     size_t number_of_language_tags,
+     const char **identifiers,
+     const char **descriptions,
+     libcerror_error_t **error );
+
 #if defined( __cplusplus )
 }
 #endif
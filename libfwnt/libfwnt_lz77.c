@@ -0,0 +1,88 @@
+/*
+ * LZ77 match functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <memory.h>
+#include <types.h>
+
+#include "libfwnt_lz77.h"
+
+/* Copies a match (back-reference) to the end of the uncompressed data
+ *
+ * The caller is responsible for the bounds: the match distance must be at least 1
+ * and not exceed the uncompressed data offset, and the match must fit in the uncompressed data.
+ *
+ * A match whose distance is smaller than its size overlaps the bytes it produces
+ * and repeats the last match distance bytes. A distance of 1 is a run of a single byte,
+ * other distances are expanded by copying the pattern with a block size that doubles
+ * every copy, so a distance of 2 or 4 becomes a handful of word sized copies
+ * instead of a copy per byte.
+ */
+void libfwnt_lz77_copy_match(
+      uint8_t *uncompressed_data,
+      size_t uncompressed_data_offset,
+      size_t match_distance,
+      size_t match_size )
+{
+	uint8_t *match_data  = &( uncompressed_data[ uncompressed_data_offset - match_distance ] );
+	uint8_t *output_data = &( uncompressed_data[ uncompressed_data_offset ] );
+	size_t copy_size     = 0;
+
+	if( match_distance >= match_size )
+	{
+		memory_copy(
+		 output_data,
+		 match_data,
+		 match_size );
+
+		return;
+	}
+	if( match_distance == 1 )
+	{
+		memory_set(
+		 output_data,
+		 match_data[ 0 ],
+		 match_size );
+
+		return;
+	}
+	/* The bytes between the match data and the output data form the repeating pattern,
+	 * after every copy this region has doubled in size and the next copy cannot overlap
+	 */
+	copy_size = match_distance;
+
+	while( match_size > 0 )
+	{
+		if( copy_size > match_size )
+		{
+			copy_size = match_size;
+		}
+		memory_copy(
+		 output_data,
+		 match_data,
+		 copy_size );
+
+		output_data += copy_size;
+		match_size  -= copy_size;
+		copy_size  <<= 1;
+	}
+}
+
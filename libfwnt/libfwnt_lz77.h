@@ -0,0 +1,43 @@
+/*
+ * LZ77 match functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _LIBFWNT_LZ77_H )
+#define _LIBFWNT_LZ77_H
+
+#include <common.h>
+#include <types.h>
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+void libfwnt_lz77_copy_match(
+      uint8_t *uncompressed_data,
+      size_t uncompressed_data_offset,
+      size_t match_distance,
+      size_t match_size );
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _LIBFWNT_LZ77_H ) */
+
@@ -24,9 +24,12 @@
 #include <memory.h>
 #include <types.h>
 
+#include "libfwnt_definitions.h"
 #include "libfwnt_libcerror.h"
 #include "libfwnt_libcnotify.h"
+#include "libfwnt_lz77.h"
 #include "libfwnt_lznt1.h"
+#include "libfwnt_statistics.h"
 
 /* Compresses data using LZNT1 compression
  * Returns 1 on success or -1 on error
@@ -101,7 +104,6 @@ int libfwnt_lznt1_decompress_chunk(
      libcerror_error_t **error )
 {
 	static char *function                   = "libfwnt_lznt1_decompress_chunk";
-	size_t compression_tuple_index          = 0;
 	size_t compression_tuple_threshold      = 0;
 	size_t uncompressed_data_offset         = 0;
 	uint16_t compression_tuple              = 0;
@@ -229,6 +231,29 @@ int libfwnt_lznt1_decompress_chunk(
 		*compressed_data_offset += 1;
 		compression_chunk_size -= 1;
 
+		/* A flag byte without tag bits is followed by 8 literals
+		 */
+		if( ( compression_flag_byte == 0 )
+		 && ( compression_chunk_size >= 8 )
+		 && ( ( *uncompressed_data_size - uncompressed_data_offset ) >= 8 ) )
+		{
+			memory_copy(
+			 &( uncompressed_data[ uncompressed_data_offset ] ),
+			 &( compressed_data[ *compressed_data_offset ] ),
+			 8 );
+
+			*compressed_data_offset  += 8;
+			compression_chunk_size   -= 8;
+			uncompressed_data_offset += 8;
+
+			while( uncompressed_data_offset > compression_tuple_threshold )
+			{
+				compression_tuple_offset_shift -= 1;
+				compression_tuple_size_mask   >>= 1;
+				compression_tuple_threshold   <<= 1;
+			}
+			continue;
+		}
 		for( compression_flag_bit_index = 0;
 		     compression_flag_bit_index < 8;
 		     compression_flag_bit_index++ )
@@ -237,6 +262,17 @@ int libfwnt_lznt1_decompress_chunk(
 			 */
 			if( ( compression_flag_byte & 0x01 ) != 0 )
 			{
+				if( compression_chunk_size < 2 )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+					 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+					 "%s: compressed data too small.",
+					 function );
+
+					return( -1 );
+				}
 				/* Read the compression ( size, offset ) tuple
 				 */
 				byte_stream_copy_to_uint16_little_endian(
@@ -297,40 +333,28 @@ int libfwnt_lznt1_decompress_chunk(
 
 					return( -1 );
 				}
-				compression_tuple_index = uncompressed_data_offset - compression_tuple_offset;
-
-				while( compression_tuple_size > 0 )
+				if( (size_t) compression_tuple_size > ( *uncompressed_data_size - uncompressed_data_offset ) )
 				{
-					if( compression_tuple_index > uncompressed_data_offset )
-					{
-						libcerror_error_set(
-						 error,
-						 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-						 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
-						 "%s: compression tuple index value out of bounds.",
-						 function );
-
-						return( -1 );
-					}
-					if( uncompressed_data_offset > *uncompressed_data_size )
-					{
-						libcerror_error_set(
-						 error,
-						 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-						 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
-						 "%s: uncompressed data too small.",
-						 function );
-
-						return( -1 );
-					}
-					uncompressed_data[ uncompressed_data_offset++ ] = uncompressed_data[ compression_tuple_index++ ];
-
-					compression_tuple_size -= 1;
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+					 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+					 "%s: uncompressed data too small.",
+					 function );
+
+					return( -1 );
 				}
+				libfwnt_lz77_copy_match(
+				 uncompressed_data,
+				 uncompressed_data_offset,
+				 (size_t) compression_tuple_offset,
+				 (size_t) compression_tuple_size );
+
+				uncompressed_data_offset += compression_tuple_size;
 			}
 			else
 			{
-				if( uncompressed_data_offset > *uncompressed_data_size )
+				if( uncompressed_data_offset >= *uncompressed_data_size )
 				{
 					libcerror_error_set(
 					 error,
@@ -368,6 +392,294 @@ int libfwnt_lznt1_decompress_chunk(
 	return( 1 );
 }
 
+/* Determines the uncompressed size of a LZNT1 compressed chunk without decompressing it
+ * Returns 1 on success or -1 on error
+ */
+int libfwnt_lznt1_get_chunk_uncompressed_data_size(
+     const uint8_t *compressed_data,
+     size_t compressed_data_size,
+     size_t compressed_data_offset,
+     size_t compression_chunk_size,
+     size_t *uncompressed_data_size,
+     libcerror_error_t **error )
+{
+	static char *function                   = "libfwnt_lznt1_get_chunk_uncompressed_data_size";
+	size_t compression_tuple_threshold      = 0;
+	size_t uncompressed_data_offset         = 0;
+	uint16_t compression_tuple              = 0;
+	uint16_t compression_tuple_offset_shift = 0;
+	uint16_t compression_tuple_size_mask    = 0;
+	uint8_t compression_flag_bit_index      = 0;
+	uint8_t compression_flag_byte           = 0;
+
+	if( compressed_data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed data.",
+		 function );
+
+		return( -1 );
+	}
+	if( compressed_data_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid compressed data size value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( ( compressed_data_offset > compressed_data_size )
+	 || ( compression_chunk_size > ( compressed_data_size - compressed_data_offset ) ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+		 "%s: compressed data too small.",
+		 function );
+
+		return( -1 );
+	}
+	if( uncompressed_data_size == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid uncompressed data size.",
+		 function );
+
+		return( -1 );
+	}
+	compression_tuple_threshold    = 16;
+	compression_tuple_offset_shift = 12;
+	compression_tuple_size_mask    = 0x0fff;
+
+	/* Only the tag bits and tuples are read, the matches themselves are not resolved
+	 */
+	while( compression_chunk_size > 0 )
+	{
+		compression_flag_byte = compressed_data[ compressed_data_offset ];
+
+		compressed_data_offset += 1;
+		compression_chunk_size -= 1;
+
+		for( compression_flag_bit_index = 0;
+		     compression_flag_bit_index < 8;
+		     compression_flag_bit_index++ )
+		{
+			if( compression_chunk_size == 0 )
+			{
+				break;
+			}
+			if( ( compression_flag_byte & 0x01 ) != 0 )
+			{
+				if( compression_chunk_size < 2 )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+					 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+					 "%s: compressed data too small.",
+					 function );
+
+					return( -1 );
+				}
+				byte_stream_copy_to_uint16_little_endian(
+				 &( compressed_data[ compressed_data_offset ] ),
+				 compression_tuple );
+
+				compressed_data_offset += 2;
+				compression_chunk_size -= 2;
+
+				if( (size_t) ( ( compression_tuple >> compression_tuple_offset_shift ) + 1 ) > uncompressed_data_offset )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+					 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+					 "%s: compression tuple offset value out of bounds.",
+					 function );
+
+					return( -1 );
+				}
+				uncompressed_data_offset += (size_t) ( compression_tuple & compression_tuple_size_mask ) + 3;
+			}
+			else
+			{
+				compressed_data_offset   += 1;
+				compression_chunk_size   -= 1;
+				uncompressed_data_offset += 1;
+			}
+			compression_flag_byte >>= 1;
+
+			while( uncompressed_data_offset > compression_tuple_threshold )
+			{
+				compression_tuple_offset_shift -= 1;
+				compression_tuple_size_mask   >>= 1;
+				compression_tuple_threshold   <<= 1;
+			}
+		}
+	}
+	*uncompressed_data_size = uncompressed_data_offset;
+
+	return( 1 );
+}
+
+/* Determines the uncompressed size of LZNT1 compressed data
+ * A compressed chunk holds at most 4096 bytes of uncompressed data and all chunks but
+ * the last one are normally full, hence only the chunk headers are read and the last
+ * chunk is the only one that is walked. The size is exact for such data and an upper
+ * bound if a compressed chunk other than the last one is not full
+ * Returns 1 on success or -1 on error
+ */
+int libfwnt_lznt1_get_uncompressed_data_size(
+     const uint8_t *compressed_data,
+     size_t compressed_data_size,
+     size_t *uncompressed_data_size,
+     libcerror_error_t **error )
+{
+	static char *function                  = "libfwnt_lznt1_get_uncompressed_data_size";
+	size_t compressed_data_offset          = 0;
+	size_t next_compressed_data_offset     = 0;
+	size_t safe_uncompressed_data_size     = 0;
+	size_t uncompressed_chunk_size         = 0;
+	uint16_t compression_chunk_header      = 0;
+	uint16_t compression_chunk_size        = 0;
+	uint16_t next_compression_chunk_header = 0;
+
+	if( compressed_data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed data.",
+		 function );
+
+		return( -1 );
+	}
+	if( compressed_data_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid compressed data size value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( uncompressed_data_size == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid uncompressed data size.",
+		 function );
+
+		return( -1 );
+	}
+	while( compressed_data_offset < compressed_data_size )
+	{
+		if( ( compressed_data_offset + 1 ) >= compressed_data_size )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+			 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+			 "%s: compressed data size value too small.",
+			 function );
+
+			return( -1 );
+		}
+		byte_stream_copy_to_uint16_little_endian(
+		 &( compressed_data[ compressed_data_offset ] ),
+		 compression_chunk_header );
+
+		compressed_data_offset += 2;
+
+		if( compression_chunk_header == 0 )
+		{
+			break;
+		}
+		compression_chunk_size = ( compression_chunk_header & 0x0fff ) + 1;
+
+		if( (size_t) compression_chunk_size > ( compressed_data_size - compressed_data_offset ) )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+			 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+			 "%s: compressed data too small.",
+			 function );
+
+			return( -1 );
+		}
+		next_compressed_data_offset = compressed_data_offset + compression_chunk_size;
+
+		if( ( compression_chunk_header & 0x8000 ) == 0 )
+		{
+			uncompressed_chunk_size = (size_t) compression_chunk_size;
+		}
+		else
+		{
+			next_compression_chunk_header = 0;
+
+			if( ( next_compressed_data_offset + 1 ) < compressed_data_size )
+			{
+				byte_stream_copy_to_uint16_little_endian(
+				 &( compressed_data[ next_compressed_data_offset ] ),
+				 next_compression_chunk_header );
+			}
+			if( next_compression_chunk_header != 0 )
+			{
+				uncompressed_chunk_size = 4096;
+			}
+			else if( libfwnt_lznt1_get_chunk_uncompressed_data_size(
+			          compressed_data,
+			          compressed_data_size,
+			          compressed_data_offset,
+			          (size_t) compression_chunk_size,
+			          &uncompressed_chunk_size,
+			          error ) != 1 )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+				 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+				 "%s: unable to determine uncompressed size of last chunk.",
+				 function );
+
+				return( -1 );
+			}
+		}
+		if( uncompressed_chunk_size > ( (size_t) SSIZE_MAX - safe_uncompressed_data_size ) )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_EXCEEDS_MAXIMUM,
+			 "%s: invalid uncompressed data size value exceeds maximum.",
+			 function );
+
+			return( -1 );
+		}
+		safe_uncompressed_data_size += uncompressed_chunk_size;
+		compressed_data_offset       = next_compressed_data_offset;
+	}
+	*uncompressed_data_size = safe_uncompressed_data_size;
+
+	return( 1 );
+}
+
 /* Decompresses data using LZNT1 compression
  * Returns 1 on success or -1 on error
  */
@@ -382,8 +694,10 @@ int libfwnt_lznt1_decompress(
 	size_t compressed_data_offset     = 0;
 	size_t uncompressed_chunk_size    = 0;
 	size_t uncompressed_data_offset   = 0;
+	uint64_t statistics_start_time    = 0;
 	uint16_t compression_chunk_header = 0;
 	uint16_t compression_chunk_size   = 0;
+	int statistics_enabled            = 0;
 
 	if( compressed_data == NULL )
 	{
@@ -429,6 +743,12 @@ int libfwnt_lznt1_decompress(
 
 		return( -1 );
 	}
+	statistics_enabled = libfwnt_statistics_enabled;
+
+	if( statistics_enabled != 0 )
+	{
+		statistics_start_time = libfwnt_statistics_get_time();
+	}
 	while( compressed_data_offset < compressed_data_size )
 	{
 		if( uncompressed_data_offset >= *uncompressed_data_size )
@@ -566,6 +886,14 @@ int libfwnt_lznt1_decompress(
 	}
 	*uncompressed_data_size = uncompressed_data_offset;
 
+	if( statistics_enabled != 0 )
+	{
+		libfwnt_statistics_update(
+		 LIBFWNT_STATISTICS_FUNCTION_LZNT1_DECOMPRESS,
+		 statistics_start_time,
+		 compressed_data_offset,
+		 uncompressed_data_offset );
+	}
 	return( 1 );
 }
 
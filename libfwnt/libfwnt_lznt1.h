@@ -49,6 +49,21 @@ int libfwnt_lznt1_decompress_chunk(
      size_t *uncompressed_data_size,
      libcerror_error_t **error );
 
+int libfwnt_lznt1_get_chunk_uncompressed_data_size(
+     const uint8_t *compressed_data,
+     size_t compressed_data_size,
+     size_t compressed_data_offset,
+     size_t compression_chunk_size,
+     size_t *uncompressed_data_size,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_lznt1_get_uncompressed_data_size(
+     const uint8_t *compressed_data,
+     size_t compressed_data_size,
+     size_t *uncompressed_data_size,
+     libcerror_error_t **error );
+
 LIBFWNT_EXTERN \
 int libfwnt_lznt1_decompress(
      const uint8_t *compressed_data,
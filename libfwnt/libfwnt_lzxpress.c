@@ -24,10 +24,52 @@
 #include <memory.h>
 #include <types.h>
 
-#include "libfwnt_bit_stream.h"
+#include "libfwnt_definitions.h"
 #include "libfwnt_libcerror.h"
 #include "libfwnt_libcnotify.h"
+#include "libfwnt_lz77.h"
 #include "libfwnt_lzxpress.h"
+#include "libfwnt_lzxpress_huffman_decoder.h"
+#include "libfwnt_statistics.h"
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+#include "libfwnt_libcthreads.h"
+#endif
+
+/* The maximum size of the uncompressed data of a LZXPRESS Huffman chunk
+ */
+#define LIBFWNT_LZXPRESS_HUFFMAN_CHUNK_SIZE			65536
+
+/* The maximum compressed size of a LZXPRESS Huffman chunk, where a code is at most
+ * 15 bits per uncompressed byte and the chunk starts with the 256 bytes code sizes table
+ */
+#define LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_COMPRESSED_CHUNK_SIZE	( 256 + ( 2 * LIBFWNT_LZXPRESS_HUFFMAN_CHUNK_SIZE ) + 8 )
+
+#define LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_CODE_SIZE		15
+#define LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_MATCH_OFFSET		65535
+#define LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_SHORT_MATCH_OFFSET	8192
+#define LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_NUMBER_OF_THREADS	64
+
+#define LIBFWNT_LZXPRESS_HUFFMAN_HASH_TABLE_BITS		15
+#define LIBFWNT_LZXPRESS_HUFFMAN_HASH_TABLE_SIZE		( 1 << LIBFWNT_LZXPRESS_HUFFMAN_HASH_TABLE_BITS )
+
+/* Calculates the hash table index of the 3 bytes at data
+ */
+#define libfwnt_lzxpress_huffman_hash( data ) \
+	(uint32_t) ( (uint32_t) ( ( ( (uint32_t) ( data )[ 0 ] << 16 ) | ( (uint32_t) ( data )[ 1 ] << 8 ) | (uint32_t) ( data )[ 2 ] ) * 0x9e3779b1UL ) >> ( 32 - LIBFWNT_LZXPRESS_HUFFMAN_HASH_TABLE_BITS ) )
+
+/* The match search parameters per compression level
+ */
+libfwnt_lzxpress_huffman_compression_level_t libfwnt_lzxpress_huffman_compression_levels[ 9 ] = {
+	{ 4, 16, 0 },
+	{ 8, 32, 0 },
+	{ 16, 64, 0 },
+	{ 16, 64, 1 },
+	{ 32, 128, 1 },
+	{ 64, 258, 1 },
+	{ 128, 258, 1 },
+	{ 512, 258, 1 },
+	{ 2048, 1024, 1 } };
 
 /* Compresses data using LZXPRESS (LZ77 + DIRECT2) compression
  * Returns 1 on success or -1 on error
@@ -101,14 +143,15 @@ int libfwnt_lzxpress_decompress(
 {
 	static char *function                  = "libfwnt_lzxpress_decompress";
 	size_t compressed_data_offset          = 0;
-	size_t compression_index               = 0;
 	size_t compression_shared_byte_index   = 0;
 	size_t uncompressed_data_offset        = 0;
+	uint64_t statistics_start_time         = 0;
 	uint32_t compression_indicator         = 0;
 	uint32_t compression_indicator_bitmask = 0;
 	uint16_t compression_tuple             = 0;
 	uint16_t compression_tuple_size        = 0;
 	int16_t compression_tuple_offset       = 0;
+	int statistics_enabled                 = 0;
 
 	if( compressed_data == NULL )
 	{
@@ -165,12 +208,29 @@ int libfwnt_lzxpress_decompress(
 
 		return( -1 );
 	}
+	statistics_enabled = libfwnt_statistics_enabled;
+
+	if( statistics_enabled != 0 )
+	{
+		statistics_start_time = libfwnt_statistics_get_time();
+	}
 	while( compressed_data_offset < compressed_data_size )
 	{
 		if( uncompressed_data_offset >= *uncompressed_data_size )
 		{
 			break;
 		}
+		if( ( compressed_data_size - compressed_data_offset ) < 4 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+			 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+			 "%s: compressed data too small.",
+			 function );
+
+			return( -1 );
+		}
 		byte_stream_copy_to_uint32_little_endian(
 		 &( compressed_data[ compressed_data_offset ] ),
 		 compression_indicator );
@@ -207,6 +267,25 @@ int libfwnt_lzxpress_decompress(
 			{
 				break;
 			}
+			/* Copy 8 literals at once when the next 8 indicator bits, starting at a byte boundary, are 0
+			 */
+			if( ( ( compression_indicator_bitmask & 0x80808080UL ) != 0 )
+			 && ( ( compression_indicator & (uint32_t) ( ( compression_indicator_bitmask << 1 ) - ( compression_indicator_bitmask >> 7 ) ) ) == 0 )
+			 && ( ( compressed_data_size - compressed_data_offset ) >= 8 )
+			 && ( ( *uncompressed_data_size - uncompressed_data_offset ) >= 8 ) )
+			{
+				memory_copy(
+				 &( uncompressed_data[ uncompressed_data_offset ] ),
+				 &( compressed_data[ compressed_data_offset ] ),
+				 8 );
+
+				compressed_data_offset   += 8;
+				uncompressed_data_offset += 8;
+
+				compression_indicator_bitmask >>= 7;
+
+				continue;
+			}
 			/* If the indicator bit is 0 the data is uncompressed
 			 * or 1 if the data is compressed
 			 */
@@ -353,39 +432,38 @@ int libfwnt_lzxpress_decompress(
 
 					return( -1 );
 				}
-				compression_index = uncompressed_data_offset - compression_tuple_offset;
-
-				while( compression_tuple_size > 0 )
+				if( (size_t) compression_tuple_offset > uncompressed_data_offset )
 				{
-					if( compression_index > uncompressed_data_offset )
-					{
-						libcerror_error_set(
-						 error,
-						 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-						 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
-						 "%s: invalid compressed data at offset: %" PRIzd " - compression index: %" PRIzd " out of range: %" PRIzd ".",
-						 function,
-						 compressed_data_offset,
-						 compression_index,
-						 uncompressed_data_offset );
-
-						return( -1 );
-					}
-					if( uncompressed_data_offset > *uncompressed_data_size )
-					{
-						libcerror_error_set(
-						 error,
-						 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-						 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
-						 "%s: uncompressed data too small.",
-						 function );
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+					 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+					 "%s: invalid compressed data at offset: %" PRIzd " - compression tuple offset: %" PRIi16 " out of range: %" PRIzd ".",
+					 function,
+					 compressed_data_offset,
+					 compression_tuple_offset,
+					 uncompressed_data_offset );
 
-						return( -1 );
-					}
-					uncompressed_data[ uncompressed_data_offset++ ] = uncompressed_data[ compression_index++ ];
+					return( -1 );
+				}
+				if( (size_t) compression_tuple_size > ( *uncompressed_data_size - uncompressed_data_offset ) )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+					 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+					 "%s: uncompressed data too small.",
+					 function );
 
-					compression_tuple_size--;
+					return( -1 );
 				}
+				libfwnt_lz77_copy_match(
+				 uncompressed_data,
+				 uncompressed_data_offset,
+				 (size_t) compression_tuple_offset,
+				 (size_t) compression_tuple_size );
+
+				uncompressed_data_offset += compression_tuple_size;
 			}
 			else
 			{
@@ -400,7 +478,7 @@ int libfwnt_lzxpress_decompress(
 
 					return( -1 );
 				}
-				if( uncompressed_data_offset > *uncompressed_data_size )
+				if( uncompressed_data_offset >= *uncompressed_data_size )
 				{
 					libcerror_error_set(
 					 error,
@@ -417,762 +495,1478 @@ int libfwnt_lzxpress_decompress(
 	}
 	*uncompressed_data_size = uncompressed_data_offset;
 
-	return( 1 );
-}
-
-/* Copmares two Huffman code symbols
- * Returns 1 if the first symbol is larger than the second, 0 if equal or -1 if smaller
- */
-int libfwnt_lzxpress_huffman_compare_symbols(
-     libfwnt_lzxpress_huffman_code_symbol_t *first_symbol,
-     libfwnt_lzxpress_huffman_code_symbol_t *second_symbol )
-{
-	if( first_symbol == NULL )
-	{
-		return( -1 );
-	}
-	if( second_symbol == NULL )
-	{
-		return( 1 );
-	}
-	if( first_symbol->code_size < second_symbol->code_size )
-	{
-		return( -1 );
-	}
-	else if( first_symbol->code_size > second_symbol->code_size )
-	{
-		return( 1 );
-	}
-	else if( first_symbol->symbol < second_symbol->symbol )
-	{
-		return( -1 );
-	}
-	else if( first_symbol->symbol > second_symbol->symbol )
-	{
-		return( 1 );
-	}
-	return( 0 );
-}
-
-/* Adds a leaf node to the Huffman tree
- * Returns 1 on success or -1 on error
- */
-int libfwnt_lzxpress_huffman_tree_add_leaf(
-     libfwnt_lzxpress_huffman_tree_node_t *tree_nodes,
-     int tree_node_index,
-     uint32_t bits,
-     uint8_t number_of_bits )
-{
-	libfwnt_lzxpress_huffman_tree_node_t *tree_node = NULL;
-	uint8_t sub_tree_node_index                     = 0;
-	int next_tree_node_index                        = 0;
-
-	tree_node            = &( tree_nodes[ 0 ] );
-	next_tree_node_index = tree_node_index + 1;
-
-	while( number_of_bits > 1 )
+	if( statistics_enabled != 0 )
 	{
-		number_of_bits--;
-
-		sub_tree_node_index = (uint8_t) ( bits >> number_of_bits ) & 0x00000001UL;
-
-		if( tree_node->sub_tree_nodes[ sub_tree_node_index ] == NULL )
-		{
-			tree_node->sub_tree_nodes[ sub_tree_node_index ] = &( tree_nodes[ next_tree_node_index ] );
-			tree_nodes[ next_tree_node_index ].is_leaf       = 0;
-
-#if defined( HAVE_DEBUG_OUTPUT )
-			tree_node->sub_tree_node_indexes[ sub_tree_node_index ] = next_tree_node_index;
-#endif
-
-			next_tree_node_index++;
-		}
-		tree_node = tree_node->sub_tree_nodes[ sub_tree_node_index ];
+		libfwnt_statistics_update(
+		 LIBFWNT_STATISTICS_FUNCTION_LZXPRESS_DECOMPRESS,
+		 statistics_start_time,
+		 compressed_data_offset,
+		 uncompressed_data_offset );
 	}
-/* TODO store index instead of pointer ? */
-	tree_node->sub_tree_nodes[ bits & 0x00000001UL ] = &( tree_nodes[ tree_node_index ] );
-
-#if defined( HAVE_DEBUG_OUTPUT )
-	tree_node->sub_tree_node_indexes[ bits & 0x00000001UL ] = tree_node_index;
-#endif
-
-	return( next_tree_node_index );
+	return( 1 );
 }
 
-/* Reads the Huffman tree
- * Returns 1 on success or -1 on error
+/* Creates a LZXPRESS Huffman compression context
+ * Make sure the value context is referencing, is set to NULL
+ * Returns 1 if successful or -1 on error
  */
-int libfwnt_lzxpress_huffman_tree_read(
-     libfwnt_lzxpress_huffman_tree_node_t *tree_nodes,
-     const uint8_t *compressed_data,
-     size_t compressed_data_size,
-     size_t compressed_data_offset,
+int libfwnt_lzxpress_huffman_compression_context_initialize(
+     libfwnt_lzxpress_huffman_compression_context_t **context,
+     const uint8_t *uncompressed_data,
+     size_t uncompressed_data_size,
+     int compression_level,
      libcerror_error_t **error )
 {
-	libfwnt_lzxpress_huffman_code_symbol_t code_symbols[ 512 ];
+	static char *function = "libfwnt_lzxpress_huffman_compression_context_initialize";
 
-	static char *function  = "libfwnt_lzxpress_huffman_tree_read";
-	size_t byte_index      = 0;
-	uint32_t bits          = 0;
-	uint16_t symbol_index  = 0;
-	uint8_t byte_value     = 0;
-	uint8_t number_of_bits = 0;
-	int tree_node_index    = 0;
-
-	if( compressed_data == NULL )
+	if( context == NULL )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
 		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid compressed data.",
+		 "%s: invalid context.",
 		 function );
 
 		return( -1 );
 	}
-	if( compressed_data_size > (size_t) SSIZE_MAX )
+	if( *context != NULL )
 	{
 		libcerror_error_set(
 		 error,
-		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
-		 "%s: invalid compressed data size value exceeds maximum.",
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid context value already set.",
 		 function );
 
 		return( -1 );
 	}
-	if( ( compressed_data_offset >= compressed_data_size )
-	 || ( ( compressed_data_size - compressed_data_offset ) < 256 ) )
+	if( ( compression_level < 1 )
+	 || ( compression_level > 9 ) )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
-		 "%s: compressed data offset value out of bounds.",
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported compression level.",
 		 function );
 
 		return( -1 );
 	}
-	if( memory_set(
-	     tree_nodes,
-	     0,
-	     sizeof( libfwnt_lzxpress_huffman_tree_node_t ) * 1024 ) == NULL )
+	*context = memory_allocate_structure(
+	            libfwnt_lzxpress_huffman_compression_context_t );
+
+	if( *context == NULL )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_MEMORY,
-		 LIBCERROR_MEMORY_ERROR_SET_FAILED,
-		 "%s: unable to clear tree nodes.",
+		 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+		 "%s: unable to create context.",
 		 function );
 
-		return( -1 );
+		goto on_error;
 	}
-	/* The initial table contains a 4-bits code size per symbol
-	 */
-	for( byte_index = 0;
-	     byte_index < 256;
-	     byte_index++ )
+	if( memory_set(
+	     *context,
+	     0,
+	     sizeof( libfwnt_lzxpress_huffman_compression_context_t ) ) == NULL )
 	{
-		byte_value = compressed_data[ compressed_data_offset++ ];
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+		 "%s: unable to clear context.",
+		 function );
 
-		code_symbols[ symbol_index ].symbol    = symbol_index;
-		code_symbols[ symbol_index ].code_size = (uint16_t) ( byte_value & 0x0f );
+		memory_free(
+		 *context );
 
-		symbol_index++;
+		*context = NULL;
 
-		byte_value >>= 4;
+		return( -1 );
+	}
+	( *context )->hash_table = (int32_t *) memory_allocate(
+	                                        sizeof( int32_t ) * LIBFWNT_LZXPRESS_HUFFMAN_HASH_TABLE_SIZE );
 
-		code_symbols[ symbol_index ].symbol    = symbol_index;
-		code_symbols[ symbol_index ].code_size = (uint16_t) ( byte_value & 0x0f );
+	if( ( *context )->hash_table == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+		 "%s: unable to create hash table.",
+		 function );
 
-		symbol_index++;
+		goto on_error;
 	}
-	/* Sort the symbols
+	/* The window contains the chunk and the maximum match offset of bytes before it
 	 */
-	qsort(
-	 code_symbols,
-	 512,
-	 sizeof( libfwnt_lzxpress_huffman_code_symbol_t ),
-	 (int (*)(const void *, const void *)) &libfwnt_lzxpress_huffman_compare_symbols );
+	( *context )->hash_chain = (int32_t *) memory_allocate(
+	                                        sizeof( int32_t ) * ( LIBFWNT_LZXPRESS_HUFFMAN_CHUNK_SIZE + LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_MATCH_OFFSET ) );
 
-	/* Find the first symbol with a code size > 0
-	 */
-	for( symbol_index = 0;
-	     symbol_index < 512;
-	     symbol_index++ )
+	if( ( *context )->hash_chain == NULL )
 	{
-		if( code_symbols[ symbol_index ].code_size > 0 )
-		{
-			break;
-		}
-	}
-	bits           = 0;
-	number_of_bits = 1;
-
-	tree_nodes[ tree_node_index ].is_leaf = 0;
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+		 "%s: unable to create hash chain.",
+		 function );
 
-	tree_node_index++;
+		goto on_error;
+	}
+	( *context )->tokens = (uint32_t *) memory_allocate(
+	                                     sizeof( uint32_t ) * LIBFWNT_LZXPRESS_HUFFMAN_CHUNK_SIZE );
 
-	while( symbol_index < 512 )
+	if( ( *context )->tokens == NULL )
 	{
-		tree_nodes[ tree_node_index ].symbol  = code_symbols[ symbol_index ].symbol;
-		tree_nodes[ tree_node_index ].is_leaf = 1;
-
-		bits         <<= code_symbols[ symbol_index ].code_size - number_of_bits;
-		number_of_bits = (uint8_t) code_symbols[ symbol_index ].code_size;
-
-		tree_node_index = libfwnt_lzxpress_huffman_tree_add_leaf(
-		                   tree_nodes,
-		                   tree_node_index,
-		                   bits,
-		                   number_of_bits );
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+		 "%s: unable to create tokens.",
+		 function );
 
-		bits++;
-		symbol_index++;
+		goto on_error;
 	}
-#if defined( HAVE_DEBUG_OUTPUT )
-	if( libcnotify_verbose != 0 )
-	{
-		for( tree_node_index = 0;
-		     tree_node_index < 1024;
-		     tree_node_index++ )
-		{
-			libcnotify_printf(
-			 "%s: tree node: %04d symbol\t\t: 0x%04" PRIx16 "\n",
-			 function,
-			 tree_node_index,
-			 tree_nodes[ tree_node_index ].symbol );
-
-			libcnotify_printf(
-			 "%s: tree node: %04d is leaf\t\t: %" PRId8 "\n",
-			 function,
-			 tree_node_index,
-			 tree_nodes[ tree_node_index ].is_leaf );
-
-			libcnotify_printf(
-			 "%s: tree node: %04d sub node: 0\t\t: %" PRId16 "\n",
-			 function,
-			 tree_node_index,
-			 tree_nodes[ tree_node_index ].sub_tree_node_indexes[ 0 ] );
-
-			libcnotify_printf(
-			 "%s: tree node: %04d sub node: 1\t\t: %" PRId16 "\n",
-			 function,
-			 tree_node_index,
-			 tree_nodes[ tree_node_index ].sub_tree_node_indexes[ 1 ] );
-		}
-		libcnotify_printf(
-		 "\n" );
+	( *context )->uncompressed_data      = uncompressed_data;
+	( *context )->uncompressed_data_size = uncompressed_data_size;
+	( *context )->maximum_search_depth   = libfwnt_lzxpress_huffman_compression_levels[ compression_level - 1 ].maximum_search_depth;
+	( *context )->nice_match_size        = libfwnt_lzxpress_huffman_compression_levels[ compression_level - 1 ].nice_match_size;
+	( *context )->use_lazy_matching      = libfwnt_lzxpress_huffman_compression_levels[ compression_level - 1 ].use_lazy_matching;
 
-		for( symbol_index = 0;
-		     symbol_index < 512;
-		     symbol_index++ )
-		{
-			libcnotify_printf(
-			 "%s: symbol: %03d symbol\t\t\t: 0x%04" PRIx16 "\n",
-			 function,
-			 symbol_index,
-			 code_symbols[ symbol_index ].symbol );
+	return( 1 );
 
-			libcnotify_printf(
-			 "%s: symbol: %03d code size\t\t: %" PRIu16 "\n",
-			 function,
-			 symbol_index,
-			 code_symbols[ symbol_index ].code_size );
-		}
-		libcnotify_printf(
-		 "\n" );
+on_error:
+	if( *context != NULL )
+	{
+		libfwnt_lzxpress_huffman_compression_context_free(
+		 context,
+		 NULL );
 	}
-#endif
-	return( 1 );
+	return( -1 );
 }
 
-/* Reads a Huffman tree symbol
- * Returns 1 on success or -1 on error
+/* Frees a LZXPRESS Huffman compression context
+ * Returns 1 if successful or -1 on error
  */
-int libfwnt_lzxpress_huffman_tree_read_symbol(
-     libfwnt_lzxpress_huffman_tree_node_t *tree_nodes,
-     libfwnt_bit_stream_t *compressed_data_bit_stream,
-     uint16_t *symbol,
+int libfwnt_lzxpress_huffman_compression_context_free(
+     libfwnt_lzxpress_huffman_compression_context_t **context,
      libcerror_error_t **error )
 {
-	libfwnt_lzxpress_huffman_tree_node_t *tree_node = NULL;
-	static char *function                           = "libfwnt_lzxpress_huffman_tree_read_symbol";
-	uint16_t bits                                   = 0;
-	uint8_t sub_tree_node_index                     = 0;
+	static char *function = "libfwnt_lzxpress_huffman_compression_context_free";
 
-	if( compressed_data_bit_stream == NULL )
+	if( context == NULL )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
 		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid compressed data bit stream.",
+		 "%s: invalid context.",
 		 function );
 
 		return( -1 );
 	}
-	if( symbol == NULL )
+	if( *context != NULL )
 	{
-		libcerror_error_set(
-		 error,
-		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid symbol.",
-		 function );
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+		if( ( *context )->chunk_data != NULL )
+		{
+			memory_free(
+			 ( *context )->chunk_data );
+		}
+#endif
+		if( ( *context )->tokens != NULL )
+		{
+			memory_free(
+			 ( *context )->tokens );
+		}
+		if( ( *context )->hash_chain != NULL )
+		{
+			memory_free(
+			 ( *context )->hash_chain );
+		}
+		if( ( *context )->hash_table != NULL )
+		{
+			memory_free(
+			 ( *context )->hash_table );
+		}
+		memory_free(
+		 *context );
 
-		return( -1 );
+		*context = NULL;
 	}
-	tree_node = &( tree_nodes[ 0 ] );
+	return( 1 );
+}
 
-	do
+/* Inserts an uncompressed data offset into the hash table
+ * The offset must be in the window and offsets must be inserted in increasing order
+ */
+void libfwnt_lzxpress_huffman_compression_context_insert_position(
+      libfwnt_lzxpress_huffman_compression_context_t *context,
+      size_t uncompressed_data_offset )
+{
+	const uint8_t *uncompressed_data = NULL;
+	uint32_t hash_value              = 0;
+	int32_t window_position          = 0;
+
+	/* The last 2 bytes cannot start a match
+	 */
+	if( ( uncompressed_data_offset + 3 ) > context->uncompressed_data_size )
 	{
-/* TODO add a read number of bits function ? */
-		sub_tree_node_index = (uint8_t) ( ( compressed_data_bit_stream->bits >> 31 ) & 0x00000001UL );
+		return;
+	}
+	uncompressed_data = &( context->uncompressed_data[ uncompressed_data_offset ] );
+	hash_value        = libfwnt_lzxpress_huffman_hash( uncompressed_data );
+	window_position   = (int32_t) ( uncompressed_data_offset - context->window_offset );
 
-		compressed_data_bit_stream->bits          <<= 1;
-		compressed_data_bit_stream->number_of_bits -= 1;
+	context->hash_chain[ window_position ] = context->hash_table[ hash_value ];
+	context->hash_table[ hash_value ]      = window_position;
+}
 
-#if defined( HAVE_DEBUG_OUTPUT )
-		if( libcnotify_verbose != 0 )
-		{
-			libcnotify_printf(
-			 "%s: sub tree node index\t\t: 0x%02" PRIx8 "\n",
-			 function,
-			 sub_tree_node_index );
-		}
-#endif
-		if( ( compressed_data_bit_stream->number_of_bits < 16 )
-		 && ( compressed_data_bit_stream->byte_stream_offset <= ( compressed_data_bit_stream->byte_stream_size - 2 ) ) )
-		{
-			byte_stream_copy_to_uint16_little_endian(
-			 &( compressed_data_bit_stream->byte_stream[ compressed_data_bit_stream->byte_stream_offset ] ),
-			 bits );
+/* Finds the longest match for the data at the uncompressed data offset
+ * All preceding offsets in the window must have been inserted, the offset itself not
+ * Returns the match size or 0 if no match was found
+ */
+size_t libfwnt_lzxpress_huffman_compression_context_find_match(
+        libfwnt_lzxpress_huffman_compression_context_t *context,
+        size_t uncompressed_data_offset,
+        size_t uncompressed_data_end_offset,
+        size_t *match_offset )
+{
+	const uint8_t *candidate_data    = NULL;
+	const uint8_t *uncompressed_data = NULL;
+	size_t best_match_offset         = 0;
+	size_t best_match_size           = 2;
+	size_t candidate_offset          = 0;
+	size_t maximum_match_size        = 0;
+	size_t match_size                = 0;
+	int32_t window_position          = 0;
+	int search_depth                 = 0;
+
+	if( ( uncompressed_data_offset + 3 ) > uncompressed_data_end_offset )
+	{
+		return( 0 );
+	}
+	maximum_match_size = uncompressed_data_end_offset - uncompressed_data_offset;
+	uncompressed_data  = &( context->uncompressed_data[ uncompressed_data_offset ] );
+	window_position    = context->hash_table[ libfwnt_lzxpress_huffman_hash( uncompressed_data ) ];
+	search_depth       = context->maximum_search_depth;
+
+	while( ( window_position >= 0 )
+	    && ( search_depth > 0 ) )
+	{
+		candidate_offset = uncompressed_data_offset - ( context->window_offset + (size_t) window_position );
 
-			compressed_data_bit_stream->bits               |= bits << ( 16 - compressed_data_bit_stream->number_of_bits );
-			compressed_data_bit_stream->byte_stream_offset += 2;
-			compressed_data_bit_stream->number_of_bits     += 16;
+		if( candidate_offset > LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_MATCH_OFFSET )
+		{
+			break;
 		}
-		tree_node = tree_node->sub_tree_nodes[ sub_tree_node_index ];
+		candidate_data = &( uncompressed_data[ -( (ssize_t) candidate_offset ) ] );
 
-		if( tree_node == NULL )
+		/* A candidate can only be longer if it matches at the end of the best match
+		 */
+		if( candidate_data[ best_match_size ] == uncompressed_data[ best_match_size ] )
 		{
-			libcerror_error_set(
-			 error,
-			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-			 LIBCERROR_RUNTIME_ERROR_VALUE_MISSING,
-			 "%s: missing tree node value.",
-			 function );
+			match_size = 0;
 
-			return( -1 );
+			while( ( match_size < maximum_match_size )
+			    && ( candidate_data[ match_size ] == uncompressed_data[ match_size ] ) )
+			{
+				match_size++;
+			}
+			/* A 3 byte match that far back is not smaller than the 3 literals
+			 */
+			if( ( match_size > best_match_size )
+			 && ( ( match_size > 3 )
+			  || ( candidate_offset <= LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_SHORT_MATCH_OFFSET ) ) )
+			{
+				best_match_offset = candidate_offset;
+				best_match_size   = match_size;
+
+				if( ( match_size >= context->nice_match_size )
+				 || ( match_size == maximum_match_size ) )
+				{
+					break;
+				}
+			}
 		}
-	}
-	while( tree_node->is_leaf == 0 );
+		window_position = context->hash_chain[ window_position ];
 
-	*symbol = tree_node->symbol;
+		search_depth--;
+	}
+	if( best_match_offset == 0 )
+	{
+		return( 0 );
+	}
+	*match_offset = best_match_offset;
 
-	return( 1 );
+	return( best_match_size );
 }
 
-/* Decompresses a LZXPRESS Huffman compressed chunk
- * Return 1 on success or -1 on error
+/* Starts the bit stream after the Huffman code sizes table
+ * The decompressor reads the first two 16-bit words at once
+ * Returns 1 if successful or -1 on error
  */
-int libfwnt_lzxpress_huffman_decompress_chunk(
-     const uint8_t *compressed_data,
-     size_t compressed_data_size,
-     size_t *compressed_data_offset,
-     uint8_t *uncompressed_data,
-     size_t uncompressed_data_size,
-     size_t *uncompressed_data_offset,
+int libfwnt_lzxpress_huffman_compression_context_start_bit_stream(
+     libfwnt_lzxpress_huffman_compression_context_t *context,
      libcerror_error_t **error )
 {
-	libfwnt_lzxpress_huffman_tree_node_t tree_nodes[ 1024 ];
-
-	libfwnt_bit_stream_t *compressed_data_bit_stream = NULL;
-	static char *function                            = "libfwnt_lzxpress_huffman_decompress_chunk";
-	size_t compression_uncompressed_data_offset      = 0;
-	size_t next_chunk_uncompressed_data_offset       = 0;
-	size_t safe_uncompressed_data_offset             = 0;
-	uint32_t compression_offset                      = 0;
-	uint16_t bits                                    = 0;
-	uint16_t compression_size                        = 0;
-	uint16_t symbol                                  = 0;
+	static char *function = "libfwnt_lzxpress_huffman_compression_context_start_bit_stream";
 
+	if( ( context->compressed_data_size - context->compressed_data_offset ) < 4 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+		 "%s: compressed data size value too small.",
+		 function );
+
+		return( -1 );
+	}
+	context->word_offsets[ 0 ] = context->compressed_data_offset;
+	context->word_offsets[ 1 ] = context->compressed_data_offset + 2;
+
+	memory_set(
+	 &( context->compressed_data[ context->compressed_data_offset ] ),
+	 0,
+	 4 );
+
+	context->compressed_data_offset  += 4;
+	context->number_of_words          = 2;
+	context->bits                     = 0;
+	context->number_of_bits           = 0;
+	context->number_of_available_bits = 32;
+
+	return( 1 );
+}
+
+/* Writes bits to the bit stream
+ * A new 16-bit word is reserved at the current compressed data offset whenever
+ * the decompressor would read one, so that the bytes written in between the bits,
+ * such as match sizes, end up at the offset the decompressor reads them from
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_lzxpress_huffman_compression_context_write_bits(
+     libfwnt_lzxpress_huffman_compression_context_t *context,
+     uint32_t value,
+     uint8_t number_of_bits,
+     libcerror_error_t **error )
+{
+	static char *function = "libfwnt_lzxpress_huffman_compression_context_write_bits";
+	uint16_t word         = 0;
+
+	context->bits            = ( context->bits << number_of_bits ) | value;
+	context->number_of_bits += number_of_bits;
+
+	if( context->number_of_bits >= 16 )
+	{
+		context->number_of_bits -= 16;
+
+		word = (uint16_t) ( context->bits >> context->number_of_bits );
+
+		byte_stream_copy_from_uint16_little_endian(
+		 &( context->compressed_data[ context->word_offsets[ 0 ] ] ),
+		 word );
+
+		context->word_offsets[ 0 ] = context->word_offsets[ 1 ];
+
+		context->number_of_words--;
+	}
+	context->number_of_available_bits -= (int) number_of_bits;
+
+	if( context->number_of_available_bits < 16 )
+	{
+		if( ( context->compressed_data_size - context->compressed_data_offset ) < 2 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+			 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+			 "%s: compressed data size value too small.",
+			 function );
+
+			return( -1 );
+		}
+		context->compressed_data[ context->compressed_data_offset ]     = 0;
+		context->compressed_data[ context->compressed_data_offset + 1 ] = 0;
+
+		context->word_offsets[ context->number_of_words ] = context->compressed_data_offset;
+
+		context->compressed_data_offset   += 2;
+		context->number_of_words          += 1;
+		context->number_of_available_bits += 16;
+	}
+	return( 1 );
+}
+
+/* Writes a byte in between the bits of the bit stream
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_lzxpress_huffman_compression_context_write_byte(
+     libfwnt_lzxpress_huffman_compression_context_t *context,
+     uint8_t value,
+     libcerror_error_t **error )
+{
+	static char *function = "libfwnt_lzxpress_huffman_compression_context_write_byte";
+
+	if( context->compressed_data_offset >= context->compressed_data_size )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+		 "%s: compressed data size value too small.",
+		 function );
+
+		return( -1 );
+	}
+	context->compressed_data[ context->compressed_data_offset++ ] = value;
+
+	return( 1 );
+}
+
+/* Writes the remaining bits of the bit stream, the reserved words were cleared
+ */
+void libfwnt_lzxpress_huffman_compression_context_flush_bit_stream(
+      libfwnt_lzxpress_huffman_compression_context_t *context )
+{
+	uint16_t word = 0;
+
+	if( context->number_of_bits > 0 )
+	{
+		word = (uint16_t) ( context->bits << ( 16 - context->number_of_bits ) );
+
+		byte_stream_copy_from_uint16_little_endian(
+		 &( context->compressed_data[ context->word_offsets[ 0 ] ] ),
+		 word );
+	}
+	context->number_of_words = 0;
+	context->number_of_bits  = 0;
+}
+
+/* Compares two Huffman weights
+ * Returns 1 if the first weight is larger than the second, 0 if equal or -1 if smaller
+ */
+int libfwnt_lzxpress_huffman_compare_weights(
+     const uint32_t *first_weight,
+     const uint32_t *second_weight )
+{
+	if( *first_weight < *second_weight )
+	{
+		return( -1 );
+	}
+	else if( *first_weight > *second_weight )
+	{
+		return( 1 );
+	}
+	return( 0 );
+}
+
+/* Determines the Huffman code sizes of the 512 symbols from their frequencies
+ * The code sizes are limited to 15 bits by halving the frequencies until the tree fits,
+ * symbols with a frequency of 0 get a code size of 0. At least 2 symbols must be used.
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_lzxpress_huffman_get_code_sizes(
+     const uint32_t *symbol_frequencies,
+     uint8_t *code_sizes,
+     libcerror_error_t **error )
+{
+	uint32_t frequencies[ 512 ];
+	uint32_t node_weights[ 1023 ];
+	uint16_t node_parents[ 1023 ];
+	uint8_t node_depths[ 1023 ];
+
+	static char *function      = "libfwnt_lzxpress_huffman_get_code_sizes";
+	uint32_t first_weight      = 0;
+	uint16_t first_node_index  = 0;
+	uint16_t leaf_node_index   = 0;
+	uint16_t maximum_code_size = 0;
+	uint16_t merged_node_index = 0;
+	uint16_t next_node_index   = 0;
+	uint16_t node_index        = 0;
+	uint16_t number_of_leaves  = 0;
+	uint16_t symbol            = 0;
+	int merge_iterator         = 0;
+
+	for( symbol = 0;
+	     symbol < 512;
+	     symbol++ )
+	{
+		frequencies[ symbol ] = symbol_frequencies[ symbol ];
+	}
+	do
+	{
+		/* The leaves are sorted by weight, the symbol is stored in the lower 9 bits
+		 * so that leaves of equal weight are ordered by symbol
+		 */
+		number_of_leaves = 0;
+
+		for( symbol = 0;
+		     symbol < 512;
+		     symbol++ )
+		{
+			if( frequencies[ symbol ] > 0 )
+			{
+				node_weights[ number_of_leaves++ ] = ( frequencies[ symbol ] << 9 ) | symbol;
+			}
+		}
+		if( number_of_leaves < 2 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+			 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+			 "%s: invalid number of used symbols value too small.",
+			 function );
+
+			return( -1 );
+		}
+		qsort(
+		 node_weights,
+		 number_of_leaves,
+		 sizeof( uint32_t ),
+		 (int (*)(const void *, const void *)) &libfwnt_lzxpress_huffman_compare_weights );
+
+		/* Merge the 2 lightest nodes until one node remains, since the merged nodes
+		 * are created in order of weight the lightest nodes are either the next leaf
+		 * or the next merged node
+		 */
+		leaf_node_index   = 0;
+		merged_node_index = number_of_leaves;
+		next_node_index   = number_of_leaves;
+
+		while( next_node_index < ( ( 2 * number_of_leaves ) - 1 ) )
+		{
+			node_weights[ next_node_index ] = 0;
+
+			for( merge_iterator = 0;
+			     merge_iterator < 2;
+			     merge_iterator++ )
+			{
+				if( ( leaf_node_index < number_of_leaves )
+				 && ( ( merged_node_index >= next_node_index )
+				  || ( ( node_weights[ leaf_node_index ] >> 9 ) <= node_weights[ merged_node_index ] ) ) )
+				{
+					first_node_index = leaf_node_index++;
+					first_weight     = node_weights[ first_node_index ] >> 9;
+				}
+				else
+				{
+					first_node_index = merged_node_index++;
+					first_weight     = node_weights[ first_node_index ];
+				}
+				node_parents[ first_node_index ]  = next_node_index;
+				node_weights[ next_node_index ]  += first_weight;
+			}
+			next_node_index++;
+		}
+		node_depths[ next_node_index - 1 ] = 0;
+
+		maximum_code_size = 0;
+
+		for( node_index = next_node_index - 1;
+		     node_index > 0;
+		     node_index-- )
+		{
+			node_depths[ node_index - 1 ] = node_depths[ node_parents[ node_index - 1 ] ] + 1;
+
+			if( node_depths[ node_index - 1 ] > maximum_code_size )
+			{
+				maximum_code_size = node_depths[ node_index - 1 ];
+			}
+		}
+		if( maximum_code_size > LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_CODE_SIZE )
+		{
+			for( symbol = 0;
+			     symbol < 512;
+			     symbol++ )
+			{
+				if( frequencies[ symbol ] > 0 )
+				{
+					frequencies[ symbol ] = ( frequencies[ symbol ] >> 1 ) | 1;
+				}
+			}
+		}
+	}
+	while( maximum_code_size > LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_CODE_SIZE );
+
+	if( memory_set(
+	     code_sizes,
+	     0,
+	     sizeof( uint8_t ) * 512 ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+		 "%s: unable to clear code sizes.",
+		 function );
+
+		return( -1 );
+	}
+	for( node_index = 0;
+	     node_index < number_of_leaves;
+	     node_index++ )
+	{
+		code_sizes[ node_weights[ node_index ] & 0x000001ffUL ] = node_depths[ node_index ];
+	}
+	return( 1 );
+}
+
+/* Retrieves the Huffman symbol of a token
+ * A match symbol contains the number of bits of the match offset after its most
+ * significant bit in the upper 4 bits and the match size - 3, up to 15, in the lower 4 bits
+ * Returns the symbol
+ */
+uint16_t libfwnt_lzxpress_huffman_get_token_symbol(
+          uint32_t token )
+{
+	uint32_t match_offset = 0;
+	uint16_t match_size   = 0;
+	uint16_t offset_size  = 0;
+
+	if( token < 256 )
+	{
+		return( (uint16_t) token );
+	}
+	match_offset = token >> 16;
+	match_size   = (uint16_t) ( token & 0x0000ffffUL );
+
+	while( ( match_offset >> ( offset_size + 1 ) ) != 0 )
+	{
+		offset_size++;
+	}
+	if( match_size > 15 )
+	{
+		match_size = 15;
+	}
+	return( 256 + ( offset_size << 4 ) + match_size );
+}
+
+/* Compresses a LZXPRESS Huffman chunk
+ * A chunk contains up to 64 KiB of uncompressed data, matches can refer to data
+ * of preceding chunks. The last chunk, which is smaller than 64 KiB, ends with
+ * an end-of-block symbol
+ * Returns 1 on success or -1 on error
+ */
+int libfwnt_lzxpress_huffman_compress_chunk(
+     libfwnt_lzxpress_huffman_compression_context_t *context,
+     size_t chunk_offset,
+     uint8_t *compressed_data,
+     size_t compressed_data_size,
+     size_t *compressed_data_offset,
+     libcerror_error_t **error )
+{
+	uint32_t symbol_codes[ 512 ];
+	uint32_t symbol_frequencies[ 512 ];
+	uint16_t number_of_codes_per_size[ LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_CODE_SIZE + 1 ];
+	uint32_t next_codes[ LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_CODE_SIZE + 1 ];
+	uint8_t code_sizes[ 512 ];
+
+	static char *function       = "libfwnt_lzxpress_huffman_compress_chunk";
+	size_t chunk_end_offset     = 0;
+	size_t insert_offset        = 0;
+	size_t match_offset         = 0;
+	size_t match_size           = 0;
+	size_t next_match_offset    = 0;
+	size_t next_match_size      = 0;
+	size_t token_index          = 0;
+	size_t number_of_tokens     = 0;
+	size_t uncompressed_offset  = 0;
+	uint32_t token              = 0;
+	uint16_t symbol             = 0;
+	uint8_t code_size           = 0;
+	uint8_t has_next_match      = 0;
+	uint8_t offset_size         = 0;
+	int is_last_chunk           = 0;
+	int number_of_symbols       = 0;
+
+	if( context == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid context.",
+		 function );
+
+		return( -1 );
+	}
+	if( chunk_offset > context->uncompressed_data_size )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: chunk offset value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
 	if( compressed_data == NULL )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
 		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid compressed data.",
+		 "%s: invalid compressed data.",
+		 function );
+
+		return( -1 );
+	}
+	if( compressed_data_offset == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed data offset.",
+		 function );
+
+		return( -1 );
+	}
+	if( ( *compressed_data_offset > compressed_data_size )
+	 || ( ( compressed_data_size - *compressed_data_offset ) < 256 ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+		 "%s: compressed data size value too small.",
+		 function );
+
+		return( -1 );
+	}
+	chunk_end_offset = context->uncompressed_data_size;
+
+	if( ( chunk_end_offset - chunk_offset ) >= LIBFWNT_LZXPRESS_HUFFMAN_CHUNK_SIZE )
+	{
+		chunk_end_offset = chunk_offset + LIBFWNT_LZXPRESS_HUFFMAN_CHUNK_SIZE;
+	}
+	else
+	{
+		is_last_chunk = 1;
+	}
+	if( chunk_offset > LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_MATCH_OFFSET )
+	{
+		context->window_offset = chunk_offset - LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_MATCH_OFFSET;
+	}
+	else
+	{
+		context->window_offset = 0;
+	}
+	/* Setting every byte to 0xff sets every hash table entry to -1
+	 */
+	if( memory_set(
+	     context->hash_table,
+	     0xff,
+	     sizeof( int32_t ) * LIBFWNT_LZXPRESS_HUFFMAN_HASH_TABLE_SIZE ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+		 "%s: unable to clear hash table.",
+		 function );
+
+		return( -1 );
+	}
+	if( memory_set(
+	     symbol_frequencies,
+	     0,
+	     sizeof( uint32_t ) * 512 ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+		 "%s: unable to clear symbol frequencies.",
+		 function );
+
+		return( -1 );
+	}
+	/* Determine the literals and matches of the chunk
+	 */
+	insert_offset       = context->window_offset;
+	uncompressed_offset = chunk_offset;
+
+	while( uncompressed_offset < chunk_end_offset )
+	{
+		if( has_next_match != 0 )
+		{
+			match_offset   = next_match_offset;
+			match_size     = next_match_size;
+			has_next_match = 0;
+		}
+		else
+		{
+			while( insert_offset < uncompressed_offset )
+			{
+				libfwnt_lzxpress_huffman_compression_context_insert_position(
+				 context,
+				 insert_offset++ );
+			}
+			match_size = libfwnt_lzxpress_huffman_compression_context_find_match(
+			              context,
+			              uncompressed_offset,
+			              chunk_end_offset,
+			              &match_offset );
+		}
+		/* Emit a literal instead of the match if the next byte starts a longer match
+		 */
+		if( ( match_size > 0 )
+		 && ( match_size < context->nice_match_size )
+		 && ( context->use_lazy_matching != 0 ) )
+		{
+			libfwnt_lzxpress_huffman_compression_context_insert_position(
+			 context,
+			 insert_offset++ );
+
+			next_match_size = libfwnt_lzxpress_huffman_compression_context_find_match(
+			                   context,
+			                   uncompressed_offset + 1,
+			                   chunk_end_offset,
+			                   &next_match_offset );
+
+			if( next_match_size > match_size )
+			{
+				match_size     = 0;
+				has_next_match = 1;
+			}
+		}
+		if( match_size > 0 )
+		{
+			context->tokens[ number_of_tokens++ ] = (uint32_t) ( ( match_offset << 16 ) | ( match_size - 3 ) );
+
+			uncompressed_offset += match_size;
+		}
+		else
+		{
+			context->tokens[ number_of_tokens++ ] = context->uncompressed_data[ uncompressed_offset ];
+
+			uncompressed_offset += 1;
+		}
+	}
+	for( token_index = 0;
+	     token_index < number_of_tokens;
+	     token_index++ )
+	{
+		symbol_frequencies[ libfwnt_lzxpress_huffman_get_token_symbol( context->tokens[ token_index ] ) ] += 1;
+	}
+	if( is_last_chunk != 0 )
+	{
+		symbol_frequencies[ 256 ] += 1;
+	}
+	/* A Huffman code needs at least 2 symbols, the unused symbol 0 or 1 is added otherwise
+	 */
+	number_of_symbols = 0;
+
+	for( symbol = 0;
+	     symbol < 512;
+	     symbol++ )
+	{
+		if( symbol_frequencies[ symbol ] > 0 )
+		{
+			number_of_symbols++;
+		}
+	}
+	if( number_of_symbols < 2 )
+	{
+		if( symbol_frequencies[ 0 ] == 0 )
+		{
+			symbol_frequencies[ 0 ] = 1;
+		}
+		else
+		{
+			symbol_frequencies[ 1 ] = 1;
+		}
+	}
+	if( libfwnt_lzxpress_huffman_get_code_sizes(
+	     symbol_frequencies,
+	     code_sizes,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to determine Huffman code sizes.",
+		 function );
+
+		return( -1 );
+	}
+	/* Assign the canonical Huffman codes in order of code size and symbol
+	 * as the decompressor does when it reads the Huffman tree
+	 */
+	if( memory_set(
+	     number_of_codes_per_size,
+	     0,
+	     sizeof( uint16_t ) * ( LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_CODE_SIZE + 1 ) ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+		 "%s: unable to clear number of codes per size.",
+		 function );
+
+		return( -1 );
+	}
+	for( symbol = 0;
+	     symbol < 512;
+	     symbol++ )
+	{
+		number_of_codes_per_size[ code_sizes[ symbol ] ] += 1;
+	}
+	next_codes[ 0 ] = 0;
+	next_codes[ 1 ] = 0;
+
+	for( code_size = 2;
+	     code_size <= LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_CODE_SIZE;
+	     code_size++ )
+	{
+		next_codes[ code_size ] = ( next_codes[ code_size - 1 ] + number_of_codes_per_size[ code_size - 1 ] ) << 1;
+	}
+	for( symbol = 0;
+	     symbol < 512;
+	     symbol++ )
+	{
+		code_size = code_sizes[ symbol ];
+
+		if( code_size > 0 )
+		{
+			symbol_codes[ symbol ] = next_codes[ code_size ]++;
+		}
+	}
+	/* The table contains a 4-bit code size per symbol, the lower 4 bits of a byte
+	 * contain the code size of the even symbol
+	 */
+	for( symbol = 0;
+	     symbol < 512;
+	     symbol += 2 )
+	{
+		compressed_data[ *compressed_data_offset ] = code_sizes[ symbol ] | ( code_sizes[ symbol + 1 ] << 4 );
+
+		*compressed_data_offset += 1;
+	}
+	context->compressed_data        = compressed_data;
+	context->compressed_data_size   = compressed_data_size;
+	context->compressed_data_offset = *compressed_data_offset;
+
+	if( libfwnt_lzxpress_huffman_compression_context_start_bit_stream(
+	     context,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to start bit stream.",
+		 function );
+
+		return( -1 );
+	}
+	for( token_index = 0;
+	     token_index < number_of_tokens;
+	     token_index++ )
+	{
+		token  = context->tokens[ token_index ];
+		symbol = libfwnt_lzxpress_huffman_get_token_symbol( token );
+
+		if( libfwnt_lzxpress_huffman_compression_context_write_bits(
+		     context,
+		     symbol_codes[ symbol ],
+		     code_sizes[ symbol ],
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_IO,
+			 LIBCERROR_IO_ERROR_WRITE_FAILED,
+			 "%s: unable to write symbol.",
+			 function );
+
+			return( -1 );
+		}
+		if( symbol < 256 )
+		{
+			continue;
+		}
+		/* The match size is stored in a byte and if that does not suffice
+		 * in 16-bits that follow the byte
+		 */
+		match_size = (size_t) ( token & 0x0000ffffUL );
+
+		if( match_size >= 15 )
+		{
+			if( match_size < ( 15 + 255 ) )
+			{
+				if( libfwnt_lzxpress_huffman_compression_context_write_byte(
+				     context,
+				     (uint8_t) ( match_size - 15 ),
+				     error ) != 1 )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_IO,
+					 LIBCERROR_IO_ERROR_WRITE_FAILED,
+					 "%s: unable to write match size.",
+					 function );
+
+					return( -1 );
+				}
+			}
+			else if( ( libfwnt_lzxpress_huffman_compression_context_write_byte(
+			           context,
+			           0xff,
+			           error ) != 1 )
+			      || ( libfwnt_lzxpress_huffman_compression_context_write_byte(
+			           context,
+			           (uint8_t) ( match_size & 0xff ),
+			           error ) != 1 )
+			      || ( libfwnt_lzxpress_huffman_compression_context_write_byte(
+			           context,
+			           (uint8_t) ( match_size >> 8 ),
+			           error ) != 1 ) )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_IO,
+				 LIBCERROR_IO_ERROR_WRITE_FAILED,
+				 "%s: unable to write match size.",
+				 function );
+
+				return( -1 );
+			}
+		}
+		/* The most significant bit of the match offset is implied by the symbol
+		 */
+		offset_size = (uint8_t) ( ( symbol - 256 ) >> 4 );
+
+		if( libfwnt_lzxpress_huffman_compression_context_write_bits(
+		     context,
+		     ( token >> 16 ) & ( ( 1UL << offset_size ) - 1 ),
+		     offset_size,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_IO,
+			 LIBCERROR_IO_ERROR_WRITE_FAILED,
+			 "%s: unable to write match offset.",
+			 function );
+
+			return( -1 );
+		}
+	}
+	if( is_last_chunk != 0 )
+	{
+		if( libfwnt_lzxpress_huffman_compression_context_write_bits(
+		     context,
+		     symbol_codes[ 256 ],
+		     code_sizes[ 256 ],
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_IO,
+			 LIBCERROR_IO_ERROR_WRITE_FAILED,
+			 "%s: unable to write end-of-block symbol.",
+			 function );
+
+			return( -1 );
+		}
+	}
+	libfwnt_lzxpress_huffman_compression_context_flush_bit_stream(
+	 context );
+
+	*compressed_data_offset = context->compressed_data_offset;
+
+	return( 1 );
+}
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+
+/* Compresses the chunk of a context into the chunk data of the context
+ * Returns 1 on success or -1 on error
+ */
+int libfwnt_lzxpress_huffman_compress_chunk_thread_callback(
+     libfwnt_lzxpress_huffman_compression_context_t *context )
+{
+	size_t chunk_data_offset = 0;
+
+	context->result = libfwnt_lzxpress_huffman_compress_chunk(
+	                   context,
+	                   context->chunk_offset,
+	                   context->chunk_data,
+	                   LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_COMPRESSED_CHUNK_SIZE,
+	                   &chunk_data_offset,
+	                   NULL );
+
+	context->chunk_data_size = chunk_data_offset;
+
+	return( context->result );
+}
+
+#endif /* defined( HAVE_MULTI_THREAD_SUPPORT ) */
+
+/* Compresses data using LZXPRESS Huffman compression
+ * The compression level ranges from 1 (fastest) to 9 (smallest) and determines
+ * how many earlier occurrences are examined per match search. Chunks are compressed
+ * independently in number of threads when multi-threading support is available,
+ * the compressed data does not depend on the number of threads
+ * Returns 1 on success or -1 on error
+ */
+int libfwnt_lzxpress_huffman_compress(
+     const uint8_t *uncompressed_data,
+     size_t uncompressed_data_size,
+     uint8_t *compressed_data,
+     size_t *compressed_data_size,
+     int compression_level,
+     int number_of_threads,
+     libcerror_error_t **error )
+{
+	libfwnt_lzxpress_huffman_compression_context_t *contexts[ LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_NUMBER_OF_THREADS ];
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	libcthreads_thread_t *threads[ LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_NUMBER_OF_THREADS ];
+#endif
+
+	static char *function         = "libfwnt_lzxpress_huffman_compress";
+	size_t chunk_index            = 0;
+	size_t chunk_offset           = 0;
+	size_t compressed_data_offset = 0;
+	size_t number_of_chunks       = 0;
+	int context_index             = 0;
+	int number_of_contexts        = 1;
+	int result                    = -1;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	int number_of_batch_chunks    = 0;
+	int thread_index              = 0;
+#endif
+
+	if( uncompressed_data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid uncompressed data.",
 		 function );
 
 		return( -1 );
 	}
-	if( compressed_data_size > (size_t) SSIZE_MAX )
+	if( uncompressed_data_size > (size_t) SSIZE_MAX )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
 		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
-		 "%s: invalid compressed data size value exceeds maximum.",
+		 "%s: invalid uncompressed data size value exceeds maximum.",
 		 function );
 
 		return( -1 );
 	}
-	if( compressed_data_offset == NULL )
+	if( compressed_data == NULL )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
 		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid compressed data offset.",
-		 function );
-
-		return( -1 );
-	}
-	if( ( *compressed_data_offset >= compressed_data_size )
-	 || ( ( compressed_data_size - *compressed_data_offset ) < 260 ) )
-	{
-		libcerror_error_set(
-		 error,
-		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
-		 "%s: compressed data offset value out of bounds.",
+		 "%s: invalid compressed data.",
 		 function );
 
 		return( -1 );
 	}
-	if( uncompressed_data == NULL )
+	if( compressed_data_size == NULL )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
 		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid uncompressed data.",
+		 "%s: invalid compressed data size.",
 		 function );
 
 		return( -1 );
 	}
-	if( uncompressed_data_size > (size_t) SSIZE_MAX )
+	if( *compressed_data_size > (size_t) SSIZE_MAX )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
 		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
-		 "%s: invalid uncompressed data size value exceeds maximum.",
+		 "%s: invalid compressed data size value exceeds maximum.",
 		 function );
 
 		return( -1 );
 	}
-	if( uncompressed_data_offset == NULL )
+	if( ( compression_level < 1 )
+	 || ( compression_level > 9 ) )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid uncompressed data offset.",
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported compression level.",
 		 function );
 
 		return( -1 );
 	}
-	if( *uncompressed_data_offset > uncompressed_data_size )
+	if( ( number_of_threads < 0 )
+	 || ( number_of_threads > LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_NUMBER_OF_THREADS ) )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
 		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
-		 "%s: uncompressed data offset value out of bounds.",
+		 "%s: invalid number of threads value out of bounds.",
 		 function );
 
 		return( -1 );
 	}
-	if( libfwnt_lzxpress_huffman_tree_read(
-	     tree_nodes,
-	     compressed_data,
-	     compressed_data_size,
-	     *compressed_data_offset,
-	     error ) != 1 )
-	{
-		libcerror_error_set(
-		 error,
-		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
-		 "%s: unable to read Huffman tree.",
-		 function );
-
-		goto on_error;
-	}
-	if( libfwnt_bit_stream_initialize(
-	     &compressed_data_bit_stream,
-	     &( compressed_data[ *compressed_data_offset ] ),
-	     compressed_data_size,
-	     error ) != 1 )
-	{
-		libcerror_error_set(
-		 error,
-		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-		 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
-		 "%s: unable to create compressed data bit stream.",
-		 function );
-
-		goto on_error;
-	}
-/* TODO add a bit stream seek function ? */
-	compressed_data_bit_stream->byte_stream_offset = 256;
+	/* Data that fills the last chunk is followed by a chunk with only the end-of-block symbol
+	 */
+	number_of_chunks = ( uncompressed_data_size / LIBFWNT_LZXPRESS_HUFFMAN_CHUNK_SIZE ) + 1;
 
-	if( libfwnt_bit_stream_read(
-	     compressed_data_bit_stream,
-	     4,
-	     error ) != 4 )
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( ( number_of_threads > 1 )
+	 && ( number_of_chunks > 1 ) )
 	{
-		libcerror_error_set(
-		 error,
-		 LIBCERROR_ERROR_DOMAIN_IO,
-		 LIBCERROR_IO_ERROR_READ_FAILED,
-		 "%s: unable to read 32-bit from bit stream.",
-		 function );
+		number_of_contexts = number_of_threads;
 
-		goto on_error;
+		if( (size_t) number_of_contexts > number_of_chunks )
+		{
+			number_of_contexts = (int) number_of_chunks;
+		}
 	}
-	safe_uncompressed_data_offset = *uncompressed_data_offset;
-
-	next_chunk_uncompressed_data_offset = safe_uncompressed_data_offset + 65536;
-
-	if( next_chunk_uncompressed_data_offset > uncompressed_data_size )
+#endif
+	for( context_index = 0;
+	     context_index < number_of_contexts;
+	     context_index++ )
 	{
-		next_chunk_uncompressed_data_offset = uncompressed_data_size;
+		contexts[ context_index ] = NULL;
 	}
-        while( ( compressed_data_bit_stream->byte_stream_offset < compressed_data_bit_stream->byte_stream_size )
-            || ( compressed_data_bit_stream->number_of_bits > 0 ) )
+	for( context_index = 0;
+	     context_index < number_of_contexts;
+	     context_index++ )
 	{
-		if( safe_uncompressed_data_offset >= next_chunk_uncompressed_data_offset )
-		{
-			break;
-		}
-#if defined( HAVE_DEBUG_OUTPUT )
-		if( libcnotify_verbose != 0 )
-		{
-			libcnotify_printf(
-			 "%s: compressed data offset\t: %" PRIzd " (0x%08" PRIzx ")\n",
-			 function,
-			 compressed_data_bit_stream->byte_stream_offset,
-			 compressed_data_bit_stream->byte_stream_offset );
-		}
-#endif
-		if( libfwnt_lzxpress_huffman_tree_read_symbol(
-		     tree_nodes,
-		     compressed_data_bit_stream,
-		     &symbol,
+		if( libfwnt_lzxpress_huffman_compression_context_initialize(
+		     &( contexts[ context_index ] ),
+		     uncompressed_data,
+		     uncompressed_data_size,
+		     compression_level,
 		     error ) != 1 )
 		{
 			libcerror_error_set(
 			 error,
 			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
-			 "%s: unable to read symbol.",
-			 function );
+			 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
+			 "%s: unable to create compression context: %d.",
+			 function,
+			 context_index );
 
 			goto on_error;
 		}
-#if defined( HAVE_DEBUG_OUTPUT )
-		if( libcnotify_verbose != 0 )
+	}
+	if( number_of_contexts == 1 )
+	{
+		for( chunk_index = 0;
+		     chunk_index < number_of_chunks;
+		     chunk_index++ )
 		{
-			libcnotify_printf(
-			 "%s: number of bits\t\t: %" PRId8 "\n",
-			 function,
-			 compressed_data_bit_stream->number_of_bits );
+			chunk_offset = chunk_index * LIBFWNT_LZXPRESS_HUFFMAN_CHUNK_SIZE;
+
+			if( libfwnt_lzxpress_huffman_compress_chunk(
+			     contexts[ 0 ],
+			     chunk_offset,
+			     compressed_data,
+			     *compressed_data_size,
+			     &compressed_data_offset,
+			     error ) != 1 )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_COMPRESSION,
+				 LIBCERROR_COMPRESSION_ERROR_COMPRESS_FAILED,
+				 "%s: unable to compress chunk at offset: %" PRIzd ".",
+				 function,
+				 chunk_offset );
 
-			libcnotify_printf(
-			 "%s: huffman symbol\t\t: 0x%04" PRIx16 "\n",
-			 function,
-			 symbol );
-		}
-#endif
-		if( ( compressed_data_bit_stream->number_of_bits < 16 )
-		 && ( compressed_data_bit_stream->byte_stream_offset <= ( compressed_data_bit_stream->byte_stream_size - 2 ) ) )
-		{
-			byte_stream_copy_to_uint16_little_endian(
-			 &( compressed_data_bit_stream->byte_stream[ compressed_data_bit_stream->byte_stream_offset ] ),
-			 bits );
-
-/* TODO bits read infront of the bit stream ? */
-			compressed_data_bit_stream->bits               |= bits << ( 16 - compressed_data_bit_stream->number_of_bits );
-			compressed_data_bit_stream->byte_stream_offset += 2;
-			compressed_data_bit_stream->number_of_bits     += 16;
+				goto on_error;
+			}
 		}
-		if( symbol < 256 )
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	else
+	{
+		for( context_index = 0;
+		     context_index < number_of_contexts;
+		     context_index++ )
 		{
-			uncompressed_data[ safe_uncompressed_data_offset++ ] = (uint8_t) symbol;
+			contexts[ context_index ]->chunk_data = (uint8_t *) memory_allocate(
+			                                                     sizeof( uint8_t ) * LIBFWNT_LZXPRESS_HUFFMAN_MAXIMUM_COMPRESSED_CHUNK_SIZE );
+
+			if( contexts[ context_index ]->chunk_data == NULL )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_MEMORY,
+				 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+				 "%s: unable to create chunk data: %d.",
+				 function,
+				 context_index );
+
+				goto on_error;
+			}
 		}
-		/* Check if we have an end-of-block marker (remaining bits are 0)
+		/* Every thread compresses one chunk of a batch into its own chunk data,
+		 * after which the chunks are copied into the compressed data in order
 		 */
-		if( ( compressed_data_bit_stream->bits == 0 )
-		 && ( safe_uncompressed_data_offset >= uncompressed_data_size ) )
-		{
-			break;
-		}
-		if( symbol >= 256 )
+		for( chunk_index = 0;
+		     chunk_index < number_of_chunks;
+		     chunk_index += (size_t) number_of_batch_chunks )
 		{
-			symbol          -= 256;
-			compression_size = symbol & 0x000f;
-			symbol         >>= 4;
+			number_of_batch_chunks = number_of_contexts;
 
-			if( symbol == 0 )
+			if( (size_t) number_of_batch_chunks > ( number_of_chunks - chunk_index ) )
 			{
-				compression_offset = 0;
+				number_of_batch_chunks = (int) ( number_of_chunks - chunk_index );
 			}
-			else
+			result = 1;
+
+			for( thread_index = 0;
+			     thread_index < number_of_batch_chunks;
+			     thread_index++ )
 			{
-/* TODO add a read number of bits function ? */
-				compression_offset = (uint32_t) ( compressed_data_bit_stream->bits >> ( 32 - symbol ) );
-			}
-			compression_offset = (uint32_t) ( ( 1 << symbol ) | compression_offset );
+				threads[ thread_index ] = NULL;
 
-			compressed_data_bit_stream->bits          <<= symbol;
-			compressed_data_bit_stream->number_of_bits -= (uint8_t) symbol;
+				contexts[ thread_index ]->chunk_offset = ( chunk_index + thread_index ) * LIBFWNT_LZXPRESS_HUFFMAN_CHUNK_SIZE;
+				contexts[ thread_index ]->result       = -1;
 
-			/* Ignore any data beyond the uncompressed block size
-			 */
-			if( compression_size == 15 )
-			{
-				if( compressed_data_bit_stream->byte_stream_offset > ( compressed_data_bit_stream->byte_stream_size - 1 ) )
+				if( libcthreads_thread_create(
+				     &( threads[ thread_index ] ),
+				     NULL,
+				     (int (*)(void *)) &libfwnt_lzxpress_huffman_compress_chunk_thread_callback,
+				     (void *) contexts[ thread_index ],
+				     error ) != 1 )
 				{
 					libcerror_error_set(
 					 error,
 					 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-					 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
-					 "%s: compressed data size value too small.",
-					 function );
-
-					goto on_error;
-				}
-				compression_size = compressed_data_bit_stream->byte_stream[ compressed_data_bit_stream->byte_stream_offset ] + 15;
-
-				compressed_data_bit_stream->byte_stream_offset += 1;
-
-				if( compression_size == 270 )
-				{
-					if( compressed_data_bit_stream->byte_stream_offset > ( compressed_data_bit_stream->byte_stream_size - 2 ) )
-					{
-						libcerror_error_set(
-						 error,
-						 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-						 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
-						 "%s: compressed data size value too small.",
-						 function );
+					 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
+					 "%s: unable to create thread: %d.",
+					 function,
+					 thread_index );
 
-						goto on_error;
-					}
-					byte_stream_copy_to_uint16_little_endian(
-					 &( compressed_data_bit_stream->byte_stream[ compressed_data_bit_stream->byte_stream_offset ] ),
-					 compression_size );
+					result = -1;
 
-					compressed_data_bit_stream->byte_stream_offset += 2;
+					break;
 				}
 			}
-			compression_size += 3;
-
-#if defined( HAVE_DEBUG_OUTPUT )
-			if( libcnotify_verbose != 0 )
+			/* Join the threads that were created, also when the creation of a thread failed
+			 */
+			while( thread_index > 0 )
 			{
-				libcnotify_printf(
-				 "%s: compression offset\t\t: %" PRIi16 "\n",
-				 function,
-				 compression_offset );
+				thread_index--;
 
-				libcnotify_printf(
-				 "%s: compression size\t\t: %" PRIu16 "\n",
-				 function,
-				 compression_size );
+				if( libcthreads_thread_join(
+				     &( threads[ thread_index ] ),
+				     error ) != 1 )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+					 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+					 "%s: unable to join thread: %d.",
+					 function,
+					 thread_index );
 
-				libcnotify_printf(
-				 "%s: uncompressed data offset\t: %" PRIzd "\n",
-				 function,
-				 safe_uncompressed_data_offset );
+					result = -1;
+				}
 			}
-#endif
-			if( compression_offset > safe_uncompressed_data_offset )
+			if( result != 1 )
 			{
-				libcerror_error_set(
-				 error,
-				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-				 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
-				 "%s: compression offset value out of bounds.",
-				 function );
-
 				goto on_error;
 			}
-			if( compression_size > ( uncompressed_data_size - safe_uncompressed_data_offset ) )
+			for( thread_index = 0;
+			     thread_index < number_of_batch_chunks;
+			     thread_index++ )
 			{
-				libcerror_error_set(
-				 error,
-				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-				 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
-				 "%s: compression size value out of bounds.",
-				 function );
+				if( contexts[ thread_index ]->result != 1 )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_COMPRESSION,
+					 LIBCERROR_COMPRESSION_ERROR_COMPRESS_FAILED,
+					 "%s: unable to compress chunk: %" PRIzd ".",
+					 function,
+					 chunk_index + thread_index );
 
-				goto on_error;
-			}
-			compression_uncompressed_data_offset = safe_uncompressed_data_offset - compression_offset;
+					goto on_error;
+				}
+				if( contexts[ thread_index ]->chunk_data_size > ( *compressed_data_size - compressed_data_offset ) )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+					 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+					 "%s: compressed data size value too small.",
+					 function );
 
-			while( compression_size > 0 )
-			{
-				uncompressed_data[ safe_uncompressed_data_offset++ ] = uncompressed_data[ compression_uncompressed_data_offset++ ];
+					goto on_error;
+				}
+				if( memory_copy(
+				     &( compressed_data[ compressed_data_offset ] ),
+				     contexts[ thread_index ]->chunk_data,
+				     contexts[ thread_index ]->chunk_data_size ) == NULL )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_MEMORY,
+					 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+					 "%s: unable to copy chunk: %" PRIzd ".",
+					 function,
+					 chunk_index + thread_index );
 
-				compression_size--;
-			}
-			if( ( compressed_data_bit_stream->number_of_bits < 16 )
-			 && ( compressed_data_bit_stream->byte_stream_offset <= ( compressed_data_bit_stream->byte_stream_size - 2 ) ) )
-			{
-				byte_stream_copy_to_uint16_little_endian(
-				 &( compressed_data_bit_stream->byte_stream[ compressed_data_bit_stream->byte_stream_offset ] ),
-				 bits );
-
-/* TODO bits read infront of the bit stream ? */
-				compressed_data_bit_stream->bits               |= bits << ( 16 - compressed_data_bit_stream->number_of_bits );
-				compressed_data_bit_stream->byte_stream_offset += 2;
-				compressed_data_bit_stream->number_of_bits     += 16;
+					goto on_error;
+				}
+				compressed_data_offset += contexts[ thread_index ]->chunk_data_size;
 			}
 		}
-#if defined( HAVE_DEBUG_OUTPUT )
-		if( libcnotify_verbose != 0 )
-		{
-			libcnotify_printf(
-			 "\n" );
-		}
-#endif
 	}
-	*compressed_data_offset += compressed_data_bit_stream->byte_stream_offset;
-
-	if( libfwnt_bit_stream_free(
-	     &compressed_data_bit_stream,
-	     error ) != 1 )
-	{
-		libcerror_error_set(
-		 error,
-		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-		 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
-		 "%s: unable to free compressed data bit stream.",
-		 function );
+#endif /* defined( HAVE_MULTI_THREAD_SUPPORT ) */
 
-		goto on_error;
-	}
-	*uncompressed_data_offset = safe_uncompressed_data_offset;
+	*compressed_data_size = compressed_data_offset;
 
-	return( 1 );
+	result = 1;
 
 on_error:
-	if( compressed_data_bit_stream != NULL )
+	for( context_index = 0;
+	     context_index < number_of_contexts;
+	     context_index++ )
 	{
-		libfwnt_bit_stream_free(
-		 &compressed_data_bit_stream,
-		 NULL );
+		if( contexts[ context_index ] != NULL )
+		{
+			libfwnt_lzxpress_huffman_compression_context_free(
+			 &( contexts[ context_index ] ),
+			 NULL );
+		}
 	}
-	return( -1 );
+	if( result != 1 )
+	{
+		return( -1 );
+	}
+	return( 1 );
 }
 
 /* Decompresses data using LZXPRESS Huffman compression
+ * A decoder is created on the stack for the duration of the call, use a
+ * LZXPRESS Huffman decoder to reuse the decoding tables between calls
  * Return 1 on success or -1 on error
  */
 int libfwnt_lzxpress_huffman_decompress(
@@ -1182,48 +1976,29 @@ int libfwnt_lzxpress_huffman_decompress(
      size_t *uncompressed_data_size,
      libcerror_error_t **error )
 {
-	static char *function           = "libfwnt_lzxpress_huffman_decompress";
-	size_t compressed_data_offset   = 0;
-	size_t uncompressed_data_offset = 0;
+	libfwnt_internal_lzxpress_huffman_decoder_t internal_decoder;
 
-	if( uncompressed_data_size == NULL )
+	static char *function = "libfwnt_lzxpress_huffman_decompress";
+
+	internal_decoder.tables_are_set = 0;
+
+	if( libfwnt_internal_lzxpress_huffman_decoder_decompress(
+	     &internal_decoder,
+	     compressed_data,
+	     compressed_data_size,
+	     uncompressed_data,
+	     uncompressed_data_size,
+	     error ) != 1 )
 	{
 		libcerror_error_set(
 		 error,
-		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid uncompressed data size.",
+		 LIBCERROR_ERROR_DOMAIN_COMPRESSION,
+		 LIBCERROR_COMPRESSION_ERROR_DECOMPRESS_FAILED,
+		 "%s: unable to decompress data.",
 		 function );
 
 		return( -1 );
 	}
-	while( compressed_data_offset < compressed_data_size )
-	{
-		if( uncompressed_data_offset >= *uncompressed_data_size )
-		{
-			break;
-		}
-		if( libfwnt_lzxpress_huffman_decompress_chunk(
-		     compressed_data,
-		     compressed_data_size,
-		     &compressed_data_offset,
-		     uncompressed_data,
-		     *uncompressed_data_size,
-		     &uncompressed_data_offset,
-		     error ) != 1 )
-		{
-			libcerror_error_set(
-			 error,
-			 LIBCERROR_ERROR_DOMAIN_COMPRESSION,
-			 LIBCERROR_COMPRESSION_ERROR_DECOMPRESS_FAILED,
-			 "%s: unable to decompress chunk.",
-			 function );
-
-			return( -1 );
-		}
-	}
-	*uncompressed_data_size = uncompressed_data_offset;
-
 	return( 1 );
 }
 
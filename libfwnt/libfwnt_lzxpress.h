@@ -25,7 +25,6 @@
 #include <common.h>
 #include <types.h>
 
-#include "libfwnt_bit_stream.h"
 #include "libfwnt_extern.h"
 #include "libfwnt_libcerror.h"
 
@@ -33,41 +32,114 @@
 extern "C" {
 #endif
 
-typedef struct libfwnt_lzxpress_huffman_tree_node libfwnt_lzxpress_huffman_tree_node_t;
+typedef struct libfwnt_lzxpress_huffman_compression_level libfwnt_lzxpress_huffman_compression_level_t;
 
-struct libfwnt_lzxpress_huffman_tree_node 
+struct libfwnt_lzxpress_huffman_compression_level
 {
-	/* The symbol
+	/* The maximum number of hash chain entries examined per match search
 	 */
-	uint16_t symbol;
+	int maximum_search_depth;
 
-	/* Value to indicate the tree node is a leaf node
+	/* The match size at which a match search stops
 	 */
-	uint8_t is_leaf;
+	size_t nice_match_size;
 
-	/* The sub tree nodes
+	/* Value to indicate a match is only used if the next position has no longer match
 	 */
-	libfwnt_lzxpress_huffman_tree_node_t *sub_tree_nodes[ 2 ];
+	uint8_t use_lazy_matching;
+};
 
-#if defined( HAVE_DEBUG_OUTPUT )
+typedef struct libfwnt_lzxpress_huffman_compression_context libfwnt_lzxpress_huffman_compression_context_t;
 
-	/* The sub tree node indexes
+struct libfwnt_lzxpress_huffman_compression_context
+{
+	/* The uncompressed data
 	 */
-	uint16_t sub_tree_node_indexes[ 2 ];
-#endif
-};
+	const uint8_t *uncompressed_data;
 
-typedef struct libfwnt_lzxpress_huffman_code_symbol libfwnt_lzxpress_huffman_code_symbol_t;
+	/* The uncompressed data size
+	 */
+	size_t uncompressed_data_size;
 
-struct libfwnt_lzxpress_huffman_code_symbol
-{
-	/* The symbol
+	/* The maximum number of hash chain entries examined per match search
+	 */
+	int maximum_search_depth;
+
+	/* The match size at which a match search stops
+	 */
+	size_t nice_match_size;
+
+	/* Value to indicate a match is only used if the next position has no longer match
+	 */
+	uint8_t use_lazy_matching;
+
+	/* The offset of the first uncompressed byte that can be referenced
+	 */
+	size_t window_offset;
+
+	/* The hash table, contains the most recent window position per hash value or -1
+	 */
+	int32_t *hash_table;
+
+	/* The hash chain, contains the previous window position with the same hash value or -1
+	 */
+	int32_t *hash_chain;
+
+	/* The tokens, literals are stored as their byte value and matches as the match offset
+	 * in the upper 16-bits and the match size - 3 in the lower 16-bits
+	 */
+	uint32_t *tokens;
+
+	/* The compressed data the bit stream is written to
+	 */
+	uint8_t *compressed_data;
+
+	/* The compressed data size
+	 */
+	size_t compressed_data_size;
+
+	/* The compressed data offset
+	 */
+	size_t compressed_data_offset;
+
+	/* The offsets of the 16-bit words the decompressor has read but are not yet filled
+	 */
+	size_t word_offsets[ 2 ];
+
+	/* The number of words in word offsets
+	 */
+	int number_of_words;
+
+	/* The bits that have not yet been stored in a word
+	 */
+	uint32_t bits;
+
+	/* The number of bits that have not yet been stored in a word
+	 */
+	uint8_t number_of_bits;
+
+	/* The number of bits the decompressor has read but not yet consumed
+	 */
+	int number_of_available_bits;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+
+	/* The uncompressed offset of the chunk compressed by a thread
 	 */
-	uint16_t symbol;
+	size_t chunk_offset;
 
-	/* The code size 
+	/* The chunk compressed data of a thread
 	 */
-	uint16_t code_size;
+	uint8_t *chunk_data;
+
+	/* The chunk compressed data size of a thread
+	 */
+	size_t chunk_data_size;
+
+	/* The result of a thread
+	 */
+	int result;
+#endif
 };
 
 LIBFWNT_EXTERN \
@@ -86,36 +158,80 @@ int libfwnt_lzxpress_decompress(
      size_t *uncompressed_data_size,
      libcerror_error_t **error );
 
-int libfwnt_lzxpress_huffman_compare_symbols(
-     libfwnt_lzxpress_huffman_code_symbol_t *first_symbol,
-     libfwnt_lzxpress_huffman_code_symbol_t *second_symbol );
+int libfwnt_lzxpress_huffman_compression_context_initialize(
+     libfwnt_lzxpress_huffman_compression_context_t **context,
+     const uint8_t *uncompressed_data,
+     size_t uncompressed_data_size,
+     int compression_level,
+     libcerror_error_t **error );
+
+int libfwnt_lzxpress_huffman_compression_context_free(
+     libfwnt_lzxpress_huffman_compression_context_t **context,
+     libcerror_error_t **error );
 
-int libfwnt_lzxpress_huffman_tree_add_leaf(
-     libfwnt_lzxpress_huffman_tree_node_t *tree_nodes,
-     int tree_node_index,
-     uint32_t bits,
-     uint8_t number_of_bits );
+void libfwnt_lzxpress_huffman_compression_context_insert_position(
+      libfwnt_lzxpress_huffman_compression_context_t *context,
+      size_t uncompressed_data_offset );
 
-int libfwnt_lzxpress_huffman_tree_read(
-     libfwnt_lzxpress_huffman_tree_node_t *tree_nodes,
-     const uint8_t *compressed_data,
-     size_t compressed_data_size,
-     size_t compressed_data_offset,
+size_t libfwnt_lzxpress_huffman_compression_context_find_match(
+        libfwnt_lzxpress_huffman_compression_context_t *context,
+        size_t uncompressed_data_offset,
+        size_t uncompressed_data_end_offset,
+        size_t *match_offset );
+
+int libfwnt_lzxpress_huffman_compression_context_start_bit_stream(
+     libfwnt_lzxpress_huffman_compression_context_t *context,
      libcerror_error_t **error );
 
-int libfwnt_lzxpress_huffman_tree_read_symbol(
-     libfwnt_lzxpress_huffman_tree_node_t *tree_nodes,
-     libfwnt_bit_stream_t *compressed_data_bit_stream,
-     uint16_t *symbol,
+int libfwnt_lzxpress_huffman_compression_context_write_bits(
+     libfwnt_lzxpress_huffman_compression_context_t *context,
+     uint32_t value,
+     uint8_t number_of_bits,
      libcerror_error_t **error );
 
-int libfwnt_lzxpress_huffman_decompress_chunk(
-     const uint8_t *compressed_data,
+int libfwnt_lzxpress_huffman_compression_context_write_byte(
+     libfwnt_lzxpress_huffman_compression_context_t *context,
+     uint8_t value,
+     libcerror_error_t **error );
+
+void libfwnt_lzxpress_huffman_compression_context_flush_bit_stream(
+      libfwnt_lzxpress_huffman_compression_context_t *context );
+
+int libfwnt_lzxpress_huffman_compare_weights(
+     const uint32_t *first_weight,
+     const uint32_t *second_weight );
+
+int libfwnt_lzxpress_huffman_get_code_sizes(
+     const uint32_t *symbol_frequencies,
+     uint8_t *code_sizes,
+     libcerror_error_t **error );
+
+uint16_t libfwnt_lzxpress_huffman_get_token_symbol(
+          uint32_t token );
+
+int libfwnt_lzxpress_huffman_compress_chunk(
+     libfwnt_lzxpress_huffman_compression_context_t *context,
+     size_t chunk_offset,
+     uint8_t *compressed_data,
      size_t compressed_data_size,
      size_t *compressed_data_offset,
-     uint8_t *uncompressed_data,
+     libcerror_error_t **error );
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+
+int libfwnt_lzxpress_huffman_compress_chunk_thread_callback(
+     libfwnt_lzxpress_huffman_compression_context_t *context );
+
+#endif
+
+LIBFWNT_EXTERN \
+int libfwnt_lzxpress_huffman_compress(
+     const uint8_t *uncompressed_data,
      size_t uncompressed_data_size,
-     size_t *uncompressed_data_offset,
+     uint8_t *compressed_data,
+     size_t *compressed_data_size,
+     int compression_level,
+     int number_of_threads,
      libcerror_error_t **error );
 
 LIBFWNT_EXTERN \
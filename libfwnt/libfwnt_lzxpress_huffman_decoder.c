@@ -0,0 +1,933 @@
+/*
+ * LZXPRESS Huffman decoder functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <byte_stream.h>
+#include <memory.h>
+#include <types.h>
+
+#include "libfwnt_definitions.h"
+#include "libfwnt_libcerror.h"
+#include "libfwnt_libcnotify.h"
+#include "libfwnt_lz77.h"
+#include "libfwnt_lzxpress_huffman_decoder.h"
+#include "libfwnt_statistics.h"
+#include "libfwnt_types.h"
+
+/* Creates a LZXPRESS Huffman decoder
+ * Make sure the value decoder is referencing, is set to NULL
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_lzxpress_huffman_decoder_initialize(
+     libfwnt_lzxpress_huffman_decoder_t **decoder,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_lzxpress_huffman_decoder_t *internal_decoder = NULL;
+	static char *function                                         = "libfwnt_lzxpress_huffman_decoder_initialize";
+
+	if( decoder == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid decoder.",
+		 function );
+
+		return( -1 );
+	}
+	if( *decoder != NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid decoder value already set.",
+		 function );
+
+		return( -1 );
+	}
+	internal_decoder = memory_allocate_structure(
+	                    libfwnt_internal_lzxpress_huffman_decoder_t );
+
+	if( internal_decoder == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+		 "%s: unable to create decoder.",
+		 function );
+
+		return( -1 );
+	}
+	if( memory_set(
+	     internal_decoder,
+	     0,
+	     sizeof( libfwnt_internal_lzxpress_huffman_decoder_t ) ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+		 "%s: unable to clear decoder.",
+		 function );
+
+		memory_free(
+		 internal_decoder );
+
+		return( -1 );
+	}
+	*decoder = (libfwnt_lzxpress_huffman_decoder_t *) internal_decoder;
+
+	return( 1 );
+}
+
+/* Frees a LZXPRESS Huffman decoder
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_lzxpress_huffman_decoder_free(
+     libfwnt_lzxpress_huffman_decoder_t **decoder,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_lzxpress_huffman_decoder_t *internal_decoder = NULL;
+	static char *function                                         = "libfwnt_lzxpress_huffman_decoder_free";
+
+	if( decoder == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid decoder.",
+		 function );
+
+		return( -1 );
+	}
+	if( *decoder != NULL )
+	{
+		internal_decoder = (libfwnt_internal_lzxpress_huffman_decoder_t *) *decoder;
+		*decoder         = NULL;
+
+		memory_free(
+		 internal_decoder );
+	}
+	return( 1 );
+}
+
+/* Reads the code sizes table and builds the canonical Huffman decoding tables
+ * The code sizes table consists of 256 bytes that contain a 4-bit code size per symbol
+ * The tables are only rebuilt if the code sizes table differs from the previous one
+ * Returns 1 on success or -1 on error
+ */
+int libfwnt_internal_lzxpress_huffman_decoder_read_code_sizes(
+     libfwnt_internal_lzxpress_huffman_decoder_t *internal_decoder,
+     const uint8_t *code_sizes_table,
+     libcerror_error_t **error )
+{
+	uint16_t next_symbol_indexes[ 16 ];
+
+	static char *function      = "libfwnt_internal_lzxpress_huffman_decoder_read_code_sizes";
+	size_t byte_index          = 0;
+	uint32_t code              = 0;
+	uint32_t lookup_index      = 0;
+	uint32_t lookup_end_index  = 0;
+	int32_t number_of_codes    = 0;
+	uint16_t code_index        = 0;
+	uint16_t lookup_value      = 0;
+	uint16_t symbol            = 0;
+	uint16_t symbol_index      = 0;
+	uint8_t byte_value         = 0;
+	uint8_t code_size          = 0;
+
+	if( internal_decoder == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid decoder.",
+		 function );
+
+		return( -1 );
+	}
+	if( code_sizes_table == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid code sizes table.",
+		 function );
+
+		return( -1 );
+	}
+	/* Consecutive chunks are often compressed with the same code sizes
+	 */
+	if( ( internal_decoder->tables_are_set != 0 )
+	 && ( memory_compare(
+	       internal_decoder->code_sizes_table,
+	       code_sizes_table,
+	       256 ) == 0 ) )
+	{
+		return( 1 );
+	}
+	internal_decoder->tables_are_set = 0;
+
+	if( memory_set(
+	     internal_decoder->number_of_codes,
+	     0,
+	     sizeof( uint16_t ) * 16 ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+		 "%s: unable to clear number of codes.",
+		 function );
+
+		return( -1 );
+	}
+	for( byte_index = 0;
+	     byte_index < 256;
+	     byte_index++ )
+	{
+		byte_value = code_sizes_table[ byte_index ];
+
+		internal_decoder->number_of_codes[ byte_value & 0x0f ] += 1;
+		internal_decoder->number_of_codes[ byte_value >> 4 ]   += 1;
+	}
+	internal_decoder->number_of_codes[ 0 ] = 0;
+
+	/* Check that the code sizes do not describe more codes than fit in their number of bits
+	 */
+	number_of_codes = 1;
+
+	for( code_size = 1;
+	     code_size < 16;
+	     code_size++ )
+	{
+		number_of_codes <<= 1;
+		number_of_codes  -= (int32_t) internal_decoder->number_of_codes[ code_size ];
+
+		if( number_of_codes < 0 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: invalid code sizes table - too many codes of size: %" PRIu8 ".",
+			 function,
+			 code_size );
+
+			return( -1 );
+		}
+	}
+	/* Sort the symbols by code size and symbol value using a counting sort
+	 * and determine the first canonical code of every code size
+	 */
+	code         = 0;
+	symbol_index = 0;
+
+	internal_decoder->first_codes[ 0 ]          = 0;
+	internal_decoder->first_symbol_indexes[ 0 ] = 0;
+
+	for( code_size = 1;
+	     code_size < 16;
+	     code_size++ )
+	{
+		internal_decoder->first_codes[ code_size ]          = (uint16_t) code;
+		internal_decoder->first_symbol_indexes[ code_size ] = symbol_index;
+		next_symbol_indexes[ code_size ]                    = symbol_index;
+
+		code          = ( code + internal_decoder->number_of_codes[ code_size ] ) << 1;
+		symbol_index += internal_decoder->number_of_codes[ code_size ];
+	}
+	for( symbol = 0;
+	     symbol < 512;
+	     symbol++ )
+	{
+		byte_value = code_sizes_table[ symbol >> 1 ];
+
+		if( ( symbol & 1 ) == 0 )
+		{
+			code_size = byte_value & 0x0f;
+		}
+		else
+		{
+			code_size = byte_value >> 4;
+		}
+		if( code_size != 0 )
+		{
+			internal_decoder->sorted_symbols[ next_symbol_indexes[ code_size ]++ ] = symbol;
+		}
+	}
+	/* Fill the lookup table with every code that fits in the lookup bits, where
+	 * a code occupies all the entries that start with its bits
+	 */
+	if( memory_set(
+	     internal_decoder->lookup_table,
+	     0,
+	     sizeof( uint16_t ) * ( 1 << LIBFWNT_LZXPRESS_HUFFMAN_DECODER_LOOKUP_BITS ) ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+		 "%s: unable to clear lookup table.",
+		 function );
+
+		return( -1 );
+	}
+	for( code_size = 1;
+	     code_size <= LIBFWNT_LZXPRESS_HUFFMAN_DECODER_LOOKUP_BITS;
+	     code_size++ )
+	{
+		symbol_index = internal_decoder->first_symbol_indexes[ code_size ];
+		code         = internal_decoder->first_codes[ code_size ];
+
+		for( code_index = 0;
+		     code_index < internal_decoder->number_of_codes[ code_size ];
+		     code_index++ )
+		{
+			lookup_value = (uint16_t) ( ( internal_decoder->sorted_symbols[ symbol_index++ ] << 4 ) | code_size );
+
+			lookup_index     = code << ( LIBFWNT_LZXPRESS_HUFFMAN_DECODER_LOOKUP_BITS - code_size );
+			lookup_end_index = lookup_index + ( 1 << ( LIBFWNT_LZXPRESS_HUFFMAN_DECODER_LOOKUP_BITS - code_size ) );
+
+			while( lookup_index < lookup_end_index )
+			{
+				internal_decoder->lookup_table[ lookup_index++ ] = lookup_value;
+			}
+			code++;
+		}
+	}
+	if( memory_copy(
+	     internal_decoder->code_sizes_table,
+	     code_sizes_table,
+	     256 ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+		 "%s: unable to copy code sizes table.",
+		 function );
+
+		return( -1 );
+	}
+	internal_decoder->tables_are_set = 1;
+
+#if defined( HAVE_DEBUG_OUTPUT )
+	if( libcnotify_verbose != 0 )
+	{
+		for( code_size = 1;
+		     code_size < 16;
+		     code_size++ )
+		{
+			libcnotify_printf(
+			 "%s: code size: %02" PRIu8 " number of codes\t: %" PRIu16 "\n",
+			 function,
+			 code_size,
+			 internal_decoder->number_of_codes[ code_size ] );
+		}
+		libcnotify_printf(
+		 "\n" );
+	}
+#endif
+	return( 1 );
+}
+
+/* Reads a Huffman symbol from the bit stream of the decoder
+ * Returns 1 on success or -1 on error
+ */
+int libfwnt_internal_lzxpress_huffman_decoder_read_symbol(
+     libfwnt_internal_lzxpress_huffman_decoder_t *internal_decoder,
+     uint16_t *symbol,
+     libcerror_error_t **error )
+{
+	libfwnt_bit_stream_t *bit_stream = NULL;
+	static char *function            = "libfwnt_internal_lzxpress_huffman_decoder_read_symbol";
+	uint32_t code                    = 0;
+	uint16_t bits                    = 0;
+	uint16_t lookup_value            = 0;
+	uint8_t code_size                = 0;
+
+	if( internal_decoder == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid decoder.",
+		 function );
+
+		return( -1 );
+	}
+	if( symbol == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid symbol.",
+		 function );
+
+		return( -1 );
+	}
+	bit_stream = &( internal_decoder->bit_stream );
+
+	lookup_value = internal_decoder->lookup_table[ bit_stream->bits >> ( 32 - LIBFWNT_LZXPRESS_HUFFMAN_DECODER_LOOKUP_BITS ) ];
+
+	if( lookup_value != 0 )
+	{
+		code_size = (uint8_t) ( lookup_value & 0x000f );
+		*symbol   = lookup_value >> 4;
+	}
+	else
+	{
+		/* Codes larger than the lookup bits are decoded using the canonical code ranges
+		 */
+		for( code_size = LIBFWNT_LZXPRESS_HUFFMAN_DECODER_LOOKUP_BITS + 1;
+		     code_size < 16;
+		     code_size++ )
+		{
+			code = ( bit_stream->bits >> ( 32 - code_size ) ) - internal_decoder->first_codes[ code_size ];
+
+			if( code < internal_decoder->number_of_codes[ code_size ] )
+			{
+				break;
+			}
+		}
+		if( code_size >= 16 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: invalid Huffman code.",
+			 function );
+
+			return( -1 );
+		}
+		*symbol = internal_decoder->sorted_symbols[ internal_decoder->first_symbol_indexes[ code_size ] + code ];
+	}
+	bit_stream->bits <<= code_size;
+
+	/* At the end of the compressed data the remaining bits are 0
+	 */
+	if( code_size < bit_stream->number_of_bits )
+	{
+		bit_stream->number_of_bits -= code_size;
+	}
+	else
+	{
+		bit_stream->number_of_bits = 0;
+	}
+	if( ( bit_stream->number_of_bits < 16 )
+	 && ( ( bit_stream->byte_stream_offset + 2 ) <= bit_stream->byte_stream_size ) )
+	{
+		byte_stream_copy_to_uint16_little_endian(
+		 &( bit_stream->byte_stream[ bit_stream->byte_stream_offset ] ),
+		 bits );
+
+		bit_stream->bits               |= (uint32_t) bits << ( 16 - bit_stream->number_of_bits );
+		bit_stream->byte_stream_offset += 2;
+		bit_stream->number_of_bits     += 16;
+	}
+	return( 1 );
+}
+
+/* Decompresses a LZXPRESS Huffman compressed chunk
+ * Return 1 on success or -1 on error
+ */
+int libfwnt_internal_lzxpress_huffman_decoder_decompress_chunk(
+     libfwnt_internal_lzxpress_huffman_decoder_t *internal_decoder,
+     const uint8_t *compressed_data,
+     size_t compressed_data_size,
+     size_t *compressed_data_offset,
+     uint8_t *uncompressed_data,
+     size_t uncompressed_data_size,
+     size_t *uncompressed_data_offset,
+     libcerror_error_t **error )
+{
+	libfwnt_bit_stream_t *bit_stream           = NULL;
+	static char *function                      = "libfwnt_internal_lzxpress_huffman_decoder_decompress_chunk";
+	size_t next_chunk_uncompressed_data_offset = 0;
+	size_t safe_uncompressed_data_offset       = 0;
+	uint32_t compression_offset                = 0;
+	uint32_t compression_size                  = 0;
+	uint16_t bits                              = 0;
+	uint16_t symbol                            = 0;
+	uint8_t number_of_offset_bits              = 0;
+
+	if( internal_decoder == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid decoder.",
+		 function );
+
+		return( -1 );
+	}
+	if( compressed_data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed data.",
+		 function );
+
+		return( -1 );
+	}
+	if( compressed_data_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid compressed data size value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( compressed_data_offset == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed data offset.",
+		 function );
+
+		return( -1 );
+	}
+	if( ( *compressed_data_offset >= compressed_data_size )
+	 || ( ( compressed_data_size - *compressed_data_offset ) < 260 ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: compressed data offset value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+	if( uncompressed_data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid uncompressed data.",
+		 function );
+
+		return( -1 );
+	}
+	if( uncompressed_data_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid uncompressed data size value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( uncompressed_data_offset == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid uncompressed data offset.",
+		 function );
+
+		return( -1 );
+	}
+	if( *uncompressed_data_offset > uncompressed_data_size )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: uncompressed data offset value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+	if( libfwnt_internal_lzxpress_huffman_decoder_read_code_sizes(
+	     internal_decoder,
+	     &( compressed_data[ *compressed_data_offset ] ),
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to read code sizes table.",
+		 function );
+
+		return( -1 );
+	}
+	/* The bit stream of the chunk starts after the code sizes table with 2 16-bit values
+	 */
+	bit_stream = &( internal_decoder->bit_stream );
+
+	bit_stream->byte_stream        = &( compressed_data[ *compressed_data_offset ] );
+	bit_stream->byte_stream_size   = compressed_data_size - *compressed_data_offset;
+	bit_stream->byte_stream_offset = 256;
+
+	byte_stream_copy_to_uint16_little_endian(
+	 &( bit_stream->byte_stream[ 256 ] ),
+	 bits );
+
+	bit_stream->bits = (uint32_t) bits << 16;
+
+	byte_stream_copy_to_uint16_little_endian(
+	 &( bit_stream->byte_stream[ 258 ] ),
+	 bits );
+
+	bit_stream->bits              |= bits;
+	bit_stream->byte_stream_offset = 260;
+	bit_stream->number_of_bits     = 32;
+
+	safe_uncompressed_data_offset = *uncompressed_data_offset;
+
+	next_chunk_uncompressed_data_offset = safe_uncompressed_data_offset + 65536;
+
+	if( next_chunk_uncompressed_data_offset > uncompressed_data_size )
+	{
+		next_chunk_uncompressed_data_offset = uncompressed_data_size;
+	}
+	while( ( bit_stream->byte_stream_offset < bit_stream->byte_stream_size )
+	    || ( bit_stream->number_of_bits > 0 ) )
+	{
+		if( safe_uncompressed_data_offset >= next_chunk_uncompressed_data_offset )
+		{
+			break;
+		}
+		if( libfwnt_internal_lzxpress_huffman_decoder_read_symbol(
+		     internal_decoder,
+		     &symbol,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to read symbol.",
+			 function );
+
+			return( -1 );
+		}
+#if defined( HAVE_DEBUG_OUTPUT )
+		if( libcnotify_verbose != 0 )
+		{
+			libcnotify_printf(
+			 "%s: compressed data offset\t: %" PRIzd " (0x%08" PRIzx ")\n",
+			 function,
+			 bit_stream->byte_stream_offset,
+			 bit_stream->byte_stream_offset );
+
+			libcnotify_printf(
+			 "%s: number of bits\t\t: %" PRId8 "\n",
+			 function,
+			 bit_stream->number_of_bits );
+
+			libcnotify_printf(
+			 "%s: huffman symbol\t\t: 0x%04" PRIx16 "\n",
+			 function,
+			 symbol );
+		}
+#endif
+		if( symbol < 256 )
+		{
+			uncompressed_data[ safe_uncompressed_data_offset++ ] = (uint8_t) symbol;
+
+			/* Check if we have an end-of-block marker (remaining bits are 0)
+			 */
+			if( ( bit_stream->bits == 0 )
+			 && ( safe_uncompressed_data_offset >= uncompressed_data_size ) )
+			{
+				break;
+			}
+			continue;
+		}
+		if( ( bit_stream->bits == 0 )
+		 && ( safe_uncompressed_data_offset >= uncompressed_data_size ) )
+		{
+			break;
+		}
+		symbol                -= 256;
+		compression_size       = symbol & 0x000f;
+		number_of_offset_bits  = (uint8_t) ( symbol >> 4 );
+		compression_offset     = 0;
+
+		if( number_of_offset_bits > 0 )
+		{
+			compression_offset = bit_stream->bits >> ( 32 - number_of_offset_bits );
+
+			bit_stream->bits <<= number_of_offset_bits;
+
+			if( number_of_offset_bits < bit_stream->number_of_bits )
+			{
+				bit_stream->number_of_bits -= number_of_offset_bits;
+			}
+			else
+			{
+				bit_stream->number_of_bits = 0;
+			}
+		}
+		compression_offset |= (uint32_t) 1 << number_of_offset_bits;
+
+		/* Ignore any data beyond the uncompressed block size
+		 */
+		if( compression_size == 15 )
+		{
+			if( bit_stream->byte_stream_offset >= bit_stream->byte_stream_size )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+				 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+				 "%s: compressed data size value too small.",
+				 function );
+
+				return( -1 );
+			}
+			compression_size = bit_stream->byte_stream[ bit_stream->byte_stream_offset ] + 15;
+
+			bit_stream->byte_stream_offset += 1;
+
+			if( compression_size == 270 )
+			{
+				if( ( bit_stream->byte_stream_offset + 2 ) > bit_stream->byte_stream_size )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+					 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+					 "%s: compressed data size value too small.",
+					 function );
+
+					return( -1 );
+				}
+				byte_stream_copy_to_uint16_little_endian(
+				 &( bit_stream->byte_stream[ bit_stream->byte_stream_offset ] ),
+				 compression_size );
+
+				bit_stream->byte_stream_offset += 2;
+			}
+		}
+		compression_size += 3;
+
+#if defined( HAVE_DEBUG_OUTPUT )
+		if( libcnotify_verbose != 0 )
+		{
+			libcnotify_printf(
+			 "%s: compression offset\t\t: %" PRIu32 "\n",
+			 function,
+			 compression_offset );
+
+			libcnotify_printf(
+			 "%s: compression size\t\t: %" PRIu32 "\n",
+			 function,
+			 compression_size );
+
+			libcnotify_printf(
+			 "%s: uncompressed data offset\t: %" PRIzd "\n",
+			 function,
+			 safe_uncompressed_data_offset );
+		}
+#endif
+		if( compression_offset > safe_uncompressed_data_offset )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: compression offset value out of bounds.",
+			 function );
+
+			return( -1 );
+		}
+		if( compression_size > ( uncompressed_data_size - safe_uncompressed_data_offset ) )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: compression size value out of bounds.",
+			 function );
+
+			return( -1 );
+		}
+		libfwnt_lz77_copy_match(
+		 uncompressed_data,
+		 safe_uncompressed_data_offset,
+		 (size_t) compression_offset,
+		 (size_t) compression_size );
+
+		safe_uncompressed_data_offset += compression_size;
+
+		if( ( bit_stream->number_of_bits < 16 )
+		 && ( ( bit_stream->byte_stream_offset + 2 ) <= bit_stream->byte_stream_size ) )
+		{
+			byte_stream_copy_to_uint16_little_endian(
+			 &( bit_stream->byte_stream[ bit_stream->byte_stream_offset ] ),
+			 bits );
+
+			bit_stream->bits               |= (uint32_t) bits << ( 16 - bit_stream->number_of_bits );
+			bit_stream->byte_stream_offset += 2;
+			bit_stream->number_of_bits     += 16;
+		}
+	}
+	*compressed_data_offset  += bit_stream->byte_stream_offset;
+	*uncompressed_data_offset = safe_uncompressed_data_offset;
+
+	return( 1 );
+}
+
+/* Decompresses LZXPRESS Huffman compressed data using the decoder
+ * Return 1 on success or -1 on error
+ */
+int libfwnt_internal_lzxpress_huffman_decoder_decompress(
+     libfwnt_internal_lzxpress_huffman_decoder_t *internal_decoder,
+     const uint8_t *compressed_data,
+     size_t compressed_data_size,
+     uint8_t *uncompressed_data,
+     size_t *uncompressed_data_size,
+     libcerror_error_t **error )
+{
+	static char *function           = "libfwnt_internal_lzxpress_huffman_decoder_decompress";
+	size_t compressed_data_offset   = 0;
+	size_t uncompressed_data_offset = 0;
+	uint64_t statistics_start_time  = 0;
+	int statistics_enabled          = 0;
+
+	if( uncompressed_data_size == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid uncompressed data size.",
+		 function );
+
+		return( -1 );
+	}
+	statistics_enabled = libfwnt_statistics_enabled;
+
+	if( statistics_enabled != 0 )
+	{
+		statistics_start_time = libfwnt_statistics_get_time();
+	}
+	while( compressed_data_offset < compressed_data_size )
+	{
+		if( uncompressed_data_offset >= *uncompressed_data_size )
+		{
+			break;
+		}
+		if( libfwnt_internal_lzxpress_huffman_decoder_decompress_chunk(
+		     internal_decoder,
+		     compressed_data,
+		     compressed_data_size,
+		     &compressed_data_offset,
+		     uncompressed_data,
+		     *uncompressed_data_size,
+		     &uncompressed_data_offset,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_COMPRESSION,
+			 LIBCERROR_COMPRESSION_ERROR_DECOMPRESS_FAILED,
+			 "%s: unable to decompress chunk.",
+			 function );
+
+			return( -1 );
+		}
+	}
+	*uncompressed_data_size = uncompressed_data_offset;
+
+	if( statistics_enabled != 0 )
+	{
+		libfwnt_statistics_update(
+		 LIBFWNT_STATISTICS_FUNCTION_LZXPRESS_HUFFMAN_DECOMPRESS,
+		 statistics_start_time,
+		 compressed_data_offset,
+		 uncompressed_data_offset );
+	}
+	return( 1 );
+}
+
+/* Decompresses LZXPRESS Huffman compressed data
+ * The decoding tables of the decoder are reused by successive calls, a decoder
+ * must not be used by multiple threads at the same time
+ * Return 1 on success or -1 on error
+ */
+int libfwnt_lzxpress_huffman_decoder_decompress(
+     libfwnt_lzxpress_huffman_decoder_t *decoder,
+     const uint8_t *compressed_data,
+     size_t compressed_data_size,
+     uint8_t *uncompressed_data,
+     size_t *uncompressed_data_size,
+     libcerror_error_t **error )
+{
+	static char *function = "libfwnt_lzxpress_huffman_decoder_decompress";
+
+	if( decoder == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid decoder.",
+		 function );
+
+		return( -1 );
+	}
+	if( libfwnt_internal_lzxpress_huffman_decoder_decompress(
+	     (libfwnt_internal_lzxpress_huffman_decoder_t *) decoder,
+	     compressed_data,
+	     compressed_data_size,
+	     uncompressed_data,
+	     uncompressed_data_size,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_COMPRESSION,
+		 LIBCERROR_COMPRESSION_ERROR_DECOMPRESS_FAILED,
+		 "%s: unable to decompress data.",
+		 function );
+
+		return( -1 );
+	}
+	return( 1 );
+}
+
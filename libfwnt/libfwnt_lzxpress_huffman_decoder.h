@@ -0,0 +1,132 @@
+/*
+ * LZXPRESS Huffman decoder functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _LIBFWNT_INTERNAL_LZXPRESS_HUFFMAN_DECODER_H )
+#define _LIBFWNT_INTERNAL_LZXPRESS_HUFFMAN_DECODER_H
+
+#include <common.h>
+#include <types.h>
+
+#include "libfwnt_bit_stream.h"
+#include "libfwnt_extern.h"
+#include "libfwnt_libcerror.h"
+#include "libfwnt_types.h"
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+/* The number of bits of a code that are decoded with a single lookup
+ */
+#define LIBFWNT_LZXPRESS_HUFFMAN_DECODER_LOOKUP_BITS	10
+
+typedef struct libfwnt_internal_lzxpress_huffman_decoder libfwnt_internal_lzxpress_huffman_decoder_t;
+
+struct libfwnt_internal_lzxpress_huffman_decoder
+{
+	/* The code sizes table the decoding tables were built from
+	 */
+	uint8_t code_sizes_table[ 256 ];
+
+	/* Value to indicate the decoding tables were built
+	 */
+	uint8_t tables_are_set;
+
+	/* The lookup table of codes of up to lookup bits in size, where an entry
+	 * contains the symbol in the upper 12 bits and the code size in the lower 4 bits
+	 * or 0 if the code is larger than lookup bits
+	 */
+	uint16_t lookup_table[ 1 << LIBFWNT_LZXPRESS_HUFFMAN_DECODER_LOOKUP_BITS ];
+
+	/* The number of codes per code size
+	 */
+	uint16_t number_of_codes[ 16 ];
+
+	/* The first (canonical) code per code size
+	 */
+	uint16_t first_codes[ 16 ];
+
+	/* The index of the first symbol per code size in the sorted symbols
+	 */
+	uint16_t first_symbol_indexes[ 16 ];
+
+	/* The symbols sorted by code size and symbol value
+	 */
+	uint16_t sorted_symbols[ 512 ];
+
+	/* The compressed data bit stream
+	 */
+	libfwnt_bit_stream_t bit_stream;
+};
+
+LIBFWNT_EXTERN \
+int libfwnt_lzxpress_huffman_decoder_initialize(
+     libfwnt_lzxpress_huffman_decoder_t **decoder,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_lzxpress_huffman_decoder_free(
+     libfwnt_lzxpress_huffman_decoder_t **decoder,
+     libcerror_error_t **error );
+
+int libfwnt_internal_lzxpress_huffman_decoder_read_code_sizes(
+     libfwnt_internal_lzxpress_huffman_decoder_t *internal_decoder,
+     const uint8_t *code_sizes_table,
+     libcerror_error_t **error );
+
+int libfwnt_internal_lzxpress_huffman_decoder_read_symbol(
+     libfwnt_internal_lzxpress_huffman_decoder_t *internal_decoder,
+     uint16_t *symbol,
+     libcerror_error_t **error );
+
+int libfwnt_internal_lzxpress_huffman_decoder_decompress_chunk(
+     libfwnt_internal_lzxpress_huffman_decoder_t *internal_decoder,
+     const uint8_t *compressed_data,
+     size_t compressed_data_size,
+     size_t *compressed_data_offset,
+     uint8_t *uncompressed_data,
+     size_t uncompressed_data_size,
+     size_t *uncompressed_data_offset,
+     libcerror_error_t **error );
+
+int libfwnt_internal_lzxpress_huffman_decoder_decompress(
+     libfwnt_internal_lzxpress_huffman_decoder_t *internal_decoder,
+     const uint8_t *compressed_data,
+     size_t compressed_data_size,
+     uint8_t *uncompressed_data,
+     size_t *uncompressed_data_size,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_lzxpress_huffman_decoder_decompress(
+     libfwnt_lzxpress_huffman_decoder_t *decoder,
+     const uint8_t *compressed_data,
+     size_t compressed_data_size,
+     uint8_t *uncompressed_data,
+     size_t *uncompressed_data_size,
+     libcerror_error_t **error );
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _LIBFWNT_INTERNAL_LZXPRESS_HUFFMAN_DECODER_H ) */
+
@@ -0,0 +1,383 @@
+/*
+ * Scan functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+
+#include <common.h>
+#include <byte_stream.h>
+#include <types.h>
+
+#include "libfwnt_definitions.h"
+#include "libfwnt_libcerror.h"
+#include "libfwnt_scan.h"
+#include "libfwnt_validate.h"
+
+/* The scan functions search data, such as a raw disk or memory image, for structures
+ * that validate. Every candidate offset is first checked by a cheap prefilter on the
+ * header values and only the candidates that pass it are fully validated.
+ */
+
+/* The identifier authorities that are considered plausible by the scanner as a bit mask
+ * which consist of the null (0), world (1), local (2), creator (3), non-unique (4),
+ * NT (5), resource manager (9), application package (15), mandatory label (16),
+ * scoped policy (17), authentication (18) and process trust (19) authorities
+ */
+#define LIBFWNT_SCAN_PLAUSIBLE_AUTHORITIES	0x000f823fUL
+
+/* Determines if the header of a self-relative security descriptor is plausible
+ * The revision must be 1, the padding byte 0 and the self-relative control flag set,
+ * at least one of the component offsets must be set and the offsets that are set
+ * must be 4-byte aligned and within the data. An ACL offset is only plausible when
+ * the corresponding present control flag is set
+ * Returns 1 if plausible or 0 if not
+ */
+int libfwnt_scan_security_descriptor_header_is_plausible(
+     const uint8_t *data,
+     size_t data_size )
+{
+	uint32_t value_32bit   = 0;
+	uint16_t control_flags = 0;
+	int component_index    = 0;
+	int number_of_offsets  = 0;
+
+	if( ( data_size < 20 )
+	 || ( data[ 0 ] != 1 )
+	 || ( data[ 1 ] != 0 )
+	 || ( ( data[ 3 ] & 0x80 ) == 0 ) )
+	{
+		return( 0 );
+	}
+	byte_stream_copy_to_uint16_little_endian(
+	 &( data[ 2 ] ),
+	 control_flags );
+
+	for( component_index = 0;
+	     component_index < 4;
+	     component_index++ )
+	{
+		byte_stream_copy_to_uint32_little_endian(
+		 &( data[ 4 + ( 4 * component_index ) ] ),
+		 value_32bit );
+
+		if( value_32bit == 0 )
+		{
+			continue;
+		}
+		if( ( value_32bit < 20 )
+		 || ( (size_t) value_32bit >= data_size )
+		 || ( ( value_32bit % 4 ) != 0 ) )
+		{
+			return( 0 );
+		}
+		if( ( component_index == 2 )
+		 && ( ( control_flags & LIBFWNT_CONTROL_FLAG_SACL_PRESENT ) == 0 ) )
+		{
+			return( 0 );
+		}
+		if( ( component_index == 3 )
+		 && ( ( control_flags & LIBFWNT_CONTROL_FLAG_DACL_PRESENT ) == 0 ) )
+		{
+			return( 0 );
+		}
+		number_of_offsets++;
+	}
+	if( number_of_offsets == 0 )
+	{
+		return( 0 );
+	}
+	return( 1 );
+}
+
+/* Determines if the header of a security identifier (SID) is plausible
+ * The revision must be 1, the number of sub authorities between 1 and 15
+ * and the identifier authority a well-known one
+ * Returns 1 if plausible or 0 if not
+ */
+int libfwnt_scan_security_identifier_header_is_plausible(
+     const uint8_t *data,
+     size_t data_size )
+{
+	if( ( data_size < 12 )
+	 || ( data[ 0 ] != 1 )
+	 || ( data[ 1 ] == 0 )
+	 || ( data[ 1 ] > 15 ) )
+	{
+		return( 0 );
+	}
+	/* The identifier authority is stored as a 48-bit big-endian value
+	 */
+	if( ( data[ 2 ] != 0 )
+	 || ( data[ 3 ] != 0 )
+	 || ( data[ 4 ] != 0 )
+	 || ( data[ 5 ] != 0 )
+	 || ( data[ 6 ] != 0 )
+	 || ( data[ 7 ] >= 32 ) )
+	{
+		return( 0 );
+	}
+	if( ( LIBFWNT_SCAN_PLAUSIBLE_AUTHORITIES & ( 1UL << data[ 7 ] ) ) == 0 )
+	{
+		return( 0 );
+	}
+	return( 1 );
+}
+
+/* Checks the arguments of the find functions
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_scan_check_arguments(
+     const uint8_t *data,
+     size_t data_size,
+     size_t start_offset,
+     size_t end_offset,
+     size_t alignment,
+     size_t *match_offset,
+     size_t *match_size,
+     const char *function,
+     libcerror_error_t **error )
+{
+	if( data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid data.",
+		 function );
+
+		return( -1 );
+	}
+	if( data_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid data size value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( start_offset > end_offset )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid start offset value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+	if( end_offset > data_size )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid end offset value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+	if( alignment == 0 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_ZERO_OR_LESS,
+		 "%s: invalid alignment value zero or less.",
+		 function );
+
+		return( -1 );
+	}
+	if( match_offset == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid match offset.",
+		 function );
+
+		return( -1 );
+	}
+	if( match_size == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid match size.",
+		 function );
+
+		return( -1 );
+	}
+	return( 1 );
+}
+
+/* Finds the first self-relative security descriptor in data
+ * Candidate offsets are multiples of alignment from the start of the data in the range
+ * start_offset up to end_offset, although the security descriptor itself can extend
+ * beyond end_offset up to data_size, so that adjacent ranges of the same data can be
+ * scanned independently. The security descriptor is limited to the maximum size of
+ * its components
+ * Returns 1 if found, 0 if not or -1 on error
+ */
+int libfwnt_scan_find_security_descriptor(
+     const uint8_t *data,
+     size_t data_size,
+     size_t start_offset,
+     size_t end_offset,
+     size_t alignment,
+     size_t *match_offset,
+     size_t *match_size,
+     libcerror_error_t **error )
+{
+	static char *function           = "libfwnt_scan_find_security_descriptor";
+	size_t scan_offset              = 0;
+	size_t security_descriptor_size = 0;
+	size_t validation_error_offset  = 0;
+	size_t window_size              = 0;
+	int validation_error            = 0;
+
+	if( libfwnt_scan_check_arguments(
+	     data,
+	     data_size,
+	     start_offset,
+	     end_offset,
+	     alignment,
+	     match_offset,
+	     match_size,
+	     function,
+	     error ) != 1 )
+	{
+		return( -1 );
+	}
+	scan_offset = start_offset;
+
+	if( ( scan_offset % alignment ) != 0 )
+	{
+		scan_offset += alignment - ( scan_offset % alignment );
+	}
+	while( scan_offset < end_offset )
+	{
+		if( data[ scan_offset ] == 1 )
+		{
+			window_size = data_size - scan_offset;
+
+			if( window_size > LIBFWNT_SCAN_MAXIMUM_SECURITY_DESCRIPTOR_SIZE )
+			{
+				window_size = LIBFWNT_SCAN_MAXIMUM_SECURITY_DESCRIPTOR_SIZE;
+			}
+			if( ( libfwnt_scan_security_descriptor_header_is_plausible(
+			       &( data[ scan_offset ] ),
+			       window_size ) != 0 )
+			 && ( libfwnt_validate_security_descriptor_data(
+			       &( data[ scan_offset ] ),
+			       window_size,
+			       &security_descriptor_size,
+			       &validation_error,
+			       &validation_error_offset ) == 1 ) )
+			{
+				*match_offset = scan_offset;
+				*match_size   = security_descriptor_size;
+
+				return( 1 );
+			}
+		}
+		if( alignment > ( end_offset - scan_offset ) )
+		{
+			break;
+		}
+		scan_offset += alignment;
+	}
+	return( 0 );
+}
+
+/* Finds the first security identifier (SID) in data
+ * Candidate offsets are multiples of alignment from the start of the data in the range
+ * start_offset up to end_offset, although the SID itself can extend beyond end_offset
+ * up to data_size
+ * Returns 1 if found, 0 if not or -1 on error
+ */
+int libfwnt_scan_find_security_identifier(
+     const uint8_t *data,
+     size_t data_size,
+     size_t start_offset,
+     size_t end_offset,
+     size_t alignment,
+     size_t *match_offset,
+     size_t *match_size,
+     libcerror_error_t **error )
+{
+	static char *function           = "libfwnt_scan_find_security_identifier";
+	size_t scan_offset              = 0;
+	size_t security_identifier_size = 0;
+	size_t validation_error_offset  = 0;
+	int validation_error            = 0;
+
+	if( libfwnt_scan_check_arguments(
+	     data,
+	     data_size,
+	     start_offset,
+	     end_offset,
+	     alignment,
+	     match_offset,
+	     match_size,
+	     function,
+	     error ) != 1 )
+	{
+		return( -1 );
+	}
+	scan_offset = start_offset;
+
+	if( ( scan_offset % alignment ) != 0 )
+	{
+		scan_offset += alignment - ( scan_offset % alignment );
+	}
+	while( scan_offset < end_offset )
+	{
+		if( ( data[ scan_offset ] == 1 )
+		 && ( libfwnt_scan_security_identifier_header_is_plausible(
+		       &( data[ scan_offset ] ),
+		       data_size - scan_offset ) != 0 )
+		 && ( libfwnt_validate_security_identifier_data(
+		       data,
+		       data_size,
+		       scan_offset,
+		       &security_identifier_size,
+		       &validation_error,
+		       &validation_error_offset ) == 1 ) )
+		{
+			*match_offset = scan_offset;
+			*match_size   = security_identifier_size;
+
+			return( 1 );
+		}
+		if( alignment > ( end_offset - scan_offset ) )
+		{
+			break;
+		}
+		scan_offset += alignment;
+	}
+	return( 0 );
+}
+
@@ -0,0 +1,86 @@
+/*
+ * Scan functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _LIBFWNT_SCAN_H )
+#define _LIBFWNT_SCAN_H
+
+#include <common.h>
+#include <types.h>
+
+#include "libfwnt_extern.h"
+#include "libfwnt_libcerror.h"
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+/* The maximum size of a security descriptor that is considered by the scanner
+ * which fits two ACLs of the maximum size of 65532 bytes and two SIDs of 68 bytes
+ */
+#define LIBFWNT_SCAN_MAXIMUM_SECURITY_DESCRIPTOR_SIZE	( 20 + ( 2 * 65532 ) + ( 2 * 68 ) )
+
+int libfwnt_scan_security_descriptor_header_is_plausible(
+     const uint8_t *data,
+     size_t data_size );
+
+int libfwnt_scan_security_identifier_header_is_plausible(
+     const uint8_t *data,
+     size_t data_size );
+
+int libfwnt_scan_check_arguments(
+     const uint8_t *data,
+     size_t data_size,
+     size_t start_offset,
+     size_t end_offset,
+     size_t alignment,
+     size_t *match_offset,
+     size_t *match_size,
+     const char *function,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_scan_find_security_descriptor(
+     const uint8_t *data,
+     size_t data_size,
+     size_t start_offset,
+     size_t end_offset,
+     size_t alignment,
+     size_t *match_offset,
+     size_t *match_size,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_scan_find_security_identifier(
+     const uint8_t *data,
+     size_t data_size,
+     size_t start_offset,
+     size_t end_offset,
+     size_t alignment,
+     size_t *match_offset,
+     size_t *match_size,
+     libcerror_error_t **error );
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _LIBFWNT_SCAN_H ) */
+
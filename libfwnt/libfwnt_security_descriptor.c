@@ -34,6 +34,7 @@
 #include "libfwnt_libcnotify.h"
 #include "libfwnt_security_descriptor.h"
 #include "libfwnt_security_identifier.h"
+#include "libfwnt_statistics.h"
 #include "libfwnt_types.h"
 
 /* Creates a security descriptor
@@ -97,6 +98,10 @@ int libfwnt_security_descriptor_initialize(
 
 		goto on_error;
 	}
+	/* A new descriptor uses the only known security descriptor revision
+	 */
+	internal_security_descriptor->revision_number = 1;
+
 	*security_descriptor = (libfwnt_security_descriptor_t *) internal_security_descriptor;
 
 	return( 1 );
@@ -137,6 +142,22 @@ int libfwnt_security_descriptor_free(
 		internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) *security_descriptor;
 		*security_descriptor         = NULL;
 
+		if( internal_security_descriptor->is_lazy != 0 )
+		{
+			if( libfwnt_internal_security_descriptor_clear_byte_stream(
+			     internal_security_descriptor,
+			     error ) != 1 )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+				 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+				 "%s: unable to clear byte stream.",
+				 function );
+
+				result = -1;
+			}
+		}
 		if( internal_security_descriptor->owner_sid != NULL )
 		{
 			if( libfwnt_internal_security_identifier_free(
@@ -219,11 +240,13 @@ int libfwnt_security_descriptor_copy_from_byte_stream(
 {
 	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
 	static char *function                                                = "libfwnt_security_descriptor_copy_from_byte_stream";
+	uint64_t statistics_start_time                                       = 0;
 	uint32_t discretionary_acl_offset                                    = 0;
 	uint32_t group_sid_offset                                            = 0;
 	uint32_t owner_sid_offset                                            = 0;
 	uint32_t system_acl_offset                                           = 0;
 	uint16_t control_flags                                               = 0;
+	int statistics_enabled                                               = 0;
 
 #if defined( HAVE_DEBUG_OUTPUT )
 	system_character_t *sid_string                                       = NULL;
@@ -244,6 +267,23 @@ int libfwnt_security_descriptor_copy_from_byte_stream(
 	}
 	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
 
+	statistics_enabled = libfwnt_statistics_enabled;
+
+	if( statistics_enabled != 0 )
+	{
+		statistics_start_time = libfwnt_statistics_get_time();
+	}
+	if( internal_security_descriptor->is_lazy != 0 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid security descriptor - byte stream value already set.",
+		 function );
+
+		return( -1 );
+	}
 	if( internal_security_descriptor->owner_sid != NULL )
 	{
 		libcerror_error_set(
@@ -350,6 +390,8 @@ int libfwnt_security_descriptor_copy_from_byte_stream(
 	 &( byte_stream[ 2 ] ),
 	 control_flags );
 
+	internal_security_descriptor->control_flags = control_flags;
+
 	byte_stream_copy_to_uint32_little_endian(
 	 &( byte_stream[ 4 ] ),
 	 owner_sid_offset );
@@ -360,11 +402,11 @@ int libfwnt_security_descriptor_copy_from_byte_stream(
 
 	byte_stream_copy_to_uint32_little_endian(
 	 &( byte_stream[ 12 ] ),
-	 discretionary_acl_offset );
+	 system_acl_offset );
 
 	byte_stream_copy_to_uint32_little_endian(
 	 &( byte_stream[ 16 ] ),
-	 system_acl_offset );
+	 discretionary_acl_offset );
 
 #if defined( HAVE_DEBUG_OUTPUT )
 	if( libcnotify_verbose != 0 )
@@ -399,14 +441,14 @@ int libfwnt_security_descriptor_copy_from_byte_stream(
 		 group_sid_offset );
 
 		libcnotify_printf(
-		 "%s: discretionary ACL offset\t: 0x%08" PRIx32 "\n",
+		 "%s: system ACL offset\t\t: 0x%08" PRIx32 "\n",
 		 function,
-		 discretionary_acl_offset );
+		 system_acl_offset );
 
 		libcnotify_printf(
-		 "%s: system ACL offset\t\t: 0x%08" PRIx32 "\n",
+		 "%s: discretionary ACL offset\t: 0x%08" PRIx32 "\n",
 		 function,
-		 system_acl_offset );
+		 discretionary_acl_offset );
 
 		libcnotify_printf(
 		 "\n" );
@@ -707,6 +749,8 @@ int libfwnt_security_descriptor_copy_from_byte_stream(
 
 			goto on_error;
 		}
+		( (libfwnt_internal_access_control_list_t *) internal_security_descriptor->discretionary_acl )->is_managed = 1;
+
 		if( libfwnt_access_control_list_copy_from_byte_stream(
 		     internal_security_descriptor->discretionary_acl,
 		     &( byte_stream[ discretionary_acl_offset ] ),
@@ -751,6 +795,8 @@ int libfwnt_security_descriptor_copy_from_byte_stream(
 
 			goto on_error;
 		}
+		( (libfwnt_internal_access_control_list_t *) internal_security_descriptor->system_acl )->is_managed = 1;
+
 		if( libfwnt_access_control_list_copy_from_byte_stream(
 		     internal_security_descriptor->system_acl,
 		     &( byte_stream[ system_acl_offset ] ),
@@ -768,6 +814,14 @@ int libfwnt_security_descriptor_copy_from_byte_stream(
 			goto on_error;
 		}
 	}
+	if( statistics_enabled != 0 )
+	{
+		libfwnt_statistics_update(
+		 LIBFWNT_STATISTICS_FUNCTION_SECURITY_DESCRIPTOR_COPY_FROM_BYTE_STREAM,
+		 statistics_start_time,
+		 byte_stream_size,
+		 0 );
+	}
 	return( 1 );
 
 on_error:
@@ -805,18 +859,17 @@ on_error:
 	return( -1 );
 }
 
-/* Retrieves the owner security identifier (SID)
- * Returns 1 if successful, 0 if not available or -1 on error
+/* Clears the byte stream of a security descriptor that is parsed on demand
+ * Returns 1 if successful or -1 on error
  */
-int libfwnt_security_descriptor_get_owner(
-     libfwnt_security_descriptor_t *security_descriptor,
-     libfwnt_security_identifier_t **security_identifier,
+int libfwnt_internal_security_descriptor_clear_byte_stream(
+     libfwnt_internal_security_descriptor_t *internal_security_descriptor,
      libcerror_error_t **error )
 {
-	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
-	static char *function                                                = "libfwnt_security_descriptor_get_owner";
+	static char *function = "libfwnt_internal_security_descriptor_clear_byte_stream";
+	int result            = 1;
 
-	if( security_descriptor == NULL )
+	if( internal_security_descriptor == NULL )
 	{
 		libcerror_error_set(
 		 error,
@@ -827,49 +880,73 @@ int libfwnt_security_descriptor_get_owner(
 
 		return( -1 );
 	}
-	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
-
-	if( security_identifier == NULL )
+	/* The SIDs and ACLs are embedded in the security descriptor and are not freed
+	 */
+	internal_security_descriptor->owner_sid         = NULL;
+	internal_security_descriptor->group_sid         = NULL;
+	internal_security_descriptor->discretionary_acl = NULL;
+	internal_security_descriptor->system_acl        = NULL;
+
+	if( libfwnt_internal_access_control_list_clear(
+	     &( internal_security_descriptor->discretionary_acl_value ),
+	     error ) != 1 )
 	{
 		libcerror_error_set(
 		 error,
-		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid security identifier.",
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+		 "%s: unable to clear discretionary ACL.",
 		 function );
 
-		return( -1 );
+		result = -1;
 	}
-	if( *security_identifier != NULL )
+	if( libfwnt_internal_access_control_list_clear(
+	     &( internal_security_descriptor->system_acl_value ),
+	     error ) != 1 )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
-		 "%s: invalid security identifier value already set.",
+		 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+		 "%s: unable to clear system ACL.",
 		 function );
 
-		return( -1 );
+		result = -1;
 	}
-	if( internal_security_descriptor->owner_sid == NULL )
+	if( internal_security_descriptor->managed_byte_stream != NULL )
 	{
-		return( 0 );
+		memory_free(
+		 internal_security_descriptor->managed_byte_stream );
+
+		internal_security_descriptor->managed_byte_stream = NULL;
 	}
-	*security_identifier = internal_security_descriptor->owner_sid;
+	internal_security_descriptor->is_lazy = 0;
 
-	return( 1 );
+	return( result );
 }
 
-/* Retrieves the group security identifier (SID)
- * Returns 1 if successful, 0 if not available or -1 on error
+/* Sets a security descriptor stored in a byte stream to be parsed on demand
+ * The layout is validated once, the access control entries and their security identifiers
+ * are decoded when first retrieved. Unless LIBFWNT_SECURITY_DESCRIPTOR_FLAG_MANAGED is set
+ * the byte stream is referenced and must remain available while the descriptor is used
+ * Returns 1 if successful or -1 on error
  */
-int libfwnt_security_descriptor_get_group(
+int libfwnt_security_descriptor_set_byte_stream(
      libfwnt_security_descriptor_t *security_descriptor,
-     libfwnt_security_identifier_t **security_identifier,
+     const uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     uint8_t flags,
      libcerror_error_t **error )
 {
 	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
-	static char *function                                                = "libfwnt_security_descriptor_get_group";
+	static char *function                                                = "libfwnt_security_descriptor_set_byte_stream";
+	uint64_t statistics_start_time                                       = 0;
+	uint32_t discretionary_acl_offset                                    = 0;
+	uint32_t group_sid_offset                                            = 0;
+	uint32_t owner_sid_offset                                            = 0;
+	uint32_t system_acl_offset                                           = 0;
+	int statistics_enabled                                               = 0;
 
 	if( security_descriptor == NULL )
 	{
@@ -884,144 +961,1598 @@ int libfwnt_security_descriptor_get_group(
 	}
 	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
 
-	if( security_identifier == NULL )
-	{
-		libcerror_error_set(
-		 error,
-		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid security identifier.",
-		 function );
+	statistics_enabled = libfwnt_statistics_enabled;
 
-		return( -1 );
+	if( statistics_enabled != 0 )
+	{
+		statistics_start_time = libfwnt_statistics_get_time();
 	}
-	if( *security_identifier != NULL )
+	if( ( internal_security_descriptor->is_lazy != 0 )
+	 || ( internal_security_descriptor->owner_sid != NULL )
+	 || ( internal_security_descriptor->group_sid != NULL )
+	 || ( internal_security_descriptor->discretionary_acl != NULL )
+	 || ( internal_security_descriptor->system_acl != NULL ) )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
 		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
-		 "%s: invalid security identifier value already set.",
+		 "%s: invalid security descriptor - values already set.",
 		 function );
 
 		return( -1 );
 	}
-	if( internal_security_descriptor->group_sid == NULL )
-	{
-		return( 0 );
-	}
-	*security_identifier = internal_security_descriptor->group_sid;
-
-	return( 1 );
-}
-
-/* Retrieves the discretionary access control list (ACL)
- * Returns 1 if successful, 0 if not available or -1 on error
- */
-int libfwnt_security_descriptor_get_discretionary_acl(
-     libfwnt_security_descriptor_t *security_descriptor,
-     libfwnt_access_control_list_t **access_control_list,
-     libcerror_error_t **error )
-{
-	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
-	static char *function                                                = "libfwnt_security_descriptor_get_discretionary_acl";
-
-	if( security_descriptor == NULL )
+	if( byte_stream == NULL )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
 		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid security descriptor.",
+		 "%s: invalid byte stream.",
 		 function );
 
 		return( -1 );
 	}
-	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
-
-	if( access_control_list == NULL )
+	if( byte_stream_size < 20 )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid access control list.",
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+		 "%s: byte stream too small.",
 		 function );
 
 		return( -1 );
 	}
-	if( *access_control_list != NULL )
+	if( byte_stream_size > (size_t) SSIZE_MAX )
 	{
 		libcerror_error_set(
 		 error,
-		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
-		 "%s: invalid access control list value already set.",
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: byte stream size exceeds maximum.",
 		 function );
 
 		return( -1 );
 	}
-	if( internal_security_descriptor->discretionary_acl == NULL )
-	{
-		return( 0 );
-	}
-	*access_control_list = internal_security_descriptor->discretionary_acl;
-
-	return( 1 );
-}
-
-/* Retrieves the system access control list (ACL)
- * Returns 1 if successful, 0 if not available or -1 on error
- */
-int libfwnt_security_descriptor_get_system_acl(
-     libfwnt_security_descriptor_t *security_descriptor,
-     libfwnt_access_control_list_t **access_control_list,
-     libcerror_error_t **error )
-{
-	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
-	static char *function                                                = "libfwnt_security_descriptor_get_system_acl";
-
-	if( security_descriptor == NULL )
+	if( byte_order != LIBFWNT_ENDIAN_LITTLE )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid security descriptor.",
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported byte order.",
 		 function );
 
 		return( -1 );
 	}
-	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
-
-	if( access_control_list == NULL )
+	if( ( flags & ~( LIBFWNT_SECURITY_DESCRIPTOR_FLAG_MANAGED ) ) != 0 )
 	{
 		libcerror_error_set(
 		 error,
 		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
-		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
-		 "%s: invalid access control list.",
-		 function );
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported flags: 0x%02" PRIx8 ".",
+		 function,
+		 flags );
 
 		return( -1 );
 	}
-	if( *access_control_list != NULL )
+	internal_security_descriptor->is_lazy = 1;
+
+	if( ( flags & LIBFWNT_SECURITY_DESCRIPTOR_FLAG_MANAGED ) != 0 )
 	{
-		libcerror_error_set(
-		 error,
-		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
-		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
-		 "%s: invalid access control list value already set.",
-		 function );
+		internal_security_descriptor->managed_byte_stream = (uint8_t *) memory_allocate(
+		                                                                 sizeof( uint8_t ) * byte_stream_size );
 
-		return( -1 );
+		if( internal_security_descriptor->managed_byte_stream == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+			 "%s: unable to create managed byte stream.",
+			 function );
+
+			goto on_error;
+		}
+		if( memory_copy(
+		     internal_security_descriptor->managed_byte_stream,
+		     byte_stream,
+		     byte_stream_size ) == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+			 "%s: unable to copy byte stream.",
+			 function );
+
+			goto on_error;
+		}
+		byte_stream = internal_security_descriptor->managed_byte_stream;
 	}
-	if( internal_security_descriptor->system_acl == NULL )
+	internal_security_descriptor->revision_number = byte_stream[ 0 ];
+
+	byte_stream_copy_to_uint16_little_endian(
+	 &( byte_stream[ 2 ] ),
+	 internal_security_descriptor->control_flags );
+
+	byte_stream_copy_to_uint32_little_endian(
+	 &( byte_stream[ 4 ] ),
+	 owner_sid_offset );
+
+	byte_stream_copy_to_uint32_little_endian(
+	 &( byte_stream[ 8 ] ),
+	 group_sid_offset );
+
+	byte_stream_copy_to_uint32_little_endian(
+	 &( byte_stream[ 12 ] ),
+	 system_acl_offset );
+
+	byte_stream_copy_to_uint32_little_endian(
+	 &( byte_stream[ 16 ] ),
+	 discretionary_acl_offset );
+
+	/* The owner and group SIDs are small enough to be decoded into the descriptor
+	 * itself, which also validates them
+	 */
+	if( owner_sid_offset != 0 )
 	{
-		return( 0 );
-	}
-	*access_control_list = internal_security_descriptor->system_acl;
+		if( ( owner_sid_offset < 20 )
+		 || ( (size_t) owner_sid_offset > byte_stream_size ) )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: owner SID offset value out of bounds.",
+			 function );
+
+			goto on_error;
+		}
+		internal_security_descriptor->owner_sid_value.is_managed = 1;
+
+		if( libfwnt_security_identifier_copy_from_byte_stream(
+		     (libfwnt_security_identifier_t *) &( internal_security_descriptor->owner_sid_value ),
+		     &( byte_stream[ owner_sid_offset ] ),
+		     byte_stream_size - owner_sid_offset,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+			 "%s: unable to copy owner security identifier from byte stream.",
+			 function );
 
+			goto on_error;
+		}
+		internal_security_descriptor->owner_sid = (libfwnt_security_identifier_t *) &( internal_security_descriptor->owner_sid_value );
+	}
+	if( group_sid_offset != 0 )
+	{
+		if( ( group_sid_offset < 20 )
+		 || ( (size_t) group_sid_offset > byte_stream_size ) )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: group security identifier offset value out of bounds.",
+			 function );
+
+			goto on_error;
+		}
+		internal_security_descriptor->group_sid_value.is_managed = 1;
+
+		if( libfwnt_security_identifier_copy_from_byte_stream(
+		     (libfwnt_security_identifier_t *) &( internal_security_descriptor->group_sid_value ),
+		     &( byte_stream[ group_sid_offset ] ),
+		     byte_stream_size - group_sid_offset,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+			 "%s: unable to copy group security identifier from byte stream.",
+			 function );
+
+			goto on_error;
+		}
+		internal_security_descriptor->group_sid = (libfwnt_security_identifier_t *) &( internal_security_descriptor->group_sid_value );
+	}
+	if( discretionary_acl_offset != 0 )
+	{
+		if( ( discretionary_acl_offset < 20 )
+		 || ( (size_t) discretionary_acl_offset > byte_stream_size ) )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: discretionary ACL offset value out of bounds.",
+			 function );
+
+			goto on_error;
+		}
+		internal_security_descriptor->discretionary_acl_value.is_managed = 1;
+
+		if( libfwnt_access_control_list_set_byte_stream(
+		     (libfwnt_access_control_list_t *) &( internal_security_descriptor->discretionary_acl_value ),
+		     &( byte_stream[ discretionary_acl_offset ] ),
+		     byte_stream_size - discretionary_acl_offset,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+			 "%s: unable to set discretionary ACL byte stream.",
+			 function );
+
+			goto on_error;
+		}
+		internal_security_descriptor->discretionary_acl = (libfwnt_access_control_list_t *) &( internal_security_descriptor->discretionary_acl_value );
+	}
+	if( system_acl_offset != 0 )
+	{
+		if( ( system_acl_offset < 20 )
+		 || ( (size_t) system_acl_offset > byte_stream_size ) )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+			 "%s: system ACL offset value out of bounds.",
+			 function );
+
+			goto on_error;
+		}
+		internal_security_descriptor->system_acl_value.is_managed = 1;
+
+		if( libfwnt_access_control_list_set_byte_stream(
+		     (libfwnt_access_control_list_t *) &( internal_security_descriptor->system_acl_value ),
+		     &( byte_stream[ system_acl_offset ] ),
+		     byte_stream_size - system_acl_offset,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+			 "%s: unable to set system ACL byte stream.",
+			 function );
+
+			goto on_error;
+		}
+		internal_security_descriptor->system_acl = (libfwnt_access_control_list_t *) &( internal_security_descriptor->system_acl_value );
+	}
+	if( statistics_enabled != 0 )
+	{
+		libfwnt_statistics_update(
+		 LIBFWNT_STATISTICS_FUNCTION_SECURITY_DESCRIPTOR_SET_BYTE_STREAM,
+		 statistics_start_time,
+		 byte_stream_size,
+		 0 );
+	}
+	return( 1 );
+
+on_error:
+	libfwnt_internal_security_descriptor_clear_byte_stream(
+	 internal_security_descriptor,
+	 NULL );
+
+	return( -1 );
+}
+
+/* Reads the byte stream of a security descriptor that is parsed on demand into separate values
+ * This allows the descriptor to be modified, values previously retrieved from the descriptor
+ * are freed
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_security_descriptor_read_byte_stream(
+     libfwnt_internal_security_descriptor_t *internal_security_descriptor,
+     libcerror_error_t **error )
+{
+	uint8_t *byte_stream    = NULL;
+	static char *function   = "libfwnt_internal_security_descriptor_read_byte_stream";
+	size_t byte_stream_size = 0;
+
+	if( internal_security_descriptor == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_security_descriptor->is_lazy == 0 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_MISSING,
+		 "%s: invalid security descriptor - missing byte stream.",
+		 function );
+
+		return( -1 );
+	}
+	/* The byte stream could have been modified by changes to the access control lists
+	 * hence the descriptor is stored again instead of reusing the original byte stream
+	 */
+	if( libfwnt_security_descriptor_get_byte_stream_size(
+	     (libfwnt_security_descriptor_t *) internal_security_descriptor,
+	     &byte_stream_size,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve byte stream size.",
+		 function );
+
+		goto on_error;
+	}
+	byte_stream = (uint8_t *) memory_allocate(
+	                           sizeof( uint8_t ) * byte_stream_size );
+
+	if( byte_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+		 "%s: unable to create byte stream.",
+		 function );
+
+		goto on_error;
+	}
+	if( libfwnt_security_descriptor_copy_to_byte_stream(
+	     (libfwnt_security_descriptor_t *) internal_security_descriptor,
+	     byte_stream,
+	     byte_stream_size,
+	     LIBFWNT_ENDIAN_LITTLE,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+		 "%s: unable to copy security descriptor to byte stream.",
+		 function );
+
+		goto on_error;
+	}
+	if( libfwnt_internal_security_descriptor_clear_byte_stream(
+	     internal_security_descriptor,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+		 "%s: unable to clear byte stream.",
+		 function );
+
+		goto on_error;
+	}
+	if( libfwnt_security_descriptor_copy_from_byte_stream(
+	     (libfwnt_security_descriptor_t *) internal_security_descriptor,
+	     byte_stream,
+	     byte_stream_size,
+	     LIBFWNT_ENDIAN_LITTLE,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+		 "%s: unable to copy security descriptor from byte stream.",
+		 function );
+
+		goto on_error;
+	}
+	memory_free(
+	 byte_stream );
+
+	return( 1 );
+
+on_error:
+	if( byte_stream != NULL )
+	{
+		memory_free(
+		 byte_stream );
+	}
+	return( -1 );
+}
+
+/* Retrieves the size of the security descriptor when stored in a self-relative byte stream
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_security_descriptor_get_byte_stream_size(
+     libfwnt_security_descriptor_t *security_descriptor,
+     size_t *byte_stream_size,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
+	static char *function                                                = "libfwnt_security_descriptor_get_byte_stream_size";
+	size_t safe_byte_stream_size                                         = 0;
+	size_t value_size                                                    = 0;
+
+	if( security_descriptor == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( -1 );
+	}
+	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
+
+	if( byte_stream_size == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid byte stream size.",
+		 function );
+
+		return( -1 );
+	}
+	safe_byte_stream_size = 20;
+
+	if( internal_security_descriptor->system_acl != NULL )
+	{
+		if( libfwnt_access_control_list_get_byte_stream_size(
+		     internal_security_descriptor->system_acl,
+		     &value_size,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve system ACL byte stream size.",
+			 function );
+
+			return( -1 );
+		}
+		safe_byte_stream_size += value_size;
+	}
+	if( internal_security_descriptor->discretionary_acl != NULL )
+	{
+		if( libfwnt_access_control_list_get_byte_stream_size(
+		     internal_security_descriptor->discretionary_acl,
+		     &value_size,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve discretionary ACL byte stream size.",
+			 function );
+
+			return( -1 );
+		}
+		safe_byte_stream_size += value_size;
+	}
+	if( internal_security_descriptor->owner_sid != NULL )
+	{
+		if( libfwnt_security_identifier_get_size(
+		     internal_security_descriptor->owner_sid,
+		     &value_size,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve owner security identifier size.",
+			 function );
+
+			return( -1 );
+		}
+		safe_byte_stream_size += value_size;
+	}
+	if( internal_security_descriptor->group_sid != NULL )
+	{
+		if( libfwnt_security_identifier_get_size(
+		     internal_security_descriptor->group_sid,
+		     &value_size,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve group security identifier size.",
+			 function );
+
+			return( -1 );
+		}
+		safe_byte_stream_size += value_size;
+	}
+	*byte_stream_size = safe_byte_stream_size;
+
+	return( 1 );
+}
+
+/* Converts a security descriptor into a self-relative byte stream
+ * The values are stored in a single pass in the order: system ACL, discretionary ACL,
+ * owner SID and group SID. The self-relative control flag is set and the ACL present
+ * control flags are set for the ACLs that are stored
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_security_descriptor_copy_to_byte_stream(
+     libfwnt_security_descriptor_t *security_descriptor,
+     uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
+	static char *function                                                = "libfwnt_security_descriptor_copy_to_byte_stream";
+	size_t byte_stream_offset                                            = 0;
+	size_t descriptor_size                                               = 0;
+	size_t value_size                                                    = 0;
+	uint32_t discretionary_acl_offset                                    = 0;
+	uint32_t group_sid_offset                                            = 0;
+	uint32_t owner_sid_offset                                            = 0;
+	uint32_t system_acl_offset                                           = 0;
+	uint16_t control_flags                                               = 0;
+
+	if( security_descriptor == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( -1 );
+	}
+	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
+
+	if( byte_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid byte stream.",
+		 function );
+
+		return( -1 );
+	}
+	if( byte_stream_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: byte stream size exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( byte_order != LIBFWNT_ENDIAN_LITTLE )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported byte order.",
+		 function );
+
+		return( -1 );
+	}
+	if( libfwnt_security_descriptor_get_byte_stream_size(
+	     security_descriptor,
+	     &descriptor_size,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve byte stream size.",
+		 function );
+
+		return( -1 );
+	}
+	if( byte_stream_size < descriptor_size )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+		 "%s: byte stream too small.",
+		 function );
+
+		return( -1 );
+	}
+	control_flags = internal_security_descriptor->control_flags | LIBFWNT_CONTROL_FLAG_SELF_RELATIVE;
+
+	byte_stream_offset = 20;
+
+	if( internal_security_descriptor->system_acl != NULL )
+	{
+		if( libfwnt_access_control_list_get_byte_stream_size(
+		     internal_security_descriptor->system_acl,
+		     &value_size,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve system ACL byte stream size.",
+			 function );
+
+			return( -1 );
+		}
+		if( libfwnt_access_control_list_copy_to_byte_stream(
+		     internal_security_descriptor->system_acl,
+		     &( byte_stream[ byte_stream_offset ] ),
+		     descriptor_size - byte_stream_offset,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+			 "%s: unable to copy system ACL to byte stream.",
+			 function );
+
+			return( -1 );
+		}
+		system_acl_offset   = (uint32_t) byte_stream_offset;
+		byte_stream_offset += value_size;
+		control_flags      |= LIBFWNT_CONTROL_FLAG_SACL_PRESENT;
+	}
+	if( internal_security_descriptor->discretionary_acl != NULL )
+	{
+		if( libfwnt_access_control_list_get_byte_stream_size(
+		     internal_security_descriptor->discretionary_acl,
+		     &value_size,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve discretionary ACL byte stream size.",
+			 function );
+
+			return( -1 );
+		}
+		if( libfwnt_access_control_list_copy_to_byte_stream(
+		     internal_security_descriptor->discretionary_acl,
+		     &( byte_stream[ byte_stream_offset ] ),
+		     descriptor_size - byte_stream_offset,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+			 "%s: unable to copy discretionary ACL to byte stream.",
+			 function );
+
+			return( -1 );
+		}
+		discretionary_acl_offset = (uint32_t) byte_stream_offset;
+		byte_stream_offset      += value_size;
+		control_flags           |= LIBFWNT_CONTROL_FLAG_DACL_PRESENT;
+	}
+	if( internal_security_descriptor->owner_sid != NULL )
+	{
+		if( libfwnt_security_identifier_get_size(
+		     internal_security_descriptor->owner_sid,
+		     &value_size,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve owner security identifier size.",
+			 function );
+
+			return( -1 );
+		}
+		if( libfwnt_security_identifier_copy_to_byte_stream(
+		     internal_security_descriptor->owner_sid,
+		     &( byte_stream[ byte_stream_offset ] ),
+		     descriptor_size - byte_stream_offset,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+			 "%s: unable to copy owner security identifier to byte stream.",
+			 function );
+
+			return( -1 );
+		}
+		owner_sid_offset    = (uint32_t) byte_stream_offset;
+		byte_stream_offset += value_size;
+	}
+	if( internal_security_descriptor->group_sid != NULL )
+	{
+		if( libfwnt_security_identifier_get_size(
+		     internal_security_descriptor->group_sid,
+		     &value_size,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve group security identifier size.",
+			 function );
+
+			return( -1 );
+		}
+		if( libfwnt_security_identifier_copy_to_byte_stream(
+		     internal_security_descriptor->group_sid,
+		     &( byte_stream[ byte_stream_offset ] ),
+		     descriptor_size - byte_stream_offset,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+			 "%s: unable to copy group security identifier to byte stream.",
+			 function );
+
+			return( -1 );
+		}
+		group_sid_offset    = (uint32_t) byte_stream_offset;
+		byte_stream_offset += value_size;
+	}
+	byte_stream[ 0 ] = internal_security_descriptor->revision_number;
+	byte_stream[ 1 ] = 0;
+
+	byte_stream_copy_from_uint16_little_endian(
+	 &( byte_stream[ 2 ] ),
+	 control_flags );
+
+	byte_stream_copy_from_uint32_little_endian(
+	 &( byte_stream[ 4 ] ),
+	 owner_sid_offset );
+
+	byte_stream_copy_from_uint32_little_endian(
+	 &( byte_stream[ 8 ] ),
+	 group_sid_offset );
+
+	byte_stream_copy_from_uint32_little_endian(
+	 &( byte_stream[ 12 ] ),
+	 system_acl_offset );
+
+	byte_stream_copy_from_uint32_little_endian(
+	 &( byte_stream[ 16 ] ),
+	 discretionary_acl_offset );
+
+	return( 1 );
+}
+
+/* Retrieves the owner security identifier (SID)
+ * Returns 1 if successful, 0 if not available or -1 on error
+ */
+int libfwnt_security_descriptor_get_owner(
+     libfwnt_security_descriptor_t *security_descriptor,
+     libfwnt_security_identifier_t **security_identifier,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
+	static char *function                                                = "libfwnt_security_descriptor_get_owner";
+
+	if( security_descriptor == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( -1 );
+	}
+	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
+
+	if( security_identifier == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security identifier.",
+		 function );
+
+		return( -1 );
+	}
+	if( *security_identifier != NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid security identifier value already set.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_security_descriptor->owner_sid == NULL )
+	{
+		return( 0 );
+	}
+	*security_identifier = internal_security_descriptor->owner_sid;
+
+	return( 1 );
+}
+
+/* Retrieves the group security identifier (SID)
+ * Returns 1 if successful, 0 if not available or -1 on error
+ */
+int libfwnt_security_descriptor_get_group(
+     libfwnt_security_descriptor_t *security_descriptor,
+     libfwnt_security_identifier_t **security_identifier,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
+	static char *function                                                = "libfwnt_security_descriptor_get_group";
+
+	if( security_descriptor == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( -1 );
+	}
+	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
+
+	if( security_identifier == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security identifier.",
+		 function );
+
+		return( -1 );
+	}
+	if( *security_identifier != NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid security identifier value already set.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_security_descriptor->group_sid == NULL )
+	{
+		return( 0 );
+	}
+	*security_identifier = internal_security_descriptor->group_sid;
+
+	return( 1 );
+}
+
+/* Retrieves the discretionary access control list (ACL)
+ * Returns 1 if successful, 0 if not available or -1 on error
+ */
+int libfwnt_security_descriptor_get_discretionary_acl(
+     libfwnt_security_descriptor_t *security_descriptor,
+     libfwnt_access_control_list_t **access_control_list,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
+	static char *function                                                = "libfwnt_security_descriptor_get_discretionary_acl";
+
+	if( security_descriptor == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( -1 );
+	}
+	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
+
+	if( access_control_list == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control list.",
+		 function );
+
+		return( -1 );
+	}
+	if( *access_control_list != NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid access control list value already set.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_security_descriptor->discretionary_acl == NULL )
+	{
+		return( 0 );
+	}
+	*access_control_list = internal_security_descriptor->discretionary_acl;
+
+	return( 1 );
+}
+
+/* Retrieves the system access control list (ACL)
+ * Returns 1 if successful, 0 if not available or -1 on error
+ */
+int libfwnt_security_descriptor_get_system_acl(
+     libfwnt_security_descriptor_t *security_descriptor,
+     libfwnt_access_control_list_t **access_control_list,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
+	static char *function                                                = "libfwnt_security_descriptor_get_system_acl";
+
+	if( security_descriptor == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( -1 );
+	}
+	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
+
+	if( access_control_list == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control list.",
+		 function );
+
+		return( -1 );
+	}
+	if( *access_control_list != NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid access control list value already set.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_security_descriptor->system_acl == NULL )
+	{
+		return( 0 );
+	}
+	*access_control_list = internal_security_descriptor->system_acl;
+
+	return( 1 );
+}
+
+/* Retrieves the control flags
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_security_descriptor_get_control_flags(
+     libfwnt_security_descriptor_t *security_descriptor,
+     uint16_t *control_flags,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
+	static char *function                                                = "libfwnt_security_descriptor_get_control_flags";
+
+	if( security_descriptor == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( -1 );
+	}
+	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
+
+	if( control_flags == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid control flags.",
+		 function );
+
+		return( -1 );
+	}
+	*control_flags = internal_security_descriptor->control_flags;
+
+	return( 1 );
+}
+
+/* Sets the control flags
+ * The ACL present and self-relative flags are determined when the descriptor is stored
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_security_descriptor_set_control_flags(
+     libfwnt_security_descriptor_t *security_descriptor,
+     uint16_t control_flags,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
+	static char *function                                                = "libfwnt_security_descriptor_set_control_flags";
+
+	if( security_descriptor == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( -1 );
+	}
+	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
+
+	internal_security_descriptor->control_flags = control_flags;
+
+	return( 1 );
+}
+
+/* Replaces a security identifier (SID) of the security descriptor with a copy of another
+ * The source is copied before the security descriptor is modified, hence it can be
+ * a security identifier retrieved from the same security descriptor
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_security_descriptor_replace_security_identifier(
+     libfwnt_internal_security_descriptor_t *internal_security_descriptor,
+     libfwnt_security_identifier_t **security_identifier,
+     libfwnt_security_identifier_t *source_security_identifier,
+     libcerror_error_t **error )
+{
+	uint8_t sid_data[ 8 + ( 4 * 255 ) ];
+
+	libfwnt_security_identifier_t *safe_security_identifier = NULL;
+	static char *function                                   = "libfwnt_internal_security_descriptor_replace_security_identifier";
+	size_t sid_data_size                                    = 0;
+
+	if( internal_security_descriptor == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( -1 );
+	}
+	if( security_identifier == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security identifier.",
+		 function );
+
+		return( -1 );
+	}
+	if( source_security_identifier != NULL )
+	{
+		if( libfwnt_security_identifier_get_size(
+		     source_security_identifier,
+		     &sid_data_size,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve source security identifier size.",
+			 function );
+
+			goto on_error;
+		}
+		if( libfwnt_security_identifier_copy_to_byte_stream(
+		     source_security_identifier,
+		     sid_data,
+		     sizeof( sid_data ),
+		     LIBFWNT_ENDIAN_LITTLE,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+			 "%s: unable to copy source security identifier to byte stream.",
+			 function );
+
+			goto on_error;
+		}
+		if( libfwnt_security_identifier_initialize(
+		     &safe_security_identifier,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
+			 "%s: unable to create security identifier.",
+			 function );
+
+			goto on_error;
+		}
+		if( libfwnt_security_identifier_copy_from_byte_stream(
+		     safe_security_identifier,
+		     sid_data,
+		     sid_data_size,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+			 "%s: unable to copy security identifier from byte stream.",
+			 function );
+
+			goto on_error;
+		}
+		( (libfwnt_internal_security_identifier_t *) safe_security_identifier )->is_managed = 1;
+	}
+	if( internal_security_descriptor->is_lazy != 0 )
+	{
+		if( libfwnt_internal_security_descriptor_read_byte_stream(
+		     internal_security_descriptor,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_IO,
+			 LIBCERROR_IO_ERROR_READ_FAILED,
+			 "%s: unable to read byte stream.",
+			 function );
+
+			goto on_error;
+		}
+	}
+	if( *security_identifier != NULL )
+	{
+		if( libfwnt_internal_security_identifier_free(
+		     (libfwnt_internal_security_identifier_t **) security_identifier,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+			 "%s: unable to free security identifier.",
+			 function );
+
+			goto on_error;
+		}
+	}
+	*security_identifier = safe_security_identifier;
+
+	return( 1 );
+
+on_error:
+	if( safe_security_identifier != NULL )
+	{
+		libfwnt_internal_security_identifier_free(
+		 (libfwnt_internal_security_identifier_t **) &safe_security_identifier,
+		 NULL );
+	}
+	return( -1 );
+}
+
+/* Replaces an access control list (ACL) of the security descriptor with a copy of another
+ * The source is copied before the security descriptor is modified, hence it can be
+ * an access control list retrieved from the same security descriptor
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_security_descriptor_replace_access_control_list(
+     libfwnt_internal_security_descriptor_t *internal_security_descriptor,
+     libfwnt_access_control_list_t **access_control_list,
+     libfwnt_access_control_list_t *source_access_control_list,
+     libcerror_error_t **error )
+{
+	libfwnt_access_control_list_t *safe_access_control_list = NULL;
+	uint8_t *acl_data                                       = NULL;
+	static char *function                                   = "libfwnt_internal_security_descriptor_replace_access_control_list";
+	size_t acl_data_size                                    = 0;
+
+	if( internal_security_descriptor == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( -1 );
+	}
+	if( access_control_list == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid access control list.",
+		 function );
+
+		return( -1 );
+	}
+	if( source_access_control_list != NULL )
+	{
+		if( libfwnt_access_control_list_get_byte_stream_size(
+		     source_access_control_list,
+		     &acl_data_size,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve source access control list byte stream size.",
+			 function );
+
+			goto on_error;
+		}
+		acl_data = (uint8_t *) memory_allocate(
+		                        sizeof( uint8_t ) * acl_data_size );
+
+		if( acl_data == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+			 "%s: unable to create access control list data.",
+			 function );
+
+			goto on_error;
+		}
+		if( libfwnt_access_control_list_copy_to_byte_stream(
+		     source_access_control_list,
+		     acl_data,
+		     acl_data_size,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+			 "%s: unable to copy source access control list to byte stream.",
+			 function );
+
+			goto on_error;
+		}
+		if( libfwnt_access_control_list_initialize(
+		     &safe_access_control_list,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
+			 "%s: unable to create access control list.",
+			 function );
+
+			goto on_error;
+		}
+		if( libfwnt_access_control_list_copy_from_byte_stream(
+		     safe_access_control_list,
+		     acl_data,
+		     acl_data_size,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_COPY_FAILED,
+			 "%s: unable to copy access control list from byte stream.",
+			 function );
+
+			goto on_error;
+		}
+		( (libfwnt_internal_access_control_list_t *) safe_access_control_list )->is_managed = 1;
+
+		memory_free(
+		 acl_data );
+
+		acl_data = NULL;
+	}
+	if( internal_security_descriptor->is_lazy != 0 )
+	{
+		if( libfwnt_internal_security_descriptor_read_byte_stream(
+		     internal_security_descriptor,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_IO,
+			 LIBCERROR_IO_ERROR_READ_FAILED,
+			 "%s: unable to read byte stream.",
+			 function );
+
+			goto on_error;
+		}
+	}
+	if( *access_control_list != NULL )
+	{
+		if( libfwnt_internal_access_control_list_free(
+		     (libfwnt_internal_access_control_list_t **) access_control_list,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+			 "%s: unable to free access control list.",
+			 function );
+
+			goto on_error;
+		}
+	}
+	*access_control_list = safe_access_control_list;
+
+	return( 1 );
+
+on_error:
+	if( safe_access_control_list != NULL )
+	{
+		libfwnt_internal_access_control_list_free(
+		 (libfwnt_internal_access_control_list_t **) &safe_access_control_list,
+		 NULL );
+	}
+	if( acl_data != NULL )
+	{
+		memory_free(
+		 acl_data );
+	}
+	return( -1 );
+}
+
+/* Sets the owner security identifier
+ * The security identifier (SID) is copied, NULL removes the owner security identifier from the descriptor
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_security_descriptor_set_owner(
+     libfwnt_security_descriptor_t *security_descriptor,
+     libfwnt_security_identifier_t *security_identifier,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
+	static char *function                                                = "libfwnt_security_descriptor_set_owner";
+
+	if( security_descriptor == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( -1 );
+	}
+	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
+
+	if( libfwnt_internal_security_descriptor_replace_security_identifier(
+	     internal_security_descriptor,
+	     &( internal_security_descriptor->owner_sid ),
+	     security_identifier,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to set owner security identifier.",
+		 function );
+
+		return( -1 );
+	}
+	return( 1 );
+}
+
+/* Sets the group security identifier
+ * The security identifier (SID) is copied, NULL removes the group security identifier from the descriptor
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_security_descriptor_set_group(
+     libfwnt_security_descriptor_t *security_descriptor,
+     libfwnt_security_identifier_t *security_identifier,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
+	static char *function                                                = "libfwnt_security_descriptor_set_group";
+
+	if( security_descriptor == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( -1 );
+	}
+	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
+
+	if( libfwnt_internal_security_descriptor_replace_security_identifier(
+	     internal_security_descriptor,
+	     &( internal_security_descriptor->group_sid ),
+	     security_identifier,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to set group security identifier.",
+		 function );
+
+		return( -1 );
+	}
+	return( 1 );
+}
+
+/* Sets the discretionary ACL
+ * The ACL is copied, NULL removes the discretionary ACL from the descriptor
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_security_descriptor_set_discretionary_acl(
+     libfwnt_security_descriptor_t *security_descriptor,
+     libfwnt_access_control_list_t *access_control_list,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
+	static char *function                                                = "libfwnt_security_descriptor_set_discretionary_acl";
+
+	if( security_descriptor == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( -1 );
+	}
+	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
+
+	if( libfwnt_internal_security_descriptor_replace_access_control_list(
+	     internal_security_descriptor,
+	     &( internal_security_descriptor->discretionary_acl ),
+	     access_control_list,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to set discretionary ACL.",
+		 function );
+
+		return( -1 );
+	}
+	if( access_control_list != NULL )
+	{
+		internal_security_descriptor->control_flags |= LIBFWNT_CONTROL_FLAG_DACL_PRESENT;
+	}
+	else
+	{
+		internal_security_descriptor->control_flags &= ~( LIBFWNT_CONTROL_FLAG_DACL_PRESENT );
+	}
+	return( 1 );
+}
+
+/* Sets the system ACL
+ * The ACL is copied, NULL removes the system ACL from the descriptor
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_security_descriptor_set_system_acl(
+     libfwnt_security_descriptor_t *security_descriptor,
+     libfwnt_access_control_list_t *access_control_list,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_security_descriptor_t *internal_security_descriptor = NULL;
+	static char *function                                                = "libfwnt_security_descriptor_set_system_acl";
+
+	if( security_descriptor == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( -1 );
+	}
+	internal_security_descriptor = (libfwnt_internal_security_descriptor_t *) security_descriptor;
+
+	if( libfwnt_internal_security_descriptor_replace_access_control_list(
+	     internal_security_descriptor,
+	     &( internal_security_descriptor->system_acl ),
+	     access_control_list,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to set system ACL.",
+		 function );
+
+		return( -1 );
+	}
+	if( access_control_list != NULL )
+	{
+		internal_security_descriptor->control_flags |= LIBFWNT_CONTROL_FLAG_SACL_PRESENT;
+	}
+	else
+	{
+		internal_security_descriptor->control_flags &= ~( LIBFWNT_CONTROL_FLAG_SACL_PRESENT );
+	}
 	return( 1 );
 }
 
@@ -25,8 +25,10 @@
 #include <common.h>
 #include <types.h>
 
+#include "libfwnt_access_control_list.h"
 #include "libfwnt_extern.h"
 #include "libfwnt_libcerror.h"
+#include "libfwnt_security_identifier.h"
 #include "libfwnt_types.h"
 
 #if defined( __cplusplus )
@@ -49,6 +51,10 @@ struct libfwnt_internal_security_descriptor
 	 */
 	uint8_t revision_number;
 
+	/* The control flags
+	 */
+	uint16_t control_flags;
+
 	/* The owner SID
 	 */
 	libfwnt_security_identifier_t *owner_sid;
@@ -64,6 +70,30 @@ struct libfwnt_internal_security_descriptor
 	/* The system ACL
 	 */
 	libfwnt_access_control_list_t *system_acl;
+
+	/* The managed copy of the byte stream
+	 */
+	uint8_t *managed_byte_stream;
+
+	/* The owner SID value, used when the descriptor is parsed on demand
+	 */
+	libfwnt_internal_security_identifier_t owner_sid_value;
+
+	/* The group SID value, used when the descriptor is parsed on demand
+	 */
+	libfwnt_internal_security_identifier_t group_sid_value;
+
+	/* The discretionary ACL value, used when the descriptor is parsed on demand
+	 */
+	libfwnt_internal_access_control_list_t discretionary_acl_value;
+
+	/* The system ACL value, used when the descriptor is parsed on demand
+	 */
+	libfwnt_internal_access_control_list_t system_acl_value;
+
+	/* Value to indicate if the descriptor is parsed on demand
+	 */
+	uint8_t is_lazy;
 };
 
 LIBFWNT_EXTERN \
@@ -84,6 +114,37 @@ int libfwnt_security_descriptor_copy_from_byte_stream(
      int byte_order,
      libcerror_error_t **error );
 
+int libfwnt_internal_security_descriptor_clear_byte_stream(
+     libfwnt_internal_security_descriptor_t *internal_security_descriptor,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_security_descriptor_set_byte_stream(
+     libfwnt_security_descriptor_t *security_descriptor,
+     const uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     uint8_t flags,
+     libcerror_error_t **error );
+
+int libfwnt_internal_security_descriptor_read_byte_stream(
+     libfwnt_internal_security_descriptor_t *internal_security_descriptor,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_security_descriptor_get_byte_stream_size(
+     libfwnt_security_descriptor_t *security_descriptor,
+     size_t *byte_stream_size,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_security_descriptor_copy_to_byte_stream(
+     libfwnt_security_descriptor_t *security_descriptor,
+     uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     libcerror_error_t **error );
+
 LIBFWNT_EXTERN \
 int libfwnt_security_descriptor_get_owner(
      libfwnt_security_descriptor_t *security_descriptor,
@@ -108,6 +169,54 @@ int libfwnt_security_descriptor_get_system_acl(
      libfwnt_access_control_list_t **access_control_list,
      libcerror_error_t **error );
 
+LIBFWNT_EXTERN \
+int libfwnt_security_descriptor_get_control_flags(
+     libfwnt_security_descriptor_t *security_descriptor,
+     uint16_t *control_flags,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_security_descriptor_set_control_flags(
+     libfwnt_security_descriptor_t *security_descriptor,
+     uint16_t control_flags,
+     libcerror_error_t **error );
+
+int libfwnt_internal_security_descriptor_replace_security_identifier(
+     libfwnt_internal_security_descriptor_t *internal_security_descriptor,
+     libfwnt_security_identifier_t **security_identifier,
+     libfwnt_security_identifier_t *source_security_identifier,
+     libcerror_error_t **error );
+
+int libfwnt_internal_security_descriptor_replace_access_control_list(
+     libfwnt_internal_security_descriptor_t *internal_security_descriptor,
+     libfwnt_access_control_list_t **access_control_list,
+     libfwnt_access_control_list_t *source_access_control_list,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_security_descriptor_set_owner(
+     libfwnt_security_descriptor_t *security_descriptor,
+     libfwnt_security_identifier_t *security_identifier,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_security_descriptor_set_group(
+     libfwnt_security_descriptor_t *security_descriptor,
+     libfwnt_security_identifier_t *security_identifier,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_security_descriptor_set_discretionary_acl(
+     libfwnt_security_descriptor_t *security_descriptor,
+     libfwnt_access_control_list_t *access_control_list,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_security_descriptor_set_system_acl(
+     libfwnt_security_descriptor_t *security_descriptor,
+     libfwnt_access_control_list_t *access_control_list,
+     libcerror_error_t **error );
+
 #if defined( __cplusplus )
 }
 #endif
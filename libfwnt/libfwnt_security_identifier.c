@@ -27,6 +27,7 @@
 #include "libfwnt_definitions.h"
 #include "libfwnt_libcerror.h"
 #include "libfwnt_security_identifier.h"
+#include "libfwnt_statistics.h"
 #include "libfwnt_types.h"
 
 /* Creates a security identifier
@@ -193,7 +194,9 @@ int libfwnt_security_identifier_copy_from_byte_stream(
 	libfwnt_internal_security_identifier_t *internal_security_identifier = NULL;
 	static char *function                                                = "libfwnt_security_identifier_copy_from_byte_stream";
 	size_t security_identifier_size                                      = 0;
+	uint64_t statistics_start_time                                       = 0;
 	uint8_t sub_authority_index                                          = 0;
+	int statistics_enabled                                               = 0;
 
 	if( security_identifier == NULL )
 	{
@@ -208,6 +211,12 @@ int libfwnt_security_identifier_copy_from_byte_stream(
 	}
 	internal_security_identifier = (libfwnt_internal_security_identifier_t *) security_identifier;
 
+	statistics_enabled = libfwnt_statistics_enabled;
+
+	if( statistics_enabled != 0 )
+	{
+		statistics_start_time = libfwnt_statistics_get_time();
+	}
 	if( byte_stream == NULL )
 	{
 		libcerror_error_set(
@@ -299,9 +308,267 @@ int libfwnt_security_identifier_copy_from_byte_stream(
 
 		byte_stream += 4;
 	}
+	if( statistics_enabled != 0 )
+	{
+		libfwnt_statistics_update(
+		 LIBFWNT_STATISTICS_FUNCTION_SECURITY_IDENTIFIER_COPY_FROM_BYTE_STREAM,
+		 statistics_start_time,
+		 security_identifier_size,
+		 0 );
+	}
+	return( 1 );
+}
+
+/* Retrieves the size of the security identifier stored in a byte stream
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_security_identifier_get_size(
+     libfwnt_security_identifier_t *security_identifier,
+     size_t *size,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_security_identifier_t *internal_security_identifier = NULL;
+	static char *function                                                = "libfwnt_security_identifier_get_size";
+
+	if( security_identifier == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security identifier.",
+		 function );
+
+		return( -1 );
+	}
+	internal_security_identifier = (libfwnt_internal_security_identifier_t *) security_identifier;
+
+	if( size == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid size.",
+		 function );
+
+		return( -1 );
+	}
+	*size = 8 + ( (size_t) internal_security_identifier->number_of_sub_authorities * 4 );
+
+	return( 1 );
+}
+
+/* Converts a security identifier into a byte stream
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_security_identifier_copy_to_byte_stream(
+     libfwnt_security_identifier_t *security_identifier,
+     uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_security_identifier_t *internal_security_identifier = NULL;
+	static char *function                                                = "libfwnt_security_identifier_copy_to_byte_stream";
+	size_t security_identifier_size                                      = 0;
+	uint8_t sub_authority_index                                          = 0;
+
+	if( security_identifier == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid security identifier.",
+		 function );
+
+		return( -1 );
+	}
+	internal_security_identifier = (libfwnt_internal_security_identifier_t *) security_identifier;
+
+	if( byte_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid byte stream.",
+		 function );
+
+		return( -1 );
+	}
+	if( byte_stream_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: byte stream size exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( byte_order != LIBFWNT_ENDIAN_LITTLE )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported byte order.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_security_identifier->number_of_sub_authorities > 15 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported security identifier contains more than 15 sub authoritites.",
+		 function );
+
+		return( -1 );
+	}
+	security_identifier_size = 8 + ( internal_security_identifier->number_of_sub_authorities * 4 );
+
+	if( byte_stream_size < security_identifier_size )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+		 "%s: byte stream too small.",
+		 function );
+
+		return( -1 );
+	}
+	byte_stream[ 0 ] = internal_security_identifier->revision_number;
+	byte_stream[ 1 ] = internal_security_identifier->number_of_sub_authorities;
+
+	byte_stream += 2;
+
+	/* The authority is stored as a 48-bit value
+	 */
+	byte_stream_copy_from_uint48_big_endian(
+	 byte_stream,
+	 internal_security_identifier->authority );
+
+	byte_stream += 6;
+
+	for( sub_authority_index = 0;
+	     sub_authority_index < internal_security_identifier->number_of_sub_authorities;
+	     sub_authority_index++ )
+	{
+		byte_stream_copy_from_uint32_little_endian(
+		 byte_stream,
+		 internal_security_identifier->sub_authority[ sub_authority_index ] );
+
+		byte_stream += 4;
+	}
 	return( 1 );
 }
 
+/* Compares two security identifiers
+ * The revision number is compared first, then the authority and then the sub authorities in order,
+ * where a security identifier that is a prefix of the other is considered less
+ * Returns LIBFWNT_COMPARE_LESS, LIBFWNT_COMPARE_EQUAL, LIBFWNT_COMPARE_GREATER if successful or -1 on error
+ */
+int libfwnt_security_identifier_compare(
+     libfwnt_security_identifier_t *first_security_identifier,
+     libfwnt_security_identifier_t *second_security_identifier,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_security_identifier_t *first_internal_security_identifier  = NULL;
+	libfwnt_internal_security_identifier_t *second_internal_security_identifier = NULL;
+	static char *function                                                       = "libfwnt_security_identifier_compare";
+	uint8_t number_of_sub_authorities                                           = 0;
+	uint8_t sub_authority_index                                                 = 0;
+
+	if( first_security_identifier == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid first security identifier.",
+		 function );
+
+		return( -1 );
+	}
+	first_internal_security_identifier = (libfwnt_internal_security_identifier_t *) first_security_identifier;
+
+	if( second_security_identifier == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid second security identifier.",
+		 function );
+
+		return( -1 );
+	}
+	second_internal_security_identifier = (libfwnt_internal_security_identifier_t *) second_security_identifier;
+
+	if( first_internal_security_identifier->revision_number < second_internal_security_identifier->revision_number )
+	{
+		return( LIBFWNT_COMPARE_LESS );
+	}
+	else if( first_internal_security_identifier->revision_number > second_internal_security_identifier->revision_number )
+	{
+		return( LIBFWNT_COMPARE_GREATER );
+	}
+	if( first_internal_security_identifier->authority < second_internal_security_identifier->authority )
+	{
+		return( LIBFWNT_COMPARE_LESS );
+	}
+	else if( first_internal_security_identifier->authority > second_internal_security_identifier->authority )
+	{
+		return( LIBFWNT_COMPARE_GREATER );
+	}
+	number_of_sub_authorities = first_internal_security_identifier->number_of_sub_authorities;
+
+	if( number_of_sub_authorities > second_internal_security_identifier->number_of_sub_authorities )
+	{
+		number_of_sub_authorities = second_internal_security_identifier->number_of_sub_authorities;
+	}
+	if( number_of_sub_authorities > 15 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported security identifier contains more than 15 sub authoritites.",
+		 function );
+
+		return( -1 );
+	}
+	for( sub_authority_index = 0;
+	     sub_authority_index < number_of_sub_authorities;
+	     sub_authority_index++ )
+	{
+		if( first_internal_security_identifier->sub_authority[ sub_authority_index ] < second_internal_security_identifier->sub_authority[ sub_authority_index ] )
+		{
+			return( LIBFWNT_COMPARE_LESS );
+		}
+		else if( first_internal_security_identifier->sub_authority[ sub_authority_index ] > second_internal_security_identifier->sub_authority[ sub_authority_index ] )
+		{
+			return( LIBFWNT_COMPARE_GREATER );
+		}
+	}
+	if( first_internal_security_identifier->number_of_sub_authorities < second_internal_security_identifier->number_of_sub_authorities )
+	{
+		return( LIBFWNT_COMPARE_LESS );
+	}
+	else if( first_internal_security_identifier->number_of_sub_authorities > second_internal_security_identifier->number_of_sub_authorities )
+	{
+		return( LIBFWNT_COMPARE_GREATER );
+	}
+	return( LIBFWNT_COMPARE_EQUAL );
+}
+
 /* Deterimes the size of the string for the security identifier
  * The string size includes the end of string character
  * Returns 1 if successful or -1 on error
@@ -452,7 +719,9 @@ int libfwnt_security_identifier_copy_to_utf8_string_with_index(
 	size_t value_string_index                                            = 0;
 	size_t value_string_length                                           = 0;
 	uint64_t value_64bit                                                 = 0;
+	uint64_t statistics_start_time                                       = 0;
 	uint8_t sub_authority_index                                          = 0;
+	int statistics_enabled                                               = 0;
 
 	if( security_identifier == NULL )
 	{
@@ -467,6 +736,12 @@ int libfwnt_security_identifier_copy_to_utf8_string_with_index(
 	}
 	internal_security_identifier = (libfwnt_internal_security_identifier_t *) security_identifier;
 
+	statistics_enabled = libfwnt_statistics_enabled;
+
+	if( statistics_enabled != 0 )
+	{
+		statistics_start_time = libfwnt_statistics_get_time();
+	}
 	if( utf8_string == NULL )
 	{
 		libcerror_error_set(
@@ -653,6 +928,14 @@ int libfwnt_security_identifier_copy_to_utf8_string_with_index(
 	}
 	utf8_string[ string_index++ ] = 0;
 
+	if( statistics_enabled != 0 )
+	{
+		libfwnt_statistics_update(
+		 LIBFWNT_STATISTICS_FUNCTION_SECURITY_IDENTIFIER_COPY_TO_STRING,
+		 statistics_start_time,
+		 8 + ( (size_t) internal_security_identifier->number_of_sub_authorities * 4 ),
+		 ( string_index - *utf8_string_index ) * sizeof( uint8_t ) );
+	}
 	*utf8_string_index = string_index;
 
 	return( 1 );
@@ -710,7 +993,9 @@ int libfwnt_security_identifier_copy_to_utf16_string_with_index(
 	size_t value_string_index                                            = 0;
 	size_t value_string_length                                           = 0;
 	uint64_t value_64bit                                                 = 0;
+	uint64_t statistics_start_time                                       = 0;
 	uint8_t sub_authority_index                                          = 0;
+	int statistics_enabled                                               = 0;
 
 	if( security_identifier == NULL )
 	{
@@ -725,6 +1010,12 @@ int libfwnt_security_identifier_copy_to_utf16_string_with_index(
 	}
 	internal_security_identifier = (libfwnt_internal_security_identifier_t *) security_identifier;
 
+	statistics_enabled = libfwnt_statistics_enabled;
+
+	if( statistics_enabled != 0 )
+	{
+		statistics_start_time = libfwnt_statistics_get_time();
+	}
 	if( utf16_string == NULL )
 	{
 		libcerror_error_set(
@@ -911,6 +1202,14 @@ int libfwnt_security_identifier_copy_to_utf16_string_with_index(
 	}
 	utf16_string[ string_index++ ] = 0;
 
+	if( statistics_enabled != 0 )
+	{
+		libfwnt_statistics_update(
+		 LIBFWNT_STATISTICS_FUNCTION_SECURITY_IDENTIFIER_COPY_TO_STRING,
+		 statistics_start_time,
+		 8 + ( (size_t) internal_security_identifier->number_of_sub_authorities * 4 ),
+		 ( string_index - *utf16_string_index ) * sizeof( uint16_t ) );
+	}
 	*utf16_string_index = string_index;
 
 	return( 1 );
@@ -968,7 +1267,9 @@ int libfwnt_security_identifier_copy_to_utf32_string_with_index(
 	size_t value_string_index                                            = 0;
 	size_t value_string_length                                           = 0;
 	uint64_t value_64bit                                                 = 0;
+	uint64_t statistics_start_time                                       = 0;
 	uint8_t sub_authority_index                                          = 0;
+	int statistics_enabled                                               = 0;
 
 	if( security_identifier == NULL )
 	{
@@ -983,6 +1284,12 @@ int libfwnt_security_identifier_copy_to_utf32_string_with_index(
 	}
 	internal_security_identifier = (libfwnt_internal_security_identifier_t *) security_identifier;
 
+	statistics_enabled = libfwnt_statistics_enabled;
+
+	if( statistics_enabled != 0 )
+	{
+		statistics_start_time = libfwnt_statistics_get_time();
+	}
 	if( utf32_string == NULL )
 	{
 		libcerror_error_set(
@@ -1169,6 +1476,14 @@ int libfwnt_security_identifier_copy_to_utf32_string_with_index(
 	}
 	utf32_string[ string_index++ ] = 0;
 
+	if( statistics_enabled != 0 )
+	{
+		libfwnt_statistics_update(
+		 LIBFWNT_STATISTICS_FUNCTION_SECURITY_IDENTIFIER_COPY_TO_STRING,
+		 statistics_start_time,
+		 8 + ( (size_t) internal_security_identifier->number_of_sub_authorities * 4 ),
+		 ( string_index - *utf32_string_index ) * sizeof( uint32_t ) );
+	}
 	*utf32_string_index = string_index;
 
 	return( 1 );
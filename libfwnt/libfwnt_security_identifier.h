@@ -100,6 +100,26 @@ int libfwnt_security_identifier_copy_from_byte_stream(
      int byte_order,
      libcerror_error_t **error );
 
+LIBFWNT_EXTERN \
+int libfwnt_security_identifier_get_size(
+     libfwnt_security_identifier_t *security_identifier,
+     size_t *size,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_security_identifier_copy_to_byte_stream(
+     libfwnt_security_identifier_t *security_identifier,
+     uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_security_identifier_compare(
+     libfwnt_security_identifier_t *first_security_identifier,
+     libfwnt_security_identifier_t *second_security_identifier,
+     libcerror_error_t **error );
+
 LIBFWNT_EXTERN \
 int libfwnt_security_identifier_get_string_size(
      libfwnt_security_identifier_t *security_identifier,
@@ -0,0 +1,279 @@
+/*
+ * Statistics functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+
+#include <common.h>
+#include <memory.h>
+#include <types.h>
+
+#if defined( WINAPI ) || defined( _MSC_VER )
+#include <windows.h>
+#endif
+
+#if defined( HAVE_TIME_H ) && !defined( WINAPI )
+#include <time.h>
+#endif
+
+#include "libfwnt_definitions.h"
+#include "libfwnt_libcerror.h"
+#include "libfwnt_statistics.h"
+
+/* The statistics are maintained per function in a global table that is updated with
+ * atomic additions, so the library can be used from multiple threads. The statistics
+ * are disabled by default in which case an instrumented function only tests
+ * libfwnt_statistics_enabled, hence they can be toggled at runtime in production.
+ *
+ * Compilers without atomic additions fall back to a plain addition, which is only
+ * safe when the statistics are updated from a single thread. A lock is not used
+ * since the library has no initialization function to create it before the first
+ * update. Concurrent updates can lose additions, so the statistics can undercount.
+ */
+#if defined( _MSC_VER )
+#define libfwnt_statistics_add( value, addend ) \
+	InterlockedExchangeAdd64( (volatile LONG64 *) &( value ), (LONG64) ( addend ) )
+
+#elif defined( __GNUC__ ) || defined( __clang__ )
+#define libfwnt_statistics_add( value, addend ) \
+	__sync_fetch_and_add( &( value ), (uint64_t) ( addend ) )
+
+#else
+#define libfwnt_statistics_add( value, addend ) \
+	value += (uint64_t) ( addend )
+
+#endif
+
+int libfwnt_statistics_enabled = 0;
+
+libfwnt_statistics_values_t libfwnt_statistics_values_table[ LIBFWNT_STATISTICS_NUMBER_OF_FUNCTIONS ];
+
+/* Retrieves the value of a monotonic clock in nanoseconds
+ * Returns the time or 0 if no monotonic clock is available
+ */
+uint64_t libfwnt_statistics_get_time(
+          void )
+{
+#if defined( WINAPI )
+	LARGE_INTEGER counter;
+	LARGE_INTEGER frequency;
+
+	if( ( QueryPerformanceCounter(
+	       &counter ) == 0 )
+	 || ( QueryPerformanceFrequency(
+	       &frequency ) == 0 )
+	 || ( frequency.QuadPart <= 0 ) )
+	{
+		return( 0 );
+	}
+	/* Split the conversion to prevent the multiplication from overflowing
+	 */
+	return( ( (uint64_t) ( counter.QuadPart / frequency.QuadPart ) * 1000000000UL )
+	      + ( (uint64_t) ( counter.QuadPart % frequency.QuadPart ) * 1000000000UL / (uint64_t) frequency.QuadPart ) );
+
+#elif defined( HAVE_CLOCK_GETTIME ) && defined( CLOCK_MONOTONIC )
+	struct timespec time_value;
+
+	if( clock_gettime(
+	     CLOCK_MONOTONIC,
+	     &time_value ) != 0 )
+	{
+		return( 0 );
+	}
+	return( ( (uint64_t) time_value.tv_sec * 1000000000UL ) + (uint64_t) time_value.tv_nsec );
+
+#else
+	return( 0 );
+
+#endif
+}
+
+/* Adds a call of an instrumented function to the statistics
+ * The start time is the value of libfwnt_statistics_get_time when the call started
+ */
+void libfwnt_statistics_update(
+      int function_type,
+      uint64_t start_time,
+      size_t input_size,
+      size_t output_size )
+{
+	libfwnt_statistics_values_t *values = NULL;
+	uint64_t end_time                   = 0;
+
+	if( ( function_type < 0 )
+	 || ( function_type >= LIBFWNT_STATISTICS_NUMBER_OF_FUNCTIONS ) )
+	{
+		return;
+	}
+	values   = &( libfwnt_statistics_values_table[ function_type ] );
+	end_time = libfwnt_statistics_get_time();
+
+	libfwnt_statistics_add(
+	 values->number_of_calls,
+	 1 );
+
+	libfwnt_statistics_add(
+	 values->number_of_input_bytes,
+	 input_size );
+
+	libfwnt_statistics_add(
+	 values->number_of_output_bytes,
+	 output_size );
+
+	if( end_time > start_time )
+	{
+		libfwnt_statistics_add(
+		 values->elapsed_time,
+		 end_time - start_time );
+	}
+}
+
+/* Enables or disables maintaining statistics
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_statistics_set_enabled(
+     int enabled,
+     libcerror_error_t **error )
+{
+	static char *function = "libfwnt_statistics_set_enabled";
+
+	if( ( enabled != 0 )
+	 && ( enabled != 1 ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported enabled value.",
+		 function );
+
+		return( -1 );
+	}
+	libfwnt_statistics_enabled = enabled;
+
+	return( 1 );
+}
+
+/* Retrieves the statistics of a specific function
+ * The elapsed time is in nanoseconds
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_statistics_get_values(
+     int function_type,
+     uint64_t *number_of_calls,
+     uint64_t *number_of_input_bytes,
+     uint64_t *number_of_output_bytes,
+     uint64_t *elapsed_time,
+     libcerror_error_t **error )
+{
+	libfwnt_statistics_values_t *values = NULL;
+	static char *function               = "libfwnt_statistics_get_values";
+
+	if( ( function_type < 0 )
+	 || ( function_type >= LIBFWNT_STATISTICS_NUMBER_OF_FUNCTIONS ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported function type.",
+		 function );
+
+		return( -1 );
+	}
+	if( number_of_calls == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid number of calls.",
+		 function );
+
+		return( -1 );
+	}
+	if( number_of_input_bytes == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid number of input bytes.",
+		 function );
+
+		return( -1 );
+	}
+	if( number_of_output_bytes == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid number of output bytes.",
+		 function );
+
+		return( -1 );
+	}
+	if( elapsed_time == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid elapsed time.",
+		 function );
+
+		return( -1 );
+	}
+	values = &( libfwnt_statistics_values_table[ function_type ] );
+
+	*number_of_calls        = values->number_of_calls;
+	*number_of_input_bytes  = values->number_of_input_bytes;
+	*number_of_output_bytes = values->number_of_output_bytes;
+	*elapsed_time           = values->elapsed_time;
+
+	return( 1 );
+}
+
+/* Resets the statistics of all functions
+ * Calls that are in progress can be recorded partially
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_statistics_reset(
+     libcerror_error_t **error )
+{
+	static char *function = "libfwnt_statistics_reset";
+
+	if( memory_set(
+	     libfwnt_statistics_values_table,
+	     0,
+	     sizeof( libfwnt_statistics_values_t ) * LIBFWNT_STATISTICS_NUMBER_OF_FUNCTIONS ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+		 "%s: unable to clear statistics.",
+		 function );
+
+		return( -1 );
+	}
+	return( 1 );
+}
+
@@ -0,0 +1,95 @@
+/*
+ * Statistics functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _LIBFWNT_STATISTICS_H )
+#define _LIBFWNT_STATISTICS_H
+
+#include <common.h>
+#include <types.h>
+
+#include "libfwnt_extern.h"
+#include "libfwnt_libcerror.h"
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+#define LIBFWNT_STATISTICS_NUMBER_OF_FUNCTIONS	7
+
+typedef struct libfwnt_statistics_values libfwnt_statistics_values_t;
+
+struct libfwnt_statistics_values
+{
+	/* The number of calls
+	 */
+	uint64_t number_of_calls;
+
+	/* The number of input bytes
+	 */
+	uint64_t number_of_input_bytes;
+
+	/* The number of output bytes
+	 */
+	uint64_t number_of_output_bytes;
+
+	/* The elapsed time in nanoseconds
+	 */
+	uint64_t elapsed_time;
+};
+
+/* Value to indicate if statistics are maintained, the value is read
+ * without synchronization since the statistics are a best effort
+ */
+extern int libfwnt_statistics_enabled;
+
+uint64_t libfwnt_statistics_get_time(
+          void );
+
+void libfwnt_statistics_update(
+      int function_type,
+      uint64_t start_time,
+      size_t input_size,
+      size_t output_size );
+
+LIBFWNT_EXTERN \
+int libfwnt_statistics_set_enabled(
+     int enabled,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_statistics_get_values(
+     int function_type,
+     uint64_t *number_of_calls,
+     uint64_t *number_of_input_bytes,
+     uint64_t *number_of_output_bytes,
+     uint64_t *elapsed_time,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_statistics_reset(
+     libcerror_error_t **error );
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _LIBFWNT_STATISTICS_H ) */
+
@@ -36,14 +36,20 @@
 #if defined( HAVE_DEBUG_OUTPUT ) && !defined( WINAPI )
 typedef struct libfwnt_access_control_entry {}	libfwnt_access_control_entry_t;
 typedef struct libfwnt_access_control_list {}	libfwnt_access_control_list_t;
+typedef struct libfwnt_compressed_attribute {}	libfwnt_compressed_attribute_t;
+typedef struct libfwnt_lzxpress_huffman_decoder {}	libfwnt_lzxpress_huffman_decoder_t;
 typedef struct libfwnt_security_descriptor {}	libfwnt_security_descriptor_t;
 typedef struct libfwnt_security_identifier {}	libfwnt_security_identifier_t;
+typedef struct libfwnt_wof_stream {}		libfwnt_wof_stream_t;
 
 #else
 typedef intptr_t libfwnt_access_control_entry_t;
 typedef intptr_t libfwnt_access_control_list_t;
+typedef intptr_t libfwnt_compressed_attribute_t;
+typedef intptr_t libfwnt_lzxpress_huffman_decoder_t;
 typedef intptr_t libfwnt_security_descriptor_t;
 typedef intptr_t libfwnt_security_identifier_t;
+typedef intptr_t libfwnt_wof_stream_t;
 
 #endif /* defined( HAVE_DEBUG_OUTPUT ) && !defined( WINAPI ) */
 
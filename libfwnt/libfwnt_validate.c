@@ -0,0 +1,627 @@
+/*
+ * Validation functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <byte_stream.h>
+#include <types.h>
+
+#include "libfwnt_definitions.h"
+#include "libfwnt_libcerror.h"
+#include "libfwnt_validate.h"
+
+/* The validation functions check the layout of untrusted data in a single pass
+ * without allocating memory. They are stricter than the parsing functions and
+ * follow the rules of RtlValidRelativeSecurityDescriptor and RtlValidAcl, hence
+ * data that validates can be parsed, but not all data that can be parsed validates.
+ */
+
+/* Validates a security identifier (SID) at a specific offset in the data
+ * The SID must fit within data_size
+ * Returns 1 if valid or 0 if not
+ */
+int libfwnt_validate_security_identifier_data(
+     const uint8_t *data,
+     size_t data_size,
+     size_t data_offset,
+     size_t *security_identifier_size,
+     int *validation_error,
+     size_t *validation_error_offset )
+{
+	size_t safe_security_identifier_size = 0;
+
+	*validation_error_offset = data_offset;
+
+	if( ( data_offset > data_size )
+	 || ( ( data_size - data_offset ) < 8 ) )
+	{
+		*validation_error = LIBFWNT_VALIDATION_ERROR_SID_OUT_OF_BOUNDS;
+
+		return( 0 );
+	}
+	if( data[ data_offset ] != 1 )
+	{
+		*validation_error = LIBFWNT_VALIDATION_ERROR_UNSUPPORTED_SID_REVISION;
+
+		return( 0 );
+	}
+	if( data[ data_offset + 1 ] > 15 )
+	{
+		*validation_error = LIBFWNT_VALIDATION_ERROR_TOO_MANY_SUB_AUTHORITIES;
+
+		return( 0 );
+	}
+	safe_security_identifier_size = 8 + ( 4 * (size_t) data[ data_offset + 1 ] );
+
+	if( safe_security_identifier_size > ( data_size - data_offset ) )
+	{
+		*validation_error = LIBFWNT_VALIDATION_ERROR_SID_OUT_OF_BOUNDS;
+
+		return( 0 );
+	}
+	*security_identifier_size = safe_security_identifier_size;
+
+	return( 1 );
+}
+
+/* Validates an access control entry (ACE) at a specific offset in the data
+ * The ACE must fit within data_size, which is the end of the containing ACL
+ * Returns 1 if valid or 0 if not
+ */
+int libfwnt_validate_access_control_entry_data(
+     const uint8_t *data,
+     size_t data_size,
+     size_t data_offset,
+     size_t *access_control_entry_size,
+     int *validation_error,
+     size_t *validation_error_offset )
+{
+	size_t data_end                 = 0;
+	size_t security_identifier_size = 0;
+	size_t sid_offset               = 0;
+	uint32_t object_flags           = 0;
+	uint16_t entry_size             = 0;
+
+	*validation_error_offset = data_offset;
+
+	if( ( data_offset > data_size )
+	 || ( ( data_size - data_offset ) < 4 ) )
+	{
+		*validation_error = LIBFWNT_VALIDATION_ERROR_ACE_SIZE_OUT_OF_BOUNDS;
+
+		return( 0 );
+	}
+	byte_stream_copy_to_uint16_little_endian(
+	 &( data[ data_offset + 2 ] ),
+	 entry_size );
+
+	if( ( entry_size < 4 )
+	 || ( (size_t) entry_size > ( data_size - data_offset ) ) )
+	{
+		*validation_error = LIBFWNT_VALIDATION_ERROR_ACE_SIZE_OUT_OF_BOUNDS;
+
+		return( 0 );
+	}
+	if( ( entry_size % 4 ) != 0 )
+	{
+		*validation_error = LIBFWNT_VALIDATION_ERROR_ACE_SIZE_NOT_ALIGNED;
+
+		return( 0 );
+	}
+	data_end = data_offset + entry_size;
+
+	switch( data[ data_offset ] )
+	{
+		/* Basic and basic callback types contain an access mask followed by the SID
+		 */
+		case LIBFWNT_ACCESS_ALLOWED:
+		case LIBFWNT_ACCESS_DENIED:
+		case LIBFWNT_SYSTEM_AUDIT:
+		case LIBFWNT_SYSTEM_ALARM:
+		case LIBFWNT_SYSTEM_MANDATORY_LABEL:
+		case LIBFWNT_ACCESS_ALLOWED_CALLBACK:
+		case LIBFWNT_ACCESS_DENIED_CALLBACK:
+		case LIBFWNT_SYSTEM_AUDIT_CALLBACK:
+		case LIBFWNT_SYSTEM_ALARM_CALLBACK:
+			if( entry_size < 8 )
+			{
+				*validation_error = LIBFWNT_VALIDATION_ERROR_ACE_DATA_OUT_OF_BOUNDS;
+
+				return( 0 );
+			}
+			sid_offset = 8;
+
+			break;
+
+		/* Object and object callback types contain an access mask, object flags
+		 * and the object types indicated by the flags followed by the SID
+		 */
+		case LIBFWNT_ACCESS_ALLOWED_OBJECT:
+		case LIBFWNT_ACCESS_DENIED_OBJECT:
+		case LIBFWNT_SYSTEM_AUDIT_OBJECT:
+		case LIBFWNT_SYSTEM_ALARM_OBJECT:
+		case LIBFWNT_ACCESS_ALLOWED_CALLBACK_OBJECT:
+		case LIBFWNT_ACCESS_DENIED_CALLBACK_OBJECT:
+		case LIBFWNT_SYSTEM_AUDIT_CALLBACK_OBJECT:
+		case LIBFWNT_SYSTEM_ALARM_CALLBACK_OBJECT:
+			if( entry_size < 12 )
+			{
+				*validation_error = LIBFWNT_VALIDATION_ERROR_ACE_DATA_OUT_OF_BOUNDS;
+
+				return( 0 );
+			}
+			byte_stream_copy_to_uint32_little_endian(
+			 &( data[ data_offset + 8 ] ),
+			 object_flags );
+
+			sid_offset = 12;
+
+			if( ( object_flags & LIBFWNT_OBJECT_FLAG_OBJECT_TYPE_PRESENT ) != 0 )
+			{
+				sid_offset += 16;
+			}
+			if( ( object_flags & LIBFWNT_OBJECT_FLAG_INHERITED_OBJECT_TYPE_PRESENT ) != 0 )
+			{
+				sid_offset += 16;
+			}
+			if( sid_offset > (size_t) entry_size )
+			{
+				*validation_error = LIBFWNT_VALIDATION_ERROR_ACE_DATA_OUT_OF_BOUNDS;
+
+				return( 0 );
+			}
+			break;
+
+		/* The layout of other types is not known, only their size is validated
+		 */
+		default:
+			break;
+	}
+	if( sid_offset > 0 )
+	{
+		if( libfwnt_validate_security_identifier_data(
+		     data,
+		     data_end,
+		     data_offset + sid_offset,
+		     &security_identifier_size,
+		     validation_error,
+		     validation_error_offset ) != 1 )
+		{
+			return( 0 );
+		}
+	}
+	*access_control_entry_size = (size_t) entry_size;
+
+	return( 1 );
+}
+
+/* Validates an access control list (ACL) and its entries at a specific offset in the data
+ * The ACL must fit within data_size
+ * Returns 1 if valid or 0 if not
+ */
+int libfwnt_validate_access_control_list_data(
+     const uint8_t *data,
+     size_t data_size,
+     size_t data_offset,
+     size_t *access_control_list_size,
+     int *validation_error,
+     size_t *validation_error_offset )
+{
+	size_t data_end                  = 0;
+	size_t entry_offset              = 0;
+	size_t access_control_entry_size = 0;
+	uint16_t entry_index             = 0;
+	uint16_t list_size               = 0;
+	uint16_t number_of_entries       = 0;
+
+	*validation_error_offset = data_offset;
+
+	if( ( data_offset > data_size )
+	 || ( ( data_size - data_offset ) < 8 ) )
+	{
+		*validation_error = LIBFWNT_VALIDATION_ERROR_ACL_SIZE_OUT_OF_BOUNDS;
+
+		return( 0 );
+	}
+	/* Revisions 2 (NT4) up to 4 (DS) are supported
+	 */
+	if( ( data[ data_offset ] < 2 )
+	 || ( data[ data_offset ] > 4 ) )
+	{
+		*validation_error = LIBFWNT_VALIDATION_ERROR_UNSUPPORTED_ACL_REVISION;
+
+		return( 0 );
+	}
+	byte_stream_copy_to_uint16_little_endian(
+	 &( data[ data_offset + 2 ] ),
+	 list_size );
+
+	byte_stream_copy_to_uint16_little_endian(
+	 &( data[ data_offset + 4 ] ),
+	 number_of_entries );
+
+	if( ( list_size < 8 )
+	 || ( (size_t) list_size > ( data_size - data_offset ) ) )
+	{
+		*validation_error = LIBFWNT_VALIDATION_ERROR_ACL_SIZE_OUT_OF_BOUNDS;
+
+		return( 0 );
+	}
+	if( ( list_size % 4 ) != 0 )
+	{
+		*validation_error = LIBFWNT_VALIDATION_ERROR_ACL_SIZE_NOT_ALIGNED;
+
+		return( 0 );
+	}
+	data_end     = data_offset + list_size;
+	entry_offset = data_offset + 8;
+
+	for( entry_index = 0;
+	     entry_index < number_of_entries;
+	     entry_index++ )
+	{
+		/* Both the ACL and ACE sizes are 4-byte aligned, hence the ACL is either
+		 * exhausted or large enough to contain an ACE header
+		 */
+		if( entry_offset >= data_end )
+		{
+			*validation_error        = LIBFWNT_VALIDATION_ERROR_ACE_COUNT_OUT_OF_BOUNDS;
+			*validation_error_offset = data_offset + 4;
+
+			return( 0 );
+		}
+		if( libfwnt_validate_access_control_entry_data(
+		     data,
+		     data_end,
+		     entry_offset,
+		     &access_control_entry_size,
+		     validation_error,
+		     validation_error_offset ) != 1 )
+		{
+			return( 0 );
+		}
+		entry_offset += access_control_entry_size;
+	}
+	*access_control_list_size = (size_t) list_size;
+
+	return( 1 );
+}
+
+/* Validates an access control list (ACL) stored in a byte stream
+ * The ACL and all its entries are checked without allocating memory, if the ACL is not valid
+ * validation_error is set to a LIBFWNT_VALIDATION_ERROR value and validation_error_offset
+ * to the offset of the offending structure or value in the byte stream
+ * Returns 1 if valid, 0 if not or -1 on error
+ */
+int libfwnt_validate_access_control_list(
+     const uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     int *validation_error,
+     size_t *validation_error_offset,
+     libcerror_error_t **error )
+{
+	static char *function            = "libfwnt_validate_access_control_list";
+	size_t access_control_list_size = 0;
+
+	if( byte_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid byte stream.",
+		 function );
+
+		return( -1 );
+	}
+	if( byte_stream_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: byte stream size exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( byte_order != LIBFWNT_ENDIAN_LITTLE )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported byte order.",
+		 function );
+
+		return( -1 );
+	}
+	if( validation_error == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid validation error.",
+		 function );
+
+		return( -1 );
+	}
+	if( validation_error_offset == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid validation error offset.",
+		 function );
+
+		return( -1 );
+	}
+	*validation_error        = LIBFWNT_VALIDATION_ERROR_NONE;
+	*validation_error_offset = 0;
+
+	if( byte_stream_size < 8 )
+	{
+		*validation_error = LIBFWNT_VALIDATION_ERROR_DATA_TOO_SMALL;
+
+		return( 0 );
+	}
+	if( libfwnt_validate_access_control_list_data(
+	     byte_stream,
+	     byte_stream_size,
+	     0,
+	     &access_control_list_size,
+	     validation_error,
+	     validation_error_offset ) != 1 )
+	{
+		return( 0 );
+	}
+	*validation_error_offset = 0;
+
+	return( 1 );
+}
+
+/* Validates a self-relative security descriptor stored in data
+ * The header, the owner and group SIDs and the system and discretionary ACLs with all
+ * their entries are checked in a single pass without allocating memory. The components
+ * must be 4-byte aligned and must not partially overlap, although a component can be
+ * referenced more than once. If valid security_descriptor_size is set to the end of the
+ * last component, which is the size of the security descriptor when the data contains
+ * trailing bytes. If not valid validation_error is set to a LIBFWNT_VALIDATION_ERROR
+ * value and validation_error_offset to the offset of the offending structure or value
+ * Returns 1 if valid or 0 if not
+ */
+int libfwnt_validate_security_descriptor_data(
+     const uint8_t *data,
+     size_t data_size,
+     size_t *security_descriptor_size,
+     int *validation_error,
+     size_t *validation_error_offset )
+{
+	size_t component_ends[ 4 ];
+	size_t component_offsets[ 4 ];
+
+	size_t component_offset  = 0;
+	size_t component_size    = 0;
+	size_t descriptor_size   = 20;
+	uint32_t value_32bit     = 0;
+	uint16_t control_flags   = 0;
+	int component_index      = 0;
+	int number_of_components = 0;
+	int other_index          = 0;
+	int result               = 0;
+
+	*validation_error        = LIBFWNT_VALIDATION_ERROR_NONE;
+	*validation_error_offset = 0;
+
+	if( data_size < 20 )
+	{
+		*validation_error = LIBFWNT_VALIDATION_ERROR_DATA_TOO_SMALL;
+
+		return( 0 );
+	}
+	if( data[ 0 ] != 1 )
+	{
+		*validation_error = LIBFWNT_VALIDATION_ERROR_UNSUPPORTED_REVISION;
+
+		return( 0 );
+	}
+	byte_stream_copy_to_uint16_little_endian(
+	 &( data[ 2 ] ),
+	 control_flags );
+
+	if( ( control_flags & LIBFWNT_CONTROL_FLAG_SELF_RELATIVE ) == 0 )
+	{
+		*validation_error        = LIBFWNT_VALIDATION_ERROR_NOT_SELF_RELATIVE;
+		*validation_error_offset = 2;
+
+		return( 0 );
+	}
+	/* The owner SID, group SID, system ACL and discretionary ACL offsets
+	 * are stored consecutively from offset 4
+	 */
+	for( component_index = 0;
+	     component_index < 4;
+	     component_index++ )
+	{
+		byte_stream_copy_to_uint32_little_endian(
+		 &( data[ 4 + ( 4 * component_index ) ] ),
+		 value_32bit );
+
+		if( value_32bit == 0 )
+		{
+			continue;
+		}
+		component_offset = (size_t) value_32bit;
+
+		if( ( component_offset < 20 )
+		 || ( component_offset >= data_size ) )
+		{
+			*validation_error        = LIBFWNT_VALIDATION_ERROR_OFFSET_OUT_OF_BOUNDS;
+			*validation_error_offset = (size_t) ( 4 + ( 4 * component_index ) );
+
+			return( 0 );
+		}
+		if( ( component_offset % 4 ) != 0 )
+		{
+			*validation_error        = LIBFWNT_VALIDATION_ERROR_OFFSET_NOT_ALIGNED;
+			*validation_error_offset = (size_t) ( 4 + ( 4 * component_index ) );
+
+			return( 0 );
+		}
+		if( component_index < 2 )
+		{
+			result = libfwnt_validate_security_identifier_data(
+			          data,
+			          data_size,
+			          component_offset,
+			          &component_size,
+			          validation_error,
+			          validation_error_offset );
+		}
+		else
+		{
+			result = libfwnt_validate_access_control_list_data(
+			          data,
+			          data_size,
+			          component_offset,
+			          &component_size,
+			          validation_error,
+			          validation_error_offset );
+		}
+		if( result != 1 )
+		{
+			return( 0 );
+		}
+		for( other_index = 0;
+		     other_index < number_of_components;
+		     other_index++ )
+		{
+			if( ( component_offset == component_offsets[ other_index ] )
+			 && ( ( component_offset + component_size ) == component_ends[ other_index ] ) )
+			{
+				continue;
+			}
+			if( ( component_offset < component_ends[ other_index ] )
+			 && ( component_offsets[ other_index ] < ( component_offset + component_size ) ) )
+			{
+				*validation_error        = LIBFWNT_VALIDATION_ERROR_OVERLAPPING_COMPONENTS;
+				*validation_error_offset = (size_t) ( 4 + ( 4 * component_index ) );
+
+				return( 0 );
+			}
+		}
+		component_offsets[ number_of_components ] = component_offset;
+		component_ends[ number_of_components ]    = component_offset + component_size;
+
+		if( component_ends[ number_of_components ] > descriptor_size )
+		{
+			descriptor_size = component_ends[ number_of_components ];
+		}
+		number_of_components++;
+	}
+	*validation_error_offset  = 0;
+	*security_descriptor_size = descriptor_size;
+
+	return( 1 );
+}
+
+/* Validates a self-relative security descriptor stored in a byte stream
+ * If the security descriptor is not valid validation_error is set to
+ * a LIBFWNT_VALIDATION_ERROR value and validation_error_offset to the offset
+ * of the offending structure or value in the byte stream
+ * Returns 1 if valid, 0 if not or -1 on error
+ */
+int libfwnt_validate_security_descriptor(
+     const uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     int *validation_error,
+     size_t *validation_error_offset,
+     libcerror_error_t **error )
+{
+	static char *function           = "libfwnt_validate_security_descriptor";
+	size_t security_descriptor_size = 0;
+
+	if( byte_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid byte stream.",
+		 function );
+
+		return( -1 );
+	}
+	if( byte_stream_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: byte stream size exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( byte_order != LIBFWNT_ENDIAN_LITTLE )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported byte order.",
+		 function );
+
+		return( -1 );
+	}
+	if( validation_error == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid validation error.",
+		 function );
+
+		return( -1 );
+	}
+	if( validation_error_offset == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid validation error offset.",
+		 function );
+
+		return( -1 );
+	}
+	return( libfwnt_validate_security_descriptor_data(
+	         byte_stream,
+	         byte_stream_size,
+	         &security_descriptor_size,
+	         validation_error,
+	         validation_error_offset ) );
+}
+
@@ -0,0 +1,89 @@
+/*
+ * Validation functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _LIBFWNT_VALIDATE_H )
+#define _LIBFWNT_VALIDATE_H
+
+#include <common.h>
+#include <types.h>
+
+#include "libfwnt_extern.h"
+#include "libfwnt_libcerror.h"
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+int libfwnt_validate_security_identifier_data(
+     const uint8_t *data,
+     size_t data_size,
+     size_t data_offset,
+     size_t *security_identifier_size,
+     int *validation_error,
+     size_t *validation_error_offset );
+
+int libfwnt_validate_access_control_entry_data(
+     const uint8_t *data,
+     size_t data_size,
+     size_t data_offset,
+     size_t *access_control_entry_size,
+     int *validation_error,
+     size_t *validation_error_offset );
+
+int libfwnt_validate_access_control_list_data(
+     const uint8_t *data,
+     size_t data_size,
+     size_t data_offset,
+     size_t *access_control_list_size,
+     int *validation_error,
+     size_t *validation_error_offset );
+
+int libfwnt_validate_security_descriptor_data(
+     const uint8_t *data,
+     size_t data_size,
+     size_t *security_descriptor_size,
+     int *validation_error,
+     size_t *validation_error_offset );
+
+LIBFWNT_EXTERN \
+int libfwnt_validate_access_control_list(
+     const uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     int *validation_error,
+     size_t *validation_error_offset,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_validate_security_descriptor(
+     const uint8_t *byte_stream,
+     size_t byte_stream_size,
+     int byte_order,
+     int *validation_error,
+     size_t *validation_error_offset,
+     libcerror_error_t **error );
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _LIBFWNT_VALIDATE_H ) */
+
@@ -0,0 +1,1954 @@
+/*
+ * Windows Overlay Filter (WOF) compressed stream functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <byte_stream.h>
+#include <memory.h>
+#include <types.h>
+
+#include "libfwnt_definitions.h"
+#include "libfwnt_libcerror.h"
+#include "libfwnt_lzxpress.h"
+#include "libfwnt_lzxpress_huffman_decoder.h"
+#include "libfwnt_types.h"
+#include "libfwnt_wof_stream.h"
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+#include "libfwnt_libcthreads.h"
+#endif
+
+#define LIBFWNT_WOF_STREAM_DEFAULT_MAXIMUM_NUMBER_OF_CACHED_CHUNKS	16
+#define LIBFWNT_WOF_STREAM_MAXIMUM_NUMBER_OF_CACHED_CHUNKS		1024
+#define LIBFWNT_WOF_STREAM_MAXIMUM_NUMBER_OF_THREADS			64
+
+/* Creates a WOF stream
+ * Make sure the value wof_stream is referencing, is set to NULL
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_wof_stream_initialize(
+     libfwnt_wof_stream_t **wof_stream,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_wof_stream_t *internal_wof_stream = NULL;
+	static char *function                              = "libfwnt_wof_stream_initialize";
+
+	if( wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	if( *wof_stream != NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid WOF stream value already set.",
+		 function );
+
+		return( -1 );
+	}
+	internal_wof_stream = memory_allocate_structure(
+	                       libfwnt_internal_wof_stream_t );
+
+	if( internal_wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+		 "%s: unable to create WOF stream.",
+		 function );
+
+		goto on_error;
+	}
+	if( memory_set(
+	     internal_wof_stream,
+	     0,
+	     sizeof( libfwnt_internal_wof_stream_t ) ) == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+		 "%s: unable to clear WOF stream.",
+		 function );
+
+		memory_free(
+		 internal_wof_stream );
+
+		return( -1 );
+	}
+	internal_wof_stream->maximum_number_of_cached_chunks = LIBFWNT_WOF_STREAM_DEFAULT_MAXIMUM_NUMBER_OF_CACHED_CHUNKS;
+	internal_wof_stream->number_of_threads               = 1;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_initialize(
+	     &( internal_wof_stream->read_write_lock ),
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
+		 "%s: unable to initialize read/write lock.",
+		 function );
+
+		goto on_error;
+	}
+#endif
+	*wof_stream = (libfwnt_wof_stream_t *) internal_wof_stream;
+
+	return( 1 );
+
+on_error:
+	if( internal_wof_stream != NULL )
+	{
+		memory_free(
+		 internal_wof_stream );
+	}
+	return( -1 );
+}
+
+/* Frees a WOF stream
+ * The compressed data is referenced and is not freed
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_wof_stream_free(
+     libfwnt_wof_stream_t **wof_stream,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_wof_stream_t *internal_wof_stream = NULL;
+	static char *function                              = "libfwnt_wof_stream_free";
+	int result                                         = 1;
+
+	if( wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	if( *wof_stream != NULL )
+	{
+		internal_wof_stream = (libfwnt_internal_wof_stream_t *) *wof_stream;
+		*wof_stream         = NULL;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+		if( libcthreads_read_write_lock_free(
+		     &( internal_wof_stream->read_write_lock ),
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+			 "%s: unable to free read/write lock.",
+			 function );
+
+			result = -1;
+		}
+#endif
+		if( libfwnt_internal_wof_stream_free_cache(
+		     internal_wof_stream,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+			 "%s: unable to free cache.",
+			 function );
+
+			result = -1;
+		}
+		if( internal_wof_stream->chunk_offsets != NULL )
+		{
+			memory_free(
+			 internal_wof_stream->chunk_offsets );
+		}
+		if( internal_wof_stream->decoders != NULL )
+		{
+			memory_free(
+			 internal_wof_stream->decoders );
+		}
+		memory_free(
+		 internal_wof_stream );
+	}
+	return( result );
+}
+
+/* Frees the cache entries of a WOF stream
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_wof_stream_free_cache(
+     libfwnt_internal_wof_stream_t *internal_wof_stream,
+     libcerror_error_t **error )
+{
+	static char *function = "libfwnt_internal_wof_stream_free_cache";
+	int entry_index       = 0;
+
+	if( internal_wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_wof_stream->cache_entries != NULL )
+	{
+		for( entry_index = 0;
+		     entry_index < internal_wof_stream->maximum_number_of_cached_chunks;
+		     entry_index++ )
+		{
+			if( internal_wof_stream->cache_entries[ entry_index ].data != NULL )
+			{
+				memory_free(
+				 internal_wof_stream->cache_entries[ entry_index ].data );
+			}
+		}
+		memory_free(
+		 internal_wof_stream->cache_entries );
+
+		internal_wof_stream->cache_entries = NULL;
+	}
+	return( 1 );
+}
+
+/* Sets the compressed data of a WOF stream
+ * The compressed data is the content of the WofCompressedData stream, it is referenced
+ * and must remain available until the WOF stream is freed
+ * The chunk table is read and validated once, chunks are decompressed when read
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_wof_stream_set_compressed_data(
+     libfwnt_wof_stream_t *wof_stream,
+     const uint8_t *compressed_data,
+     size_t compressed_data_size,
+     size64_t uncompressed_data_size,
+     uint32_t compression_method,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_wof_stream_t *internal_wof_stream = NULL;
+	static char *function                              = "libfwnt_wof_stream_set_compressed_data";
+	size64_t number_of_chunks                          = 0;
+	size_t chunk_index                                 = 0;
+	size_t chunk_offset                                = 0;
+	size_t chunk_size                                  = 0;
+	size_t chunk_table_entry_size                      = 0;
+	size_t chunk_table_size                            = 0;
+	size_t last_chunk_size                             = 0;
+	uint64_t chunk_end_offset                          = 0;
+	int result                                         = 1;
+
+	if( wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	internal_wof_stream = (libfwnt_internal_wof_stream_t *) wof_stream;
+
+	if( internal_wof_stream->chunk_offsets != NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_ALREADY_SET,
+		 "%s: invalid WOF stream - compressed data already set.",
+		 function );
+
+		return( -1 );
+	}
+	if( compressed_data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid compressed data.",
+		 function );
+
+		return( -1 );
+	}
+	if( compressed_data_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid compressed data size value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( uncompressed_data_size > (size64_t) INT64_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid uncompressed data size value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	switch( compression_method )
+	{
+		case LIBFWNT_WOF_COMPRESSION_METHOD_XPRESS4K:
+			chunk_size = 4096;
+			break;
+
+		case LIBFWNT_WOF_COMPRESSION_METHOD_XPRESS8K:
+			chunk_size = 8192;
+			break;
+
+		case LIBFWNT_WOF_COMPRESSION_METHOD_XPRESS16K:
+			chunk_size = 16384;
+			break;
+
+		default:
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+			 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+			 "%s: unsupported compression method: %" PRIu32 ".",
+			 function,
+			 compression_method );
+
+			return( -1 );
+	}
+	number_of_chunks = uncompressed_data_size / chunk_size;
+
+	if( ( uncompressed_data_size % chunk_size ) != 0 )
+	{
+		number_of_chunks += 1;
+	}
+	if( uncompressed_data_size > (size64_t) UINT32_MAX )
+	{
+		chunk_table_entry_size = 8;
+	}
+	else
+	{
+		chunk_table_entry_size = 4;
+	}
+	/* Every chunk except the first has an entry in the chunk table
+	 */
+	if( ( number_of_chunks > 1 )
+	 && ( ( number_of_chunks - 1 ) > (size64_t) ( compressed_data_size / chunk_table_entry_size ) ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid compressed data size value too small for chunk table.",
+		 function );
+
+		return( -1 );
+	}
+	if( number_of_chunks > 1 )
+	{
+		chunk_table_size = (size_t) ( number_of_chunks - 1 ) * chunk_table_entry_size;
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_write(
+	     internal_wof_stream->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	/* The number of chunks is bounded by the compressed data size
+	 * hence the chunk offsets can be allocated
+	 */
+	internal_wof_stream->chunk_offsets = (size_t *) memory_allocate(
+	                                                 sizeof( size_t ) * ( (size_t) number_of_chunks + 1 ) );
+
+	if( internal_wof_stream->chunk_offsets == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+		 "%s: unable to create chunk offsets.",
+		 function );
+
+		result = -1;
+	}
+	else
+	{
+		last_chunk_size = (size_t) ( uncompressed_data_size - ( ( number_of_chunks - 1 ) * chunk_size ) );
+
+		internal_wof_stream->chunk_offsets[ 0 ] = chunk_table_size;
+
+		for( chunk_index = 1;
+		     chunk_index <= (size_t) number_of_chunks;
+		     chunk_index++ )
+		{
+			if( chunk_index == (size_t) number_of_chunks )
+			{
+				chunk_end_offset = compressed_data_size - chunk_table_size;
+			}
+			else if( chunk_table_entry_size == 8 )
+			{
+				byte_stream_copy_to_uint64_little_endian(
+				 &( compressed_data[ ( chunk_index - 1 ) * 8 ] ),
+				 chunk_end_offset );
+			}
+			else
+			{
+				byte_stream_copy_to_uint32_little_endian(
+				 &( compressed_data[ ( chunk_index - 1 ) * 4 ] ),
+				 chunk_end_offset );
+			}
+			chunk_offset = internal_wof_stream->chunk_offsets[ chunk_index - 1 ] - chunk_table_size;
+
+			/* A chunk is stored uncompressed if compression did not reduce its size
+			 * hence the stored size cannot exceed the uncompressed size of the chunk
+			 */
+			if( ( chunk_end_offset <= (uint64_t) chunk_offset )
+			 || ( chunk_end_offset > (uint64_t) ( compressed_data_size - chunk_table_size ) )
+			 || ( ( chunk_end_offset - chunk_offset ) > (uint64_t) ( chunk_index == (size_t) number_of_chunks ? last_chunk_size : chunk_size ) ) )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+				 LIBCERROR_RUNTIME_ERROR_VALUE_OUT_OF_BOUNDS,
+				 "%s: invalid chunk: %" PRIzd " end offset value out of bounds.",
+				 function,
+				 chunk_index - 1 );
+
+				result = -1;
+
+				break;
+			}
+			internal_wof_stream->chunk_offsets[ chunk_index ] = chunk_table_size + (size_t) chunk_end_offset;
+		}
+		if( result != 1 )
+		{
+			memory_free(
+			 internal_wof_stream->chunk_offsets );
+
+			internal_wof_stream->chunk_offsets = NULL;
+		}
+		else
+		{
+			internal_wof_stream->compressed_data        = compressed_data;
+			internal_wof_stream->compressed_data_size   = compressed_data_size;
+			internal_wof_stream->uncompressed_data_size = uncompressed_data_size;
+			internal_wof_stream->compression_method     = compression_method;
+			internal_wof_stream->chunk_size             = chunk_size;
+			internal_wof_stream->number_of_chunks       = (size_t) number_of_chunks;
+			internal_wof_stream->current_offset         = 0;
+		}
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_write(
+	     internal_wof_stream->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( result );
+}
+
+/* Sets the maximum number of recently decompressed chunks that are cached
+ * Chunks are cached when they are read partially, the least recently used chunk
+ * is replaced when the cache is full. Cached chunks are discarded
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_wof_stream_set_maximum_number_of_cached_chunks(
+     libfwnt_wof_stream_t *wof_stream,
+     int maximum_number_of_cached_chunks,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_wof_stream_t *internal_wof_stream = NULL;
+	static char *function                              = "libfwnt_wof_stream_set_maximum_number_of_cached_chunks";
+	int result                                         = 1;
+
+	if( wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	internal_wof_stream = (libfwnt_internal_wof_stream_t *) wof_stream;
+
+	if( ( maximum_number_of_cached_chunks < 1 )
+	 || ( maximum_number_of_cached_chunks > LIBFWNT_WOF_STREAM_MAXIMUM_NUMBER_OF_CACHED_CHUNKS ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid maximum number of cached chunks value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_write(
+	     internal_wof_stream->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	if( libfwnt_internal_wof_stream_free_cache(
+	     internal_wof_stream,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+		 "%s: unable to free cache.",
+		 function );
+
+		result = -1;
+	}
+	internal_wof_stream->maximum_number_of_cached_chunks = maximum_number_of_cached_chunks;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_write(
+	     internal_wof_stream->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( result );
+}
+
+/* Sets the number of threads used to decompress the chunks of a read
+ * that covers multiple complete chunks
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_wof_stream_set_number_of_threads(
+     libfwnt_wof_stream_t *wof_stream,
+     int number_of_threads,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_wof_stream_t *internal_wof_stream = NULL;
+	static char *function                              = "libfwnt_wof_stream_set_number_of_threads";
+
+	if( wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	internal_wof_stream = (libfwnt_internal_wof_stream_t *) wof_stream;
+
+	if( ( number_of_threads < 1 )
+	 || ( number_of_threads > LIBFWNT_WOF_STREAM_MAXIMUM_NUMBER_OF_THREADS ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid number of threads value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_write(
+	     internal_wof_stream->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	internal_wof_stream->number_of_threads = number_of_threads;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_write(
+	     internal_wof_stream->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( 1 );
+}
+
+/* Makes sure the WOF stream has at least the number of decoders
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_wof_stream_get_decoders(
+     libfwnt_internal_wof_stream_t *internal_wof_stream,
+     int number_of_decoders,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_lzxpress_huffman_decoder_t *decoders = NULL;
+	static char *function                                 = "libfwnt_internal_wof_stream_get_decoders";
+	int decoder_index                                     = 0;
+
+	if( internal_wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	if( ( number_of_decoders < 1 )
+	 || ( number_of_decoders > LIBFWNT_WOF_STREAM_MAXIMUM_NUMBER_OF_THREADS ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid number of decoders value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+	if( number_of_decoders <= internal_wof_stream->number_of_decoders )
+	{
+		return( 1 );
+	}
+	decoders = (libfwnt_internal_lzxpress_huffman_decoder_t *) memory_allocate(
+	                                                            sizeof( libfwnt_internal_lzxpress_huffman_decoder_t ) * number_of_decoders );
+
+	if( decoders == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_MEMORY,
+		 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+		 "%s: unable to create decoders.",
+		 function );
+
+		return( -1 );
+	}
+	for( decoder_index = 0;
+	     decoder_index < number_of_decoders;
+	     decoder_index++ )
+	{
+		decoders[ decoder_index ].tables_are_set = 0;
+	}
+	if( internal_wof_stream->decoders != NULL )
+	{
+		memory_free(
+		 internal_wof_stream->decoders );
+	}
+	internal_wof_stream->decoders           = decoders;
+	internal_wof_stream->number_of_decoders = number_of_decoders;
+
+	return( 1 );
+}
+
+/* Decompresses a chunk using the decoder
+ * The uncompressed data must be large enough to contain the chunk
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_wof_stream_decompress_chunk(
+     libfwnt_internal_wof_stream_t *internal_wof_stream,
+     libfwnt_internal_lzxpress_huffman_decoder_t *decoder,
+     size_t chunk_index,
+     uint8_t *uncompressed_data,
+     size_t uncompressed_data_size,
+     libcerror_error_t **error )
+{
+	static char *function    = "libfwnt_internal_wof_stream_decompress_chunk";
+	size_t chunk_data_offset = 0;
+	size_t chunk_data_size   = 0;
+	size_t chunk_size        = 0;
+	size_t decompressed_size = 0;
+
+	if( internal_wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	if( chunk_index >= internal_wof_stream->number_of_chunks )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid chunk index value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+	if( uncompressed_data == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid uncompressed data.",
+		 function );
+
+		return( -1 );
+	}
+	chunk_size = internal_wof_stream->chunk_size;
+
+	if( chunk_index == ( internal_wof_stream->number_of_chunks - 1 ) )
+	{
+		chunk_size = (size_t) ( internal_wof_stream->uncompressed_data_size - ( (size64_t) chunk_index * internal_wof_stream->chunk_size ) );
+	}
+	if( uncompressed_data_size < chunk_size )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_TOO_SMALL,
+		 "%s: invalid uncompressed data size value too small.",
+		 function );
+
+		return( -1 );
+	}
+	chunk_data_offset = internal_wof_stream->chunk_offsets[ chunk_index ];
+	chunk_data_size   = internal_wof_stream->chunk_offsets[ chunk_index + 1 ] - chunk_data_offset;
+
+	if( chunk_data_size == chunk_size )
+	{
+		if( memory_copy(
+		     uncompressed_data,
+		     &( internal_wof_stream->compressed_data[ chunk_data_offset ] ),
+		     chunk_size ) == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+			 "%s: unable to copy uncompressed chunk: %" PRIzd ".",
+			 function,
+			 chunk_index );
+
+			return( -1 );
+		}
+		return( 1 );
+	}
+	/* The size of the chunk is passed as the uncompressed data size so that corrupted
+	 * data cannot be decompressed beyond the end of the chunk
+	 */
+	decompressed_size = chunk_size;
+
+	if( libfwnt_internal_lzxpress_huffman_decoder_decompress(
+	     decoder,
+	     &( internal_wof_stream->compressed_data[ chunk_data_offset ] ),
+	     chunk_data_size,
+	     uncompressed_data,
+	     &decompressed_size,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_COMPRESSION,
+		 LIBCERROR_COMPRESSION_ERROR_DECOMPRESS_FAILED,
+		 "%s: unable to decompress chunk: %" PRIzd ".",
+		 function,
+		 chunk_index );
+
+		return( -1 );
+	}
+	if( decompressed_size != chunk_size )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_COMPRESSION,
+		 LIBCERROR_COMPRESSION_ERROR_DECOMPRESS_FAILED,
+		 "%s: mismatch in decompressed size of chunk: %" PRIzd ".",
+		 function,
+		 chunk_index );
+
+		return( -1 );
+	}
+	return( 1 );
+}
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+
+/* Decompresses the chunks of a decompression job
+ * Returns 1 on success or -1 on error
+ */
+int libfwnt_wof_stream_decompression_job_callback(
+     libfwnt_wof_stream_decompression_job_t *decompression_job )
+{
+	size_t chunk_size  = decompression_job->internal_wof_stream->chunk_size;
+	size_t chunk_index = 0;
+
+	decompression_job->result = 1;
+
+	for( chunk_index = 0;
+	     chunk_index < decompression_job->number_of_chunks;
+	     chunk_index++ )
+	{
+		if( libfwnt_internal_wof_stream_decompress_chunk(
+		     decompression_job->internal_wof_stream,
+		     decompression_job->decoder,
+		     decompression_job->first_chunk_index + chunk_index,
+		     &( decompression_job->uncompressed_data[ chunk_index * chunk_size ] ),
+		     chunk_size,
+		     NULL ) != 1 )
+		{
+			decompression_job->result = -1;
+
+			break;
+		}
+	}
+	return( decompression_job->result );
+}
+
+#endif /* defined( HAVE_MULTI_THREAD_SUPPORT ) */
+
+/* Decompresses consecutive chunks into the uncompressed data, which must be
+ * large enough to contain the chunks. The chunks are divided over the number
+ * of threads of the WOF stream when multi-threading support is available
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_wof_stream_decompress_chunks(
+     libfwnt_internal_wof_stream_t *internal_wof_stream,
+     size_t first_chunk_index,
+     size_t number_of_chunks,
+     uint8_t *uncompressed_data,
+     libcerror_error_t **error )
+{
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	libfwnt_wof_stream_decompression_job_t decompression_jobs[ LIBFWNT_WOF_STREAM_MAXIMUM_NUMBER_OF_THREADS ];
+	libcthreads_thread_t *threads[ LIBFWNT_WOF_STREAM_MAXIMUM_NUMBER_OF_THREADS ];
+
+	size_t job_chunk_index    = 0;
+	size_t job_chunks         = 0;
+	int job_index             = 0;
+	int number_of_jobs        = 0;
+	int result                = 1;
+#endif
+	static char *function     = "libfwnt_internal_wof_stream_decompress_chunks";
+	size_t chunk_data_size    = 0;
+	size_t chunk_index        = 0;
+	size_t last_chunk_index   = 0;
+
+	if( internal_wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	if( ( first_chunk_index >= internal_wof_stream->number_of_chunks )
+	 || ( number_of_chunks > ( internal_wof_stream->number_of_chunks - first_chunk_index ) ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid chunk index value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( ( internal_wof_stream->number_of_threads > 1 )
+	 && ( number_of_chunks > 1 ) )
+	{
+		number_of_jobs = internal_wof_stream->number_of_threads;
+
+		if( (size_t) number_of_jobs > number_of_chunks )
+		{
+			number_of_jobs = (int) number_of_chunks;
+		}
+		if( libfwnt_internal_wof_stream_get_decoders(
+		     internal_wof_stream,
+		     number_of_jobs,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+			 "%s: unable to retrieve decoders.",
+			 function );
+
+			return( -1 );
+		}
+		/* Every job decompresses a contiguous range of chunks into its part of the uncompressed data
+		 */
+		job_chunk_index = first_chunk_index;
+
+		for( job_index = 0;
+		     job_index < number_of_jobs;
+		     job_index++ )
+		{
+			job_chunks = number_of_chunks / number_of_jobs;
+
+			if( (size_t) job_index < ( number_of_chunks % number_of_jobs ) )
+			{
+				job_chunks += 1;
+			}
+			decompression_jobs[ job_index ].internal_wof_stream = internal_wof_stream;
+			decompression_jobs[ job_index ].first_chunk_index   = job_chunk_index;
+			decompression_jobs[ job_index ].number_of_chunks    = job_chunks;
+			decompression_jobs[ job_index ].uncompressed_data   = &( uncompressed_data[ ( job_chunk_index - first_chunk_index ) * internal_wof_stream->chunk_size ] );
+			decompression_jobs[ job_index ].decoder             = &( internal_wof_stream->decoders[ job_index ] );
+			decompression_jobs[ job_index ].result              = -1;
+
+			threads[ job_index ] = NULL;
+
+			job_chunk_index += job_chunks;
+		}
+		for( job_index = 0;
+		     job_index < number_of_jobs;
+		     job_index++ )
+		{
+			if( libcthreads_thread_create(
+			     &( threads[ job_index ] ),
+			     NULL,
+			     (int (*)(void *)) &libfwnt_wof_stream_decompression_job_callback,
+			     (void *) &( decompression_jobs[ job_index ] ),
+			     error ) != 1 )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+				 LIBCERROR_RUNTIME_ERROR_INITIALIZE_FAILED,
+				 "%s: unable to create thread: %d.",
+				 function,
+				 job_index );
+
+				result = -1;
+
+				break;
+			}
+		}
+		/* Join the threads that were created, also when the creation of a thread failed
+		 */
+		while( job_index > 0 )
+		{
+			job_index--;
+
+			if( libcthreads_thread_join(
+			     &( threads[ job_index ] ),
+			     error ) != 1 )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+				 LIBCERROR_RUNTIME_ERROR_FINALIZE_FAILED,
+				 "%s: unable to join thread: %d.",
+				 function,
+				 job_index );
+
+				result = -1;
+			}
+		}
+		if( result != 1 )
+		{
+			return( -1 );
+		}
+		for( job_index = 0;
+		     job_index < number_of_jobs;
+		     job_index++ )
+		{
+			if( decompression_jobs[ job_index ].result != 1 )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_COMPRESSION,
+				 LIBCERROR_COMPRESSION_ERROR_DECOMPRESS_FAILED,
+				 "%s: unable to decompress chunks: %" PRIzd " - %" PRIzd ".",
+				 function,
+				 decompression_jobs[ job_index ].first_chunk_index,
+				 decompression_jobs[ job_index ].first_chunk_index + decompression_jobs[ job_index ].number_of_chunks - 1 );
+
+				return( -1 );
+			}
+		}
+		return( 1 );
+	}
+#endif /* defined( HAVE_MULTI_THREAD_SUPPORT ) */
+
+	if( libfwnt_internal_wof_stream_get_decoders(
+	     internal_wof_stream,
+	     1,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve decoders.",
+		 function );
+
+		return( -1 );
+	}
+	last_chunk_index = internal_wof_stream->number_of_chunks - 1;
+
+	for( chunk_index = first_chunk_index;
+	     chunk_index < ( first_chunk_index + number_of_chunks );
+	     chunk_index++ )
+	{
+		chunk_data_size = internal_wof_stream->chunk_size;
+
+		if( chunk_index == last_chunk_index )
+		{
+			chunk_data_size = (size_t) ( internal_wof_stream->uncompressed_data_size - ( (size64_t) last_chunk_index * internal_wof_stream->chunk_size ) );
+		}
+		if( libfwnt_internal_wof_stream_decompress_chunk(
+		     internal_wof_stream,
+		     internal_wof_stream->decoders,
+		     chunk_index,
+		     &( uncompressed_data[ ( chunk_index - first_chunk_index ) * internal_wof_stream->chunk_size ] ),
+		     chunk_data_size,
+		     error ) != 1 )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_COMPRESSION,
+			 LIBCERROR_COMPRESSION_ERROR_DECOMPRESS_FAILED,
+			 "%s: unable to decompress chunk: %" PRIzd ".",
+			 function,
+			 chunk_index );
+
+			return( -1 );
+		}
+	}
+	return( 1 );
+}
+
+/* Retrieves the cache entry of a chunk and marks it as most recently used
+ * Returns 1 if successful, 0 if the chunk is not cached or -1 on error
+ */
+int libfwnt_internal_wof_stream_get_cache_entry(
+     libfwnt_internal_wof_stream_t *internal_wof_stream,
+     size_t chunk_index,
+     libfwnt_wof_stream_cache_entry_t **cache_entry,
+     libcerror_error_t **error )
+{
+	static char *function = "libfwnt_internal_wof_stream_get_cache_entry";
+	int entry_index       = 0;
+
+	if( internal_wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	if( cache_entry == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid cache entry.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_wof_stream->cache_entries == NULL )
+	{
+		return( 0 );
+	}
+	for( entry_index = 0;
+	     entry_index < internal_wof_stream->maximum_number_of_cached_chunks;
+	     entry_index++ )
+	{
+		if( ( internal_wof_stream->cache_entries[ entry_index ].data_size != 0 )
+		 && ( internal_wof_stream->cache_entries[ entry_index ].chunk_index == chunk_index ) )
+		{
+			internal_wof_stream->cache_access_time += 1;
+
+			internal_wof_stream->cache_entries[ entry_index ].access_time = internal_wof_stream->cache_access_time;
+
+			*cache_entry = &( internal_wof_stream->cache_entries[ entry_index ] );
+
+			return( 1 );
+		}
+	}
+	return( 0 );
+}
+
+/* Retrieves the cache entry of a chunk, the chunk is decompressed into
+ * the least recently used cache entry if it is not cached
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_internal_wof_stream_get_cached_chunk(
+     libfwnt_internal_wof_stream_t *internal_wof_stream,
+     size_t chunk_index,
+     libfwnt_wof_stream_cache_entry_t **cache_entry,
+     libcerror_error_t **error )
+{
+	libfwnt_wof_stream_cache_entry_t *least_recently_used_entry = NULL;
+	static char *function                                       = "libfwnt_internal_wof_stream_get_cached_chunk";
+	size_t chunk_data_size                                      = 0;
+	int entry_index                                             = 0;
+	int result                                                  = 0;
+
+	result = libfwnt_internal_wof_stream_get_cache_entry(
+	          internal_wof_stream,
+	          chunk_index,
+	          cache_entry,
+	          error );
+
+	if( result != 0 )
+	{
+		return( result );
+	}
+	if( chunk_index >= internal_wof_stream->number_of_chunks )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid chunk index value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_wof_stream->cache_entries == NULL )
+	{
+		internal_wof_stream->cache_entries = (libfwnt_wof_stream_cache_entry_t *) memory_allocate(
+		                                                                           sizeof( libfwnt_wof_stream_cache_entry_t ) * internal_wof_stream->maximum_number_of_cached_chunks );
+
+		if( internal_wof_stream->cache_entries == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+			 "%s: unable to create cache entries.",
+			 function );
+
+			return( -1 );
+		}
+		if( memory_set(
+		     internal_wof_stream->cache_entries,
+		     0,
+		     sizeof( libfwnt_wof_stream_cache_entry_t ) * internal_wof_stream->maximum_number_of_cached_chunks ) == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_SET_FAILED,
+			 "%s: unable to clear cache entries.",
+			 function );
+
+			memory_free(
+			 internal_wof_stream->cache_entries );
+
+			internal_wof_stream->cache_entries = NULL;
+
+			return( -1 );
+		}
+	}
+	/* Use an unused entry or otherwise the least recently used entry
+	 */
+	for( entry_index = 0;
+	     entry_index < internal_wof_stream->maximum_number_of_cached_chunks;
+	     entry_index++ )
+	{
+		if( internal_wof_stream->cache_entries[ entry_index ].data_size == 0 )
+		{
+			least_recently_used_entry = &( internal_wof_stream->cache_entries[ entry_index ] );
+
+			break;
+		}
+		if( ( least_recently_used_entry == NULL )
+		 || ( internal_wof_stream->cache_entries[ entry_index ].access_time < least_recently_used_entry->access_time ) )
+		{
+			least_recently_used_entry = &( internal_wof_stream->cache_entries[ entry_index ] );
+		}
+	}
+	if( least_recently_used_entry->data == NULL )
+	{
+		least_recently_used_entry->data = (uint8_t *) memory_allocate(
+		                                               sizeof( uint8_t ) * internal_wof_stream->chunk_size );
+
+		if( least_recently_used_entry->data == NULL )
+		{
+			libcerror_error_set(
+			 error,
+			 LIBCERROR_ERROR_DOMAIN_MEMORY,
+			 LIBCERROR_MEMORY_ERROR_INSUFFICIENT,
+			 "%s: unable to create cache entry data.",
+			 function );
+
+			return( -1 );
+		}
+	}
+	least_recently_used_entry->data_size = 0;
+
+	chunk_data_size = internal_wof_stream->chunk_size;
+
+	if( chunk_index == ( internal_wof_stream->number_of_chunks - 1 ) )
+	{
+		chunk_data_size = (size_t) ( internal_wof_stream->uncompressed_data_size - ( (size64_t) chunk_index * internal_wof_stream->chunk_size ) );
+	}
+	if( libfwnt_internal_wof_stream_get_decoders(
+	     internal_wof_stream,
+	     1,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+		 "%s: unable to retrieve decoders.",
+		 function );
+
+		return( -1 );
+	}
+	if( libfwnt_internal_wof_stream_decompress_chunk(
+	     internal_wof_stream,
+	     internal_wof_stream->decoders,
+	     chunk_index,
+	     least_recently_used_entry->data,
+	     chunk_data_size,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_COMPRESSION,
+		 LIBCERROR_COMPRESSION_ERROR_DECOMPRESS_FAILED,
+		 "%s: unable to decompress chunk: %" PRIzd ".",
+		 function,
+		 chunk_index );
+
+		return( -1 );
+	}
+	internal_wof_stream->cache_access_time += 1;
+
+	least_recently_used_entry->chunk_index = chunk_index;
+	least_recently_used_entry->data_size   = chunk_data_size;
+	least_recently_used_entry->access_time = internal_wof_stream->cache_access_time;
+
+	*cache_entry = least_recently_used_entry;
+
+	return( 1 );
+}
+
+/* Reads data at a specific offset from the uncompressed data of a WOF stream
+ * Chunks that are read partially are decompressed into the cache, consecutive
+ * chunks that are read completely are decompressed directly into the buffer
+ * Returns the number of bytes read or -1 on error
+ */
+ssize_t libfwnt_internal_wof_stream_read_buffer_at_offset(
+         libfwnt_internal_wof_stream_t *internal_wof_stream,
+         uint8_t *buffer,
+         size_t buffer_size,
+         off64_t offset,
+         libcerror_error_t **error )
+{
+	libfwnt_wof_stream_cache_entry_t *cache_entry = NULL;
+	static char *function                         = "libfwnt_internal_wof_stream_read_buffer_at_offset";
+	size_t buffer_offset                          = 0;
+	size_t chunk_data_offset                      = 0;
+	size_t chunk_data_size                        = 0;
+	size_t chunk_index                            = 0;
+	size_t number_of_chunks                       = 0;
+	size_t read_size                              = 0;
+	int result                                    = 0;
+
+	if( internal_wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	if( internal_wof_stream->chunk_offsets == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_VALUE_MISSING,
+		 "%s: invalid WOF stream - missing compressed data.",
+		 function );
+
+		return( -1 );
+	}
+	if( buffer == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid buffer.",
+		 function );
+
+		return( -1 );
+	}
+	if( buffer_size > (size_t) SSIZE_MAX )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_EXCEEDS_MAXIMUM,
+		 "%s: invalid buffer size value exceeds maximum.",
+		 function );
+
+		return( -1 );
+	}
+	if( offset < 0 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_LESS_THAN_ZERO,
+		 "%s: invalid offset value less than zero.",
+		 function );
+
+		return( -1 );
+	}
+	if( (size64_t) offset >= internal_wof_stream->uncompressed_data_size )
+	{
+		return( 0 );
+	}
+	if( (size64_t) buffer_size > ( internal_wof_stream->uncompressed_data_size - offset ) )
+	{
+		buffer_size = (size_t) ( internal_wof_stream->uncompressed_data_size - offset );
+	}
+	while( buffer_offset < buffer_size )
+	{
+		chunk_index       = (size_t) ( offset / internal_wof_stream->chunk_size );
+		chunk_data_offset = (size_t) ( offset % internal_wof_stream->chunk_size );
+		chunk_data_size   = internal_wof_stream->chunk_size;
+
+		if( chunk_index == ( internal_wof_stream->number_of_chunks - 1 ) )
+		{
+			chunk_data_size = (size_t) ( internal_wof_stream->uncompressed_data_size - ( (size64_t) chunk_index * internal_wof_stream->chunk_size ) );
+		}
+		read_size = chunk_data_size - chunk_data_offset;
+
+		if( read_size > ( buffer_size - buffer_offset ) )
+		{
+			read_size = buffer_size - buffer_offset;
+		}
+		if( ( chunk_data_offset == 0 )
+		 && ( read_size == chunk_data_size ) )
+		{
+			result = libfwnt_internal_wof_stream_get_cache_entry(
+			          internal_wof_stream,
+			          chunk_index,
+			          &cache_entry,
+			          error );
+
+			if( result == -1 )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+				 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+				 "%s: unable to retrieve cache entry of chunk: %" PRIzd ".",
+				 function,
+				 chunk_index );
+
+				return( -1 );
+			}
+		}
+		else
+		{
+			if( libfwnt_internal_wof_stream_get_cached_chunk(
+			     internal_wof_stream,
+			     chunk_index,
+			     &cache_entry,
+			     error ) != 1 )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+				 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+				 "%s: unable to retrieve cached chunk: %" PRIzd ".",
+				 function,
+				 chunk_index );
+
+				return( -1 );
+			}
+			result = 1;
+		}
+		if( result != 0 )
+		{
+			if( memory_copy(
+			     &( buffer[ buffer_offset ] ),
+			     &( cache_entry->data[ chunk_data_offset ] ),
+			     read_size ) == NULL )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_MEMORY,
+				 LIBCERROR_MEMORY_ERROR_COPY_FAILED,
+				 "%s: unable to copy chunk: %" PRIzd " data.",
+				 function,
+				 chunk_index );
+
+				return( -1 );
+			}
+		}
+		else
+		{
+			/* Decompress the chunks that are read completely and are not cached
+			 * directly into the buffer
+			 */
+			number_of_chunks = 1;
+			read_size        = chunk_data_size;
+
+			while( ( chunk_index + number_of_chunks ) < internal_wof_stream->number_of_chunks )
+			{
+				chunk_data_size = internal_wof_stream->chunk_size;
+
+				if( ( chunk_index + number_of_chunks ) == ( internal_wof_stream->number_of_chunks - 1 ) )
+				{
+					chunk_data_size = (size_t) ( internal_wof_stream->uncompressed_data_size - ( (size64_t) ( chunk_index + number_of_chunks ) * internal_wof_stream->chunk_size ) );
+				}
+				if( chunk_data_size > ( buffer_size - buffer_offset - read_size ) )
+				{
+					break;
+				}
+				result = libfwnt_internal_wof_stream_get_cache_entry(
+				          internal_wof_stream,
+				          chunk_index + number_of_chunks,
+				          &cache_entry,
+				          error );
+
+				if( result == -1 )
+				{
+					libcerror_error_set(
+					 error,
+					 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+					 LIBCERROR_RUNTIME_ERROR_GET_FAILED,
+					 "%s: unable to retrieve cache entry of chunk: %" PRIzd ".",
+					 function,
+					 chunk_index + number_of_chunks );
+
+					return( -1 );
+				}
+				else if( result != 0 )
+				{
+					break;
+				}
+				number_of_chunks += 1;
+				read_size        += chunk_data_size;
+			}
+			if( libfwnt_internal_wof_stream_decompress_chunks(
+			     internal_wof_stream,
+			     chunk_index,
+			     number_of_chunks,
+			     &( buffer[ buffer_offset ] ),
+			     error ) != 1 )
+			{
+				libcerror_error_set(
+				 error,
+				 LIBCERROR_ERROR_DOMAIN_COMPRESSION,
+				 LIBCERROR_COMPRESSION_ERROR_DECOMPRESS_FAILED,
+				 "%s: unable to decompress chunks: %" PRIzd " - %" PRIzd ".",
+				 function,
+				 chunk_index,
+				 chunk_index + number_of_chunks - 1 );
+
+				return( -1 );
+			}
+		}
+		buffer_offset += read_size;
+		offset        += read_size;
+	}
+	return( (ssize_t) buffer_offset );
+}
+
+/* Reads data at the current offset from the uncompressed data of a WOF stream
+ * Returns the number of bytes read or -1 on error
+ */
+ssize_t libfwnt_wof_stream_read_buffer(
+         libfwnt_wof_stream_t *wof_stream,
+         uint8_t *buffer,
+         size_t buffer_size,
+         libcerror_error_t **error )
+{
+	libfwnt_internal_wof_stream_t *internal_wof_stream = NULL;
+	static char *function                              = "libfwnt_wof_stream_read_buffer";
+	ssize_t read_count                                 = 0;
+
+	if( wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	internal_wof_stream = (libfwnt_internal_wof_stream_t *) wof_stream;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_write(
+	     internal_wof_stream->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	read_count = libfwnt_internal_wof_stream_read_buffer_at_offset(
+	              internal_wof_stream,
+	              buffer,
+	              buffer_size,
+	              internal_wof_stream->current_offset,
+	              error );
+
+	if( read_count == -1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_IO,
+		 LIBCERROR_IO_ERROR_READ_FAILED,
+		 "%s: unable to read buffer.",
+		 function );
+	}
+	else
+	{
+		internal_wof_stream->current_offset += (off64_t) read_count;
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_write(
+	     internal_wof_stream->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( read_count );
+}
+
+/* Reads data at a specific offset from the uncompressed data of a WOF stream
+ * The current offset is not changed
+ * Returns the number of bytes read or -1 on error
+ */
+ssize_t libfwnt_wof_stream_read_buffer_at_offset(
+         libfwnt_wof_stream_t *wof_stream,
+         uint8_t *buffer,
+         size_t buffer_size,
+         off64_t offset,
+         libcerror_error_t **error )
+{
+	libfwnt_internal_wof_stream_t *internal_wof_stream = NULL;
+	static char *function                              = "libfwnt_wof_stream_read_buffer_at_offset";
+	ssize_t read_count                                 = 0;
+
+	if( wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	internal_wof_stream = (libfwnt_internal_wof_stream_t *) wof_stream;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_write(
+	     internal_wof_stream->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	read_count = libfwnt_internal_wof_stream_read_buffer_at_offset(
+	              internal_wof_stream,
+	              buffer,
+	              buffer_size,
+	              offset,
+	              error );
+
+	if( read_count == -1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_IO,
+		 LIBCERROR_IO_ERROR_READ_FAILED,
+		 "%s: unable to read buffer at offset: %" PRIi64 ".",
+		 function,
+		 offset );
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_write(
+	     internal_wof_stream->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( read_count );
+}
+
+/* Seeks a certain offset in the uncompressed data of a WOF stream
+ * Returns the offset if seek is successful or -1 on error
+ */
+off64_t libfwnt_wof_stream_seek_offset(
+         libfwnt_wof_stream_t *wof_stream,
+         off64_t offset,
+         int whence,
+         libcerror_error_t **error )
+{
+	libfwnt_internal_wof_stream_t *internal_wof_stream = NULL;
+	static char *function                              = "libfwnt_wof_stream_seek_offset";
+
+	if( wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	internal_wof_stream = (libfwnt_internal_wof_stream_t *) wof_stream;
+
+	if( ( whence != SEEK_CUR )
+	 && ( whence != SEEK_END )
+	 && ( whence != SEEK_SET ) )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_UNSUPPORTED_VALUE,
+		 "%s: unsupported whence.",
+		 function );
+
+		return( -1 );
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_write(
+	     internal_wof_stream->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	if( whence == SEEK_CUR )
+	{
+		offset += internal_wof_stream->current_offset;
+	}
+	else if( whence == SEEK_END )
+	{
+		offset += (off64_t) internal_wof_stream->uncompressed_data_size;
+	}
+	if( offset < 0 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_VALUE_OUT_OF_BOUNDS,
+		 "%s: invalid offset value out of bounds.",
+		 function );
+
+		offset = -1;
+	}
+	else
+	{
+		internal_wof_stream->current_offset = offset;
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_write(
+	     internal_wof_stream->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for writing.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( offset );
+}
+
+/* Retrieves the current offset in the uncompressed data of a WOF stream
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_wof_stream_get_offset(
+     libfwnt_wof_stream_t *wof_stream,
+     off64_t *offset,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_wof_stream_t *internal_wof_stream = NULL;
+	static char *function                              = "libfwnt_wof_stream_get_offset";
+
+	if( wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	internal_wof_stream = (libfwnt_internal_wof_stream_t *) wof_stream;
+
+	if( offset == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid offset.",
+		 function );
+
+		return( -1 );
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_read(
+	     internal_wof_stream->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for reading.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	*offset = internal_wof_stream->current_offset;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_read(
+	     internal_wof_stream->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for reading.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( 1 );
+}
+
+/* Retrieves the size of the uncompressed data of a WOF stream
+ * Returns 1 if successful or -1 on error
+ */
+int libfwnt_wof_stream_get_size(
+     libfwnt_wof_stream_t *wof_stream,
+     size64_t *size,
+     libcerror_error_t **error )
+{
+	libfwnt_internal_wof_stream_t *internal_wof_stream = NULL;
+	static char *function                              = "libfwnt_wof_stream_get_size";
+
+	if( wof_stream == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	internal_wof_stream = (libfwnt_internal_wof_stream_t *) wof_stream;
+
+	if( size == NULL )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_ARGUMENTS,
+		 LIBCERROR_ARGUMENT_ERROR_INVALID_VALUE,
+		 "%s: invalid size.",
+		 function );
+
+		return( -1 );
+	}
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_grab_for_read(
+	     internal_wof_stream->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to grab read/write lock for reading.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	*size = internal_wof_stream->uncompressed_data_size;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	if( libcthreads_read_write_lock_release_for_read(
+	     internal_wof_stream->read_write_lock,
+	     error ) != 1 )
+	{
+		libcerror_error_set(
+		 error,
+		 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+		 LIBCERROR_RUNTIME_ERROR_SET_FAILED,
+		 "%s: unable to release read/write lock for reading.",
+		 function );
+
+		return( -1 );
+	}
+#endif
+	return( 1 );
+}
+
@@ -0,0 +1,292 @@
+/*
+ * Windows Overlay Filter (WOF) compressed stream functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _LIBFWNT_INTERNAL_WOF_STREAM_H )
+#define _LIBFWNT_INTERNAL_WOF_STREAM_H
+
+#include <common.h>
+#include <types.h>
+
+#include "libfwnt_extern.h"
+#include "libfwnt_libcerror.h"
+#include "libfwnt_lzxpress_huffman_decoder.h"
+#include "libfwnt_types.h"
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+#include "libfwnt_libcthreads.h"
+#endif
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+/* The WofCompressedData stream of a file compressed by the Windows Overlay Filter
+ * (CompactOS) is formatted as following:
+ * chunk table: the end offsets of all chunks except the last, relative to the end
+ *              of the chunk table, stored as 32-bit values or as 64-bit values
+ *              if the uncompressed data size exceeds 4 GiB
+ * chunks: the chunks of uncompressed data, every chunk is compressed independently
+ *         and stored uncompressed if compression did not reduce its size
+ */
+
+typedef struct libfwnt_wof_stream_cache_entry libfwnt_wof_stream_cache_entry_t;
+
+struct libfwnt_wof_stream_cache_entry
+{
+	/* The chunk index
+	 */
+	size_t chunk_index;
+
+	/* The chunk data
+	 */
+	uint8_t *data;
+
+	/* The chunk data size, 0 if the entry is not used
+	 */
+	size_t data_size;
+
+	/* The last time the entry was accessed
+	 */
+	uint64_t access_time;
+};
+
+typedef struct libfwnt_internal_wof_stream libfwnt_internal_wof_stream_t;
+
+struct libfwnt_internal_wof_stream
+{
+	/* The compressed data, which is referenced and not copied
+	 */
+	const uint8_t *compressed_data;
+
+	/* The compressed data size
+	 */
+	size_t compressed_data_size;
+
+	/* The uncompressed data size
+	 */
+	size64_t uncompressed_data_size;
+
+	/* The compression method
+	 */
+	uint32_t compression_method;
+
+	/* The chunk size
+	 */
+	size_t chunk_size;
+
+	/* The number of chunks
+	 */
+	size_t number_of_chunks;
+
+	/* The offsets of the chunks in the compressed data, contains an additional
+	 * offset of the end of the last chunk
+	 */
+	size_t *chunk_offsets;
+
+	/* The current offset in the uncompressed data
+	 */
+	off64_t current_offset;
+
+	/* The cache entries of recently decompressed chunks
+	 */
+	libfwnt_wof_stream_cache_entry_t *cache_entries;
+
+	/* The maximum number of cached chunks
+	 */
+	int maximum_number_of_cached_chunks;
+
+	/* The cache access time, used to determine the least recently used entry
+	 */
+	uint64_t cache_access_time;
+
+	/* The number of threads used to decompress consecutive chunks
+	 */
+	int number_of_threads;
+
+	/* The LZXPRESS Huffman decoders, one per thread, which are reused for every chunk
+	 */
+	libfwnt_internal_lzxpress_huffman_decoder_t *decoders;
+
+	/* The number of decoders
+	 */
+	int number_of_decoders;
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+	/* The read/write lock
+	 */
+	libcthreads_read_write_lock_t *read_write_lock;
+#endif
+};
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+
+typedef struct libfwnt_wof_stream_decompression_job libfwnt_wof_stream_decompression_job_t;
+
+struct libfwnt_wof_stream_decompression_job
+{
+	/* The WOF stream
+	 */
+	libfwnt_internal_wof_stream_t *internal_wof_stream;
+
+	/* The index of the first chunk
+	 */
+	size_t first_chunk_index;
+
+	/* The number of chunks
+	 */
+	size_t number_of_chunks;
+
+	/* The uncompressed data of the chunks
+	 */
+	uint8_t *uncompressed_data;
+
+	/* The LZXPRESS Huffman decoder of the job
+	 */
+	libfwnt_internal_lzxpress_huffman_decoder_t *decoder;
+
+	/* The result of the job
+	 */
+	int result;
+};
+
+#endif /* defined( HAVE_MULTI_THREAD_SUPPORT ) */
+
+LIBFWNT_EXTERN \
+int libfwnt_wof_stream_initialize(
+     libfwnt_wof_stream_t **wof_stream,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_wof_stream_free(
+     libfwnt_wof_stream_t **wof_stream,
+     libcerror_error_t **error );
+
+int libfwnt_internal_wof_stream_free_cache(
+     libfwnt_internal_wof_stream_t *internal_wof_stream,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_wof_stream_set_compressed_data(
+     libfwnt_wof_stream_t *wof_stream,
+     const uint8_t *compressed_data,
+     size_t compressed_data_size,
+     size64_t uncompressed_data_size,
+     uint32_t compression_method,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_wof_stream_set_maximum_number_of_cached_chunks(
+     libfwnt_wof_stream_t *wof_stream,
+     int maximum_number_of_cached_chunks,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_wof_stream_set_number_of_threads(
+     libfwnt_wof_stream_t *wof_stream,
+     int number_of_threads,
+     libcerror_error_t **error );
+
+int libfwnt_internal_wof_stream_get_decoders(
+     libfwnt_internal_wof_stream_t *internal_wof_stream,
+     int number_of_decoders,
+     libcerror_error_t **error );
+
+int libfwnt_internal_wof_stream_decompress_chunk(
+     libfwnt_internal_wof_stream_t *internal_wof_stream,
+     libfwnt_internal_lzxpress_huffman_decoder_t *decoder,
+     size_t chunk_index,
+     uint8_t *uncompressed_data,
+     size_t uncompressed_data_size,
+     libcerror_error_t **error );
+
+int libfwnt_internal_wof_stream_decompress_chunks(
+     libfwnt_internal_wof_stream_t *internal_wof_stream,
+     size_t first_chunk_index,
+     size_t number_of_chunks,
+     uint8_t *uncompressed_data,
+     libcerror_error_t **error );
+
+#if defined( HAVE_MULTI_THREAD_SUPPORT )
+
+int libfwnt_wof_stream_decompression_job_callback(
+     libfwnt_wof_stream_decompression_job_t *decompression_job );
+
+#endif
+
+int libfwnt_internal_wof_stream_get_cache_entry(
+     libfwnt_internal_wof_stream_t *internal_wof_stream,
+     size_t chunk_index,
+     libfwnt_wof_stream_cache_entry_t **cache_entry,
+     libcerror_error_t **error );
+
+int libfwnt_internal_wof_stream_get_cached_chunk(
+     libfwnt_internal_wof_stream_t *internal_wof_stream,
+     size_t chunk_index,
+     libfwnt_wof_stream_cache_entry_t **cache_entry,
+     libcerror_error_t **error );
+
+ssize_t libfwnt_internal_wof_stream_read_buffer_at_offset(
+         libfwnt_internal_wof_stream_t *internal_wof_stream,
+         uint8_t *buffer,
+         size_t buffer_size,
+         off64_t offset,
+         libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+ssize_t libfwnt_wof_stream_read_buffer(
+         libfwnt_wof_stream_t *wof_stream,
+         uint8_t *buffer,
+         size_t buffer_size,
+         libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+ssize_t libfwnt_wof_stream_read_buffer_at_offset(
+         libfwnt_wof_stream_t *wof_stream,
+         uint8_t *buffer,
+         size_t buffer_size,
+         off64_t offset,
+         libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+off64_t libfwnt_wof_stream_seek_offset(
+         libfwnt_wof_stream_t *wof_stream,
+         off64_t offset,
+         int whence,
+         libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_wof_stream_get_offset(
+     libfwnt_wof_stream_t *wof_stream,
+     off64_t *offset,
+     libcerror_error_t **error );
+
+LIBFWNT_EXTERN \
+int libfwnt_wof_stream_get_size(
+     libfwnt_wof_stream_t *wof_stream,
+     size64_t *size,
+     libcerror_error_t **error );
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _LIBFWNT_INTERNAL_WOF_STREAM_H ) */
+
@@ -1,6 +1,12 @@
+import array
 import SIDOperations
 import struct
 import uuid
+
+try:
+	import pyfwnt
+except ImportError:
+	pyfwnt = None
 	
 """ ACE structure Integer Constants """
 #ACE Types
@@ -52,6 +58,16 @@ ACCESS_MASK_DELETE = 65536
 ACE_OBJECT_TYPE_PRESENT=1
 ACE_INHERITED_OBJECT_TYPE_PRESENT=2
 
+#ACE types whose structure carries the objectTypeFlags, objectType and inheritedObjectType fields
+OBJECT_ACE_TYPES = frozenset([ACE_TYPE_ACCESS_ALLOWED_OBJECT, \
+							  ACE_TYPE_ACCESS_DENIED_OBJECT, \
+							  ACE_TYPE_SYSTEM_AUDIT_OBJECT, \
+							  ACE_TYPE_SYSTEM_ALARM_OBJECT, \
+							  ACE_TYPE_ACCESS_ALLOWED_CALLBACK_OBJECT, \
+							  ACE_TYPE_ACCESS_DENIED_CALLBACK_OBJECT, \
+							  ACE_TYPE_SYSTEM_AUDIT_CALLBACK_OBJECT, \
+							  ACE_TYPE_SYSTEM_ALARM_CALLBACK_OBJECT])
+
 #ACE Mask Object Rights
 ADS_RIGHT_DS_CREATE_CHILD=1
 ADS_RIGHT_DS_DELETE_CHILD=2
@@ -60,6 +76,67 @@ ADS_RIGHT_DS_READ_PROP=16
 ADS_RIGHT_DS_WRITE_PROP=32
 ADS_RIGHT_DS_CONTROL_ACCESS=256
 
+#ACE Mask Directory Services Rights that are only granted through the generic mapping
+ADS_RIGHT_ACTRL_DS_LIST=4
+ADS_RIGHT_DS_DELETE_TREE=64
+ADS_RIGHT_DS_LIST_OBJECT=128
+
+#ACE Mask File and Directory Rights
+FILE_READ_DATA=1 #FILE_LIST_DIRECTORY for directories
+FILE_WRITE_DATA=2 #FILE_ADD_FILE for directories
+FILE_APPEND_DATA=4 #FILE_ADD_SUBDIRECTORY for directories
+FILE_READ_EA=8
+FILE_WRITE_EA=16
+FILE_EXECUTE=32 #FILE_TRAVERSE for directories
+FILE_DELETE_CHILD=64
+FILE_READ_ATTRIBUTES=128
+FILE_WRITE_ATTRIBUTES=256
+
+#ACE Mask Registry Key Rights
+KEY_QUERY_VALUE=1
+KEY_SET_VALUE=2
+KEY_CREATE_SUB_KEY=4
+KEY_ENUMERATE_SUB_KEYS=8
+KEY_NOTIFY=16
+KEY_CREATE_LINK=32
+
+#Standard Rights
+ACCESS_MASK_STANDARD_RIGHTS_REQUIRED = ACCESS_MASK_DELETE | ACCESS_MASK_READ_CONTROL | ACCESS_MASK_WRITE_DACL | ACCESS_MASK_WRITE_OWNER
+
+#Object classes of the generic mappings
+OBJECT_CLASS_DS=0
+OBJECT_CLASS_FILE=1
+OBJECT_CLASS_DIRECTORY=2
+OBJECT_CLASS_REGISTRY_KEY=3
+
+#The GENERIC_MAPPING of each object class: the rights GENERIC_READ, GENERIC_WRITE, GENERIC_EXECUTE and GENERIC_ALL map to
+GENERIC_MAPPINGS = { \
+	OBJECT_CLASS_DS: ( \
+		ACCESS_MASK_READ_CONTROL | ADS_RIGHT_ACTRL_DS_LIST | ADS_RIGHT_DS_READ_PROP | ADS_RIGHT_DS_LIST_OBJECT, \
+		ACCESS_MASK_READ_CONTROL | ADS_RIGHT_DS_SELF | ADS_RIGHT_DS_WRITE_PROP, \
+		ACCESS_MASK_READ_CONTROL | ADS_RIGHT_ACTRL_DS_LIST, \
+		ACCESS_MASK_STANDARD_RIGHTS_REQUIRED | ADS_RIGHT_DS_CREATE_CHILD | ADS_RIGHT_DS_DELETE_CHILD | \
+		ADS_RIGHT_ACTRL_DS_LIST | ADS_RIGHT_DS_SELF | ADS_RIGHT_DS_READ_PROP | ADS_RIGHT_DS_WRITE_PROP | \
+		ADS_RIGHT_DS_DELETE_TREE | ADS_RIGHT_DS_LIST_OBJECT | ADS_RIGHT_DS_CONTROL_ACCESS), \
+	OBJECT_CLASS_FILE: ( \
+		ACCESS_MASK_READ_CONTROL | FILE_READ_DATA | FILE_READ_ATTRIBUTES | FILE_READ_EA | ACCESS_MASK_SYNCHRONIZE, \
+		ACCESS_MASK_READ_CONTROL | FILE_WRITE_DATA | FILE_WRITE_ATTRIBUTES | FILE_WRITE_EA | FILE_APPEND_DATA | \
+		ACCESS_MASK_SYNCHRONIZE, \
+		ACCESS_MASK_READ_CONTROL | FILE_READ_ATTRIBUTES | FILE_EXECUTE | ACCESS_MASK_SYNCHRONIZE, \
+		ACCESS_MASK_STANDARD_RIGHTS_REQUIRED | ACCESS_MASK_SYNCHRONIZE | 511), \
+	OBJECT_CLASS_REGISTRY_KEY: ( \
+		ACCESS_MASK_READ_CONTROL | KEY_QUERY_VALUE | KEY_ENUMERATE_SUB_KEYS | KEY_NOTIFY, \
+		ACCESS_MASK_READ_CONTROL | KEY_SET_VALUE | KEY_CREATE_SUB_KEY, \
+		ACCESS_MASK_READ_CONTROL | KEY_QUERY_VALUE | KEY_ENUMERATE_SUB_KEYS | KEY_NOTIFY, \
+		ACCESS_MASK_STANDARD_RIGHTS_REQUIRED | KEY_QUERY_VALUE | KEY_SET_VALUE | KEY_CREATE_SUB_KEY | \
+		KEY_ENUMERATE_SUB_KEYS | KEY_NOTIFY | KEY_CREATE_LINK) \
+}
+#Directories use the same rights bits and mapping as files
+GENERIC_MAPPINGS[OBJECT_CLASS_DIRECTORY] = GENERIC_MAPPINGS[OBJECT_CLASS_FILE]
+
+#Mask of the generic rights, stored in the upper 4 bits of an access mask
+ACCESS_MASK_GENERIC_RIGHTS = ACCESS_MASK_GENERIC_READ | ACCESS_MASK_GENERIC_WRITE | ACCESS_MASK_GENERIC_EXECUTE | ACCESS_MASK_GENERIC_ALL
+
 #Extended Rights Objects
 #See http://technet.microsoft.com/en-us/library/ff405676.aspx for additional extended rights objects
 EXT_RIGHT_USER_CHANGE_PASSWORD=uuid.UUID('ab721a53-1e2f-11d0-9819-00aa0040529b')
@@ -388,9 +465,27 @@ def constructSystemMandatoryLabelACE(flags,mask,trusteeSIDBytes):
 
 def constructSystemResourceAttributeACE(flags,mask,trusteeSIDBytes,attributeData):
 	"""
-	Do not use, this method is not yet implemented.
+	Constructs and returns a system resource attribute access control entry byte structure from the provided information.
+	attributeData is a CLAIM_SECURITY_ATTRIBUTE_RELATIVE_V1 structure, see ClaimACEOperations.constructClaimAttribute.
+	The trustee SID is normally Everyone (S-1-1-0) and the mask 0.
 	"""
-	raise Exception("System Resource Attribute ACEs are not implemented.")
+	#check flags validity
+	if flags not in range(0,256):
+		raise Exception("The flags provided to constructSystemResourceAttributeACE were not valid. " \
+						+ "ACE flags must be an integer between 0 and 255.")
+	#check mask validity
+	if not (mask >= 0 and mask <= 4294967295):
+		raise Exception("The mask provided to constructSystemResourceAttributeACE was not valid.")
+	#check sid validity
+	if not SIDOperations.sidIsValid(trusteeSIDBytes):
+		raise Exception("The provided SID is not valid.  See http://msdn.microsoft.com/en-us/library/gg465313.aspx for correct SID structure.")
+
+	#the attribute data is padded so the ACE size is a multiple of four
+	aceActualSize = 8 + len(trusteeSIDBytes) + len(attributeData)
+	paddingBytes = "\x00" * ((4 - aceActualSize % 4) % 4)
+	aceSizeBytes = struct.pack("<H",aceActualSize+len(paddingBytes))
+	return struct.pack("<BB",ACE_TYPE_SYSTEM_RESOURCE_ATTRIBUTE,flags)+aceSizeBytes+struct.pack("<I",mask) \
+		   +trusteeSIDBytes+attributeData+paddingBytes
 
 def constructSystemScopedPolicyIdACE(flags,mask,trusteeSIDBytes):
 	"""
@@ -525,6 +620,65 @@ def getACETrusteeSID(aceBytes):
 	aceSIDLength = 8 + 4*aceSIDSubAuthCount 
 	return aceBytes[aceSIDOffset:aceSIDOffset+aceSIDLength]
 	
+def getACEAlignmentKey(aclBytes,aceOffset):
+	"""
+	Returns the key used to align the ACE starting at aceOffset within the provided ACL:
+	(type, flags, trustee SID bytes, objectType GUID bytes, inheritedObjectType GUID bytes).
+	GUID fields that are not present in the ACE are returned as empty strings.
+	The key is read straight from the ACE header, the ACE is not copied out of the ACL.
+	"""
+	aceType,aceFlags = struct.unpack_from("<BB",aclBytes,aceOffset)
+	objectTypeBytes = ""
+	inheritedObjectTypeBytes = ""
+	if aceType in OBJECT_ACE_TYPES:
+		objectFlags = struct.unpack_from("<I",aclBytes,aceOffset+8)[0]
+		sidOffset = aceOffset+12
+		if objectFlags & ACE_OBJECT_TYPE_PRESENT:
+			objectTypeBytes = aclBytes[sidOffset:sidOffset+16]
+			sidOffset += 16
+		if objectFlags & ACE_INHERITED_OBJECT_TYPE_PRESENT:
+			inheritedObjectTypeBytes = aclBytes[sidOffset:sidOffset+16]
+			sidOffset += 16
+	else:
+		sidOffset = aceOffset+8
+	#sid size = 8 bytes for header + 4 bytes*number of sub authorities
+	subAuthCount = struct.unpack_from("<B",aclBytes,sidOffset+1)[0]
+	trusteeSIDBytes = aclBytes[sidOffset:sidOffset+8+(4*subAuthCount)]
+	return (aceType,aceFlags,trusteeSIDBytes,objectTypeBytes,inheritedObjectTypeBytes)
+
+def getACEApplicationDataOffset(aceBytes):
+	"""
+	Given a bytestring representing a callback or resource attribute ACE, return the offset of the application data
+	that follows the trustee SID (as an integer)
+	"""
+	aceType = getACEType(aceBytes)
+	if aceType in (ACE_TYPE_ACCESS_ALLOWED_CALLBACK, \
+				   ACE_TYPE_ACCESS_DENIED_CALLBACK, \
+				   ACE_TYPE_SYSTEM_AUDIT_CALLBACK, \
+				   ACE_TYPE_SYSTEM_RESOURCE_ATTRIBUTE):
+		aceSIDOffset = 8
+	elif aceType in (ACE_TYPE_ACCESS_ALLOWED_CALLBACK_OBJECT, \
+					 ACE_TYPE_ACCESS_DENIED_CALLBACK_OBJECT, \
+					 ACE_TYPE_SYSTEM_AUDIT_CALLBACK_OBJECT):
+		#each objectType GUID that is present moves the SID by 16 bytes
+		objectflags = getACEObjectTypeFlags(aceBytes)
+		aceSIDOffset = 12
+		if objectflags & ACE_OBJECT_TYPE_PRESENT:
+			aceSIDOffset += 16
+		if objectflags & ACE_INHERITED_OBJECT_TYPE_PRESENT:
+			aceSIDOffset += 16
+	else:
+		raise Exception("The ACE provided does not contain application data.")
+	aceSIDSubAuthCount = struct.unpack("<B",aceBytes[aceSIDOffset+1])[0]
+	return aceSIDOffset+8+4*aceSIDSubAuthCount
+
+def getACEApplicationData(aceBytes):
+	"""
+	Given a bytestring representing a callback or resource attribute ACE, return the application data that follows the
+	trustee SID, such as a conditional expression, including any padding up to the length reported by the ACE
+	"""
+	return aceBytes[getACEApplicationDataOffset(aceBytes):getACELength(aceBytes)]
+
 def aceFlagsString(intAceFlags):
 	"""
 	Given the integer representation of an ACE Flags bitfield, return the selected mask options as a descriptor string.
@@ -601,6 +755,57 @@ def aceMaskString(intAceMask):
 		lstMasks.append("ADS_RIGHT_DS_CONTROL_ACCESS")
 	return " | ".join(lstMasks)
 	
+def _buildGenericMaskTable(genericMapping):
+	"""
+	Returns a tuple of the rights each of the 16 combinations of generic rights maps to, indexed by mask >> 28
+	"""
+	genericReadMapping,genericWriteMapping,genericExecuteMapping,genericAllMapping = genericMapping
+	lstRights = []
+	for genericRights in range(16):
+		intRights = 0
+		if genericRights & (ACCESS_MASK_GENERIC_READ >> 28):
+			intRights |= genericReadMapping
+		if genericRights & (ACCESS_MASK_GENERIC_WRITE >> 28):
+			intRights |= genericWriteMapping
+		if genericRights & (ACCESS_MASK_GENERIC_EXECUTE >> 28):
+			intRights |= genericExecuteMapping
+		if genericRights & (ACCESS_MASK_GENERIC_ALL >> 28):
+			intRights |= genericAllMapping
+		lstRights.append(intRights)
+	return tuple(lstRights)
+
+"""Per object class table of the rights the generic rights of a mask map to, see mapGenericMask"""
+GENERIC_MASK_TABLES = dict([(objectClass,_buildGenericMaskTable(genericMapping)) \
+							for objectClass,genericMapping in GENERIC_MAPPINGS.items()])
+
+def mapGenericMask(intAceMask,objectClass):
+	"""
+	Given the integer representation of an ACE Mask and the object class it applies to, return the mask with its
+	generic rights replaced by the object specific rights they map to, as MapGenericMask does.
+	"""
+	return (intAceMask & ~ACCESS_MASK_GENERIC_RIGHTS) | GENERIC_MASK_TABLES[objectClass][intAceMask >> 28]
+
+def maskGrantsRights(intAceMask,intRights,objectClass):
+	"""
+	Returns True if the ACE Mask includes all of the provided object specific rights once its generic rights are mapped.
+	"""
+	return (mapGenericMask(intAceMask,objectClass) & intRights) == intRights
+
+def normalizeMaskColumn(maskColumn,objectClass):
+	"""
+	Maps the generic rights of every mask in a column of 32-bit masks in native byte order, such as the "access_mask"
+	column of pyfwnt access_control_list.export_entries(), in place. After this the masks can be checked with plain
+	bitwise operations. The column is rewritten by pyfwnt in a single pass when available.
+	"""
+	if pyfwnt is not None:
+		pyfwnt.map_generic_rights(maskColumn,GENERIC_MAPPINGS[objectClass])
+		return
+	maskTable = GENERIC_MASK_TABLES[objectClass]
+	masks = array.array("I")
+	masks.fromstring(str(maskColumn))
+	masks = array.array("I",[(mask & 0x0FFFFFFF) | maskTable[mask >> 28] for mask in masks])
+	maskColumn[:] = masks.tostring()
+
 def aceTypeName(intAceType):
 	"""
 	Given the integer representation of an ACE Type, return the type as a descriptor string.
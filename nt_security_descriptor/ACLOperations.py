@@ -5,6 +5,12 @@ import ACEOperations
 ACL_TYPE_DACL = 0
 ACL_TYPE_SACL = 1
 
+"""ACE types that deny access"""
+DENY_ACE_TYPES = frozenset([ACEOperations.ACE_TYPE_ACCESS_DENIED, \
+							ACEOperations.ACE_TYPE_ACCESS_DENIED_OBJECT, \
+							ACEOperations.ACE_TYPE_ACCESS_DENIED_CALLBACK, \
+							ACEOperations.ACE_TYPE_ACCESS_DENIED_CALLBACK_OBJECT])
+
 def getACEIndex(aclBytes,aceBytes):
 	"""
 	Returns the index of the provided ACE bytes within the provided ACL or -1 if it is not present in the ACL.
@@ -111,7 +117,7 @@ def addACEtoACL(aclBytes,aceBytes):
 				iInsertionIndex = i
 				break	
 		if iInsertionIndex == -1:
-			iInsertionIndex = len(lstAceRanks)-1
+			iInsertionIndex = len(lstAceRanks)
 			
 		#create a list of aceBytes from the existing aces, then insert the new ace at the insertion index
 		lstCurrentAclAces.insert(iInsertionIndex,aceBytes)
@@ -170,3 +176,53 @@ def removeACEfromACL(aclBytes,aceIndex):
 	newACLBytes = aclRevisionByte + aclSbz1Byte + aclSizeBytes + aclAceCountBytes + aclSbz2Bytes + aclBytesBeforeACE + aclBytesAfterACE
 	
 	return newACLBytes
+
+def getACECanonicalGroup(aclBytes,aceOffset):
+	"""
+	Returns the canonical order group of the ACE starting at aceOffset within the provided ACL, reading only its header:
+		0: explicit DENY ACE
+		1: explicit GRANT ACE
+		2: inherited ACE
+	Windows only requires these groups to be in order, so the order of the ACEs within a group is not considered.
+	"""
+	aceType,aceFlags = struct.unpack_from("<BB",aclBytes,aceOffset)
+	if aceFlags & ACEOperations.ACE_FLAG_INHERITED:
+		return 2
+	if aceType in DENY_ACE_TYPES:
+		return 0
+	return 1
+
+def getNonCanonicalACEIndex(aclBytes):
+	"""
+	Returns the index of the first ACE in the provided ACL that is out of canonical order, or -1 if the ACL is canonical.
+	"""
+	previousGroup = 0
+	aceIndex = 0
+	for aceOffset,aceLength in getACEPositionsList(aclBytes):
+		group = getACECanonicalGroup(aclBytes,aceOffset)
+		if group < previousGroup:
+			return aceIndex
+		previousGroup = group
+		aceIndex += 1
+	return -1
+
+def aclIsCanonical(aclBytes):
+	"""
+	Returns true if the ACEs in the provided ACL are in canonical order
+	"""
+	return getNonCanonicalACEIndex(aclBytes) == -1
+
+def canonicalizeACL(aclBytes):
+	"""
+	Returns the provided ACL with its ACEs sorted into canonical order: explicit DENY ACEs, explicit GRANT ACEs,
+	then inherited ACEs. The sort is stable, so the ACEs within each group keep their relative order and an ACL
+	that is already canonical is returned as-is.
+	"""
+	if len(aclBytes) == 0:
+		return aclBytes
+	lstGroupedACEs = [(getACECanonicalGroup(aclBytes,aceOffset),aceOffset,aceLength) for aceOffset,aceLength in getACEPositionsList(aclBytes)]
+	lstSortedACEs = sorted(lstGroupedACEs,key=lambda groupedACE: groupedACE[0])
+	if lstSortedACEs == lstGroupedACEs:
+		return aclBytes
+	#the ACE count and size are unchanged, so the ACL header is kept as-is
+	return aclBytes[0:8] + ''.join([aclBytes[aceOffset:aceOffset+aceLength] for group,aceOffset,aceLength in lstSortedACEs])
@@ -0,0 +1,217 @@
+import struct
+import ACEOperations
+import ACLOperations
+import PoolOperations
+import SDOperations
+
+"""
+Rewrite rules are (lstConditions,lstTransforms) tuples built from the integer constants below, e.g.
+	([(MATCH_TRUSTEE,sidBytes),(MATCH_MASK_ANY,ACEOperations.ACCESS_MASK_WRITE_DACL)],[(TRANSFORM_DROP,)])
+	([(MATCH_TRUSTEE,oldSIDBytes)],[(TRANSFORM_REPLACE_TRUSTEE,newSIDBytes)])
+An ACE matches a rule when all of its conditions hold, in which case all of its transforms are applied in order.
+Rules are plain data so they can be handed to worker processes.
+"""
+#Rule conditions
+MATCH_TYPE=0				#value is a tuple of ACE types
+MATCH_TRUSTEE=1				#value is the trustee SID bytestring
+MATCH_MASK_ANY=2			#value is a mask, matches if any of its bits are set
+MATCH_MASK_ALL=3			#value is a mask, matches if all of its bits are set
+MATCH_FLAGS_ANY=4			#value is a flags bitfield, matches if any of its bits are set
+MATCH_NOT_FLAGS=5			#value is a flags bitfield, matches if none of its bits are set
+MATCH_OBJECT_TYPE=6			#value is a uuid.UUID
+MATCH_INHERITED_OBJECT_TYPE=7	#value is a uuid.UUID
+
+#Rule transforms
+TRANSFORM_DROP=0			#no value, removes the ACE
+TRANSFORM_REPLACE_TRUSTEE=1	#value is the new trustee SID bytestring
+TRANSFORM_SET_MASK=2		#value is a mask whose bits are set
+TRANSFORM_CLEAR_MASK=3		#value is a mask whose bits are cleared, the ACE is removed if no bits remain
+TRANSFORM_SET_FLAGS=4		#value is a flags bitfield whose bits are set
+TRANSFORM_CLEAR_FLAGS=5		#value is a flags bitfield whose bits are cleared
+
+#Largest ACE or ACL size their 16-bit size fields can hold
+MAXIMUM_ACE_SIZE=65535
+MAXIMUM_ACL_SIZE=65535
+
+
+def _ruleMatches(lstConditions,aceKey,aceMask):
+	"""
+	Returns true if an ACE with the provided alignment key and mask satisfies all conditions
+	"""
+	aceType,aceFlags,trusteeSIDBytes,objectTypeBytes,inheritedObjectTypeBytes = aceKey
+	for condition,value in lstConditions:
+		if condition == MATCH_TYPE:
+			if aceType not in value:
+				return False
+		elif condition == MATCH_TRUSTEE:
+			if trusteeSIDBytes != value:
+				return False
+		elif condition == MATCH_MASK_ANY:
+			if aceMask & value == 0:
+				return False
+		elif condition == MATCH_MASK_ALL:
+			if aceMask & value != value:
+				return False
+		elif condition == MATCH_FLAGS_ANY:
+			if aceFlags & value == 0:
+				return False
+		elif condition == MATCH_NOT_FLAGS:
+			if aceFlags & value != 0:
+				return False
+		elif condition == MATCH_OBJECT_TYPE:
+			if objectTypeBytes != value.bytes_le:
+				return False
+		elif condition == MATCH_INHERITED_OBJECT_TYPE:
+			if inheritedObjectTypeBytes != value.bytes_le:
+				return False
+		else:
+			raise Exception("Invalid rewrite rule condition: " + str(condition))
+	return True
+
+def _applyTransforms(aceBytes,aceKey,lstTransforms):
+	"""
+	Applies the transforms to the provided ACE and returns the new ACE bytes, or None if the ACE is to be removed
+	"""
+	for transform in lstTransforms:
+		action = transform[0]
+		if action == TRANSFORM_DROP:
+			return None
+		elif action == TRANSFORM_REPLACE_TRUSTEE:
+			trusteeSIDBytes = aceKey[2]
+			sidOffset = 8
+			if aceKey[0] in ACEOperations.OBJECT_ACE_TYPES:
+				sidOffset = 12+len(aceKey[3])+len(aceKey[4])
+			aceBytes = aceBytes[:sidOffset] + transform[1] + aceBytes[sidOffset+len(trusteeSIDBytes):]
+			aceKey = (aceKey[0],aceKey[1],transform[1],aceKey[3],aceKey[4])
+		elif action in (TRANSFORM_SET_MASK,TRANSFORM_CLEAR_MASK):
+			aceMask = struct.unpack_from("<I",aceBytes,4)[0]
+			if action == TRANSFORM_SET_MASK:
+				aceMask |= transform[1]
+			else:
+				aceMask &= ~transform[1] & 0xffffffff
+				if aceMask == 0:
+					return None
+			aceBytes = aceBytes[:4] + struct.pack("<I",aceMask) + aceBytes[8:]
+		elif action in (TRANSFORM_SET_FLAGS,TRANSFORM_CLEAR_FLAGS):
+			aceFlags = aceKey[1]
+			if action == TRANSFORM_SET_FLAGS:
+				aceFlags |= transform[1]
+			else:
+				aceFlags &= ~transform[1] & 0xff
+			aceBytes = aceBytes[0] + struct.pack("<B",aceFlags) + aceBytes[2:]
+			aceKey = (aceKey[0],aceFlags,aceKey[2],aceKey[3],aceKey[4])
+		else:
+			raise Exception("Invalid rewrite rule transform: " + str(action))
+
+	#aceSize is the least multiple of four greater than or equal to the actual size of the entire ACE
+	aceActualSize = len(aceBytes)
+	if aceActualSize % 4 != 0:
+		aceBytes += "\x00"*(4 - aceActualSize % 4)
+	if len(aceBytes) > MAXIMUM_ACE_SIZE:
+		raise Exception("The rewritten ACE is " + str(len(aceBytes)) + " bytes, which exceeds the maximum ACE size of " \
+						+ str(MAXIMUM_ACE_SIZE) + " bytes.")
+	return aceBytes[:2] + struct.pack("<H",len(aceBytes)) + aceBytes[4:]
+
+def rewriteACL(aclBytes,lstRules,aclType=ACLOperations.ACL_TYPE_DACL,dryRun=False):
+	"""
+	Applies the rewrite rules to every ACE of the provided ACL in a single pass.
+	Returns a (newACLBytes,lstAffected) tuple where lstAffected holds an (aclType,aceIndex,oldAceBytes,newAceBytes) tuple
+	for every ACE that was changed, newAceBytes being None for removed ACEs.
+	newACLBytes is None in dry-run mode, and the provided ACL is returned as-is when no ACE was affected.
+	An ACL whose ACEs are all removed is kept as an empty ACL, since an empty DACL differs from a missing one.
+	Raises an exception if a rewritten ACE or the rewritten ACL exceeds the 65535 bytes its size field can hold.
+	"""
+	lstAffected = []
+	if len(aclBytes) == 0:
+		return (None if dryRun else aclBytes,lstAffected)
+
+	lstNewACEs = []
+	aceIndex = 0
+	for aceOffset,aceLength in ACLOperations.getACEPositionsList(aclBytes):
+		aceBytes = aclBytes[aceOffset:aceOffset+aceLength]
+		aceKey = ACEOperations.getACEAlignmentKey(aclBytes,aceOffset)
+		aceMask = struct.unpack_from("<I",aclBytes,aceOffset+4)[0]
+		newAceBytes = aceBytes
+		for lstConditions,lstTransforms in lstRules:
+			if _ruleMatches(lstConditions,aceKey,aceMask):
+				newAceBytes = _applyTransforms(newAceBytes,aceKey,lstTransforms)
+				if newAceBytes is None:
+					break
+				#later rules see the rewritten ACE
+				aceKey = ACEOperations.getACEAlignmentKey(newAceBytes,0)
+				aceMask = struct.unpack_from("<I",newAceBytes,4)[0]
+		if newAceBytes != aceBytes:
+			lstAffected.append((aclType,aceIndex,aceBytes,newAceBytes))
+		if newAceBytes is not None:
+			lstNewACEs.append(newAceBytes)
+		aceIndex += 1
+
+	if dryRun:
+		return (None,lstAffected)
+	if len(lstAffected) == 0:
+		return (aclBytes,lstAffected)
+
+	#serialize the ACL once with an updated header
+	newACEBytes = ''.join(lstNewACEs)
+	if 8+len(newACEBytes) > MAXIMUM_ACL_SIZE:
+		raise Exception("The rewritten ACL is " + str(8+len(newACEBytes)) + " bytes, which exceeds the maximum ACL size of " \
+						+ str(MAXIMUM_ACL_SIZE) + " bytes.")
+	aclHeaderBytes = aclBytes[0:2] + struct.pack("<HH",8+len(newACEBytes),len(lstNewACEs)) + aclBytes[6:8]
+	return (aclHeaderBytes+newACEBytes,lstAffected)
+
+def rewriteSecurityDescriptor(sdBytes,lstRules,lstACLTypes=(ACLOperations.ACL_TYPE_DACL,),dryRun=False):
+	"""
+	Applies the rewrite rules to the ACLs of the given types in the provided security descriptor.
+	Returns a (newSDBytes,lstAffected) tuple, see rewriteACL for lstAffected.
+	newSDBytes is None in dry-run mode and the provided descriptor when nothing was affected.
+	The new descriptor is serialized once, keeping the owner, group and ACLs in their original order.
+	"""
+	dictACLs = {}
+	lstAffected = []
+	for aclType in lstACLTypes:
+		newACLBytes,lstACLAffected = rewriteACL(SDOperations.aclBytes(sdBytes,aclType),lstRules,aclType,dryRun)
+		if len(lstACLAffected) > 0:
+			dictACLs[aclType] = newACLBytes
+			lstAffected.extend(lstACLAffected)
+
+	if dryRun:
+		return (None,lstAffected)
+	if len(lstAffected) == 0:
+		return (sdBytes,lstAffected)
+
+	#offsets are stored at: owner 4, group 8, SACL 12, DACL 16
+	lstParts = []
+	iOwnerOffset,iGroupOffset,iSACLOffset,iDACLOffset = struct.unpack_from("<IIII",sdBytes,4)
+	if iOwnerOffset != 0:
+		lstParts.append((iOwnerOffset,4,SDOperations.getOwnerSIDBytes(sdBytes)))
+	if iGroupOffset != 0:
+		lstParts.append((iGroupOffset,8,SDOperations.getGroupSIDBytes(sdBytes)))
+	if iSACLOffset != 0:
+		lstParts.append((iSACLOffset,12,dictACLs.get(ACLOperations.ACL_TYPE_SACL,SDOperations.aclBytes(sdBytes,ACLOperations.ACL_TYPE_SACL))))
+	if iDACLOffset != 0:
+		lstParts.append((iDACLOffset,16,dictACLs.get(ACLOperations.ACL_TYPE_DACL,SDOperations.aclBytes(sdBytes,ACLOperations.ACL_TYPE_DACL))))
+	lstParts.sort()
+
+	header = bytearray(sdBytes[0:20])
+	lstNewSD = []
+	iByteCount = 20
+	for originalOffset,headerOffset,partBytes in lstParts:
+		struct.pack_into("<I",header,headerOffset,iByteCount)
+		lstNewSD.append(partBytes)
+		iByteCount += len(partBytes)
+	return (str(header)+''.join(lstNewSD),lstAffected)
+
+def _rewriteSecurityDescriptorTask(task):
+	"""
+	Worker pool entry point for rewriteSecurityDescriptor
+	"""
+	sdBytes,lstRules,lstACLTypes,dryRun = task
+	return rewriteSecurityDescriptor(sdBytes,lstRules,lstACLTypes,dryRun)
+
+def rewriteSecurityDescriptorsBatch(lstSDBytes,lstRules,lstACLTypes=(ACLOperations.ACL_TYPE_DACL,),dryRun=False,workers=None):
+	"""
+	Applies the rewrite rules to every security descriptor in lstSDBytes using a pool of 'workers' processes.
+	Returns a list of rewriteSecurityDescriptor results in the order of lstSDBytes.
+	"""
+	lstTasks = [(sdBytes,lstRules,lstACLTypes,dryRun) for sdBytes in lstSDBytes]
+	return PoolOperations.poolMap(_rewriteSecurityDescriptorTask,lstTasks,workers)
@@ -0,0 +1,216 @@
+import struct
+import ACEOperations
+
+"""
+Reads the claims of SYSTEM_RESOURCE_ATTRIBUTE ACEs, the CLAIM_SECURITY_ATTRIBUTE_RELATIVE_V1 structure of [MS-DTYP]
+2.4.10.1, without copying them out of the ACE bytes. The header and value offsets of a claim are read once, names and
+values are only decoded when they are accessed.
+"""
+
+#Claim value types
+CLAIM_SECURITY_ATTRIBUTE_TYPE_INT64=0x0001
+CLAIM_SECURITY_ATTRIBUTE_TYPE_UINT64=0x0002
+CLAIM_SECURITY_ATTRIBUTE_TYPE_STRING=0x0003
+CLAIM_SECURITY_ATTRIBUTE_TYPE_SID=0x0005
+CLAIM_SECURITY_ATTRIBUTE_TYPE_BOOLEAN=0x0006
+CLAIM_SECURITY_ATTRIBUTE_TYPE_OCTET_STRING=0x0010
+
+#Claim flags
+CLAIM_SECURITY_ATTRIBUTE_NON_INHERITABLE=0x0001
+CLAIM_SECURITY_ATTRIBUTE_VALUE_CASE_SENSITIVE=0x0002
+CLAIM_SECURITY_ATTRIBUTE_USE_FOR_DENY_ONLY=0x0004
+CLAIM_SECURITY_ATTRIBUTE_DISABLED_BY_DEFAULT=0x0008
+CLAIM_SECURITY_ATTRIBUTE_DISABLED=0x0010
+CLAIM_SECURITY_ATTRIBUTE_MANDATORY=0x0020
+
+#Size of the header of a CLAIM_SECURITY_ATTRIBUTE_RELATIVE_V1 without the value offsets
+CLAIM_SECURITY_ATTRIBUTE_HEADER_SIZE=16
+
+CLAIM_VALUE_TYPE_NAMES = { \
+	CLAIM_SECURITY_ATTRIBUTE_TYPE_INT64: "CLAIM_SECURITY_ATTRIBUTE_TYPE_INT64", \
+	CLAIM_SECURITY_ATTRIBUTE_TYPE_UINT64: "CLAIM_SECURITY_ATTRIBUTE_TYPE_UINT64", \
+	CLAIM_SECURITY_ATTRIBUTE_TYPE_STRING: "CLAIM_SECURITY_ATTRIBUTE_TYPE_STRING", \
+	CLAIM_SECURITY_ATTRIBUTE_TYPE_SID: "CLAIM_SECURITY_ATTRIBUTE_TYPE_SID", \
+	CLAIM_SECURITY_ATTRIBUTE_TYPE_BOOLEAN: "CLAIM_SECURITY_ATTRIBUTE_TYPE_BOOLEAN", \
+	CLAIM_SECURITY_ATTRIBUTE_TYPE_OCTET_STRING: "CLAIM_SECURITY_ATTRIBUTE_TYPE_OCTET_STRING" \
+}
+
+def _findUTF16Terminator(data,offset,endOffset):
+	"""
+	Returns the offset of the 16-bit null terminator of the UTF-16 string at offset
+	"""
+	terminatorOffset = data.find("\x00\x00",offset,endOffset)
+	while terminatorOffset != -1 and (terminatorOffset - offset) % 2 != 0:
+		terminatorOffset = data.find("\x00\x00",terminatorOffset+1,endOffset)
+	if terminatorOffset == -1:
+		raise Exception("Malformed claim: the string at offset " + str(offset) + " is not terminated.")
+	return terminatorOffset
+
+class ClaimAttribute(object):
+	"""
+	View of the claim in a SYSTEM_RESOURCE_ATTRIBUTE ACE. The ACE bytes are referenced, not copied.
+	Values are decoded per index on access: integers as int or long, booleans as bool, strings as unicode and
+	SIDs and octet strings as bytestrings. SIDs can be made readable with SIDOperations.bytesAsReadableSID.
+	"""
+	def __init__(self,aceBytes):
+		if ACEOperations.getACEType(aceBytes) != ACEOperations.ACE_TYPE_SYSTEM_RESOURCE_ATTRIBUTE:
+			raise Exception("The ACE provided is not a system resource attribute ACE.")
+		self._data = aceBytes
+		self._startOffset = ACEOperations.getACEApplicationDataOffset(aceBytes)
+		self._endOffset = min(ACEOperations.getACELength(aceBytes),len(aceBytes))
+		if self._startOffset + CLAIM_SECURITY_ATTRIBUTE_HEADER_SIZE > self._endOffset:
+			raise Exception("Malformed claim: the ACE is too small to contain a claim.")
+
+		nameOffset,self.valueType,reserved,self.flags,valueCount = struct.unpack_from("<IHHII",aceBytes,self._startOffset)
+		valueOffsetsOffset = self._startOffset + CLAIM_SECURITY_ATTRIBUTE_HEADER_SIZE
+		if valueOffsetsOffset + 4*valueCount > self._endOffset:
+			raise Exception("Malformed claim: the value offsets exceed the ACE.")
+		if self.valueType not in CLAIM_VALUE_TYPE_NAMES:
+			raise Exception("Malformed claim: unsupported value type " + hex(self.valueType) + ".")
+
+		#offsets in the claim are relative to its start, resolve them to offsets in the ACE bytes
+		self._nameOffset = self._resolveOffset(nameOffset)
+		self._valueOffsets = tuple([self._resolveOffset(valueOffset) for valueOffset in \
+									struct.unpack_from("<" + str(valueCount) + "I",aceBytes,valueOffsetsOffset)])
+		self._name = None
+
+	def _resolveOffset(self,relativeOffset):
+		"""
+		Returns the offset in the ACE bytes of an offset relative to the start of the claim
+		"""
+		offset = self._startOffset + relativeOffset
+		if relativeOffset < CLAIM_SECURITY_ATTRIBUTE_HEADER_SIZE or offset >= self._endOffset:
+			raise Exception("Malformed claim: offset " + str(relativeOffset) + " is outside of the claim.")
+		return offset
+
+	def _readOctetString(self,offset):
+		"""
+		Returns the bytes of the CLAIM_SECURITY_ATTRIBUTE_OCTET_STRING_RELATIVE at offset
+		"""
+		if offset + 4 > self._endOffset:
+			raise Exception("Malformed claim: the value at offset " + str(offset) + " exceeds the ACE.")
+		length = struct.unpack_from("<I",self._data,offset)[0]
+		if offset + 4 + length > self._endOffset:
+			raise Exception("Malformed claim: the value at offset " + str(offset) + " exceeds the ACE.")
+		return self._data[offset+4:offset+4+length]
+
+	@property
+	def name(self):
+		"""
+		The name of the claim as a unicode string, decoded on first access
+		"""
+		if self._name is None:
+			terminatorOffset = _findUTF16Terminator(self._data,self._nameOffset,self._endOffset)
+			self._name = self._data[self._nameOffset:terminatorOffset].decode("utf-16-le")
+		return self._name
+
+	@property
+	def valueTypeString(self):
+		"""
+		The name of the value type of the claim
+		"""
+		return CLAIM_VALUE_TYPE_NAMES[self.valueType]
+
+	def __len__(self):
+		return len(self._valueOffsets)
+
+	def __getitem__(self,index):
+		offset = self._valueOffsets[index]
+		if self.valueType in (CLAIM_SECURITY_ATTRIBUTE_TYPE_INT64, \
+							  CLAIM_SECURITY_ATTRIBUTE_TYPE_UINT64, \
+							  CLAIM_SECURITY_ATTRIBUTE_TYPE_BOOLEAN):
+			if offset + 8 > self._endOffset:
+				raise Exception("Malformed claim: the value at offset " + str(offset) + " exceeds the ACE.")
+			if self.valueType == CLAIM_SECURITY_ATTRIBUTE_TYPE_INT64:
+				return struct.unpack_from("<q",self._data,offset)[0]
+			value = struct.unpack_from("<Q",self._data,offset)[0]
+			if self.valueType == CLAIM_SECURITY_ATTRIBUTE_TYPE_BOOLEAN:
+				return value != 0
+			return value
+		if self.valueType == CLAIM_SECURITY_ATTRIBUTE_TYPE_STRING:
+			terminatorOffset = _findUTF16Terminator(self._data,offset,self._endOffset)
+			return self._data[offset:terminatorOffset].decode("utf-16-le")
+		return self._readOctetString(offset)
+
+	def __iter__(self):
+		for index in xrange(len(self._valueOffsets)):
+			yield self[index]
+
+	def isDisabled(self):
+		"""
+		Returns True if the claim is disabled
+		"""
+		return (self.flags & CLAIM_SECURITY_ATTRIBUTE_DISABLED) != 0
+
+	def containsValue(self,value):
+		"""
+		Returns True if one of the values of the claim equals value, decoding values only until a match is found.
+		Strings are compared case-insensitively unless the claim is flagged as case sensitive.
+		"""
+		if self.valueType == CLAIM_SECURITY_ATTRIBUTE_TYPE_STRING and \
+		   not self.flags & CLAIM_SECURITY_ATTRIBUTE_VALUE_CASE_SENSITIVE:
+			value = value.lower()
+			for claimValue in self:
+				if claimValue.lower() == value:
+					return True
+			return False
+		for claimValue in self:
+			if claimValue == value:
+				return True
+		return False
+
+def getClaimAttribute(aceBytes):
+	"""
+	Given a bytestring representing a system resource attribute ACE, return a ClaimAttribute view of its claim
+	"""
+	return ClaimAttribute(aceBytes)
+
+def iterClaimAttributes(lstAceBytes,strName=None):
+	"""
+	Given a list of bytestrings representing ACEs, yield a ClaimAttribute for each system resource attribute ACE,
+	optionally only those whose claim name equals strName case-insensitively
+	"""
+	if strName is not None:
+		strName = strName.lower()
+	for aceBytes in lstAceBytes:
+		if ACEOperations.getACEType(aceBytes) != ACEOperations.ACE_TYPE_SYSTEM_RESOURCE_ATTRIBUTE:
+			continue
+		claimAttribute = ClaimAttribute(aceBytes)
+		if strName is None or claimAttribute.name.lower() == strName:
+			yield claimAttribute
+
+def constructClaimAttribute(strName,intValueType,lstValues,intFlags=0):
+	"""
+	Constructs and returns a CLAIM_SECURITY_ATTRIBUTE_RELATIVE_V1 byte structure from the provided information, for use
+	with ACEOperations.constructSystemResourceAttributeACE. Strings are provided as unicode, SIDs and octet strings as
+	bytestrings.
+	"""
+	if intValueType not in CLAIM_VALUE_TYPE_NAMES:
+		raise Exception("The value type provided to constructClaimAttribute was not valid.")
+	if intFlags < 0 or intFlags > 0xffffffff:
+		raise Exception("The flags provided to constructClaimAttribute were not valid.")
+
+	lstValueBytes = []
+	for value in lstValues:
+		if intValueType == CLAIM_SECURITY_ATTRIBUTE_TYPE_INT64:
+			lstValueBytes.append(struct.pack("<q",value))
+		elif intValueType == CLAIM_SECURITY_ATTRIBUTE_TYPE_UINT64:
+			lstValueBytes.append(struct.pack("<Q",value))
+		elif intValueType == CLAIM_SECURITY_ATTRIBUTE_TYPE_BOOLEAN:
+			lstValueBytes.append(struct.pack("<Q",int(bool(value))))
+		elif intValueType == CLAIM_SECURITY_ATTRIBUTE_TYPE_STRING:
+			lstValueBytes.append(unicode(value).encode("utf-16-le") + "\x00\x00")
+		else:
+			lstValueBytes.append(struct.pack("<I",len(value)) + str(value))
+
+	#the name and values follow the header and value offsets in order
+	nameBytes = unicode(strName).encode("utf-16-le") + "\x00\x00"
+	nameOffset = CLAIM_SECURITY_ATTRIBUTE_HEADER_SIZE + 4*len(lstValueBytes)
+	lstValueOffsets = []
+	valueOffset = nameOffset + len(nameBytes)
+	for valueBytes in lstValueBytes:
+		lstValueOffsets.append(valueOffset)
+		valueOffset += len(valueBytes)
+	return struct.pack("<IHHII",nameOffset,intValueType,0,intFlags,len(lstValueBytes)) \
+		   + struct.pack("<" + str(len(lstValueOffsets)) + "I",*lstValueOffsets) \
+		   + nameBytes + "".join(lstValueBytes)
@@ -0,0 +1,480 @@
+import struct
+import ACEOperations
+
+"""
+Evaluates the conditional expressions of callback ACEs, the "artx" application data of [MS-DTYP] 2.4.4.17, against
+claim sets. The postfix bytecode of an expression is compiled once into a tree of Python closures, which is cached by
+the application data bytes, so evaluating an expression against many claim sets never parses it again.
+Results use three-valued logic: True, False or None for UNKNOWN, for example when a claim the expression refers to
+is not present in the claim set.
+"""
+CONDITIONAL_EXPRESSION_SIGNATURE="artx"
+
+#Conditional expression token types
+TOKEN_PADDING=0x00
+TOKEN_INT8=0x01
+TOKEN_INT16=0x02
+TOKEN_INT32=0x03
+TOKEN_INT64=0x04
+TOKEN_UNICODE_STRING=0x10
+TOKEN_OCTET_STRING=0x18
+TOKEN_COMPOSITE=0x50
+TOKEN_SID=0x51
+TOKEN_EQUALS=0x80
+TOKEN_NOT_EQUALS=0x81
+TOKEN_LESS_THAN=0x82
+TOKEN_LESS_THAN_OR_EQUAL=0x83
+TOKEN_GREATER_THAN=0x84
+TOKEN_GREATER_THAN_OR_EQUAL=0x85
+TOKEN_CONTAINS=0x86
+TOKEN_EXISTS=0x87
+TOKEN_ANY_OF=0x88
+TOKEN_MEMBER_OF=0x89
+TOKEN_DEVICE_MEMBER_OF=0x8a
+TOKEN_MEMBER_OF_ANY=0x8b
+TOKEN_DEVICE_MEMBER_OF_ANY=0x8c
+TOKEN_NOT_EXISTS=0x8d
+TOKEN_NOT_CONTAINS=0x8e
+TOKEN_NOT_ANY_OF=0x8f
+TOKEN_NOT_MEMBER_OF=0x90
+TOKEN_NOT_DEVICE_MEMBER_OF=0x91
+TOKEN_NOT_MEMBER_OF_ANY=0x92
+TOKEN_NOT_DEVICE_MEMBER_OF_ANY=0x93
+TOKEN_AND=0xa0
+TOKEN_OR=0xa1
+TOKEN_NOT=0xa2
+TOKEN_LOCAL_ATTRIBUTE=0xf8
+TOKEN_USER_ATTRIBUTE=0xf9
+TOKEN_RESOURCE_ATTRIBUTE=0xfa
+TOKEN_DEVICE_ATTRIBUTE=0xfb
+
+#Indexes of the members of a claim set, see prepareClaimSet
+CLAIM_SET_LOCAL=0
+CLAIM_SET_USER=1
+CLAIM_SET_RESOURCE=2
+CLAIM_SET_DEVICE=3
+CLAIM_SET_USER_SIDS=4
+CLAIM_SET_DEVICE_SIDS=5
+
+#Maximum number of compiled expressions that are cached, the cache is emptied when it is full
+MAX_CACHED_EXPRESSIONS=4096
+
+INTEGER_TOKENS = frozenset([TOKEN_INT8,TOKEN_INT16,TOKEN_INT32,TOKEN_INT64])
+
+ATTRIBUTE_TOKENS = { \
+	TOKEN_LOCAL_ATTRIBUTE: CLAIM_SET_LOCAL, \
+	TOKEN_USER_ATTRIBUTE: CLAIM_SET_USER, \
+	TOKEN_RESOURCE_ATTRIBUTE: CLAIM_SET_RESOURCE, \
+	TOKEN_DEVICE_ATTRIBUTE: CLAIM_SET_DEVICE \
+}
+
+RELATIONAL_TOKENS = frozenset([TOKEN_EQUALS,TOKEN_NOT_EQUALS,TOKEN_LESS_THAN,TOKEN_LESS_THAN_OR_EQUAL, \
+							   TOKEN_GREATER_THAN,TOKEN_GREATER_THAN_OR_EQUAL,TOKEN_CONTAINS,TOKEN_NOT_CONTAINS, \
+							   TOKEN_ANY_OF,TOKEN_NOT_ANY_OF])
+
+#Member of tokens: (claim set SIDs index, True if all SIDs must be present, True if the result is negated)
+MEMBER_OF_TOKENS = { \
+	TOKEN_MEMBER_OF: (CLAIM_SET_USER_SIDS,True,False), \
+	TOKEN_DEVICE_MEMBER_OF: (CLAIM_SET_DEVICE_SIDS,True,False), \
+	TOKEN_MEMBER_OF_ANY: (CLAIM_SET_USER_SIDS,False,False), \
+	TOKEN_DEVICE_MEMBER_OF_ANY: (CLAIM_SET_DEVICE_SIDS,False,False), \
+	TOKEN_NOT_MEMBER_OF: (CLAIM_SET_USER_SIDS,True,True), \
+	TOKEN_NOT_DEVICE_MEMBER_OF: (CLAIM_SET_DEVICE_SIDS,True,True), \
+	TOKEN_NOT_MEMBER_OF_ANY: (CLAIM_SET_USER_SIDS,False,True), \
+	TOKEN_NOT_DEVICE_MEMBER_OF_ANY: (CLAIM_SET_DEVICE_SIDS,False,True) \
+}
+
+#Kinds of the nodes of a compiled expression
+_NODE_LITERAL=0
+_NODE_ATTRIBUTE=1
+_NODE_RESULT=2
+
+_compiledExpressionCache = {}
+
+
+def _normalizeClaimValue(value):
+	"""
+	Returns the claim value in the form it is compared in: integers and booleans as integers, strings as lowercase
+	unicode strings and bytearrays, used for octet string and SID claims, as bytestrings
+	"""
+	if isinstance(value,bool):
+		return int(value)
+	if isinstance(value,(int,long)):
+		return value
+	if isinstance(value,unicode):
+		return value.lower()
+	if isinstance(value,str):
+		return value.decode("utf-8").lower()
+	if isinstance(value,bytearray):
+		return str(value)
+	raise Exception("Unsupported claim value type: " + type(value).__name__)
+
+def _normalizeOctetClaimValue(value):
+	"""
+	Returns the value of an octet string or SID claim as a bytestring, the value is not treated as text
+	"""
+	if isinstance(value,(str,bytearray)):
+		return str(value)
+	raise Exception("Octet string and SID claim values must be bytestrings, got: " + type(value).__name__)
+
+def _normalizeClaims(dictClaims,setOctetClaimNames):
+	"""
+	Returns a dictionary of the claims with lowercase unicode names and tuples of normalized values.
+	The values of the claims named in setOctetClaimNames are kept as bytestrings.
+	"""
+	dictNormalizedClaims = {}
+	if dictClaims is not None:
+		for name,values in dictClaims.items():
+			if isinstance(name,str):
+				name = name.decode("utf-8")
+			name = name.lower()
+			if not isinstance(values,(list,tuple,set,frozenset)):
+				values = (values,)
+			if name in setOctetClaimNames:
+				dictNormalizedClaims[name] = tuple([_normalizeOctetClaimValue(value) for value in values])
+			else:
+				dictNormalizedClaims[name] = tuple([_normalizeClaimValue(value) for value in values])
+	return dictNormalizedClaims
+
+def prepareClaimSet(userClaims=None,resourceClaims=None,deviceClaims=None,localClaims=None,userSIDs=(),deviceSIDs=(),octetClaimNames=()):
+	"""
+	Returns a claim set that compiled expressions are evaluated against. Claims are dictionaries of claim name to a value
+	or a list of values, claim names and string values are compared case-insensitively. userSIDs and deviceSIDs are the
+	SID bytestrings of the user and device tokens used by the Member_of operators.
+	A str value is text unless its claim is named in octetClaimNames: list the octet string and SID claims there so
+	their raw byte values, like the bytestrings used throughout this package, compare against octet string and SID
+	literals. Values passed as bytearray are always treated as bytes.
+	Prepare a claim set once and reuse it for all the expressions it is evaluated against.
+	"""
+	setOctetClaimNames = frozenset([(name.decode("utf-8") if isinstance(name,str) else name).lower() for name in octetClaimNames])
+	return (_normalizeClaims(localClaims,setOctetClaimNames), \
+			_normalizeClaims(userClaims,setOctetClaimNames), \
+			_normalizeClaims(resourceClaims,setOctetClaimNames), \
+			_normalizeClaims(deviceClaims,setOctetClaimNames), \
+			frozenset([str(sidBytes) for sidBytes in userSIDs]), \
+			frozenset([str(sidBytes) for sidBytes in deviceSIDs]))
+
+def _readLengthPrefixedBytes(data,offset):
+	"""
+	Returns the bytes of the length prefixed value of the token at offset and the offset of the next token
+	"""
+	if offset+5 > len(data):
+		raise Exception("Malformed conditional expression: token at offset " + str(offset) + " exceeds the data.")
+	length = struct.unpack_from("<I",data,offset+1)[0]
+	endOffset = offset+5+length
+	if endOffset > len(data):
+		raise Exception("Malformed conditional expression: token at offset " + str(offset) + " exceeds the data.")
+	return data[offset+5:endOffset],endOffset
+
+def _readLiteral(data,offset,endOffset):
+	"""
+	Returns the normalized value of the literal token at offset and the offset of the next token.
+	Composite literals are returned as a tuple of their normalized element values.
+	"""
+	tokenType = ord(data[offset])
+	if tokenType in INTEGER_TOKENS:
+		if offset+11 > endOffset:
+			raise Exception("Malformed conditional expression: integer at offset " + str(offset) + " exceeds the data.")
+		return struct.unpack_from("<q",data,offset+1)[0],offset+11
+	elif tokenType == TOKEN_UNICODE_STRING:
+		valueBytes,nextOffset = _readLengthPrefixedBytes(data,offset)
+		return valueBytes.decode("utf-16-le").lower(),nextOffset
+	elif tokenType in (TOKEN_OCTET_STRING,TOKEN_SID):
+		return _readLengthPrefixedBytes(data,offset)
+	elif tokenType == TOKEN_COMPOSITE:
+		valueBytes,nextOffset = _readLengthPrefixedBytes(data,offset)
+		lstValues = []
+		elementOffset = offset+5
+		while elementOffset < nextOffset:
+			value,elementOffset = _readLiteral(data,elementOffset,nextOffset)
+			if isinstance(value,tuple):
+				raise Exception("Malformed conditional expression: nested composite at offset " + str(elementOffset) + ".")
+			lstValues.append(value)
+		if elementOffset != nextOffset:
+			raise Exception("Malformed conditional expression: composite at offset " + str(offset) + " is truncated.")
+		return tuple(lstValues),nextOffset
+	raise Exception("Malformed conditional expression: unsupported literal token " + hex(tokenType) + \
+					" at offset " + str(offset) + ".")
+
+def _valueKind(value):
+	"""
+	Returns the kind of a normalized value, values of different kinds are never equal or ordered
+	"""
+	if isinstance(value,(int,long)):
+		return 0
+	if isinstance(value,unicode):
+		return 1
+	return 2
+
+def _compileOperand(node):
+	"""
+	Returns a function that returns the tuple of values of an operand node, or None if it is an absent attribute
+	"""
+	nodeKind,function,constantValues = node
+	if nodeKind == _NODE_RESULT:
+		raise Exception("Malformed conditional expression: a logical result is used as an operand.")
+	return function
+
+def _compileResult(node):
+	"""
+	Returns a function that returns the logical result of a node. Literals and attributes are converted as in
+	[MS-DTYP]: a single non-zero integer or non-empty string is TRUE, absent attributes and other values are UNKNOWN.
+	"""
+	nodeKind,function,constantValues = node
+	if nodeKind == _NODE_RESULT:
+		return function
+
+	def evaluate(claimSet):
+		values = function(claimSet)
+		if values is None or len(values) != 1:
+			return None
+		value = values[0]
+		if isinstance(value,(int,long)):
+			return value != 0
+		return len(value) > 0
+	return evaluate
+
+def _compileRelational(tokenType,lhsNode,rhsNode):
+	"""
+	Returns the evaluation function of a relational operator. Equality of multi-valued operands is set equality,
+	the ordering operators require single values of the same kind. A literal right-hand side is prepared once here.
+	"""
+	lhsFunction = _compileOperand(lhsNode)
+	rhsFunction = _compileOperand(rhsNode)
+	rhsConstant = rhsNode[2]
+	negate = tokenType in (TOKEN_NOT_EQUALS,TOKEN_NOT_CONTAINS,TOKEN_NOT_ANY_OF)
+
+	if tokenType in (TOKEN_EQUALS,TOKEN_NOT_EQUALS):
+		def compare(lhsValues,rhsValues,rhsSet):
+			if len(lhsValues) == 1 and len(rhsValues) == 1:
+				if _valueKind(lhsValues[0]) != _valueKind(rhsValues[0]):
+					return None
+				return lhsValues[0] == rhsValues[0]
+			return frozenset(lhsValues) == rhsSet
+	elif tokenType in (TOKEN_CONTAINS,TOKEN_NOT_CONTAINS):
+		def compare(lhsValues,rhsValues,rhsSet):
+			return rhsSet.issubset(lhsValues)
+	elif tokenType in (TOKEN_ANY_OF,TOKEN_NOT_ANY_OF):
+		def compare(lhsValues,rhsValues,rhsSet):
+			return not rhsSet.isdisjoint(lhsValues)
+	else:
+		if tokenType == TOKEN_LESS_THAN:
+			order = lambda lhsValue,rhsValue: lhsValue < rhsValue
+		elif tokenType == TOKEN_LESS_THAN_OR_EQUAL:
+			order = lambda lhsValue,rhsValue: lhsValue <= rhsValue
+		elif tokenType == TOKEN_GREATER_THAN:
+			order = lambda lhsValue,rhsValue: lhsValue > rhsValue
+		else:
+			order = lambda lhsValue,rhsValue: lhsValue >= rhsValue
+
+		def compare(lhsValues,rhsValues,rhsSet):
+			if len(lhsValues) != 1 or len(rhsValues) != 1:
+				return None
+			if _valueKind(lhsValues[0]) != _valueKind(rhsValues[0]):
+				return None
+			return order(lhsValues[0],rhsValues[0])
+
+	if rhsConstant is not None:
+		rhsConstantSet = frozenset(rhsConstant)
+
+		def evaluate(claimSet):
+			lhsValues = lhsFunction(claimSet)
+			if lhsValues is None:
+				return None
+			result = compare(lhsValues,rhsConstant,rhsConstantSet)
+			if negate and result is not None:
+				return not result
+			return result
+	else:
+		def evaluate(claimSet):
+			lhsValues = lhsFunction(claimSet)
+			rhsValues = rhsFunction(claimSet)
+			if lhsValues is None or rhsValues is None:
+				return None
+			result = compare(lhsValues,rhsValues,frozenset(rhsValues))
+			if negate and result is not None:
+				return not result
+			return result
+	return evaluate
+
+def _compileMemberOf(tokenType,operandNode):
+	"""
+	Returns the evaluation function of a Member_of operator, the operand contains the SIDs to check for
+	"""
+	sidsIndex,requireAll,negate = MEMBER_OF_TOKENS[tokenType]
+	operandFunction = _compileOperand(operandNode)
+	operandConstant = operandNode[2]
+	if operandConstant is not None:
+		operandConstantSet = frozenset(operandConstant)
+		operandFunction = lambda claimSet: operandConstantSet
+
+	def evaluate(claimSet):
+		sids = operandFunction(claimSet)
+		if sids is None:
+			return None
+		if requireAll:
+			result = claimSet[sidsIndex].issuperset(sids)
+		else:
+			result = not claimSet[sidsIndex].isdisjoint(sids)
+		if negate:
+			return not result
+		return result
+	return evaluate
+
+def _compileExists(tokenType,operandNode):
+	"""
+	Returns the evaluation function of an Exists operator, the operand must be an attribute
+	"""
+	nodeKind,operandFunction,constantValues = operandNode
+	if nodeKind != _NODE_ATTRIBUTE:
+		raise Exception("Malformed conditional expression: the operand of Exists is not an attribute.")
+	if tokenType == TOKEN_EXISTS:
+		return lambda claimSet: operandFunction(claimSet) is not None
+	return lambda claimSet: operandFunction(claimSet) is None
+
+def _compileLogical(tokenType,lstOperandNodes):
+	"""
+	Returns the evaluation function of a logical operator using three-valued logic, && and || short-circuit
+	"""
+	if tokenType == TOKEN_NOT:
+		operandFunction = _compileResult(lstOperandNodes[0])
+
+		def evaluate(claimSet):
+			result = operandFunction(claimSet)
+			if result is None:
+				return None
+			return not result
+		return evaluate
+
+	lhsFunction = _compileResult(lstOperandNodes[0])
+	rhsFunction = _compileResult(lstOperandNodes[1])
+	if tokenType == TOKEN_AND:
+		def evaluate(claimSet):
+			lhsResult = lhsFunction(claimSet)
+			if lhsResult is False:
+				return False
+			rhsResult = rhsFunction(claimSet)
+			if rhsResult is False:
+				return False
+			if lhsResult is None or rhsResult is None:
+				return None
+			return True
+	else:
+		def evaluate(claimSet):
+			lhsResult = lhsFunction(claimSet)
+			if lhsResult is True:
+				return True
+			rhsResult = rhsFunction(claimSet)
+			if rhsResult is True:
+				return True
+			if lhsResult is None or rhsResult is None:
+				return None
+			return False
+	return evaluate
+
+def _compileAttribute(claimSetIndex,name):
+	"""
+	Returns the node of an attribute, its function returns the values of the claim or None if it is not present
+	"""
+	return (_NODE_ATTRIBUTE,lambda claimSet: claimSet[claimSetIndex].get(name),None)
+
+def _compileExpression(appDataBytes):
+	"""
+	Parses the postfix tokens of a conditional expression and returns the evaluation function of its root node
+	"""
+	if not appDataBytes.startswith(CONDITIONAL_EXPRESSION_SIGNATURE):
+		raise Exception("The application data does not contain a conditional expression.")
+	lstNodes = []
+	offset = len(CONDITIONAL_EXPRESSION_SIGNATURE)
+	while offset < len(appDataBytes):
+		tokenType = ord(appDataBytes[offset])
+		if tokenType == TOKEN_PADDING:
+			if appDataBytes[offset:].strip("\x00") != "":
+				raise Exception("Malformed conditional expression: data after padding at offset " + str(offset) + ".")
+			break
+		if tokenType in ATTRIBUTE_TOKENS:
+			nameBytes,offset = _readLengthPrefixedBytes(appDataBytes,offset)
+			lstNodes.append(_compileAttribute(ATTRIBUTE_TOKENS[tokenType],nameBytes.decode("utf-16-le").lower()))
+			continue
+		if tokenType < TOKEN_EQUALS:
+			value,offset = _readLiteral(appDataBytes,offset,len(appDataBytes))
+			if not isinstance(value,tuple):
+				value = (value,)
+			lstNodes.append((_NODE_LITERAL,lambda claimSet,value=value: value,value))
+			continue
+
+		if tokenType in RELATIONAL_TOKENS or tokenType in (TOKEN_AND,TOKEN_OR):
+			numberOfOperands = 2
+		elif tokenType in MEMBER_OF_TOKENS or tokenType in (TOKEN_EXISTS,TOKEN_NOT_EXISTS,TOKEN_NOT):
+			numberOfOperands = 1
+		else:
+			raise Exception("Malformed conditional expression: unsupported token " + hex(tokenType) + \
+							" at offset " + str(offset) + ".")
+		if len(lstNodes) < numberOfOperands:
+			raise Exception("Malformed conditional expression: missing operand at offset " + str(offset) + ".")
+		lstOperandNodes = lstNodes[-numberOfOperands:]
+		del lstNodes[-numberOfOperands:]
+
+		if tokenType in RELATIONAL_TOKENS:
+			function = _compileRelational(tokenType,lstOperandNodes[0],lstOperandNodes[1])
+		elif tokenType in MEMBER_OF_TOKENS:
+			function = _compileMemberOf(tokenType,lstOperandNodes[0])
+		elif tokenType in (TOKEN_EXISTS,TOKEN_NOT_EXISTS):
+			function = _compileExists(tokenType,lstOperandNodes[0])
+		else:
+			function = _compileLogical(tokenType,lstOperandNodes)
+		lstNodes.append((_NODE_RESULT,function,None))
+		offset += 1
+
+	if len(lstNodes) != 1:
+		raise Exception("Malformed conditional expression: " + str(len(lstNodes)) + " values remain after evaluation.")
+	return _compileResult(lstNodes[0])
+
+def compileConditionalExpression(appDataBytes):
+	"""
+	Returns the evaluation function of the conditional expression in the provided application data, which takes a
+	claim set from prepareClaimSet and returns True, False or None for UNKNOWN. Compiled expressions are cached by
+	their application data bytes.
+	"""
+	appDataBytes = str(appDataBytes)
+	evaluate = _compiledExpressionCache.get(appDataBytes)
+	if evaluate is None:
+		evaluate = _compileExpression(appDataBytes)
+		if len(_compiledExpressionCache) >= MAX_CACHED_EXPRESSIONS:
+			_compiledExpressionCache.clear()
+		_compiledExpressionCache[appDataBytes] = evaluate
+	return evaluate
+
+def evaluateConditionalExpression(appDataBytes,claimSet):
+	"""
+	Evaluates the conditional expression in the provided application data against a claim set from prepareClaimSet.
+	Returns True, False or None for UNKNOWN.
+	"""
+	return compileConditionalExpression(appDataBytes)(claimSet)
+
+def evaluateConditionalExpressionBatch(appDataBytes,lstClaimSets):
+	"""
+	Evaluates the conditional expression in the provided application data against each claim set from prepareClaimSet.
+	Returns a list with the True, False or None result of each claim set.
+	"""
+	evaluate = compileConditionalExpression(appDataBytes)
+	return [evaluate(claimSet) for claimSet in lstClaimSets]
+
+def conditionalACEApplies(aceBytes,claimSet):
+	"""
+	Returns True if the callback ACE applies to the claim set. An UNKNOWN result applies to deny ACEs but not to
+	allow ACEs, as access checks treat it.
+	"""
+	result = evaluateConditionalExpression(ACEOperations.getACEApplicationData(aceBytes),claimSet)
+	if ACEOperations.aceIsDeny(aceBytes):
+		return result is not False
+	return result is True
+
+def conditionalACEAppliesBatch(aceBytes,lstClaimSets):
+	"""
+	Returns a list of whether the callback ACE applies to each of the claim sets, see conditionalACEApplies
+	"""
+	lstResults = evaluateConditionalExpressionBatch(ACEOperations.getACEApplicationData(aceBytes),lstClaimSets)
+	if ACEOperations.aceIsDeny(aceBytes):
+		return [result is not False for result in lstResults]
+	return [result is True for result in lstResults]
@@ -0,0 +1,17 @@
+import multiprocessing
+
+def poolMap(function,lstTasks,workers=None):
+	"""
+	Returns the list of function(task) for every task in lstTasks, in order, computed in a pool of 'workers' processes
+	(all CPUs when workers is None). No pool is started when workers is 1 or there are fewer than two tasks.
+	Tasks are handed out in chunks of about a quarter of each worker's share, which keeps the pool busy without
+	pickling every task separately. function must be a module level function so it can be pickled.
+	"""
+	if workers == 1 or len(lstTasks) < 2:
+		return map(function,lstTasks)
+	pool = multiprocessing.Pool(workers)
+	try:
+		return pool.map(function,lstTasks,max(1,len(lstTasks)/(4*(workers or multiprocessing.cpu_count()))))
+	finally:
+		pool.close()
+		pool.join()
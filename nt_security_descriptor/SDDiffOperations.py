@@ -0,0 +1,120 @@
+import collections
+import hashlib
+import ACEOperations
+import ACLOperations
+import SDOperations
+
+def sdDigest(sdBytes):
+	"""
+	Returns a digest of the provided security descriptor bytes.
+	Store it alongside a snapshot so diffSecurityDescriptors can short-circuit without touching the old bytes.
+	"""
+	return hashlib.sha1(sdBytes).digest()
+
+def diffACLs(oldACLBytes,newACLBytes):
+	"""
+	Compares two ACLs and returns a dictionary describing the differences, or None if the ACLs are identical:
+		"added": list of ACE bytestrings only present in the new ACL
+		"removed": list of ACE bytestrings only present in the old ACL
+		"modified": list of (oldAceBytes,newAceBytes) tuples for ACEs with the same alignment key
+					but a different mask or application data
+		"reordered": True if the ACEs common to both ACLs appear in a different order
+		"revision": (oldRevision,newRevision) if the ACL revision changed, otherwise None
+
+	ACEs are aligned on ACEOperations.getACEAlignmentKey.  Duplicate keys are paired in order of appearance.
+	Both ACLs are walked once, so the cost is linear in the number of ACEs.
+	"""
+	if oldACLBytes == newACLBytes:
+		return None
+
+	#index the old ACEs by alignment key
+	dctOldACEs = {}
+	lstOldPositions = ACLOperations.getACEPositionsList(oldACLBytes) if len(oldACLBytes) > 0 else []
+	for i in range(len(lstOldPositions)):
+		key = ACEOperations.getACEAlignmentKey(oldACLBytes,lstOldPositions[i][0])
+		if key in dctOldACEs:
+			dctOldACEs[key].append(i)
+		else:
+			dctOldACEs[key] = collections.deque([i])
+
+	lstAdded = []
+	lstModified = []
+	bMatched = [False]*len(lstOldPositions)
+	bReordered = False
+	lastMatchedIndex = -1
+	lstNewPositions = ACLOperations.getACEPositionsList(newACLBytes) if len(newACLBytes) > 0 else []
+	for newOffset,newLength in lstNewPositions:
+		newAceBytes = newACLBytes[newOffset:newOffset+newLength]
+		lstCandidates = dctOldACEs.get(ACEOperations.getACEAlignmentKey(newACLBytes,newOffset))
+		if not lstCandidates:
+			lstAdded.append(newAceBytes)
+			continue
+		i = lstCandidates.popleft()
+		bMatched[i] = True
+		if i < lastMatchedIndex:
+			bReordered = True
+		lastMatchedIndex = i
+		oldOffset,oldLength = lstOldPositions[i]
+		oldAceBytes = oldACLBytes[oldOffset:oldOffset+oldLength]
+		if oldAceBytes != newAceBytes:
+			lstModified.append((oldAceBytes,newAceBytes))
+
+	lstRemoved = []
+	for i in range(len(lstOldPositions)):
+		if not bMatched[i]:
+			oldOffset,oldLength = lstOldPositions[i]
+			lstRemoved.append(oldACLBytes[oldOffset:oldOffset+oldLength])
+
+	revisionChange = None
+	if len(oldACLBytes) > 0 and len(newACLBytes) > 0 and oldACLBytes[0] != newACLBytes[0]:
+		revisionChange = (ord(oldACLBytes[0]),ord(newACLBytes[0]))
+
+	return {"added": lstAdded, \
+			"removed": lstRemoved, \
+			"modified": lstModified, \
+			"reordered": bReordered, \
+			"revision": revisionChange}
+
+def diffSecurityDescriptors(oldSDBytes,newSDBytes,oldDigest=None,newDigest=None):
+	"""
+	Compares two self-relative security descriptors and returns None if they are identical, otherwise a dictionary with:
+		"owner": (oldOwnerSIDBytes,newOwnerSIDBytes) or None if unchanged
+		"group": (oldGroupSIDBytes,newGroupSIDBytes) or None if unchanged
+		"control": (oldControlFlags,newControlFlags) or None if unchanged
+		"dacl": the result of diffACLs for the DACLs
+		"sacl": the result of diffACLs for the SACLs
+
+	If digests from sdDigest are provided (e.g. stored with a snapshot) they are compared first, so unchanged
+	descriptors are dismissed without a byte comparison.
+	"""
+	if oldDigest is not None and newDigest is not None:
+		if oldDigest == newDigest:
+			return None
+	elif len(oldSDBytes) == len(newSDBytes) and oldSDBytes == newSDBytes:
+		return None
+
+	ownerChange = None
+	oldOwnerSIDBytes = SDOperations.getOwnerSIDBytes(oldSDBytes)
+	newOwnerSIDBytes = SDOperations.getOwnerSIDBytes(newSDBytes)
+	if oldOwnerSIDBytes != newOwnerSIDBytes:
+		ownerChange = (oldOwnerSIDBytes,newOwnerSIDBytes)
+
+	groupChange = None
+	oldGroupSIDBytes = SDOperations.getGroupSIDBytes(oldSDBytes)
+	newGroupSIDBytes = SDOperations.getGroupSIDBytes(newSDBytes)
+	if oldGroupSIDBytes != newGroupSIDBytes:
+		groupChange = (oldGroupSIDBytes,newGroupSIDBytes)
+
+	controlChange = None
+	oldControlFlags = SDOperations.getControlFlags(oldSDBytes)
+	newControlFlags = SDOperations.getControlFlags(newSDBytes)
+	if oldControlFlags != newControlFlags:
+		controlChange = (oldControlFlags,newControlFlags)
+
+	return {"owner": ownerChange, \
+			"group": groupChange, \
+			"control": controlChange, \
+			"dacl": diffACLs(SDOperations.aclBytes(oldSDBytes,ACLOperations.ACL_TYPE_DACL), \
+							 SDOperations.aclBytes(newSDBytes,ACLOperations.ACL_TYPE_DACL)), \
+			"sacl": diffACLs(SDOperations.aclBytes(oldSDBytes,ACLOperations.ACL_TYPE_SACL), \
+							 SDOperations.aclBytes(newSDBytes,ACLOperations.ACL_TYPE_SACL))}
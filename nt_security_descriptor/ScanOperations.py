@@ -0,0 +1,99 @@
+"""
+Scans raw disk and memory images for self-relative security descriptors and SIDs.
+pyfwnt prefilters every candidate offset on its header values before it fully validates it, so the image is
+never copied or parsed in Python. Hits are (offset,length) tuples in ascending order of offset, scanning resumes
+after the end of a hit hence a descriptor scan does not report the SIDs contained in the descriptors it finds.
+"""
+import mmap
+import multiprocessing
+import os
+
+try:
+	import pyfwnt
+except ImportError:
+	pyfwnt = None
+
+#Scan types
+SCAN_SECURITY_DESCRIPTORS=0
+SCAN_SIDS=1
+
+#Size of the regions an image is split into for the worker processes
+DEFAULT_REGION_SIZE=64*1024*1024
+
+
+def scanBuffer(data,scanType=SCAN_SECURITY_DESCRIPTORS,startOffset=0,endOffset=None,alignment=1):
+	"""
+	Generator of the (offset,length) hits in data, a bytestring or mmap, that start at a multiple of alignment
+	between startOffset and endOffset. A hit can extend beyond endOffset.
+	Raises an exception if the pyfwnt module, which does the scanning, could not be imported.
+	"""
+	if pyfwnt is None:
+		raise Exception("The pyfwnt module is required by scanBuffer but could not be imported.")
+	if scanType == SCAN_SIDS:
+		find = pyfwnt.find_security_identifier
+	else:
+		find = pyfwnt.find_security_descriptor
+	if endOffset is None:
+		endOffset = len(data)
+	offset = startOffset
+	while offset < endOffset:
+		hit = find(data,offset,endOffset,alignment)
+		if hit is None:
+			break
+		yield hit
+		offset = hit[0]+hit[1]
+
+def _scanRegionTask(task):
+	"""
+	Worker pool entry point for scanImage, maps the entire image so hits can extend beyond the end of the region
+	"""
+	imagePath,scanType,regionStart,regionEnd,alignment = task
+	with open(imagePath,"rb") as imageFile:
+		image = mmap.mmap(imageFile.fileno(),0,access=mmap.ACCESS_READ)
+		try:
+			return list(scanBuffer(image,scanType,regionStart,regionEnd,alignment))
+		finally:
+			image.close()
+
+def scanImage(imagePath,scanType=SCAN_SECURITY_DESCRIPTORS,alignment=1,regionSize=DEFAULT_REGION_SIZE,workers=None):
+	"""
+	Generator of the (offset,length) hits in the image file at imagePath, see scanBuffer.
+	The image is split into regions of regionSize bytes that are scanned by a pool of 'workers' processes.
+	When a hit extends into the next region that region is rescanned from the end of the hit until it is back in
+	step with the hits of its worker, so the hits are the same as those of a single scanBuffer pass.
+	"""
+	imageSize = os.path.getsize(imagePath)
+	if imageSize == 0:
+		return
+	with open(imagePath,"rb") as imageFile:
+		image = mmap.mmap(imageFile.fileno(),0,access=mmap.ACCESS_READ)
+	try:
+		lstTasks = [(imagePath,scanType,regionStart,min(regionStart+regionSize,imageSize),alignment) for regionStart in range(0,imageSize,regionSize)]
+		if workers == 1 or len(lstTasks) < 2:
+			for hit in scanBuffer(image,scanType,0,imageSize,alignment):
+				yield hit
+			return
+		pool = multiprocessing.Pool(workers)
+		try:
+			lastEnd = 0
+			for taskIndex,lstHits in enumerate(pool.imap(_scanRegionTask,lstTasks)):
+				regionStart,regionEnd = lstTasks[taskIndex][2],lstTasks[taskIndex][3]
+				hitIndex = 0
+				if lastEnd > regionStart:
+					dictHitIndexes = dict((hit,index) for index,hit in enumerate(lstHits))
+					hitIndex = len(lstHits)
+					for hit in scanBuffer(image,scanType,lastEnd,regionEnd,alignment):
+						if hit in dictHitIndexes:
+							hitIndex = dictHitIndexes[hit]
+							break
+						yield hit
+						lastEnd = hit[0]+hit[1]
+				for hit in lstHits[hitIndex:]:
+					yield hit
+					lastEnd = hit[0]+hit[1]
+		finally:
+			#the generator can be closed before all regions are scanned
+			pool.terminate()
+			pool.join()
+	finally:
+		image.close()
@@ -0,0 +1,423 @@
+import argparse
+import gc
+import json
+import struct
+import sys
+import timeit
+import uuid
+import ACEOperations
+import ACLOperations
+import SDOperations
+import SIDOperations
+
+try:
+	import tracemalloc
+except ImportError:
+	tracemalloc = None
+
+try:
+	import pyfwnt
+except ImportError:
+	pyfwnt = None
+
+"""
+Micro-benchmarks for the security descriptor helpers, run as: python benchmark.py [--profile NAME] [--output FILE]
+Every case is timed on the Python helper and, where pyfwnt provides the same operation, on the pyfwnt C path.
+Allocations per operation are the number of memory blocks and bytes an operation leaves allocated, its result
+included, averaged over a loop whose results are kept alive. With tracemalloc they are the difference between
+snapshots taken around the loop, so only memory allocated through the Python allocator is counted. The Python 2
+interpreter these helpers target has no tracemalloc, there the fallback counts the objects and sys.getsizeof bytes
+of the results, which leaves out buffers owned by C objects such as pyfwnt types.
+"""
+#Methods used to measure allocations
+ALLOCATION_METHOD_TRACEMALLOC="tracemalloc"
+ALLOCATION_METHOD_RESULT_SIZE="result size"
+
+#Descriptor profiles: (DACL explicit ACEs, DACL inherited ACEs, SACL ACEs)
+PROFILES = [ \
+	("user",(6,12,0)), \
+	("group",(24,40,8)), \
+	("ou",(120,180,1000)) \
+]
+
+#Domain used for the generated SIDs
+DOMAIN_SID = "S-1-5-21-1757981266-484763869-1060284298"
+
+#Object types used for the generated object ACEs
+OBJECT_TYPE_UUIDS = [ \
+	ACEOperations.EXT_RIGHT_USER_CHANGE_PASSWORD, \
+	uuid.UUID('bf967a86-0de6-11d0-a285-00aa003049e2'), \
+	uuid.UUID('bf967aba-0de6-11d0-a285-00aa003049e2'), \
+	uuid.UUID('4c164200-20c0-11d0-a768-00aa006e0529') \
+]
+
+#Relative increase of the time per operation over the baseline that is reported as a regression
+DEFAULT_TOLERANCE=0.2
+
+
+def generateSIDBytes(rid):
+	"""
+	Returns the bytestring of the SID of the domain account with the provided relative identifier
+	"""
+	return SIDOperations.readableSIDAsBytes(DOMAIN_SID + "-" + str(rid))
+
+def generateACL(lstACEs,revision):
+	"""
+	Returns an ACL bytestring containing the provided ACE bytestrings in order
+	"""
+	aclSize = 8+sum([len(aceBytes) for aceBytes in lstACEs])
+	return struct.pack("<BBHHH",revision,0,aclSize,len(lstACEs),0) + ''.join(lstACEs)
+
+def generateDACL(explicitACECount,inheritedACECount):
+	"""
+	Returns a directory services DACL with explicit allow ACEs followed by inherited allow ACEs, alternating between
+	simple and object ACEs, as seen on user, group and organizational unit objects.
+	"""
+	lstACEs = []
+	for i in range(explicitACECount+inheritedACECount):
+		if i < explicitACECount:
+			aceFlags = 0
+		else:
+			aceFlags = ACEOperations.ACE_FLAG_INHERITED | ACEOperations.ACE_FLAG_CONTAINER_INHERIT
+		trusteeSIDBytes = generateSIDBytes(1100+i)
+		if i % 2 == 0:
+			lstACEs.append(ACEOperations.constructSimpleACE(ACEOperations.ACE_TYPE_ACCESS_ALLOWED,aceFlags, \
+															ACEOperations.ACCESS_MASK_READ_CONTROL,trusteeSIDBytes))
+		else:
+			objectTypeUUID = OBJECT_TYPE_UUIDS[i % len(OBJECT_TYPE_UUIDS)]
+			lstACEs.append(ACEOperations.constructObjectACE(ACEOperations.ACE_TYPE_ACCESS_ALLOWED_OBJECT,aceFlags, \
+															ACEOperations.ADS_RIGHT_DS_READ_PROP,trusteeSIDBytes,objectTypeUUID))
+	return generateACL(lstACEs,4)
+
+def generateSACL(aceCount):
+	"""
+	Returns a SACL with success and failure audit ACEs for aceCount accounts, or an empty string if aceCount is 0
+	"""
+	if aceCount == 0:
+		return ""
+	lstACEs = []
+	for i in range(aceCount):
+		if i % 2 == 0:
+			aceFlags = ACEOperations.ACE_FLAG_SUCCESSFUL_ACCESS
+		else:
+			aceFlags = ACEOperations.ACE_FLAG_FAILED_ACCESS
+		lstACEs.append(ACEOperations.constructSimpleACE(ACEOperations.ACE_TYPE_SYSTEM_AUDIT,aceFlags, \
+														ACEOperations.ACCESS_MASK_WRITE_DACL,generateSIDBytes(5000+i)))
+	return generateACL(lstACEs,2)
+
+def generateSecurityDescriptor(explicitACECount,inheritedACECount,saclACECount):
+	"""
+	Returns a self-relative security descriptor bytestring stored as SACL, DACL, owner and group, like AD stores it
+	"""
+	saclBytes = generateSACL(saclACECount)
+	daclBytes = generateDACL(explicitACECount,inheritedACECount)
+	ownerSIDBytes = generateSIDBytes(512)
+	groupSIDBytes = generateSIDBytes(513)
+	controlFlags = SDOperations.SD_CONTROL_SELF_RELATIVE | SDOperations.SD_CONTROL_DACL_PRESENT
+	if len(saclBytes) > 0:
+		controlFlags |= SDOperations.SD_CONTROL_SACL_PRESENT
+		saclOffset = 20
+	else:
+		saclOffset = 0
+	daclOffset = 20+len(saclBytes)
+	ownerOffset = daclOffset+len(daclBytes)
+	groupOffset = ownerOffset+len(ownerSIDBytes)
+	headerBytes = struct.pack("<BBHIIII",1,0,controlFlags,ownerOffset,groupOffset,saclOffset,daclOffset)
+	return headerBytes+saclBytes+daclBytes+ownerSIDBytes+groupSIDBytes
+
+def _parseSecurityDescriptor(sdBytes):
+	"""
+	Returns a pyfwnt security descriptor of the provided bytestring
+	"""
+	securityDescriptor = pyfwnt.security_descriptor()
+	securityDescriptor.copy_from_byte_stream(sdBytes)
+	return securityDescriptor
+
+def getCases(profileCounts):
+	"""
+	Returns a list of (case name,python function,pyfwnt function or None) tuples for the provided descriptor profile.
+	The functions take no arguments, the descriptors they operate on are generated here.
+	"""
+	sdBytes = generateSecurityDescriptor(*profileCounts)
+	daclBytes = SDOperations.aclBytes(sdBytes,ACLOperations.ACL_TYPE_DACL)
+	saclBytes = SDOperations.aclBytes(sdBytes,ACLOperations.ACL_TYPE_SACL)
+	ownerSIDBytes = SDOperations.getOwnerSIDBytes(sdBytes)
+
+	#An explicit deny object ACE ranks before all ACEs of the generated DACLs, hence it is inserted at index 0
+	denyACEBytes = ACEOperations.constructObjectACE(ACEOperations.ACE_TYPE_ACCESS_DENIED_OBJECT,0, \
+													ACEOperations.ADS_RIGHT_DS_CONTROL_ACCESS, \
+													SIDOperations.readableSIDAsBytes("S-1-1-0"), \
+													ACEOperations.EXT_RIGHT_USER_CHANGE_PASSWORD)
+	newDACLBytes = ACLOperations.addACEtoACL(daclBytes,denyACEBytes)
+	newSDBytes = SDOperations.replaceACL(sdBytes,ACLOperations.ACL_TYPE_DACL,newDACLBytes)
+
+	lstCases = [ \
+		("bytesAsReadableSID",lambda: SIDOperations.bytesAsReadableSID(ownerSIDBytes),None), \
+		("getInfoForACEs(DACL)",lambda: ACLOperations.getInfoForACEs(daclBytes),None), \
+		("addACEtoACL",lambda: ACLOperations.addACEtoACL(daclBytes,denyACEBytes),None), \
+		("replaceACL",lambda: SDOperations.replaceACL(sdBytes,ACLOperations.ACL_TYPE_DACL,newDACLBytes),None) \
+	]
+	if len(saclBytes) > 0:
+		lstCases.insert(2,("getInfoForACEs(SACL)",lambda: ACLOperations.getInfoForACEs(saclBytes),None))
+
+	if pyfwnt is not None:
+		newDACL = _parseSecurityDescriptor(newSDBytes).discretionary_acl
+
+		def sidToStringC():
+			securityIdentifier = pyfwnt.security_identifier()
+			securityIdentifier.copy_from_byte_stream(ownerSIDBytes)
+			return securityIdentifier.get_string()
+
+		def exportDACLEntriesC():
+			return _parseSecurityDescriptor(sdBytes).discretionary_acl.export_entries()
+
+		def exportSACLEntriesC():
+			return _parseSecurityDescriptor(sdBytes).system_acl.export_entries()
+
+		def insertEntryC():
+			securityDescriptor = _parseSecurityDescriptor(sdBytes)
+			securityDescriptor.insert_discretionary_access_control_entry(0,denyACEBytes)
+			return securityDescriptor.copy_to_byte_stream()
+
+		def replaceDACLC():
+			securityDescriptor = _parseSecurityDescriptor(sdBytes)
+			securityDescriptor.set_discretionary_acl(newDACL)
+			return securityDescriptor.copy_to_byte_stream()
+
+		dictCFunctions = { \
+			"bytesAsReadableSID": sidToStringC, \
+			"getInfoForACEs(DACL)": exportDACLEntriesC, \
+			"getInfoForACEs(SACL)": exportSACLEntriesC, \
+			"addACEtoACL": insertEntryC, \
+			"replaceACL": replaceDACLC \
+		}
+		lstCases = [(caseName,pythonFunction,dictCFunctions[caseName]) for caseName,pythonFunction,_ in lstCases]
+	return lstCases
+
+def getConstructCases():
+	"""
+	Returns the cases of the ACEOperations.construct*ACE family, these have no pyfwnt counterpart
+	"""
+	trusteeSIDBytes = generateSIDBytes(1104)
+	objectTypeUUID = OBJECT_TYPE_UUIDS[1]
+	inheritedObjectTypeUUID = OBJECT_TYPE_UUIDS[2]
+	appDataBytes = "artx\x00\x00\x00\x00"
+	return [ \
+		("constructSimpleACE", \
+		 lambda: ACEOperations.constructSimpleACE(ACEOperations.ACE_TYPE_ACCESS_ALLOWED,0, \
+												  ACEOperations.ACCESS_MASK_READ_CONTROL,trusteeSIDBytes),None), \
+		("constructObjectACE", \
+		 lambda: ACEOperations.constructObjectACE(ACEOperations.ACE_TYPE_ACCESS_ALLOWED_OBJECT,0, \
+												  ACEOperations.ADS_RIGHT_DS_READ_PROP,trusteeSIDBytes, \
+												  objectTypeUUID,inheritedObjectTypeUUID),None), \
+		("constructAppDataACE", \
+		 lambda: ACEOperations.constructAppDataACE(ACEOperations.ACE_TYPE_ACCESS_ALLOWED_CALLBACK,0, \
+												   ACEOperations.ACCESS_MASK_READ_CONTROL,trusteeSIDBytes, \
+												   appDataBytes),None), \
+		("constructObjectAppDataACE", \
+		 lambda: ACEOperations.constructObjectAppDataACE(ACEOperations.ACE_TYPE_ACCESS_ALLOWED_CALLBACK_OBJECT,0, \
+														 ACEOperations.ADS_RIGHT_DS_READ_PROP,trusteeSIDBytes, \
+														 objectTypeUUID,None,appDataBytes),None) \
+	]
+
+def measureOperationsPerSecond(function,minTime=0.2):
+	"""
+	Returns the number of calls of function per second. The number of calls per timed loop is doubled until a loop
+	takes at least minTime seconds, the garbage collector is disabled while timing.
+	"""
+	numberOfCalls = 1
+	gcWasEnabled = gc.isenabled()
+	gc.disable()
+	try:
+		while True:
+			startTime = timeit.default_timer()
+			for _ in range(numberOfCalls):
+				function()
+			elapsedTime = timeit.default_timer()-startTime
+			if elapsedTime >= minTime:
+				return numberOfCalls/elapsedTime
+			numberOfCalls *= 2
+	finally:
+		if gcWasEnabled:
+			gc.enable()
+
+def getAllocationMethod():
+	"""
+	Returns the method measureAllocations uses on this interpreter
+	"""
+	if tracemalloc is None:
+		return ALLOCATION_METHOD_RESULT_SIZE
+	return ALLOCATION_METHOD_TRACEMALLOC
+
+def _measureResultSize(result,setSeenIds):
+	"""
+	Returns the (number of objects,bytes) of result and the objects it contains, counting every object once
+	"""
+	numberOfObjects = 0
+	numberOfBytes = 0
+	lstPending = [result]
+	while lstPending:
+		value = lstPending.pop()
+		if id(value) in setSeenIds:
+			continue
+		setSeenIds.add(id(value))
+		numberOfObjects += 1
+		numberOfBytes += sys.getsizeof(value)
+		if isinstance(value,dict):
+			lstPending.extend(value.keys())
+			lstPending.extend(value.values())
+		elif isinstance(value,(list,tuple,set,frozenset)):
+			lstPending.extend(value)
+	return (numberOfObjects,numberOfBytes)
+
+def measureAllocations(function,numberOfCalls=100):
+	"""
+	Returns an (allocations,bytes) tuple with the average number of memory blocks and bytes left allocated by a call of
+	function, measured with the method of getAllocationMethod. The results of all calls are kept alive until the
+	loop ends, so the memory they hold is counted once per call.
+	"""
+	function()
+	lstResults = [None]*numberOfCalls
+	gc.collect()
+	if tracemalloc is None:
+		for i in range(numberOfCalls):
+			lstResults[i] = function()
+		#objects shared between the results, such as cached or interned values, are counted once
+		setSeenIds = set()
+		totalObjects = 0
+		totalBytes = 0
+		for result in lstResults:
+			numberOfObjects,numberOfBytes = _measureResultSize(result,setSeenIds)
+			totalObjects += numberOfObjects
+			totalBytes += numberOfBytes
+		return (float(totalObjects)/numberOfCalls,float(totalBytes)/numberOfCalls)
+
+	if tracemalloc.is_tracing():
+		raise Exception("tracemalloc is already tracing, the allocations cannot be measured.")
+	tracemalloc.start()
+	try:
+		startSnapshot = tracemalloc.take_snapshot()
+		for i in range(numberOfCalls):
+			lstResults[i] = function()
+		endSnapshot = tracemalloc.take_snapshot()
+	finally:
+		tracemalloc.stop()
+	#leave out the allocations of tracemalloc itself, such as the first snapshot
+	lstFilters = [tracemalloc.Filter(False,tracemalloc.__file__)]
+	lstStatistics = endSnapshot.filter_traces(lstFilters).compare_to(startSnapshot.filter_traces(lstFilters),"filename")
+	totalBlocks = sum([statistic.count_diff for statistic in lstStatistics])
+	totalBytes = sum([statistic.size_diff for statistic in lstStatistics])
+	return (float(totalBlocks)/numberOfCalls,float(totalBytes)/numberOfCalls)
+
+def _measureImplementation(function,minTime):
+	"""
+	Returns the result dictionary of a single implementation of a case
+	"""
+	allocations,allocatedBytes = measureAllocations(function)
+	return {"ops": measureOperationsPerSecond(function,minTime), \
+			"allocations": allocations, \
+			"bytes": allocatedBytes, \
+			"allocationMethod": getAllocationMethod()}
+
+def runBenchmarks(lstProfileNames=None,minTime=0.2):
+	"""
+	Runs the benchmark cases of the provided profiles, or all profiles, and returns a list of result dictionaries with
+	the keys "profile", "case", "python" and "pyfwnt". The latter two are dictionaries with the operations per second
+	("ops"), the allocations and bytes per operation ("allocations","bytes") and the method these were measured with
+	("allocationMethod"), "pyfwnt" is None for cases without a pyfwnt counterpart.
+	"""
+	lstProfiles = [("ace",None)] + [profile for profile in PROFILES \
+									if lstProfileNames is None or profile[0] in lstProfileNames]
+	lstResults = []
+	for profileName,profileCounts in lstProfiles:
+		if profileCounts is None:
+			lstCases = getConstructCases()
+		else:
+			lstCases = getCases(profileCounts)
+		for caseName,pythonFunction,cFunction in lstCases:
+			dictResult = {"profile": profileName, "case": caseName, "pyfwnt": None}
+			dictResult["python"] = _measureImplementation(pythonFunction,minTime)
+			if cFunction is not None:
+				dictResult["pyfwnt"] = _measureImplementation(cFunction,minTime)
+			lstResults.append(dictResult)
+	return lstResults
+
+def findRegressions(lstResults,lstBaselineResults,tolerance=DEFAULT_TOLERANCE):
+	"""
+	Returns a list of (profile,case,implementation,baseline ops/s,ops/s) tuples for the results that are more than
+	tolerance slower per operation than the same case of the baseline results. Cases missing from either are ignored.
+	"""
+	dictBaseline = dict([((result["profile"],result["case"]),result) for result in lstBaselineResults])
+	lstRegressions = []
+	for result in lstResults:
+		baselineResult = dictBaseline.get((result["profile"],result["case"]))
+		if baselineResult is None:
+			continue
+		for implementation in ("python","pyfwnt"):
+			if result[implementation] is None or baselineResult.get(implementation) is None:
+				continue
+			baselineOps = baselineResult[implementation]["ops"]
+			currentOps = result[implementation]["ops"]
+			if baselineOps/currentOps > 1.0+tolerance:
+				lstRegressions.append((result["profile"],result["case"],implementation,baselineOps,currentOps))
+	return lstRegressions
+
+def formatResults(lstResults):
+	"""
+	Returns the results as a table with the Python helper and pyfwnt C path side by side
+	"""
+	lstLines = ["%-8s %-28s %14s %10s %10s %14s %10s %10s %9s" % ("profile","case","python ops/s","allocs/op","B/op", \
+																	"pyfwnt ops/s","allocs/op","B/op","speedup")]
+	for result in lstResults:
+		pythonResult = result["python"]
+		cResult = result["pyfwnt"]
+		if cResult is None:
+			cColumns = ("-","-","-","-")
+		else:
+			cColumns = ("%.0f" % cResult["ops"],"%.1f" % cResult["allocations"],"%.0f" % cResult["bytes"], \
+						"%.2fx" % (cResult["ops"]/pythonResult["ops"]))
+		lstLines.append("%-8s %-28s %14.0f %10.1f %10.0f %14s %10s %10s %9s" % ((result["profile"],result["case"], \
+																			 pythonResult["ops"],pythonResult["allocations"], \
+																			 pythonResult["bytes"])+cColumns))
+	lstLines.append("allocations measured with: " + getAllocationMethod())
+	return "\n".join(lstLines)
+
+def main(lstArguments=None):
+	"""
+	Command line entry point, returns 1 when a regression against the baseline is found and 0 otherwise
+	"""
+	argumentParser = argparse.ArgumentParser(description="Benchmarks the security descriptor helpers.")
+	argumentParser.add_argument("--profile",action="append",choices=[profile[0] for profile in PROFILES], \
+								help="descriptor profile to benchmark, can be repeated, defaults to all profiles")
+	argumentParser.add_argument("--min-time",type=float,default=0.2, \
+								help="minimum number of seconds each measurement runs")
+	argumentParser.add_argument("--output",help="file to write the results to as JSON")
+	argumentParser.add_argument("--baseline",help="JSON results file to compare the results against")
+	argumentParser.add_argument("--tolerance",type=float,default=DEFAULT_TOLERANCE, \
+								help="relative slowdown against the baseline that is reported as a regression")
+	options = argumentParser.parse_args(lstArguments)
+
+	if pyfwnt is None:
+		sys.stderr.write("pyfwnt is not available, only the Python helpers are benchmarked.\n")
+	if tracemalloc is None:
+		sys.stderr.write("tracemalloc is not available on this interpreter, allocations per operation are measured with " \
+						 "the result size fallback: the objects and sys.getsizeof bytes of the returned values.\n")
+
+	lstResults = runBenchmarks(options.profile,options.min_time)
+	print(formatResults(lstResults))
+
+	if options.output:
+		with open(options.output,"w") as outputFile:
+			json.dump(lstResults,outputFile,indent=1,sort_keys=True)
+	if options.baseline:
+		with open(options.baseline,"r") as baselineFile:
+			lstRegressions = findRegressions(lstResults,json.load(baselineFile),options.tolerance)
+		for profileName,caseName,implementation,baselineOps,currentOps in lstRegressions:
+			print("REGRESSION %s %s (%s): %.0f ops/s, baseline %.0f ops/s" % (profileName,caseName,implementation, \
+																				currentOps,baselineOps))
+		if lstRegressions:
+			return 1
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
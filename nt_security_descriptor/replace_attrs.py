@@ -1,3 +1,19 @@
+import collections
+import Queue
+import threading
+import time
+
+try:
+	import ldap
+except ImportError:
+	ldap = None
+
+class ADException(Exception):
+	"""
+	Raised when an AD entry could not be modified. Hosts that define their own ADException can assign it to
+	replace_attrs.ADException.
+	"""
+
 def replaceObjectAttributes(self,strReadableGUID,dictReplacementAttributeValues):
 	"""
 	Forcefully replaces an object's attribute values with with the attribute values matching those in the provided dictionary
@@ -12,3 +28,212 @@ def replaceObjectAttributes(self,strReadableGUID,dictReplacementAttributeValues)
 		return "Attributes for AD object with objectGUID: " + strReadableGUID + " were modified successfully."
 	except ldap.LDAPError as e:
 		raise ADException("An AD entry with objectGuid: " + strReadableGUID + " could not be modified, reason: " + str(e))
+
+class _PendingWrite(object):
+	"""
+	Handle for a write queued on a PooledAttributeWriter. Writes coalesced into the same modify share one handle.
+	"""
+	def __init__(self,strReadableGUID):
+		self.strReadableGUID = strReadableGUID
+		self.dictAttributeValues = {}
+		self.submitTime = time.time()
+		self.result = None
+		self.error = None
+		self._done = threading.Event()
+
+	def done(self):
+		"""
+		Returns True once the modify for this write has completed or failed
+		"""
+		return self._done.is_set()
+
+	def wait(self,timeout=None):
+		"""
+		Blocks until the modify for this write has completed and returns the result message.
+		Raises ADException if the modify failed or the timeout expired.
+		"""
+		if not self._done.wait(timeout):
+			raise ADException("Timed out waiting for the modification of the AD entry with objectGuid: " + self.strReadableGUID)
+		if self.error is not None:
+			raise self.error
+		return self.result
+
+class PooledAttributeWriter(object):
+	"""
+	Replaces object attributes over a pool of LDAP connections.
+	
+	connectionFactory is called once per pool connection and must return a bound connection providing modify_s.
+	resolveDN is called with a readable objectGUID to look up its DN (e.g. an AD object's getDNForObjectGUID);
+	resolved DNs are cached for dnCacheTTL seconds, keeping at most dnCacheMaxSize entries.
+	Replacements queued for an object that is still waiting to be written are merged into a single modify,
+	later values replacing earlier ones for the same attribute.
+	Writes to the same object are issued in order: while a modify for an object is in flight, later writes for it are
+	held back and queued once it completes.
+	
+	This package targets Python 2, so the pool is made of worker threads, one per connection, rather than asyncio tasks.
+	"""
+	LDAP_REPLACE = 2
+
+	def __init__(self,connectionFactory,resolveDN,poolSize=4,dnCacheTTL=300,dnCacheMaxSize=10000):
+		self.resolveDN = resolveDN
+		self.dnCacheTTL = dnCacheTTL
+		self.dnCacheMaxSize = dnCacheMaxSize
+		#the TTL is the same for every entry, so insertion order is also expiry order
+		self._dictDNCache = collections.OrderedDict()
+		self._dictPendingWrites = {}
+		#objects with a modify in flight, mapped to the write held back until it completes (or None)
+		self._dictInFlightWrites = {}
+		self._queue = Queue.Queue()
+		self._lock = threading.Lock()
+		self._idle = threading.Condition(self._lock)
+		self._closed = False
+		self._dictMetrics = {"writesSubmitted": 0, \
+							 "writesCoalesced": 0, \
+							 "modifiesIssued": 0, \
+							 "modifiesFailed": 0, \
+							 "dnCacheHits": 0, \
+							 "dnCacheMisses": 0, \
+							 "totalLatency": 0.0, \
+							 "maxLatency": 0.0}
+		self._startTime = time.time()
+		self._lstWorkers = []
+		for i in range(poolSize):
+			worker = threading.Thread(target=self._worker,args=(connectionFactory(),))
+			worker.daemon = True
+			worker.start()
+			self._lstWorkers.append(worker)
+
+	def replaceObjectAttributes(self,strReadableGUID,dictReplacementAttributeValues):
+		"""
+		Queues the replacement of an object's attribute values with those in the provided dictionary.
+		Returns a handle whose wait() method returns the result message or raises ADException.
+		"""
+		with self._lock:
+			if self._closed:
+				raise ADException("The attribute writer has been closed.")
+			self._dictMetrics["writesSubmitted"] += 1
+			pendingWrite = self._dictPendingWrites.get(strReadableGUID)
+			if pendingWrite is not None:
+				self._dictMetrics["writesCoalesced"] += 1
+			else:
+				pendingWrite = _PendingWrite(strReadableGUID)
+				self._dictPendingWrites[strReadableGUID] = pendingWrite
+				if strReadableGUID in self._dictInFlightWrites:
+					self._dictInFlightWrites[strReadableGUID] = pendingWrite
+				else:
+					self._queue.put(pendingWrite)
+			pendingWrite.dictAttributeValues.update(dictReplacementAttributeValues)
+		return pendingWrite
+
+	def getDN(self,strReadableGUID):
+		"""
+		Returns the DN for the provided objectGUID, from the cache if the cached entry has not expired
+		"""
+		now = time.time()
+		with self._lock:
+			self._evictDNs(now)
+			cachedEntry = self._dictDNCache.get(strReadableGUID)
+			if cachedEntry is not None:
+				self._dictMetrics["dnCacheHits"] += 1
+				return cachedEntry[0]
+			self._dictMetrics["dnCacheMisses"] += 1
+		dn = self.resolveDN(strReadableGUID)
+		with self._lock:
+			#re-inserting moves the entry to the end, keeping the cache in expiry order
+			self._dictDNCache.pop(strReadableGUID,None)
+			self._dictDNCache[strReadableGUID] = (dn,now+self.dnCacheTTL)
+			self._evictDNs(now)
+		return dn
+
+	def _evictDNs(self,now):
+		"""
+		Drops the expired entries and the oldest entries over dnCacheMaxSize from the DN cache, the lock must be held.
+		Returns how many entries were dropped.
+		"""
+		numberOfEvicted = 0
+		while self._dictDNCache:
+			key,value = next(self._dictDNCache.iteritems())
+			if value[1] > now and len(self._dictDNCache) <= self.dnCacheMaxSize:
+				break
+			del self._dictDNCache[key]
+			numberOfEvicted += 1
+		return numberOfEvicted
+
+	def evictExpiredDNs(self):
+		"""
+		Drops the expired entries from the DN cache and returns how many were dropped.
+		Expired entries are also dropped on every lookup, so calling this is only needed to release memory early.
+		"""
+		with self._lock:
+			return self._evictDNs(time.time())
+
+	def getMetrics(self):
+		"""
+		Returns a dictionary of the pool's counters together with:
+			"pendingWrites": writes waiting for a connection
+			"averageLatency": mean seconds between queueing a write and its modify completing
+			"throughput": modifies completed per second since the pool was created
+		"""
+		with self._lock:
+			dictMetrics = dict(self._dictMetrics)
+			dictMetrics["pendingWrites"] = len(self._dictPendingWrites)
+		completed = dictMetrics["modifiesIssued"]
+		if completed > 0:
+			dictMetrics["averageLatency"] = dictMetrics["totalLatency"] / completed
+		else:
+			dictMetrics["averageLatency"] = 0.0
+		elapsed = time.time() - self._startTime
+		if elapsed > 0:
+			dictMetrics["throughput"] = (completed - dictMetrics["modifiesFailed"]) / elapsed
+		else:
+			dictMetrics["throughput"] = 0.0
+		return dictMetrics
+
+	def close(self):
+		"""
+		Waits for the queued writes to be written and stops the pool
+		"""
+		with self._lock:
+			self._closed = True
+			#held back writes are only queued when the write before them completes
+			while self._dictPendingWrites or self._dictInFlightWrites:
+				self._idle.wait()
+		for worker in self._lstWorkers:
+			self._queue.put(None)
+		for worker in self._lstWorkers:
+			worker.join()
+
+	def _worker(self,lConn):
+		while True:
+			pendingWrite = self._queue.get()
+			if pendingWrite is None:
+				return
+			strReadableGUID = pendingWrite.strReadableGUID
+			#stop coalescing into this write once a connection has picked it up
+			with self._lock:
+				del self._dictPendingWrites[strReadableGUID]
+				self._dictInFlightWrites[strReadableGUID] = None
+				modlist = [(self.LDAP_REPLACE,key,value) for key,value in pendingWrite.dictAttributeValues.items()]
+			try:
+				lConn.modify_s(self.getDN(strReadableGUID),modlist)
+				pendingWrite.result = "Attributes for AD object with objectGUID: " + strReadableGUID + " were modified successfully."
+			except ADException as e:
+				pendingWrite.error = e
+			except Exception as e:
+				#ldap.LDAPError and the errors of stand-in connections alike
+				pendingWrite.error = ADException("An AD entry with objectGuid: " + strReadableGUID + " could not be modified, reason: " + str(e))
+			latency = time.time() - pendingWrite.submitTime
+			with self._lock:
+				self._dictMetrics["modifiesIssued"] += 1
+				if pendingWrite.error is not None:
+					self._dictMetrics["modifiesFailed"] += 1
+				self._dictMetrics["totalLatency"] += latency
+				if latency > self._dictMetrics["maxLatency"]:
+					self._dictMetrics["maxLatency"] = latency
+				heldWrite = self._dictInFlightWrites.pop(strReadableGUID)
+				if heldWrite is not None:
+					self._dictInFlightWrites[strReadableGUID] = None
+					self._queue.put(heldWrite)
+				elif not self._dictPendingWrites and not self._dictInFlightWrites:
+					self._idle.notify_all()
+			pendingWrite._done.set()
@@ -1,3 +1,21 @@
+import collections
+import heapq
+import time
+
+import ACEOperations
+import ACLOperations
+import PoolOperations
+import SDOperations
+import SIDOperations
+
+try:
+    import ldap
+except ImportError:
+    ldap = None
+
+#Cached result of buildUserCannotChangePasswordACEs
+_userCannotChangePasswordACEs = None
+
 def setUserCannotChangePasswordFlag(self,strReadableGUID,userCannotChangePassword):
     """
     If setting the flag to on,
@@ -23,6 +41,20 @@ def setUserCannotChangePasswordFlag(self,strReadableGUID,userCannotChangePasswor
         raise ADException("Active Directory returned an empty nTSecurityDescriptor for the provided user account. This is usually because the service account used to query LDAP does not have domain admin privileges.")
     userSIDBytes = dictUserAttrs['objectSid'][0]
             
+    passwordChangeACEs = buildUserCannotChangePasswordACEs()
+    newSecurityDescriptorBytes = applyUserCannotChangePasswordFlag(userSecurityDescriptorBytes,userCannotChangePassword,passwordChangeACEs)
+    if newSecurityDescriptorBytes is not None:
+        return self.replaceObjectAttributes(strReadableGUID,{'nTSecurityDescriptor':newSecurityDescriptorBytes})
+
+def buildUserCannotChangePasswordACEs():
+    """
+    Returns a (denyEveryoneAceBytes,denySelfAceBytes,allowEveryoneAceBytes) tuple with the ACEs AD assigns when checking
+    and unchecking 'user cannot change password'. The ACEs are constant, so they are only built on the first call.
+    """
+    global _userCannotChangePasswordACEs
+    if _userCannotChangePasswordACEs is not None:
+        return _userCannotChangePasswordACEs
+    
     #Define the deny 'Everyone' and 'Self' password change ACEs as assigned by AD when checking 'user cannot change password'
     denyEveryoneAceBytes = ACEOperations.constructObjectACE(ACEOperations.ACE_TYPE_ACCESS_DENIED_OBJECT,0, \
                                                                     ACEOperations.ADS_RIGHT_DS_CONTROL_ACCESS, \
@@ -38,6 +70,16 @@ def setUserCannotChangePasswordFlag(self,strReadableGUID,userCannotChangePasswor
                                                              ACEOperations.ADS_RIGHT_DS_CONTROL_ACCESS, \
                                                              SIDOperations.readableSIDAsBytes("S-1-1-0"), \
                                                              ACEOperations.EXT_RIGHT_USER_CHANGE_PASSWORD)
+    _userCannotChangePasswordACEs = (denyEveryoneAceBytes,denySelfAceBytes,allowEveryoneAceBytes)
+    return _userCannotChangePasswordACEs
+
+def applyUserCannotChangePasswordFlag(userSecurityDescriptorBytes,userCannotChangePassword,passwordChangeACEs):
+    """
+    Given a user's security descriptor and the ACEs from buildUserCannotChangePasswordACEs, returns the security descriptor
+    with the 'user cannot change password' ACEs set or cleared, or None if the descriptor already matches the requested state.
+    This does not touch LDAP, so it can run in a worker process.
+    """
+    denyEveryoneAceBytes,denySelfAceBytes,allowEveryoneAceBytes = passwordChangeACEs
 
     #grab the DACL from the user's security descriptor
     daclBytes = SDOperations.aclBytes(userSecurityDescriptorBytes,ACLOperations.ACL_TYPE_DACL)
@@ -78,5 +120,149 @@ def setUserCannotChangePasswordFlag(self,strReadableGUID,userCannotChangePasswor
             sdChangeFlag=True
 
     if sdChangeFlag:
-        userSecurityDescriptorBytes = SDOperations.replaceACL(userSecurityDescriptorBytes,ACLOperations.ACL_TYPE_DACL,daclBytes)
-        return self.replaceObjectAttributes(strReadableGUID,{'nTSecurityDescriptor':userSecurityDescriptorBytes})
+        return SDOperations.replaceACL(userSecurityDescriptorBytes,ACLOperations.ACL_TYPE_DACL,daclBytes)
+    return None
+
+def _applyUserCannotChangePasswordFlagTask(task):
+    """
+    Worker pool entry point for applyUserCannotChangePasswordFlag. Returns (strReadableGUID,newSecurityDescriptorBytes,error).
+    """
+    strReadableGUID,userSecurityDescriptorBytes,userCannotChangePassword,passwordChangeACEs = task
+    try:
+        return (strReadableGUID,applyUserCannotChangePasswordFlag(userSecurityDescriptorBytes,userCannotChangePassword,passwordChangeACEs),None)
+    except Exception as e:
+        return (strReadableGUID,None,str(e))
+
+def _pipelineLDAPRequests(lConn,lstRequests,submitRequest,maxInFlight,maxRetries,retryDelay,retryableErrors):
+    """
+    Issues asynchronous LDAP requests on lConn with at most 'maxInFlight' outstanding, collecting results oldest first
+    so a failure can always be tied to its request. lstRequests is a list of tuples whose first item is a unique key and
+    submitRequest(request) must send the request and return its message id.
+    A request failing with one of retryableErrors is resubmitted up to 'maxRetries' times, no earlier than
+    retryDelay*attempt seconds after it failed. Retries wait on a deadline, so the other requests keep flowing meanwhile.
+    Returns a dictionary of key -> the lConn.result tuple, or the ldap.LDAPError the request ultimately failed with.
+    """
+    dictOutcomes = {}
+    readyRequests = collections.deque([(request,0) for request in lstRequests])
+    #heap of (deadline,sequence,request,attempt), the sequence keeps equal deadlines in submission order
+    retryRequests = []
+    inFlightRequests = collections.deque()
+    sequence = 0
+    while len(readyRequests) > 0 or len(retryRequests) > 0 or len(inFlightRequests) > 0:
+        now = time.time()
+        while len(retryRequests) > 0 and retryRequests[0][0] <= now:
+            deadline,sequenceNumber,request,attempt = heapq.heappop(retryRequests)
+            readyRequests.append((request,attempt))
+        
+        while len(readyRequests) > 0 and len(inFlightRequests) < maxInFlight:
+            request,attempt = readyRequests.popleft()
+            try:
+                inFlightRequests.append((submitRequest(request),request,attempt))
+            except retryableErrors as e:
+                if attempt < maxRetries:
+                    sequence += 1
+                    heapq.heappush(retryRequests,(time.time()+retryDelay*(attempt+1),sequence,request,attempt+1))
+                else:
+                    dictOutcomes[request[0]] = e
+            except ldap.LDAPError as e:
+                dictOutcomes[request[0]] = e
+        
+        if len(inFlightRequests) == 0:
+            #only retries that are not yet due are left
+            if len(readyRequests) == 0 and len(retryRequests) > 0:
+                time.sleep(max(0,retryRequests[0][0]-time.time()))
+            continue
+        msgid,request,attempt = inFlightRequests.popleft()
+        try:
+            dictOutcomes[request[0]] = lConn.result(msgid,1,-1)
+        except retryableErrors as e:
+            if attempt < maxRetries:
+                sequence += 1
+                heapq.heappush(retryRequests,(time.time()+retryDelay*(attempt+1),sequence,request,attempt+1))
+            else:
+                dictOutcomes[request[0]] = e
+        except ldap.LDAPError as e:
+            dictOutcomes[request[0]] = e
+    return dictOutcomes
+
+def setUserCannotChangePasswordFlagBatch(self,lstReadableGUIDs,userCannotChangePassword,maxInFlight=32,maxRetries=3,retryDelay=0.5,workers=None):
+    """
+    Batch variant of setUserCannotChangePasswordFlag.
+    The password change ACEs are built once for the whole batch. Every user is read with an asynchronous base search
+    on its <GUID=...> DN, which returns the DN together with the security descriptor. The security descriptors are
+    transformed in a pool of 'workers' processes (no pool is started when workers is 1), and the resulting modifies are
+    issued asynchronously. Reads and modifies keep at most 'maxInFlight' requests outstanding on the connection and
+    a request that fails with a transient error (busy, unavailable, timeout, admin limit exceeded) is resubmitted up
+    to 'maxRetries' times, no earlier than retryDelay*attempt seconds after it failed.
+    
+    Only lConn.search_ext(base,scope,filterstr,attrlist), lConn.modify(dn,modlist) and lConn.result(msgid,all,timeout)
+    are used, so lConn may be any stand-in implementing those calls in the python-ldap way.
+    
+    Returns a dictionary of objectGUID -> result: the success message, None when no change was needed,
+    or an ADException describing why the account could not be updated.
+    """
+    if ldap is None:
+        raise Exception("The python-ldap module is required by setUserCannotChangePasswordFlagBatch but could not be imported.")
+    LDAP_REPLACE = 2
+    RETRYABLE_ERRORS = (ldap.BUSY,ldap.UNAVAILABLE,ldap.TIMEOUT,ldap.ADMINLIMIT_EXCEEDED)
+    
+    dictResults = {}
+    passwordChangeACEs = buildUserCannotChangePasswordACEs()
+    
+    #read the DNs and security descriptors
+    lstReads = [(strReadableGUID,) for strReadableGUID in collections.OrderedDict.fromkeys(lstReadableGUIDs)]
+    dictReads = _pipelineLDAPRequests(self.lConn,lstReads, \
+                                      lambda request: self.lConn.search_ext("<GUID=" + request[0] + ">",ldap.SCOPE_BASE, \
+                                                                            "(objectClass=*)",['nTSecurityDescriptor','objectClass']), \
+                                      maxInFlight,maxRetries,retryDelay,RETRYABLE_ERRORS)
+    
+    #build the transform tasks
+    dictDNs = {}
+    lstTasks = []
+    for strReadableGUID, in lstReads:
+        outcome = dictReads[strReadableGUID]
+        if isinstance(outcome,ldap.NO_SUCH_OBJECT):
+            dictResults[strReadableGUID] = ADException("Account with objectGUID: " + strReadableGUID + " was not found.")
+            continue
+        if isinstance(outcome,ldap.LDAPError):
+            dictResults[strReadableGUID] = ADException("The AD entry with objectGuid: " + strReadableGUID + " could not be read, reason: " + str(outcome))
+            continue
+        #referrals are returned with a None DN
+        lstEntries = [entry for entry in outcome[1] if entry[0] is not None]
+        if len(lstEntries) == 0:
+            dictResults[strReadableGUID] = ADException("Account with objectGUID: " + strReadableGUID + " was not found.")
+            continue
+        dn,dictEntryAttrs = lstEntries[0]
+        dictUserAttrs = dict([(key.lower(),value) for key,value in dictEntryAttrs.items()])
+        if 'user' not in [i.lower() for i in dictUserAttrs.get('objectclass',[])]:
+            dictResults[strReadableGUID] = ADException("The provided objectGUID does not represent a user account.")
+            continue
+        userSecurityDescriptorBytes = dictUserAttrs.get('ntsecuritydescriptor',[''])[0]
+        if len(userSecurityDescriptorBytes) == 0:
+            dictResults[strReadableGUID] = ADException("Active Directory returned an empty nTSecurityDescriptor for the provided user account. This is usually because the service account used to query LDAP does not have domain admin privileges.")
+            continue
+        dictDNs[strReadableGUID] = dn
+        lstTasks.append((strReadableGUID,userSecurityDescriptorBytes,userCannotChangePassword,passwordChangeACEs))
+    
+    #transform the security descriptors
+    lstTransformed = PoolOperations.poolMap(_applyUserCannotChangePasswordFlagTask,lstTasks,workers)
+    
+    #each modify is (strReadableGUID,dn,modlist)
+    lstModifies = []
+    for strReadableGUID,newSecurityDescriptorBytes,error in lstTransformed:
+        if error is not None:
+            dictResults[strReadableGUID] = ADException("The nTSecurityDescriptor of the AD entry with objectGuid: " + strReadableGUID + " could not be updated, reason: " + error)
+        elif newSecurityDescriptorBytes is None:
+            dictResults[strReadableGUID] = None
+        else:
+            lstModifies.append((strReadableGUID,dictDNs[strReadableGUID],[(LDAP_REPLACE,'nTSecurityDescriptor',newSecurityDescriptorBytes)]))
+    
+    dictModifies = _pipelineLDAPRequests(self.lConn,lstModifies,lambda modify: self.lConn.modify(modify[1],modify[2]), \
+                                         maxInFlight,maxRetries,retryDelay,RETRYABLE_ERRORS)
+    for strReadableGUID,outcome in dictModifies.items():
+        if isinstance(outcome,ldap.LDAPError):
+            dictResults[strReadableGUID] = ADException("An AD entry with objectGuid: " + strReadableGUID + " could not be modified, reason: " + str(outcome))
+        else:
+            dictResults[strReadableGUID] = "Attributes for AD object with objectGUID: " + strReadableGUID + " were modified successfully."
+    
+    return dictResults
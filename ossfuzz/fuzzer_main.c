@@ -0,0 +1,349 @@
+/*
+ * Standalone driver for the OSS-Fuzz targets
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/* The driver is linked instead of a fuzzing engine (LIB_FUZZING_ENGINE) and
+ * runs the target on every file on the command line, or on standard input if
+ * no files are provided, which is how AFL invokes it:
+ *   afl-fuzz -i corpus -o findings -- ./security_descriptor_fuzzer @@
+ *
+ * With -i ITERATIONS each input is additionally mutated ITERATIONS times with
+ * a deterministic pseudo random generator (seeded with -s SEED), so the target
+ * can be exercised locally, e.g. under AddressSanitizer, without a fuzzer:
+ *   ./security_descriptor_fuzzer -i 100000 corpus/security_descriptor_dacl.bin
+ */
+
+#include <common.h>
+#include <memory.h>
+#include <types.h>
+
+#include <stdio.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+#define FUZZER_MAXIMUM_INPUT_SIZE	( 1024 * 1024 )
+
+int LLVMFuzzerTestOneInput(
+     const uint8_t *data,
+     size_t size );
+
+/* Retrieves a pseudo random value using xorshift64
+ * Returns the value
+ */
+uint64_t fuzzer_get_random_value(
+          uint64_t *state )
+{
+	uint64_t value = *state;
+
+	value ^= value << 13;
+	value ^= value >> 7;
+	value ^= value << 17;
+
+	*state = value;
+
+	return( value );
+}
+
+/* Mutates the data in place, the size can be reduced
+ */
+void fuzzer_mutate(
+      uint8_t *data,
+      size_t *data_size,
+      uint64_t *state )
+{
+	/* Values that commonly reach the boundaries of sizes, counts and offsets
+	 */
+	static uint8_t interesting_values[ 8 ] = {
+		0x00, 0x01, 0x02, 0x04, 0x10, 0x14, 0x7f, 0xff };
+
+	size_t data_offset      = 0;
+	uint64_t random_value   = 0;
+	int number_of_mutations = 0;
+
+	if( *data_size == 0 )
+	{
+		return;
+	}
+	number_of_mutations = 1 + (int) ( fuzzer_get_random_value( state ) % 4 );
+
+	while( number_of_mutations > 0 )
+	{
+		random_value = fuzzer_get_random_value( state );
+		data_offset  = (size_t) ( ( random_value >> 8 ) % *data_size );
+
+		switch( random_value % 5 )
+		{
+			case 0:
+				data[ data_offset ] ^= (uint8_t) ( 1 << ( ( random_value >> 4 ) % 8 ) );
+				break;
+
+			case 1:
+				data[ data_offset ] = (uint8_t) ( random_value >> 32 );
+				break;
+
+			case 2:
+				data[ data_offset ] = interesting_values[ ( random_value >> 4 ) % 8 ];
+				break;
+
+			case 3:
+				data[ data_offset ] += (uint8_t) ( ( ( random_value >> 4 ) % 9 ) - 4 );
+				break;
+
+			case 4:
+				if( data_offset > 0 )
+				{
+					*data_size = data_offset;
+				}
+				break;
+		}
+		number_of_mutations--;
+	}
+}
+
+/* Runs the target on a copy of the data that is allocated with the exact size
+ * so that reads beyond the end of the data are detected by memory checkers
+ * Returns 1 if successful or -1 on error
+ */
+int fuzzer_test_one_input(
+     const uint8_t *data,
+     size_t data_size )
+{
+	uint8_t *test_data = NULL;
+
+	/* Allocate at least 1 byte since the allocation of 0 bytes can fail
+	 */
+	test_data = (uint8_t *) memory_allocate( data_size + 1 );
+
+	if( test_data == NULL )
+	{
+		return( -1 );
+	}
+	memory_copy(
+	 test_data,
+	 data,
+	 data_size );
+
+	LLVMFuzzerTestOneInput(
+	 test_data,
+	 data_size );
+
+	memory_free(
+	 test_data );
+
+	return( 1 );
+}
+
+/* Runs the target on the input and on mutations of the input
+ * Returns 1 if successful or -1 on error
+ */
+int fuzzer_run_input(
+     FILE *stream,
+     uint8_t *input_data,
+     uint8_t *mutated_data,
+     int number_of_iterations,
+     uint64_t *state )
+{
+	size_t input_data_size   = 0;
+	size_t mutated_data_size = 0;
+	int iteration            = 0;
+
+	input_data_size = fread(
+	                   input_data,
+	                   1,
+	                   FUZZER_MAXIMUM_INPUT_SIZE,
+	                   stream );
+
+	if( ferror( stream ) != 0 )
+	{
+		return( -1 );
+	}
+	if( fuzzer_test_one_input(
+	     input_data,
+	     input_data_size ) != 1 )
+	{
+		return( -1 );
+	}
+	for( iteration = 0;
+	     iteration < number_of_iterations;
+	     iteration++ )
+	{
+		memory_copy(
+		 mutated_data,
+		 input_data,
+		 input_data_size );
+
+		mutated_data_size = input_data_size;
+
+		fuzzer_mutate(
+		 mutated_data,
+		 &mutated_data_size,
+		 state );
+
+		if( fuzzer_test_one_input(
+		     mutated_data,
+		     mutated_data_size ) != 1 )
+		{
+			return( -1 );
+		}
+	}
+	return( 1 );
+}
+
+/* The main program
+ */
+int main(
+     int argc,
+     char * const argv[] )
+{
+	FILE *stream             = NULL;
+	uint8_t *input_data      = NULL;
+	uint8_t *mutated_data    = NULL;
+	uint64_t state           = 0x9e3779b97f4a7c15ULL;
+	int argument_index       = 1;
+	int number_of_inputs     = 0;
+	int number_of_iterations = 0;
+	int result               = EXIT_FAILURE;
+
+	while( ( argument_index + 1 < argc )
+	    && ( argv[ argument_index ][ 0 ] == '-' ) )
+	{
+		if( argv[ argument_index ][ 1 ] == 'i' )
+		{
+			number_of_iterations = atoi( argv[ argument_index + 1 ] );
+		}
+		else if( argv[ argument_index ][ 1 ] == 's' )
+		{
+			state = (uint64_t) strtoull( argv[ argument_index + 1 ], NULL, 0 );
+
+			if( state == 0 )
+			{
+				state = 1;
+			}
+		}
+		else
+		{
+			fprintf(
+			 stderr,
+			 "Usage: %s [ -i iterations ] [ -s seed ] [ file ... ]\n",
+			 argv[ 0 ] );
+
+			return( EXIT_FAILURE );
+		}
+		argument_index += 2;
+	}
+	input_data   = (uint8_t *) memory_allocate( FUZZER_MAXIMUM_INPUT_SIZE );
+	mutated_data = (uint8_t *) memory_allocate( FUZZER_MAXIMUM_INPUT_SIZE );
+
+	if( ( input_data == NULL )
+	 || ( mutated_data == NULL ) )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to create input data.\n" );
+
+		goto on_error;
+	}
+	if( argument_index >= argc )
+	{
+		if( fuzzer_run_input(
+		     stdin,
+		     input_data,
+		     mutated_data,
+		     number_of_iterations,
+		     &state ) != 1 )
+		{
+			fprintf(
+			 stderr,
+			 "Unable to read standard input.\n" );
+
+			goto on_error;
+		}
+		number_of_inputs++;
+	}
+	while( argument_index < argc )
+	{
+		stream = fopen(
+		          argv[ argument_index ],
+		          "rb" );
+
+		if( stream == NULL )
+		{
+			fprintf(
+			 stderr,
+			 "Unable to open: %s.\n",
+			 argv[ argument_index ] );
+
+			goto on_error;
+		}
+		if( fuzzer_run_input(
+		     stream,
+		     input_data,
+		     mutated_data,
+		     number_of_iterations,
+		     &state ) != 1 )
+		{
+			fprintf(
+			 stderr,
+			 "Unable to read: %s.\n",
+			 argv[ argument_index ] );
+
+			fclose(
+			 stream );
+
+			goto on_error;
+		}
+		fclose(
+		 stream );
+
+		number_of_inputs++;
+		argument_index++;
+	}
+	fprintf(
+	 stdout,
+	 "Ran %d input(s) with %d mutation(s) each.\n",
+	 number_of_inputs,
+	 number_of_iterations );
+
+	result = EXIT_SUCCESS;
+
+on_error:
+	if( mutated_data != NULL )
+	{
+		memory_free(
+		 mutated_data );
+	}
+	if( input_data != NULL )
+	{
+		memory_free(
+		 input_data );
+	}
+	return( result );
+}
+
+#if defined( __cplusplus )
+}
+#endif
+
@@ -0,0 +1,247 @@
+/*
+ * OSS-Fuzz target for libfwnt security descriptor type
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+/* Note that some of the OSS-Fuzz engines use C++
+ */
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+#include "ossfuzz_libfwnt.h"
+
+int LLVMFuzzerTestOneInput(
+     const uint8_t *data,
+     size_t size );
+
+/* Retrieves the entries of an access control list and their security identifiers
+ * Returns 1 if successful or -1 on error
+ */
+int ossfuzz_access_control_list_read_entries(
+     libfwnt_access_control_list_t *access_control_list )
+{
+	libfwnt_access_control_entry_t *access_control_entry = NULL;
+	libfwnt_security_identifier_t *security_identifier   = NULL;
+	size_t string_size                                    = 0;
+	int entry_index                                       = 0;
+	int number_of_entries                                 = 0;
+
+	if( libfwnt_access_control_list_get_number_of_entries(
+	     access_control_list,
+	     &number_of_entries,
+	     NULL ) != 1 )
+	{
+		return( -1 );
+	}
+	for( entry_index = 0;
+	     entry_index < number_of_entries;
+	     entry_index++ )
+	{
+		access_control_entry = NULL;
+		security_identifier  = NULL;
+
+		if( libfwnt_access_control_list_get_entry_by_index(
+		     access_control_list,
+		     entry_index,
+		     &access_control_entry,
+		     NULL ) != 1 )
+		{
+			return( -1 );
+		}
+		if( libfwnt_access_control_entry_get_security_identifier(
+		     access_control_entry,
+		     &security_identifier,
+		     NULL ) == -1 )
+		{
+			return( -1 );
+		}
+		if( security_identifier != NULL )
+		{
+			if( libfwnt_security_identifier_get_string_size(
+			     security_identifier,
+			     &string_size,
+			     0,
+			     NULL ) != 1 )
+			{
+				return( -1 );
+			}
+		}
+	}
+	return( 1 );
+}
+
+/* Parses the security descriptor and retrieves all its components
+ * Returns 1 if successful or -1 on error
+ */
+int ossfuzz_security_descriptor_read(
+     const uint8_t *data,
+     size_t size,
+     int use_byte_stream )
+{
+	libfwnt_access_control_list_t *access_control_list = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	libfwnt_security_identifier_t *security_identifier = NULL;
+	int result                                         = -1;
+
+	if( libfwnt_security_descriptor_initialize(
+	     &security_descriptor,
+	     NULL ) != 1 )
+	{
+		return( -1 );
+	}
+	if( use_byte_stream != 0 )
+	{
+		if( libfwnt_security_descriptor_set_byte_stream(
+		     security_descriptor,
+		     data,
+		     size,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     0,
+		     NULL ) != 1 )
+		{
+			goto on_error;
+		}
+	}
+	else
+	{
+		if( libfwnt_security_descriptor_copy_from_byte_stream(
+		     security_descriptor,
+		     data,
+		     size,
+		     LIBFWNT_ENDIAN_LITTLE,
+		     NULL ) != 1 )
+		{
+			goto on_error;
+		}
+	}
+	if( libfwnt_security_descriptor_get_owner(
+	     security_descriptor,
+	     &security_identifier,
+	     NULL ) == -1 )
+	{
+		goto on_error;
+	}
+	security_identifier = NULL;
+
+	if( libfwnt_security_descriptor_get_group(
+	     security_descriptor,
+	     &security_identifier,
+	     NULL ) == -1 )
+	{
+		goto on_error;
+	}
+	result = libfwnt_security_descriptor_get_discretionary_acl(
+	          security_descriptor,
+	          &access_control_list,
+	          NULL );
+
+	if( result == 1 )
+	{
+		result = ossfuzz_access_control_list_read_entries(
+		          access_control_list );
+	}
+	if( result == -1 )
+	{
+		goto on_error;
+	}
+	access_control_list = NULL;
+
+	result = libfwnt_security_descriptor_get_system_acl(
+	          security_descriptor,
+	          &access_control_list,
+	          NULL );
+
+	if( result == 1 )
+	{
+		result = ossfuzz_access_control_list_read_entries(
+		          access_control_list );
+	}
+	if( result == -1 )
+	{
+		goto on_error;
+	}
+	result = 1;
+
+on_error:
+	libfwnt_security_descriptor_free(
+	 &security_descriptor,
+	 NULL );
+
+	return( result );
+}
+
+/* Validates the data and parses it both as a copy and as a referenced byte stream
+ * Data that passes validation must also parse, otherwise the validation is not
+ * strict enough and the input is reported as a crash
+ */
+int LLVMFuzzerTestOneInput(
+     const uint8_t *data,
+     size_t size )
+{
+	size_t validation_error_offset = 0;
+	int copy_result                = 0;
+	int stream_result              = 0;
+	int validation_error           = 0;
+	int validation_result          = 0;
+
+	validation_result = libfwnt_validate_security_descriptor(
+	                     data,
+	                     size,
+	                     LIBFWNT_ENDIAN_LITTLE,
+	                     &validation_error,
+	                     &validation_error_offset,
+	                     NULL );
+
+	if( ( validation_result == 0 )
+	 && ( ( validation_error == LIBFWNT_VALIDATION_ERROR_NONE )
+	  || ( validation_error_offset > size ) ) )
+	{
+		abort();
+	}
+	copy_result = ossfuzz_security_descriptor_read(
+	               data,
+	               size,
+	               0 );
+
+	stream_result = ossfuzz_security_descriptor_read(
+	                 data,
+	                 size,
+	                 1 );
+
+	if( ( validation_result == 1 )
+	 && ( ( copy_result != 1 )
+	  || ( stream_result != 1 ) ) )
+	{
+		abort();
+	}
+	return( 0 );
+}
+
+#if defined( __cplusplus )
+}
+#endif
+
@@ -32,13 +32,21 @@
 #include "pyfwnt_access_control_entry.h"
 #include "pyfwnt_access_control_types.h"
 #include "pyfwnt_access_control_list.h"
+#include "pyfwnt_access_mask.h"
 #include "pyfwnt_error.h"
+#include "pyfwnt_integer.h"
 #include "pyfwnt_libcerror.h"
 #include "pyfwnt_libfwnt.h"
+#include "pyfwnt_lznt1.h"
+#include "pyfwnt_lzxpress.h"
 #include "pyfwnt_python.h"
+#include "pyfwnt_scan.h"
 #include "pyfwnt_security_descriptor.h"
 #include "pyfwnt_security_identifier.h"
+#include "pyfwnt_statistics.h"
 #include "pyfwnt_unused.h"
+#include "pyfwnt_validate.h"
+#include "pyfwnt_wof_stream.h"
 
 /* The pyfwnt module methods
  */
@@ -50,6 +58,156 @@ PyMethodDef pyfwnt_module_methods[] = {
 	  "\n"
 	  "Retrieves the version." },
 
+	{ "export_access_control_entries",
+	  (PyCFunction) pyfwnt_export_access_control_entries,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "export_access_control_entries(access_control_lists) -> Dictionary\n"
+	  "\n"
+	  "Exports the access control entries of a sequence of access control lists as columns.\n"
+	  "\n"
+	  "The columns are the same as those of access_control_list.export_entries(),\n"
+	  "the \"acl_index\" column contains the index of the list in the sequence." },
+
+	{ "map_generic_rights",
+	  (PyCFunction) pyfwnt_access_mask_map_generic_rights,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "map_generic_rights(access_masks, generic_mapping) -> None\n"
+	  "\n"
+	  "Maps the generic rights of a column of access masks to object specific rights in place.\n"
+	  "\n"
+	  "The access masks are 32-bit values in native byte order in a writable buffer, such as\n"
+	  "the \"access_mask\" column of access_control_list.export_entries(). The generic mapping\n"
+	  "is a tuple of the rights GENERIC_READ, GENERIC_WRITE, GENERIC_EXECUTE and GENERIC_ALL\n"
+	  "map to." },
+
+	{ "get_language_tag_identifier",
+	  (PyCFunction) pyfwnt_get_language_tag_identifier,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "get_language_tag_identifier(lcid) -> Unicode string or None\n"
+	  "\n"
+	  "Retrieves the language tag identifier of a LCID language tag, e.g. \"en-US\" for 0x0409." },
+
+	{ "get_language_tag_description",
+	  (PyCFunction) pyfwnt_get_language_tag_description,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "get_language_tag_description(lcid) -> Unicode string or None\n"
+	  "\n"
+	  "Retrieves the description of a LCID language tag." },
+
+	{ "get_language_tag_lcid",
+	  (PyCFunction) pyfwnt_get_language_tag_lcid,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "get_language_tag_lcid(identifier) -> Integer or None\n"
+	  "\n"
+	  "Retrieves the LCID language tag of a case-insensitive language tag identifier." },
+
+	{ "get_language_tag_identifiers",
+	  (PyCFunction) pyfwnt_get_language_tag_identifiers,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "get_language_tag_identifiers(lcids) -> List of Unicode strings\n"
+	  "\n"
+	  "Retrieves the language tag identifiers of a sequence of LCID language tags.\n"
+	  "\n"
+	  "The identifiers of unsupported language tags are None." },
+
+	{ "lznt1_decompress",
+	  (PyCFunction) pyfwnt_lznt1_decompress,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "lznt1_decompress(compressed_data, uncompressed_data_size=None) -> String\n"
+	  "\n"
+	  "Decompresses LZNT1 compressed data.\n"
+	  "\n"
+	  "If the uncompressed data size is not provided it is determined from the chunk headers." },
+
+	{ "lzxpress_decompress",
+	  (PyCFunction) pyfwnt_lzxpress_decompress,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "lzxpress_decompress(compressed_data, uncompressed_data_size) -> String\n"
+	  "\n"
+	  "Decompresses LZXPRESS compressed data." },
+
+	{ "lzxpress_huffman_decompress",
+	  (PyCFunction) pyfwnt_lzxpress_huffman_decompress,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "lzxpress_huffman_decompress(compressed_data, uncompressed_data_size) -> String\n"
+	  "\n"
+	  "Decompresses LZXPRESS Huffman compressed data." },
+
+	{ "lzxpress_huffman_compress",
+	  (PyCFunction) pyfwnt_lzxpress_huffman_compress,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "lzxpress_huffman_compress(uncompressed_data, compression_level=6, number_of_threads=1) -> String\n"
+	  "\n"
+	  "Compresses data using LZXPRESS Huffman compression.\n"
+	  "The compression level ranges from 1 (fastest) to 9 (smallest), with more than\n"
+	  "1 thread chunks of 64 KiB are compressed in parallel." },
+
+	{ "validate_security_descriptor",
+	  (PyCFunction) pyfwnt_validate_security_descriptor,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "validate_security_descriptor(data) -> Tuple\n"
+	  "\n"
+	  "Validates a self-relative security descriptor without parsing it.\n"
+	  "\n"
+	  "Returns a tuple of the validation error and the offset it relates to,\n"
+	  "where a validation error of 0 indicates the security descriptor is valid." },
+
+	{ "validate_access_control_list",
+	  (PyCFunction) pyfwnt_validate_access_control_list,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "validate_access_control_list(data) -> Tuple\n"
+	  "\n"
+	  "Validates an access control list (ACL) without parsing it.\n"
+	  "\n"
+	  "Returns a tuple of the validation error and the offset it relates to,\n"
+	  "where a validation error of 0 indicates the access control list is valid." },
+
+	{ "find_security_descriptor",
+	  (PyCFunction) pyfwnt_scan_find_security_descriptor,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "find_security_descriptor(data, start_offset=0, end_offset=None, alignment=1) -> Tuple or None\n"
+	  "\n"
+	  "Finds the first self-relative security descriptor in data, such as a byte string\n"
+	  "or a memory mapped image, that starts at a multiple of alignment between start_offset\n"
+	  "and end_offset.\n"
+	  "\n"
+	  "Returns a tuple of the offset and the size of the security descriptor or None if not found." },
+
+	{ "find_security_identifier",
+	  (PyCFunction) pyfwnt_scan_find_security_identifier,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "find_security_identifier(data, start_offset=0, end_offset=None, alignment=1) -> Tuple or None\n"
+	  "\n"
+	  "Finds the first security identifier (SID) with a well-known identifier authority in data,\n"
+	  "such as a byte string or a memory mapped image, that starts at a multiple of alignment\n"
+	  "between start_offset and end_offset.\n"
+	  "\n"
+	  "Returns a tuple of the offset and the size of the SID or None if not found." },
+
+	{ "set_statistics_enabled",
+	  (PyCFunction) pyfwnt_statistics_set_enabled,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "set_statistics_enabled(enabled)\n"
+	  "\n"
+	  "Enables or disables maintaining statistics of the decompression, security descriptor\n"
+	  "parsing and security identifier (SID) conversion functions, disabled by default." },
+
+	{ "get_statistics",
+	  (PyCFunction) pyfwnt_statistics_get,
+	  METH_NOARGS,
+	  "get_statistics() -> Dictionary\n"
+	  "\n"
+	  "Retrieves the statistics as a dictionary of the function names and dictionaries\n"
+	  "of their number of calls, number of input and output bytes and elapsed time\n"
+	  "in nanoseconds. Only successful calls are counted." },
+
+	{ "reset_statistics",
+	  (PyCFunction) pyfwnt_statistics_reset,
+	  METH_NOARGS,
+	  "reset_statistics()\n"
+	  "\n"
+	  "Resets the statistics." },
+
 	/* Sentinel */
 	{ NULL,
 	  NULL,
@@ -90,6 +248,425 @@ PyObject *pyfwnt_get_version(
 	         errors ) );
 }
 
+/* Exports the access control entries of a sequence of access control lists as columns
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_export_access_control_entries(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PyObject *sequence_object   = NULL;
+	static char *keyword_list[] = { "access_control_lists", NULL };
+
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "O",
+	     keyword_list,
+	     &sequence_object ) == 0 )
+	{
+		return( NULL );
+	}
+	return( pyfwnt_access_control_list_export_entries_from_sequence(
+	         sequence_object ) );
+}
+
+/* Creates a new Unicode string object from a language tag string
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_language_tag_string_new(
+           const char *language_tag_string )
+{
+	const char *errors                = NULL;
+	size_t language_tag_string_length = 0;
+
+	if( language_tag_string == NULL )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
+	language_tag_string_length = narrow_string_length(
+	                              language_tag_string );
+
+	return( PyUnicode_DecodeUTF8(
+	         language_tag_string,
+	         (Py_ssize_t) language_tag_string_length,
+	         errors ) );
+}
+
+/* Copies a LCID language tag integer object to a 16-bit value
+ * Returns 1 if successful or -1 on error
+ */
+int pyfwnt_language_tag_copy_from_integer(
+     PyObject *integer_object,
+     uint16_t *lcid_language_tag )
+{
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyfwnt_language_tag_copy_from_integer";
+	uint64_t value_64bit     = 0;
+
+	if( pyfwnt_integer_unsigned_copy_to_64bit(
+	     integer_object,
+	     &value_64bit,
+	     &error ) != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_ValueError,
+		 "%s: unable to convert integer object into LCID language tag.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( -1 );
+	}
+	if( value_64bit > (uint64_t) UINT16_MAX )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid LCID language tag value out of bounds.",
+		 function );
+
+		return( -1 );
+	}
+	*lcid_language_tag = (uint16_t) value_64bit;
+
+	return( 1 );
+}
+
+/* Retrieves the identifier or description of a LCID language tag
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_get_language_tag_string(
+           PyObject *arguments,
+           PyObject *keywords,
+           int get_description )
+{
+	libcerror_error_t *error     = NULL;
+	PyObject *integer_object     = NULL;
+	static char *function        = "pyfwnt_get_language_tag_string";
+	static char *keyword_list[]  = { "lcid", NULL };
+	const char *string           = NULL;
+	uint16_t lcid_language_tag   = 0;
+	int result                   = 0;
+
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "O",
+	     keyword_list,
+	     &integer_object ) == 0 )
+	{
+		return( NULL );
+	}
+	if( pyfwnt_language_tag_copy_from_integer(
+	     integer_object,
+	     &lcid_language_tag ) != 1 )
+	{
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	if( get_description == 0 )
+	{
+		result = libfwnt_locale_identifier_language_tags_get_identifiers(
+		          &lcid_language_tag,
+		          1,
+		          &string,
+		          NULL,
+		          &error );
+	}
+	else
+	{
+		result = libfwnt_locale_identifier_language_tags_get_identifiers(
+		          &lcid_language_tag,
+		          1,
+		          NULL,
+		          &string,
+		          &error );
+	}
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve language tag string.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	return( pyfwnt_language_tag_string_new(
+	         string ) );
+}
+
+/* Retrieves the language tag identifier of a LCID language tag
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_get_language_tag_identifier(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+
+	return( pyfwnt_get_language_tag_string(
+	         arguments,
+	         keywords,
+	         0 ) );
+}
+
+/* Retrieves the description of a LCID language tag
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_get_language_tag_description(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+
+	return( pyfwnt_get_language_tag_string(
+	         arguments,
+	         keywords,
+	         1 ) );
+}
+
+/* Retrieves the LCID language tag of a language tag identifier
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_get_language_tag_lcid(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	libcerror_error_t *error    = NULL;
+	static char *function       = "pyfwnt_get_language_tag_lcid";
+	static char *keyword_list[] = { "identifier", NULL };
+	const char *identifier      = NULL;
+	size_t identifier_length    = 0;
+	uint16_t lcid_language_tag  = 0;
+	int result                  = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "s",
+	     keyword_list,
+	     &identifier ) == 0 )
+	{
+		return( NULL );
+	}
+	identifier_length = narrow_string_length(
+	                     identifier );
+
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_locale_identifier_language_tag_get_lcid_from_identifier(
+	          identifier,
+	          identifier_length,
+	          &lcid_language_tag,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result == -1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve LCID language tag.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	else if( result == 0 )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
+#if PY_MAJOR_VERSION >= 3
+	return( PyLong_FromLong(
+	         (long) lcid_language_tag ) );
+#else
+	return( PyInt_FromLong(
+	         (long) lcid_language_tag ) );
+#endif
+}
+
+/* Retrieves the language tag identifiers of a sequence of LCID language tags
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_get_language_tag_identifiers(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	libcerror_error_t *error       = NULL;
+	PyObject *fast_sequence_object = NULL;
+	PyObject *list_object          = NULL;
+	PyObject *sequence_object      = NULL;
+	PyObject *string_object        = NULL;
+	PyObject **sequence_items      = NULL;
+	static char *function          = "pyfwnt_get_language_tag_identifiers";
+	static char *keyword_list[]    = { "lcids", NULL };
+	const char **identifiers       = NULL;
+	uint16_t *lcid_language_tags   = NULL;
+	Py_ssize_t number_of_lcids     = 0;
+	Py_ssize_t lcid_index          = 0;
+	int result                     = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "O",
+	     keyword_list,
+	     &sequence_object ) == 0 )
+	{
+		return( NULL );
+	}
+	fast_sequence_object = PySequence_Fast(
+	                        sequence_object,
+	                        "sequence of LCID language tags expected" );
+
+	if( fast_sequence_object == NULL )
+	{
+		return( NULL );
+	}
+	number_of_lcids = PySequence_Fast_GET_SIZE(
+	                   fast_sequence_object );
+
+	sequence_items = PySequence_Fast_ITEMS(
+	                  fast_sequence_object );
+
+	lcid_language_tags = (uint16_t *) PyMem_Malloc(
+	                                   sizeof( uint16_t ) * ( number_of_lcids + 1 ) );
+
+	identifiers = (const char **) PyMem_Malloc(
+	                               sizeof( const char * ) * ( number_of_lcids + 1 ) );
+
+	if( ( lcid_language_tags == NULL )
+	 || ( identifiers == NULL ) )
+	{
+		PyErr_Format(
+		 PyExc_MemoryError,
+		 "%s: unable to create LCID language tags.",
+		 function );
+
+		goto on_error;
+	}
+	for( lcid_index = 0;
+	     lcid_index < number_of_lcids;
+	     lcid_index++ )
+	{
+		if( pyfwnt_language_tag_copy_from_integer(
+		     sequence_items[ lcid_index ],
+		     &( lcid_language_tags[ lcid_index ] ) ) != 1 )
+		{
+			goto on_error;
+		}
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_locale_identifier_language_tags_get_identifiers(
+	          lcid_language_tags,
+	          (size_t) number_of_lcids,
+	          identifiers,
+	          NULL,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve language tag identifiers.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		goto on_error;
+	}
+	list_object = PyList_New(
+	               number_of_lcids );
+
+	if( list_object == NULL )
+	{
+		goto on_error;
+	}
+	for( lcid_index = 0;
+	     lcid_index < number_of_lcids;
+	     lcid_index++ )
+	{
+		string_object = pyfwnt_language_tag_string_new(
+		                 identifiers[ lcid_index ] );
+
+		if( string_object == NULL )
+		{
+			goto on_error;
+		}
+		/* PyList_SET_ITEM steals the reference to string_object
+		 */
+		PyList_SET_ITEM(
+		 list_object,
+		 lcid_index,
+		 string_object );
+	}
+	PyMem_Free(
+	 identifiers );
+
+	PyMem_Free(
+	 lcid_language_tags );
+
+	Py_DecRef(
+	 fast_sequence_object );
+
+	return( list_object );
+
+on_error:
+	if( list_object != NULL )
+	{
+		Py_DecRef(
+		 list_object );
+	}
+	if( identifiers != NULL )
+	{
+		PyMem_Free(
+		 identifiers );
+	}
+	if( lcid_language_tags != NULL )
+	{
+		PyMem_Free(
+		 lcid_language_tags );
+	}
+	Py_DecRef(
+	 fast_sequence_object );
+
+	return( NULL );
+}
+
 #if PY_MAJOR_VERSION >= 3
 
 /* The pyfwnt module definition
@@ -134,6 +711,7 @@ PyMODINIT_FUNC initpyfwnt(
 	PyTypeObject *access_control_list_type_object    = NULL;
 	PyTypeObject *security_descriptor_type_object    = NULL;
 	PyTypeObject *security_identifier_type_object    = NULL;
+	PyTypeObject *wof_stream_type_object             = NULL;
 	PyGILState_STATE gil_state                       = 0;
 
 #if defined( HAVE_DEBUG_OUTPUT )
@@ -165,6 +743,20 @@ PyMODINIT_FUNC initpyfwnt(
 		return;
 #endif
 	}
+#if defined( Py_GIL_DISABLED )
+	/* The pyfwnt objects are immutable once set or use per-object critical
+	 * sections, hence the module can be used without the GIL
+	 */
+	if( PyUnstable_Module_SetGIL(
+	     module,
+	     Py_MOD_GIL_NOT_USED ) != 0 )
+	{
+		Py_DecRef(
+		 module );
+
+		return( NULL );
+	}
+#endif
 	PyEval_InitThreads();
 
 	gil_state = PyGILState_Ensure();
@@ -286,6 +878,25 @@ PyMODINIT_FUNC initpyfwnt(
 	 "access_control_types",
 	 (PyObject *) access_control_types_type_object );
 
+	/* Setup the WOF stream type object
+	 */
+	pyfwnt_wof_stream_type_object.tp_new = PyType_GenericNew;
+
+	if( PyType_Ready(
+	     &pyfwnt_wof_stream_type_object ) < 0 )
+	{
+		goto on_error;
+	}
+	Py_IncRef(
+	 (PyObject *) &pyfwnt_wof_stream_type_object );
+
+	wof_stream_type_object = &pyfwnt_wof_stream_type_object;
+
+	PyModule_AddObject(
+	 module,
+	 "wof_stream",
+	 (PyObject *) wof_stream_type_object );
+
 #if PY_MAJOR_VERSION >= 3
 	return( module );
 #else
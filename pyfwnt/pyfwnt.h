@@ -35,6 +35,43 @@ PyObject *pyfwnt_get_version(
            PyObject *self,
            PyObject *arguments );
 
+PyObject *pyfwnt_export_access_control_entries(
+           PyObject *self,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_language_tag_string_new(
+           const char *language_tag_string );
+
+int pyfwnt_language_tag_copy_from_integer(
+     PyObject *integer_object,
+     uint16_t *lcid_language_tag );
+
+PyObject *pyfwnt_get_language_tag_string(
+           PyObject *arguments,
+           PyObject *keywords,
+           int get_description );
+
+PyObject *pyfwnt_get_language_tag_identifier(
+           PyObject *self,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_get_language_tag_description(
+           PyObject *self,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_get_language_tag_lcid(
+           PyObject *self,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_get_language_tag_identifiers(
+           PyObject *self,
+           PyObject *arguments,
+           PyObject *keywords );
+
 #if PY_MAJOR_VERSION >= 3
 PyMODINIT_FUNC PyInit_pyfwnt(
                 void );
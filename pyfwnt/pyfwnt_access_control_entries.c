@@ -400,6 +400,7 @@ PyObject *pyfwnt_access_control_entries_iternext(
 {
 	PyObject *entry_object = NULL;
 	static char *function  = "pyfwnt_access_control_entries_iternext";
+	int entry_index        = 0;
 
 	if( pyfwnt_access_control_entries == NULL )
 	{
@@ -437,7 +438,20 @@ PyObject *pyfwnt_access_control_entries_iternext(
 
 		return( NULL );
 	}
-	if( pyfwnt_access_control_entries->entry_index >= pyfwnt_access_control_entries->number_of_entries )
+	/* The entry index is claimed before the entry is retrieved, so that threads
+	 * sharing an iterator do not return the same entry
+	 */
+	PYFWNT_BEGIN_CRITICAL_SECTION( (PyObject *) pyfwnt_access_control_entries )
+
+	entry_index = pyfwnt_access_control_entries->entry_index;
+
+	if( entry_index < pyfwnt_access_control_entries->number_of_entries )
+	{
+		pyfwnt_access_control_entries->entry_index++;
+	}
+	PYFWNT_END_CRITICAL_SECTION
+
+	if( entry_index >= pyfwnt_access_control_entries->number_of_entries )
 	{
 		PyErr_SetNone(
 		 PyExc_StopIteration );
@@ -446,12 +460,8 @@ PyObject *pyfwnt_access_control_entries_iternext(
 	}
 	entry_object = pyfwnt_access_control_entries->get_entry_by_index(
 	                pyfwnt_access_control_entries->access_control_list_object,
-	                pyfwnt_access_control_entries->entry_index );
+	                entry_index );
 
-	if( entry_object != NULL )
-	{
-		pyfwnt_access_control_entries->entry_index++;
-	}
 	return( entry_object );
 }
 
@@ -67,6 +67,41 @@ PyMethodDef pyfwnt_access_control_entry_object_methods[] = {
 	  "\n"
 	  "Retrieves the security identifier." },
 
+	{ "get_object_flags",
+	  (PyCFunction) pyfwnt_access_control_entry_get_object_flags,
+	  METH_NOARGS,
+	  "get_object_flags() -> Integer or None\n"
+	  "\n"
+	  "Retrieves the object flags." },
+
+	{ "get_object_type",
+	  (PyCFunction) pyfwnt_access_control_entry_get_object_type,
+	  METH_NOARGS,
+	  "get_object_type() -> Binary string or None\n"
+	  "\n"
+	  "Retrieves the object type GUID as a little-endian binary string." },
+
+	{ "get_inherited_object_type",
+	  (PyCFunction) pyfwnt_access_control_entry_get_inherited_object_type,
+	  METH_NOARGS,
+	  "get_inherited_object_type() -> Binary string or None\n"
+	  "\n"
+	  "Retrieves the inherited object type GUID as a little-endian binary string." },
+
+	{ "get_application_data",
+	  (PyCFunction) pyfwnt_access_control_entry_get_application_data,
+	  METH_NOARGS,
+	  "get_application_data() -> Binary string or None\n"
+	  "\n"
+	  "Retrieves the application data." },
+
+	{ "copy_to_byte_stream",
+	  (PyCFunction) pyfwnt_access_control_entry_copy_to_byte_stream,
+	  METH_NOARGS,
+	  "copy_to_byte_stream() -> Bytes\n"
+	  "\n"
+	  "Copies the access control entry to a byte stream." },
+
 	/* Sentinel */
 	{ NULL, NULL, 0, NULL }
 };
@@ -97,6 +132,30 @@ PyGetSetDef pyfwnt_access_control_entry_object_get_set_definitions[] = {
 	  "The security identifier.",
 	  NULL },
 
+	{ "object_flags",
+	  (getter) pyfwnt_access_control_entry_get_object_flags,
+	  (setter) 0,
+	  "The object flags.",
+	  NULL },
+
+	{ "object_type",
+	  (getter) pyfwnt_access_control_entry_get_object_type,
+	  (setter) 0,
+	  "The object type GUID.",
+	  NULL },
+
+	{ "inherited_object_type",
+	  (getter) pyfwnt_access_control_entry_get_inherited_object_type,
+	  (setter) 0,
+	  "The inherited object type GUID.",
+	  NULL },
+
+	{ "application_data",
+	  (getter) pyfwnt_access_control_entry_get_application_data,
+	  (setter) 0,
+	  "The application data.",
+	  NULL },
+
 	/* Sentinel */
 	{ NULL, NULL, NULL, NULL, NULL }
 };
@@ -588,3 +647,404 @@ on_error:
 	return( NULL );
 }
 
+/* Retrieves the object flags
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_access_control_entry_get_object_flags(
+           pyfwnt_access_control_entry_t *pyfwnt_access_control_entry,
+           PyObject *arguments PYFWNT_ATTRIBUTE_UNUSED )
+{
+	libcerror_error_t *error = NULL;
+	PyObject *integer_object = NULL;
+	static char *function    = "pyfwnt_access_control_entry_get_object_flags";
+	uint32_t object_flags    = 0;
+	int result               = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyfwnt_access_control_entry == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid access control entry.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_access_control_entry_get_object_flags(
+	          pyfwnt_access_control_entry->access_control_entry,
+	          &object_flags,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result == -1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve object flags.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	else if( result == 0 )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
+	integer_object = pyfwnt_integer_unsigned_new_from_64bit(
+	                  (uint64_t) object_flags );
+
+	return( integer_object );
+}
+
+/* Retrieves the object type GUID
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_access_control_entry_get_object_type(
+           pyfwnt_access_control_entry_t *pyfwnt_access_control_entry,
+           PyObject *arguments PYFWNT_ATTRIBUTE_UNUSED )
+{
+	uint8_t guid_data[ 16 ];
+
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyfwnt_access_control_entry_get_object_type";
+	int result               = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyfwnt_access_control_entry == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid access control entry.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_access_control_entry_get_object_type(
+	          pyfwnt_access_control_entry->access_control_entry,
+	          guid_data,
+	          16,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result == -1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve object type.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	else if( result == 0 )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
+#if PY_MAJOR_VERSION >= 3
+	return( PyBytes_FromStringAndSize(
+	         (char *) guid_data,
+	         16 ) );
+#else
+	return( PyString_FromStringAndSize(
+	         (char *) guid_data,
+	         16 ) );
+#endif
+}
+
+/* Retrieves the inherited object type GUID
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_access_control_entry_get_inherited_object_type(
+           pyfwnt_access_control_entry_t *pyfwnt_access_control_entry,
+           PyObject *arguments PYFWNT_ATTRIBUTE_UNUSED )
+{
+	uint8_t guid_data[ 16 ];
+
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyfwnt_access_control_entry_get_inherited_object_type";
+	int result               = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyfwnt_access_control_entry == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid access control entry.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_access_control_entry_get_inherited_object_type(
+	          pyfwnt_access_control_entry->access_control_entry,
+	          guid_data,
+	          16,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result == -1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve inherited object type.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	else if( result == 0 )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
+#if PY_MAJOR_VERSION >= 3
+	return( PyBytes_FromStringAndSize(
+	         (char *) guid_data,
+	         16 ) );
+#else
+	return( PyString_FromStringAndSize(
+	         (char *) guid_data,
+	         16 ) );
+#endif
+}
+
+/* Retrieves the application data
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_access_control_entry_get_application_data(
+           pyfwnt_access_control_entry_t *pyfwnt_access_control_entry,
+           PyObject *arguments PYFWNT_ATTRIBUTE_UNUSED )
+{
+	libcerror_error_t *error = NULL;
+	PyObject *bytes_object   = NULL;
+	static char *function    = "pyfwnt_access_control_entry_get_application_data";
+	char *data               = NULL;
+	size_t data_size         = 0;
+	int result               = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyfwnt_access_control_entry == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid access control entry.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_access_control_entry_get_application_data_size(
+	          pyfwnt_access_control_entry->access_control_entry,
+	          &data_size,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result == -1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve application data size.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	else if( result == 0 )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
+	/* The application data is copied directly into the buffer of the bytes object
+	 */
+#if PY_MAJOR_VERSION >= 3
+	bytes_object = PyBytes_FromStringAndSize(
+	                NULL,
+	                (Py_ssize_t) data_size );
+#else
+	bytes_object = PyString_FromStringAndSize(
+	                NULL,
+	                (Py_ssize_t) data_size );
+#endif
+	if( bytes_object == NULL )
+	{
+		PyErr_Format(
+		 PyExc_MemoryError,
+		 "%s: unable to create application data.",
+		 function );
+
+		return( NULL );
+	}
+#if PY_MAJOR_VERSION >= 3
+	data = PyBytes_AsString(
+	        bytes_object );
+#else
+	data = PyString_AsString(
+	        bytes_object );
+#endif
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_access_control_entry_get_application_data(
+	          pyfwnt_access_control_entry->access_control_entry,
+	          (uint8_t *) data,
+	          data_size,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve application data.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		Py_DecRef(
+		 bytes_object );
+
+		return( NULL );
+	}
+	return( bytes_object );
+}
+
+/* Copies the access control entry to a byte stream
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_access_control_entry_copy_to_byte_stream(
+           pyfwnt_access_control_entry_t *pyfwnt_access_control_entry,
+           PyObject *arguments PYFWNT_ATTRIBUTE_UNUSED )
+{
+	libcerror_error_t *error = NULL;
+	PyObject *bytes_object   = NULL;
+	static char *function    = "pyfwnt_access_control_entry_copy_to_byte_stream";
+	char *byte_stream        = NULL;
+	size_t byte_stream_size  = 0;
+	int result               = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyfwnt_access_control_entry == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid access control entry.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_access_control_entry_get_byte_stream_size(
+	          pyfwnt_access_control_entry->access_control_entry,
+	          &byte_stream_size,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve byte stream size.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+#if PY_MAJOR_VERSION >= 3
+	bytes_object = PyBytes_FromStringAndSize(
+	                NULL,
+	                (Py_ssize_t) byte_stream_size );
+#else
+	bytes_object = PyString_FromStringAndSize(
+	                NULL,
+	                (Py_ssize_t) byte_stream_size );
+#endif
+	if( bytes_object == NULL )
+	{
+		PyErr_Format(
+		 PyExc_MemoryError,
+		 "%s: unable to create byte stream.",
+		 function );
+
+		return( NULL );
+	}
+#if PY_MAJOR_VERSION >= 3
+	byte_stream = PyBytes_AsString(
+	               bytes_object );
+#else
+	byte_stream = PyString_AsString(
+	               bytes_object );
+#endif
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_access_control_entry_copy_to_byte_stream(
+	          pyfwnt_access_control_entry->access_control_entry,
+	          (uint8_t *) byte_stream,
+	          byte_stream_size,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to copy access control entry to byte stream.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		Py_DecRef(
+		 bytes_object );
+
+		return( NULL );
+	}
+	return( bytes_object );
+}
+
@@ -80,6 +80,26 @@ PyObject *pyfwnt_access_control_entry_get_security_identifier(
            pyfwnt_access_control_entry_t *pyfwnt_access_control_entry,
            PyObject *arguments );
 
+PyObject *pyfwnt_access_control_entry_get_object_flags(
+           pyfwnt_access_control_entry_t *pyfwnt_access_control_entry,
+           PyObject *arguments );
+
+PyObject *pyfwnt_access_control_entry_get_object_type(
+           pyfwnt_access_control_entry_t *pyfwnt_access_control_entry,
+           PyObject *arguments );
+
+PyObject *pyfwnt_access_control_entry_get_inherited_object_type(
+           pyfwnt_access_control_entry_t *pyfwnt_access_control_entry,
+           PyObject *arguments );
+
+PyObject *pyfwnt_access_control_entry_get_application_data(
+           pyfwnt_access_control_entry_t *pyfwnt_access_control_entry,
+           PyObject *arguments );
+
+PyObject *pyfwnt_access_control_entry_copy_to_byte_stream(
+           pyfwnt_access_control_entry_t *pyfwnt_access_control_entry,
+           PyObject *arguments );
+
 #if defined( __cplusplus )
 }
 #endif
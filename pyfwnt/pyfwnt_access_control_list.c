@@ -20,6 +20,8 @@
  */
 
 #include <common.h>
+#include <memory.h>
+#include <narrow_string.h>
 #include <types.h>
 
 #if defined( HAVE_STDLIB_H )
@@ -35,6 +37,11 @@
 #include "pyfwnt_python.h"
 #include "pyfwnt_unused.h"
 
+/* The maximum size of a SID string: "S-255-0x" + 12 hexadecimal digits
+ * followed by 15 sub authorities of up to 11 characters each and the end-of-string character
+ */
+#define PYFWNT_SECURITY_IDENTIFIER_STRING_MAXIMUM_SIZE		192
+
 PyMethodDef pyfwnt_access_control_list_object_methods[] = {
 
 	/* Functions to access the access control list */
@@ -53,6 +60,26 @@ PyMethodDef pyfwnt_access_control_list_object_methods[] = {
 	  "\n"
 	  "Retrieves a specific access control entry." },
 
+	{ "export_entries",
+	  (PyCFunction) pyfwnt_access_control_list_export_entries,
+	  METH_NOARGS,
+	  "export_entries() -> Dictionary\n"
+	  "\n"
+	  "Exports the access control entries as columns.\n"
+	  "\n"
+	  "The \"acl_index\" (uint32), \"type\" (uint8), \"flags\" (uint8), \"access_mask\" (uint32),\n"
+	  "\"sid_index\" (int32) and \"object_type\" (16 bytes) columns are bytearray objects in native\n"
+	  "byte order that can be wrapped with numpy.frombuffer. The \"sid_index\" column indexes the\n"
+	  "\"sids\" list of distinct SID strings and is -1 for entries without a SID. The \"object_type\"\n"
+	  "column contains the GUID in little-endian or zeros when not present." },
+
+	{ "copy_to_byte_stream",
+	  (PyCFunction) pyfwnt_access_control_list_copy_to_byte_stream,
+	  METH_NOARGS,
+	  "copy_to_byte_stream() -> Bytes\n"
+	  "\n"
+	  "Copies the access control list to a byte stream." },
+
 	/* Sentinel */
 	{ NULL, NULL, 0, NULL }
 };
@@ -487,6 +514,108 @@ PyObject *pyfwnt_access_control_list_get_entry(
 	return( entry_object );
 }
 
+/* Copies the access control list to a byte stream
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_access_control_list_copy_to_byte_stream(
+           pyfwnt_access_control_list_t *pyfwnt_access_control_list,
+           PyObject *arguments PYFWNT_ATTRIBUTE_UNUSED )
+{
+	libcerror_error_t *error = NULL;
+	PyObject *bytes_object   = NULL;
+	static char *function    = "pyfwnt_access_control_list_copy_to_byte_stream";
+	char *byte_stream        = NULL;
+	size_t byte_stream_size  = 0;
+	int result               = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyfwnt_access_control_list == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid access control list.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_access_control_list_get_byte_stream_size(
+	          pyfwnt_access_control_list->access_control_list,
+	          &byte_stream_size,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve byte stream size.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+#if PY_MAJOR_VERSION >= 3
+	bytes_object = PyBytes_FromStringAndSize(
+	                NULL,
+	                (Py_ssize_t) byte_stream_size );
+#else
+	bytes_object = PyString_FromStringAndSize(
+	                NULL,
+	                (Py_ssize_t) byte_stream_size );
+#endif
+	if( bytes_object == NULL )
+	{
+		PyErr_Format(
+		 PyExc_MemoryError,
+		 "%s: unable to create byte stream.",
+		 function );
+
+		return( NULL );
+	}
+#if PY_MAJOR_VERSION >= 3
+	byte_stream = PyBytes_AsString(
+	               bytes_object );
+#else
+	byte_stream = PyString_AsString(
+	               bytes_object );
+#endif
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_access_control_list_copy_to_byte_stream(
+	          pyfwnt_access_control_list->access_control_list,
+	          (uint8_t *) byte_stream,
+	          byte_stream_size,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to copy access control list to byte stream.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		Py_DecRef(
+		 bytes_object );
+
+		return( NULL );
+	}
+	return( bytes_object );
+}
+
 /* Retrieves a entries sequence and iterator object for the entries
  * Returns a Python object if successful or NULL on error
  */
@@ -551,3 +680,578 @@ PyObject *pyfwnt_access_control_list_get_entries(
 	return( entries_object );
 }
 
+
+/* Exports the access control entries of the access control list as columns
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_access_control_list_export_entries(
+           pyfwnt_access_control_list_t *pyfwnt_access_control_list,
+           PyObject *arguments PYFWNT_ATTRIBUTE_UNUSED )
+{
+	PyObject *columns_object  = NULL;
+	PyObject *sequence_object = NULL;
+	static char *function     = "pyfwnt_access_control_list_export_entries";
+
+	PYFWNT_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyfwnt_access_control_list == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid access control list.",
+		 function );
+
+		return( NULL );
+	}
+	sequence_object = PyTuple_Pack(
+	                   1,
+	                   (PyObject *) pyfwnt_access_control_list );
+
+	if( sequence_object == NULL )
+	{
+		return( NULL );
+	}
+	columns_object = pyfwnt_access_control_list_export_entries_from_sequence(
+	                  sequence_object );
+
+	Py_DecRef(
+	 sequence_object );
+
+	return( columns_object );
+}
+
+/* Exports the access control entries of a sequence of access control lists as columns
+ *
+ * The columns are returned in a dictionary as bytearray objects in native byte order, one row per entry:
+ * "acl_index" (uint32), "type" (uint8), "flags" (uint8), "access_mask" (uint32),
+ * "sid_index" (int32, -1 if the entry has no SID) and "object_type" (16 bytes, zero if not present).
+ * The "sids" list contains the distinct SID strings referenced by "sid_index".
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_access_control_list_export_entries_from_sequence(
+           PyObject *sequence_object )
+{
+	libcerror_error_t *error                             = NULL;
+	libfwnt_access_control_entry_t *access_control_entry = NULL;
+	libfwnt_access_control_list_t *access_control_list   = NULL;
+	libfwnt_security_identifier_t *security_identifier   = NULL;
+	PyObject *access_mask_column                         = NULL;
+	PyObject *acl_index_column                           = NULL;
+	PyObject *columns_object                             = NULL;
+	PyObject *fast_sequence_object                       = NULL;
+	PyObject *flags_column                               = NULL;
+	PyObject *index_object                               = NULL;
+	PyObject *object_type_column                         = NULL;
+	PyObject *sid_index_column                           = NULL;
+	PyObject *sid_indexes                                = NULL;
+	PyObject *sid_object                                 = NULL;
+	PyObject *sids_list                                  = NULL;
+	PyObject *type_column                                = NULL;
+	PyObject **sequence_items                            = NULL;
+	uint8_t *flags_data                                  = NULL;
+	uint8_t *object_type_data                            = NULL;
+	uint8_t *sid_strings                                 = NULL;
+	uint8_t *type_data                                   = NULL;
+	uint32_t *access_mask_data                           = NULL;
+	uint32_t *acl_index_data                             = NULL;
+	int32_t *sid_index_data                              = NULL;
+	static char *function                                = "pyfwnt_access_control_list_export_entries_from_sequence";
+	const char *errors                                   = NULL;
+	const char *error_string                             = NULL;
+	size_t sid_string_size                               = 0;
+	Py_ssize_t number_of_lists                           = 0;
+	Py_ssize_t list_index                                = 0;
+	Py_ssize_t maximum_number_of_entries                 = 0;
+	Py_ssize_t row_index                                 = 0;
+	Py_ssize_t row_offset                                = 0;
+	Py_ssize_t sid_index                                 = 0;
+	Py_ssize_t total_number_of_entries                   = 0;
+	int entry_index                                      = 0;
+	int number_of_entries                                = 0;
+	int result                                           = 0;
+
+	fast_sequence_object = PySequence_Fast(
+	                        sequence_object,
+	                        "sequence of access control lists expected" );
+
+	if( fast_sequence_object == NULL )
+	{
+		return( NULL );
+	}
+	number_of_lists = PySequence_Fast_GET_SIZE(
+	                   fast_sequence_object );
+
+	sequence_items = PySequence_Fast_ITEMS(
+	                  fast_sequence_object );
+
+	/* Size the columns up front so every row is written in place
+	 */
+	for( list_index = 0;
+	     list_index < number_of_lists;
+	     list_index++ )
+	{
+		if( PyObject_TypeCheck(
+		     sequence_items[ list_index ],
+		     &pyfwnt_access_control_list_type_object ) == 0 )
+		{
+			PyErr_Format(
+			 PyExc_TypeError,
+			 "%s: unsupported item: %zd, access control list expected.",
+			 function,
+			 list_index );
+
+			goto on_error;
+		}
+		access_control_list = ( (pyfwnt_access_control_list_t *) sequence_items[ list_index ] )->access_control_list;
+
+		Py_BEGIN_ALLOW_THREADS
+
+		result = libfwnt_access_control_list_get_number_of_entries(
+		          access_control_list,
+		          &number_of_entries,
+		          &error );
+
+		Py_END_ALLOW_THREADS
+
+		if( result != 1 )
+		{
+			pyfwnt_error_raise(
+			 error,
+			 PyExc_IOError,
+			 "%s: unable to retrieve number of entries of list: %zd.",
+			 function,
+			 list_index );
+
+			libcerror_error_free(
+			 &error );
+
+			goto on_error;
+		}
+		total_number_of_entries += number_of_entries;
+
+		if( number_of_entries > maximum_number_of_entries )
+		{
+			maximum_number_of_entries = number_of_entries;
+		}
+	}
+	acl_index_column = PyByteArray_FromStringAndSize(
+	                    NULL,
+	                    total_number_of_entries * sizeof( uint32_t ) );
+
+	type_column = PyByteArray_FromStringAndSize(
+	               NULL,
+	               total_number_of_entries );
+
+	flags_column = PyByteArray_FromStringAndSize(
+	                NULL,
+	                total_number_of_entries );
+
+	access_mask_column = PyByteArray_FromStringAndSize(
+	                      NULL,
+	                      total_number_of_entries * sizeof( uint32_t ) );
+
+	sid_index_column = PyByteArray_FromStringAndSize(
+	                    NULL,
+	                    total_number_of_entries * sizeof( int32_t ) );
+
+	object_type_column = PyByteArray_FromStringAndSize(
+	                      NULL,
+	                      total_number_of_entries * 16 );
+
+	if( ( acl_index_column == NULL )
+	 || ( type_column == NULL )
+	 || ( flags_column == NULL )
+	 || ( access_mask_column == NULL )
+	 || ( sid_index_column == NULL )
+	 || ( object_type_column == NULL ) )
+	{
+		PyErr_Format(
+		 PyExc_MemoryError,
+		 "%s: unable to create columns.",
+		 function );
+
+		goto on_error;
+	}
+	acl_index_data   = (uint32_t *) PyByteArray_AS_STRING( acl_index_column );
+	type_data        = (uint8_t *) PyByteArray_AS_STRING( type_column );
+	flags_data       = (uint8_t *) PyByteArray_AS_STRING( flags_column );
+	access_mask_data = (uint32_t *) PyByteArray_AS_STRING( access_mask_column );
+	sid_index_data   = (int32_t *) PyByteArray_AS_STRING( sid_index_column );
+	object_type_data = (uint8_t *) PyByteArray_AS_STRING( object_type_column );
+
+	/* The SID strings of a list are formatted without the GIL into a scratch buffer
+	 * with a fixed stride and interned afterwards
+	 */
+	if( maximum_number_of_entries > 0 )
+	{
+		sid_strings = (uint8_t *) PyMem_Malloc(
+		                           sizeof( uint8_t ) * maximum_number_of_entries * PYFWNT_SECURITY_IDENTIFIER_STRING_MAXIMUM_SIZE );
+
+		if( sid_strings == NULL )
+		{
+			PyErr_Format(
+			 PyExc_MemoryError,
+			 "%s: unable to create SID strings.",
+			 function );
+
+			goto on_error;
+		}
+	}
+	sid_indexes = PyDict_New();
+
+	if( sid_indexes == NULL )
+	{
+		goto on_error;
+	}
+	sids_list = PyList_New(
+	             0 );
+
+	if( sids_list == NULL )
+	{
+		goto on_error;
+	}
+	row_offset = 0;
+
+	for( list_index = 0;
+	     list_index < number_of_lists;
+	     list_index++ )
+	{
+		access_control_list = ( (pyfwnt_access_control_list_t *) sequence_items[ list_index ] )->access_control_list;
+		error_string        = NULL;
+
+		Py_BEGIN_ALLOW_THREADS
+
+		result = libfwnt_access_control_list_get_number_of_entries(
+		          access_control_list,
+		          &number_of_entries,
+		          &error );
+
+		if( result != 1 )
+		{
+			error_string = "unable to retrieve number of entries";
+		}
+		else if( ( row_offset + number_of_entries ) > total_number_of_entries )
+		{
+			error_string = "number of entries changed";
+		}
+		for( entry_index = 0;
+		     ( error_string == NULL ) && ( entry_index < number_of_entries );
+		     entry_index++ )
+		{
+			row_index = row_offset + entry_index;
+
+			if( libfwnt_access_control_list_get_entry_by_index(
+			     access_control_list,
+			     entry_index,
+			     &access_control_entry,
+			     &error ) != 1 )
+			{
+				error_string = "unable to retrieve entry";
+
+				break;
+			}
+			acl_index_data[ row_index ] = (uint32_t) list_index;
+
+			if( libfwnt_access_control_entry_get_type(
+			     access_control_entry,
+			     &( type_data[ row_index ] ),
+			     &error ) != 1 )
+			{
+				error_string = "unable to retrieve type";
+			}
+			else if( libfwnt_access_control_entry_get_flags(
+			          access_control_entry,
+			          &( flags_data[ row_index ] ),
+			          &error ) != 1 )
+			{
+				error_string = "unable to retrieve flags";
+			}
+			if( error_string == NULL )
+			{
+				result = libfwnt_access_control_entry_get_access_mask(
+				          access_control_entry,
+				          &( access_mask_data[ row_index ] ),
+				          &error );
+
+				if( result == -1 )
+				{
+					error_string = "unable to retrieve access mask";
+				}
+				else if( result == 0 )
+				{
+					access_mask_data[ row_index ] = 0;
+				}
+			}
+			if( error_string == NULL )
+			{
+				result = libfwnt_access_control_entry_get_object_type(
+				          access_control_entry,
+				          &( object_type_data[ row_index * 16 ] ),
+				          16,
+				          &error );
+
+				if( result == -1 )
+				{
+					error_string = "unable to retrieve object type";
+				}
+				else if( result == 0 )
+				{
+					memory_set(
+					 &( object_type_data[ row_index * 16 ] ),
+					 0,
+					 16 );
+				}
+			}
+			if( error_string == NULL )
+			{
+				security_identifier = NULL;
+
+				result = libfwnt_access_control_entry_get_security_identifier(
+				          access_control_entry,
+				          &security_identifier,
+				          &error );
+
+				if( result == -1 )
+				{
+					error_string = "unable to retrieve security identifier";
+				}
+				else if( result == 0 )
+				{
+					sid_strings[ entry_index * PYFWNT_SECURITY_IDENTIFIER_STRING_MAXIMUM_SIZE ] = 0;
+				}
+				else if( libfwnt_security_identifier_get_string_size(
+				          security_identifier,
+				          &sid_string_size,
+				          0,
+				          &error ) != 1 )
+				{
+					error_string = "unable to retrieve security identifier string size";
+				}
+				else if( sid_string_size > PYFWNT_SECURITY_IDENTIFIER_STRING_MAXIMUM_SIZE )
+				{
+					error_string = "security identifier string size exceeds maximum";
+				}
+				else if( libfwnt_security_identifier_copy_to_utf8_string(
+				          security_identifier,
+				          &( sid_strings[ entry_index * PYFWNT_SECURITY_IDENTIFIER_STRING_MAXIMUM_SIZE ] ),
+				          PYFWNT_SECURITY_IDENTIFIER_STRING_MAXIMUM_SIZE,
+				          0,
+				          &error ) != 1 )
+				{
+					error_string = "unable to copy security identifier to string";
+				}
+			}
+			libfwnt_access_control_entry_free(
+			 &access_control_entry,
+			 NULL );
+		}
+		Py_END_ALLOW_THREADS
+
+		if( error_string != NULL )
+		{
+			pyfwnt_error_raise(
+			 error,
+			 PyExc_IOError,
+			 "%s: %s of list: %zd.",
+			 function,
+			 error_string,
+			 list_index );
+
+			libcerror_error_free(
+			 &error );
+
+			goto on_error;
+		}
+		/* Intern the SID strings, consecutive entries often share a trustee
+		 */
+		sid_index = -1;
+
+		for( entry_index = 0;
+		     entry_index < number_of_entries;
+		     entry_index++ )
+		{
+			row_index = row_offset + entry_index;
+
+			if( sid_strings[ entry_index * PYFWNT_SECURITY_IDENTIFIER_STRING_MAXIMUM_SIZE ] == 0 )
+			{
+				sid_index_data[ row_index ] = -1;
+
+				continue;
+			}
+			if( ( entry_index > 0 )
+			 && ( sid_index != -1 )
+			 && ( narrow_string_compare(
+			       (char *) &( sid_strings[ entry_index * PYFWNT_SECURITY_IDENTIFIER_STRING_MAXIMUM_SIZE ] ),
+			       (char *) &( sid_strings[ ( entry_index - 1 ) * PYFWNT_SECURITY_IDENTIFIER_STRING_MAXIMUM_SIZE ] ),
+			       PYFWNT_SECURITY_IDENTIFIER_STRING_MAXIMUM_SIZE ) == 0 ) )
+			{
+				sid_index_data[ row_index ] = (int32_t) sid_index;
+
+				continue;
+			}
+			sid_object = PyUnicode_DecodeUTF8(
+			              (char *) &( sid_strings[ entry_index * PYFWNT_SECURITY_IDENTIFIER_STRING_MAXIMUM_SIZE ] ),
+			              (Py_ssize_t) narrow_string_length( (char *) &( sid_strings[ entry_index * PYFWNT_SECURITY_IDENTIFIER_STRING_MAXIMUM_SIZE ] ) ),
+			              errors );
+
+			if( sid_object == NULL )
+			{
+				goto on_error;
+			}
+			/* PyDict_GetItem returns a borrowed reference
+			 */
+			index_object = PyDict_GetItem(
+			                sid_indexes,
+			                sid_object );
+
+			if( index_object != NULL )
+			{
+#if PY_MAJOR_VERSION >= 3
+				sid_index = PyLong_AsSsize_t(
+				             index_object );
+#else
+				sid_index = PyInt_AsSsize_t(
+				             index_object );
+#endif
+			}
+			else
+			{
+				sid_index = PyList_GET_SIZE(
+				             sids_list );
+
+#if PY_MAJOR_VERSION >= 3
+				index_object = PyLong_FromSsize_t(
+				                sid_index );
+#else
+				index_object = PyInt_FromSsize_t(
+				                sid_index );
+#endif
+				if( index_object == NULL )
+				{
+					goto on_error;
+				}
+				result = PyDict_SetItem(
+				          sid_indexes,
+				          sid_object,
+				          index_object );
+
+				Py_DecRef(
+				 index_object );
+
+				if( ( result != 0 )
+				 || ( PyList_Append(
+				       sids_list,
+				       sid_object ) != 0 ) )
+				{
+					goto on_error;
+				}
+			}
+			Py_DecRef(
+			 sid_object );
+
+			sid_object = NULL;
+
+			sid_index_data[ row_index ] = (int32_t) sid_index;
+		}
+		row_offset += number_of_entries;
+	}
+	if( sid_strings != NULL )
+	{
+		PyMem_Free(
+		 sid_strings );
+
+		sid_strings = NULL;
+	}
+	Py_DecRef(
+	 sid_indexes );
+
+	sid_indexes = NULL;
+
+	columns_object = Py_BuildValue(
+	                  "{s:N,s:N,s:N,s:N,s:N,s:N,s:N}",
+	                  "acl_index",
+	                  acl_index_column,
+	                  "type",
+	                  type_column,
+	                  "flags",
+	                  flags_column,
+	                  "access_mask",
+	                  access_mask_column,
+	                  "sid_index",
+	                  sid_index_column,
+	                  "object_type",
+	                  object_type_column,
+	                  "sids",
+	                  sids_list );
+
+	/* Py_BuildValue steals the column references with N, also on failure
+	 */
+	acl_index_column   = NULL;
+	type_column        = NULL;
+	flags_column       = NULL;
+	access_mask_column = NULL;
+	sid_index_column   = NULL;
+	object_type_column = NULL;
+	sids_list          = NULL;
+
+	Py_DecRef(
+	 fast_sequence_object );
+
+	return( columns_object );
+
+on_error:
+	if( sid_object != NULL )
+	{
+		Py_DecRef(
+		 sid_object );
+	}
+	if( sids_list != NULL )
+	{
+		Py_DecRef(
+		 sids_list );
+	}
+	if( sid_indexes != NULL )
+	{
+		Py_DecRef(
+		 sid_indexes );
+	}
+	if( sid_strings != NULL )
+	{
+		PyMem_Free(
+		 sid_strings );
+	}
+	if( object_type_column != NULL )
+	{
+		Py_DecRef(
+		 object_type_column );
+	}
+	if( sid_index_column != NULL )
+	{
+		Py_DecRef(
+		 sid_index_column );
+	}
+	if( access_mask_column != NULL )
+	{
+		Py_DecRef(
+		 access_mask_column );
+	}
+	if( flags_column != NULL )
+	{
+		Py_DecRef(
+		 flags_column );
+	}
+	if( type_column != NULL )
+	{
+		Py_DecRef(
+		 type_column );
+	}
+	if( acl_index_column != NULL )
+	{
+		Py_DecRef(
+		 acl_index_column );
+	}
+	Py_DecRef(
+	 fast_sequence_object );
+
+	return( NULL );
+}
@@ -81,6 +81,17 @@ PyObject *pyfwnt_access_control_list_get_entries(
            pyfwnt_access_control_list_t *pyfwnt_access_control_list,
            PyObject *arguments );
 
+PyObject *pyfwnt_access_control_list_export_entries(
+           pyfwnt_access_control_list_t *pyfwnt_access_control_list,
+           PyObject *arguments );
+
+PyObject *pyfwnt_access_control_list_copy_to_byte_stream(
+           pyfwnt_access_control_list_t *pyfwnt_access_control_list,
+           PyObject *arguments );
+
+PyObject *pyfwnt_access_control_list_export_entries_from_sequence(
+           PyObject *sequence_object );
+
 #if defined( __cplusplus )
 }
 #endif
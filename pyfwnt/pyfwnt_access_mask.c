@@ -0,0 +1,151 @@
+/*
+ * Python bindings for the access mask functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <types.h>
+
+#include "pyfwnt_access_mask.h"
+#include "pyfwnt_error.h"
+#include "pyfwnt_libcerror.h"
+#include "pyfwnt_libfwnt.h"
+#include "pyfwnt_python.h"
+#include "pyfwnt_unused.h"
+
+/* Maps the generic rights of a column of access masks to object specific rights
+ * The access masks are 32-bit values in native byte order, stored in a writable buffer
+ * such as the "access_mask" column of access_control_list.export_entries()
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_access_mask_map_generic_rights(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+#if PY_MAJOR_VERSION >= 3
+	Py_buffer buffer;
+#endif
+	PyObject *access_masks_object        = NULL;
+	libcerror_error_t *error             = NULL;
+	static char *function                = "pyfwnt_access_mask_map_generic_rights";
+	static char *keyword_list[]          = { "access_masks", "generic_mapping", NULL };
+	void *data                           = NULL;
+	Py_ssize_t data_size                 = 0;
+	unsigned int generic_all_mapping     = 0;
+	unsigned int generic_execute_mapping = 0;
+	unsigned int generic_read_mapping    = 0;
+	unsigned int generic_write_mapping   = 0;
+	int result                           = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "O(IIII)",
+	     keyword_list,
+	     &access_masks_object,
+	     &generic_read_mapping,
+	     &generic_write_mapping,
+	     &generic_execute_mapping,
+	     &generic_all_mapping ) == 0 )
+	{
+		return( NULL );
+	}
+#if PY_MAJOR_VERSION >= 3
+	if( PyObject_GetBuffer(
+	     access_masks_object,
+	     &buffer,
+	     PyBUF_WRITABLE ) != 0 )
+	{
+		return( NULL );
+	}
+	data      = buffer.buf;
+	data_size = buffer.len;
+#else
+	if( PyObject_AsWriteBuffer(
+	     access_masks_object,
+	     &data,
+	     &data_size ) != 0 )
+	{
+		return( NULL );
+	}
+#endif
+	if( ( data_size % sizeof( uint32_t ) ) != 0 )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid access masks size value not a multiple of 4.",
+		 function );
+
+		goto on_error;
+	}
+	if( ( (intptr_t) data % sizeof( uint32_t ) ) != 0 )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid access masks buffer not aligned.",
+		 function );
+
+		goto on_error;
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_access_mask_map_generic_rights(
+	          (uint32_t *) data,
+	          (size_t) data_size / sizeof( uint32_t ),
+	          (uint32_t) generic_read_mapping,
+	          (uint32_t) generic_write_mapping,
+	          (uint32_t) generic_execute_mapping,
+	          (uint32_t) generic_all_mapping,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+#if PY_MAJOR_VERSION >= 3
+	PyBuffer_Release(
+	 &buffer );
+#endif
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to map generic rights.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	Py_IncRef(
+	 Py_None );
+
+	return( Py_None );
+
+on_error:
+#if PY_MAJOR_VERSION >= 3
+	PyBuffer_Release(
+	 &buffer );
+#endif
+	return( NULL );
+}
+
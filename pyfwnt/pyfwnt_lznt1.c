@@ -0,0 +1,242 @@
+/*
+ * Python bindings for the LZNT1 (de)compression functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+
+#include <common.h>
+#include <types.h>
+
+#include "pyfwnt_error.h"
+#include "pyfwnt_integer.h"
+#include "pyfwnt_libcerror.h"
+#include "pyfwnt_libfwnt.h"
+#include "pyfwnt_lznt1.h"
+#include "pyfwnt_python.h"
+#include "pyfwnt_unused.h"
+
+/* Decompresses data using LZNT1 compression
+ * If no uncompressed data size is provided it is determined from the chunk headers,
+ * so that the uncompressed data is allocated only once
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_lznt1_decompress(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PyObject *integer_object        = NULL;
+	PyObject *string_object         = NULL;
+	PyObject *uncompressed_object   = NULL;
+	libcerror_error_t *error        = NULL;
+	static char *function           = "pyfwnt_lznt1_decompress";
+	static char *keyword_list[]     = { "compressed_data", "uncompressed_data_size", NULL };
+	const char *compressed_data     = NULL;
+	char *uncompressed_data         = NULL;
+	Py_ssize_t compressed_data_size = 0;
+	size_t uncompressed_data_size   = 0;
+	uint64_t value_64bit            = 0;
+	int result                      = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "O|O",
+	     keyword_list,
+	     &string_object,
+	     &integer_object ) == 0 )
+	{
+		return( NULL );
+	}
+	PyErr_Clear();
+
+#if PY_MAJOR_VERSION >= 3
+	result = PyObject_IsInstance(
+		  string_object,
+		  (PyObject *) &PyBytes_Type );
+#else
+	result = PyObject_IsInstance(
+		  string_object,
+		  (PyObject *) &PyString_Type );
+#endif
+	if( result == -1 )
+	{
+		pyfwnt_error_fetch_and_raise(
+	         PyExc_RuntimeError,
+		 "%s: unable to determine if string object is of type string.",
+		 function );
+
+		return( NULL );
+	}
+	else if( result == 0 )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: unsupported string object type",
+		 function );
+
+		return( NULL );
+	}
+	PyErr_Clear();
+
+#if PY_MAJOR_VERSION >= 3
+	compressed_data = PyBytes_AsString(
+	                   string_object );
+
+	compressed_data_size = PyBytes_Size(
+	                        string_object );
+#else
+	compressed_data = PyString_AsString(
+	                   string_object );
+
+	compressed_data_size = PyString_Size(
+	                        string_object );
+#endif
+	if( ( integer_object == NULL )
+	 || ( integer_object == Py_None ) )
+	{
+		Py_BEGIN_ALLOW_THREADS
+
+		result = libfwnt_lznt1_get_uncompressed_data_size(
+		          (uint8_t *) compressed_data,
+		          (size_t) compressed_data_size,
+		          &uncompressed_data_size,
+		          &error );
+
+		Py_END_ALLOW_THREADS
+
+		if( result != 1 )
+		{
+			pyfwnt_error_raise(
+			 error,
+			 PyExc_IOError,
+			 "%s: unable to determine uncompressed data size.",
+			 function );
+
+			libcerror_error_free(
+			 &error );
+
+			return( NULL );
+		}
+	}
+	else
+	{
+		if( pyfwnt_integer_unsigned_copy_to_64bit(
+		     integer_object,
+		     &value_64bit,
+		     &error ) != 1 )
+		{
+			pyfwnt_error_raise(
+			 error,
+			 PyExc_ValueError,
+			 "%s: unable to convert integer object into uncompressed data size.",
+			 function );
+
+			libcerror_error_free(
+			 &error );
+
+			return( NULL );
+		}
+		if( value_64bit > (uint64_t) PY_SSIZE_T_MAX )
+		{
+			PyErr_Format(
+			 PyExc_ValueError,
+			 "%s: invalid uncompressed data size value exceeds maximum.",
+			 function );
+
+			return( NULL );
+		}
+		uncompressed_data_size = (size_t) value_64bit;
+	}
+	/* The decompressed data is written into the string object directly
+	 * and the string object is only shrunk if less data was decompressed
+	 */
+#if PY_MAJOR_VERSION >= 3
+	uncompressed_object = PyBytes_FromStringAndSize(
+	                       NULL,
+	                       (Py_ssize_t) uncompressed_data_size );
+#else
+	uncompressed_object = PyString_FromStringAndSize(
+	                       NULL,
+	                       (Py_ssize_t) uncompressed_data_size );
+#endif
+	if( uncompressed_object == NULL )
+	{
+		PyErr_Format(
+		 PyExc_MemoryError,
+		 "%s: unable to create uncompressed data.",
+		 function );
+
+		return( NULL );
+	}
+	if( uncompressed_data_size == 0 )
+	{
+		return( uncompressed_object );
+	}
+#if PY_MAJOR_VERSION >= 3
+	uncompressed_data = PyBytes_AsString(
+	                     uncompressed_object );
+#else
+	uncompressed_data = PyString_AsString(
+	                     uncompressed_object );
+#endif
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_lznt1_decompress(
+	          (uint8_t *) compressed_data,
+	          (size_t) compressed_data_size,
+	          (uint8_t *) uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to decompress data.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		Py_DecRef(
+		 uncompressed_object );
+
+		return( NULL );
+	}
+#if PY_MAJOR_VERSION >= 3
+	if( _PyBytes_Resize(
+	     &uncompressed_object,
+	     (Py_ssize_t) uncompressed_data_size ) != 0 )
+#else
+	if( _PyString_Resize(
+	     &uncompressed_object,
+	     (Py_ssize_t) uncompressed_data_size ) != 0 )
+#endif
+	{
+		return( NULL );
+	}
+	return( uncompressed_object );
+}
+
@@ -0,0 +1,394 @@
+/*
+ * Python bindings for the LZXPRESS (de)compression functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+
+#include <common.h>
+#include <types.h>
+
+#include "pyfwnt_error.h"
+#include "pyfwnt_libcerror.h"
+#include "pyfwnt_libfwnt.h"
+#include "pyfwnt_lzxpress.h"
+#include "pyfwnt_python.h"
+#include "pyfwnt_unused.h"
+
+/* Decompresses LZXPRESS or LZXPRESS Huffman compressed data
+ * Unlike LZNT1 neither format stores the uncompressed size, so it must be provided
+ * and the uncompressed data is allocated once with that size
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_lzxpress_decompress_data(
+           PyObject *arguments,
+           PyObject *keywords,
+           int use_huffman )
+{
+	PyObject *string_object           = NULL;
+	PyObject *uncompressed_object     = NULL;
+	libcerror_error_t *error          = NULL;
+	static char *function             = "pyfwnt_lzxpress_decompress_data";
+	static char *keyword_list[]       = { "compressed_data", "uncompressed_data_size", NULL };
+	const char *compressed_data       = NULL;
+	char *uncompressed_data           = NULL;
+	Py_ssize_t compressed_data_size   = 0;
+	Py_ssize_t uncompressed_data_size = 0;
+	size_t safe_uncompressed_size     = 0;
+	int result                        = 0;
+
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "On",
+	     keyword_list,
+	     &string_object,
+	     &uncompressed_data_size ) == 0 )
+	{
+		return( NULL );
+	}
+	if( uncompressed_data_size < 0 )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid uncompressed data size value less than zero.",
+		 function );
+
+		return( NULL );
+	}
+	PyErr_Clear();
+
+#if PY_MAJOR_VERSION >= 3
+	result = PyObject_IsInstance(
+		  string_object,
+		  (PyObject *) &PyBytes_Type );
+#else
+	result = PyObject_IsInstance(
+		  string_object,
+		  (PyObject *) &PyString_Type );
+#endif
+	if( result == -1 )
+	{
+		pyfwnt_error_fetch_and_raise(
+	         PyExc_RuntimeError,
+		 "%s: unable to determine if string object is of type string.",
+		 function );
+
+		return( NULL );
+	}
+	else if( result == 0 )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: unsupported string object type",
+		 function );
+
+		return( NULL );
+	}
+	PyErr_Clear();
+
+#if PY_MAJOR_VERSION >= 3
+	compressed_data = PyBytes_AsString(
+	                   string_object );
+
+	compressed_data_size = PyBytes_Size(
+	                        string_object );
+
+	uncompressed_object = PyBytes_FromStringAndSize(
+	                       NULL,
+	                       uncompressed_data_size );
+#else
+	compressed_data = PyString_AsString(
+	                   string_object );
+
+	compressed_data_size = PyString_Size(
+	                        string_object );
+
+	uncompressed_object = PyString_FromStringAndSize(
+	                       NULL,
+	                       uncompressed_data_size );
+#endif
+	if( uncompressed_object == NULL )
+	{
+		PyErr_Format(
+		 PyExc_MemoryError,
+		 "%s: unable to create uncompressed data.",
+		 function );
+
+		return( NULL );
+	}
+	if( uncompressed_data_size == 0 )
+	{
+		return( uncompressed_object );
+	}
+#if PY_MAJOR_VERSION >= 3
+	uncompressed_data = PyBytes_AsString(
+	                     uncompressed_object );
+#else
+	uncompressed_data = PyString_AsString(
+	                     uncompressed_object );
+#endif
+	safe_uncompressed_size = (size_t) uncompressed_data_size;
+
+	Py_BEGIN_ALLOW_THREADS
+
+	if( use_huffman == 0 )
+	{
+		result = libfwnt_lzxpress_decompress(
+		          (uint8_t *) compressed_data,
+		          (size_t) compressed_data_size,
+		          (uint8_t *) uncompressed_data,
+		          &safe_uncompressed_size,
+		          &error );
+	}
+	else
+	{
+		result = libfwnt_lzxpress_huffman_decompress(
+		          (uint8_t *) compressed_data,
+		          (size_t) compressed_data_size,
+		          (uint8_t *) uncompressed_data,
+		          &safe_uncompressed_size,
+		          &error );
+	}
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to decompress data.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		Py_DecRef(
+		 uncompressed_object );
+
+		return( NULL );
+	}
+#if PY_MAJOR_VERSION >= 3
+	if( _PyBytes_Resize(
+	     &uncompressed_object,
+	     (Py_ssize_t) safe_uncompressed_size ) != 0 )
+#else
+	if( _PyString_Resize(
+	     &uncompressed_object,
+	     (Py_ssize_t) safe_uncompressed_size ) != 0 )
+#endif
+	{
+		return( NULL );
+	}
+	return( uncompressed_object );
+}
+
+/* Decompresses data using LZXPRESS (LZ77 + DIRECT2) compression
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_lzxpress_decompress(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+
+	return( pyfwnt_lzxpress_decompress_data(
+	         arguments,
+	         keywords,
+	         0 ) );
+}
+
+/* Decompresses data using LZXPRESS Huffman compression
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_lzxpress_huffman_decompress(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+
+	return( pyfwnt_lzxpress_decompress_data(
+	         arguments,
+	         keywords,
+	         1 ) );
+}
+
+/* Compresses data using LZXPRESS Huffman compression
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_lzxpress_huffman_compress(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PyObject *compressed_object       = NULL;
+	PyObject *string_object           = NULL;
+	libcerror_error_t *error          = NULL;
+	static char *function             = "pyfwnt_lzxpress_huffman_compress";
+	static char *keyword_list[]       = { "uncompressed_data", "compression_level", "number_of_threads", NULL };
+	const char *uncompressed_data     = NULL;
+	char *compressed_data             = NULL;
+	Py_ssize_t uncompressed_data_size = 0;
+	size_t compressed_data_size       = 0;
+	int compression_level             = 6;
+	int number_of_threads             = 1;
+	int result                        = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "O|ii",
+	     keyword_list,
+	     &string_object,
+	     &compression_level,
+	     &number_of_threads ) == 0 )
+	{
+		return( NULL );
+	}
+	PyErr_Clear();
+
+#if PY_MAJOR_VERSION >= 3
+	result = PyObject_IsInstance(
+		  string_object,
+		  (PyObject *) &PyBytes_Type );
+#else
+	result = PyObject_IsInstance(
+		  string_object,
+		  (PyObject *) &PyString_Type );
+#endif
+	if( result == -1 )
+	{
+		pyfwnt_error_fetch_and_raise(
+	         PyExc_RuntimeError,
+		 "%s: unable to determine if string object is of type string.",
+		 function );
+
+		return( NULL );
+	}
+	else if( result == 0 )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: unsupported string object type",
+		 function );
+
+		return( NULL );
+	}
+	PyErr_Clear();
+
+#if PY_MAJOR_VERSION >= 3
+	uncompressed_data = PyBytes_AsString(
+	                     string_object );
+
+	uncompressed_data_size = PyBytes_Size(
+	                          string_object );
+#else
+	uncompressed_data = PyString_AsString(
+	                     string_object );
+
+	uncompressed_data_size = PyString_Size(
+	                          string_object );
+#endif
+	/* Every chunk of 65536 bytes is stored in at most 2 bytes per input byte
+	 * with a 256 bytes Huffman table and up to 8 bytes of bit stream padding
+	 */
+	if( (size_t) uncompressed_data_size > ( (size_t) ( PY_SSIZE_T_MAX - 264 ) / 3 ) )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid uncompressed data size value exceeds maximum.",
+		 function );
+
+		return( NULL );
+	}
+	compressed_data_size = ( 2 * (size_t) uncompressed_data_size )
+	                     + ( 264 * ( ( (size_t) uncompressed_data_size / 65536 ) + 1 ) );
+
+#if PY_MAJOR_VERSION >= 3
+	compressed_object = PyBytes_FromStringAndSize(
+	                     NULL,
+	                     (Py_ssize_t) compressed_data_size );
+#else
+	compressed_object = PyString_FromStringAndSize(
+	                     NULL,
+	                     (Py_ssize_t) compressed_data_size );
+#endif
+	if( compressed_object == NULL )
+	{
+		PyErr_Format(
+		 PyExc_MemoryError,
+		 "%s: unable to create compressed data.",
+		 function );
+
+		return( NULL );
+	}
+#if PY_MAJOR_VERSION >= 3
+	compressed_data = PyBytes_AsString(
+	                   compressed_object );
+#else
+	compressed_data = PyString_AsString(
+	                   compressed_object );
+#endif
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_lzxpress_huffman_compress(
+	          (uint8_t *) uncompressed_data,
+	          (size_t) uncompressed_data_size,
+	          (uint8_t *) compressed_data,
+	          &compressed_data_size,
+	          compression_level,
+	          number_of_threads,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to compress data.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		Py_DecRef(
+		 compressed_object );
+
+		return( NULL );
+	}
+#if PY_MAJOR_VERSION >= 3
+	if( _PyBytes_Resize(
+	     &compressed_object,
+	     (Py_ssize_t) compressed_data_size ) != 0 )
+#else
+	if( _PyString_Resize(
+	     &compressed_object,
+	     (Py_ssize_t) compressed_data_size ) != 0 )
+#endif
+	{
+		return( NULL );
+	}
+	return( compressed_object );
+}
+
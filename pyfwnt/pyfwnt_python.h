@@ -72,5 +72,24 @@
 
 #endif /* !defined( Py_TYPE ) */
 
+/* Per-object critical sections, which only lock in free-threaded (no-GIL) builds
+ * and otherwise rely on the GIL being held
+ */
+#if defined( Py_BEGIN_CRITICAL_SECTION )
+#define PYFWNT_BEGIN_CRITICAL_SECTION( object ) \
+	Py_BEGIN_CRITICAL_SECTION( object )
+
+#define PYFWNT_END_CRITICAL_SECTION \
+	Py_END_CRITICAL_SECTION
+
+#else
+#define PYFWNT_BEGIN_CRITICAL_SECTION( object ) \
+	{
+
+#define PYFWNT_END_CRITICAL_SECTION \
+	}
+
+#endif /* defined( Py_BEGIN_CRITICAL_SECTION ) */
+
 #endif /* !defined( _PYFWNT_PYTHON_H ) */
 
@@ -0,0 +1,230 @@
+/*
+ * Python bindings for the scan functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+
+#include <common.h>
+#include <types.h>
+
+#include "pyfwnt_error.h"
+#include "pyfwnt_libcerror.h"
+#include "pyfwnt_libfwnt.h"
+#include "pyfwnt_python.h"
+#include "pyfwnt_scan.h"
+#include "pyfwnt_unused.h"
+
+/* Finds the first security descriptor or security identifier in an object that supports
+ * the buffer interface, such as a byte string or a memory mapped file
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_scan_find(
+           PyObject *arguments,
+           PyObject *keywords,
+           int find_security_identifier )
+{
+#if PY_MAJOR_VERSION >= 3
+	Py_buffer buffer;
+#endif
+	PyObject *data_object       = NULL;
+	PyObject *end_offset_object = NULL;
+	libcerror_error_t *error    = NULL;
+	static char *function       = "pyfwnt_scan_find";
+	static char *keyword_list[] = { "data", "start_offset", "end_offset", "alignment", NULL };
+	const void *data            = NULL;
+	Py_ssize_t alignment        = 1;
+	Py_ssize_t data_size        = 0;
+	Py_ssize_t end_offset       = 0;
+	Py_ssize_t start_offset     = 0;
+	size_t match_offset         = 0;
+	size_t match_size           = 0;
+	int result                  = 0;
+
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "O|nOn",
+	     keyword_list,
+	     &data_object,
+	     &start_offset,
+	     &end_offset_object,
+	     &alignment ) == 0 )
+	{
+		return( NULL );
+	}
+#if PY_MAJOR_VERSION >= 3
+	if( PyObject_GetBuffer(
+	     data_object,
+	     &buffer,
+	     PyBUF_SIMPLE ) != 0 )
+	{
+		return( NULL );
+	}
+	data      = buffer.buf;
+	data_size = buffer.len;
+#else
+	if( PyObject_AsReadBuffer(
+	     data_object,
+	     &data,
+	     &data_size ) != 0 )
+	{
+		return( NULL );
+	}
+#endif
+	end_offset = data_size;
+
+	if( ( end_offset_object != NULL )
+	 && ( end_offset_object != Py_None ) )
+	{
+		end_offset = PyNumber_AsSsize_t(
+		              end_offset_object,
+		              PyExc_OverflowError );
+
+		if( ( end_offset == -1 )
+		 && ( PyErr_Occurred() != NULL ) )
+		{
+			goto on_error;
+		}
+	}
+	if( ( start_offset < 0 )
+	 || ( start_offset > data_size ) )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid start offset value out of bounds.",
+		 function );
+
+		goto on_error;
+	}
+	if( ( end_offset < start_offset )
+	 || ( end_offset > data_size ) )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid end offset value out of bounds.",
+		 function );
+
+		goto on_error;
+	}
+	if( alignment <= 0 )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid alignment value zero or less.",
+		 function );
+
+		goto on_error;
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	if( find_security_identifier != 0 )
+	{
+		result = libfwnt_scan_find_security_identifier(
+		          (uint8_t *) data,
+		          (size_t) data_size,
+		          (size_t) start_offset,
+		          (size_t) end_offset,
+		          (size_t) alignment,
+		          &match_offset,
+		          &match_size,
+		          &error );
+	}
+	else
+	{
+		result = libfwnt_scan_find_security_descriptor(
+		          (uint8_t *) data,
+		          (size_t) data_size,
+		          (size_t) start_offset,
+		          (size_t) end_offset,
+		          (size_t) alignment,
+		          &match_offset,
+		          &match_size,
+		          &error );
+	}
+	Py_END_ALLOW_THREADS
+
+#if PY_MAJOR_VERSION >= 3
+	PyBuffer_Release(
+	 &buffer );
+#endif
+	if( result == -1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to scan data.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	else if( result == 0 )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
+	return( Py_BuildValue(
+	         "(nn)",
+	         (Py_ssize_t) match_offset,
+	         (Py_ssize_t) match_size ) );
+
+on_error:
+#if PY_MAJOR_VERSION >= 3
+	PyBuffer_Release(
+	 &buffer );
+#endif
+	return( NULL );
+}
+
+/* Finds the first self-relative security descriptor in data
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_scan_find_security_descriptor(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+
+	return( pyfwnt_scan_find(
+	         arguments,
+	         keywords,
+	         0 ) );
+}
+
+/* Finds the first security identifier (SID) in data
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_scan_find_security_identifier(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+
+	return( pyfwnt_scan_find(
+	         arguments,
+	         keywords,
+	         1 ) );
+}
+
@@ -0,0 +1,55 @@
+/*
+ * Python bindings for the scan functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+
+#if !defined( _PYFWNT_SCAN_H )
+#define _PYFWNT_SCAN_H
+
+#include <common.h>
+#include <types.h>
+
+#include "pyfwnt_python.h"
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+PyObject *pyfwnt_scan_find(
+           PyObject *arguments,
+           PyObject *keywords,
+           int find_security_identifier );
+
+PyObject *pyfwnt_scan_find_security_descriptor(
+           PyObject *self,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_scan_find_security_identifier(
+           PyObject *self,
+           PyObject *arguments,
+           PyObject *keywords );
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _PYFWNT_SCAN_H ) */
+
@@ -35,6 +35,10 @@
 #include "pyfwnt_security_identifier.h"
 #include "pyfwnt_unused.h"
 
+/* The name of the value object, which owns the libfwnt security descriptor
+ */
+#define PYFWNT_SECURITY_DESCRIPTOR_VALUE_NAME		"pyfwnt.security_descriptor.value"
+
 PyMethodDef pyfwnt_security_descriptor_object_methods[] = {
 
 	{ "copy_from_byte_stream",
@@ -44,6 +48,30 @@ PyMethodDef pyfwnt_security_descriptor_object_methods[] = {
 	  "\n"
 	  "Copies the the security descriptor from the byte stream." },
 
+	{ "copy_to_byte_stream",
+	  (PyCFunction) pyfwnt_security_descriptor_copy_to_byte_stream,
+	  METH_NOARGS,
+	  "copy_to_byte_stream() -> Bytes\n"
+	  "\n"
+	  "Copies the security descriptor to a self-relative byte stream." },
+
+	/* Functions to access the control flags */
+
+	{ "get_control_flags",
+	  (PyCFunction) pyfwnt_security_descriptor_get_control_flags,
+	  METH_NOARGS,
+	  "get_control_flags() -> Integer or None\n"
+	  "\n"
+	  "Retrieves the control flags." },
+
+	{ "set_control_flags",
+	  (PyCFunction) pyfwnt_security_descriptor_set_control_flags,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "set_control_flags(control_flags)\n"
+	  "\n"
+	  "Sets the control flags. The ACL present and self-relative flags are\n"
+	  "determined when the security descriptor is copied to a byte stream." },
+
 	/* Functions to access the security identifier */
 
 	{ "get_owner",
@@ -60,6 +88,20 @@ PyMethodDef pyfwnt_security_descriptor_object_methods[] = {
 	  "\n"
 	  "Retrieves the group security identifier (SID)." },
 
+	{ "set_owner",
+	  (PyCFunction) pyfwnt_security_descriptor_set_owner,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "set_owner(security_identifier)\n"
+	  "\n"
+	  "Sets the owner security identifier (SID) or removes it if None." },
+
+	{ "set_group",
+	  (PyCFunction) pyfwnt_security_descriptor_set_group,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "set_group(security_identifier)\n"
+	  "\n"
+	  "Sets the group security identifier (SID) or removes it if None." },
+
 	{ "get_discretionary_acl",
 	  (PyCFunction) pyfwnt_security_descriptor_get_discretionary_acl,
 	  METH_NOARGS,
@@ -74,12 +116,64 @@ PyMethodDef pyfwnt_security_descriptor_object_methods[] = {
 	  "\n"
 	  "Retrieves the system access control list (ACL)." },
 
+	{ "set_discretionary_acl",
+	  (PyCFunction) pyfwnt_security_descriptor_set_discretionary_acl,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "set_discretionary_acl(access_control_list)\n"
+	  "\n"
+	  "Sets the discretionary access control list (ACL) or removes it if None." },
+
+	{ "set_system_acl",
+	  (PyCFunction) pyfwnt_security_descriptor_set_system_acl,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "set_system_acl(access_control_list)\n"
+	  "\n"
+	  "Sets the system access control list (ACL) or removes it if None." },
+
+	{ "insert_discretionary_access_control_entry",
+	  (PyCFunction) pyfwnt_security_descriptor_insert_discretionary_access_control_entry,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "insert_discretionary_access_control_entry(entry_index, byte_stream)\n"
+	  "\n"
+	  "Inserts an access control entry (ACE) stored in a byte stream into the\n"
+	  "discretionary access control list (ACL)." },
+
+	{ "insert_system_access_control_entry",
+	  (PyCFunction) pyfwnt_security_descriptor_insert_system_access_control_entry,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "insert_system_access_control_entry(entry_index, byte_stream)\n"
+	  "\n"
+	  "Inserts an access control entry (ACE) stored in a byte stream into the\n"
+	  "system access control list (ACL)." },
+
+	{ "remove_discretionary_access_control_entry",
+	  (PyCFunction) pyfwnt_security_descriptor_remove_discretionary_access_control_entry,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "remove_discretionary_access_control_entry(entry_index)\n"
+	  "\n"
+	  "Removes a specific access control entry (ACE) from the discretionary\n"
+	  "access control list (ACL)." },
+
+	{ "remove_system_access_control_entry",
+	  (PyCFunction) pyfwnt_security_descriptor_remove_system_access_control_entry,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "remove_system_access_control_entry(entry_index)\n"
+	  "\n"
+	  "Removes a specific access control entry (ACE) from the system access\n"
+	  "control list (ACL)." },
+
 	/* Sentinel */
 	{ NULL, NULL, 0, NULL }
 };
 
 PyGetSetDef pyfwnt_security_descriptor_object_get_set_definitions[] = {
 
+	{ "control_flags",
+	  (getter) pyfwnt_security_descriptor_get_control_flags,
+	  (setter) 0,
+	  "The control flags.",
+	  NULL },
+
 	{ "owner",
 	  (getter) pyfwnt_security_descriptor_get_owner,
 	  (setter) 0,
@@ -263,8 +357,7 @@ on_error:
 int pyfwnt_security_descriptor_init(
      pyfwnt_security_descriptor_t *pyfwnt_security_descriptor )
 {
-	libcerror_error_t *error = NULL;
-	static char *function    = "pyfwnt_security_descriptor_init";
+	static char *function = "pyfwnt_security_descriptor_init";
 
 	if( pyfwnt_security_descriptor == NULL )
 	{
@@ -278,22 +371,8 @@ int pyfwnt_security_descriptor_init(
 	/* Make sure libfwnt security descriptor is set to NULL
 	 */
 	pyfwnt_security_descriptor->security_descriptor = NULL;
+	pyfwnt_security_descriptor->value_object        = NULL;
 
-	if( libfwnt_security_descriptor_initialize(
-	     &( pyfwnt_security_descriptor->security_descriptor ),
-	     &error ) != 1 )
-	{
-		pyfwnt_error_raise(
-		 error,
-		 PyExc_MemoryError,
-		 "%s: unable to initialize security descriptor.",
-		 function );
-
-		libcerror_error_free(
-		 &error );
-
-		return( -1 );
-	}
 	return( 0 );
 }
 
@@ -302,10 +381,8 @@ int pyfwnt_security_descriptor_init(
 void pyfwnt_security_descriptor_free(
       pyfwnt_security_descriptor_t *pyfwnt_security_descriptor )
 {
-	libcerror_error_t *error    = NULL;
 	struct _typeobject *ob_type = NULL;
 	static char *function       = "pyfwnt_security_descriptor_free";
-	int result                  = 0;
 
 	if( pyfwnt_security_descriptor == NULL )
 	{
@@ -316,15 +393,6 @@ void pyfwnt_security_descriptor_free(
 
 		return;
 	}
-	if( pyfwnt_security_descriptor->security_descriptor == NULL )
-	{
-		PyErr_Format(
-		 PyExc_TypeError,
-		 "%s: invalid security descriptor - missing libfwnt security descriptor.",
-		 function );
-
-		return;
-	}
 	ob_type = Py_TYPE(
 	           pyfwnt_security_descriptor );
 
@@ -346,24 +414,13 @@ void pyfwnt_security_descriptor_free(
 
 		return;
 	}
-	Py_BEGIN_ALLOW_THREADS
-
-	result = libfwnt_security_descriptor_free(
-	          &( pyfwnt_security_descriptor->security_descriptor ),
-	          &error );
-
-	Py_END_ALLOW_THREADS
-
-	if( result != 1 )
+	/* The libfwnt security descriptor is freed by the value object when it is
+	 * no longer referenced by the objects retrieved from it
+	 */
+	if( pyfwnt_security_descriptor->value_object != NULL )
 	{
-		pyfwnt_error_raise(
-		 error,
-		 PyExc_MemoryError,
-		 "%s: unable to free security descriptor.",
-		 function );
-
-		libcerror_error_free(
-		 &error );
+		Py_DecRef(
+		 pyfwnt_security_descriptor->value_object );
 	}
 	ob_type->tp_free(
 	 (PyObject*) pyfwnt_security_descriptor );
@@ -377,13 +434,14 @@ PyObject *pyfwnt_security_descriptor_copy_from_byte_stream(
            PyObject *arguments,
            PyObject *keywords )
 {
-	PyObject *string_object     = NULL;
-	libcerror_error_t *error    = NULL;
-	static char *function       = "pyfwnt_security_descriptor_copy_from_byte_stream";
-	static char *keyword_list[] = { "byte_stream", NULL };
-	const char *byte_stream     = NULL;
-	Py_ssize_t byte_stream_size = 0;
-	int result                  = 0;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	PyObject *string_object                            = NULL;
+	libcerror_error_t *error                           = NULL;
+	static char *function                              = "pyfwnt_security_descriptor_copy_from_byte_stream";
+	static char *keyword_list[]                        = { "byte_stream", NULL };
+	const char *byte_stream                            = NULL;
+	Py_ssize_t byte_stream_size                        = 0;
+	int result                                         = 0;
 
 	if( pyfwnt_security_descriptor == NULL )
 	{
@@ -449,15 +507,25 @@ PyObject *pyfwnt_security_descriptor_copy_from_byte_stream(
 #endif
 /* TODO size bounds check */
 
+	/* The security descriptor is parsed into a new libfwnt security descriptor that
+	 * is only set on the object once complete, hence its access control lists and
+	 * security identifiers can be shared between threads without locking
+	 */
 	Py_BEGIN_ALLOW_THREADS
 
-	result = libfwnt_security_descriptor_copy_from_byte_stream(
-	          pyfwnt_security_descriptor->security_descriptor,
-	          (uint8_t *) byte_stream,
-	          (size_t) byte_stream_size,
-	          LIBFWNT_ENDIAN_LITTLE,
+	result = libfwnt_security_descriptor_initialize(
+	          &security_descriptor,
 	          &error );
 
+	if( result == 1 )
+	{
+		result = libfwnt_security_descriptor_copy_from_byte_stream(
+		          security_descriptor,
+		          (uint8_t *) byte_stream,
+		          (size_t) byte_stream_size,
+		          LIBFWNT_ENDIAN_LITTLE,
+		          &error );
+	}
 	Py_END_ALLOW_THREADS
 
 	if( result != 1 )
@@ -471,12 +539,264 @@ PyObject *pyfwnt_security_descriptor_copy_from_byte_stream(
 		libcerror_error_free(
 		 &error );
 
-		return( NULL );
+		goto on_error;
+	}
+	result = 0;
+
+	PYFWNT_BEGIN_CRITICAL_SECTION( (PyObject *) pyfwnt_security_descriptor )
+
+	if( pyfwnt_security_descriptor->value_object == NULL )
+	{
+		result = pyfwnt_security_descriptor_set_value(
+		          pyfwnt_security_descriptor,
+		          security_descriptor );
+	}
+	PYFWNT_END_CRITICAL_SECTION
+
+	if( result == 0 )
+	{
+		PyErr_Format(
+		 PyExc_IOError,
+		 "%s: invalid security descriptor value already set.",
+		 function );
+
+		goto on_error;
+	}
+	else if( result != 1 )
+	{
+		goto on_error;
 	}
+	security_descriptor = NULL;
+
 	Py_IncRef(
 	 Py_None );
 
 	return( Py_None );
+
+on_error:
+	if( security_descriptor != NULL )
+	{
+		libfwnt_security_descriptor_free(
+		 &security_descriptor,
+		 NULL );
+	}
+	return( NULL );
+}
+
+/* Frees the libfwnt security descriptor of a value object
+ */
+void pyfwnt_security_descriptor_value_free(
+      PyObject *value_object )
+{
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+
+	security_descriptor = (libfwnt_security_descriptor_t *) PyCapsule_GetPointer(
+	                                                         value_object,
+	                                                         PYFWNT_SECURITY_DESCRIPTOR_VALUE_NAME );
+
+	if( security_descriptor != NULL )
+	{
+		libfwnt_security_descriptor_free(
+		 &security_descriptor,
+		 NULL );
+	}
+}
+
+/* Sets the libfwnt security descriptor
+ * The libfwnt security descriptor is owned by a value object that is referenced by
+ * the objects retrieved from it, which keeps their values available after the
+ * security descriptor object is modified or freed
+ * The critical section of the security descriptor object must be held
+ * Returns 1 if successful or -1 on error
+ */
+int pyfwnt_security_descriptor_set_value(
+     pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+     libfwnt_security_descriptor_t *security_descriptor )
+{
+	PyObject *value_object = NULL;
+	static char *function  = "pyfwnt_security_descriptor_set_value";
+
+	if( pyfwnt_security_descriptor == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( -1 );
+	}
+	value_object = PyCapsule_New(
+	                security_descriptor,
+	                PYFWNT_SECURITY_DESCRIPTOR_VALUE_NAME,
+	                pyfwnt_security_descriptor_value_free );
+
+	if( value_object == NULL )
+	{
+		PyErr_Format(
+		 PyExc_MemoryError,
+		 "%s: unable to create value object.",
+		 function );
+
+		return( -1 );
+	}
+	if( pyfwnt_security_descriptor->value_object != NULL )
+	{
+		Py_DecRef(
+		 pyfwnt_security_descriptor->value_object );
+	}
+	pyfwnt_security_descriptor->security_descriptor = security_descriptor;
+	pyfwnt_security_descriptor->value_object        = value_object;
+
+	return( 1 );
+}
+
+/* Retrieves the libfwnt security descriptor
+ * A new reference to the value object that owns the libfwnt security descriptor is
+ * returned in value_object, which must be released once the libfwnt security
+ * descriptor is no longer used
+ * Returns the libfwnt security descriptor or NULL if not set
+ */
+libfwnt_security_descriptor_t *pyfwnt_security_descriptor_get_value(
+                                pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+                                PyObject **value_object )
+{
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+
+	if( ( pyfwnt_security_descriptor == NULL )
+	 || ( value_object == NULL ) )
+	{
+		return( NULL );
+	}
+	PYFWNT_BEGIN_CRITICAL_SECTION( (PyObject *) pyfwnt_security_descriptor )
+
+	security_descriptor = pyfwnt_security_descriptor->security_descriptor;
+	*value_object       = pyfwnt_security_descriptor->value_object;
+
+	if( *value_object != NULL )
+	{
+		Py_IncRef(
+		 *value_object );
+	}
+	PYFWNT_END_CRITICAL_SECTION
+
+	return( security_descriptor );
+}
+
+/* Retrieves the libfwnt security descriptor to modify
+ * The libfwnt security descriptor is copied first when its value object is also
+ * referenced elsewhere, such as by a retrieved access control list or by a thread
+ * that is reading it, so that these keep seeing the unmodified values
+ * The critical section of the security descriptor object must be held
+ * Returns the libfwnt security descriptor or NULL on error
+ */
+libfwnt_security_descriptor_t *pyfwnt_security_descriptor_get_writable_value(
+                                pyfwnt_security_descriptor_t *pyfwnt_security_descriptor )
+{
+	libcerror_error_t *error                           = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	uint8_t *byte_stream                               = NULL;
+	static char *function                              = "pyfwnt_security_descriptor_get_writable_value";
+	size_t byte_stream_size                            = 0;
+	int result                                         = 0;
+
+	if( pyfwnt_security_descriptor == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( NULL );
+	}
+	if( ( pyfwnt_security_descriptor->value_object != NULL )
+	 && ( Py_REFCNT( pyfwnt_security_descriptor->value_object ) == 1 ) )
+	{
+		return( pyfwnt_security_descriptor->security_descriptor );
+	}
+	result = libfwnt_security_descriptor_initialize(
+	          &security_descriptor,
+	          &error );
+
+	if( ( result == 1 )
+	 && ( pyfwnt_security_descriptor->security_descriptor != NULL ) )
+	{
+		result = libfwnt_security_descriptor_get_byte_stream_size(
+		          pyfwnt_security_descriptor->security_descriptor,
+		          &byte_stream_size,
+		          &error );
+
+		if( result == 1 )
+		{
+			byte_stream = (uint8_t *) PyMem_Malloc(
+			                           sizeof( uint8_t ) * byte_stream_size );
+
+			if( byte_stream == NULL )
+			{
+				PyErr_Format(
+				 PyExc_MemoryError,
+				 "%s: unable to create byte stream.",
+				 function );
+
+				goto on_error;
+			}
+			result = libfwnt_security_descriptor_copy_to_byte_stream(
+			          pyfwnt_security_descriptor->security_descriptor,
+			          byte_stream,
+			          byte_stream_size,
+			          LIBFWNT_ENDIAN_LITTLE,
+			          &error );
+		}
+		if( result == 1 )
+		{
+			result = libfwnt_security_descriptor_copy_from_byte_stream(
+			          security_descriptor,
+			          byte_stream,
+			          byte_stream_size,
+			          LIBFWNT_ENDIAN_LITTLE,
+			          &error );
+		}
+	}
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to copy security descriptor.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		goto on_error;
+	}
+	if( byte_stream != NULL )
+	{
+		PyMem_Free(
+		 byte_stream );
+
+		byte_stream = NULL;
+	}
+	if( pyfwnt_security_descriptor_set_value(
+	     pyfwnt_security_descriptor,
+	     security_descriptor ) != 1 )
+	{
+		goto on_error;
+	}
+	return( security_descriptor );
+
+on_error:
+	if( byte_stream != NULL )
+	{
+		PyMem_Free(
+		 byte_stream );
+	}
+	if( security_descriptor != NULL )
+	{
+		libfwnt_security_descriptor_free(
+		 &security_descriptor,
+		 NULL );
+	}
+	return( NULL );
 }
 
 /* Retrieves the owner security identifier (SID)
@@ -488,7 +808,10 @@ PyObject *pyfwnt_security_descriptor_get_owner(
 {
 	libfwnt_security_identifier_t *security_identifier = NULL;
 	libcerror_error_t *error                           = NULL;
+	PyObject *object                                   = NULL;
+	PyObject *value_object                             = NULL;
 	static char *function                              = "pyfwnt_security_descriptor_get_owner";
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
 	int result                                         = 0;
 
 	PYFWNT_UNREFERENCED_PARAMETER( arguments )
@@ -502,10 +825,21 @@ PyObject *pyfwnt_security_descriptor_get_owner(
 
 		return( NULL );
 	}
+	security_descriptor = pyfwnt_security_descriptor_get_value(
+	                       pyfwnt_security_descriptor,
+	                       &value_object );
+
+	if( security_descriptor == NULL )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
 	Py_BEGIN_ALLOW_THREADS
 
 	result = libfwnt_security_descriptor_get_owner(
-	          pyfwnt_security_descriptor->security_descriptor,
+	          security_descriptor,
 	          &security_identifier,
 	          &error );
 
@@ -526,14 +860,25 @@ PyObject *pyfwnt_security_descriptor_get_owner(
 	}
 	else if( result == 0 )
 	{
+		Py_DecRef(
+		 value_object );
+
 		Py_IncRef(
 		 Py_None );
 
 		return( Py_None );
 	}
-	return( pyfwnt_security_identifier_new(
-	         security_identifier,
-	         (PyObject *) pyfwnt_security_descriptor ) );
+	/* The retrieved object references the value object and not the security descriptor
+	 * object, hence it keeps its value when the security descriptor is modified
+	 */
+	object = pyfwnt_security_identifier_new(
+	          security_identifier,
+	          value_object );
+
+	Py_DecRef(
+	 value_object );
+
+	return( object );
 
 on_error:
 	if( security_identifier != NULL )
@@ -542,6 +887,11 @@ on_error:
 		 &security_identifier,
 		 NULL );
 	}
+	if( value_object != NULL )
+	{
+		Py_DecRef(
+		 value_object );
+	}
 	return( NULL );
 }
 
@@ -554,7 +904,10 @@ PyObject *pyfwnt_security_descriptor_get_group(
 {
 	libfwnt_security_identifier_t *security_identifier = NULL;
 	libcerror_error_t *error                           = NULL;
+	PyObject *object                                   = NULL;
+	PyObject *value_object                             = NULL;
 	static char *function                              = "pyfwnt_security_descriptor_get_group";
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
 	int result                                         = 0;
 
 	PYFWNT_UNREFERENCED_PARAMETER( arguments )
@@ -568,10 +921,21 @@ PyObject *pyfwnt_security_descriptor_get_group(
 
 		return( NULL );
 	}
+	security_descriptor = pyfwnt_security_descriptor_get_value(
+	                       pyfwnt_security_descriptor,
+	                       &value_object );
+
+	if( security_descriptor == NULL )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
 	Py_BEGIN_ALLOW_THREADS
 
 	result = libfwnt_security_descriptor_get_group(
-	          pyfwnt_security_descriptor->security_descriptor,
+	          security_descriptor,
 	          &security_identifier,
 	          &error );
 
@@ -592,14 +956,22 @@ PyObject *pyfwnt_security_descriptor_get_group(
 	}
 	else if( result == 0 )
 	{
+		Py_DecRef(
+		 value_object );
+
 		Py_IncRef(
 		 Py_None );
 
 		return( Py_None );
 	}
-	return( pyfwnt_security_identifier_new(
-	         security_identifier,
-	         (PyObject *) pyfwnt_security_descriptor ) );
+	object = pyfwnt_security_identifier_new(
+	          security_identifier,
+	          value_object );
+
+	Py_DecRef(
+	 value_object );
+
+	return( object );
 
 on_error:
 	if( security_identifier != NULL )
@@ -608,6 +980,11 @@ on_error:
 		 &security_identifier,
 		 NULL );
 	}
+	if( value_object != NULL )
+	{
+		Py_DecRef(
+		 value_object );
+	}
 	return( NULL );
 }
 
@@ -620,7 +997,10 @@ PyObject *pyfwnt_security_descriptor_get_discretionary_acl(
 {
 	libfwnt_access_control_list_t *access_control_list = NULL;
 	libcerror_error_t *error                           = NULL;
+	PyObject *object                                   = NULL;
+	PyObject *value_object                             = NULL;
 	static char *function                              = "pyfwnt_security_descriptor_get_discretionary_acl";
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
 	int result                                         = 0;
 
 	PYFWNT_UNREFERENCED_PARAMETER( arguments )
@@ -634,10 +1014,21 @@ PyObject *pyfwnt_security_descriptor_get_discretionary_acl(
 
 		return( NULL );
 	}
+	security_descriptor = pyfwnt_security_descriptor_get_value(
+	                       pyfwnt_security_descriptor,
+	                       &value_object );
+
+	if( security_descriptor == NULL )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
 	Py_BEGIN_ALLOW_THREADS
 
 	result = libfwnt_security_descriptor_get_discretionary_acl(
-	          pyfwnt_security_descriptor->security_descriptor,
+	          security_descriptor,
 	          &access_control_list,
 	          &error );
 
@@ -658,14 +1049,22 @@ PyObject *pyfwnt_security_descriptor_get_discretionary_acl(
 	}
 	else if( result == 0 )
 	{
+		Py_DecRef(
+		 value_object );
+
 		Py_IncRef(
 		 Py_None );
 
 		return( Py_None );
 	}
-	return( pyfwnt_access_control_list_new(
-	         access_control_list,
-	         (PyObject *) pyfwnt_security_descriptor ) );
+	object = pyfwnt_access_control_list_new(
+	          access_control_list,
+	          value_object );
+
+	Py_DecRef(
+	 value_object );
+
+	return( object );
 
 on_error:
 	if( access_control_list != NULL )
@@ -674,6 +1073,11 @@ on_error:
 		 &access_control_list,
 		 NULL );
 	}
+	if( value_object != NULL )
+	{
+		Py_DecRef(
+		 value_object );
+	}
 	return( NULL );
 }
 
@@ -686,7 +1090,10 @@ PyObject *pyfwnt_security_descriptor_get_system_acl(
 {
 	libfwnt_access_control_list_t *access_control_list = NULL;
 	libcerror_error_t *error                           = NULL;
+	PyObject *object                                   = NULL;
+	PyObject *value_object                             = NULL;
 	static char *function                              = "pyfwnt_security_descriptor_get_system_acl";
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
 	int result                                         = 0;
 
 	PYFWNT_UNREFERENCED_PARAMETER( arguments )
@@ -700,14 +1107,25 @@ PyObject *pyfwnt_security_descriptor_get_system_acl(
 
 		return( NULL );
 	}
-	Py_BEGIN_ALLOW_THREADS
-
-	result = libfwnt_security_descriptor_get_system_acl(
-	          pyfwnt_security_descriptor->security_descriptor,
-	          &access_control_list,
-	          &error );
-
-	Py_END_ALLOW_THREADS
+	security_descriptor = pyfwnt_security_descriptor_get_value(
+	                       pyfwnt_security_descriptor,
+	                       &value_object );
+
+	if( security_descriptor == NULL )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_security_descriptor_get_system_acl(
+	          security_descriptor,
+	          &access_control_list,
+	          &error );
+
+	Py_END_ALLOW_THREADS
 
 	if( result == -1 )
 	{
@@ -724,14 +1142,22 @@ PyObject *pyfwnt_security_descriptor_get_system_acl(
 	}
 	else if( result == 0 )
 	{
+		Py_DecRef(
+		 value_object );
+
 		Py_IncRef(
 		 Py_None );
 
 		return( Py_None );
 	}
-	return( pyfwnt_access_control_list_new(
-	         access_control_list,
-	         (PyObject *) pyfwnt_security_descriptor ) );
+	object = pyfwnt_access_control_list_new(
+	          access_control_list,
+	          value_object );
+
+	Py_DecRef(
+	 value_object );
+
+	return( object );
 
 on_error:
 	if( access_control_list != NULL )
@@ -740,6 +1166,1201 @@ on_error:
 		 &access_control_list,
 		 NULL );
 	}
+	if( value_object != NULL )
+	{
+		Py_DecRef(
+		 value_object );
+	}
+	return( NULL );
+}
+
+/* Retrieves the control flags
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_security_descriptor_get_control_flags(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments PYFWNT_ATTRIBUTE_UNUSED )
+{
+	libcerror_error_t *error                           = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	PyObject *integer_object                           = NULL;
+	PyObject *value_object                             = NULL;
+	static char *function                              = "pyfwnt_security_descriptor_get_control_flags";
+	uint16_t control_flags                             = 0;
+	int result                                         = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyfwnt_security_descriptor == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( NULL );
+	}
+	security_descriptor = pyfwnt_security_descriptor_get_value(
+	                       pyfwnt_security_descriptor,
+	                       &value_object );
+
+	if( security_descriptor == NULL )
+	{
+		Py_IncRef(
+		 Py_None );
+
+		return( Py_None );
+	}
+	result = libfwnt_security_descriptor_get_control_flags(
+	          security_descriptor,
+	          &control_flags,
+	          &error );
+
+	Py_DecRef(
+	 value_object );
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve control flags.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+#if PY_MAJOR_VERSION >= 3
+	integer_object = PyLong_FromLong(
+	                  (long) control_flags );
+#else
+	integer_object = PyInt_FromLong(
+	                  (long) control_flags );
+#endif
+	return( integer_object );
+}
+
+/* Sets the control flags
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_security_descriptor_set_control_flags(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	libcerror_error_t *error                           = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	static char *function                              = "pyfwnt_security_descriptor_set_control_flags";
+	static char *keyword_list[]                        = { "control_flags", NULL };
+	int control_flags                                  = 0;
+	int result                                         = 0;
+
+	if( pyfwnt_security_descriptor == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( NULL );
+	}
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "i",
+	     keyword_list,
+	     &control_flags ) == 0 )
+	{
+		return( NULL );
+	}
+	if( ( control_flags < 0 )
+	 || ( control_flags > (int) UINT16_MAX ) )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid control flags value out of bounds.",
+		 function );
+
+		return( NULL );
+	}
+	PYFWNT_BEGIN_CRITICAL_SECTION( (PyObject *) pyfwnt_security_descriptor )
+
+	security_descriptor = pyfwnt_security_descriptor_get_writable_value(
+	                       pyfwnt_security_descriptor );
+
+	if( security_descriptor != NULL )
+	{
+		result = libfwnt_security_descriptor_set_control_flags(
+		          security_descriptor,
+		          (uint16_t) control_flags,
+		          &error );
+	}
+	PYFWNT_END_CRITICAL_SECTION
+
+	if( security_descriptor == NULL )
+	{
+		return( NULL );
+	}
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to set control flags.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	Py_IncRef(
+	 Py_None );
+
+	return( Py_None );
+}
+
+/* Sets the owner security identifier (SID)
+ * The security identifier is copied, None removes the owner security identifier
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_security_descriptor_set_owner(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	libcerror_error_t *error                           = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	libfwnt_security_identifier_t *security_identifier = NULL;
+	PyObject *security_identifier_object               = NULL;
+	static char *function                              = "pyfwnt_security_descriptor_set_owner";
+	static char *keyword_list[]                        = { "security_identifier", NULL };
+	int result                                         = 0;
+
+	if( pyfwnt_security_descriptor == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( NULL );
+	}
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "O",
+	     keyword_list,
+	     &security_identifier_object ) == 0 )
+	{
+		return( NULL );
+	}
+	if( security_identifier_object != Py_None )
+	{
+		result = PyObject_IsInstance(
+		          security_identifier_object,
+		          (PyObject *) &pyfwnt_security_identifier_type_object );
+
+		if( result == -1 )
+		{
+			pyfwnt_error_fetch_and_raise(
+			 PyExc_RuntimeError,
+			 "%s: unable to determine if object is of type security identifier.",
+			 function );
+
+			return( NULL );
+		}
+		else if( result == 0 )
+		{
+			PyErr_Format(
+			 PyExc_TypeError,
+			 "%s: unsupported security identifier object type.",
+			 function );
+
+			return( NULL );
+		}
+		security_identifier = pyfwnt_security_identifier_get_value(
+		                       (pyfwnt_security_identifier_t *) security_identifier_object );
+
+		if( security_identifier == NULL )
+		{
+			PyErr_Format(
+			 PyExc_ValueError,
+			 "%s: invalid security identifier value missing.",
+			 function );
+
+			return( NULL );
+		}
+		result = 0;
+	}
+	PYFWNT_BEGIN_CRITICAL_SECTION( (PyObject *) pyfwnt_security_descriptor )
+
+	security_descriptor = pyfwnt_security_descriptor_get_writable_value(
+	                       pyfwnt_security_descriptor );
+
+	if( security_descriptor != NULL )
+	{
+		result = libfwnt_security_descriptor_set_owner(
+		          security_descriptor,
+		          security_identifier,
+		          &error );
+	}
+	PYFWNT_END_CRITICAL_SECTION
+
+	if( security_descriptor == NULL )
+	{
+		return( NULL );
+	}
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to set owner security identifier.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	Py_IncRef(
+	 Py_None );
+
+	return( Py_None );
+}
+
+/* Sets the group security identifier (SID)
+ * The security identifier is copied, None removes the group security identifier
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_security_descriptor_set_group(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	libcerror_error_t *error                           = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	libfwnt_security_identifier_t *security_identifier = NULL;
+	PyObject *security_identifier_object               = NULL;
+	static char *function                              = "pyfwnt_security_descriptor_set_group";
+	static char *keyword_list[]                        = { "security_identifier", NULL };
+	int result                                         = 0;
+
+	if( pyfwnt_security_descriptor == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( NULL );
+	}
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "O",
+	     keyword_list,
+	     &security_identifier_object ) == 0 )
+	{
+		return( NULL );
+	}
+	if( security_identifier_object != Py_None )
+	{
+		result = PyObject_IsInstance(
+		          security_identifier_object,
+		          (PyObject *) &pyfwnt_security_identifier_type_object );
+
+		if( result == -1 )
+		{
+			pyfwnt_error_fetch_and_raise(
+			 PyExc_RuntimeError,
+			 "%s: unable to determine if object is of type security identifier.",
+			 function );
+
+			return( NULL );
+		}
+		else if( result == 0 )
+		{
+			PyErr_Format(
+			 PyExc_TypeError,
+			 "%s: unsupported security identifier object type.",
+			 function );
+
+			return( NULL );
+		}
+		security_identifier = pyfwnt_security_identifier_get_value(
+		                       (pyfwnt_security_identifier_t *) security_identifier_object );
+
+		if( security_identifier == NULL )
+		{
+			PyErr_Format(
+			 PyExc_ValueError,
+			 "%s: invalid security identifier value missing.",
+			 function );
+
+			return( NULL );
+		}
+		result = 0;
+	}
+	PYFWNT_BEGIN_CRITICAL_SECTION( (PyObject *) pyfwnt_security_descriptor )
+
+	security_descriptor = pyfwnt_security_descriptor_get_writable_value(
+	                       pyfwnt_security_descriptor );
+
+	if( security_descriptor != NULL )
+	{
+		result = libfwnt_security_descriptor_set_group(
+		          security_descriptor,
+		          security_identifier,
+		          &error );
+	}
+	PYFWNT_END_CRITICAL_SECTION
+
+	if( security_descriptor == NULL )
+	{
+		return( NULL );
+	}
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to set group security identifier.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	Py_IncRef(
+	 Py_None );
+
+	return( Py_None );
+}
+
+/* Sets the discretionary access control list (ACL)
+ * The access control list is copied, None removes the discretionary access control list
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_security_descriptor_set_discretionary_acl(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	libcerror_error_t *error                           = NULL;
+	libfwnt_access_control_list_t *access_control_list = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	PyObject *access_control_list_object               = NULL;
+	static char *function                              = "pyfwnt_security_descriptor_set_discretionary_acl";
+	static char *keyword_list[]                        = { "access_control_list", NULL };
+	int result                                         = 0;
+
+	if( pyfwnt_security_descriptor == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( NULL );
+	}
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "O",
+	     keyword_list,
+	     &access_control_list_object ) == 0 )
+	{
+		return( NULL );
+	}
+	if( access_control_list_object != Py_None )
+	{
+		result = PyObject_IsInstance(
+		          access_control_list_object,
+		          (PyObject *) &pyfwnt_access_control_list_type_object );
+
+		if( result == -1 )
+		{
+			pyfwnt_error_fetch_and_raise(
+			 PyExc_RuntimeError,
+			 "%s: unable to determine if object is of type access control list.",
+			 function );
+
+			return( NULL );
+		}
+		else if( result == 0 )
+		{
+			PyErr_Format(
+			 PyExc_TypeError,
+			 "%s: unsupported access control list object type.",
+			 function );
+
+			return( NULL );
+		}
+		access_control_list = ( (pyfwnt_access_control_list_t *) access_control_list_object )->access_control_list;
+
+		result = 0;
+	}
+	PYFWNT_BEGIN_CRITICAL_SECTION( (PyObject *) pyfwnt_security_descriptor )
+
+	security_descriptor = pyfwnt_security_descriptor_get_writable_value(
+	                       pyfwnt_security_descriptor );
+
+	if( security_descriptor != NULL )
+	{
+		result = libfwnt_security_descriptor_set_discretionary_acl(
+		          security_descriptor,
+		          access_control_list,
+		          &error );
+	}
+	PYFWNT_END_CRITICAL_SECTION
+
+	if( security_descriptor == NULL )
+	{
+		return( NULL );
+	}
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to set discretionary access control list.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	Py_IncRef(
+	 Py_None );
+
+	return( Py_None );
+}
+
+/* Sets the system access control list (ACL)
+ * The access control list is copied, None removes the system access control list
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_security_descriptor_set_system_acl(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	libcerror_error_t *error                           = NULL;
+	libfwnt_access_control_list_t *access_control_list = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	PyObject *access_control_list_object               = NULL;
+	static char *function                              = "pyfwnt_security_descriptor_set_system_acl";
+	static char *keyword_list[]                        = { "access_control_list", NULL };
+	int result                                         = 0;
+
+	if( pyfwnt_security_descriptor == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( NULL );
+	}
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "O",
+	     keyword_list,
+	     &access_control_list_object ) == 0 )
+	{
+		return( NULL );
+	}
+	if( access_control_list_object != Py_None )
+	{
+		result = PyObject_IsInstance(
+		          access_control_list_object,
+		          (PyObject *) &pyfwnt_access_control_list_type_object );
+
+		if( result == -1 )
+		{
+			pyfwnt_error_fetch_and_raise(
+			 PyExc_RuntimeError,
+			 "%s: unable to determine if object is of type access control list.",
+			 function );
+
+			return( NULL );
+		}
+		else if( result == 0 )
+		{
+			PyErr_Format(
+			 PyExc_TypeError,
+			 "%s: unsupported access control list object type.",
+			 function );
+
+			return( NULL );
+		}
+		access_control_list = ( (pyfwnt_access_control_list_t *) access_control_list_object )->access_control_list;
+
+		result = 0;
+	}
+	PYFWNT_BEGIN_CRITICAL_SECTION( (PyObject *) pyfwnt_security_descriptor )
+
+	security_descriptor = pyfwnt_security_descriptor_get_writable_value(
+	                       pyfwnt_security_descriptor );
+
+	if( security_descriptor != NULL )
+	{
+		result = libfwnt_security_descriptor_set_system_acl(
+		          security_descriptor,
+		          access_control_list,
+		          &error );
+	}
+	PYFWNT_END_CRITICAL_SECTION
+
+	if( security_descriptor == NULL )
+	{
+		return( NULL );
+	}
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to set system access control list.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	Py_IncRef(
+	 Py_None );
+
+	return( Py_None );
+}
+
+/* Inserts an access control entry (ACE) stored in a byte stream into the discretionary access control list
+ * The discretionary access control list is created if not set
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_security_descriptor_insert_discretionary_access_control_entry(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	libcerror_error_t *error                           = NULL;
+	libfwnt_access_control_list_t *access_control_list = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	PyObject *string_object                            = NULL;
+	static char *function                              = "pyfwnt_security_descriptor_insert_discretionary_access_control_entry";
+	static char *keyword_list[]                        = { "entry_index", "byte_stream", NULL };
+	const char *byte_stream                            = NULL;
+	Py_ssize_t byte_stream_size                        = 0;
+	int entry_index                                    = 0;
+	int result                                         = 0;
+
+	if( pyfwnt_security_descriptor == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( NULL );
+	}
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "iO",
+	     keyword_list,
+	     &entry_index, &string_object ) == 0 )
+	{
+		return( NULL );
+	}
+	PyErr_Clear();
+
+#if PY_MAJOR_VERSION >= 3
+	result = PyObject_IsInstance(
+		  string_object,
+		  (PyObject *) &PyBytes_Type );
+#else
+	result = PyObject_IsInstance(
+		  string_object,
+		  (PyObject *) &PyString_Type );
+#endif
+	if( result == -1 )
+	{
+		pyfwnt_error_fetch_and_raise(
+	         PyExc_RuntimeError,
+		 "%s: unable to determine if string object is of type string.",
+		 function );
+
+		return( NULL );
+	}
+	else if( result == 0 )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: unsupported string object type",
+		 function );
+
+		return( NULL );
+	}
+	PyErr_Clear();
+
+#if PY_MAJOR_VERSION >= 3
+	byte_stream = PyBytes_AsString(
+	               string_object );
+
+	byte_stream_size = PyBytes_Size(
+	                    string_object );
+#else
+	byte_stream = PyString_AsString(
+	               string_object );
+
+	byte_stream_size = PyString_Size(
+	                    string_object );
+#endif
+	result = 0;
+
+	PYFWNT_BEGIN_CRITICAL_SECTION( (PyObject *) pyfwnt_security_descriptor )
+
+	security_descriptor = pyfwnt_security_descriptor_get_writable_value(
+	                       pyfwnt_security_descriptor );
+
+	if( security_descriptor != NULL )
+	{
+		result = libfwnt_security_descriptor_get_discretionary_acl(
+		          security_descriptor,
+		          &access_control_list,
+		          &error );
+
+		if( result == 0 )
+		{
+			result = libfwnt_access_control_list_initialize(
+			          &access_control_list,
+			          &error );
+
+			if( result == 1 )
+			{
+				result = libfwnt_security_descriptor_set_discretionary_acl(
+				          security_descriptor,
+				          access_control_list,
+				          &error );
+
+				libfwnt_access_control_list_free(
+				 &access_control_list,
+				 NULL );
+			}
+			if( result == 1 )
+			{
+				result = libfwnt_security_descriptor_get_discretionary_acl(
+				          security_descriptor,
+				          &access_control_list,
+				          &error );
+			}
+		}
+		if( result == 1 )
+		{
+			result = libfwnt_access_control_list_insert_entry_from_byte_stream(
+			          access_control_list,
+			          entry_index,
+			          (uint8_t *) byte_stream,
+			          (size_t) byte_stream_size,
+			          LIBFWNT_ENDIAN_LITTLE,
+			          &error );
+		}
+	}
+	PYFWNT_END_CRITICAL_SECTION
+
+	if( security_descriptor == NULL )
+	{
+		return( NULL );
+	}
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to insert access control entry.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	Py_IncRef(
+	 Py_None );
+
+	return( Py_None );
+}
+
+/* Removes a specific access control entry (ACE) from the discretionary access control list
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_security_descriptor_remove_discretionary_access_control_entry(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	libcerror_error_t *error                           = NULL;
+	libfwnt_access_control_list_t *access_control_list = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	static char *function                              = "pyfwnt_security_descriptor_remove_discretionary_access_control_entry";
+	static char *keyword_list[]                        = { "entry_index", NULL };
+	int entry_index                                    = 0;
+	int result                                         = 0;
+
+	if( pyfwnt_security_descriptor == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( NULL );
+	}
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "i",
+	     keyword_list,
+	     &entry_index ) == 0 )
+	{
+		return( NULL );
+	}
+	PYFWNT_BEGIN_CRITICAL_SECTION( (PyObject *) pyfwnt_security_descriptor )
+
+	security_descriptor = pyfwnt_security_descriptor_get_writable_value(
+	                       pyfwnt_security_descriptor );
+
+	if( security_descriptor != NULL )
+	{
+		result = libfwnt_security_descriptor_get_discretionary_acl(
+		          security_descriptor,
+		          &access_control_list,
+		          &error );
+
+		if( result == 0 )
+		{
+			libcerror_error_set(
+			 &error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_MISSING,
+			 "%s: missing discretionary access control list.",
+			 function );
+
+			result = -1;
+		}
+		else if( result == 1 )
+		{
+			result = libfwnt_access_control_list_remove_entry(
+			          access_control_list,
+			          entry_index,
+			          &error );
+		}
+	}
+	PYFWNT_END_CRITICAL_SECTION
+
+	if( security_descriptor == NULL )
+	{
+		return( NULL );
+	}
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to remove access control entry.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	Py_IncRef(
+	 Py_None );
+
+	return( Py_None );
+}
+
+/* Inserts an access control entry (ACE) stored in a byte stream into the system access control list
+ * The system access control list is created if not set
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_security_descriptor_insert_system_access_control_entry(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	libcerror_error_t *error                           = NULL;
+	libfwnt_access_control_list_t *access_control_list = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	PyObject *string_object                            = NULL;
+	static char *function                              = "pyfwnt_security_descriptor_insert_system_access_control_entry";
+	static char *keyword_list[]                        = { "entry_index", "byte_stream", NULL };
+	const char *byte_stream                            = NULL;
+	Py_ssize_t byte_stream_size                        = 0;
+	int entry_index                                    = 0;
+	int result                                         = 0;
+
+	if( pyfwnt_security_descriptor == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( NULL );
+	}
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "iO",
+	     keyword_list,
+	     &entry_index, &string_object ) == 0 )
+	{
+		return( NULL );
+	}
+	PyErr_Clear();
+
+#if PY_MAJOR_VERSION >= 3
+	result = PyObject_IsInstance(
+		  string_object,
+		  (PyObject *) &PyBytes_Type );
+#else
+	result = PyObject_IsInstance(
+		  string_object,
+		  (PyObject *) &PyString_Type );
+#endif
+	if( result == -1 )
+	{
+		pyfwnt_error_fetch_and_raise(
+	         PyExc_RuntimeError,
+		 "%s: unable to determine if string object is of type string.",
+		 function );
+
+		return( NULL );
+	}
+	else if( result == 0 )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: unsupported string object type",
+		 function );
+
+		return( NULL );
+	}
+	PyErr_Clear();
+
+#if PY_MAJOR_VERSION >= 3
+	byte_stream = PyBytes_AsString(
+	               string_object );
+
+	byte_stream_size = PyBytes_Size(
+	                    string_object );
+#else
+	byte_stream = PyString_AsString(
+	               string_object );
+
+	byte_stream_size = PyString_Size(
+	                    string_object );
+#endif
+	result = 0;
+
+	PYFWNT_BEGIN_CRITICAL_SECTION( (PyObject *) pyfwnt_security_descriptor )
+
+	security_descriptor = pyfwnt_security_descriptor_get_writable_value(
+	                       pyfwnt_security_descriptor );
+
+	if( security_descriptor != NULL )
+	{
+		result = libfwnt_security_descriptor_get_system_acl(
+		          security_descriptor,
+		          &access_control_list,
+		          &error );
+
+		if( result == 0 )
+		{
+			result = libfwnt_access_control_list_initialize(
+			          &access_control_list,
+			          &error );
+
+			if( result == 1 )
+			{
+				result = libfwnt_security_descriptor_set_system_acl(
+				          security_descriptor,
+				          access_control_list,
+				          &error );
+
+				libfwnt_access_control_list_free(
+				 &access_control_list,
+				 NULL );
+			}
+			if( result == 1 )
+			{
+				result = libfwnt_security_descriptor_get_system_acl(
+				          security_descriptor,
+				          &access_control_list,
+				          &error );
+			}
+		}
+		if( result == 1 )
+		{
+			result = libfwnt_access_control_list_insert_entry_from_byte_stream(
+			          access_control_list,
+			          entry_index,
+			          (uint8_t *) byte_stream,
+			          (size_t) byte_stream_size,
+			          LIBFWNT_ENDIAN_LITTLE,
+			          &error );
+		}
+	}
+	PYFWNT_END_CRITICAL_SECTION
+
+	if( security_descriptor == NULL )
+	{
+		return( NULL );
+	}
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to insert access control entry.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	Py_IncRef(
+	 Py_None );
+
+	return( Py_None );
+}
+
+/* Removes a specific access control entry (ACE) from the system access control list
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_security_descriptor_remove_system_access_control_entry(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	libcerror_error_t *error                           = NULL;
+	libfwnt_access_control_list_t *access_control_list = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	static char *function                              = "pyfwnt_security_descriptor_remove_system_access_control_entry";
+	static char *keyword_list[]                        = { "entry_index", NULL };
+	int entry_index                                    = 0;
+	int result                                         = 0;
+
+	if( pyfwnt_security_descriptor == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( NULL );
+	}
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "i",
+	     keyword_list,
+	     &entry_index ) == 0 )
+	{
+		return( NULL );
+	}
+	PYFWNT_BEGIN_CRITICAL_SECTION( (PyObject *) pyfwnt_security_descriptor )
+
+	security_descriptor = pyfwnt_security_descriptor_get_writable_value(
+	                       pyfwnt_security_descriptor );
+
+	if( security_descriptor != NULL )
+	{
+		result = libfwnt_security_descriptor_get_system_acl(
+		          security_descriptor,
+		          &access_control_list,
+		          &error );
+
+		if( result == 0 )
+		{
+			libcerror_error_set(
+			 &error,
+			 LIBCERROR_ERROR_DOMAIN_RUNTIME,
+			 LIBCERROR_RUNTIME_ERROR_VALUE_MISSING,
+			 "%s: missing system access control list.",
+			 function );
+
+			result = -1;
+		}
+		else if( result == 1 )
+		{
+			result = libfwnt_access_control_list_remove_entry(
+			          access_control_list,
+			          entry_index,
+			          &error );
+		}
+	}
+	PYFWNT_END_CRITICAL_SECTION
+
+	if( security_descriptor == NULL )
+	{
+		return( NULL );
+	}
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to remove access control entry.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	Py_IncRef(
+	 Py_None );
+
+	return( Py_None );
+}
+
+/* Copies the security descriptor to a self-relative byte stream
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_security_descriptor_copy_to_byte_stream(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments PYFWNT_ATTRIBUTE_UNUSED )
+{
+	libcerror_error_t *error                           = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	PyObject *bytes_object                             = NULL;
+	PyObject *value_object                             = NULL;
+	static char *function                              = "pyfwnt_security_descriptor_copy_to_byte_stream";
+	char *byte_stream                                  = NULL;
+	size_t byte_stream_size                            = 0;
+	int result                                         = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyfwnt_security_descriptor == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid security descriptor.",
+		 function );
+
+		return( NULL );
+	}
+	security_descriptor = pyfwnt_security_descriptor_get_value(
+	                       pyfwnt_security_descriptor,
+	                       &value_object );
+
+	if( security_descriptor == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid security descriptor value missing.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_security_descriptor_get_byte_stream_size(
+	          security_descriptor,
+	          &byte_stream_size,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve byte stream size.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		goto on_error;
+	}
+#if PY_MAJOR_VERSION >= 3
+	bytes_object = PyBytes_FromStringAndSize(
+	                NULL,
+	                (Py_ssize_t) byte_stream_size );
+#else
+	bytes_object = PyString_FromStringAndSize(
+	                NULL,
+	                (Py_ssize_t) byte_stream_size );
+#endif
+	if( bytes_object == NULL )
+	{
+		PyErr_Format(
+		 PyExc_MemoryError,
+		 "%s: unable to create byte stream.",
+		 function );
+
+		goto on_error;
+	}
+#if PY_MAJOR_VERSION >= 3
+	byte_stream = PyBytes_AsString(
+	               bytes_object );
+#else
+	byte_stream = PyString_AsString(
+	               bytes_object );
+#endif
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_security_descriptor_copy_to_byte_stream(
+	          security_descriptor,
+	          (uint8_t *) byte_stream,
+	          byte_stream_size,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to copy security descriptor to byte stream.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		goto on_error;
+	}
+	Py_DecRef(
+	 value_object );
+
+	return( bytes_object );
+
+on_error:
+	if( bytes_object != NULL )
+	{
+		Py_DecRef(
+		 bytes_object );
+	}
+	Py_DecRef(
+	 value_object );
+
 	return( NULL );
 }
 
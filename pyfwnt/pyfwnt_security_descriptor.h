@@ -45,6 +45,10 @@ struct pyfwnt_security_descriptor
 	/* The libfwnt security descriptor
 	 */
 	libfwnt_security_descriptor_t *security_descriptor;
+
+	/* The value object, which owns the libfwnt security descriptor
+	 */
+	PyObject *value_object;
 };
 
 extern PyMethodDef pyfwnt_security_descriptor_object_methods[];
@@ -64,6 +68,20 @@ PyObject *pyfwnt_security_descriptor_copy_from_byte_stream(
            PyObject *arguments,
            PyObject *keywords );
 
+void pyfwnt_security_descriptor_value_free(
+      PyObject *value_object );
+
+int pyfwnt_security_descriptor_set_value(
+     pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+     libfwnt_security_descriptor_t *security_descriptor );
+
+libfwnt_security_descriptor_t *pyfwnt_security_descriptor_get_value(
+                                pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+                                PyObject **value_object );
+
+libfwnt_security_descriptor_t *pyfwnt_security_descriptor_get_writable_value(
+                                pyfwnt_security_descriptor_t *pyfwnt_security_descriptor );
+
 PyObject *pyfwnt_security_descriptor_get_owner(
            pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
            PyObject *arguments );
@@ -80,6 +98,59 @@ PyObject *pyfwnt_security_descriptor_get_system_acl(
            pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
            PyObject *arguments );
 
+PyObject *pyfwnt_security_descriptor_get_control_flags(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments );
+
+PyObject *pyfwnt_security_descriptor_set_control_flags(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_security_descriptor_set_owner(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_security_descriptor_set_group(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_security_descriptor_set_discretionary_acl(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_security_descriptor_set_system_acl(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_security_descriptor_insert_discretionary_access_control_entry(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_security_descriptor_remove_discretionary_access_control_entry(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_security_descriptor_insert_system_access_control_entry(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_security_descriptor_remove_system_access_control_entry(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_security_descriptor_copy_to_byte_stream(
+           pyfwnt_security_descriptor_t *pyfwnt_security_descriptor,
+           PyObject *arguments );
+
 #if defined( __cplusplus )
 }
 #endif
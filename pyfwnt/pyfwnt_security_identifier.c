@@ -42,6 +42,20 @@ PyMethodDef pyfwnt_security_identifier_object_methods[] = {
 	  "\n"
 	  "Copies the the security identifier from the byte stream." },
 
+	{ "copy_to_byte_stream",
+	  (PyCFunction) pyfwnt_security_identifier_copy_to_byte_stream,
+	  METH_NOARGS,
+	  "copy_to_byte_stream() -> Binary string\n"
+	  "\n"
+	  "Copies the the security identifier to a byte stream." },
+
+	{ "__bytes__",
+	  (PyCFunction) pyfwnt_security_identifier_copy_to_byte_stream,
+	  METH_NOARGS,
+	  "__bytes__() -> Binary string\n"
+	  "\n"
+	  "Copies the the security identifier to a byte stream." },
+
 	/* Functions to access the security identifier */
 
 	{ "get_string",
@@ -63,6 +77,12 @@ PyGetSetDef pyfwnt_security_identifier_object_get_set_definitions[] = {
 	  "The string.",
 	  NULL },
 
+	{ "byte_stream",
+	  (getter) pyfwnt_security_identifier_copy_to_byte_stream,
+	  (setter) 0,
+	  "The byte stream.",
+	  NULL },
+
 	/* Sentinel */
 	{ NULL, NULL, NULL, NULL, NULL }
 };
@@ -95,7 +115,7 @@ PyTypeObject pyfwnt_security_identifier_type_object = {
 	/* tp_as_mapping */
 	0,
 	/* tp_hash */
-	0,
+	(hashfunc) pyfwnt_security_identifier_hash,
 	/* tp_call */
 	0,
 	/* tp_str */
@@ -115,7 +135,7 @@ PyTypeObject pyfwnt_security_identifier_type_object = {
 	/* tp_clear */
 	0,
 	/* tp_richcompare */
-	0,
+	(richcmpfunc) pyfwnt_security_identifier_richcompare,
 	/* tp_weaklistoffset */
 	0,
 	/* tp_iter */
@@ -266,15 +286,6 @@ void pyfwnt_security_identifier_free(
 
 		return;
 	}
-	if( pyfwnt_security_identifier->security_identifier == NULL )
-	{
-		PyErr_Format(
-		 PyExc_TypeError,
-		 "%s: invalid security identifier - missing libfwnt security identifier.",
-		 function );
-
-		return;
-	}
 	ob_type = Py_TYPE(
 	           pyfwnt_security_identifier );
 
@@ -296,24 +307,29 @@ void pyfwnt_security_identifier_free(
 
 		return;
 	}
-	Py_BEGIN_ALLOW_THREADS
+	/* A security identifier object that was never set has no libfwnt security identifier
+	 */
+	if( pyfwnt_security_identifier->security_identifier != NULL )
+	{
+		Py_BEGIN_ALLOW_THREADS
 
-	result = libfwnt_security_identifier_free(
-	          &( pyfwnt_security_identifier->security_identifier ),
-	          &error );
+		result = libfwnt_security_identifier_free(
+		          &( pyfwnt_security_identifier->security_identifier ),
+		          &error );
 
-	Py_END_ALLOW_THREADS
+		Py_END_ALLOW_THREADS
 
-	if( result != 1 )
-	{
-		pyfwnt_error_raise(
-		 error,
-		 PyExc_MemoryError,
-		 "%s: unable to free security identifier.",
-		 function );
+		if( result != 1 )
+		{
+			pyfwnt_error_raise(
+			 error,
+			 PyExc_MemoryError,
+			 "%s: unable to free security identifier.",
+			 function );
 
-		libcerror_error_free(
-		 &error );
+			libcerror_error_free(
+			 &error );
+		}
 	}
 	if( pyfwnt_security_identifier->parent_object != NULL )
 	{
@@ -332,13 +348,14 @@ PyObject *pyfwnt_security_identifier_copy_from_byte_stream(
            PyObject *arguments,
            PyObject *keywords )
 {
-	PyObject *string_object     = NULL;
-	libcerror_error_t *error    = NULL;
-	static char *function       = "pyfwnt_security_identifier_copy_from_byte_stream";
-	static char *keyword_list[] = { "byte_stream", NULL };
-	const char *byte_stream     = NULL;
-	Py_ssize_t byte_stream_size = 0;
-	int result                  = 0;
+	libfwnt_security_identifier_t *security_identifier = NULL;
+	PyObject *string_object                            = NULL;
+	libcerror_error_t *error                           = NULL;
+	static char *function                              = "pyfwnt_security_identifier_copy_from_byte_stream";
+	static char *keyword_list[]                        = { "byte_stream", NULL };
+	const char *byte_stream                            = NULL;
+	Py_ssize_t byte_stream_size                        = 0;
+	int result                                         = 0;
 
 	if( pyfwnt_security_identifier == NULL )
 	{
@@ -404,15 +421,24 @@ PyObject *pyfwnt_security_identifier_copy_from_byte_stream(
 #endif
 /* TODO size bounds check */
 
+	/* The security identifier is copied into a new libfwnt security identifier that
+	 * is only set on the object once it is complete, after which it is not modified
+	 */
 	Py_BEGIN_ALLOW_THREADS
 
-	result = libfwnt_security_identifier_copy_from_byte_stream(
-	          pyfwnt_security_identifier->security_identifier,
-	          (uint8_t *) byte_stream,
-	          (size_t) byte_stream_size,
-	          LIBFWNT_ENDIAN_LITTLE,
+	result = libfwnt_security_identifier_initialize(
+	          &security_identifier,
 	          &error );
 
+	if( result == 1 )
+	{
+		result = libfwnt_security_identifier_copy_from_byte_stream(
+		          security_identifier,
+		          (uint8_t *) byte_stream,
+		          (size_t) byte_stream_size,
+		          LIBFWNT_ENDIAN_LITTLE,
+		          &error );
+	}
 	Py_END_ALLOW_THREADS
 
 	if( result != 1 )
@@ -426,12 +452,61 @@ PyObject *pyfwnt_security_identifier_copy_from_byte_stream(
 		libcerror_error_free(
 		 &error );
 
-		return( NULL );
+		goto on_error;
+	}
+	PYFWNT_BEGIN_CRITICAL_SECTION( (PyObject *) pyfwnt_security_identifier )
+
+	if( pyfwnt_security_identifier->security_identifier == NULL )
+	{
+		pyfwnt_security_identifier->security_identifier = security_identifier;
+
+		security_identifier = NULL;
+	}
+	PYFWNT_END_CRITICAL_SECTION
+
+	if( security_identifier != NULL )
+	{
+		PyErr_Format(
+		 PyExc_IOError,
+		 "%s: invalid security identifier value already set.",
+		 function );
+
+		goto on_error;
 	}
 	Py_IncRef(
 	 Py_None );
 
 	return( Py_None );
+
+on_error:
+	if( security_identifier != NULL )
+	{
+		libfwnt_security_identifier_free(
+		 &security_identifier,
+		 NULL );
+	}
+	return( NULL );
+}
+
+/* Retrieves the libfwnt security identifier
+ * Returns the libfwnt security identifier or NULL if not set
+ */
+libfwnt_security_identifier_t *pyfwnt_security_identifier_get_value(
+                                pyfwnt_security_identifier_t *pyfwnt_security_identifier )
+{
+	libfwnt_security_identifier_t *security_identifier = NULL;
+
+	if( pyfwnt_security_identifier == NULL )
+	{
+		return( NULL );
+	}
+	PYFWNT_BEGIN_CRITICAL_SECTION( (PyObject *) pyfwnt_security_identifier )
+
+	security_identifier = pyfwnt_security_identifier->security_identifier;
+
+	PYFWNT_END_CRITICAL_SECTION
+
+	return( security_identifier );
 }
 
 /* Retrieves the string
@@ -441,14 +516,15 @@ PyObject *pyfwnt_security_identifier_get_string(
            pyfwnt_security_identifier_t *pyfwnt_security_identifier,
            PyObject *arguments PYFWNT_ATTRIBUTE_UNUSED )
 {
-	libcerror_error_t *error     = NULL;
-	PyObject *string_object      = NULL;
-	const char *errors           = NULL;
-	uint8_t *string              = NULL;
-	static char *function        = "pyfwnt_security_identifier_get_string";
-	size_t string_size           = 0;
-	uint32_t string_format_flags = 0;
-	int result                   = 0;
+	libfwnt_security_identifier_t *security_identifier = NULL;
+	libcerror_error_t *error                           = NULL;
+	PyObject *string_object                            = NULL;
+	const char *errors                                 = NULL;
+	uint8_t *string                                    = NULL;
+	static char *function                              = "pyfwnt_security_identifier_get_string";
+	size_t string_size                                 = 0;
+	uint32_t string_format_flags                       = 0;
+	int result                                         = 0;
 
 	PYFWNT_UNREFERENCED_PARAMETER( arguments )
 
@@ -461,10 +537,13 @@ PyObject *pyfwnt_security_identifier_get_string(
 
 		return( NULL );
 	}
+	security_identifier = pyfwnt_security_identifier_get_value(
+	                       pyfwnt_security_identifier );
+
 	Py_BEGIN_ALLOW_THREADS
 
 	result = libfwnt_security_identifier_get_string_size(
-	          pyfwnt_security_identifier->security_identifier,
+	          security_identifier,
 	          &string_size,
 	          string_format_flags,
 	          &error );
@@ -507,7 +586,7 @@ PyObject *pyfwnt_security_identifier_get_string(
 	Py_BEGIN_ALLOW_THREADS
 
 	result = libfwnt_security_identifier_copy_to_utf8_string(
-		  pyfwnt_security_identifier->security_identifier,
+		  security_identifier,
 		  string,
 		  string_size,
 		  string_format_flags,
@@ -551,3 +630,289 @@ on_error:
 	return( NULL );
 }
 
+
+/* Copies the security identifier to a byte stream
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_security_identifier_copy_to_byte_stream(
+           pyfwnt_security_identifier_t *pyfwnt_security_identifier,
+           PyObject *arguments PYFWNT_ATTRIBUTE_UNUSED )
+{
+	uint8_t byte_stream[ 68 ];
+
+	libfwnt_security_identifier_t *security_identifier = NULL;
+	libcerror_error_t *error                           = NULL;
+	PyObject *bytes_object                             = NULL;
+	static char *function                              = "pyfwnt_security_identifier_copy_to_byte_stream";
+	size_t security_identifier_size                    = 0;
+	int result                                         = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyfwnt_security_identifier == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid security identifier.",
+		 function );
+
+		return( NULL );
+	}
+	security_identifier = pyfwnt_security_identifier_get_value(
+	                       pyfwnt_security_identifier );
+
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_security_identifier_get_size(
+	          security_identifier,
+	          &security_identifier_size,
+	          &error );
+
+	if( result == 1 )
+	{
+		result = libfwnt_security_identifier_copy_to_byte_stream(
+		          security_identifier,
+		          byte_stream,
+		          68,
+		          LIBFWNT_ENDIAN_LITTLE,
+		          &error );
+	}
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to copy security identifier to byte stream.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+#if PY_MAJOR_VERSION >= 3
+	bytes_object = PyBytes_FromStringAndSize(
+	                (char *) byte_stream,
+	                (Py_ssize_t) security_identifier_size );
+#else
+	bytes_object = PyString_FromStringAndSize(
+	                (char *) byte_stream,
+	                (Py_ssize_t) security_identifier_size );
+#endif
+	return( bytes_object );
+}
+
+/* Calculates the hash of the security identifier
+ * The hash is a FNV-1a hash of the byte stream, which is determined with the GIL held
+ * since copying a security identifier takes less time than releasing the GIL
+ * A security identifier that has not been set only equals itself and is hashed on its identity
+ * Returns the hash if successful or -1 on error
+ */
+#if PY_MAJOR_VERSION >= 3
+Py_hash_t pyfwnt_security_identifier_hash(
+           pyfwnt_security_identifier_t *pyfwnt_security_identifier )
+#else
+long pyfwnt_security_identifier_hash(
+      pyfwnt_security_identifier_t *pyfwnt_security_identifier )
+#endif
+{
+	uint8_t byte_stream[ 68 ];
+
+	libfwnt_security_identifier_t *security_identifier = NULL;
+	libcerror_error_t *error                           = NULL;
+	static char *function                              = "pyfwnt_security_identifier_hash";
+	size_t byte_stream_index                           = 0;
+	size_t security_identifier_size                    = 0;
+	uint64_t hash                                      = 0xcbf29ce484222325ULL;
+
+	if( pyfwnt_security_identifier == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid security identifier.",
+		 function );
+
+		return( -1 );
+	}
+	security_identifier = pyfwnt_security_identifier_get_value(
+	                       pyfwnt_security_identifier );
+
+	if( security_identifier == NULL )
+	{
+		/* Rotate the address, of which the lower bits are always zero due to alignment
+		 */
+		hash = (uint64_t) (uintptr_t) pyfwnt_security_identifier;
+		hash = ( hash >> 4 ) | ( hash << 60 );
+	}
+	else if( ( libfwnt_security_identifier_get_size(
+	       security_identifier,
+	       &security_identifier_size,
+	       &error ) != 1 )
+	 || ( libfwnt_security_identifier_copy_to_byte_stream(
+	       security_identifier,
+	       byte_stream,
+	       68,
+	       LIBFWNT_ENDIAN_LITTLE,
+	       &error ) != 1 ) )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to copy security identifier to byte stream.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( -1 );
+	}
+	else
+	{
+		for( byte_stream_index = 0;
+		     byte_stream_index < security_identifier_size;
+		     byte_stream_index++ )
+		{
+			hash ^= byte_stream[ byte_stream_index ];
+			hash *= 0x100000001b3ULL;
+		}
+	}
+	/* -1 is reserved to signal an error
+	 */
+#if PY_MAJOR_VERSION >= 3
+	if( (Py_hash_t) hash == -1 )
+	{
+		return( -2 );
+	}
+	return( (Py_hash_t) hash );
+#else
+	if( (long) hash == -1 )
+	{
+		return( -2 );
+	}
+	return( (long) hash );
+#endif
+}
+
+/* Compares the security identifier with another object
+ * Security identifiers are ordered on revision number, authority and sub authorities
+ * A security identifier that has not been set only equals itself and cannot be ordered
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_security_identifier_richcompare(
+           pyfwnt_security_identifier_t *pyfwnt_security_identifier,
+           PyObject *other_object,
+           int compare_operation )
+{
+	libfwnt_security_identifier_t *other_security_identifier = NULL;
+	libfwnt_security_identifier_t *security_identifier       = NULL;
+	libcerror_error_t *error                                 = NULL;
+	PyObject *result_object                                  = NULL;
+	static char *function                                    = "pyfwnt_security_identifier_richcompare";
+	int result                                               = 0;
+
+	if( pyfwnt_security_identifier == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid security identifier.",
+		 function );
+
+		return( NULL );
+	}
+	if( PyObject_TypeCheck(
+	     other_object,
+	     &pyfwnt_security_identifier_type_object ) == 0 )
+	{
+		Py_IncRef(
+		 Py_NotImplemented );
+
+		return( Py_NotImplemented );
+	}
+	security_identifier = pyfwnt_security_identifier_get_value(
+	                       pyfwnt_security_identifier );
+
+	other_security_identifier = pyfwnt_security_identifier_get_value(
+	                             (pyfwnt_security_identifier_t *) other_object );
+
+	if( ( security_identifier == NULL )
+	 || ( other_security_identifier == NULL ) )
+	{
+		if( compare_operation == Py_EQ )
+		{
+			result_object = ( (PyObject *) pyfwnt_security_identifier == other_object ) ? Py_True : Py_False;
+		}
+		else if( compare_operation == Py_NE )
+		{
+			result_object = ( (PyObject *) pyfwnt_security_identifier != other_object ) ? Py_True : Py_False;
+		}
+		else
+		{
+			/* Python 2 would fall back to an arbitrary order on NotImplemented
+			 */
+			PyErr_Format(
+			 PyExc_TypeError,
+			 "%s: unable to order security identifier that has not been set.",
+			 function );
+
+			return( NULL );
+		}
+		Py_IncRef(
+		 result_object );
+
+		return( result_object );
+	}
+	result = libfwnt_security_identifier_compare(
+	          security_identifier,
+	          other_security_identifier,
+	          &error );
+
+	if( result == -1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to compare security identifiers.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	switch( compare_operation )
+	{
+		case Py_LT:
+			result_object = ( result == LIBFWNT_COMPARE_LESS ) ? Py_True : Py_False;
+			break;
+
+		case Py_LE:
+			result_object = ( result != LIBFWNT_COMPARE_GREATER ) ? Py_True : Py_False;
+			break;
+
+		case Py_EQ:
+			result_object = ( result == LIBFWNT_COMPARE_EQUAL ) ? Py_True : Py_False;
+			break;
+
+		case Py_NE:
+			result_object = ( result != LIBFWNT_COMPARE_EQUAL ) ? Py_True : Py_False;
+			break;
+
+		case Py_GT:
+			result_object = ( result == LIBFWNT_COMPARE_GREATER ) ? Py_True : Py_False;
+			break;
+
+		case Py_GE:
+			result_object = ( result != LIBFWNT_COMPARE_LESS ) ? Py_True : Py_False;
+			break;
+
+		default:
+			result_object = Py_NotImplemented;
+			break;
+	}
+	Py_IncRef(
+	 result_object );
+
+	return( result_object );
+}
@@ -69,10 +69,30 @@ PyObject *pyfwnt_security_identifier_copy_from_byte_stream(
            PyObject *arguments,
            PyObject *keywords );
 
+libfwnt_security_identifier_t *pyfwnt_security_identifier_get_value(
+                                pyfwnt_security_identifier_t *pyfwnt_security_identifier );
+
 PyObject *pyfwnt_security_identifier_get_string(
            pyfwnt_security_identifier_t *pyfwnt_security_identifier,
            PyObject *arguments );
 
+PyObject *pyfwnt_security_identifier_copy_to_byte_stream(
+           pyfwnt_security_identifier_t *pyfwnt_security_identifier,
+           PyObject *arguments );
+
+#if PY_MAJOR_VERSION >= 3
+Py_hash_t pyfwnt_security_identifier_hash(
+           pyfwnt_security_identifier_t *pyfwnt_security_identifier );
+#else
+long pyfwnt_security_identifier_hash(
+      pyfwnt_security_identifier_t *pyfwnt_security_identifier );
+#endif
+
+PyObject *pyfwnt_security_identifier_richcompare(
+           pyfwnt_security_identifier_t *pyfwnt_security_identifier,
+           PyObject *other_object,
+           int compare_operation );
+
 #if defined( __cplusplus )
 }
 #endif
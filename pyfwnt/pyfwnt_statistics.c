@@ -0,0 +1,240 @@
+/*
+ * Python bindings for the statistics functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+
+#include <common.h>
+#include <types.h>
+
+#include "pyfwnt_error.h"
+#include "pyfwnt_libcerror.h"
+#include "pyfwnt_libfwnt.h"
+#include "pyfwnt_python.h"
+#include "pyfwnt_statistics.h"
+#include "pyfwnt_unused.h"
+
+/* The names of the functions of which statistics are maintained
+ * in the order of the LIBFWNT_STATISTICS_FUNCTION values
+ */
+static const char *pyfwnt_statistics_function_names[] = {
+	"lznt1_decompress",
+	"lzxpress_decompress",
+	"lzxpress_huffman_decompress",
+	"security_descriptor_copy_from_byte_stream",
+	"security_descriptor_set_byte_stream",
+	"security_identifier_copy_from_byte_stream",
+	"security_identifier_copy_to_string" };
+
+#define PYFWNT_STATISTICS_NUMBER_OF_FUNCTIONS \
+	(int) ( sizeof( pyfwnt_statistics_function_names ) / sizeof( const char * ) )
+
+/* Enables or disables maintaining statistics
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_statistics_set_enabled(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PyObject *enabled_object    = NULL;
+	libcerror_error_t *error    = NULL;
+	static char *function       = "pyfwnt_statistics_set_enabled";
+	static char *keyword_list[] = { "enabled", NULL };
+	int enabled                 = 0;
+	int result                  = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "O",
+	     keyword_list,
+	     &enabled_object ) == 0 )
+	{
+		return( NULL );
+	}
+	enabled = PyObject_IsTrue(
+	           enabled_object );
+
+	if( enabled == -1 )
+	{
+		pyfwnt_error_fetch_and_raise(
+		 PyExc_RuntimeError,
+		 "%s: unable to determine if enabled object is true.",
+		 function );
+
+		return( NULL );
+	}
+	result = libfwnt_statistics_set_enabled(
+	          enabled,
+	          &error );
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to set statistics enabled.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	Py_IncRef(
+	 Py_None );
+
+	return( Py_None );
+}
+
+/* Retrieves the statistics as a dictionary of the function names and their values
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_statistics_get(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments PYFWNT_ATTRIBUTE_UNUSED )
+{
+	PyObject *dictionary_object     = NULL;
+	PyObject *values_object         = NULL;
+	libcerror_error_t *error        = NULL;
+	static char *function           = "pyfwnt_statistics_get";
+	uint64_t elapsed_time           = 0;
+	uint64_t number_of_calls        = 0;
+	uint64_t number_of_input_bytes  = 0;
+	uint64_t number_of_output_bytes = 0;
+	int function_type               = 0;
+	int result                      = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+	PYFWNT_UNREFERENCED_PARAMETER( arguments )
+
+	dictionary_object = PyDict_New();
+
+	if( dictionary_object == NULL )
+	{
+		PyErr_Format(
+		 PyExc_MemoryError,
+		 "%s: unable to create dictionary.",
+		 function );
+
+		return( NULL );
+	}
+	for( function_type = 0;
+	     function_type < PYFWNT_STATISTICS_NUMBER_OF_FUNCTIONS;
+	     function_type++ )
+	{
+		result = libfwnt_statistics_get_values(
+		          function_type,
+		          &number_of_calls,
+		          &number_of_input_bytes,
+		          &number_of_output_bytes,
+		          &elapsed_time,
+		          &error );
+
+		if( result != 1 )
+		{
+			pyfwnt_error_raise(
+			 error,
+			 PyExc_IOError,
+			 "%s: unable to retrieve statistics of function: %d.",
+			 function,
+			 function_type );
+
+			libcerror_error_free(
+			 &error );
+
+			goto on_error;
+		}
+		values_object = Py_BuildValue(
+		                 "{s:K,s:K,s:K,s:K}",
+		                 "number_of_calls",
+		                 (unsigned PY_LONG_LONG) number_of_calls,
+		                 "number_of_input_bytes",
+		                 (unsigned PY_LONG_LONG) number_of_input_bytes,
+		                 "number_of_output_bytes",
+		                 (unsigned PY_LONG_LONG) number_of_output_bytes,
+		                 "elapsed_time",
+		                 (unsigned PY_LONG_LONG) elapsed_time );
+
+		if( values_object == NULL )
+		{
+			goto on_error;
+		}
+		if( PyDict_SetItemString(
+		     dictionary_object,
+		     pyfwnt_statistics_function_names[ function_type ],
+		     values_object ) != 0 )
+		{
+			goto on_error;
+		}
+		Py_DecRef(
+		 values_object );
+
+		values_object = NULL;
+	}
+	return( dictionary_object );
+
+on_error:
+	if( values_object != NULL )
+	{
+		Py_DecRef(
+		 values_object );
+	}
+	Py_DecRef(
+	 dictionary_object );
+
+	return( NULL );
+}
+
+/* Resets the statistics
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_statistics_reset(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments PYFWNT_ATTRIBUTE_UNUSED )
+{
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyfwnt_statistics_reset";
+
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+	PYFWNT_UNREFERENCED_PARAMETER( arguments )
+
+	if( libfwnt_statistics_reset(
+	     &error ) != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to reset statistics.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	Py_IncRef(
+	 Py_None );
+
+	return( Py_None );
+}
+
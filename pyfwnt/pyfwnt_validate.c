@@ -0,0 +1,177 @@
+/*
+ * Python bindings for the validation functions
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <types.h>
+
+#include "pyfwnt_error.h"
+#include "pyfwnt_libcerror.h"
+#include "pyfwnt_libfwnt.h"
+#include "pyfwnt_python.h"
+#include "pyfwnt_unused.h"
+#include "pyfwnt_validate.h"
+
+/* Validates a security descriptor or an access control list stored in a byte string
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_validate_data(
+           PyObject *arguments,
+           PyObject *keywords,
+           int validate_access_control_list )
+{
+	PyObject *string_object        = NULL;
+	libcerror_error_t *error       = NULL;
+	static char *function          = "pyfwnt_validate_data";
+	static char *keyword_list[]    = { "data", NULL };
+	const char *data               = NULL;
+	Py_ssize_t data_size           = 0;
+	size_t validation_error_offset = 0;
+	int result                     = 0;
+	int validation_error           = 0;
+
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "O",
+	     keyword_list,
+	     &string_object ) == 0 )
+	{
+		return( NULL );
+	}
+	PyErr_Clear();
+
+#if PY_MAJOR_VERSION >= 3
+	result = PyObject_IsInstance(
+		  string_object,
+		  (PyObject *) &PyBytes_Type );
+#else
+	result = PyObject_IsInstance(
+		  string_object,
+		  (PyObject *) &PyString_Type );
+#endif
+	if( result == -1 )
+	{
+		pyfwnt_error_fetch_and_raise(
+	         PyExc_RuntimeError,
+		 "%s: unable to determine if string object is of type string.",
+		 function );
+
+		return( NULL );
+	}
+	else if( result == 0 )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: unsupported string object type",
+		 function );
+
+		return( NULL );
+	}
+	PyErr_Clear();
+
+#if PY_MAJOR_VERSION >= 3
+	data = PyBytes_AsString(
+	        string_object );
+
+	data_size = PyBytes_Size(
+	             string_object );
+#else
+	data = PyString_AsString(
+	        string_object );
+
+	data_size = PyString_Size(
+	             string_object );
+#endif
+	Py_BEGIN_ALLOW_THREADS
+
+	if( validate_access_control_list != 0 )
+	{
+		result = libfwnt_validate_access_control_list(
+		          (uint8_t *) data,
+		          (size_t) data_size,
+		          LIBFWNT_ENDIAN_LITTLE,
+		          &validation_error,
+		          &validation_error_offset,
+		          &error );
+	}
+	else
+	{
+		result = libfwnt_validate_security_descriptor(
+		          (uint8_t *) data,
+		          (size_t) data_size,
+		          LIBFWNT_ENDIAN_LITTLE,
+		          &validation_error,
+		          &validation_error_offset,
+		          &error );
+	}
+	Py_END_ALLOW_THREADS
+
+	if( result == -1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to validate data.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	return( Py_BuildValue(
+	         "(in)",
+	         validation_error,
+	         (Py_ssize_t) validation_error_offset ) );
+}
+
+/* Validates a security descriptor stored in a byte string
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_validate_security_descriptor(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+
+	return( pyfwnt_validate_data(
+	         arguments,
+	         keywords,
+	         0 ) );
+}
+
+/* Validates an access control list stored in a byte string
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_validate_access_control_list(
+           PyObject *self PYFWNT_ATTRIBUTE_UNUSED,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PYFWNT_UNREFERENCED_PARAMETER( self )
+
+	return( pyfwnt_validate_data(
+	         arguments,
+	         keywords,
+	         1 ) );
+}
+
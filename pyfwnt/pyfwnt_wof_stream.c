@@ -0,0 +1,1009 @@
+/*
+ * Python object wrapper of libfwnt_wof_stream_t
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( HAVE_WINAPI )
+#include <stdlib.h>
+#endif
+
+#include "pyfwnt_error.h"
+#include "pyfwnt_integer.h"
+#include "pyfwnt_libcerror.h"
+#include "pyfwnt_libfwnt.h"
+#include "pyfwnt_python.h"
+#include "pyfwnt_unused.h"
+#include "pyfwnt_wof_stream.h"
+
+PyMethodDef pyfwnt_wof_stream_object_methods[] = {
+
+	{ "set_compressed_data",
+	  (PyCFunction) pyfwnt_wof_stream_set_compressed_data,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "set_compressed_data(compressed_data, uncompressed_data_size, compression_method=0)\n"
+	  "\n"
+	  "Sets the WofCompressedData stream. The compressed data can be any object that supports\n"
+	  "the buffer interface, such as a byte string or a memory mapped file, and is referenced,\n"
+	  "not copied. The compression method is 0 (XPRESS4K), 2 (XPRESS8K) or 3 (XPRESS16K)." },
+
+	{ "set_maximum_number_of_cached_chunks",
+	  (PyCFunction) pyfwnt_wof_stream_set_maximum_number_of_cached_chunks,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "set_maximum_number_of_cached_chunks(maximum_number_of_cached_chunks)\n"
+	  "\n"
+	  "Sets the maximum number of decompressed chunks that are cached." },
+
+	{ "set_number_of_threads",
+	  (PyCFunction) pyfwnt_wof_stream_set_number_of_threads,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "set_number_of_threads(number_of_threads)\n"
+	  "\n"
+	  "Sets the number of threads used to decompress the chunks of large reads." },
+
+	/* Functions to access the data */
+
+	{ "read_buffer",
+	  (PyCFunction) pyfwnt_wof_stream_read_buffer,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "read_buffer(size) -> String\n"
+	  "\n"
+	  "Reads a buffer of uncompressed data." },
+
+	{ "read_buffer_at_offset",
+	  (PyCFunction) pyfwnt_wof_stream_read_buffer_at_offset,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "read_buffer_at_offset(size, offset) -> String\n"
+	  "\n"
+	  "Reads a buffer of uncompressed data at a specific offset." },
+
+	{ "seek_offset",
+	  (PyCFunction) pyfwnt_wof_stream_seek_offset,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "seek_offset(offset, whence) -> None\n"
+	  "\n"
+	  "Seeks an offset within the uncompressed data." },
+
+	{ "get_offset",
+	  (PyCFunction) pyfwnt_wof_stream_get_offset,
+	  METH_NOARGS,
+	  "get_offset() -> Integer\n"
+	  "\n"
+	  "Retrieves the current offset within the uncompressed data." },
+
+	/* Some Pythonesque aliases */
+
+	{ "read",
+	  (PyCFunction) pyfwnt_wof_stream_read_buffer,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "read(size) -> String\n"
+	  "\n"
+	  "Reads a buffer of uncompressed data." },
+
+	{ "seek",
+	  (PyCFunction) pyfwnt_wof_stream_seek_offset,
+	  METH_VARARGS | METH_KEYWORDS,
+	  "seek(offset, whence) -> None\n"
+	  "\n"
+	  "Seeks an offset within the uncompressed data." },
+
+	{ "tell",
+	  (PyCFunction) pyfwnt_wof_stream_get_offset,
+	  METH_NOARGS,
+	  "tell() -> Integer\n"
+	  "\n"
+	  "Retrieves the current offset within the uncompressed data." },
+
+	/* Functions to access the metadata */
+
+	{ "get_size",
+	  (PyCFunction) pyfwnt_wof_stream_get_size,
+	  METH_NOARGS,
+	  "get_size() -> Integer\n"
+	  "\n"
+	  "Retrieves the size of the uncompressed data." },
+
+	/* Sentinel */
+	{ NULL, NULL, 0, NULL }
+};
+
+PyGetSetDef pyfwnt_wof_stream_object_get_set_definitions[] = {
+
+	{ "size",
+	  (getter) pyfwnt_wof_stream_get_size,
+	  (setter) 0,
+	  "The size of the uncompressed data.",
+	  NULL },
+
+	/* Sentinel */
+	{ NULL, NULL, NULL, NULL, NULL }
+};
+
+PyTypeObject pyfwnt_wof_stream_type_object = {
+	PyVarObject_HEAD_INIT( NULL, 0 )
+
+	/* tp_name */
+	"pyfwnt.wof_stream",
+	/* tp_basicsize */
+	sizeof( pyfwnt_wof_stream_t ),
+	/* tp_itemsize */
+	0,
+	/* tp_dealloc */
+	(destructor) pyfwnt_wof_stream_free,
+	/* tp_print */
+	0,
+	/* tp_getattr */
+	0,
+	/* tp_setattr */
+	0,
+	/* tp_compare */
+	0,
+	/* tp_repr */
+	0,
+	/* tp_as_number */
+	0,
+	/* tp_as_sequence */
+	0,
+	/* tp_as_mapping */
+	0,
+	/* tp_hash */
+	0,
+	/* tp_call */
+	0,
+	/* tp_str */
+	0,
+	/* tp_getattro */
+	0,
+	/* tp_setattro */
+	0,
+	/* tp_as_buffer */
+	0,
+	/* tp_flags */
+	Py_TPFLAGS_DEFAULT,
+	/* tp_doc */
+	"pyfwnt WOF stream object (wraps libfwnt_wof_stream_t)",
+	/* tp_traverse */
+	0,
+	/* tp_clear */
+	0,
+	/* tp_richcompare */
+	0,
+	/* tp_weaklistoffset */
+	0,
+	/* tp_iter */
+	0,
+	/* tp_iternext */
+	0,
+	/* tp_methods */
+	pyfwnt_wof_stream_object_methods,
+	/* tp_members */
+	0,
+	/* tp_getset */
+	pyfwnt_wof_stream_object_get_set_definitions,
+	/* tp_base */
+	0,
+	/* tp_dict */
+	0,
+	/* tp_descr_get */
+	0,
+	/* tp_descr_set */
+	0,
+	/* tp_dictoffset */
+	0,
+	/* tp_init */
+	(initproc) pyfwnt_wof_stream_init,
+	/* tp_alloc */
+	0,
+	/* tp_new */
+	0,
+	/* tp_free */
+	0,
+	/* tp_is_gc */
+	0,
+	/* tp_bases */
+	NULL,
+	/* tp_mro */
+	NULL,
+	/* tp_cache */
+	NULL,
+	/* tp_subclasses */
+	NULL,
+	/* tp_weaklist */
+	NULL,
+	/* tp_del */
+	0
+};
+
+/* Intializes a WOF stream object
+ * Returns 0 if successful or -1 on error
+ */
+int pyfwnt_wof_stream_init(
+     pyfwnt_wof_stream_t *pyfwnt_wof_stream )
+{
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyfwnt_wof_stream_init";
+
+	if( pyfwnt_wof_stream == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( -1 );
+	}
+	/* Make sure libfwnt WOF stream is set to NULL
+	 */
+	pyfwnt_wof_stream->wof_stream             = NULL;
+	pyfwnt_wof_stream->compressed_data_object = NULL;
+
+	if( libfwnt_wof_stream_initialize(
+	     &( pyfwnt_wof_stream->wof_stream ),
+	     &error ) != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_MemoryError,
+		 "%s: unable to initialize WOF stream.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( -1 );
+	}
+	return( 0 );
+}
+
+/* Frees a WOF stream object
+ */
+void pyfwnt_wof_stream_free(
+      pyfwnt_wof_stream_t *pyfwnt_wof_stream )
+{
+	libcerror_error_t *error    = NULL;
+	struct _typeobject *ob_type = NULL;
+	static char *function       = "pyfwnt_wof_stream_free";
+	int result                  = 0;
+
+	if( pyfwnt_wof_stream == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return;
+	}
+	if( pyfwnt_wof_stream->wof_stream == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid WOF stream - missing libfwnt WOF stream.",
+		 function );
+
+		return;
+	}
+	ob_type = Py_TYPE(
+	           pyfwnt_wof_stream );
+
+	if( ob_type == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: missing ob_type.",
+		 function );
+
+		return;
+	}
+	if( ob_type->tp_free == NULL )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid ob_type - missing tp_free.",
+		 function );
+
+		return;
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_wof_stream_free(
+	          &( pyfwnt_wof_stream->wof_stream ),
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_MemoryError,
+		 "%s: unable to free WOF stream.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+	}
+	/* The compressed data is released after the WOF stream no longer references it
+	 */
+	if( pyfwnt_wof_stream->compressed_data_object != NULL )
+	{
+#if PY_MAJOR_VERSION >= 3
+		PyBuffer_Release(
+		 &( pyfwnt_wof_stream->compressed_data_buffer ) );
+#endif
+		Py_DecRef(
+		 pyfwnt_wof_stream->compressed_data_object );
+
+		pyfwnt_wof_stream->compressed_data_object = NULL;
+	}
+	ob_type->tp_free(
+	 (PyObject*) pyfwnt_wof_stream );
+}
+
+/* Sets the compressed data
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_wof_stream_set_compressed_data(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	PyObject *data_object                        = NULL;
+	libcerror_error_t *error                     = NULL;
+	static char *function                        = "pyfwnt_wof_stream_set_compressed_data";
+	static char *keyword_list[]                  = { "compressed_data", "uncompressed_data_size", "compression_method", NULL };
+	const void *compressed_data                  = NULL;
+	unsigned PY_LONG_LONG uncompressed_data_size = 0;
+	Py_ssize_t compressed_data_size              = 0;
+	unsigned long compression_method             = 0;
+	int result                                   = 0;
+
+	if( pyfwnt_wof_stream == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( NULL );
+	}
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "OK|k",
+	     keyword_list,
+	     &data_object,
+	     &uncompressed_data_size,
+	     &compression_method ) == 0 )
+	{
+		return( NULL );
+	}
+	/* The compressed data object is claimed before the GIL is released, so that
+	 * concurrent calls cannot both set the compressed data buffer
+	 */
+	PYFWNT_BEGIN_CRITICAL_SECTION( (PyObject *) pyfwnt_wof_stream )
+
+	if( pyfwnt_wof_stream->compressed_data_object == NULL )
+	{
+		Py_IncRef(
+		 data_object );
+
+		pyfwnt_wof_stream->compressed_data_object = data_object;
+
+		result = 1;
+	}
+	PYFWNT_END_CRITICAL_SECTION
+
+	if( result == 0 )
+	{
+		PyErr_Format(
+		 PyExc_IOError,
+		 "%s: invalid WOF stream - compressed data already set.",
+		 function );
+
+		return( NULL );
+	}
+#if PY_MAJOR_VERSION >= 3
+	if( PyObject_GetBuffer(
+	     data_object,
+	     &( pyfwnt_wof_stream->compressed_data_buffer ),
+	     PyBUF_SIMPLE ) != 0 )
+	{
+		goto on_error;
+	}
+	compressed_data      = pyfwnt_wof_stream->compressed_data_buffer.buf;
+	compressed_data_size = pyfwnt_wof_stream->compressed_data_buffer.len;
+#else
+	if( PyObject_AsReadBuffer(
+	     data_object,
+	     &compressed_data,
+	     &compressed_data_size ) != 0 )
+	{
+		goto on_error;
+	}
+#endif
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_wof_stream_set_compressed_data(
+	          pyfwnt_wof_stream->wof_stream,
+	          (uint8_t *) compressed_data,
+	          (size_t) compressed_data_size,
+	          (size64_t) uncompressed_data_size,
+	          (uint32_t) compression_method,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to set compressed data.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+#if PY_MAJOR_VERSION >= 3
+		PyBuffer_Release(
+		 &( pyfwnt_wof_stream->compressed_data_buffer ) );
+#endif
+		goto on_error;
+	}
+	Py_IncRef(
+	 Py_None );
+
+	return( Py_None );
+
+on_error:
+	PYFWNT_BEGIN_CRITICAL_SECTION( (PyObject *) pyfwnt_wof_stream )
+
+	pyfwnt_wof_stream->compressed_data_object = NULL;
+
+	PYFWNT_END_CRITICAL_SECTION
+
+	Py_DecRef(
+	 data_object );
+
+	return( NULL );
+}
+
+/* Sets the maximum number of cached chunks
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_wof_stream_set_maximum_number_of_cached_chunks(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	libcerror_error_t *error            = NULL;
+	static char *function               = "pyfwnt_wof_stream_set_maximum_number_of_cached_chunks";
+	static char *keyword_list[]         = { "maximum_number_of_cached_chunks", NULL };
+	int maximum_number_of_cached_chunks = 0;
+	int result                          = 0;
+
+	if( pyfwnt_wof_stream == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( NULL );
+	}
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "i",
+	     keyword_list,
+	     &maximum_number_of_cached_chunks ) == 0 )
+	{
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_wof_stream_set_maximum_number_of_cached_chunks(
+	          pyfwnt_wof_stream->wof_stream,
+	          maximum_number_of_cached_chunks,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to set maximum number of cached chunks.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	Py_IncRef(
+	 Py_None );
+
+	return( Py_None );
+}
+
+/* Sets the number of threads
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_wof_stream_set_number_of_threads(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	libcerror_error_t *error    = NULL;
+	static char *function       = "pyfwnt_wof_stream_set_number_of_threads";
+	static char *keyword_list[] = { "number_of_threads", NULL };
+	int number_of_threads       = 0;
+	int result                  = 0;
+
+	if( pyfwnt_wof_stream == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( NULL );
+	}
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "i",
+	     keyword_list,
+	     &number_of_threads ) == 0 )
+	{
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_wof_stream_set_number_of_threads(
+	          pyfwnt_wof_stream->wof_stream,
+	          number_of_threads,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to set number of threads.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	Py_IncRef(
+	 Py_None );
+
+	return( Py_None );
+}
+
+/* Reads uncompressed data at the current offset or at a specific offset
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_wof_stream_read(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           Py_ssize_t read_size,
+           off64_t read_offset,
+           int use_read_offset )
+{
+	PyObject *string_object  = NULL;
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyfwnt_wof_stream_read";
+	char *buffer             = NULL;
+	off64_t current_offset   = 0;
+	size64_t size            = 0;
+	ssize_t read_count       = 0;
+	int result               = 0;
+
+	if( read_size < 0 )
+	{
+		Py_BEGIN_ALLOW_THREADS
+
+		result = libfwnt_wof_stream_get_size(
+		          pyfwnt_wof_stream->wof_stream,
+		          &size,
+		          &error );
+
+		if( ( result == 1 )
+		 && ( use_read_offset == 0 ) )
+		{
+			result = libfwnt_wof_stream_get_offset(
+			          pyfwnt_wof_stream->wof_stream,
+			          &current_offset,
+			          &error );
+		}
+		Py_END_ALLOW_THREADS
+
+		if( result != 1 )
+		{
+			pyfwnt_error_raise(
+			 error,
+			 PyExc_IOError,
+			 "%s: unable to retrieve size.",
+			 function );
+
+			libcerror_error_free(
+			 &error );
+
+			return( NULL );
+		}
+		if( use_read_offset != 0 )
+		{
+			current_offset = read_offset;
+		}
+		if( ( current_offset < 0 )
+		 || ( (size64_t) current_offset >= size ) )
+		{
+			read_size = 0;
+		}
+		else if( ( size - current_offset ) > (size64_t) SSIZE_MAX )
+		{
+			PyErr_Format(
+			 PyExc_ValueError,
+			 "%s: invalid read size value exceeds maximum.",
+			 function );
+
+			return( NULL );
+		}
+		else
+		{
+			read_size = (Py_ssize_t) ( size - current_offset );
+		}
+	}
+#if PY_MAJOR_VERSION >= 3
+	string_object = PyBytes_FromStringAndSize(
+	                 NULL,
+	                 read_size );
+#else
+	string_object = PyString_FromStringAndSize(
+	                 NULL,
+	                 read_size );
+#endif
+	if( string_object == NULL )
+	{
+		PyErr_Format(
+		 PyExc_MemoryError,
+		 "%s: unable to create buffer.",
+		 function );
+
+		return( NULL );
+	}
+	if( read_size == 0 )
+	{
+		return( string_object );
+	}
+#if PY_MAJOR_VERSION >= 3
+	buffer = PyBytes_AsString(
+	          string_object );
+#else
+	buffer = PyString_AsString(
+	          string_object );
+#endif
+	Py_BEGIN_ALLOW_THREADS
+
+	if( use_read_offset == 0 )
+	{
+		read_count = libfwnt_wof_stream_read_buffer(
+		              pyfwnt_wof_stream->wof_stream,
+		              (uint8_t *) buffer,
+		              (size_t) read_size,
+		              &error );
+	}
+	else
+	{
+		read_count = libfwnt_wof_stream_read_buffer_at_offset(
+		              pyfwnt_wof_stream->wof_stream,
+		              (uint8_t *) buffer,
+		              (size_t) read_size,
+		              read_offset,
+		              &error );
+	}
+	Py_END_ALLOW_THREADS
+
+	if( read_count == -1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to read data.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		Py_DecRef(
+		 string_object );
+
+		return( NULL );
+	}
+#if PY_MAJOR_VERSION >= 3
+	if( _PyBytes_Resize(
+	     &string_object,
+	     (Py_ssize_t) read_count ) != 0 )
+#else
+	if( _PyString_Resize(
+	     &string_object,
+	     (Py_ssize_t) read_count ) != 0 )
+#endif
+	{
+		return( NULL );
+	}
+	return( string_object );
+}
+
+/* Reads uncompressed data at the current offset
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_wof_stream_read_buffer(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	static char *function       = "pyfwnt_wof_stream_read_buffer";
+	static char *keyword_list[] = { "size", NULL };
+	Py_ssize_t read_size        = -1;
+
+	if( pyfwnt_wof_stream == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( NULL );
+	}
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "|n",
+	     keyword_list,
+	     &read_size ) == 0 )
+	{
+		return( NULL );
+	}
+	return( pyfwnt_wof_stream_read(
+	         pyfwnt_wof_stream,
+	         read_size,
+	         0,
+	         0 ) );
+}
+
+/* Reads uncompressed data at a specific offset
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_wof_stream_read_buffer_at_offset(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	static char *function       = "pyfwnt_wof_stream_read_buffer_at_offset";
+	static char *keyword_list[] = { "size", "offset", NULL };
+	PY_LONG_LONG read_offset    = 0;
+	Py_ssize_t read_size        = 0;
+
+	if( pyfwnt_wof_stream == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( NULL );
+	}
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "nL",
+	     keyword_list,
+	     &read_size,
+	     &read_offset ) == 0 )
+	{
+		return( NULL );
+	}
+	if( read_offset < 0 )
+	{
+		PyErr_Format(
+		 PyExc_ValueError,
+		 "%s: invalid read offset value less than zero.",
+		 function );
+
+		return( NULL );
+	}
+	return( pyfwnt_wof_stream_read(
+	         pyfwnt_wof_stream,
+	         read_size,
+	         (off64_t) read_offset,
+	         1 ) );
+}
+
+/* Seeks a certain offset in the uncompressed data
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_wof_stream_seek_offset(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           PyObject *arguments,
+           PyObject *keywords )
+{
+	libcerror_error_t *error    = NULL;
+	static char *function       = "pyfwnt_wof_stream_seek_offset";
+	static char *keyword_list[] = { "offset", "whence", NULL };
+	PY_LONG_LONG offset         = 0;
+	off64_t result_offset       = 0;
+	int whence                  = 0;
+
+	if( pyfwnt_wof_stream == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( NULL );
+	}
+	if( PyArg_ParseTupleAndKeywords(
+	     arguments,
+	     keywords,
+	     "L|i",
+	     keyword_list,
+	     &offset,
+	     &whence ) == 0 )
+	{
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result_offset = libfwnt_wof_stream_seek_offset(
+	                 pyfwnt_wof_stream->wof_stream,
+	                 (off64_t) offset,
+	                 whence,
+	                 &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result_offset == -1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to seek offset.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	Py_IncRef(
+	 Py_None );
+
+	return( Py_None );
+}
+
+/* Retrieves the current offset in the uncompressed data
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_wof_stream_get_offset(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           PyObject *arguments PYFWNT_ATTRIBUTE_UNUSED )
+{
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyfwnt_wof_stream_get_offset";
+	off64_t current_offset   = 0;
+	int result               = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyfwnt_wof_stream == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_wof_stream_get_offset(
+	          pyfwnt_wof_stream->wof_stream,
+	          &current_offset,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve offset.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	return( pyfwnt_integer_signed_new_from_64bit(
+	         (int64_t) current_offset ) );
+}
+
+/* Retrieves the size of the uncompressed data
+ * Returns a Python object if successful or NULL on error
+ */
+PyObject *pyfwnt_wof_stream_get_size(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           PyObject *arguments PYFWNT_ATTRIBUTE_UNUSED )
+{
+	libcerror_error_t *error = NULL;
+	static char *function    = "pyfwnt_wof_stream_get_size";
+	size64_t size            = 0;
+	int result               = 0;
+
+	PYFWNT_UNREFERENCED_PARAMETER( arguments )
+
+	if( pyfwnt_wof_stream == NULL )
+	{
+		PyErr_Format(
+		 PyExc_TypeError,
+		 "%s: invalid WOF stream.",
+		 function );
+
+		return( NULL );
+	}
+	Py_BEGIN_ALLOW_THREADS
+
+	result = libfwnt_wof_stream_get_size(
+	          pyfwnt_wof_stream->wof_stream,
+	          &size,
+	          &error );
+
+	Py_END_ALLOW_THREADS
+
+	if( result != 1 )
+	{
+		pyfwnt_error_raise(
+		 error,
+		 PyExc_IOError,
+		 "%s: unable to retrieve size.",
+		 function );
+
+		libcerror_error_free(
+		 &error );
+
+		return( NULL );
+	}
+	return( pyfwnt_integer_unsigned_new_from_64bit(
+	         (uint64_t) size ) );
+}
+
@@ -0,0 +1,118 @@
+/*
+ * Python object wrapper of libfwnt_wof_stream_t
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#if !defined( _PYFWNT_WOF_STREAM_H )
+#define _PYFWNT_WOF_STREAM_H
+
+#include <common.h>
+#include <types.h>
+
+#include "pyfwnt_libcerror.h"
+#include "pyfwnt_libfwnt.h"
+#include "pyfwnt_python.h"
+
+#if defined( __cplusplus )
+extern "C" {
+#endif
+
+typedef struct pyfwnt_wof_stream pyfwnt_wof_stream_t;
+
+struct pyfwnt_wof_stream
+{
+	/* Python object initialization
+	 */
+	PyObject_HEAD
+
+	/* The libfwnt WOF stream
+	 */
+	libfwnt_wof_stream_t *wof_stream;
+
+	/* The compressed data object, which is referenced while the WOF stream
+	 * reads from its data
+	 */
+	PyObject *compressed_data_object;
+
+#if PY_MAJOR_VERSION >= 3
+	/* The compressed data buffer
+	 */
+	Py_buffer compressed_data_buffer;
+#endif
+};
+
+extern PyMethodDef pyfwnt_wof_stream_object_methods[];
+extern PyTypeObject pyfwnt_wof_stream_type_object;
+
+int pyfwnt_wof_stream_init(
+     pyfwnt_wof_stream_t *pyfwnt_wof_stream );
+
+void pyfwnt_wof_stream_free(
+      pyfwnt_wof_stream_t *pyfwnt_wof_stream );
+
+PyObject *pyfwnt_wof_stream_set_compressed_data(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_wof_stream_set_maximum_number_of_cached_chunks(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_wof_stream_set_number_of_threads(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_wof_stream_read(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           Py_ssize_t read_size,
+           off64_t read_offset,
+           int use_read_offset );
+
+PyObject *pyfwnt_wof_stream_read_buffer(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_wof_stream_read_buffer_at_offset(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_wof_stream_seek_offset(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           PyObject *arguments,
+           PyObject *keywords );
+
+PyObject *pyfwnt_wof_stream_get_offset(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           PyObject *arguments );
+
+PyObject *pyfwnt_wof_stream_get_size(
+           pyfwnt_wof_stream_t *pyfwnt_wof_stream,
+           PyObject *arguments );
+
+#if defined( __cplusplus )
+}
+#endif
+
+#endif /* !defined( _PYFWNT_WOF_STREAM_H ) */
+
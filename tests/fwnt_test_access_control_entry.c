@@ -21,6 +21,7 @@
 
 #include <common.h>
 #include <file_stream.h>
+#include <memory.h>
 #include <types.h>
 
 #if defined( HAVE_STDLIB_H ) || defined( WINAPI )
@@ -39,6 +40,12 @@ uint8_t fwnt_test_access_control_entry_byte_stream[ 20 ] = {
 	0x00, 0x00, 0x14, 0x00, 0x9f, 0x01, 0x12, 0x00, 0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05,
 	0x12, 0x00, 0x00, 0x00 };
 
+uint8_t fwnt_test_access_control_entry_object_byte_stream[ 60 ] = {
+	0x0b, 0x00, 0x3c, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x72, 0x96, 0x99, 0x00,
+	0x62, 0xc4, 0xd0, 0x11, 0xa7, 0x85, 0x00, 0xaa, 0x00, 0x3d, 0xa4, 0x5b, 0x14, 0xcc, 0x28, 0x48,
+	0x37, 0x14, 0xbc, 0x45, 0x9b, 0x07, 0xad, 0x6f, 0x01, 0x5e, 0x5f, 0x28, 0x01, 0x01, 0x00, 0x00,
+	0x00, 0x00, 0x00, 0x05, 0x12, 0x00, 0x00, 0x00, 0x61, 0x72, 0x74, 0x78 };
+
 #if defined( __GNUC__ )
 
 /* Tests the libfwnt_access_control_entry_initialize function
@@ -1005,56 +1012,838 @@ on_error:
 	return( 0 );
 }
 
-#endif /* defined( __GNUC__ ) */
-
-/* The main program
+/* Tests the libfwnt_access_control_entry_get_object_type and libfwnt_access_control_entry_get_inherited_object_type functions
+ * Returns 1 if successful or 0 if not
  */
-#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
-int wmain(
-     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
-     wchar_t * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
-#else
-int main(
-     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
-     char * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
-#endif
+int fwnt_test_access_control_entry_get_object_type(
+     void )
 {
-	FWNT_TEST_UNREFERENCED_PARAMETER( argc )
-	FWNT_TEST_UNREFERENCED_PARAMETER( argv )
+	uint8_t guid_data[ 16 ];
 
-#if defined( __GNUC__ )
+	libcerror_error_t *error                             = NULL;
+	libfwnt_access_control_entry_t *access_control_entry = NULL;
+	libfwnt_security_identifier_t *security_identifier   = NULL;
+	uint32_t object_flags                                = 0;
+	int result                                           = 0;
 
-	FWNT_TEST_RUN(
-	 "libfwnt_access_control_entry_initialize",
-	 fwnt_test_access_control_entry_initialize );
+	/* Initialize test
+	 */
+	result = libfwnt_access_control_entry_initialize(
+	          &access_control_entry,
+	          &error );
 
-#endif /* defined( __GNUC__ ) */
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
 
-	FWNT_TEST_RUN(
-	 "libfwnt_access_control_entry_free",
-	 fwnt_test_access_control_entry_free );
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "access_control_entry",
+	 access_control_entry );
 
-#if defined( __GNUC__ )
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
 
-	FWNT_TEST_RUN(
-	 "libfwnt_access_control_entry_copy_from_byte_stream",
-	 fwnt_test_access_control_entry_copy_from_byte_stream );
+	result = libfwnt_access_control_entry_copy_from_byte_stream(
+	          access_control_entry,
+	          fwnt_test_access_control_entry_object_byte_stream,
+	          60,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
 
-	FWNT_TEST_RUN(
-	 "libfwnt_access_control_entry_get_type",
-	 fwnt_test_access_control_entry_get_type );
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
 
-	FWNT_TEST_RUN(
-	 "libfwnt_access_control_entry_get_flags",
-	 fwnt_test_access_control_entry_get_flags );
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
 
-	FWNT_TEST_RUN(
-	 "libfwnt_access_control_entry_get_access_mask",
-	 fwnt_test_access_control_entry_get_access_mask );
+	/* Test regular cases
+	 */
+	result = libfwnt_access_control_entry_get_object_flags(
+	          access_control_entry,
+	          &object_flags,
+	          &error );
 
-	FWNT_TEST_RUN(
-	 "libfwnt_access_control_entry_get_security_identifier",
-	 fwnt_test_access_control_entry_get_security_identifier );
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT32(
+	 "object_flags",
+	 object_flags,
+	 (uint32_t) 0x00000003UL );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_entry_get_object_type(
+	          access_control_entry,
+	          guid_data,
+	          16,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = memory_compare(
+	          guid_data,
+	          &( fwnt_test_access_control_entry_object_byte_stream[ 12 ] ),
+	          16 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	result = libfwnt_access_control_entry_get_inherited_object_type(
+	          access_control_entry,
+	          guid_data,
+	          16,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = memory_compare(
+	          guid_data,
+	          &( fwnt_test_access_control_entry_object_byte_stream[ 28 ] ),
+	          16 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* The security identifier follows the object type GUIDs
+	 */
+	result = libfwnt_access_control_entry_get_security_identifier(
+	          access_control_entry,
+	          &security_identifier,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "number_of_sub_authorities",
+	 (int) ( (libfwnt_internal_security_identifier_t *) security_identifier )->number_of_sub_authorities,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT32(
+	 "sub_authority[ 0 ]",
+	 ( (libfwnt_internal_security_identifier_t *) security_identifier )->sub_authority[ 0 ],
+	 (uint32_t) 18 );
+
+	result = libfwnt_security_identifier_free(
+	          &security_identifier,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_access_control_entry_get_object_type(
+	          NULL,
+	          guid_data,
+	          16,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_entry_get_object_type(
+	          access_control_entry,
+	          NULL,
+	          16,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_entry_get_object_type(
+	          access_control_entry,
+	          guid_data,
+	          8,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_entry_get_object_flags(
+	          access_control_entry,
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libfwnt_internal_access_control_entry_free(
+	          (libfwnt_internal_access_control_entry_t **) &access_control_entry,
+	          NULL );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	/* Test an entry without object type GUIDs
+	 */
+	result = libfwnt_access_control_entry_initialize(
+	          &access_control_entry,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_entry_copy_from_byte_stream(
+	          access_control_entry,
+	          fwnt_test_access_control_entry_byte_stream,
+	          20,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_entry_get_object_flags(
+	          access_control_entry,
+	          &object_flags,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_entry_get_object_type(
+	          access_control_entry,
+	          guid_data,
+	          16,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_internal_access_control_entry_free(
+	          (libfwnt_internal_access_control_entry_t **) &access_control_entry,
+	          NULL );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "access_control_entry",
+	 access_control_entry );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( access_control_entry != NULL )
+	{
+		libfwnt_internal_access_control_entry_free(
+		 (libfwnt_internal_access_control_entry_t **) &access_control_entry,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_access_control_entry_get_application_data_size and libfwnt_access_control_entry_get_application_data functions
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_access_control_entry_get_application_data(
+     void )
+{
+	uint8_t data[ 16 ];
+
+	libcerror_error_t *error                             = NULL;
+	libfwnt_access_control_entry_t *access_control_entry = NULL;
+	size_t data_size                                     = 0;
+	int result                                           = 0;
+
+	/* Initialize test
+	 */
+	result = libfwnt_access_control_entry_initialize(
+	          &access_control_entry,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "access_control_entry",
+	 access_control_entry );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_entry_copy_from_byte_stream(
+	          access_control_entry,
+	          fwnt_test_access_control_entry_object_byte_stream,
+	          60,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test regular cases
+	 */
+	result = libfwnt_access_control_entry_get_application_data_size(
+	          access_control_entry,
+	          &data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "data_size",
+	 data_size,
+	 (size_t) 4 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_entry_get_application_data(
+	          access_control_entry,
+	          data,
+	          16,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = memory_compare(
+	          data,
+	          &( fwnt_test_access_control_entry_object_byte_stream[ 56 ] ),
+	          4 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* Test error cases
+	 */
+	result = libfwnt_access_control_entry_get_application_data_size(
+	          NULL,
+	          &data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_entry_get_application_data_size(
+	          access_control_entry,
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_entry_get_application_data(
+	          access_control_entry,
+	          NULL,
+	          16,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_entry_get_application_data(
+	          access_control_entry,
+	          data,
+	          2,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libfwnt_internal_access_control_entry_free(
+	          (libfwnt_internal_access_control_entry_t **) &access_control_entry,
+	          NULL );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "access_control_entry",
+	 access_control_entry );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( access_control_entry != NULL )
+	{
+		libfwnt_internal_access_control_entry_free(
+		 (libfwnt_internal_access_control_entry_t **) &access_control_entry,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_access_control_entry_copy_to_byte_stream function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_access_control_entry_copy_to_byte_stream(
+     void )
+{
+	uint8_t byte_stream[ 64 ];
+
+	libcerror_error_t *error                             = NULL;
+	libfwnt_access_control_entry_t *access_control_entry = NULL;
+	size_t byte_stream_size                              = 0;
+	int result                                           = 0;
+
+	/* Initialize test
+	 */
+	result = libfwnt_access_control_entry_initialize(
+	          &access_control_entry,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "access_control_entry",
+	 access_control_entry );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_entry_copy_from_byte_stream(
+	          access_control_entry,
+	          fwnt_test_access_control_entry_object_byte_stream,
+	          60,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test regular cases
+	 */
+	result = libfwnt_access_control_entry_get_byte_stream_size(
+	          access_control_entry,
+	          &byte_stream_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "byte_stream_size",
+	 byte_stream_size,
+	 (size_t) 60 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_entry_copy_to_byte_stream(
+	          access_control_entry,
+	          byte_stream,
+	          64,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = memory_compare(
+	          byte_stream,
+	          fwnt_test_access_control_entry_object_byte_stream,
+	          60 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* Test error cases
+	 */
+	result = libfwnt_access_control_entry_get_byte_stream_size(
+	          NULL,
+	          &byte_stream_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_entry_get_byte_stream_size(
+	          access_control_entry,
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_entry_copy_to_byte_stream(
+	          NULL,
+	          byte_stream,
+	          64,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_entry_copy_to_byte_stream(
+	          access_control_entry,
+	          NULL,
+	          64,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_entry_copy_to_byte_stream(
+	          access_control_entry,
+	          byte_stream,
+	          59,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_entry_copy_to_byte_stream(
+	          access_control_entry,
+	          byte_stream,
+	          64,
+	          -1,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libfwnt_internal_access_control_entry_free(
+	          (libfwnt_internal_access_control_entry_t **) &access_control_entry,
+	          NULL );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "access_control_entry",
+	 access_control_entry );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( access_control_entry != NULL )
+	{
+		libfwnt_internal_access_control_entry_free(
+		 (libfwnt_internal_access_control_entry_t **) &access_control_entry,
+		 NULL );
+	}
+	return( 0 );
+}
+
+#endif /* defined( __GNUC__ ) */
+
+/* The main program
+ */
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+int wmain(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     wchar_t * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#else
+int main(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     char * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#endif
+{
+	FWNT_TEST_UNREFERENCED_PARAMETER( argc )
+	FWNT_TEST_UNREFERENCED_PARAMETER( argv )
+
+#if defined( __GNUC__ )
+
+	FWNT_TEST_RUN(
+	 "libfwnt_access_control_entry_initialize",
+	 fwnt_test_access_control_entry_initialize );
+
+#endif /* defined( __GNUC__ ) */
+
+	FWNT_TEST_RUN(
+	 "libfwnt_access_control_entry_free",
+	 fwnt_test_access_control_entry_free );
+
+#if defined( __GNUC__ )
+
+	FWNT_TEST_RUN(
+	 "libfwnt_access_control_entry_copy_from_byte_stream",
+	 fwnt_test_access_control_entry_copy_from_byte_stream );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_access_control_entry_get_type",
+	 fwnt_test_access_control_entry_get_type );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_access_control_entry_get_flags",
+	 fwnt_test_access_control_entry_get_flags );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_access_control_entry_get_access_mask",
+	 fwnt_test_access_control_entry_get_access_mask );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_access_control_entry_get_security_identifier",
+	 fwnt_test_access_control_entry_get_security_identifier );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_access_control_entry_get_object_type",
+	 fwnt_test_access_control_entry_get_object_type );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_access_control_entry_get_application_data",
+	 fwnt_test_access_control_entry_get_application_data );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_access_control_entry_copy_to_byte_stream",
+	 fwnt_test_access_control_entry_copy_to_byte_stream );
 
 #endif /* defined( __GNUC__ ) */
 
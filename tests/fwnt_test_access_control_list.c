@@ -21,6 +21,7 @@
 
 #include <common.h>
 #include <file_stream.h>
+#include <memory.h>
 #include <types.h>
 
 #if defined( HAVE_STDLIB_H ) || defined( WINAPI )
@@ -41,6 +42,12 @@ uint8_t fwnt_test_access_control_list_byte_stream[ 52 ] = {
 	0x9f, 0x01, 0x12, 0x00, 0x01, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x20, 0x00, 0x00, 0x00,
 	0x20, 0x02, 0x00, 0x00 };
 
+uint8_t fwnt_test_access_control_list_object_entry_byte_stream[ 60 ] = {
+	0x0b, 0x00, 0x3c, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x72, 0x96, 0x99, 0x00,
+	0x62, 0xc4, 0xd0, 0x11, 0xa7, 0x85, 0x00, 0xaa, 0x00, 0x3d, 0xa4, 0x5b, 0x14, 0xcc, 0x28, 0x48,
+	0x37, 0x14, 0xbc, 0x45, 0x9b, 0x07, 0xad, 0x6f, 0x01, 0x5e, 0x5f, 0x28, 0x01, 0x01, 0x00, 0x00,
+	0x00, 0x00, 0x00, 0x05, 0x12, 0x00, 0x00, 0x00, 0x61, 0x72, 0x74, 0x78 };
+
 #if defined( __GNUC__ )
 
 /* Tests the libfwnt_access_control_list_initialize function
@@ -764,6 +771,580 @@ on_error:
 	return( 0 );
 }
 
+/* Tests the libfwnt_access_control_list_copy_to_byte_stream function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_access_control_list_copy_to_byte_stream(
+     void )
+{
+	uint8_t byte_stream[ 64 ];
+
+	libcerror_error_t *error                           = NULL;
+	libfwnt_access_control_list_t *access_control_list = NULL;
+	size_t byte_stream_size                            = 0;
+	int result                                         = 0;
+
+	/* Initialize test
+	 */
+	result = libfwnt_access_control_list_initialize(
+	          &access_control_list,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "access_control_list",
+	 access_control_list );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test an empty access control list
+	 */
+	result = libfwnt_access_control_list_copy_to_byte_stream(
+	          access_control_list,
+	          byte_stream,
+	          64,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = memory_compare(
+	          byte_stream,
+	          "\x02\x00\x08\x00\x00\x00\x00\x00",
+	          8 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	result = libfwnt_access_control_list_copy_from_byte_stream(
+	          access_control_list,
+	          fwnt_test_access_control_list_byte_stream,
+	          52,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test regular cases
+	 */
+	result = libfwnt_access_control_list_get_byte_stream_size(
+	          access_control_list,
+	          &byte_stream_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "byte_stream_size",
+	 byte_stream_size,
+	 (size_t) 52 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_list_copy_to_byte_stream(
+	          access_control_list,
+	          byte_stream,
+	          64,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = memory_compare(
+	          byte_stream,
+	          fwnt_test_access_control_list_byte_stream,
+	          52 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* Test error cases
+	 */
+	result = libfwnt_access_control_list_get_byte_stream_size(
+	          NULL,
+	          &byte_stream_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_list_copy_to_byte_stream(
+	          NULL,
+	          byte_stream,
+	          64,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_list_copy_to_byte_stream(
+	          access_control_list,
+	          NULL,
+	          64,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_list_copy_to_byte_stream(
+	          access_control_list,
+	          byte_stream,
+	          51,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libfwnt_access_control_list_free(
+	          &access_control_list,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "access_control_list",
+	 access_control_list );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( access_control_list != NULL )
+	{
+		libfwnt_access_control_list_free(
+		 &access_control_list,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_access_control_list_insert_entry_from_byte_stream and
+ * libfwnt_access_control_list_remove_entry functions
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_access_control_list_insert_entry_from_byte_stream(
+     void )
+{
+	uint8_t byte_stream[ 128 ];
+
+	libcerror_error_t *error                           = NULL;
+	libfwnt_access_control_list_t *access_control_list = NULL;
+	size_t byte_stream_size                            = 0;
+	int number_of_entries                              = 0;
+	int result                                         = 0;
+
+	/* Initialize test
+	 */
+	result = libfwnt_access_control_list_initialize(
+	          &access_control_list,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "access_control_list",
+	 access_control_list );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_list_set_byte_stream(
+	          access_control_list,
+	          fwnt_test_access_control_list_byte_stream,
+	          52,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test inserting an object entry between the entries of a list parsed on demand
+	 */
+	result = libfwnt_access_control_list_insert_entry_from_byte_stream(
+	          access_control_list,
+	          1,
+	          fwnt_test_access_control_list_object_entry_byte_stream,
+	          60,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_list_get_number_of_entries(
+	          access_control_list,
+	          &number_of_entries,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "number_of_entries",
+	 number_of_entries,
+	 3 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_list_get_byte_stream_size(
+	          access_control_list,
+	          &byte_stream_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "byte_stream_size",
+	 byte_stream_size,
+	 (size_t) 112 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_list_copy_to_byte_stream(
+	          access_control_list,
+	          byte_stream,
+	          128,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* An object entry requires revision 4
+	 */
+	result = memory_compare(
+	          byte_stream,
+	          "\x04\x00\x70\x00\x03\x00\x00\x00",
+	          8 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	result = memory_compare(
+	          &( byte_stream[ 8 ] ),
+	          &( fwnt_test_access_control_list_byte_stream[ 8 ] ),
+	          20 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	result = memory_compare(
+	          &( byte_stream[ 28 ] ),
+	          fwnt_test_access_control_list_object_entry_byte_stream,
+	          60 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	result = memory_compare(
+	          &( byte_stream[ 88 ] ),
+	          &( fwnt_test_access_control_list_byte_stream[ 28 ] ),
+	          24 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* Test removing the inserted entry
+	 */
+	result = libfwnt_access_control_list_remove_entry(
+	          access_control_list,
+	          1,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_list_copy_to_byte_stream(
+	          access_control_list,
+	          byte_stream,
+	          128,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = memory_compare(
+	          &( byte_stream[ 1 ] ),
+	          &( fwnt_test_access_control_list_byte_stream[ 1 ] ),
+	          51 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* Test error cases
+	 */
+	result = libfwnt_access_control_list_insert_entry_from_byte_stream(
+	          NULL,
+	          0,
+	          fwnt_test_access_control_list_object_entry_byte_stream,
+	          60,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_list_insert_entry_from_byte_stream(
+	          access_control_list,
+	          3,
+	          fwnt_test_access_control_list_object_entry_byte_stream,
+	          60,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_list_insert_entry_from_byte_stream(
+	          access_control_list,
+	          0,
+	          fwnt_test_access_control_list_object_entry_byte_stream,
+	          32,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_list_remove_entry(
+	          NULL,
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_list_remove_entry(
+	          access_control_list,
+	          2,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libfwnt_access_control_list_free(
+	          &access_control_list,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "access_control_list",
+	 access_control_list );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( access_control_list != NULL )
+	{
+		libfwnt_access_control_list_free(
+		 &access_control_list,
+		 NULL );
+	}
+	return( 0 );
+}
+
 #endif /* defined( __GNUC__ ) */
 
 /* The main program
@@ -807,6 +1388,14 @@ int main(
 	 "libfwnt_access_control_list_get_entry_by_index",
 	 fwnt_test_access_control_list_get_entry_by_index );
 
+	FWNT_TEST_RUN(
+	 "libfwnt_access_control_list_copy_to_byte_stream",
+	 fwnt_test_access_control_list_copy_to_byte_stream );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_access_control_list_insert_entry_from_byte_stream",
+	 fwnt_test_access_control_list_insert_entry_from_byte_stream );
+
 #endif /* defined( __GNUC__ ) */
 
 	return( EXIT_SUCCESS );
@@ -0,0 +1,221 @@
+/*
+ * Library access mask functions testing program
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <file_stream.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+#include "fwnt_test_libcerror.h"
+#include "fwnt_test_libfwnt.h"
+#include "fwnt_test_macros.h"
+#include "fwnt_test_unused.h"
+
+/* The generic mapping of files: FILE_GENERIC_READ, FILE_GENERIC_WRITE,
+ * FILE_GENERIC_EXECUTE and FILE_ALL_ACCESS
+ */
+uint32_t fwnt_test_access_mask_file_generic_mapping[ 4 ] = {
+	0x00120089UL, 0x00120116UL, 0x001200a0UL, 0x001f01ffUL };
+
+/* Tests the libfwnt_access_mask_map_generic_rights function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_access_mask_map_generic_rights(
+     void )
+{
+	uint32_t access_masks[ 6 ] = {
+		0x80000000UL, 0x10000000UL, 0xc0000004UL, 0xa0000000UL, 0x00020000UL, 0x01000000UL };
+
+	libcerror_error_t *error = NULL;
+	int result               = 0;
+
+	/* Test regular cases
+	 */
+	result = libfwnt_access_mask_map_generic_rights(
+	          access_masks,
+	          6,
+	          fwnt_test_access_mask_file_generic_mapping[ 0 ],
+	          fwnt_test_access_mask_file_generic_mapping[ 1 ],
+	          fwnt_test_access_mask_file_generic_mapping[ 2 ],
+	          fwnt_test_access_mask_file_generic_mapping[ 3 ],
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT32(
+	 "access_masks[ 0 ]",
+	 access_masks[ 0 ],
+	 (uint32_t) 0x00120089UL );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT32(
+	 "access_masks[ 1 ]",
+	 access_masks[ 1 ],
+	 (uint32_t) 0x001f01ffUL );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT32(
+	 "access_masks[ 2 ]",
+	 access_masks[ 2 ],
+	 (uint32_t) 0x0012019fUL );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT32(
+	 "access_masks[ 3 ]",
+	 access_masks[ 3 ],
+	 (uint32_t) 0x001200a9UL );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT32(
+	 "access_masks[ 4 ]",
+	 access_masks[ 4 ],
+	 (uint32_t) 0x00020000UL );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT32(
+	 "access_masks[ 5 ]",
+	 access_masks[ 5 ],
+	 (uint32_t) 0x01000000UL );
+
+	/* Mapping access masks without generic rights does not change them
+	 */
+	result = libfwnt_access_mask_map_generic_rights(
+	          access_masks,
+	          6,
+	          0xffffffffUL,
+	          0xffffffffUL,
+	          0xffffffffUL,
+	          0xffffffffUL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT32(
+	 "access_masks[ 1 ]",
+	 access_masks[ 1 ],
+	 (uint32_t) 0x001f01ffUL );
+
+	result = libfwnt_access_mask_map_generic_rights(
+	          access_masks,
+	          0,
+	          fwnt_test_access_mask_file_generic_mapping[ 0 ],
+	          fwnt_test_access_mask_file_generic_mapping[ 1 ],
+	          fwnt_test_access_mask_file_generic_mapping[ 2 ],
+	          fwnt_test_access_mask_file_generic_mapping[ 3 ],
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_access_mask_map_generic_rights(
+	          NULL,
+	          6,
+	          fwnt_test_access_mask_file_generic_mapping[ 0 ],
+	          fwnt_test_access_mask_file_generic_mapping[ 1 ],
+	          fwnt_test_access_mask_file_generic_mapping[ 2 ],
+	          fwnt_test_access_mask_file_generic_mapping[ 3 ],
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_mask_map_generic_rights(
+	          access_masks,
+	          (size_t) SSIZE_MAX,
+	          fwnt_test_access_mask_file_generic_mapping[ 0 ],
+	          fwnt_test_access_mask_file_generic_mapping[ 1 ],
+	          fwnt_test_access_mask_file_generic_mapping[ 2 ],
+	          fwnt_test_access_mask_file_generic_mapping[ 3 ],
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	return( 0 );
+}
+
+/* The main program
+ */
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+int wmain(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     wchar_t * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#else
+int main(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     char * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#endif
+{
+	FWNT_TEST_UNREFERENCED_PARAMETER( argc )
+	FWNT_TEST_UNREFERENCED_PARAMETER( argv )
+
+	FWNT_TEST_RUN(
+	 "libfwnt_access_mask_map_generic_rights",
+	 fwnt_test_access_mask_map_generic_rights );
+
+	return( EXIT_SUCCESS );
+
+on_error:
+	return( EXIT_FAILURE );
+}
+
@@ -0,0 +1,1777 @@
+/*
+ * Library compressed_attribute type test program
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <byte_stream.h>
+#include <file_stream.h>
+#include <memory.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+#include "fwnt_test_libcerror.h"
+#include "fwnt_test_libfwnt.h"
+#include "fwnt_test_macros.h"
+#include "fwnt_test_memory.h"
+#include "fwnt_test_unused.h"
+
+#include "../libfwnt/libfwnt_compressed_attribute.h"
+
+/* The test data consists of 8 compression units of 16 clusters of 512 bytes
+ * of which the last one is partial. Units 2 and 5 are sparse, units 3 and 6
+ * are incompressible and stored uncompressed, the other units are compressed.
+ * The clusters are stored in a volume with a gap between every extent and
+ * the clusters of units 0 and 3 are split over 2 extents
+ */
+#define FWNT_TEST_COMPRESSED_ATTRIBUTE_CLUSTER_SIZE		512
+#define FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE		( 16 * FWNT_TEST_COMPRESSED_ATTRIBUTE_CLUSTER_SIZE )
+#define FWNT_TEST_COMPRESSED_ATTRIBUTE_NUMBER_OF_UNITS		8
+#define FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE		( ( 7 * FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE ) + 3000 )
+#define FWNT_TEST_COMPRESSED_ATTRIBUTE_VOLUME_SIZE		( 2 * FWNT_TEST_COMPRESSED_ATTRIBUTE_NUMBER_OF_UNITS * FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE )
+#define FWNT_TEST_COMPRESSED_ATTRIBUTE_MAXIMUM_NUMBER_OF_EXTENTS	32
+
+uint8_t *fwnt_test_compressed_attribute_uncompressed_data = NULL;
+uint8_t *fwnt_test_compressed_attribute_volume_data       = NULL;
+
+off64_t fwnt_test_compressed_attribute_extent_data_offsets[ FWNT_TEST_COMPRESSED_ATTRIBUTE_MAXIMUM_NUMBER_OF_EXTENTS ];
+size64_t fwnt_test_compressed_attribute_extent_sizes[ FWNT_TEST_COMPRESSED_ATTRIBUTE_MAXIMUM_NUMBER_OF_EXTENTS ];
+uint32_t fwnt_test_compressed_attribute_extent_flags[ FWNT_TEST_COMPRESSED_ATTRIBUTE_MAXIMUM_NUMBER_OF_EXTENTS ];
+int fwnt_test_compressed_attribute_number_of_extents      = 0;
+
+/* Adds an extent to the test data
+ */
+void fwnt_test_compressed_attribute_add_test_extent(
+      off64_t data_offset,
+      size64_t extent_size,
+      uint32_t extent_flags )
+{
+	int extent_index = fwnt_test_compressed_attribute_number_of_extents;
+
+	fwnt_test_compressed_attribute_extent_data_offsets[ extent_index ] = data_offset;
+	fwnt_test_compressed_attribute_extent_sizes[ extent_index ]        = extent_size;
+	fwnt_test_compressed_attribute_extent_flags[ extent_index ]        = extent_flags;
+
+	fwnt_test_compressed_attribute_number_of_extents += 1;
+}
+
+/* Stores clusters in the volume, split over 2 extents if requested
+ * Returns the volume offset that follows the clusters
+ */
+size_t fwnt_test_compressed_attribute_store_clusters(
+        size_t volume_offset,
+        const uint8_t *data,
+        size_t data_size,
+        int split )
+{
+	size_t allocated_size = 0;
+	size_t extent_size    = 0;
+
+	allocated_size = ( ( data_size + FWNT_TEST_COMPRESSED_ATTRIBUTE_CLUSTER_SIZE - 1 ) / FWNT_TEST_COMPRESSED_ATTRIBUTE_CLUSTER_SIZE ) * FWNT_TEST_COMPRESSED_ATTRIBUTE_CLUSTER_SIZE;
+
+	memory_copy(
+	 &( fwnt_test_compressed_attribute_volume_data[ volume_offset ] ),
+	 data,
+	 data_size );
+
+	if( ( split != 0 )
+	 && ( allocated_size > FWNT_TEST_COMPRESSED_ATTRIBUTE_CLUSTER_SIZE ) )
+	{
+		/* Move the remaining clusters behind a gap cluster
+		 */
+		extent_size = FWNT_TEST_COMPRESSED_ATTRIBUTE_CLUSTER_SIZE;
+
+		memory_copy(
+		 &( fwnt_test_compressed_attribute_volume_data[ volume_offset + extent_size + FWNT_TEST_COMPRESSED_ATTRIBUTE_CLUSTER_SIZE ] ),
+		 &( data[ extent_size ] ),
+		 data_size - extent_size );
+
+		memory_set(
+		 &( fwnt_test_compressed_attribute_volume_data[ volume_offset + extent_size ] ),
+		 0xaa,
+		 FWNT_TEST_COMPRESSED_ATTRIBUTE_CLUSTER_SIZE );
+
+		fwnt_test_compressed_attribute_add_test_extent(
+		 (off64_t) volume_offset,
+		 (size64_t) extent_size,
+		 0 );
+
+		volume_offset  += extent_size + FWNT_TEST_COMPRESSED_ATTRIBUTE_CLUSTER_SIZE;
+		allocated_size -= extent_size;
+	}
+	fwnt_test_compressed_attribute_add_test_extent(
+	 (off64_t) volume_offset,
+	 (size64_t) allocated_size,
+	 0 );
+
+	/* Add a gap cluster so that the extents are not contiguous
+	 */
+	volume_offset += allocated_size;
+
+	memory_set(
+	 &( fwnt_test_compressed_attribute_volume_data[ volume_offset ] ),
+	 0xaa,
+	 FWNT_TEST_COMPRESSED_ATTRIBUTE_CLUSTER_SIZE );
+
+	return( volume_offset + FWNT_TEST_COMPRESSED_ATTRIBUTE_CLUSTER_SIZE );
+}
+
+/* Compresses data using a basic LZNT1 compressor
+ * Returns 1 if successful or -1 on error
+ */
+int fwnt_test_compressed_attribute_lznt1_compress(
+     const uint8_t *uncompressed_data,
+     size_t uncompressed_data_size,
+     uint8_t *compressed_data,
+     size_t *compressed_data_size )
+{
+	size_t chunk_data_offset        = 0;
+	size_t chunk_offset             = 0;
+	size_t chunk_size               = 0;
+	size_t compressed_chunk_size    = 0;
+	size_t compressed_data_offset   = 0;
+	size_t flag_byte_offset         = 0;
+	size_t match_offset             = 0;
+	size_t match_size               = 0;
+	size_t maximum_match_offset     = 0;
+	size_t maximum_match_size       = 0;
+	size_t search_offset            = 0;
+	size_t search_size              = 0;
+	uint16_t compression_tuple      = 0;
+	uint16_t offset_shift           = 0;
+	uint8_t flag_bit_index          = 0;
+
+	for( chunk_offset = 0;
+	     chunk_offset < uncompressed_data_size;
+	     chunk_offset += chunk_size )
+	{
+		chunk_size = uncompressed_data_size - chunk_offset;
+
+		if( chunk_size > 4096 )
+		{
+			chunk_size = 4096;
+		}
+		if( ( compressed_data_offset + 2 + chunk_size + ( chunk_size / 8 ) + 1 ) > *compressed_data_size )
+		{
+			return( -1 );
+		}
+		compressed_chunk_size = 2;
+		chunk_data_offset     = 0;
+
+		while( chunk_data_offset < chunk_size )
+		{
+			flag_byte_offset = compressed_data_offset + compressed_chunk_size;
+
+			compressed_data[ flag_byte_offset ] = 0;
+
+			compressed_chunk_size += 1;
+
+			for( flag_bit_index = 0;
+			     ( flag_bit_index < 8 ) && ( chunk_data_offset < chunk_size );
+			     flag_bit_index++ )
+			{
+				/* The number of offset bits depends on the position in the chunk
+				 */
+				offset_shift = 12;
+
+				for( search_size = 16;
+				     chunk_data_offset > search_size;
+				     search_size <<= 1 )
+				{
+					offset_shift -= 1;
+				}
+				maximum_match_offset = (size_t) 1 << ( 16 - offset_shift );
+				maximum_match_size   = ( (size_t) 1 << offset_shift ) + 2;
+
+				if( maximum_match_offset > chunk_data_offset )
+				{
+					maximum_match_offset = chunk_data_offset;
+				}
+				if( maximum_match_offset > 512 )
+				{
+					maximum_match_offset = 512;
+				}
+				match_offset = 0;
+				match_size   = 0;
+
+				for( search_offset = 1;
+				     search_offset <= maximum_match_offset;
+				     search_offset++ )
+				{
+					for( search_size = 0;
+					     ( search_size < maximum_match_size )
+					  && ( ( chunk_data_offset + search_size ) < chunk_size );
+					     search_size++ )
+					{
+						if( uncompressed_data[ chunk_offset + chunk_data_offset + search_size ] != uncompressed_data[ chunk_offset + chunk_data_offset + search_size - search_offset ] )
+						{
+							break;
+						}
+					}
+					if( search_size > match_size )
+					{
+						match_offset = search_offset;
+						match_size   = search_size;
+					}
+				}
+				if( match_size >= 3 )
+				{
+					compression_tuple = (uint16_t) ( ( ( match_offset - 1 ) << offset_shift ) | ( match_size - 3 ) );
+
+					byte_stream_copy_from_uint16_little_endian(
+					 &( compressed_data[ compressed_data_offset + compressed_chunk_size ] ),
+					 compression_tuple );
+
+					compressed_data[ flag_byte_offset ] |= (uint8_t) ( 1 << flag_bit_index );
+
+					compressed_chunk_size += 2;
+					chunk_data_offset     += match_size;
+				}
+				else
+				{
+					compressed_data[ compressed_data_offset + compressed_chunk_size ] = uncompressed_data[ chunk_offset + chunk_data_offset ];
+
+					compressed_chunk_size += 1;
+					chunk_data_offset     += 1;
+				}
+			}
+		}
+		if( ( compressed_chunk_size - 2 ) < chunk_size )
+		{
+			byte_stream_copy_from_uint16_little_endian(
+			 &( compressed_data[ compressed_data_offset ] ),
+			 0xb000 | ( compressed_chunk_size - 3 ) );
+		}
+		else
+		{
+			/* Chunks that do not compress are stored uncompressed
+			 */
+			byte_stream_copy_from_uint16_little_endian(
+			 &( compressed_data[ compressed_data_offset ] ),
+			 0x3000 | ( chunk_size - 1 ) );
+
+			memory_copy(
+			 &( compressed_data[ compressed_data_offset + 2 ] ),
+			 &( uncompressed_data[ chunk_offset ] ),
+			 chunk_size );
+
+			compressed_chunk_size = 2 + chunk_size;
+		}
+		compressed_data_offset += compressed_chunk_size;
+	}
+	*compressed_data_size = compressed_data_offset;
+
+	return( 1 );
+}
+
+/* Creates the uncompressed test data, the volume and the extents of the compressed attribute
+ * Returns 1 if successful or -1 on error
+ */
+int fwnt_test_compressed_attribute_create_test_data(
+     void )
+{
+	uint8_t unit_data[ 2 * FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE ];
+
+	const char *words[ 8 ]          = { "the ", "quick ", "brown ", "fox ", "jumps ", "over ", "lazy ", "dog. " };
+	const char *word                = NULL;
+	size_t allocated_size           = 0;
+	size_t data_offset              = 0;
+	size_t unit_data_size           = 0;
+	size_t unit_offset              = 0;
+	size_t uncompressed_unit_size   = 0;
+	size_t volume_offset            = 0;
+	uint32_t random_value           = 0x12345678UL;
+	int unit_index                  = 0;
+
+	fwnt_test_compressed_attribute_uncompressed_data = (uint8_t *) memory_allocate(
+	                                                                FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE );
+
+	if( fwnt_test_compressed_attribute_uncompressed_data == NULL )
+	{
+		return( -1 );
+	}
+	fwnt_test_compressed_attribute_volume_data = (uint8_t *) memory_allocate(
+	                                                          FWNT_TEST_COMPRESSED_ATTRIBUTE_VOLUME_SIZE );
+
+	if( fwnt_test_compressed_attribute_volume_data == NULL )
+	{
+		return( -1 );
+	}
+	memory_set(
+	 fwnt_test_compressed_attribute_volume_data,
+	 0xaa,
+	 FWNT_TEST_COMPRESSED_ATTRIBUTE_VOLUME_SIZE );
+
+	for( data_offset = 0;
+	     data_offset < FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE;
+	     data_offset++ )
+	{
+		unit_index = (int) ( data_offset / FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE );
+
+		random_value ^= random_value << 13;
+		random_value ^= random_value >> 17;
+		random_value ^= random_value << 5;
+
+		if( ( unit_index == 2 )
+		 || ( unit_index == 5 ) )
+		{
+			fwnt_test_compressed_attribute_uncompressed_data[ data_offset ] = 0;
+		}
+		else if( ( unit_index == 3 )
+		      || ( unit_index == 6 ) )
+		{
+			fwnt_test_compressed_attribute_uncompressed_data[ data_offset ] = (uint8_t) random_value;
+		}
+		else
+		{
+			if( ( word == NULL )
+			 || ( *word == 0 ) )
+			{
+				word = words[ random_value % 8 ];
+			}
+			fwnt_test_compressed_attribute_uncompressed_data[ data_offset ] = (uint8_t) *word;
+
+			word++;
+		}
+	}
+	fwnt_test_compressed_attribute_number_of_extents = 0;
+
+	volume_offset = FWNT_TEST_COMPRESSED_ATTRIBUTE_CLUSTER_SIZE;
+
+	for( unit_index = 0;
+	     unit_index < FWNT_TEST_COMPRESSED_ATTRIBUTE_NUMBER_OF_UNITS;
+	     unit_index++ )
+	{
+		unit_offset            = (size_t) unit_index * FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE;
+		uncompressed_unit_size = FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE - unit_offset;
+
+		if( uncompressed_unit_size > FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE )
+		{
+			uncompressed_unit_size = FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE;
+		}
+		if( ( unit_index == 2 )
+		 || ( unit_index == 5 ) )
+		{
+			fwnt_test_compressed_attribute_add_test_extent(
+			 0,
+			 FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE,
+			 LIBFWNT_EXTENT_FLAG_IS_SPARSE );
+
+			continue;
+		}
+		unit_data_size = sizeof( unit_data );
+
+		if( fwnt_test_compressed_attribute_lznt1_compress(
+		     &( fwnt_test_compressed_attribute_uncompressed_data[ unit_offset ] ),
+		     uncompressed_unit_size,
+		     unit_data,
+		     &unit_data_size ) != 1 )
+		{
+			return( -1 );
+		}
+		allocated_size = ( ( unit_data_size + FWNT_TEST_COMPRESSED_ATTRIBUTE_CLUSTER_SIZE - 1 ) / FWNT_TEST_COMPRESSED_ATTRIBUTE_CLUSTER_SIZE ) * FWNT_TEST_COMPRESSED_ATTRIBUTE_CLUSTER_SIZE;
+
+		/* Units that do not compress into fewer clusters are stored uncompressed
+		 */
+		if( allocated_size >= FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE )
+		{
+			/* The last unit is allocated completely
+			 */
+			memory_set(
+			 unit_data,
+			 0,
+			 FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE );
+
+			memory_copy(
+			 unit_data,
+			 &( fwnt_test_compressed_attribute_uncompressed_data[ unit_offset ] ),
+			 uncompressed_unit_size );
+
+			volume_offset = fwnt_test_compressed_attribute_store_clusters(
+			                 volume_offset,
+			                 unit_data,
+			                 FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE,
+			                 unit_index == 3 );
+		}
+		else
+		{
+			/* The remainder of the last compressed cluster is 0-byte values
+			 */
+			memory_set(
+			 &( unit_data[ unit_data_size ] ),
+			 0,
+			 allocated_size - unit_data_size );
+
+			volume_offset = fwnt_test_compressed_attribute_store_clusters(
+			                 volume_offset,
+			                 unit_data,
+			                 allocated_size,
+			                 unit_index == 0 );
+
+			fwnt_test_compressed_attribute_add_test_extent(
+			 0,
+			 (size64_t) ( FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE - allocated_size ),
+			 LIBFWNT_EXTENT_FLAG_IS_SPARSE );
+		}
+	}
+	return( 1 );
+}
+
+/* Frees the test data
+ */
+void fwnt_test_compressed_attribute_free_test_data(
+      void )
+{
+	if( fwnt_test_compressed_attribute_volume_data != NULL )
+	{
+		memory_free(
+		 fwnt_test_compressed_attribute_volume_data );
+
+		fwnt_test_compressed_attribute_volume_data = NULL;
+	}
+	if( fwnt_test_compressed_attribute_uncompressed_data != NULL )
+	{
+		memory_free(
+		 fwnt_test_compressed_attribute_uncompressed_data );
+
+		fwnt_test_compressed_attribute_uncompressed_data = NULL;
+	}
+}
+
+/* Creates a compressed attribute of the test data
+ * Returns 1 if successful or -1 on error
+ */
+int fwnt_test_compressed_attribute_open_test_data(
+     libfwnt_compressed_attribute_t **compressed_attribute,
+     libcerror_error_t **error )
+{
+	int extent_index = 0;
+
+	if( libfwnt_compressed_attribute_initialize(
+	     compressed_attribute,
+	     error ) != 1 )
+	{
+		return( -1 );
+	}
+	if( libfwnt_compressed_attribute_set_data(
+	     *compressed_attribute,
+	     fwnt_test_compressed_attribute_volume_data,
+	     FWNT_TEST_COMPRESSED_ATTRIBUTE_VOLUME_SIZE,
+	     FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE,
+	     FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE,
+	     error ) != 1 )
+	{
+		return( -1 );
+	}
+	for( extent_index = 0;
+	     extent_index < fwnt_test_compressed_attribute_number_of_extents;
+	     extent_index++ )
+	{
+		if( libfwnt_compressed_attribute_append_extent(
+		     *compressed_attribute,
+		     fwnt_test_compressed_attribute_extent_data_offsets[ extent_index ],
+		     fwnt_test_compressed_attribute_extent_sizes[ extent_index ],
+		     fwnt_test_compressed_attribute_extent_flags[ extent_index ],
+		     error ) != 1 )
+		{
+			return( -1 );
+		}
+	}
+	return( 1 );
+}
+
+/* Tests the libfwnt_compressed_attribute_initialize function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_compressed_attribute_initialize(
+     void )
+{
+	libcerror_error_t *error                             = NULL;
+	libfwnt_compressed_attribute_t *compressed_attribute = NULL;
+	int result                                           = 0;
+
+#if defined( HAVE_FWNT_TEST_MEMORY )
+	int number_of_malloc_fail_tests                      = 1;
+	int number_of_memset_fail_tests                      = 1;
+	int test_number                                      = 0;
+#endif
+
+	/* Test regular cases
+	 */
+	result = libfwnt_compressed_attribute_initialize(
+	          &compressed_attribute,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "compressed_attribute",
+	 compressed_attribute );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_compressed_attribute_free(
+	          &compressed_attribute,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "compressed_attribute",
+	 compressed_attribute );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_compressed_attribute_initialize(
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	compressed_attribute = (libfwnt_compressed_attribute_t *) 0x12345678UL;
+
+	result = libfwnt_compressed_attribute_initialize(
+	          &compressed_attribute,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	compressed_attribute = NULL;
+
+#if defined( HAVE_FWNT_TEST_MEMORY )
+
+	for( test_number = 0;
+	     test_number < number_of_malloc_fail_tests;
+	     test_number++ )
+	{
+		/* Test libfwnt_compressed_attribute_initialize with malloc failing
+		 */
+		fwnt_test_malloc_attempts_before_fail = test_number;
+
+		result = libfwnt_compressed_attribute_initialize(
+		          &compressed_attribute,
+		          &error );
+
+		if( fwnt_test_malloc_attempts_before_fail != -1 )
+		{
+			fwnt_test_malloc_attempts_before_fail = -1;
+
+			if( compressed_attribute != NULL )
+			{
+				libfwnt_compressed_attribute_free(
+				 &compressed_attribute,
+				 NULL );
+			}
+		}
+		else
+		{
+			FWNT_TEST_ASSERT_EQUAL_INT(
+			 "result",
+			 result,
+			 -1 );
+
+			FWNT_TEST_ASSERT_IS_NULL(
+			 "compressed_attribute",
+			 compressed_attribute );
+
+			FWNT_TEST_ASSERT_IS_NOT_NULL(
+			 "error",
+			 error );
+
+			libcerror_error_free(
+			 &error );
+		}
+	}
+	for( test_number = 0;
+	     test_number < number_of_memset_fail_tests;
+	     test_number++ )
+	{
+		/* Test libfwnt_compressed_attribute_initialize with memset failing
+		 */
+		fwnt_test_memset_attempts_before_fail = test_number;
+
+		result = libfwnt_compressed_attribute_initialize(
+		          &compressed_attribute,
+		          &error );
+
+		if( fwnt_test_memset_attempts_before_fail != -1 )
+		{
+			fwnt_test_memset_attempts_before_fail = -1;
+
+			if( compressed_attribute != NULL )
+			{
+				libfwnt_compressed_attribute_free(
+				 &compressed_attribute,
+				 NULL );
+			}
+		}
+		else
+		{
+			FWNT_TEST_ASSERT_EQUAL_INT(
+			 "result",
+			 result,
+			 -1 );
+
+			FWNT_TEST_ASSERT_IS_NULL(
+			 "compressed_attribute",
+			 compressed_attribute );
+
+			FWNT_TEST_ASSERT_IS_NOT_NULL(
+			 "error",
+			 error );
+
+			libcerror_error_free(
+			 &error );
+		}
+	}
+#endif /* defined( HAVE_FWNT_TEST_MEMORY ) */
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( compressed_attribute != NULL )
+	{
+		libfwnt_compressed_attribute_free(
+		 &compressed_attribute,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_compressed_attribute_free function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_compressed_attribute_free(
+     void )
+{
+	libcerror_error_t *error = NULL;
+	int result               = 0;
+
+	/* Test error cases
+	 */
+	result = libfwnt_compressed_attribute_free(
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_compressed_attribute_set_data function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_compressed_attribute_set_data(
+     void )
+{
+	libcerror_error_t *error                             = NULL;
+	libfwnt_compressed_attribute_t *compressed_attribute = NULL;
+	int result                                           = 0;
+
+	result = libfwnt_compressed_attribute_initialize(
+	          &compressed_attribute,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_compressed_attribute_set_data(
+	          NULL,
+	          fwnt_test_compressed_attribute_volume_data,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_VOLUME_SIZE,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_compressed_attribute_set_data(
+	          compressed_attribute,
+	          NULL,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_VOLUME_SIZE,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_compressed_attribute_set_data(
+	          compressed_attribute,
+	          fwnt_test_compressed_attribute_volume_data,
+	          (size_t) SSIZE_MAX + 1,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test a compression unit size that is not a power of 2
+	 */
+	result = libfwnt_compressed_attribute_set_data(
+	          compressed_attribute,
+	          fwnt_test_compressed_attribute_volume_data,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_VOLUME_SIZE,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE + 512,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test a compression unit size that is too small
+	 */
+	result = libfwnt_compressed_attribute_set_data(
+	          compressed_attribute,
+	          fwnt_test_compressed_attribute_volume_data,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_VOLUME_SIZE,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE,
+	          2048,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test append extent without data
+	 */
+	result = libfwnt_compressed_attribute_append_extent(
+	          compressed_attribute,
+	          0,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE,
+	          LIBFWNT_EXTENT_FLAG_IS_SPARSE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test regular cases
+	 */
+	result = libfwnt_compressed_attribute_set_data(
+	          compressed_attribute,
+	          fwnt_test_compressed_attribute_volume_data,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_VOLUME_SIZE,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test set data when data is already set
+	 */
+	result = libfwnt_compressed_attribute_set_data(
+	          compressed_attribute,
+	          fwnt_test_compressed_attribute_volume_data,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_VOLUME_SIZE,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test append extent error cases
+	 */
+	result = libfwnt_compressed_attribute_append_extent(
+	          NULL,
+	          0,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE,
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_compressed_attribute_append_extent(
+	          compressed_attribute,
+	          0,
+	          0,
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_compressed_attribute_append_extent(
+	          compressed_attribute,
+	          0,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE,
+	          0x00000002UL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_compressed_attribute_append_extent(
+	          compressed_attribute,
+	          -1,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE,
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test an extent that exceeds the data
+	 */
+	result = libfwnt_compressed_attribute_append_extent(
+	          compressed_attribute,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_VOLUME_SIZE - 512,
+	          1024,
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libfwnt_compressed_attribute_free(
+	          &compressed_attribute,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( compressed_attribute != NULL )
+	{
+		libfwnt_compressed_attribute_free(
+		 &compressed_attribute,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_compressed_attribute_read_buffer_at_offset function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_compressed_attribute_read_buffer_at_offset(
+     void )
+{
+	uint8_t buffer[ FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE ];
+
+	libcerror_error_t *error                             = NULL;
+	libfwnt_compressed_attribute_t *compressed_attribute = NULL;
+	ssize_t read_count                                   = 0;
+	off64_t offset                                       = 0;
+	size_t maximum_cache_size                            = 0;
+	size_t read_size                                     = 0;
+	uint32_t random_value                                = 0x9e3779b9UL;
+	int read_index                                       = 0;
+	int result                                           = 0;
+
+	for( maximum_cache_size = 0;
+	     maximum_cache_size <= ( 4 * FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE );
+	     maximum_cache_size += ( 2 * FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE ) )
+	{
+		result = fwnt_test_compressed_attribute_open_test_data(
+		          &compressed_attribute,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		result = libfwnt_compressed_attribute_set_maximum_cache_size(
+		          compressed_attribute,
+		          maximum_cache_size,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		/* Test regular cases
+		 */
+		read_count = libfwnt_compressed_attribute_read_buffer_at_offset(
+		              compressed_attribute,
+		              buffer,
+		              FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE,
+		              0,
+		              &error );
+
+		FWNT_TEST_ASSERT_EQUAL_SSIZE(
+		 "read_count",
+		 read_count,
+		 (ssize_t) FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		result = memory_compare(
+		          buffer,
+		          fwnt_test_compressed_attribute_uncompressed_data,
+		          FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 0 );
+
+		/* Test reads that start and end within compression units
+		 */
+		for( read_index = 0;
+		     read_index < 256;
+		     read_index++ )
+		{
+			random_value ^= random_value << 13;
+			random_value ^= random_value >> 17;
+			random_value ^= random_value << 5;
+
+			offset    = (off64_t) ( random_value % FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE );
+			read_size = (size_t) ( ( random_value >> 16 ) % ( 3 * FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE ) );
+
+			read_count = libfwnt_compressed_attribute_read_buffer_at_offset(
+			              compressed_attribute,
+			              buffer,
+			              read_size,
+			              offset,
+			              &error );
+
+			if( read_size > (size_t) ( FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE - offset ) )
+			{
+				read_size = (size_t) ( FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE - offset );
+			}
+			FWNT_TEST_ASSERT_EQUAL_SSIZE(
+			 "read_count",
+			 read_count,
+			 (ssize_t) read_size );
+
+			FWNT_TEST_ASSERT_IS_NULL(
+			 "error",
+			 error );
+
+			result = memory_compare(
+			          buffer,
+			          &( fwnt_test_compressed_attribute_uncompressed_data[ offset ] ),
+			          read_size );
+
+			FWNT_TEST_ASSERT_EQUAL_INT(
+			 "result",
+			 result,
+			 0 );
+		}
+		/* Test read beyond the end of the data
+		 */
+		read_count = libfwnt_compressed_attribute_read_buffer_at_offset(
+		              compressed_attribute,
+		              buffer,
+		              16,
+		              FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE,
+		              &error );
+
+		FWNT_TEST_ASSERT_EQUAL_SSIZE(
+		 "read_count",
+		 read_count,
+		 (ssize_t) 0 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		result = libfwnt_compressed_attribute_free(
+		          &compressed_attribute,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+	}
+	/* Test error cases
+	 */
+	result = libfwnt_compressed_attribute_initialize(
+	          &compressed_attribute,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	read_count = libfwnt_compressed_attribute_read_buffer_at_offset(
+	              compressed_attribute,
+	              buffer,
+	              16,
+	              0,
+	              &error );
+
+	FWNT_TEST_ASSERT_EQUAL_SSIZE(
+	 "read_count",
+	 read_count,
+	 (ssize_t) -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_compressed_attribute_set_data(
+	          compressed_attribute,
+	          fwnt_test_compressed_attribute_volume_data,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_VOLUME_SIZE,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test read when the extents do not cover the data
+	 */
+	result = libfwnt_compressed_attribute_append_extent(
+	          compressed_attribute,
+	          0,
+	          FWNT_TEST_COMPRESSED_ATTRIBUTE_UNIT_SIZE,
+	          LIBFWNT_EXTENT_FLAG_IS_SPARSE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	read_count = libfwnt_compressed_attribute_read_buffer_at_offset(
+	              compressed_attribute,
+	              buffer,
+	              16,
+	              0,
+	              &error );
+
+	FWNT_TEST_ASSERT_EQUAL_SSIZE(
+	 "read_count",
+	 read_count,
+	 (ssize_t) -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	read_count = libfwnt_compressed_attribute_read_buffer_at_offset(
+	              NULL,
+	              buffer,
+	              16,
+	              0,
+	              &error );
+
+	FWNT_TEST_ASSERT_EQUAL_SSIZE(
+	 "read_count",
+	 read_count,
+	 (ssize_t) -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libfwnt_compressed_attribute_free(
+	          &compressed_attribute,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases on a compressed attribute that covers the data
+	 */
+	result = fwnt_test_compressed_attribute_open_test_data(
+	          &compressed_attribute,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	read_count = libfwnt_compressed_attribute_read_buffer_at_offset(
+	              compressed_attribute,
+	              NULL,
+	              16,
+	              0,
+	              &error );
+
+	FWNT_TEST_ASSERT_EQUAL_SSIZE(
+	 "read_count",
+	 read_count,
+	 (ssize_t) -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	read_count = libfwnt_compressed_attribute_read_buffer_at_offset(
+	              compressed_attribute,
+	              buffer,
+	              (size_t) SSIZE_MAX + 1,
+	              0,
+	              &error );
+
+	FWNT_TEST_ASSERT_EQUAL_SSIZE(
+	 "read_count",
+	 read_count,
+	 (ssize_t) -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	read_count = libfwnt_compressed_attribute_read_buffer_at_offset(
+	              compressed_attribute,
+	              buffer,
+	              16,
+	              -1,
+	              &error );
+
+	FWNT_TEST_ASSERT_EQUAL_SSIZE(
+	 "read_count",
+	 read_count,
+	 (ssize_t) -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libfwnt_compressed_attribute_free(
+	          &compressed_attribute,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( compressed_attribute != NULL )
+	{
+		libfwnt_compressed_attribute_free(
+		 &compressed_attribute,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_compressed_attribute_read_buffer and libfwnt_compressed_attribute_seek_offset functions
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_compressed_attribute_read_buffer(
+     void )
+{
+	uint8_t buffer[ 3000 ];
+
+	libcerror_error_t *error                             = NULL;
+	libfwnt_compressed_attribute_t *compressed_attribute = NULL;
+	ssize_t read_count                                   = 0;
+	size64_t size                                        = 0;
+	off64_t offset                                       = 0;
+	size_t read_size                                     = 0;
+	uint8_t read_ahead                                   = 0;
+	int result                                           = 0;
+
+	for( read_ahead = 0;
+	     read_ahead <= 1;
+	     read_ahead++ )
+	{
+		result = fwnt_test_compressed_attribute_open_test_data(
+		          &compressed_attribute,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		result = libfwnt_compressed_attribute_set_read_ahead(
+		          compressed_attribute,
+		          read_ahead,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		result = libfwnt_compressed_attribute_get_size(
+		          compressed_attribute,
+		          &size,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_EQUAL_UINT64(
+		 "size",
+		 (uint64_t) size,
+		 (uint64_t) FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		/* Test sequential reads that are not aligned with the compression units
+		 */
+		offset = 0;
+
+		while( offset < (off64_t) FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE )
+		{
+			read_count = libfwnt_compressed_attribute_read_buffer(
+			              compressed_attribute,
+			              buffer,
+			              3000,
+			              &error );
+
+			read_size = (size_t) ( FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE - offset );
+
+			if( read_size > 3000 )
+			{
+				read_size = 3000;
+			}
+			FWNT_TEST_ASSERT_EQUAL_SSIZE(
+			 "read_count",
+			 read_count,
+			 (ssize_t) read_size );
+
+			FWNT_TEST_ASSERT_IS_NULL(
+			 "error",
+			 error );
+
+			result = memory_compare(
+			          buffer,
+			          &( fwnt_test_compressed_attribute_uncompressed_data[ offset ] ),
+			          (size_t) read_count );
+
+			FWNT_TEST_ASSERT_EQUAL_INT(
+			 "result",
+			 result,
+			 0 );
+
+			offset += read_count;
+		}
+		FWNT_TEST_ASSERT_EQUAL_INT64(
+		 "offset",
+		 (int64_t) offset,
+		 (int64_t) FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE );
+
+		read_count = libfwnt_compressed_attribute_read_buffer(
+		              compressed_attribute,
+		              buffer,
+		              3000,
+		              &error );
+
+		FWNT_TEST_ASSERT_EQUAL_SSIZE(
+		 "read_count",
+		 read_count,
+		 (ssize_t) 0 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		/* Test seek and read
+		 */
+		offset = libfwnt_compressed_attribute_seek_offset(
+		          compressed_attribute,
+		          -10000,
+		          SEEK_END,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT64(
+		 "offset",
+		 (int64_t) offset,
+		 (int64_t) ( FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE - 10000 ) );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		read_count = libfwnt_compressed_attribute_read_buffer(
+		              compressed_attribute,
+		              buffer,
+		              3000,
+		              &error );
+
+		FWNT_TEST_ASSERT_EQUAL_SSIZE(
+		 "read_count",
+		 read_count,
+		 (ssize_t) 3000 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		result = memory_compare(
+		          buffer,
+		          &( fwnt_test_compressed_attribute_uncompressed_data[ FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE - 10000 ] ),
+		          3000 );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 0 );
+
+		result = libfwnt_compressed_attribute_get_offset(
+		          compressed_attribute,
+		          &offset,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_EQUAL_INT64(
+		 "offset",
+		 (int64_t) offset,
+		 (int64_t) ( FWNT_TEST_COMPRESSED_ATTRIBUTE_DATA_SIZE - 7000 ) );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		/* Test error cases
+		 */
+		offset = libfwnt_compressed_attribute_seek_offset(
+		          compressed_attribute,
+		          -1,
+		          SEEK_SET,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT64(
+		 "offset",
+		 (int64_t) offset,
+		 (int64_t) -1 );
+
+		FWNT_TEST_ASSERT_IS_NOT_NULL(
+		 "error",
+		 error );
+
+		libcerror_error_free(
+		 &error );
+
+		offset = libfwnt_compressed_attribute_seek_offset(
+		          compressed_attribute,
+		          0,
+		          -1,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT64(
+		 "offset",
+		 (int64_t) offset,
+		 (int64_t) -1 );
+
+		FWNT_TEST_ASSERT_IS_NOT_NULL(
+		 "error",
+		 error );
+
+		libcerror_error_free(
+		 &error );
+
+		result = libfwnt_compressed_attribute_get_offset(
+		          compressed_attribute,
+		          NULL,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 -1 );
+
+		FWNT_TEST_ASSERT_IS_NOT_NULL(
+		 "error",
+		 error );
+
+		libcerror_error_free(
+		 &error );
+
+		result = libfwnt_compressed_attribute_get_size(
+		          compressed_attribute,
+		          NULL,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 -1 );
+
+		FWNT_TEST_ASSERT_IS_NOT_NULL(
+		 "error",
+		 error );
+
+		libcerror_error_free(
+		 &error );
+
+		/* Clean up
+		 */
+		result = libfwnt_compressed_attribute_free(
+		          &compressed_attribute,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+	}
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( compressed_attribute != NULL )
+	{
+		libfwnt_compressed_attribute_free(
+		 &compressed_attribute,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* The main program
+ */
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+int wmain(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     wchar_t * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#else
+int main(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     char * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#endif
+{
+	FWNT_TEST_UNREFERENCED_PARAMETER( argc )
+	FWNT_TEST_UNREFERENCED_PARAMETER( argv )
+
+	if( fwnt_test_compressed_attribute_create_test_data() != 1 )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to create test data.\n" );
+
+		goto on_error;
+	}
+	FWNT_TEST_RUN(
+	 "libfwnt_compressed_attribute_initialize",
+	 fwnt_test_compressed_attribute_initialize );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_compressed_attribute_free",
+	 fwnt_test_compressed_attribute_free );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_compressed_attribute_set_data",
+	 fwnt_test_compressed_attribute_set_data );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_compressed_attribute_read_buffer_at_offset",
+	 fwnt_test_compressed_attribute_read_buffer_at_offset );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_compressed_attribute_read_buffer",
+	 fwnt_test_compressed_attribute_read_buffer );
+
+	fwnt_test_compressed_attribute_free_test_data();
+
+	return( EXIT_SUCCESS );
+
+on_error:
+	fwnt_test_compressed_attribute_free_test_data();
+
+	return( EXIT_FAILURE );
+}
+
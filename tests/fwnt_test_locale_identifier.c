@@ -0,0 +1,615 @@
+/*
+ * Library locale identifier (LCID) functions test program
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <file_stream.h>
+#include <narrow_string.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+#include "fwnt_test_libcerror.h"
+#include "fwnt_test_libfwnt.h"
+#include "fwnt_test_macros.h"
+#include "fwnt_test_unused.h"
+
+#include "../libfwnt/libfwnt_locale_identifier.h"
+
+/* Tests the libfwnt_locale_identifier_language_tag_get_identifier function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_locale_identifier_language_tag_get_identifier(
+     void )
+{
+	const char *identifier = NULL;
+	int result             = 0;
+
+	/* Test regular cases
+	 */
+	identifier = libfwnt_locale_identifier_language_tag_get_identifier(
+	              0x0001 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "identifier",
+	 identifier );
+
+	result = narrow_string_compare(
+	          identifier,
+	          "ar",
+	          3 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	identifier = libfwnt_locale_identifier_language_tag_get_identifier(
+	              0x0409 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "identifier",
+	 identifier );
+
+	result = narrow_string_compare(
+	          identifier,
+	          "en-US",
+	          6 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	identifier = libfwnt_locale_identifier_language_tag_get_identifier(
+	              0x7c68 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "identifier",
+	 identifier );
+
+	result = narrow_string_compare(
+	          identifier,
+	          "ha-Latn",
+	          8 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* Test unsupported language tags
+	 */
+	identifier = libfwnt_locale_identifier_language_tag_get_identifier(
+	              0x0000 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "identifier",
+	 identifier );
+
+	result = narrow_string_compare(
+	          identifier,
+	          "_UNKNOWN_",
+	          10 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	identifier = libfwnt_locale_identifier_language_tag_get_identifier(
+	              0xffff );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "identifier",
+	 identifier );
+
+	result = narrow_string_compare(
+	          identifier,
+	          "_UNKNOWN_",
+	          10 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	return( 1 );
+
+on_error:
+	return( 0 );
+}
+
+/* Tests the libfwnt_locale_identifier_language_tag_get_description function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_locale_identifier_language_tag_get_description(
+     void )
+{
+	const char *description = NULL;
+	int result              = 0;
+
+	/* Test regular cases
+	 */
+	description = libfwnt_locale_identifier_language_tag_get_description(
+	               0x0409 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "description",
+	 description );
+
+	result = narrow_string_compare(
+	          description,
+	          "English, United States",
+	          23 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* Test unsupported language tags
+	 */
+	description = libfwnt_locale_identifier_language_tag_get_description(
+	               0x0000 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "description",
+	 description );
+
+	result = narrow_string_compare(
+	          description,
+	          "Unknown",
+	          8 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	return( 1 );
+
+on_error:
+	return( 0 );
+}
+
+/* Tests the libfwnt_locale_identifier_language_tag_get_lcid_from_identifier function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_locale_identifier_language_tag_get_lcid_from_identifier(
+     void )
+{
+	libcerror_error_t *error   = NULL;
+	const char *identifier     = NULL;
+	size_t identifier_length   = 0;
+	uint32_t lcid_language_tag = 0;
+	uint16_t lookup_value      = 0;
+	int result                 = 0;
+
+	/* Test regular cases
+	 */
+	result = libfwnt_locale_identifier_language_tag_get_lcid_from_identifier(
+	          "en-US",
+	          5,
+	          &lookup_value,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT32(
+	 "lookup_value",
+	 (uint32_t) lookup_value,
+	 (uint32_t) 0x0409 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_locale_identifier_language_tag_get_lcid_from_identifier(
+	          "EN-us",
+	          5,
+	          &lookup_value,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT32(
+	 "lookup_value",
+	 (uint32_t) lookup_value,
+	 (uint32_t) 0x0409 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* The identifier length bounds the comparison
+	 */
+	result = libfwnt_locale_identifier_language_tag_get_lcid_from_identifier(
+	          "en-US",
+	          2,
+	          &lookup_value,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT32(
+	 "lookup_value",
+	 (uint32_t) lookup_value,
+	 (uint32_t) 0x0009 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test that every supported language tag can be found by its identifier
+	 */
+	for( lcid_language_tag = 0;
+	     lcid_language_tag < 0xffff;
+	     lcid_language_tag++ )
+	{
+		identifier = libfwnt_locale_identifier_language_tag_get_identifier(
+		              (uint16_t) lcid_language_tag );
+
+		identifier_length = narrow_string_length(
+		                     identifier );
+
+		if( ( identifier_length == 9 )
+		 && ( narrow_string_compare(
+		       identifier,
+		       "_UNKNOWN_",
+		       9 ) == 0 ) )
+		{
+			continue;
+		}
+		result = libfwnt_locale_identifier_language_tag_get_lcid_from_identifier(
+		          identifier,
+		          identifier_length,
+		          &lookup_value,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_EQUAL_UINT32(
+		 "lookup_value",
+		 (uint32_t) lookup_value,
+		 lcid_language_tag );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+	}
+	/* Test unsupported identifiers
+	 */
+	result = libfwnt_locale_identifier_language_tag_get_lcid_from_identifier(
+	          "xx-YY",
+	          5,
+	          &lookup_value,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_locale_identifier_language_tag_get_lcid_from_identifier(
+	          "_UNKNOWN_",
+	          9,
+	          &lookup_value,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_locale_identifier_language_tag_get_lcid_from_identifier(
+	          "",
+	          0,
+	          &lookup_value,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_locale_identifier_language_tag_get_lcid_from_identifier(
+	          NULL,
+	          5,
+	          &lookup_value,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_locale_identifier_language_tag_get_lcid_from_identifier(
+	          "en-US",
+	          (size_t) SSIZE_MAX + 1,
+	          &lookup_value,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_locale_identifier_language_tag_get_lcid_from_identifier(
+	          "en-US",
+	          5,
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_locale_identifier_language_tags_get_identifiers function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_locale_identifier_language_tags_get_identifiers(
+     void )
+{
+	const char *descriptions[ 3 ];
+	const char *identifiers[ 3 ];
+
+	uint16_t lcid_language_tags[ 3 ] = { 0x0409, 0x0000, 0x0407 };
+	libcerror_error_t *error         = NULL;
+	int result                       = 0;
+
+	/* Test regular cases
+	 */
+	result = libfwnt_locale_identifier_language_tags_get_identifiers(
+	          lcid_language_tags,
+	          3,
+	          identifiers,
+	          descriptions,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "identifiers[ 0 ]",
+	 identifiers[ 0 ] );
+
+	result = narrow_string_compare(
+	          identifiers[ 0 ],
+	          "en-US",
+	          6 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "identifiers[ 1 ]",
+	 identifiers[ 1 ] );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "descriptions[ 1 ]",
+	 descriptions[ 1 ] );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "descriptions[ 2 ]",
+	 descriptions[ 2 ] );
+
+	result = narrow_string_compare(
+	          descriptions[ 2 ],
+	          "German, Germany",
+	          16 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	result = libfwnt_locale_identifier_language_tags_get_identifiers(
+	          lcid_language_tags,
+	          3,
+	          identifiers,
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_locale_identifier_language_tags_get_identifiers(
+	          NULL,
+	          3,
+	          identifiers,
+	          descriptions,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_locale_identifier_language_tags_get_identifiers(
+	          lcid_language_tags,
+	          (size_t) SSIZE_MAX,
+	          identifiers,
+	          descriptions,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_locale_identifier_language_tags_get_identifiers(
+	          lcid_language_tags,
+	          3,
+	          NULL,
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	return( 0 );
+}
+
+/* The main program
+ */
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+int wmain(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     wchar_t * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#else
+int main(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     char * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#endif
+{
+	FWNT_TEST_UNREFERENCED_PARAMETER( argc )
+	FWNT_TEST_UNREFERENCED_PARAMETER( argv )
+
+	FWNT_TEST_RUN(
+	 "libfwnt_locale_identifier_language_tag_get_identifier",
+	 fwnt_test_locale_identifier_language_tag_get_identifier );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_locale_identifier_language_tag_get_description",
+	 fwnt_test_locale_identifier_language_tag_get_description );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_locale_identifier_language_tag_get_lcid_from_identifier",
+	 fwnt_test_locale_identifier_language_tag_get_lcid_from_identifier );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_locale_identifier_language_tags_get_identifiers",
+	 fwnt_test_locale_identifier_language_tags_get_identifiers );
+
+	return( EXIT_SUCCESS );
+
+on_error:
+	return( EXIT_FAILURE );
+}
+
@@ -0,0 +1,181 @@
+/*
+ * Library LZ77 match copy testing program
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <file_stream.h>
+#include <memory.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+#include "fwnt_test_libfwnt.h"
+#include "fwnt_test_macros.h"
+#include "fwnt_test_unused.h"
+
+#include "../libfwnt/libfwnt_lz77.h"
+
+/* The matches are copied after a history of 16 bytes into a buffer of 64 bytes,
+ * so that the largest matches end exactly at the end of the buffer
+ */
+#define FWNT_TEST_LZ77_HISTORY_SIZE	16
+#define FWNT_TEST_LZ77_BUFFER_SIZE	64
+
+/* Tests the libfwnt_lz77_copy_match function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_lz77_copy_match(
+     void )
+{
+	uint8_t expected_data[ FWNT_TEST_LZ77_BUFFER_SIZE ];
+	uint8_t uncompressed_data[ FWNT_TEST_LZ77_BUFFER_SIZE ];
+
+	/* Distances of 1, 2 and 4 and those that are not a power of 2 repeat
+	 * a pattern shorter than the match, 16 is larger than the smaller matches
+	 */
+	size_t match_distances[ 7 ] = { 1, 2, 3, 4, 5, 8, 16 };
+
+	size_t byte_index     = 0;
+	size_t distance_index = 0;
+	size_t match_distance = 0;
+	size_t match_size     = 0;
+	int result            = 0;
+
+	for( distance_index = 0;
+	     distance_index < 7;
+	     distance_index++ )
+	{
+		match_distance = match_distances[ distance_index ];
+
+		for( match_size = 1;
+		     match_size <= ( FWNT_TEST_LZ77_BUFFER_SIZE - FWNT_TEST_LZ77_HISTORY_SIZE );
+		     match_size++ )
+		{
+			/* The bytes after the match are set to 0xff to detect a copy that is too large
+			 */
+			for( byte_index = 0;
+			     byte_index < FWNT_TEST_LZ77_BUFFER_SIZE;
+			     byte_index++ )
+			{
+				if( byte_index < FWNT_TEST_LZ77_HISTORY_SIZE )
+				{
+					uncompressed_data[ byte_index ] = (uint8_t) ( 'a' + byte_index );
+				}
+				else
+				{
+					uncompressed_data[ byte_index ] = 0xff;
+				}
+			}
+			memory_copy(
+			 expected_data,
+			 uncompressed_data,
+			 FWNT_TEST_LZ77_BUFFER_SIZE );
+
+			/* The expected data is copied a byte at a time, as LZ77 defines an overlapping match
+			 */
+			for( byte_index = FWNT_TEST_LZ77_HISTORY_SIZE;
+			     byte_index < ( FWNT_TEST_LZ77_HISTORY_SIZE + match_size );
+			     byte_index++ )
+			{
+				expected_data[ byte_index ] = expected_data[ byte_index - match_distance ];
+			}
+			libfwnt_lz77_copy_match(
+			 uncompressed_data,
+			 FWNT_TEST_LZ77_HISTORY_SIZE,
+			 match_distance,
+			 match_size );
+
+			result = memory_compare(
+			          uncompressed_data,
+			          expected_data,
+			          FWNT_TEST_LZ77_BUFFER_SIZE );
+
+			if( result != 0 )
+			{
+				fprintf(
+				 stderr,
+				 "Unable to copy match of size: %" PRIzd " at distance: %" PRIzd ".\n",
+				 match_size,
+				 match_distance );
+			}
+			FWNT_TEST_ASSERT_EQUAL_INT(
+			 "result",
+			 result,
+			 0 );
+		}
+	}
+	/* A match at the start of the history
+	 */
+	for( byte_index = 0;
+	     byte_index < FWNT_TEST_LZ77_BUFFER_SIZE;
+	     byte_index++ )
+	{
+		uncompressed_data[ byte_index ] = 0xff;
+	}
+	uncompressed_data[ 0 ] = (uint8_t) 'a';
+
+	libfwnt_lz77_copy_match(
+	 uncompressed_data,
+	 1,
+	 1,
+	 FWNT_TEST_LZ77_BUFFER_SIZE - 1 );
+
+	for( byte_index = 0;
+	     byte_index < FWNT_TEST_LZ77_BUFFER_SIZE;
+	     byte_index++ )
+	{
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "uncompressed_data[ byte_index ]",
+		 (int) uncompressed_data[ byte_index ],
+		 (int) 'a' );
+	}
+	return( 1 );
+
+on_error:
+	return( 0 );
+}
+
+/* The main program
+ */
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+int wmain(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     wchar_t * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#else
+int main(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     char * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#endif
+{
+	FWNT_TEST_UNREFERENCED_PARAMETER( argc )
+	FWNT_TEST_UNREFERENCED_PARAMETER( argv )
+
+	FWNT_TEST_RUN(
+	 "libfwnt_lz77_copy_match",
+	 fwnt_test_lz77_copy_match );
+
+	return( EXIT_SUCCESS );
+
+on_error:
+	return( EXIT_FAILURE );
+}
+
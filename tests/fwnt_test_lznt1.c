@@ -299,6 +299,150 @@ uint8_t fwnt_test_lznt1_compressed_byte_stream[ 4135 ] = {
 	0x20, 0x66, 0xff, 0x7f, 0x00, 0x00, 0x6f, 0x72, 0x20, 0x74, 0x68, 0x65, 0x0a, 0x4c, 0x69, 0x62, 
 	0x72, 0x61, 0x72, 0x79, 0x2e, 0x0a, 0x0a };
 
+/* Tests the libfwnt_lznt1_get_uncompressed_data_size function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_lznt1_get_uncompressed_data_size(
+     void )
+{
+	uint8_t uncompressed_chunk_byte_stream[ 6 ] = {
+		0x03, 0x30, 0x61, 0x62, 0x63, 0x00 };
+
+	libcerror_error_t *error      = NULL;
+	size_t uncompressed_data_size = 0;
+	int result                    = 0;
+
+	/* Test regular cases
+	 */
+	result = libfwnt_lznt1_get_uncompressed_data_size(
+	          fwnt_test_lznt1_compressed_byte_stream,
+	          3575,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "uncompressed_data_size",
+	 uncompressed_data_size,
+	 (size_t) 7640 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test an uncompressed chunk followed by an end-of-data chunk header
+	 */
+	result = libfwnt_lznt1_get_uncompressed_data_size(
+	          uncompressed_chunk_byte_stream,
+	          6,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "uncompressed_data_size",
+	 uncompressed_data_size,
+	 (size_t) 4 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_lznt1_get_uncompressed_data_size(
+	          NULL,
+	          4135,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_lznt1_get_uncompressed_data_size(
+	          fwnt_test_lznt1_compressed_byte_stream,
+	          (size_t) SSIZE_MAX + 1,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_lznt1_get_uncompressed_data_size(
+	          fwnt_test_lznt1_compressed_byte_stream,
+	          4135,
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test truncated compressed data, the last chunk of the test data is incomplete
+	 */
+	result = libfwnt_lznt1_get_uncompressed_data_size(
+	          fwnt_test_lznt1_compressed_byte_stream,
+	          4135,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	return( 0 );
+}
+
 /* Tests the libfwnt_lznt1_decompress function
  * Returns 1 if successful or 0 if not
  */
@@ -414,6 +558,191 @@ on_error:
 	return( 0 );
 }
 
+/* Tests the literal and match decoding of libfwnt_lznt1_decompress
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_lznt1_decompress_literals(
+     void )
+{
+	uint8_t uncompressed_data[ 48 ];
+
+	/* A chunk of a flag byte without tag bits followed by 8 literals
+	 */
+	uint8_t literals_byte_stream[ 11 ] = {
+		0x08, 0xb0, 0x00, 0x61, 0x62, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68 };
+
+	/* A chunk of 3 flag bytes without tag bits each followed by 8 literals
+	 * and a match of size 24 at distance 24, which is decoded with an offset
+	 * shift of 11 as it follows 24 bytes of uncompressed data
+	 */
+	uint8_t match_byte_stream[ 32 ] = {
+		0x1d, 0xb0, 0x00, 0x61, 0x62, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x00,
+		0x69, 0x6a, 0x6b, 0x6c, 0x6d, 0x6e, 0x6f, 0x70, 0x00, 0x71, 0x72, 0x73,
+		0x74, 0x75, 0x76, 0x77, 0x78, 0x01, 0x15, 0xb8 };
+
+	/* A chunk of a flag byte without tag bits followed by only 3 literals
+	 */
+	uint8_t short_literals_byte_stream[ 6 ] = {
+		0x03, 0xb0, 0x00, 0x61, 0x62, 0x63 };
+
+	libcerror_error_t *error      = NULL;
+	size_t uncompressed_data_size = 0;
+	int result                    = 0;
+
+	/* Test 8 literals that end exactly at the end of the uncompressed data
+	 */
+	uncompressed_data_size = 8;
+
+	result = libfwnt_lznt1_decompress(
+	          literals_byte_stream,
+	          11,
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_FPRINT_ERROR( error )
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "uncompressed_data_size",
+	 uncompressed_data_size,
+	 (size_t) 8 );
+
+	result = memory_compare(
+	          uncompressed_data,
+	          "abcdefgh",
+	          8 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* Test a match that follows literals and ends exactly at the end of the uncompressed data
+	 */
+	uncompressed_data_size = 48;
+
+	result = libfwnt_lznt1_decompress(
+	          match_byte_stream,
+	          32,
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_FPRINT_ERROR( error )
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "uncompressed_data_size",
+	 uncompressed_data_size,
+	 (size_t) 48 );
+
+	result = memory_compare(
+	          uncompressed_data,
+	          "abcdefghijklmnopqrstuvwxabcdefghijklmnopqrstuvwx",
+	          48 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* Test a flag byte without tag bits followed by less than 8 literals
+	 */
+	uncompressed_data_size = 48;
+
+	result = libfwnt_lznt1_decompress(
+	          short_literals_byte_stream,
+	          6,
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_FPRINT_ERROR( error )
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "uncompressed_data_size",
+	 uncompressed_data_size,
+	 (size_t) 3 );
+
+	result = memory_compare(
+	          uncompressed_data,
+	          "abc",
+	          3 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* Test error cases
+	 */
+	uncompressed_data_size = 7;
+
+	result = libfwnt_lznt1_decompress(
+	          literals_byte_stream,
+	          11,
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+        FWNT_TEST_ASSERT_IS_NOT_NULL(
+         "error",
+         error );
+
+	libcerror_error_free(
+	 &error );
+
+	uncompressed_data_size = 47;
+
+	result = libfwnt_lznt1_decompress(
+	          match_byte_stream,
+	          32,
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+        FWNT_TEST_ASSERT_IS_NOT_NULL(
+         "error",
+         error );
+
+	libcerror_error_free(
+	 &error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	return( 0 );
+}
+
 /* The main program
  */
 #if defined( HAVE_WIDE_SYSTEM_CHARACTER )
@@ -439,10 +768,18 @@ int main(
 
 	/* TODO add tests for libfwnt_lznt1_compress */
 
+	FWNT_TEST_RUN(
+	 "libfwnt_lznt1_get_uncompressed_data_size",
+	 fwnt_test_lznt1_get_uncompressed_data_size );
+
 	FWNT_TEST_RUN(
 	 "libfwnt_lznt1_decompress",
 	 fwnt_test_lznt1_decompress );
 
+	FWNT_TEST_RUN(
+	 "libfwnt_lznt1_decompress_literals",
+	 fwnt_test_lznt1_decompress_literals );
+
 	return( EXIT_SUCCESS );
 
 on_error:
@@ -564,6 +564,222 @@ on_error:
 	return( 0 );
 }
 
+/* Tests the literal and match decoding of libfwnt_lzxpress_decompress
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_lzxpress_decompress_literals(
+     void )
+{
+	uint8_t uncompressed_data[ 48 ];
+
+	/* An indicator of 8 literals and a match, followed by 8 literals
+	 * and a match of size 8 at distance 8
+	 */
+	uint8_t literals_byte_stream[ 14 ] = {
+		0x00, 0x00, 0x80, 0x00, 0x61, 0x62, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68,
+		0x3d, 0x00 };
+
+	/* An indicator of 24 literals and a match, followed by 24 literals
+	 * and a match of size 24 at distance 24 with an extended size
+	 */
+	uint8_t match_byte_stream[ 31 ] = {
+		0x80, 0x00, 0x00, 0x00, 0x61, 0x62, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68,
+		0x69, 0x6a, 0x6b, 0x6c, 0x6d, 0x6e, 0x6f, 0x70, 0x71, 0x72, 0x73, 0x74,
+		0x75, 0x76, 0x77, 0x78, 0xbf, 0x00, 0x0e };
+
+	libcerror_error_t *error      = NULL;
+	size_t uncompressed_data_size = 0;
+	int result                    = 0;
+
+	/* Test a match that ends exactly at the end of the uncompressed data
+	 */
+	uncompressed_data_size = 16;
+
+	result = libfwnt_lzxpress_decompress(
+	          literals_byte_stream,
+	          14,
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_FPRINT_ERROR( error )
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "uncompressed_data_size",
+	 uncompressed_data_size,
+	 (size_t) 16 );
+
+	result = memory_compare(
+	          uncompressed_data,
+	          "abcdefghabcdefgh",
+	          16 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* Test 8 literals that end exactly at the end of the uncompressed data
+	 */
+	uncompressed_data_size = 8;
+
+	result = libfwnt_lzxpress_decompress(
+	          literals_byte_stream,
+	          14,
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_FPRINT_ERROR( error )
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "uncompressed_data_size",
+	 uncompressed_data_size,
+	 (size_t) 8 );
+
+	result = memory_compare(
+	          uncompressed_data,
+	          "abcdefgh",
+	          8 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* Test literals that do not fit 8 at a time in the uncompressed data
+	 */
+	uncompressed_data_size = 7;
+
+	result = libfwnt_lzxpress_decompress(
+	          literals_byte_stream,
+	          14,
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_FPRINT_ERROR( error )
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "uncompressed_data_size",
+	 uncompressed_data_size,
+	 (size_t) 7 );
+
+	result = memory_compare(
+	          uncompressed_data,
+	          "abcdefg",
+	          7 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* Test a match that follows 3 sets of 8 literals
+	 */
+	uncompressed_data_size = 48;
+
+	result = libfwnt_lzxpress_decompress(
+	          match_byte_stream,
+	          31,
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_FPRINT_ERROR( error )
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "uncompressed_data_size",
+	 uncompressed_data_size,
+	 (size_t) 48 );
+
+	result = memory_compare(
+	          uncompressed_data,
+	          "abcdefghijklmnopqrstuvwxabcdefghijklmnopqrstuvwx",
+	          48 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* Test error cases
+	 */
+	uncompressed_data_size = 47;
+
+	result = libfwnt_lzxpress_decompress(
+	          match_byte_stream,
+	          31,
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+        FWNT_TEST_ASSERT_IS_NOT_NULL(
+         "error",
+         error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test an indicator that is truncated
+	 */
+	uncompressed_data_size = 48;
+
+	result = libfwnt_lzxpress_decompress(
+	          match_byte_stream,
+	          3,
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+        FWNT_TEST_ASSERT_IS_NOT_NULL(
+         "error",
+         error );
+
+	libcerror_error_free(
+	 &error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	return( 0 );
+}
+
 /* Tests the libfwnt_lzxpress_huffman_decompress function
  * Returns 1 if successful or 0 if not
  */
@@ -679,6 +895,394 @@ on_error:
 	return( 0 );
 }
 
+/* Tests the libfwnt_lzxpress_huffman_compress function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_lzxpress_huffman_compress(
+     void )
+{
+	uint8_t uncompressed_data[ 8192 ];
+
+	libcerror_error_t *error             = NULL;
+	uint8_t *compressed_data             = NULL;
+	uint8_t *data                        = NULL;
+	uint8_t *parallel_compressed_data    = NULL;
+	uint8_t *test_data                   = NULL;
+	size_t compressed_data_size          = 0;
+	size_t data_size                     = 0;
+	size_t maximum_compressed_data_size  = 0;
+	size_t parallel_compressed_data_size = 0;
+	size_t test_data_size                = 0;
+	size_t uncompressed_data_size        = 7640;
+	int compression_level                = 0;
+	int copy_index                       = 0;
+	int result                           = 0;
+
+	result = libfwnt_lzxpress_huffman_decompress(
+	          fwnt_test_lzxpress_huffman_compressed_byte_stream,
+	          2917,
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Use 24 copies of the uncompressed data so that it spans multiple chunks
+	 */
+	data_size = 24 * uncompressed_data_size;
+
+	maximum_compressed_data_size = ( 2 * data_size ) + ( 264 * ( ( data_size / 65536 ) + 1 ) );
+
+	data                     = (uint8_t *) memory_allocate( data_size );
+	test_data                = (uint8_t *) memory_allocate( data_size );
+	compressed_data          = (uint8_t *) memory_allocate( maximum_compressed_data_size );
+	parallel_compressed_data = (uint8_t *) memory_allocate( maximum_compressed_data_size );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "data",
+	 data );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "test_data",
+	 test_data );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "compressed_data",
+	 compressed_data );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "parallel_compressed_data",
+	 parallel_compressed_data );
+
+	for( copy_index = 0;
+	     copy_index < 24;
+	     copy_index++ )
+	{
+		memory_copy(
+		 &( data[ copy_index * uncompressed_data_size ] ),
+		 uncompressed_data,
+		 uncompressed_data_size );
+	}
+	/* Test regular cases
+	 */
+	for( compression_level = 1;
+	     compression_level <= 9;
+	     compression_level += 8 )
+	{
+		compressed_data_size = maximum_compressed_data_size;
+
+		result = libfwnt_lzxpress_huffman_compress(
+		          data,
+		          data_size,
+		          compressed_data,
+		          &compressed_data_size,
+		          compression_level,
+		          1,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		parallel_compressed_data_size = maximum_compressed_data_size;
+
+		result = libfwnt_lzxpress_huffman_compress(
+		          data,
+		          data_size,
+		          parallel_compressed_data,
+		          &parallel_compressed_data_size,
+		          compression_level,
+		          2,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		FWNT_TEST_ASSERT_EQUAL_SIZE(
+		 "parallel_compressed_data_size",
+		 parallel_compressed_data_size,
+		 compressed_data_size );
+
+		result = memory_compare(
+		          parallel_compressed_data,
+		          compressed_data,
+		          compressed_data_size );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 0 );
+
+		test_data_size = data_size;
+
+		result = libfwnt_lzxpress_huffman_decompress(
+		          compressed_data,
+		          compressed_data_size,
+		          test_data,
+		          &test_data_size,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		FWNT_TEST_ASSERT_EQUAL_SIZE(
+		 "test_data_size",
+		 test_data_size,
+		 data_size );
+
+		result = memory_compare(
+		          test_data,
+		          data,
+		          data_size );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 0 );
+	}
+	/* Test error cases
+	 */
+	compressed_data_size = maximum_compressed_data_size;
+
+	result = libfwnt_lzxpress_huffman_compress(
+	          NULL,
+	          data_size,
+	          compressed_data,
+	          &compressed_data_size,
+	          6,
+	          1,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_lzxpress_huffman_compress(
+	          data,
+	          (size_t) SSIZE_MAX + 1,
+	          compressed_data,
+	          &compressed_data_size,
+	          6,
+	          1,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_lzxpress_huffman_compress(
+	          data,
+	          data_size,
+	          NULL,
+	          &compressed_data_size,
+	          6,
+	          1,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_lzxpress_huffman_compress(
+	          data,
+	          data_size,
+	          compressed_data,
+	          NULL,
+	          6,
+	          1,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_lzxpress_huffman_compress(
+	          data,
+	          data_size,
+	          compressed_data,
+	          &compressed_data_size,
+	          0,
+	          1,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_lzxpress_huffman_compress(
+	          data,
+	          data_size,
+	          compressed_data,
+	          &compressed_data_size,
+	          10,
+	          1,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_lzxpress_huffman_compress(
+	          data,
+	          data_size,
+	          compressed_data,
+	          &compressed_data_size,
+	          6,
+	          -1,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test compressed data too small
+	 */
+	compressed_data_size = 64;
+
+	result = libfwnt_lzxpress_huffman_compress(
+	          data,
+	          data_size,
+	          compressed_data,
+	          &compressed_data_size,
+	          6,
+	          1,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	memory_free(
+	 parallel_compressed_data );
+
+	memory_free(
+	 compressed_data );
+
+	memory_free(
+	 test_data );
+
+	memory_free(
+	 data );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( parallel_compressed_data != NULL )
+	{
+		memory_free(
+		 parallel_compressed_data );
+	}
+	if( compressed_data != NULL )
+	{
+		memory_free(
+		 compressed_data );
+	}
+	if( test_data != NULL )
+	{
+		memory_free(
+		 test_data );
+	}
+	if( data != NULL )
+	{
+		memory_free(
+		 data );
+	}
+	return( 0 );
+}
+
 /* The main program
  */
 #if defined( HAVE_WIDE_SYSTEM_CHARACTER )
@@ -709,10 +1313,18 @@ int main(
 	 "libfwnt_lzxpress_decompress",
 	 fwnt_test_lzxpress_decompress );
 
+	FWNT_TEST_RUN(
+	 "libfwnt_lzxpress_decompress_literals",
+	 fwnt_test_lzxpress_decompress_literals );
+
 	FWNT_TEST_RUN(
 	 "libfwnt_lzxpress_huffman_decompress",
 	 fwnt_test_lzxpress_huffman_decompress );
 
+	FWNT_TEST_RUN(
+	 "libfwnt_lzxpress_huffman_compress",
+	 fwnt_test_lzxpress_huffman_compress );
+
 	/* TODO add tests for libfwnt_lzxpress_huffman_stream_decompress */
 
 	return( EXIT_SUCCESS );
@@ -0,0 +1,721 @@
+/*
+ * Library lzxpress_huffman_decoder type test program
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <file_stream.h>
+#include <memory.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+#include "fwnt_test_libcerror.h"
+#include "fwnt_test_libfwnt.h"
+#include "fwnt_test_macros.h"
+#include "fwnt_test_memory.h"
+#include "fwnt_test_unused.h"
+
+#include "../libfwnt/libfwnt_lzxpress_huffman_decoder.h"
+
+/* The test data consists of 2 data sets, the first of 3 full and 1 partial
+ * chunks of mostly text, the second of 1 partial chunk that contains the
+ * symbols in a different distribution, so that the decoding tables of
+ * a decoder are both reused and rebuilt
+ */
+#define FWNT_TEST_LZXPRESS_HUFFMAN_DECODER_NUMBER_OF_DATA_SETS	2
+#define FWNT_TEST_LZXPRESS_HUFFMAN_DECODER_TEXT_DATA_SIZE	( ( 3 * 65536 ) + 4321 )
+#define FWNT_TEST_LZXPRESS_HUFFMAN_DECODER_OTHER_DATA_SIZE	12345
+
+uint8_t *fwnt_test_lzxpress_huffman_decoder_uncompressed_data[ FWNT_TEST_LZXPRESS_HUFFMAN_DECODER_NUMBER_OF_DATA_SETS ] = { NULL, NULL };
+uint8_t *fwnt_test_lzxpress_huffman_decoder_compressed_data[ FWNT_TEST_LZXPRESS_HUFFMAN_DECODER_NUMBER_OF_DATA_SETS ]   = { NULL, NULL };
+
+size_t fwnt_test_lzxpress_huffman_decoder_uncompressed_data_size[ FWNT_TEST_LZXPRESS_HUFFMAN_DECODER_NUMBER_OF_DATA_SETS ] = {
+	FWNT_TEST_LZXPRESS_HUFFMAN_DECODER_TEXT_DATA_SIZE,
+	FWNT_TEST_LZXPRESS_HUFFMAN_DECODER_OTHER_DATA_SIZE };
+
+size_t fwnt_test_lzxpress_huffman_decoder_compressed_data_size[ FWNT_TEST_LZXPRESS_HUFFMAN_DECODER_NUMBER_OF_DATA_SETS ] = { 0, 0 };
+
+/* Creates the uncompressed test data and compresses it
+ * Returns 1 if successful or -1 on error
+ */
+int fwnt_test_lzxpress_huffman_decoder_create_test_data(
+     void )
+{
+	const char *text            = "The quick brown fox jumps over the lazy dog. ";
+	size_t compressed_data_size = 0;
+	size_t data_offset          = 0;
+	size_t data_size            = 0;
+	uint32_t random_value       = 0x12345678UL;
+	int data_set_index          = 0;
+
+	for( data_set_index = 0;
+	     data_set_index < FWNT_TEST_LZXPRESS_HUFFMAN_DECODER_NUMBER_OF_DATA_SETS;
+	     data_set_index++ )
+	{
+		data_size = fwnt_test_lzxpress_huffman_decoder_uncompressed_data_size[ data_set_index ];
+
+		fwnt_test_lzxpress_huffman_decoder_uncompressed_data[ data_set_index ] = (uint8_t *) memory_allocate(
+		                                                                                      data_size );
+
+		if( fwnt_test_lzxpress_huffman_decoder_uncompressed_data[ data_set_index ] == NULL )
+		{
+			return( -1 );
+		}
+		for( data_offset = 0;
+		     data_offset < data_size;
+		     data_offset++ )
+		{
+			random_value ^= random_value << 13;
+			random_value ^= random_value >> 17;
+			random_value ^= random_value << 5;
+
+			if( data_set_index == 0 )
+			{
+				if( ( random_value & 0x0f ) == 0 )
+				{
+					fwnt_test_lzxpress_huffman_decoder_uncompressed_data[ data_set_index ][ data_offset ] = (uint8_t) ( random_value >> 8 );
+				}
+				else
+				{
+					fwnt_test_lzxpress_huffman_decoder_uncompressed_data[ data_set_index ][ data_offset ] = (uint8_t) text[ ( data_offset + ( data_offset / 997 ) ) % 45 ];
+				}
+			}
+			else
+			{
+				fwnt_test_lzxpress_huffman_decoder_uncompressed_data[ data_set_index ][ data_offset ] = (uint8_t) ( ( data_offset / 7 ) + ( random_value & 0x03 ) );
+			}
+		}
+		compressed_data_size = ( 2 * data_size ) + ( 264 * ( ( data_size / 65536 ) + 1 ) );
+
+		fwnt_test_lzxpress_huffman_decoder_compressed_data[ data_set_index ] = (uint8_t *) memory_allocate(
+		                                                                                    compressed_data_size );
+
+		if( fwnt_test_lzxpress_huffman_decoder_compressed_data[ data_set_index ] == NULL )
+		{
+			return( -1 );
+		}
+		if( libfwnt_lzxpress_huffman_compress(
+		     fwnt_test_lzxpress_huffman_decoder_uncompressed_data[ data_set_index ],
+		     data_size,
+		     fwnt_test_lzxpress_huffman_decoder_compressed_data[ data_set_index ],
+		     &compressed_data_size,
+		     6,
+		     1,
+		     NULL ) != 1 )
+		{
+			return( -1 );
+		}
+		fwnt_test_lzxpress_huffman_decoder_compressed_data_size[ data_set_index ] = compressed_data_size;
+	}
+	return( 1 );
+}
+
+/* Frees the test data
+ */
+void fwnt_test_lzxpress_huffman_decoder_free_test_data(
+      void )
+{
+	int data_set_index = 0;
+
+	for( data_set_index = 0;
+	     data_set_index < FWNT_TEST_LZXPRESS_HUFFMAN_DECODER_NUMBER_OF_DATA_SETS;
+	     data_set_index++ )
+	{
+		if( fwnt_test_lzxpress_huffman_decoder_compressed_data[ data_set_index ] != NULL )
+		{
+			memory_free(
+			 fwnt_test_lzxpress_huffman_decoder_compressed_data[ data_set_index ] );
+
+			fwnt_test_lzxpress_huffman_decoder_compressed_data[ data_set_index ] = NULL;
+		}
+		if( fwnt_test_lzxpress_huffman_decoder_uncompressed_data[ data_set_index ] != NULL )
+		{
+			memory_free(
+			 fwnt_test_lzxpress_huffman_decoder_uncompressed_data[ data_set_index ] );
+
+			fwnt_test_lzxpress_huffman_decoder_uncompressed_data[ data_set_index ] = NULL;
+		}
+	}
+}
+
+/* Tests the libfwnt_lzxpress_huffman_decoder_initialize function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_lzxpress_huffman_decoder_initialize(
+     void )
+{
+	libcerror_error_t *error                    = NULL;
+	libfwnt_lzxpress_huffman_decoder_t *decoder = NULL;
+	int result                                  = 0;
+
+#if defined( HAVE_FWNT_TEST_MEMORY )
+	int number_of_malloc_fail_tests             = 1;
+	int number_of_memset_fail_tests             = 1;
+	int test_number                             = 0;
+#endif
+
+	/* Test regular cases
+	 */
+	result = libfwnt_lzxpress_huffman_decoder_initialize(
+	          &decoder,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "decoder",
+	 decoder );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_lzxpress_huffman_decoder_free(
+	          &decoder,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "decoder",
+	 decoder );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_lzxpress_huffman_decoder_initialize(
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	decoder = (libfwnt_lzxpress_huffman_decoder_t *) 0x12345678UL;
+
+	result = libfwnt_lzxpress_huffman_decoder_initialize(
+	          &decoder,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	decoder = NULL;
+
+#if defined( HAVE_FWNT_TEST_MEMORY )
+
+	for( test_number = 0;
+	     test_number < number_of_malloc_fail_tests;
+	     test_number++ )
+	{
+		/* Test libfwnt_lzxpress_huffman_decoder_initialize with malloc failing
+		 */
+		fwnt_test_malloc_attempts_before_fail = test_number;
+
+		result = libfwnt_lzxpress_huffman_decoder_initialize(
+		          &decoder,
+		          &error );
+
+		if( fwnt_test_malloc_attempts_before_fail != -1 )
+		{
+			fwnt_test_malloc_attempts_before_fail = -1;
+
+			if( decoder != NULL )
+			{
+				libfwnt_lzxpress_huffman_decoder_free(
+				 &decoder,
+				 NULL );
+			}
+		}
+		else
+		{
+			FWNT_TEST_ASSERT_EQUAL_INT(
+			 "result",
+			 result,
+			 -1 );
+
+			FWNT_TEST_ASSERT_IS_NULL(
+			 "decoder",
+			 decoder );
+
+			FWNT_TEST_ASSERT_IS_NOT_NULL(
+			 "error",
+			 error );
+
+			libcerror_error_free(
+			 &error );
+		}
+	}
+	for( test_number = 0;
+	     test_number < number_of_memset_fail_tests;
+	     test_number++ )
+	{
+		/* Test libfwnt_lzxpress_huffman_decoder_initialize with memset failing
+		 */
+		fwnt_test_memset_attempts_before_fail = test_number;
+
+		result = libfwnt_lzxpress_huffman_decoder_initialize(
+		          &decoder,
+		          &error );
+
+		if( fwnt_test_memset_attempts_before_fail != -1 )
+		{
+			fwnt_test_memset_attempts_before_fail = -1;
+
+			if( decoder != NULL )
+			{
+				libfwnt_lzxpress_huffman_decoder_free(
+				 &decoder,
+				 NULL );
+			}
+		}
+		else
+		{
+			FWNT_TEST_ASSERT_EQUAL_INT(
+			 "result",
+			 result,
+			 -1 );
+
+			FWNT_TEST_ASSERT_IS_NULL(
+			 "decoder",
+			 decoder );
+
+			FWNT_TEST_ASSERT_IS_NOT_NULL(
+			 "error",
+			 error );
+
+			libcerror_error_free(
+			 &error );
+		}
+	}
+#endif /* defined( HAVE_FWNT_TEST_MEMORY ) */
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( decoder != NULL )
+	{
+		libfwnt_lzxpress_huffman_decoder_free(
+		 &decoder,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_lzxpress_huffman_decoder_free function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_lzxpress_huffman_decoder_free(
+     void )
+{
+	libcerror_error_t *error = NULL;
+	int result               = 0;
+
+	/* Test error cases
+	 */
+	result = libfwnt_lzxpress_huffman_decoder_free(
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_lzxpress_huffman_decoder_decompress function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_lzxpress_huffman_decoder_decompress(
+     void )
+{
+	uint8_t invalid_compressed_data[ 512 ];
+
+	libcerror_error_t *error                    = NULL;
+	libfwnt_lzxpress_huffman_decoder_t *decoder = NULL;
+	uint8_t *uncompressed_data                  = NULL;
+	size_t uncompressed_data_size               = 0;
+	int data_set_index                          = 0;
+	int iteration                               = 0;
+	int result                                  = 0;
+
+	/* Initialize test
+	 */
+	result = libfwnt_lzxpress_huffman_decoder_initialize(
+	          &decoder,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "decoder",
+	 decoder );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	uncompressed_data = (uint8_t *) memory_allocate(
+	                                 FWNT_TEST_LZXPRESS_HUFFMAN_DECODER_TEXT_DATA_SIZE );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "uncompressed_data",
+	 uncompressed_data );
+
+	/* Test regular cases, where the decoder is reused for the data sets in turn
+	 */
+	for( iteration = 0;
+	     iteration < 3;
+	     iteration++ )
+	{
+		data_set_index = iteration % FWNT_TEST_LZXPRESS_HUFFMAN_DECODER_NUMBER_OF_DATA_SETS;
+
+		uncompressed_data_size = fwnt_test_lzxpress_huffman_decoder_uncompressed_data_size[ data_set_index ];
+
+		result = libfwnt_lzxpress_huffman_decoder_decompress(
+		          decoder,
+		          fwnt_test_lzxpress_huffman_decoder_compressed_data[ data_set_index ],
+		          fwnt_test_lzxpress_huffman_decoder_compressed_data_size[ data_set_index ],
+		          uncompressed_data,
+		          &uncompressed_data_size,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_EQUAL_SIZE(
+		 "uncompressed_data_size",
+		 uncompressed_data_size,
+		 fwnt_test_lzxpress_huffman_decoder_uncompressed_data_size[ data_set_index ] );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		result = memory_compare(
+		          uncompressed_data,
+		          fwnt_test_lzxpress_huffman_decoder_uncompressed_data[ data_set_index ],
+		          uncompressed_data_size );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 0 );
+	}
+	/* Test error cases
+	 */
+	uncompressed_data_size = FWNT_TEST_LZXPRESS_HUFFMAN_DECODER_TEXT_DATA_SIZE;
+
+	result = libfwnt_lzxpress_huffman_decoder_decompress(
+	          NULL,
+	          fwnt_test_lzxpress_huffman_decoder_compressed_data[ 0 ],
+	          fwnt_test_lzxpress_huffman_decoder_compressed_data_size[ 0 ],
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_lzxpress_huffman_decoder_decompress(
+	          decoder,
+	          NULL,
+	          fwnt_test_lzxpress_huffman_decoder_compressed_data_size[ 0 ],
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_lzxpress_huffman_decoder_decompress(
+	          decoder,
+	          fwnt_test_lzxpress_huffman_decoder_compressed_data[ 0 ],
+	          fwnt_test_lzxpress_huffman_decoder_compressed_data_size[ 0 ],
+	          uncompressed_data,
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test decompress with code sizes that describe more codes than fit in their number of bits
+	 */
+	memory_set(
+	 invalid_compressed_data,
+	 0x11,
+	 512 );
+
+	result = libfwnt_lzxpress_huffman_decoder_decompress(
+	          decoder,
+	          invalid_compressed_data,
+	          512,
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test decompress with code sizes that do not contain any codes
+	 */
+	memory_set(
+	 invalid_compressed_data,
+	 0,
+	 512 );
+
+	result = libfwnt_lzxpress_huffman_decoder_decompress(
+	          decoder,
+	          invalid_compressed_data,
+	          512,
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test that the decoder remains usable after an error
+	 */
+	uncompressed_data_size = fwnt_test_lzxpress_huffman_decoder_uncompressed_data_size[ 1 ];
+
+	result = libfwnt_lzxpress_huffman_decoder_decompress(
+	          decoder,
+	          fwnt_test_lzxpress_huffman_decoder_compressed_data[ 1 ],
+	          fwnt_test_lzxpress_huffman_decoder_compressed_data_size[ 1 ],
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "uncompressed_data_size",
+	 uncompressed_data_size,
+	 (size_t) FWNT_TEST_LZXPRESS_HUFFMAN_DECODER_OTHER_DATA_SIZE );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = memory_compare(
+	          uncompressed_data,
+	          fwnt_test_lzxpress_huffman_decoder_uncompressed_data[ 1 ],
+	          uncompressed_data_size );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* Clean up
+	 */
+	memory_free(
+	 uncompressed_data );
+
+	uncompressed_data = NULL;
+
+	result = libfwnt_lzxpress_huffman_decoder_free(
+	          &decoder,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "decoder",
+	 decoder );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( uncompressed_data != NULL )
+	{
+		memory_free(
+		 uncompressed_data );
+	}
+	if( decoder != NULL )
+	{
+		libfwnt_lzxpress_huffman_decoder_free(
+		 &decoder,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* The main program
+ */
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+int wmain(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     wchar_t * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#else
+int main(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     char * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#endif
+{
+	FWNT_TEST_UNREFERENCED_PARAMETER( argc )
+	FWNT_TEST_UNREFERENCED_PARAMETER( argv )
+
+	if( fwnt_test_lzxpress_huffman_decoder_create_test_data() != 1 )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to create test data.\n" );
+
+		goto on_error;
+	}
+	FWNT_TEST_RUN(
+	 "libfwnt_lzxpress_huffman_decoder_initialize",
+	 fwnt_test_lzxpress_huffman_decoder_initialize );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_lzxpress_huffman_decoder_free",
+	 fwnt_test_lzxpress_huffman_decoder_free );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_lzxpress_huffman_decoder_decompress",
+	 fwnt_test_lzxpress_huffman_decoder_decompress );
+
+	fwnt_test_lzxpress_huffman_decoder_free_test_data();
+
+	return( EXIT_SUCCESS );
+
+on_error:
+	fwnt_test_lzxpress_huffman_decoder_free_test_data();
+
+	return( EXIT_FAILURE );
+}
+
@@ -0,0 +1,642 @@
+/*
+ * Library scan functions testing program
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+
+#include <common.h>
+#include <file_stream.h>
+#include <memory.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+#include "fwnt_test_libcerror.h"
+#include "fwnt_test_libfwnt.h"
+#include "fwnt_test_macros.h"
+#include "fwnt_test_unused.h"
+
+/* The security descriptor contains a DACL at offset 20 with 2 ACEs,
+ * an owner SID at offset 72 and a group SID at offset 100
+ */
+uint8_t fwnt_test_scan_security_descriptor_byte_stream[ 116 ] = {
+	0x01, 0x00, 0x04, 0x80, 0x48, 0x00, 0x00, 0x00, 0x64, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+	0x14, 0x00, 0x00, 0x00, 0x02, 0x00, 0x34, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x14, 0x00,
+	0x9f, 0x01, 0x12, 0x00, 0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x12, 0x00, 0x00, 0x00,
+	0x00, 0x00, 0x18, 0x00, 0x9f, 0x01, 0x12, 0x00, 0x01, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05,
+	0x20, 0x00, 0x00, 0x00, 0x20, 0x02, 0x00, 0x00, 0x01, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05,
+	0x15, 0x00, 0x00, 0x00, 0x52, 0xaa, 0xc8, 0x68, 0xdd, 0xe8, 0xe4, 0x1c, 0x8a, 0xa7, 0x32, 0x3f,
+	0xeb, 0x03, 0x00, 0x00, 0x01, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x20, 0x00, 0x00, 0x00,
+	0x20, 0x02, 0x00, 0x00 };
+
+/* A header that passes the revision and control flags checks but of which the owner offset is not plausible
+ */
+uint8_t fwnt_test_scan_implausible_security_descriptor_byte_stream[ 20 ] = {
+	0x01, 0x00, 0x04, 0x80, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+	0x00, 0x00, 0x00, 0x00 };
+
+/* A SID with an identifier authority that is not well-known
+ */
+uint8_t fwnt_test_scan_implausible_security_identifier_byte_stream[ 12 ] = {
+	0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x12, 0x00, 0x00, 0x00 };
+
+/* Creates the scan test data
+ * The data contains an implausible security descriptor at offset 8, an implausible SID at offset 40
+ * and the security descriptor at the unaligned offset 101 and at offset 256
+ */
+void fwnt_test_scan_initialize_data(
+      uint8_t *data,
+      size_t data_size )
+{
+	memory_set(
+	 data,
+	 0xaa,
+	 data_size );
+
+	memory_copy(
+	 &( data[ 8 ] ),
+	 fwnt_test_scan_implausible_security_descriptor_byte_stream,
+	 20 );
+
+	memory_copy(
+	 &( data[ 40 ] ),
+	 fwnt_test_scan_implausible_security_identifier_byte_stream,
+	 12 );
+
+	memory_copy(
+	 &( data[ 101 ] ),
+	 fwnt_test_scan_security_descriptor_byte_stream,
+	 116 );
+
+	memory_copy(
+	 &( data[ 256 ] ),
+	 fwnt_test_scan_security_descriptor_byte_stream,
+	 116 );
+}
+
+/* Tests the libfwnt_scan_find_security_descriptor function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_scan_find_security_descriptor(
+     void )
+{
+	uint8_t data[ 512 ];
+
+	libcerror_error_t *error = NULL;
+	size_t match_offset      = 0;
+	size_t match_size        = 0;
+	int result               = 0;
+
+	fwnt_test_scan_initialize_data(
+	 data,
+	 512 );
+
+	/* Test regular cases
+	 */
+	result = libfwnt_scan_find_security_descriptor(
+	          data,
+	          512,
+	          0,
+	          512,
+	          1,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "match_offset",
+	 match_offset,
+	 (size_t) 101 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "match_size",
+	 match_size,
+	 (size_t) 116 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_scan_find_security_descriptor(
+	          data,
+	          512,
+	          101 + 116,
+	          512,
+	          1,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "match_offset",
+	 match_offset,
+	 (size_t) 256 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "match_size",
+	 match_size,
+	 (size_t) 116 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test that unaligned candidates are skipped
+	 */
+	result = libfwnt_scan_find_security_descriptor(
+	          data,
+	          512,
+	          1,
+	          512,
+	          4,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "match_offset",
+	 match_offset,
+	 (size_t) 256 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test that a security descriptor can extend beyond the end offset
+	 */
+	result = libfwnt_scan_find_security_descriptor(
+	          data,
+	          512,
+	          200,
+	          257,
+	          1,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "match_offset",
+	 match_offset,
+	 (size_t) 256 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test that candidates at the end offset are not considered
+	 */
+	result = libfwnt_scan_find_security_descriptor(
+	          data,
+	          512,
+	          200,
+	          256,
+	          1,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test that a truncated security descriptor is not found
+	 */
+	result = libfwnt_scan_find_security_descriptor(
+	          data,
+	          300,
+	          200,
+	          300,
+	          1,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_scan_find_security_descriptor(
+	          NULL,
+	          512,
+	          0,
+	          512,
+	          1,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_scan_find_security_descriptor(
+	          data,
+	          (size_t) SSIZE_MAX + 1,
+	          0,
+	          512,
+	          1,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_scan_find_security_descriptor(
+	          data,
+	          512,
+	          256,
+	          200,
+	          1,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_scan_find_security_descriptor(
+	          data,
+	          512,
+	          0,
+	          513,
+	          1,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_scan_find_security_descriptor(
+	          data,
+	          512,
+	          0,
+	          512,
+	          0,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_scan_find_security_descriptor(
+	          data,
+	          512,
+	          0,
+	          512,
+	          1,
+	          NULL,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_scan_find_security_descriptor(
+	          data,
+	          512,
+	          0,
+	          512,
+	          1,
+	          &match_offset,
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_scan_find_security_identifier function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_scan_find_security_identifier(
+     void )
+{
+	uint8_t data[ 512 ];
+
+	libcerror_error_t *error = NULL;
+	size_t match_offset      = 0;
+	size_t match_size        = 0;
+	int result               = 0;
+
+	fwnt_test_scan_initialize_data(
+	 data,
+	 512 );
+
+	/* Test regular cases
+	 */
+	result = libfwnt_scan_find_security_identifier(
+	          data,
+	          512,
+	          0,
+	          512,
+	          1,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "match_offset",
+	 match_offset,
+	 (size_t) ( 101 + 36 ) );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "match_size",
+	 match_size,
+	 (size_t) 12 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_scan_find_security_identifier(
+	          data,
+	          512,
+	          101 + 48,
+	          512,
+	          1,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "match_offset",
+	 match_offset,
+	 (size_t) ( 101 + 56 ) );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "match_size",
+	 match_size,
+	 (size_t) 16 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test that unaligned candidates are skipped
+	 */
+	result = libfwnt_scan_find_security_identifier(
+	          data,
+	          512,
+	          0,
+	          512,
+	          4,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "match_offset",
+	 match_offset,
+	 (size_t) ( 256 + 36 ) );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test that a truncated SID is not found
+	 */
+	result = libfwnt_scan_find_security_identifier(
+	          data,
+	          256 + 40,
+	          256,
+	          256 + 40,
+	          1,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_scan_find_security_identifier(
+	          NULL,
+	          512,
+	          0,
+	          512,
+	          1,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_scan_find_security_identifier(
+	          data,
+	          512,
+	          0,
+	          512,
+	          0,
+	          &match_offset,
+	          &match_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	return( 0 );
+}
+
+/* The main program
+ */
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+int wmain(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     wchar_t * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#else
+int main(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     char * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#endif
+{
+	FWNT_TEST_UNREFERENCED_PARAMETER( argc )
+	FWNT_TEST_UNREFERENCED_PARAMETER( argv )
+
+	FWNT_TEST_RUN(
+	 "libfwnt_scan_find_security_descriptor",
+	 fwnt_test_scan_find_security_descriptor );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_scan_find_security_identifier",
+	 fwnt_test_scan_find_security_identifier );
+
+	return( EXIT_SUCCESS );
+
+on_error:
+	return( EXIT_FAILURE );
+}
+
@@ -21,6 +21,7 @@
 
 #include <common.h>
 #include <file_stream.h>
+#include <memory.h>
 #include <types.h>
 
 #if defined( HAVE_STDLIB_H ) || defined( WINAPI )
@@ -471,16 +472,1222 @@ on_error:
 	return( 0 );
 }
 
+/* Tests the libfwnt_security_descriptor_set_byte_stream function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_security_descriptor_set_byte_stream(
+     void )
+{
+	uint8_t byte_stream[ 116 ];
+
+	libcerror_error_t *error                             = NULL;
+	libfwnt_access_control_entry_t *access_control_entry = NULL;
+	libfwnt_access_control_list_t *discretionary_acl     = NULL;
+	libfwnt_security_descriptor_t *security_descriptor   = NULL;
+	libfwnt_security_identifier_t *security_identifier   = NULL;
+	uint32_t access_mask                                 = 0;
+	int number_of_entries                                = 0;
+	int result                                           = 0;
+
+	/* Initialize test
+	 */
+	result = libfwnt_security_descriptor_initialize(
+	          &security_descriptor,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "security_descriptor",
+	 security_descriptor );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test to set a byte stream that is referenced
+	 */
+	result = libfwnt_security_descriptor_set_byte_stream(
+	          security_descriptor,
+	          fwnt_test_security_descriptor_byte_stream,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_security_descriptor_get_discretionary_acl(
+	          security_descriptor,
+	          &discretionary_acl,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "discretionary_acl",
+	 discretionary_acl );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_list_get_number_of_entries(
+	          discretionary_acl,
+	          &number_of_entries,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "number_of_entries",
+	 number_of_entries,
+	 2 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_list_get_entry_by_index(
+	          discretionary_acl,
+	          1,
+	          &access_control_entry,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "access_control_entry",
+	 access_control_entry );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_entry_get_access_mask(
+	          access_control_entry,
+	          &access_mask,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT32(
+	 "access_mask",
+	 access_mask,
+	 (uint32_t) 0x0012019fUL );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_entry_get_security_identifier(
+	          access_control_entry,
+	          &security_identifier,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "security_identifier",
+	 security_identifier );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_security_identifier_free(
+	          &security_identifier,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_entry_free(
+	          &access_control_entry,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_list_get_entry_by_index(
+	          discretionary_acl,
+	          2,
+	          &access_control_entry,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_access_control_list_free(
+	          &discretionary_acl,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_security_descriptor_set_byte_stream(
+	          security_descriptor,
+	          fwnt_test_security_descriptor_byte_stream,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_security_descriptor_copy_from_byte_stream(
+	          security_descriptor,
+	          fwnt_test_security_descriptor_byte_stream,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_security_descriptor_free(
+	          &security_descriptor,
+	          NULL );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	result = libfwnt_security_descriptor_initialize(
+	          &security_descriptor,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_security_descriptor_set_byte_stream(
+	          NULL,
+	          fwnt_test_security_descriptor_byte_stream,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_security_descriptor_set_byte_stream(
+	          security_descriptor,
+	          NULL,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_security_descriptor_set_byte_stream(
+	          security_descriptor,
+	          fwnt_test_security_descriptor_byte_stream,
+	          0,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_security_descriptor_set_byte_stream(
+	          security_descriptor,
+	          fwnt_test_security_descriptor_byte_stream,
+	          116,
+	          (uint8_t) 'X',
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_security_descriptor_set_byte_stream(
+	          security_descriptor,
+	          fwnt_test_security_descriptor_byte_stream,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          0xfe,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test an access control entry size that exceeds the access control list
+	 */
+	memory_copy(
+	 byte_stream,
+	 fwnt_test_security_descriptor_byte_stream,
+	 116 );
+
+	byte_stream[ 30 ] = 0xff;
+
+	result = libfwnt_security_descriptor_set_byte_stream(
+	          security_descriptor,
+	          byte_stream,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test to set a byte stream that is copied
+	 */
+	memory_copy(
+	 byte_stream,
+	 fwnt_test_security_descriptor_byte_stream,
+	 116 );
+
+	result = libfwnt_security_descriptor_set_byte_stream(
+	          security_descriptor,
+	          byte_stream,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          LIBFWNT_SECURITY_DESCRIPTOR_FLAG_MANAGED,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	memory_set(
+	 byte_stream,
+	 0,
+	 116 );
+
+	result = libfwnt_security_descriptor_get_discretionary_acl(
+	          security_descriptor,
+	          &discretionary_acl,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_list_get_entry_by_index(
+	          discretionary_acl,
+	          0,
+	          &access_control_entry,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_entry_get_security_identifier(
+	          access_control_entry,
+	          &security_identifier,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	libfwnt_security_identifier_free(
+	 &security_identifier,
+	 NULL );
+
+	libfwnt_access_control_entry_free(
+	 &access_control_entry,
+	 NULL );
+
+	libfwnt_access_control_list_free(
+	 &discretionary_acl,
+	 NULL );
+
+	/* Clean up
+	 */
+	result = libfwnt_security_descriptor_free(
+	          &security_descriptor,
+	          NULL );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "security_descriptor",
+	 security_descriptor );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( security_descriptor != NULL )
+	{
+		libfwnt_security_descriptor_free(
+		 &security_descriptor,
+		 NULL );
+	}
+	return( 0 );
+}
+
 /* Tests the libfwnt_security_descriptor_get_owner function
  * Returns 1 if successful or 0 if not
  */
-int fwnt_test_security_descriptor_get_owner(
+int fwnt_test_security_descriptor_get_owner(
+     void )
+{
+	libcerror_error_t *error                           = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	libfwnt_security_identifier_t *owner               = NULL;
+	int owner_is_set                                   = 0;
+	int result                                         = 0;
+
+	/* Initialize test
+	 */
+	result = libfwnt_security_descriptor_initialize(
+	          &security_descriptor,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+        FWNT_TEST_ASSERT_IS_NOT_NULL(
+         "security_descriptor",
+         security_descriptor );
+
+        FWNT_TEST_ASSERT_IS_NULL(
+         "error",
+         error );
+
+	result = libfwnt_security_descriptor_copy_from_byte_stream(
+	          security_descriptor,
+	          fwnt_test_security_descriptor_byte_stream,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+        FWNT_TEST_ASSERT_IS_NULL(
+         "error",
+         error );
+
+	/* Test regular cases
+	 */
+	result = libfwnt_security_descriptor_get_owner(
+	          security_descriptor,
+	          &owner,
+	          &error );
+
+	FWNT_TEST_ASSERT_NOT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	owner_is_set = result;
+
+	if( owner_is_set != 0 )
+	{
+		FWNT_TEST_ASSERT_IS_NOT_NULL(
+		 "owner",
+		 owner );
+
+		result = libfwnt_security_identifier_free(
+		          &owner,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+	}
+	/* Test error cases
+	 */
+	result = libfwnt_security_descriptor_get_owner(
+	          NULL,
+	          &owner,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "owner",
+	 owner );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	if( owner_is_set != 0 )
+	{
+		result = libfwnt_security_descriptor_get_owner(
+		          security_descriptor,
+		          NULL,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 -1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "owner",
+		 owner );
+
+		FWNT_TEST_ASSERT_IS_NOT_NULL(
+		 "error",
+		 error );
+
+		libcerror_error_free(
+		 &error );
+	}
+	/* Clean up
+	 */
+	result = libfwnt_security_descriptor_free(
+	          &security_descriptor,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "security_descriptor",
+	 security_descriptor );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( owner != NULL )
+	{
+		libfwnt_security_identifier_free(
+		 &owner,
+		 NULL );
+	}
+	if( security_descriptor != NULL )
+	{
+		libfwnt_security_descriptor_free(
+		 &security_descriptor,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_security_descriptor_get_group function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_security_descriptor_get_group(
+     void )
+{
+	libcerror_error_t *error                           = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	libfwnt_security_identifier_t *group               = NULL;
+	int group_is_set                                   = 0;
+	int result                                         = 0;
+
+	/* Initialize test
+	 */
+	result = libfwnt_security_descriptor_initialize(
+	          &security_descriptor,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+        FWNT_TEST_ASSERT_IS_NOT_NULL(
+         "security_descriptor",
+         security_descriptor );
+
+        FWNT_TEST_ASSERT_IS_NULL(
+         "error",
+         error );
+
+	result = libfwnt_security_descriptor_copy_from_byte_stream(
+	          security_descriptor,
+	          fwnt_test_security_descriptor_byte_stream,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+        FWNT_TEST_ASSERT_IS_NULL(
+         "error",
+         error );
+
+	/* Test regular cases
+	 */
+	result = libfwnt_security_descriptor_get_group(
+	          security_descriptor,
+	          &group,
+	          &error );
+
+	FWNT_TEST_ASSERT_NOT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	group_is_set = result;
+
+	if( group_is_set != 0 )
+	{
+		FWNT_TEST_ASSERT_IS_NOT_NULL(
+		 "group",
+		 group );
+
+		result = libfwnt_security_identifier_free(
+		          &group,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+	}
+	/* Test error cases
+	 */
+	result = libfwnt_security_descriptor_get_group(
+	          NULL,
+	          &group,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "group",
+	 group );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	if( group_is_set != 0 )
+	{
+		result = libfwnt_security_descriptor_get_group(
+		          security_descriptor,
+		          NULL,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 -1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "group",
+		 group );
+
+		FWNT_TEST_ASSERT_IS_NOT_NULL(
+		 "error",
+		 error );
+
+		libcerror_error_free(
+		 &error );
+	}
+	/* Clean up
+	 */
+	result = libfwnt_security_descriptor_free(
+	          &security_descriptor,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "security_descriptor",
+	 security_descriptor );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( group != NULL )
+	{
+		libfwnt_security_identifier_free(
+		 &group,
+		 NULL );
+	}
+	if( security_descriptor != NULL )
+	{
+		libfwnt_security_descriptor_free(
+		 &security_descriptor,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_security_descriptor_get_discretionary_acl function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_security_descriptor_get_discretionary_acl(
+     void )
+{
+	libcerror_error_t *error                           = NULL;
+	libfwnt_access_control_list_t *discretionary_acl   = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	int discretionary_acl_is_set                       = 0;
+	int result                                         = 0;
+
+	/* Initialize test
+	 */
+	result = libfwnt_security_descriptor_initialize(
+	          &security_descriptor,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+        FWNT_TEST_ASSERT_IS_NOT_NULL(
+         "security_descriptor",
+         security_descriptor );
+
+        FWNT_TEST_ASSERT_IS_NULL(
+         "error",
+         error );
+
+	result = libfwnt_security_descriptor_copy_from_byte_stream(
+	          security_descriptor,
+	          fwnt_test_security_descriptor_byte_stream,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+        FWNT_TEST_ASSERT_IS_NULL(
+         "error",
+         error );
+
+	/* Test regular cases
+	 */
+	result = libfwnt_security_descriptor_get_discretionary_acl(
+	          security_descriptor,
+	          &discretionary_acl,
+	          &error );
+
+	FWNT_TEST_ASSERT_NOT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	discretionary_acl_is_set = result;
+
+	if( discretionary_acl_is_set != 0 )
+	{
+		FWNT_TEST_ASSERT_IS_NOT_NULL(
+		 "discretionary_acl",
+		 discretionary_acl );
+
+		result = libfwnt_access_control_list_free(
+		          &discretionary_acl,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+	}
+	/* Test error cases
+	 */
+	result = libfwnt_security_descriptor_get_discretionary_acl(
+	          NULL,
+	          &discretionary_acl,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "discretionary_acl",
+	 discretionary_acl );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	if( discretionary_acl_is_set != 0 )
+	{
+		result = libfwnt_security_descriptor_get_discretionary_acl(
+		          security_descriptor,
+		          NULL,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 -1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "discretionary_acl",
+		 discretionary_acl );
+
+		FWNT_TEST_ASSERT_IS_NOT_NULL(
+		 "error",
+		 error );
+
+		libcerror_error_free(
+		 &error );
+	}
+	/* Clean up
+	 */
+	result = libfwnt_security_descriptor_free(
+	          &security_descriptor,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "security_descriptor",
+	 security_descriptor );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( discretionary_acl != NULL )
+	{
+		libfwnt_access_control_list_free(
+		 &discretionary_acl,
+		 NULL );
+	}
+	if( security_descriptor != NULL )
+	{
+		libfwnt_security_descriptor_free(
+		 &security_descriptor,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_security_descriptor_get_system_acl function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_security_descriptor_get_system_acl(
+     void )
+{
+	libcerror_error_t *error                           = NULL;
+	libfwnt_access_control_list_t *system_acl          = NULL;
+	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	int result                                         = 0;
+	int system_acl_is_set                              = 0;
+
+	/* Initialize test
+	 */
+	result = libfwnt_security_descriptor_initialize(
+	          &security_descriptor,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+        FWNT_TEST_ASSERT_IS_NOT_NULL(
+         "security_descriptor",
+         security_descriptor );
+
+        FWNT_TEST_ASSERT_IS_NULL(
+         "error",
+         error );
+
+	result = libfwnt_security_descriptor_copy_from_byte_stream(
+	          security_descriptor,
+	          fwnt_test_security_descriptor_byte_stream,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+        FWNT_TEST_ASSERT_IS_NULL(
+         "error",
+         error );
+
+	/* Test regular cases
+	 */
+	result = libfwnt_security_descriptor_get_system_acl(
+	          security_descriptor,
+	          &system_acl,
+	          &error );
+
+	FWNT_TEST_ASSERT_NOT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	system_acl_is_set = result;
+
+	if( system_acl_is_set != 0 )
+	{
+		FWNT_TEST_ASSERT_IS_NOT_NULL(
+		 "system_acl",
+		 system_acl );
+
+		result = libfwnt_access_control_list_free(
+		          &system_acl,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+	}
+	/* Test error cases
+	 */
+	result = libfwnt_security_descriptor_get_system_acl(
+	          NULL,
+	          &system_acl,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "system_acl",
+	 system_acl );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	if( system_acl_is_set != 0 )
+	{
+		result = libfwnt_security_descriptor_get_system_acl(
+		          security_descriptor,
+		          NULL,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 -1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "system_acl",
+		 system_acl );
+
+		FWNT_TEST_ASSERT_IS_NOT_NULL(
+		 "error",
+		 error );
+
+		libcerror_error_free(
+		 &error );
+	}
+	/* Clean up
+	 */
+	result = libfwnt_security_descriptor_free(
+	          &security_descriptor,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "security_descriptor",
+	 security_descriptor );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( system_acl != NULL )
+	{
+		libfwnt_access_control_list_free(
+		 &system_acl,
+		 NULL );
+	}
+	if( security_descriptor != NULL )
+	{
+		libfwnt_security_descriptor_free(
+		 &security_descriptor,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_security_descriptor_copy_to_byte_stream function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_security_descriptor_copy_to_byte_stream(
      void )
 {
+	uint8_t byte_stream[ 128 ];
+
 	libcerror_error_t *error                           = NULL;
 	libfwnt_security_descriptor_t *security_descriptor = NULL;
-	libfwnt_security_identifier_t *owner               = NULL;
-	int owner_is_set                                   = 0;
+	size_t byte_stream_size                            = 0;
 	int result                                         = 0;
 
 	/* Initialize test
@@ -494,13 +1701,41 @@ int fwnt_test_security_descriptor_get_owner(
 	 result,
 	 1 );
 
-        FWNT_TEST_ASSERT_IS_NOT_NULL(
-         "security_descriptor",
-         security_descriptor );
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "security_descriptor",
+	 security_descriptor );
 
-        FWNT_TEST_ASSERT_IS_NULL(
-         "error",
-         error );
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test an empty security descriptor
+	 */
+	result = libfwnt_security_descriptor_copy_to_byte_stream(
+	          security_descriptor,
+	          byte_stream,
+	          128,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = memory_compare(
+	          byte_stream,
+	          "\x01\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00",
+	          20 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
 
 	result = libfwnt_security_descriptor_copy_from_byte_stream(
 	          security_descriptor,
@@ -514,52 +1749,62 @@ int fwnt_test_security_descriptor_get_owner(
 	 result,
 	 1 );
 
-        FWNT_TEST_ASSERT_IS_NULL(
-         "error",
-         error );
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
 
 	/* Test regular cases
 	 */
-	result = libfwnt_security_descriptor_get_owner(
+	result = libfwnt_security_descriptor_get_byte_stream_size(
 	          security_descriptor,
-	          &owner,
+	          &byte_stream_size,
 	          &error );
 
-	FWNT_TEST_ASSERT_NOT_EQUAL_INT(
+	FWNT_TEST_ASSERT_EQUAL_INT(
 	 "result",
 	 result,
-	 -1 );
+	 1 );
 
 	FWNT_TEST_ASSERT_IS_NULL(
 	 "error",
 	 error );
 
-	owner_is_set = result;
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "byte_stream_size",
+	 byte_stream_size,
+	 (size_t) 116 );
 
-	if( owner_is_set != 0 )
-	{
-		FWNT_TEST_ASSERT_IS_NOT_NULL(
-		 "owner",
-		 owner );
+	result = libfwnt_security_descriptor_copy_to_byte_stream(
+	          security_descriptor,
+	          byte_stream,
+	          128,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
 
-		result = libfwnt_security_identifier_free(
-		          &owner,
-		          &error );
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
 
-		FWNT_TEST_ASSERT_EQUAL_INT(
-		 "result",
-		 result,
-		 1 );
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = memory_compare(
+	          byte_stream,
+	          fwnt_test_security_descriptor_byte_stream,
+	          116 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
 
-		FWNT_TEST_ASSERT_IS_NULL(
-		 "error",
-		 error );
-	}
 	/* Test error cases
 	 */
-	result = libfwnt_security_descriptor_get_owner(
+	result = libfwnt_security_descriptor_get_byte_stream_size(
 	          NULL,
-	          &owner,
+	          &byte_stream_size,
 	          &error );
 
 	FWNT_TEST_ASSERT_EQUAL_INT(
@@ -567,9 +1812,22 @@ int fwnt_test_security_descriptor_get_owner(
 	 result,
 	 -1 );
 
-	FWNT_TEST_ASSERT_IS_NULL(
-	 "owner",
-	 owner );
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_security_descriptor_get_byte_stream_size(
+	          security_descriptor,
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
 
 	FWNT_TEST_ASSERT_IS_NOT_NULL(
 	 "error",
@@ -578,29 +1836,82 @@ int fwnt_test_security_descriptor_get_owner(
 	libcerror_error_free(
 	 &error );
 
-	if( owner_is_set != 0 )
-	{
-		result = libfwnt_security_descriptor_get_owner(
-		          security_descriptor,
-		          NULL,
-		          &error );
+	result = libfwnt_security_descriptor_copy_to_byte_stream(
+	          NULL,
+	          byte_stream,
+	          128,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
 
-		FWNT_TEST_ASSERT_EQUAL_INT(
-		 "result",
-		 result,
-		 -1 );
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
 
-		FWNT_TEST_ASSERT_IS_NULL(
-		 "owner",
-		 owner );
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
 
-		FWNT_TEST_ASSERT_IS_NOT_NULL(
-		 "error",
-		 error );
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_security_descriptor_copy_to_byte_stream(
+	          security_descriptor,
+	          NULL,
+	          128,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_security_descriptor_copy_to_byte_stream(
+	          security_descriptor,
+	          byte_stream,
+	          115,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_security_descriptor_copy_to_byte_stream(
+	          security_descriptor,
+	          byte_stream,
+	          128,
+	          -1,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
 
-		libcerror_error_free(
-		 &error );
-	}
 	/* Clean up
 	 */
 	result = libfwnt_security_descriptor_free(
@@ -628,12 +1939,6 @@ on_error:
 		libcerror_error_free(
 		 &error );
 	}
-	if( owner != NULL )
-	{
-		libfwnt_security_identifier_free(
-		 &owner,
-		 NULL );
-	}
 	if( security_descriptor != NULL )
 	{
 		libfwnt_security_descriptor_free(
@@ -643,16 +1948,18 @@ on_error:
 	return( 0 );
 }
 
-/* Tests the libfwnt_security_descriptor_get_group function
+/* Tests the libfwnt_security_descriptor_set_owner function
  * Returns 1 if successful or 0 if not
  */
-int fwnt_test_security_descriptor_get_group(
+int fwnt_test_security_descriptor_set_owner(
      void )
 {
+	uint8_t byte_stream[ 128 ];
+
 	libcerror_error_t *error                           = NULL;
 	libfwnt_security_descriptor_t *security_descriptor = NULL;
-	libfwnt_security_identifier_t *group               = NULL;
-	int group_is_set                                   = 0;
+	libfwnt_security_identifier_t *group_sid           = NULL;
+	size_t byte_stream_size                            = 0;
 	int result                                         = 0;
 
 	/* Initialize test
@@ -666,19 +1973,20 @@ int fwnt_test_security_descriptor_get_group(
 	 result,
 	 1 );
 
-        FWNT_TEST_ASSERT_IS_NOT_NULL(
-         "security_descriptor",
-         security_descriptor );
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "security_descriptor",
+	 security_descriptor );
 
-        FWNT_TEST_ASSERT_IS_NULL(
-         "error",
-         error );
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
 
-	result = libfwnt_security_descriptor_copy_from_byte_stream(
+	result = libfwnt_security_descriptor_set_byte_stream(
 	          security_descriptor,
 	          fwnt_test_security_descriptor_byte_stream,
 	          116,
 	          LIBFWNT_ENDIAN_LITTLE,
+	          0,
 	          &error );
 
 	FWNT_TEST_ASSERT_EQUAL_INT(
@@ -686,97 +1994,73 @@ int fwnt_test_security_descriptor_get_group(
 	 result,
 	 1 );
 
-        FWNT_TEST_ASSERT_IS_NULL(
-         "error",
-         error );
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
 
-	/* Test regular cases
+	/* Test that a security descriptor parsed on demand is stored unmodified
 	 */
-	result = libfwnt_security_descriptor_get_group(
+	result = libfwnt_security_descriptor_copy_to_byte_stream(
 	          security_descriptor,
-	          &group,
+	          byte_stream,
+	          128,
+	          LIBFWNT_ENDIAN_LITTLE,
 	          &error );
 
-	FWNT_TEST_ASSERT_NOT_EQUAL_INT(
+	FWNT_TEST_ASSERT_EQUAL_INT(
 	 "result",
 	 result,
-	 -1 );
+	 1 );
 
 	FWNT_TEST_ASSERT_IS_NULL(
 	 "error",
 	 error );
 
-	group_is_set = result;
-
-	if( group_is_set != 0 )
-	{
-		FWNT_TEST_ASSERT_IS_NOT_NULL(
-		 "group",
-		 group );
-
-		result = libfwnt_security_identifier_free(
-		          &group,
-		          &error );
+	result = memory_compare(
+	          byte_stream,
+	          fwnt_test_security_descriptor_byte_stream,
+	          116 );
 
-		FWNT_TEST_ASSERT_EQUAL_INT(
-		 "result",
-		 result,
-		 1 );
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
 
-		FWNT_TEST_ASSERT_IS_NULL(
-		 "error",
-		 error );
-	}
-	/* Test error cases
+	/* Test setting the owner to the group of the same security descriptor
 	 */
 	result = libfwnt_security_descriptor_get_group(
-	          NULL,
-	          &group,
+	          security_descriptor,
+	          &group_sid,
 	          &error );
 
 	FWNT_TEST_ASSERT_EQUAL_INT(
 	 "result",
 	 result,
-	 -1 );
+	 1 );
 
 	FWNT_TEST_ASSERT_IS_NULL(
-	 "group",
-	 group );
-
-	FWNT_TEST_ASSERT_IS_NOT_NULL(
 	 "error",
 	 error );
 
-	libcerror_error_free(
-	 &error );
-
-	if( group_is_set != 0 )
-	{
-		result = libfwnt_security_descriptor_get_group(
-		          security_descriptor,
-		          NULL,
-		          &error );
+	result = libfwnt_security_descriptor_set_owner(
+	          security_descriptor,
+	          group_sid,
+	          &error );
 
-		FWNT_TEST_ASSERT_EQUAL_INT(
-		 "result",
-		 result,
-		 -1 );
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
 
-		FWNT_TEST_ASSERT_IS_NULL(
-		 "group",
-		 group );
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
 
-		FWNT_TEST_ASSERT_IS_NOT_NULL(
-		 "error",
-		 error );
+	group_sid = NULL;
 
-		libcerror_error_free(
-		 &error );
-	}
-	/* Clean up
-	 */
-	result = libfwnt_security_descriptor_free(
-	          &security_descriptor,
+	result = libfwnt_security_descriptor_get_byte_stream_size(
+	          security_descriptor,
+	          &byte_stream_size,
 	          &error );
 
 	FWNT_TEST_ASSERT_EQUAL_INT(
@@ -785,72 +2069,75 @@ int fwnt_test_security_descriptor_get_group(
 	 1 );
 
 	FWNT_TEST_ASSERT_IS_NULL(
-	 "security_descriptor",
-	 security_descriptor );
+	 "error",
+	 error );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "byte_stream_size",
+	 byte_stream_size,
+	 (size_t) 104 );
+
+	result = libfwnt_security_descriptor_copy_to_byte_stream(
+	          security_descriptor,
+	          byte_stream,
+	          128,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
 
 	FWNT_TEST_ASSERT_IS_NULL(
 	 "error",
 	 error );
 
-	return( 1 );
+	result = memory_compare(
+	          &( byte_stream[ 4 ] ),
+	          "\x48\x00\x00\x00\x58\x00\x00\x00",
+	          8 );
 
-on_error:
-	if( error != NULL )
-	{
-		libcerror_error_free(
-		 &error );
-	}
-	if( group != NULL )
-	{
-		libfwnt_security_identifier_free(
-		 &group,
-		 NULL );
-	}
-	if( security_descriptor != NULL )
-	{
-		libfwnt_security_descriptor_free(
-		 &security_descriptor,
-		 NULL );
-	}
-	return( 0 );
-}
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
 
-/* Tests the libfwnt_security_descriptor_get_discretionary_acl function
- * Returns 1 if successful or 0 if not
- */
-int fwnt_test_security_descriptor_get_discretionary_acl(
-     void )
-{
-	libcerror_error_t *error                           = NULL;
-	libfwnt_access_control_list_t *discretionary_acl   = NULL;
-	libfwnt_security_descriptor_t *security_descriptor = NULL;
-	int discretionary_acl_is_set                       = 0;
-	int result                                         = 0;
+	result = memory_compare(
+	          &( byte_stream[ 20 ] ),
+	          &( fwnt_test_security_descriptor_byte_stream[ 20 ] ),
+	          52 );
 
-	/* Initialize test
-	 */
-	result = libfwnt_security_descriptor_initialize(
-	          &security_descriptor,
-	          &error );
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	result = memory_compare(
+	          &( byte_stream[ 72 ] ),
+	          &( fwnt_test_security_descriptor_byte_stream[ 100 ] ),
+	          16 );
 
 	FWNT_TEST_ASSERT_EQUAL_INT(
 	 "result",
 	 result,
-	 1 );
+	 0 );
 
-        FWNT_TEST_ASSERT_IS_NOT_NULL(
-         "security_descriptor",
-         security_descriptor );
+	result = memory_compare(
+	          &( byte_stream[ 88 ] ),
+	          &( fwnt_test_security_descriptor_byte_stream[ 100 ] ),
+	          16 );
 
-        FWNT_TEST_ASSERT_IS_NULL(
-         "error",
-         error );
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
 
-	result = libfwnt_security_descriptor_copy_from_byte_stream(
+	/* Test removing the owner
+	 */
+	result = libfwnt_security_descriptor_set_owner(
 	          security_descriptor,
-	          fwnt_test_security_descriptor_byte_stream,
-	          116,
-	          LIBFWNT_ENDIAN_LITTLE,
+	          NULL,
 	          &error );
 
 	FWNT_TEST_ASSERT_EQUAL_INT(
@@ -858,52 +2145,60 @@ int fwnt_test_security_descriptor_get_discretionary_acl(
 	 result,
 	 1 );
 
-        FWNT_TEST_ASSERT_IS_NULL(
-         "error",
-         error );
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
 
-	/* Test regular cases
-	 */
-	result = libfwnt_security_descriptor_get_discretionary_acl(
+	result = libfwnt_security_descriptor_get_byte_stream_size(
 	          security_descriptor,
-	          &discretionary_acl,
+	          &byte_stream_size,
 	          &error );
 
-	FWNT_TEST_ASSERT_NOT_EQUAL_INT(
+	FWNT_TEST_ASSERT_EQUAL_INT(
 	 "result",
 	 result,
-	 -1 );
+	 1 );
 
 	FWNT_TEST_ASSERT_IS_NULL(
 	 "error",
 	 error );
 
-	discretionary_acl_is_set = result;
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "byte_stream_size",
+	 byte_stream_size,
+	 (size_t) 88 );
 
-	if( discretionary_acl_is_set != 0 )
-	{
-		FWNT_TEST_ASSERT_IS_NOT_NULL(
-		 "discretionary_acl",
-		 discretionary_acl );
+	result = libfwnt_security_descriptor_copy_to_byte_stream(
+	          security_descriptor,
+	          byte_stream,
+	          128,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
 
-		result = libfwnt_access_control_list_free(
-		          &discretionary_acl,
-		          &error );
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
 
-		FWNT_TEST_ASSERT_EQUAL_INT(
-		 "result",
-		 result,
-		 1 );
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = memory_compare(
+	          &( byte_stream[ 4 ] ),
+	          "\x00\x00\x00\x00\x48\x00\x00\x00",
+	          8 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
 
-		FWNT_TEST_ASSERT_IS_NULL(
-		 "error",
-		 error );
-	}
 	/* Test error cases
 	 */
-	result = libfwnt_security_descriptor_get_discretionary_acl(
+	result = libfwnt_security_descriptor_set_owner(
+	          NULL,
 	          NULL,
-	          &discretionary_acl,
 	          &error );
 
 	FWNT_TEST_ASSERT_EQUAL_INT(
@@ -911,40 +2206,13 @@ int fwnt_test_security_descriptor_get_discretionary_acl(
 	 result,
 	 -1 );
 
-	FWNT_TEST_ASSERT_IS_NULL(
-	 "discretionary_acl",
-	 discretionary_acl );
-
 	FWNT_TEST_ASSERT_IS_NOT_NULL(
 	 "error",
-	 error );
-
-	libcerror_error_free(
-	 &error );
-
-	if( discretionary_acl_is_set != 0 )
-	{
-		result = libfwnt_security_descriptor_get_discretionary_acl(
-		          security_descriptor,
-		          NULL,
-		          &error );
-
-		FWNT_TEST_ASSERT_EQUAL_INT(
-		 "result",
-		 result,
-		 -1 );
-
-		FWNT_TEST_ASSERT_IS_NULL(
-		 "discretionary_acl",
-		 discretionary_acl );
+	 error );
 
-		FWNT_TEST_ASSERT_IS_NOT_NULL(
-		 "error",
-		 error );
+	libcerror_error_free(
+	 &error );
 
-		libcerror_error_free(
-		 &error );
-	}
 	/* Clean up
 	 */
 	result = libfwnt_security_descriptor_free(
@@ -972,12 +2240,6 @@ on_error:
 		libcerror_error_free(
 		 &error );
 	}
-	if( discretionary_acl != NULL )
-	{
-		libfwnt_access_control_list_free(
-		 &discretionary_acl,
-		 NULL );
-	}
 	if( security_descriptor != NULL )
 	{
 		libfwnt_security_descriptor_free(
@@ -987,17 +2249,20 @@ on_error:
 	return( 0 );
 }
 
-/* Tests the libfwnt_security_descriptor_get_system_acl function
+/* Tests the libfwnt_security_descriptor_set_discretionary_acl function
  * Returns 1 if successful or 0 if not
  */
-int fwnt_test_security_descriptor_get_system_acl(
+int fwnt_test_security_descriptor_set_discretionary_acl(
      void )
 {
+	uint8_t byte_stream[ 128 ];
+
 	libcerror_error_t *error                           = NULL;
-	libfwnt_access_control_list_t *system_acl          = NULL;
+	libfwnt_access_control_list_t *access_control_list = NULL;
 	libfwnt_security_descriptor_t *security_descriptor = NULL;
+	size_t byte_stream_size                            = 0;
+	uint16_t control_flags                             = 0;
 	int result                                         = 0;
-	int system_acl_is_set                              = 0;
 
 	/* Initialize test
 	 */
@@ -1010,13 +2275,13 @@ int fwnt_test_security_descriptor_get_system_acl(
 	 result,
 	 1 );
 
-        FWNT_TEST_ASSERT_IS_NOT_NULL(
-         "security_descriptor",
-         security_descriptor );
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "security_descriptor",
+	 security_descriptor );
 
-        FWNT_TEST_ASSERT_IS_NULL(
-         "error",
-         error );
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
 
 	result = libfwnt_security_descriptor_copy_from_byte_stream(
 	          security_descriptor,
@@ -1030,52 +2295,186 @@ int fwnt_test_security_descriptor_get_system_acl(
 	 result,
 	 1 );
 
-        FWNT_TEST_ASSERT_IS_NULL(
-         "error",
-         error );
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
 
-	/* Test regular cases
+	result = libfwnt_security_descriptor_get_control_flags(
+	          security_descriptor,
+	          &control_flags,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "control_flags",
+	 (int) control_flags,
+	 0x8004 );
+
+	/* Test removing the discretionary ACL
 	 */
-	result = libfwnt_security_descriptor_get_system_acl(
+	result = libfwnt_security_descriptor_set_discretionary_acl(
 	          security_descriptor,
-	          &system_acl,
+	          NULL,
 	          &error );
 
-	FWNT_TEST_ASSERT_NOT_EQUAL_INT(
+	FWNT_TEST_ASSERT_EQUAL_INT(
 	 "result",
 	 result,
-	 -1 );
+	 1 );
 
 	FWNT_TEST_ASSERT_IS_NULL(
 	 "error",
 	 error );
 
-	system_acl_is_set = result;
+	result = libfwnt_security_descriptor_get_control_flags(
+	          security_descriptor,
+	          &control_flags,
+	          &error );
 
-	if( system_acl_is_set != 0 )
-	{
-		FWNT_TEST_ASSERT_IS_NOT_NULL(
-		 "system_acl",
-		 system_acl );
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
 
-		result = libfwnt_access_control_list_free(
-		          &system_acl,
-		          &error );
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
 
-		FWNT_TEST_ASSERT_EQUAL_INT(
-		 "result",
-		 result,
-		 1 );
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "control_flags",
+	 (int) control_flags,
+	 0x8000 );
+
+	result = libfwnt_security_descriptor_get_byte_stream_size(
+	          security_descriptor,
+	          &byte_stream_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "byte_stream_size",
+	 byte_stream_size,
+	 (size_t) 64 );
+
+	/* Test setting a discretionary ACL, the ACL present flag is set when stored
+	 */
+	result = libfwnt_security_descriptor_set_control_flags(
+	          security_descriptor,
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_list_initialize(
+	          &access_control_list,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_list_copy_from_byte_stream(
+	          access_control_list,
+	          &( fwnt_test_security_descriptor_byte_stream[ 20 ] ),
+	          52,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_security_descriptor_set_discretionary_acl(
+	          security_descriptor,
+	          access_control_list,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_access_control_list_free(
+	          &access_control_list,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_security_descriptor_copy_to_byte_stream(
+	          security_descriptor,
+	          byte_stream,
+	          128,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = memory_compare(
+	          byte_stream,
+	          fwnt_test_security_descriptor_byte_stream,
+	          116 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
 
-		FWNT_TEST_ASSERT_IS_NULL(
-		 "error",
-		 error );
-	}
 	/* Test error cases
 	 */
-	result = libfwnt_security_descriptor_get_system_acl(
+	result = libfwnt_security_descriptor_set_discretionary_acl(
+	          NULL,
 	          NULL,
-	          &system_acl,
 	          &error );
 
 	FWNT_TEST_ASSERT_EQUAL_INT(
@@ -1083,9 +2482,22 @@ int fwnt_test_security_descriptor_get_system_acl(
 	 result,
 	 -1 );
 
-	FWNT_TEST_ASSERT_IS_NULL(
-	 "system_acl",
-	 system_acl );
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_security_descriptor_get_control_flags(
+	          NULL,
+	          &control_flags,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
 
 	FWNT_TEST_ASSERT_IS_NOT_NULL(
 	 "error",
@@ -1094,29 +2506,40 @@ int fwnt_test_security_descriptor_get_system_acl(
 	libcerror_error_free(
 	 &error );
 
-	if( system_acl_is_set != 0 )
-	{
-		result = libfwnt_security_descriptor_get_system_acl(
-		          security_descriptor,
-		          NULL,
-		          &error );
+	result = libfwnt_security_descriptor_get_control_flags(
+	          security_descriptor,
+	          NULL,
+	          &error );
 
-		FWNT_TEST_ASSERT_EQUAL_INT(
-		 "result",
-		 result,
-		 -1 );
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
 
-		FWNT_TEST_ASSERT_IS_NULL(
-		 "system_acl",
-		 system_acl );
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
 
-		FWNT_TEST_ASSERT_IS_NOT_NULL(
-		 "error",
-		 error );
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_security_descriptor_set_control_flags(
+	          NULL,
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
 
-		libcerror_error_free(
-		 &error );
-	}
 	/* Clean up
 	 */
 	result = libfwnt_security_descriptor_free(
@@ -1144,10 +2567,10 @@ on_error:
 		libcerror_error_free(
 		 &error );
 	}
-	if( system_acl != NULL )
+	if( access_control_list != NULL )
 	{
 		libfwnt_access_control_list_free(
-		 &system_acl,
+		 &access_control_list,
 		 NULL );
 	}
 	if( security_descriptor != NULL )
@@ -1186,6 +2609,10 @@ int main(
 	 "libfwnt_security_descriptor_copy_from_byte_stream",
 	 fwnt_test_security_descriptor_copy_from_byte_stream );
 
+	FWNT_TEST_RUN(
+	 "libfwnt_security_descriptor_set_byte_stream",
+	 fwnt_test_security_descriptor_set_byte_stream );
+
 	FWNT_TEST_RUN(
 	 "libfwnt_security_descriptor_get_owner",
 	 fwnt_test_security_descriptor_get_owner );
@@ -1202,6 +2629,18 @@ int main(
 	 "libfwnt_security_descriptor_get_system_acl",
 	 fwnt_test_security_descriptor_get_system_acl );
 
+	FWNT_TEST_RUN(
+	 "libfwnt_security_descriptor_copy_to_byte_stream",
+	 fwnt_test_security_descriptor_copy_to_byte_stream );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_security_descriptor_set_owner",
+	 fwnt_test_security_descriptor_set_owner );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_security_descriptor_set_discretionary_acl",
+	 fwnt_test_security_descriptor_set_discretionary_acl );
+
 	return( EXIT_SUCCESS );
 
 on_error:
@@ -21,6 +21,7 @@
 
 #include <common.h>
 #include <file_stream.h>
+#include <memory.h>
 #include <types.h>
 
 #if defined( HAVE_STDLIB_H ) || defined( WINAPI )
@@ -465,6 +466,393 @@ on_error:
 	return( 0 );
 }
 
+/* Tests the libfwnt_security_identifier_copy_to_byte_stream function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_security_identifier_copy_to_byte_stream(
+     void )
+{
+	uint8_t byte_stream[ 32 ];
+
+	libcerror_error_t *error                           = NULL;
+	libfwnt_security_identifier_t *security_identifier = NULL;
+	size_t security_identifier_size                    = 0;
+	int result                                         = 0;
+
+	/* Initialize test
+	 */
+	result = libfwnt_security_identifier_initialize(
+	          &security_identifier,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "security_identifier",
+	 security_identifier );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_security_identifier_copy_from_byte_stream(
+	          security_identifier,
+	          fwnt_test_security_identifier_byte_stream,
+	          28,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test regular cases
+	 */
+	result = libfwnt_security_identifier_get_size(
+	          security_identifier,
+	          &security_identifier_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "security_identifier_size",
+	 security_identifier_size,
+	 (size_t) 28 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_security_identifier_copy_to_byte_stream(
+	          security_identifier,
+	          byte_stream,
+	          32,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = memory_compare(
+	          byte_stream,
+	          fwnt_test_security_identifier_byte_stream,
+	          28 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	/* Test error cases
+	 */
+	result = libfwnt_security_identifier_copy_to_byte_stream(
+	          NULL,
+	          byte_stream,
+	          32,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_security_identifier_copy_to_byte_stream(
+	          security_identifier,
+	          NULL,
+	          32,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_security_identifier_copy_to_byte_stream(
+	          security_identifier,
+	          byte_stream,
+	          27,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_security_identifier_copy_to_byte_stream(
+	          security_identifier,
+	          byte_stream,
+	          32,
+	          (uint8_t) 'X',
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libfwnt_security_identifier_free(
+	          &security_identifier,
+	          NULL );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "security_identifier",
+	 security_identifier );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( security_identifier != NULL )
+	{
+		libfwnt_security_identifier_free(
+		 &security_identifier,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_security_identifier_compare function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_security_identifier_compare(
+     void )
+{
+	libcerror_error_t *error                                  = NULL;
+	libfwnt_security_identifier_t *first_security_identifier  = NULL;
+	libfwnt_security_identifier_t *second_security_identifier = NULL;
+	int result                                                = 0;
+
+	/* Initialize test
+	 */
+	result = libfwnt_security_identifier_initialize(
+	          &first_security_identifier,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	result = libfwnt_security_identifier_initialize(
+	          &second_security_identifier,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	result = libfwnt_security_identifier_copy_from_byte_stream(
+	          first_security_identifier,
+	          fwnt_test_security_identifier_byte_stream,
+	          28,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	result = libfwnt_security_identifier_copy_from_byte_stream(
+	          second_security_identifier,
+	          fwnt_test_security_identifier_byte_stream,
+	          28,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test regular cases
+	 */
+	result = libfwnt_security_identifier_compare(
+	          first_security_identifier,
+	          second_security_identifier,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 LIBFWNT_COMPARE_EQUAL );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* The domain SID S-1-5-21-x-y-z is a prefix of the account SID and sorts before it
+	 */
+	( (libfwnt_internal_security_identifier_t *) second_security_identifier )->number_of_sub_authorities = 4;
+
+	result = libfwnt_security_identifier_compare(
+	          first_security_identifier,
+	          second_security_identifier,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 LIBFWNT_COMPARE_GREATER );
+
+	result = libfwnt_security_identifier_compare(
+	          second_security_identifier,
+	          first_security_identifier,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 LIBFWNT_COMPARE_LESS );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_security_identifier_compare(
+	          NULL,
+	          second_security_identifier,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_security_identifier_compare(
+	          first_security_identifier,
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libfwnt_security_identifier_free(
+	          &second_security_identifier,
+	          NULL );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	result = libfwnt_security_identifier_free(
+	          &first_security_identifier,
+	          NULL );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( second_security_identifier != NULL )
+	{
+		libfwnt_security_identifier_free(
+		 &second_security_identifier,
+		 NULL );
+	}
+	if( first_security_identifier != NULL )
+	{
+		libfwnt_security_identifier_free(
+		 &first_security_identifier,
+		 NULL );
+	}
+	return( 0 );
+}
+
 /* Tests the libfwnt_security_identifier_get_string_size function
  * Returns 1 if successful or 0 if not
  */
@@ -1262,6 +1650,14 @@ int main(
 	 "libfwnt_security_identifier_copy_from_byte_stream",
 	 fwnt_test_security_identifier_copy_from_byte_stream );
 
+	FWNT_TEST_RUN(
+	 "libfwnt_security_identifier_copy_to_byte_stream",
+	 fwnt_test_security_identifier_copy_to_byte_stream );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_security_identifier_compare",
+	 fwnt_test_security_identifier_compare );
+
 	FWNT_TEST_RUN(
 	 "libfwnt_security_identifier_get_string_size",
 	 fwnt_test_security_identifier_get_string_size );
@@ -0,0 +1,580 @@
+/*
+ * Library statistics functions testing program
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+
+#include <common.h>
+#include <file_stream.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+#include "fwnt_test_libcerror.h"
+#include "fwnt_test_libfwnt.h"
+#include "fwnt_test_macros.h"
+#include "fwnt_test_unused.h"
+
+/* An uncompressed LZNT1 chunk of 4 bytes
+ */
+uint8_t fwnt_test_statistics_lznt1_compressed_byte_stream[ 6 ] = {
+	0x03, 0x30, 0x61, 0x62, 0x63, 0x64 };
+
+/* The SID: S-1-5-18
+ */
+uint8_t fwnt_test_statistics_security_identifier_byte_stream[ 12 ] = {
+	0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x12, 0x00, 0x00, 0x00 };
+
+/* Tests the libfwnt_statistics_set_enabled function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_statistics_set_enabled(
+     void )
+{
+	libcerror_error_t *error = NULL;
+	int result               = 0;
+
+	/* Test regular cases
+	 */
+	result = libfwnt_statistics_set_enabled(
+	          1,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_statistics_set_enabled(
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_statistics_set_enabled(
+	          2,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_statistics_get_values function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_statistics_get_values(
+     void )
+{
+	uint8_t uncompressed_data[ 16 ];
+	uint8_t utf8_string[ 32 ];
+
+	libcerror_error_t *error                           = NULL;
+	libfwnt_security_identifier_t *security_identifier = NULL;
+	size_t uncompressed_data_size                      = 0;
+	uint64_t elapsed_time                              = 0;
+	uint64_t number_of_calls                           = 0;
+	uint64_t number_of_input_bytes                     = 0;
+	uint64_t number_of_output_bytes                    = 0;
+	int result                                         = 0;
+
+	/* Initialize test
+	 */
+	result = libfwnt_statistics_reset(
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_security_identifier_initialize(
+	          &security_identifier,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "security_identifier",
+	 security_identifier );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test that calls are not counted when disabled
+	 */
+	uncompressed_data_size = 16;
+
+	result = libfwnt_lznt1_decompress(
+	          fwnt_test_statistics_lznt1_compressed_byte_stream,
+	          6,
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_statistics_get_values(
+	          LIBFWNT_STATISTICS_FUNCTION_LZNT1_DECOMPRESS,
+	          &number_of_calls,
+	          &number_of_input_bytes,
+	          &number_of_output_bytes,
+	          &elapsed_time,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT64(
+	 "number_of_calls",
+	 number_of_calls,
+	 (uint64_t) 0 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test that calls are counted when enabled
+	 */
+	result = libfwnt_statistics_set_enabled(
+	          1,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	uncompressed_data_size = 16;
+
+	result = libfwnt_lznt1_decompress(
+	          fwnt_test_statistics_lznt1_compressed_byte_stream,
+	          6,
+	          uncompressed_data,
+	          &uncompressed_data_size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_security_identifier_copy_from_byte_stream(
+	          security_identifier,
+	          fwnt_test_statistics_security_identifier_byte_stream,
+	          12,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_security_identifier_copy_to_utf8_string(
+	          security_identifier,
+	          utf8_string,
+	          32,
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_statistics_set_enabled(
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_statistics_get_values(
+	          LIBFWNT_STATISTICS_FUNCTION_LZNT1_DECOMPRESS,
+	          &number_of_calls,
+	          &number_of_input_bytes,
+	          &number_of_output_bytes,
+	          &elapsed_time,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT64(
+	 "number_of_calls",
+	 number_of_calls,
+	 (uint64_t) 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT64(
+	 "number_of_input_bytes",
+	 number_of_input_bytes,
+	 (uint64_t) 6 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT64(
+	 "number_of_output_bytes",
+	 number_of_output_bytes,
+	 (uint64_t) 4 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_statistics_get_values(
+	          LIBFWNT_STATISTICS_FUNCTION_SECURITY_IDENTIFIER_COPY_FROM_BYTE_STREAM,
+	          &number_of_calls,
+	          &number_of_input_bytes,
+	          &number_of_output_bytes,
+	          &elapsed_time,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT64(
+	 "number_of_calls",
+	 number_of_calls,
+	 (uint64_t) 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT64(
+	 "number_of_input_bytes",
+	 number_of_input_bytes,
+	 (uint64_t) 12 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_statistics_get_values(
+	          LIBFWNT_STATISTICS_FUNCTION_SECURITY_IDENTIFIER_COPY_TO_STRING,
+	          &number_of_calls,
+	          &number_of_input_bytes,
+	          &number_of_output_bytes,
+	          &elapsed_time,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT64(
+	 "number_of_calls",
+	 number_of_calls,
+	 (uint64_t) 1 );
+
+	/* The string "S-1-5-18" including the end-of-string character
+	 */
+	FWNT_TEST_ASSERT_EQUAL_UINT64(
+	 "number_of_output_bytes",
+	 number_of_output_bytes,
+	 (uint64_t) 9 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test that the statistics are cleared by a reset
+	 */
+	result = libfwnt_statistics_reset(
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_statistics_get_values(
+	          LIBFWNT_STATISTICS_FUNCTION_LZNT1_DECOMPRESS,
+	          &number_of_calls,
+	          &number_of_input_bytes,
+	          &number_of_output_bytes,
+	          &elapsed_time,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT64(
+	 "number_of_calls",
+	 number_of_calls,
+	 (uint64_t) 0 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT64(
+	 "elapsed_time",
+	 elapsed_time,
+	 (uint64_t) 0 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_statistics_get_values(
+	          -1,
+	          &number_of_calls,
+	          &number_of_input_bytes,
+	          &number_of_output_bytes,
+	          &elapsed_time,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_statistics_get_values(
+	          LIBFWNT_STATISTICS_FUNCTION_LZNT1_DECOMPRESS,
+	          NULL,
+	          &number_of_input_bytes,
+	          &number_of_output_bytes,
+	          &elapsed_time,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_statistics_get_values(
+	          LIBFWNT_STATISTICS_FUNCTION_LZNT1_DECOMPRESS,
+	          &number_of_calls,
+	          NULL,
+	          &number_of_output_bytes,
+	          &elapsed_time,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_statistics_get_values(
+	          LIBFWNT_STATISTICS_FUNCTION_LZNT1_DECOMPRESS,
+	          &number_of_calls,
+	          &number_of_input_bytes,
+	          NULL,
+	          &elapsed_time,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_statistics_get_values(
+	          LIBFWNT_STATISTICS_FUNCTION_LZNT1_DECOMPRESS,
+	          &number_of_calls,
+	          &number_of_input_bytes,
+	          &number_of_output_bytes,
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libfwnt_security_identifier_free(
+	          &security_identifier,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "security_identifier",
+	 security_identifier );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( security_identifier != NULL )
+	{
+		libfwnt_security_identifier_free(
+		 &security_identifier,
+		 NULL );
+	}
+	libfwnt_statistics_set_enabled(
+	 0,
+	 NULL );
+
+	return( 0 );
+}
+
+/* The main program
+ */
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+int wmain(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     wchar_t * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#else
+int main(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     char * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#endif
+{
+	FWNT_TEST_UNREFERENCED_PARAMETER( argc )
+	FWNT_TEST_UNREFERENCED_PARAMETER( argv )
+
+	FWNT_TEST_RUN(
+	 "libfwnt_statistics_set_enabled",
+	 fwnt_test_statistics_set_enabled );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_statistics_get_values",
+	 fwnt_test_statistics_get_values );
+
+	return( EXIT_SUCCESS );
+
+on_error:
+	return( EXIT_FAILURE );
+}
+
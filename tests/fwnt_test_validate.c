@@ -0,0 +1,585 @@
+/*
+ * Library validation functions testing program
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <file_stream.h>
+#include <memory.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+#include "fwnt_test_libcerror.h"
+#include "fwnt_test_libfwnt.h"
+#include "fwnt_test_macros.h"
+#include "fwnt_test_unused.h"
+
+/* The security descriptor contains a DACL at offset 20 with 2 ACEs,
+ * an owner SID at offset 72 and a group SID at offset 100
+ */
+uint8_t fwnt_test_validate_security_descriptor_byte_stream[ 116 ] = {
+	0x01, 0x00, 0x04, 0x80, 0x48, 0x00, 0x00, 0x00, 0x64, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+	0x14, 0x00, 0x00, 0x00, 0x02, 0x00, 0x34, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x14, 0x00,
+	0x9f, 0x01, 0x12, 0x00, 0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x12, 0x00, 0x00, 0x00,
+	0x00, 0x00, 0x18, 0x00, 0x9f, 0x01, 0x12, 0x00, 0x01, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05,
+	0x20, 0x00, 0x00, 0x00, 0x20, 0x02, 0x00, 0x00, 0x01, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05,
+	0x15, 0x00, 0x00, 0x00, 0x52, 0xaa, 0xc8, 0x68, 0xdd, 0xe8, 0xe4, 0x1c, 0x8a, 0xa7, 0x32, 0x3f,
+	0xeb, 0x03, 0x00, 0x00, 0x01, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x20, 0x00, 0x00, 0x00,
+	0x20, 0x02, 0x00, 0x00 };
+
+/* A single byte modification of the security descriptor test data
+ * and the validation error it is expected to produce
+ */
+typedef struct fwnt_test_validate_modification fwnt_test_validate_modification_t;
+
+struct fwnt_test_validate_modification
+{
+	/* The offset of the modified byte
+	 */
+	size_t offset;
+
+	/* The value of the modified byte
+	 */
+	uint8_t value;
+
+	/* The expected validation error
+	 */
+	int validation_error;
+
+	/* The expected validation error offset
+	 */
+	size_t validation_error_offset;
+};
+
+fwnt_test_validate_modification_t fwnt_test_validate_security_descriptor_modifications[] = {
+	/* Revision */
+	{ 0, 0x02, LIBFWNT_VALIDATION_ERROR_UNSUPPORTED_REVISION, 0 },
+	/* Control flags without self-relative */
+	{ 3, 0x00, LIBFWNT_VALIDATION_ERROR_NOT_SELF_RELATIVE, 2 },
+	/* Owner SID offset beyond the end of the data */
+	{ 4, 0xc8, LIBFWNT_VALIDATION_ERROR_OFFSET_OUT_OF_BOUNDS, 4 },
+	/* Owner SID offset inside the header */
+	{ 4, 0x10, LIBFWNT_VALIDATION_ERROR_OFFSET_OUT_OF_BOUNDS, 4 },
+	/* Unaligned owner SID offset */
+	{ 4, 0x4a, LIBFWNT_VALIDATION_ERROR_OFFSET_NOT_ALIGNED, 4 },
+	/* Owner SID offset pointing at the SID of the second ACE, within the DACL */
+	{ 4, 0x38, LIBFWNT_VALIDATION_ERROR_OVERLAPPING_COMPONENTS, 16 },
+	/* Group SID offset pointing into the owner SID */
+	{ 8, 0x58, LIBFWNT_VALIDATION_ERROR_UNSUPPORTED_SID_REVISION, 88 },
+	/* Owner SID revision */
+	{ 72, 0x02, LIBFWNT_VALIDATION_ERROR_UNSUPPORTED_SID_REVISION, 72 },
+	/* Owner SID number of sub authorities */
+	{ 73, 0x10, LIBFWNT_VALIDATION_ERROR_TOO_MANY_SUB_AUTHORITIES, 72 },
+	/* Group SID number of sub authorities exceeding the data */
+	{ 101, 0x03, LIBFWNT_VALIDATION_ERROR_SID_OUT_OF_BOUNDS, 100 },
+	/* DACL revision */
+	{ 20, 0x01, LIBFWNT_VALIDATION_ERROR_UNSUPPORTED_ACL_REVISION, 20 },
+	/* DACL size exceeding the data */
+	{ 22, 0xf0, LIBFWNT_VALIDATION_ERROR_ACL_SIZE_OUT_OF_BOUNDS, 20 },
+	/* Unaligned DACL size */
+	{ 22, 0x36, LIBFWNT_VALIDATION_ERROR_ACL_SIZE_NOT_ALIGNED, 20 },
+	/* DACL number of entries exceeding the DACL size */
+	{ 24, 0x03, LIBFWNT_VALIDATION_ERROR_ACE_COUNT_OUT_OF_BOUNDS, 24 },
+	/* First ACE size exceeding the DACL size */
+	{ 30, 0x40, LIBFWNT_VALIDATION_ERROR_ACE_SIZE_OUT_OF_BOUNDS, 28 },
+	/* Unaligned first ACE size */
+	{ 30, 0x15, LIBFWNT_VALIDATION_ERROR_ACE_SIZE_NOT_ALIGNED, 28 },
+	/* First ACE as an object type with object flags indicating an object type that does not fit */
+	{ 28, 0x05, LIBFWNT_VALIDATION_ERROR_ACE_DATA_OUT_OF_BOUNDS, 28 },
+	/* First ACE SID number of sub authorities exceeding the ACE size */
+	{ 37, 0x02, LIBFWNT_VALIDATION_ERROR_SID_OUT_OF_BOUNDS, 36 },
+	/* First ACE SID revision */
+	{ 36, 0x00, LIBFWNT_VALIDATION_ERROR_UNSUPPORTED_SID_REVISION, 36 },
+};
+
+/* Tests the libfwnt_validate_security_descriptor function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_validate_security_descriptor(
+     void )
+{
+	uint8_t byte_stream[ 116 ];
+
+	libcerror_error_t *error       = NULL;
+	size_t modification_index      = 0;
+	size_t number_of_modifications = 0;
+	size_t validation_error_offset = 0;
+	int result                     = 0;
+	int validation_error           = 0;
+
+	/* Test regular cases
+	 */
+	result = libfwnt_validate_security_descriptor(
+	          fwnt_test_validate_security_descriptor_byte_stream,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &validation_error,
+	          &validation_error_offset,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "validation_error",
+	 validation_error,
+	 LIBFWNT_VALIDATION_ERROR_NONE );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "validation_error_offset",
+	 validation_error_offset,
+	 (size_t) 0 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test a security descriptor that references the same SID as owner and group
+	 * and an ACE of a type of which the layout is not known
+	 */
+	memory_copy(
+	 byte_stream,
+	 fwnt_test_validate_security_descriptor_byte_stream,
+	 116 );
+
+	byte_stream[ 8 ]  = 0x48;
+	byte_stream[ 48 ] = LIBFWNT_ACCESS_ALLOWED_COMPOUND;
+
+	result = libfwnt_validate_security_descriptor(
+	          byte_stream,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &validation_error,
+	          &validation_error_offset,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test a security descriptor without components
+	 */
+	memory_set(
+	 &( byte_stream[ 4 ] ),
+	 0,
+	 16 );
+
+	result = libfwnt_validate_security_descriptor(
+	          byte_stream,
+	          20,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &validation_error,
+	          &validation_error_offset,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test invalid security descriptors
+	 */
+	result = libfwnt_validate_security_descriptor(
+	          fwnt_test_validate_security_descriptor_byte_stream,
+	          19,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &validation_error,
+	          &validation_error_offset,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "validation_error",
+	 validation_error,
+	 LIBFWNT_VALIDATION_ERROR_DATA_TOO_SMALL );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* The group SID is at the end of the data
+	 */
+	result = libfwnt_validate_security_descriptor(
+	          fwnt_test_validate_security_descriptor_byte_stream,
+	          112,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &validation_error,
+	          &validation_error_offset,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "validation_error",
+	 validation_error,
+	 LIBFWNT_VALIDATION_ERROR_SID_OUT_OF_BOUNDS );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "validation_error_offset",
+	 validation_error_offset,
+	 (size_t) 100 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	number_of_modifications = sizeof( fwnt_test_validate_security_descriptor_modifications )
+	                        / sizeof( fwnt_test_validate_modification_t );
+
+	for( modification_index = 0;
+	     modification_index < number_of_modifications;
+	     modification_index++ )
+	{
+		memory_copy(
+		 byte_stream,
+		 fwnt_test_validate_security_descriptor_byte_stream,
+		 116 );
+
+		byte_stream[ fwnt_test_validate_security_descriptor_modifications[ modification_index ].offset ] =
+			fwnt_test_validate_security_descriptor_modifications[ modification_index ].value;
+
+		result = libfwnt_validate_security_descriptor(
+		          byte_stream,
+		          116,
+		          LIBFWNT_ENDIAN_LITTLE,
+		          &validation_error,
+		          &validation_error_offset,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 0 );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "validation_error",
+		 validation_error,
+		 fwnt_test_validate_security_descriptor_modifications[ modification_index ].validation_error );
+
+		FWNT_TEST_ASSERT_EQUAL_SIZE(
+		 "validation_error_offset",
+		 validation_error_offset,
+		 fwnt_test_validate_security_descriptor_modifications[ modification_index ].validation_error_offset );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+	}
+	/* Test error cases
+	 */
+	result = libfwnt_validate_security_descriptor(
+	          NULL,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &validation_error,
+	          &validation_error_offset,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_validate_security_descriptor(
+	          fwnt_test_validate_security_descriptor_byte_stream,
+	          (size_t) SSIZE_MAX + 1,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &validation_error,
+	          &validation_error_offset,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_validate_security_descriptor(
+	          fwnt_test_validate_security_descriptor_byte_stream,
+	          116,
+	          -1,
+	          &validation_error,
+	          &validation_error_offset,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_validate_security_descriptor(
+	          fwnt_test_validate_security_descriptor_byte_stream,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          NULL,
+	          &validation_error_offset,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_validate_security_descriptor(
+	          fwnt_test_validate_security_descriptor_byte_stream,
+	          116,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &validation_error,
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_validate_access_control_list function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_validate_access_control_list(
+     void )
+{
+	libcerror_error_t *error       = NULL;
+	size_t validation_error_offset = 0;
+	int result                     = 0;
+	int validation_error           = 0;
+
+	/* Test regular cases
+	 */
+	result = libfwnt_validate_access_control_list(
+	          &( fwnt_test_validate_security_descriptor_byte_stream[ 20 ] ),
+	          52,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &validation_error,
+	          &validation_error_offset,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "validation_error",
+	 validation_error,
+	 LIBFWNT_VALIDATION_ERROR_NONE );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test invalid access control lists
+	 */
+	result = libfwnt_validate_access_control_list(
+	          &( fwnt_test_validate_security_descriptor_byte_stream[ 20 ] ),
+	          7,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &validation_error,
+	          &validation_error_offset,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "validation_error",
+	 validation_error,
+	 LIBFWNT_VALIDATION_ERROR_DATA_TOO_SMALL );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_validate_access_control_list(
+	          &( fwnt_test_validate_security_descriptor_byte_stream[ 20 ] ),
+	          48,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &validation_error,
+	          &validation_error_offset,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "validation_error",
+	 validation_error,
+	 LIBFWNT_VALIDATION_ERROR_ACL_SIZE_OUT_OF_BOUNDS );
+
+	FWNT_TEST_ASSERT_EQUAL_SIZE(
+	 "validation_error_offset",
+	 validation_error_offset,
+	 (size_t) 0 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_validate_access_control_list(
+	          NULL,
+	          52,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          &validation_error,
+	          &validation_error_offset,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_validate_access_control_list(
+	          &( fwnt_test_validate_security_descriptor_byte_stream[ 20 ] ),
+	          52,
+	          LIBFWNT_ENDIAN_LITTLE,
+	          NULL,
+	          &validation_error_offset,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	return( 0 );
+}
+
+/* The main program
+ */
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+int wmain(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     wchar_t * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#else
+int main(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     char * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#endif
+{
+	FWNT_TEST_UNREFERENCED_PARAMETER( argc )
+	FWNT_TEST_UNREFERENCED_PARAMETER( argv )
+
+	FWNT_TEST_RUN(
+	 "libfwnt_validate_access_control_list",
+	 fwnt_test_validate_access_control_list );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_validate_security_descriptor",
+	 fwnt_test_validate_security_descriptor );
+
+	return( EXIT_SUCCESS );
+
+on_error:
+	return( EXIT_FAILURE );
+}
+
@@ -0,0 +1,1398 @@
+/*
+ * Library wof_stream type test program
+ *
+ * Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+ *
+ * Refer to AUTHORS for acknowledgements.
+ *
+ * This software is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Lesser General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This software is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Lesser General Public License
+ * along with this software.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#include <common.h>
+#include <byte_stream.h>
+#include <file_stream.h>
+#include <memory.h>
+#include <types.h>
+
+#if defined( HAVE_STDLIB_H ) || defined( WINAPI )
+#include <stdlib.h>
+#endif
+
+#include "fwnt_test_libcerror.h"
+#include "fwnt_test_libfwnt.h"
+#include "fwnt_test_macros.h"
+#include "fwnt_test_memory.h"
+#include "fwnt_test_unused.h"
+
+#include "../libfwnt/libfwnt_wof_stream.h"
+
+/* The test data consists of 11 chunks of 4096 bytes of which the last one
+ * is partial, chunks 5 and 6 are incompressible and stored uncompressed
+ */
+#define FWNT_TEST_WOF_STREAM_CHUNK_SIZE		4096
+#define FWNT_TEST_WOF_STREAM_DATA_SIZE		( ( 10 * FWNT_TEST_WOF_STREAM_CHUNK_SIZE ) + 1234 )
+#define FWNT_TEST_WOF_STREAM_NUMBER_OF_CHUNKS	11
+
+uint8_t *fwnt_test_wof_stream_uncompressed_data = NULL;
+uint8_t *fwnt_test_wof_stream_compressed_data   = NULL;
+size_t fwnt_test_wof_stream_compressed_data_size = 0;
+
+/* Creates the uncompressed test data and its WofCompressedData stream
+ * Returns 1 if successful or -1 on error
+ */
+int fwnt_test_wof_stream_create_test_data(
+     void )
+{
+	uint8_t chunk_data[ 2 * FWNT_TEST_WOF_STREAM_CHUNK_SIZE + 512 ];
+
+	const char *text                = "The quick brown fox jumps over the lazy dog. ";
+	size_t chunk_data_size          = 0;
+	size_t chunk_offset             = 0;
+	size_t chunk_table_size         = 0;
+	size_t compressed_data_offset   = 0;
+	size_t data_offset              = 0;
+	size_t uncompressed_chunk_size  = 0;
+	uint32_t random_value           = 0x12345678UL;
+	int chunk_index                 = 0;
+
+	fwnt_test_wof_stream_uncompressed_data = (uint8_t *) memory_allocate(
+	                                                      FWNT_TEST_WOF_STREAM_DATA_SIZE );
+
+	if( fwnt_test_wof_stream_uncompressed_data == NULL )
+	{
+		return( -1 );
+	}
+	for( data_offset = 0;
+	     data_offset < FWNT_TEST_WOF_STREAM_DATA_SIZE;
+	     data_offset++ )
+	{
+		chunk_index = (int) ( data_offset / FWNT_TEST_WOF_STREAM_CHUNK_SIZE );
+
+		if( ( chunk_index == 5 )
+		 || ( chunk_index == 6 ) )
+		{
+			random_value ^= random_value << 13;
+			random_value ^= random_value >> 17;
+			random_value ^= random_value << 5;
+
+			fwnt_test_wof_stream_uncompressed_data[ data_offset ] = (uint8_t) random_value;
+		}
+		else
+		{
+			fwnt_test_wof_stream_uncompressed_data[ data_offset ] = (uint8_t) text[ ( data_offset + ( data_offset / 997 ) ) % 45 ];
+		}
+	}
+	chunk_table_size = ( FWNT_TEST_WOF_STREAM_NUMBER_OF_CHUNKS - 1 ) * 4;
+
+	fwnt_test_wof_stream_compressed_data = (uint8_t *) memory_allocate(
+	                                                    chunk_table_size + FWNT_TEST_WOF_STREAM_DATA_SIZE );
+
+	if( fwnt_test_wof_stream_compressed_data == NULL )
+	{
+		return( -1 );
+	}
+	compressed_data_offset = chunk_table_size;
+
+	for( chunk_index = 0;
+	     chunk_index < FWNT_TEST_WOF_STREAM_NUMBER_OF_CHUNKS;
+	     chunk_index++ )
+	{
+		chunk_offset            = (size_t) chunk_index * FWNT_TEST_WOF_STREAM_CHUNK_SIZE;
+		uncompressed_chunk_size = FWNT_TEST_WOF_STREAM_DATA_SIZE - chunk_offset;
+
+		if( uncompressed_chunk_size > FWNT_TEST_WOF_STREAM_CHUNK_SIZE )
+		{
+			uncompressed_chunk_size = FWNT_TEST_WOF_STREAM_CHUNK_SIZE;
+		}
+		chunk_data_size = sizeof( chunk_data );
+
+		if( libfwnt_lzxpress_huffman_compress(
+		     &( fwnt_test_wof_stream_uncompressed_data[ chunk_offset ] ),
+		     uncompressed_chunk_size,
+		     chunk_data,
+		     &chunk_data_size,
+		     6,
+		     1,
+		     NULL ) != 1 )
+		{
+			return( -1 );
+		}
+		/* Chunks that do not compress are stored uncompressed
+		 */
+		if( chunk_data_size >= uncompressed_chunk_size )
+		{
+			memory_copy(
+			 &( fwnt_test_wof_stream_compressed_data[ compressed_data_offset ] ),
+			 &( fwnt_test_wof_stream_uncompressed_data[ chunk_offset ] ),
+			 uncompressed_chunk_size );
+
+			compressed_data_offset += uncompressed_chunk_size;
+		}
+		else
+		{
+			memory_copy(
+			 &( fwnt_test_wof_stream_compressed_data[ compressed_data_offset ] ),
+			 chunk_data,
+			 chunk_data_size );
+
+			compressed_data_offset += chunk_data_size;
+		}
+		if( chunk_index < ( FWNT_TEST_WOF_STREAM_NUMBER_OF_CHUNKS - 1 ) )
+		{
+			byte_stream_copy_from_uint32_little_endian(
+			 &( fwnt_test_wof_stream_compressed_data[ chunk_index * 4 ] ),
+			 compressed_data_offset - chunk_table_size );
+		}
+	}
+	fwnt_test_wof_stream_compressed_data_size = compressed_data_offset;
+
+	return( 1 );
+}
+
+/* Frees the test data
+ */
+void fwnt_test_wof_stream_free_test_data(
+      void )
+{
+	if( fwnt_test_wof_stream_compressed_data != NULL )
+	{
+		memory_free(
+		 fwnt_test_wof_stream_compressed_data );
+
+		fwnt_test_wof_stream_compressed_data = NULL;
+	}
+	if( fwnt_test_wof_stream_uncompressed_data != NULL )
+	{
+		memory_free(
+		 fwnt_test_wof_stream_uncompressed_data );
+
+		fwnt_test_wof_stream_uncompressed_data = NULL;
+	}
+}
+
+/* Tests the libfwnt_wof_stream_initialize function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_wof_stream_initialize(
+     void )
+{
+	libcerror_error_t *error         = NULL;
+	libfwnt_wof_stream_t *wof_stream = NULL;
+	int result                       = 0;
+
+#if defined( HAVE_FWNT_TEST_MEMORY )
+	int number_of_malloc_fail_tests  = 1;
+	int number_of_memset_fail_tests  = 1;
+	int test_number                  = 0;
+#endif
+
+	/* Test regular cases
+	 */
+	result = libfwnt_wof_stream_initialize(
+	          &wof_stream,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "wof_stream",
+	 wof_stream );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_wof_stream_free(
+	          &wof_stream,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "wof_stream",
+	 wof_stream );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_wof_stream_initialize(
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	wof_stream = (libfwnt_wof_stream_t *) 0x12345678UL;
+
+	result = libfwnt_wof_stream_initialize(
+	          &wof_stream,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	wof_stream = NULL;
+
+#if defined( HAVE_FWNT_TEST_MEMORY )
+
+	for( test_number = 0;
+	     test_number < number_of_malloc_fail_tests;
+	     test_number++ )
+	{
+		/* Test libfwnt_wof_stream_initialize with malloc failing
+		 */
+		fwnt_test_malloc_attempts_before_fail = test_number;
+
+		result = libfwnt_wof_stream_initialize(
+		          &wof_stream,
+		          &error );
+
+		if( fwnt_test_malloc_attempts_before_fail != -1 )
+		{
+			fwnt_test_malloc_attempts_before_fail = -1;
+
+			if( wof_stream != NULL )
+			{
+				libfwnt_wof_stream_free(
+				 &wof_stream,
+				 NULL );
+			}
+		}
+		else
+		{
+			FWNT_TEST_ASSERT_EQUAL_INT(
+			 "result",
+			 result,
+			 -1 );
+
+			FWNT_TEST_ASSERT_IS_NULL(
+			 "wof_stream",
+			 wof_stream );
+
+			FWNT_TEST_ASSERT_IS_NOT_NULL(
+			 "error",
+			 error );
+
+			libcerror_error_free(
+			 &error );
+		}
+	}
+	for( test_number = 0;
+	     test_number < number_of_memset_fail_tests;
+	     test_number++ )
+	{
+		/* Test libfwnt_wof_stream_initialize with memset failing
+		 */
+		fwnt_test_memset_attempts_before_fail = test_number;
+
+		result = libfwnt_wof_stream_initialize(
+		          &wof_stream,
+		          &error );
+
+		if( fwnt_test_memset_attempts_before_fail != -1 )
+		{
+			fwnt_test_memset_attempts_before_fail = -1;
+
+			if( wof_stream != NULL )
+			{
+				libfwnt_wof_stream_free(
+				 &wof_stream,
+				 NULL );
+			}
+		}
+		else
+		{
+			FWNT_TEST_ASSERT_EQUAL_INT(
+			 "result",
+			 result,
+			 -1 );
+
+			FWNT_TEST_ASSERT_IS_NULL(
+			 "wof_stream",
+			 wof_stream );
+
+			FWNT_TEST_ASSERT_IS_NOT_NULL(
+			 "error",
+			 error );
+
+			libcerror_error_free(
+			 &error );
+		}
+	}
+#endif /* defined( HAVE_FWNT_TEST_MEMORY ) */
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( wof_stream != NULL )
+	{
+		libfwnt_wof_stream_free(
+		 &wof_stream,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_wof_stream_free function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_wof_stream_free(
+     void )
+{
+	libcerror_error_t *error = NULL;
+	int result               = 0;
+
+	/* Test error cases
+	 */
+	result = libfwnt_wof_stream_free(
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_wof_stream_set_compressed_data function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_wof_stream_set_compressed_data(
+     void )
+{
+	uint8_t corrupted_data[ 64 ];
+
+	libcerror_error_t *error         = NULL;
+	libfwnt_wof_stream_t *wof_stream = NULL;
+	size64_t size                    = 0;
+	int result                       = 0;
+
+	result = libfwnt_wof_stream_initialize(
+	          &wof_stream,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "wof_stream",
+	 wof_stream );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test regular cases
+	 */
+	result = libfwnt_wof_stream_set_compressed_data(
+	          wof_stream,
+	          fwnt_test_wof_stream_compressed_data,
+	          fwnt_test_wof_stream_compressed_data_size,
+	          FWNT_TEST_WOF_STREAM_DATA_SIZE,
+	          LIBFWNT_WOF_COMPRESSION_METHOD_XPRESS4K,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_wof_stream_get_size(
+	          wof_stream,
+	          &size,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_UINT64(
+	 "size",
+	 (uint64_t) size,
+	 (uint64_t) FWNT_TEST_WOF_STREAM_DATA_SIZE );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	result = libfwnt_wof_stream_set_compressed_data(
+	          wof_stream,
+	          fwnt_test_wof_stream_compressed_data,
+	          fwnt_test_wof_stream_compressed_data_size,
+	          FWNT_TEST_WOF_STREAM_DATA_SIZE,
+	          LIBFWNT_WOF_COMPRESSION_METHOD_XPRESS4K,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_wof_stream_free(
+	          &wof_stream,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_wof_stream_initialize(
+	          &wof_stream,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_wof_stream_set_compressed_data(
+	          NULL,
+	          fwnt_test_wof_stream_compressed_data,
+	          fwnt_test_wof_stream_compressed_data_size,
+	          FWNT_TEST_WOF_STREAM_DATA_SIZE,
+	          LIBFWNT_WOF_COMPRESSION_METHOD_XPRESS4K,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_wof_stream_set_compressed_data(
+	          wof_stream,
+	          NULL,
+	          fwnt_test_wof_stream_compressed_data_size,
+	          FWNT_TEST_WOF_STREAM_DATA_SIZE,
+	          LIBFWNT_WOF_COMPRESSION_METHOD_XPRESS4K,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_wof_stream_set_compressed_data(
+	          wof_stream,
+	          fwnt_test_wof_stream_compressed_data,
+	          (size_t) SSIZE_MAX + 1,
+	          FWNT_TEST_WOF_STREAM_DATA_SIZE,
+	          LIBFWNT_WOF_COMPRESSION_METHOD_XPRESS4K,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test with an unsupported compression method
+	 */
+	result = libfwnt_wof_stream_set_compressed_data(
+	          wof_stream,
+	          fwnt_test_wof_stream_compressed_data,
+	          fwnt_test_wof_stream_compressed_data_size,
+	          FWNT_TEST_WOF_STREAM_DATA_SIZE,
+	          LIBFWNT_WOF_COMPRESSION_METHOD_LZX,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test with a chunk table that does not fit in the compressed data
+	 */
+	result = libfwnt_wof_stream_set_compressed_data(
+	          wof_stream,
+	          fwnt_test_wof_stream_compressed_data,
+	          16,
+	          FWNT_TEST_WOF_STREAM_DATA_SIZE,
+	          LIBFWNT_WOF_COMPRESSION_METHOD_XPRESS4K,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Test with chunk end offsets that are not increasing
+	 */
+	memory_copy(
+	 corrupted_data,
+	 fwnt_test_wof_stream_compressed_data,
+	 64 );
+
+	byte_stream_copy_from_uint32_little_endian(
+	 &( corrupted_data[ 4 ] ),
+	 0 );
+
+	result = libfwnt_wof_stream_set_compressed_data(
+	          wof_stream,
+	          corrupted_data,
+	          64,
+	          FWNT_TEST_WOF_STREAM_DATA_SIZE,
+	          LIBFWNT_WOF_COMPRESSION_METHOD_XPRESS4K,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libfwnt_wof_stream_free(
+	          &wof_stream,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "wof_stream",
+	 wof_stream );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( wof_stream != NULL )
+	{
+		libfwnt_wof_stream_free(
+		 &wof_stream,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_wof_stream_read_buffer_at_offset function
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_wof_stream_read_buffer_at_offset(
+     void )
+{
+	uint8_t buffer[ FWNT_TEST_WOF_STREAM_DATA_SIZE ];
+
+	libcerror_error_t *error         = NULL;
+	libfwnt_wof_stream_t *wof_stream = NULL;
+	ssize_t read_count               = 0;
+	off64_t offset                   = 0;
+	size_t read_size                 = 0;
+	uint32_t random_value            = 0x9e3779b9UL;
+	int number_of_threads            = 0;
+	int read_index                   = 0;
+	int result                       = 0;
+
+	for( number_of_threads = 1;
+	     number_of_threads <= 4;
+	     number_of_threads += 3 )
+	{
+		result = libfwnt_wof_stream_initialize(
+		          &wof_stream,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		result = libfwnt_wof_stream_set_compressed_data(
+		          wof_stream,
+		          fwnt_test_wof_stream_compressed_data,
+		          fwnt_test_wof_stream_compressed_data_size,
+		          FWNT_TEST_WOF_STREAM_DATA_SIZE,
+		          LIBFWNT_WOF_COMPRESSION_METHOD_XPRESS4K,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		result = libfwnt_wof_stream_set_number_of_threads(
+		          wof_stream,
+		          number_of_threads,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		/* Use a small cache so that cached chunks are replaced
+		 */
+		result = libfwnt_wof_stream_set_maximum_number_of_cached_chunks(
+		          wof_stream,
+		          2,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		/* Test regular cases
+		 */
+		read_count = libfwnt_wof_stream_read_buffer_at_offset(
+		              wof_stream,
+		              buffer,
+		              FWNT_TEST_WOF_STREAM_DATA_SIZE,
+		              0,
+		              &error );
+
+		FWNT_TEST_ASSERT_EQUAL_SSIZE(
+		 "read_count",
+		 read_count,
+		 (ssize_t) FWNT_TEST_WOF_STREAM_DATA_SIZE );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		result = memory_compare(
+		          buffer,
+		          fwnt_test_wof_stream_uncompressed_data,
+		          FWNT_TEST_WOF_STREAM_DATA_SIZE );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 0 );
+
+		/* Test reads that start and end within chunks
+		 */
+		for( read_index = 0;
+		     read_index < 256;
+		     read_index++ )
+		{
+			random_value ^= random_value << 13;
+			random_value ^= random_value >> 17;
+			random_value ^= random_value << 5;
+
+			offset    = (off64_t) ( random_value % FWNT_TEST_WOF_STREAM_DATA_SIZE );
+			read_size = (size_t) ( ( random_value >> 16 ) % ( 3 * FWNT_TEST_WOF_STREAM_CHUNK_SIZE ) );
+
+			read_count = libfwnt_wof_stream_read_buffer_at_offset(
+			              wof_stream,
+			              buffer,
+			              read_size,
+			              offset,
+			              &error );
+
+			if( read_size > (size_t) ( FWNT_TEST_WOF_STREAM_DATA_SIZE - offset ) )
+			{
+				read_size = (size_t) ( FWNT_TEST_WOF_STREAM_DATA_SIZE - offset );
+			}
+			FWNT_TEST_ASSERT_EQUAL_SSIZE(
+			 "read_count",
+			 read_count,
+			 (ssize_t) read_size );
+
+			FWNT_TEST_ASSERT_IS_NULL(
+			 "error",
+			 error );
+
+			result = memory_compare(
+			          buffer,
+			          &( fwnt_test_wof_stream_uncompressed_data[ offset ] ),
+			          read_size );
+
+			FWNT_TEST_ASSERT_EQUAL_INT(
+			 "result",
+			 result,
+			 0 );
+		}
+		/* Test read beyond the end of the data
+		 */
+		read_count = libfwnt_wof_stream_read_buffer_at_offset(
+		              wof_stream,
+		              buffer,
+		              16,
+		              FWNT_TEST_WOF_STREAM_DATA_SIZE,
+		              &error );
+
+		FWNT_TEST_ASSERT_EQUAL_SSIZE(
+		 "read_count",
+		 read_count,
+		 (ssize_t) 0 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+
+		result = libfwnt_wof_stream_free(
+		          &wof_stream,
+		          &error );
+
+		FWNT_TEST_ASSERT_EQUAL_INT(
+		 "result",
+		 result,
+		 1 );
+
+		FWNT_TEST_ASSERT_IS_NULL(
+		 "error",
+		 error );
+	}
+	/* Test error cases
+	 */
+	result = libfwnt_wof_stream_initialize(
+	          &wof_stream,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	read_count = libfwnt_wof_stream_read_buffer_at_offset(
+	              wof_stream,
+	              buffer,
+	              16,
+	              0,
+	              &error );
+
+	FWNT_TEST_ASSERT_EQUAL_SSIZE(
+	 "read_count",
+	 read_count,
+	 (ssize_t) -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_wof_stream_set_compressed_data(
+	          wof_stream,
+	          fwnt_test_wof_stream_compressed_data,
+	          fwnt_test_wof_stream_compressed_data_size,
+	          FWNT_TEST_WOF_STREAM_DATA_SIZE,
+	          LIBFWNT_WOF_COMPRESSION_METHOD_XPRESS4K,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	read_count = libfwnt_wof_stream_read_buffer_at_offset(
+	              NULL,
+	              buffer,
+	              16,
+	              0,
+	              &error );
+
+	FWNT_TEST_ASSERT_EQUAL_SSIZE(
+	 "read_count",
+	 read_count,
+	 (ssize_t) -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	read_count = libfwnt_wof_stream_read_buffer_at_offset(
+	              wof_stream,
+	              NULL,
+	              16,
+	              0,
+	              &error );
+
+	FWNT_TEST_ASSERT_EQUAL_SSIZE(
+	 "read_count",
+	 read_count,
+	 (ssize_t) -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	read_count = libfwnt_wof_stream_read_buffer_at_offset(
+	              wof_stream,
+	              buffer,
+	              (size_t) SSIZE_MAX + 1,
+	              0,
+	              &error );
+
+	FWNT_TEST_ASSERT_EQUAL_SSIZE(
+	 "read_count",
+	 read_count,
+	 (ssize_t) -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	read_count = libfwnt_wof_stream_read_buffer_at_offset(
+	              wof_stream,
+	              buffer,
+	              16,
+	              -1,
+	              &error );
+
+	FWNT_TEST_ASSERT_EQUAL_SSIZE(
+	 "read_count",
+	 read_count,
+	 (ssize_t) -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_wof_stream_set_number_of_threads(
+	          wof_stream,
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_wof_stream_set_maximum_number_of_cached_chunks(
+	          wof_stream,
+	          0,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libfwnt_wof_stream_free(
+	          &wof_stream,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( wof_stream != NULL )
+	{
+		libfwnt_wof_stream_free(
+		 &wof_stream,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* Tests the libfwnt_wof_stream_read_buffer and libfwnt_wof_stream_seek_offset functions
+ * Returns 1 if successful or 0 if not
+ */
+int fwnt_test_wof_stream_read_buffer(
+     void )
+{
+	uint8_t buffer[ 5000 ];
+
+	libcerror_error_t *error         = NULL;
+	libfwnt_wof_stream_t *wof_stream = NULL;
+	ssize_t read_count               = 0;
+	off64_t offset                   = 0;
+	int result                       = 0;
+
+	result = libfwnt_wof_stream_initialize(
+	          &wof_stream,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = libfwnt_wof_stream_set_compressed_data(
+	          wof_stream,
+	          fwnt_test_wof_stream_compressed_data,
+	          fwnt_test_wof_stream_compressed_data_size,
+	          FWNT_TEST_WOF_STREAM_DATA_SIZE,
+	          LIBFWNT_WOF_COMPRESSION_METHOD_XPRESS4K,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test regular cases
+	 */
+	offset = libfwnt_wof_stream_seek_offset(
+	          wof_stream,
+	          -1000,
+	          SEEK_END,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT64(
+	 "offset",
+	 (int64_t) offset,
+	 (int64_t) FWNT_TEST_WOF_STREAM_DATA_SIZE - 1000 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	read_count = libfwnt_wof_stream_read_buffer(
+	              wof_stream,
+	              buffer,
+	              5000,
+	              &error );
+
+	FWNT_TEST_ASSERT_EQUAL_SSIZE(
+	 "read_count",
+	 read_count,
+	 (ssize_t) 1000 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = memory_compare(
+	          buffer,
+	          &( fwnt_test_wof_stream_uncompressed_data[ FWNT_TEST_WOF_STREAM_DATA_SIZE - 1000 ] ),
+	          1000 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	offset = libfwnt_wof_stream_seek_offset(
+	          wof_stream,
+	          100,
+	          SEEK_SET,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT64(
+	 "offset",
+	 (int64_t) offset,
+	 (int64_t) 100 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	read_count = libfwnt_wof_stream_read_buffer(
+	              wof_stream,
+	              buffer,
+	              5000,
+	              &error );
+
+	FWNT_TEST_ASSERT_EQUAL_SSIZE(
+	 "read_count",
+	 read_count,
+	 (ssize_t) 5000 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	result = memory_compare(
+	          buffer,
+	          &( fwnt_test_wof_stream_uncompressed_data[ 100 ] ),
+	          5000 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 0 );
+
+	result = libfwnt_wof_stream_get_offset(
+	          wof_stream,
+	          &offset,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_EQUAL_INT64(
+	 "offset",
+	 (int64_t) offset,
+	 (int64_t) 5100 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	offset = libfwnt_wof_stream_seek_offset(
+	          wof_stream,
+	          -100,
+	          SEEK_CUR,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT64(
+	 "offset",
+	 (int64_t) offset,
+	 (int64_t) 5000 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	/* Test error cases
+	 */
+	offset = libfwnt_wof_stream_seek_offset(
+	          wof_stream,
+	          -1,
+	          SEEK_SET,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT64(
+	 "offset",
+	 (int64_t) offset,
+	 (int64_t) -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	offset = libfwnt_wof_stream_seek_offset(
+	          wof_stream,
+	          0,
+	          -1,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT64(
+	 "offset",
+	 (int64_t) offset,
+	 (int64_t) -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	read_count = libfwnt_wof_stream_read_buffer(
+	              NULL,
+	              buffer,
+	              16,
+	              &error );
+
+	FWNT_TEST_ASSERT_EQUAL_SSIZE(
+	 "read_count",
+	 read_count,
+	 (ssize_t) -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	result = libfwnt_wof_stream_get_offset(
+	          wof_stream,
+	          NULL,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 -1 );
+
+	FWNT_TEST_ASSERT_IS_NOT_NULL(
+	 "error",
+	 error );
+
+	libcerror_error_free(
+	 &error );
+
+	/* Clean up
+	 */
+	result = libfwnt_wof_stream_free(
+	          &wof_stream,
+	          &error );
+
+	FWNT_TEST_ASSERT_EQUAL_INT(
+	 "result",
+	 result,
+	 1 );
+
+	FWNT_TEST_ASSERT_IS_NULL(
+	 "error",
+	 error );
+
+	return( 1 );
+
+on_error:
+	if( error != NULL )
+	{
+		libcerror_error_free(
+		 &error );
+	}
+	if( wof_stream != NULL )
+	{
+		libfwnt_wof_stream_free(
+		 &wof_stream,
+		 NULL );
+	}
+	return( 0 );
+}
+
+/* The main program
+ */
+#if defined( HAVE_WIDE_SYSTEM_CHARACTER )
+int wmain(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     wchar_t * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#else
+int main(
+     int argc FWNT_TEST_ATTRIBUTE_UNUSED,
+     char * const argv[] FWNT_TEST_ATTRIBUTE_UNUSED )
+#endif
+{
+	FWNT_TEST_UNREFERENCED_PARAMETER( argc )
+	FWNT_TEST_UNREFERENCED_PARAMETER( argv )
+
+	if( fwnt_test_wof_stream_create_test_data() != 1 )
+	{
+		fprintf(
+		 stderr,
+		 "Unable to create test data.\n" );
+
+		goto on_error;
+	}
+	FWNT_TEST_RUN(
+	 "libfwnt_wof_stream_initialize",
+	 fwnt_test_wof_stream_initialize );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_wof_stream_free",
+	 fwnt_test_wof_stream_free );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_wof_stream_set_compressed_data",
+	 fwnt_test_wof_stream_set_compressed_data );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_wof_stream_read_buffer_at_offset",
+	 fwnt_test_wof_stream_read_buffer_at_offset );
+
+	FWNT_TEST_RUN(
+	 "libfwnt_wof_stream_read_buffer",
+	 fwnt_test_wof_stream_read_buffer );
+
+	fwnt_test_wof_stream_free_test_data();
+
+	return( EXIT_SUCCESS );
+
+on_error:
+	fwnt_test_wof_stream_free_test_data();
+
+	return( EXIT_FAILURE );
+}
+
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+#
+# ACL functions test script
+#
+# Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+#
+# Refer to AUTHORS for acknowledgements.
+#
+# This software is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this software.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import struct
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "nt_security_descriptor"))
+
+import ACEOperations
+import ACLOperations
+import SIDOperations
+
+
+_EVERYONE_SID = SIDOperations.readableSIDAsBytes("S-1-1-0")
+_LOCAL_SYSTEM_SID = SIDOperations.readableSIDAsBytes("S-1-5-18")
+_ADMINISTRATORS_SID = SIDOperations.readableSIDAsBytes("S-1-5-32-544")
+_USERS_SID = SIDOperations.readableSIDAsBytes("S-1-5-32-545")
+
+
+def _CreateACE(sid_bytes, ace_type=ACEOperations.ACE_TYPE_ACCESS_ALLOWED,
+               ace_flags=0):
+  """Creates an ACE.
+
+  Args:
+    sid_bytes (bytes): trustee SID.
+    ace_type (Optional[int]): ACE type.
+    ace_flags (Optional[int]): ACE flags.
+
+  Returns:
+    bytes: ACE.
+  """
+  return ACEOperations.constructSimpleACE(
+      ace_type, ace_flags, ACEOperations.ACCESS_MASK_READ_CONTROL, sid_bytes)
+
+
+def _CreateACL(aces):
+  """Creates an ACL.
+
+  Args:
+    aces (list[bytes]): ACEs in order.
+
+  Returns:
+    bytes: ACL.
+  """
+  aces_data = b"".join(aces)
+  return struct.pack(
+      "<BBHHH", 2, 0, 8 + len(aces_data), len(aces), 0) + aces_data
+
+
+class ACLOperationsTests(unittest.TestCase):
+  """Tests the ACL functions."""
+
+  _DENY = ACEOperations.ACE_TYPE_ACCESS_DENIED
+
+  def test_add_ace_to_acl(self):
+    """Tests the addACEtoACL function."""
+    first_deny_ace = _CreateACE(_EVERYONE_SID, self._DENY)
+    second_deny_ace = _CreateACE(_USERS_SID, self._DENY)
+    allow_ace = _CreateACE(_LOCAL_SYSTEM_SID)
+
+    # An ACE that ranks below every ACE in the ACL is appended.
+    acl = ACLOperations.addACEtoACL(
+        _CreateACL([first_deny_ace, second_deny_ace]), allow_ace)
+    self.assertEqual(
+        acl, _CreateACL([first_deny_ace, second_deny_ace, allow_ace]))
+
+    acl = ACLOperations.addACEtoACL(_CreateACL([allow_ace]), first_deny_ace)
+    self.assertEqual(acl, _CreateACL([first_deny_ace, allow_ace]))
+
+    with self.assertRaises(Exception):
+      ACLOperations.addACEtoACL(b"", allow_ace)
+
+  def test_get_ace_canonical_group(self):
+    """Tests the getACECanonicalGroup function."""
+    acl = _CreateACL([
+        _CreateACE(_EVERYONE_SID, self._DENY),
+        _CreateACE(_LOCAL_SYSTEM_SID),
+        _CreateACE(
+            _USERS_SID, self._DENY, ACEOperations.ACE_FLAG_INHERITED)])
+    groups = [
+        ACLOperations.getACECanonicalGroup(acl, ace_offset)
+        for ace_offset, _ in ACLOperations.getACEPositionsList(acl)]
+    self.assertEqual(groups, [0, 1, 2])
+
+  def test_get_non_canonical_ace_index(self):
+    """Tests the getNonCanonicalACEIndex and aclIsCanonical functions."""
+    deny_ace = _CreateACE(_EVERYONE_SID, self._DENY)
+    allow_ace = _CreateACE(_LOCAL_SYSTEM_SID)
+    inherited_ace = _CreateACE(
+        _USERS_SID, ace_flags=ACEOperations.ACE_FLAG_INHERITED)
+    inherited_deny_ace = _CreateACE(
+        _USERS_SID, self._DENY, ACEOperations.ACE_FLAG_INHERITED)
+
+    acl = _CreateACL([deny_ace, allow_ace, inherited_ace, inherited_deny_ace])
+    self.assertEqual(ACLOperations.getNonCanonicalACEIndex(acl), -1)
+    self.assertTrue(ACLOperations.aclIsCanonical(acl))
+
+    acl = _CreateACL([deny_ace, allow_ace, deny_ace])
+    self.assertEqual(ACLOperations.getNonCanonicalACEIndex(acl), 2)
+    self.assertFalse(ACLOperations.aclIsCanonical(acl))
+
+    acl = _CreateACL([inherited_ace, allow_ace])
+    self.assertEqual(ACLOperations.getNonCanonicalACEIndex(acl), 1)
+
+    self.assertTrue(ACLOperations.aclIsCanonical(b""))
+
+  def test_canonicalize_acl(self):
+    """Tests the canonicalizeACL function."""
+    first_deny_ace = _CreateACE(_EVERYONE_SID, self._DENY)
+    second_deny_ace = _CreateACE(_USERS_SID, self._DENY)
+    first_allow_ace = _CreateACE(_LOCAL_SYSTEM_SID)
+    second_allow_ace = _CreateACE(_ADMINISTRATORS_SID)
+    inherited_allow_ace = _CreateACE(
+        _USERS_SID, ace_flags=ACEOperations.ACE_FLAG_INHERITED)
+    inherited_deny_ace = _CreateACE(
+        _EVERYONE_SID, self._DENY, ACEOperations.ACE_FLAG_INHERITED)
+
+    # The sort is stable: ACEs keep their relative order within each group
+    # and inherited deny ACEs stay after inherited allow ACEs.
+    acl = ACLOperations.canonicalizeACL(_CreateACL([
+        first_allow_ace, inherited_allow_ace, first_deny_ace,
+        second_allow_ace, inherited_deny_ace, second_deny_ace]))
+    self.assertEqual(acl, _CreateACL([
+        first_deny_ace, second_deny_ace, first_allow_ace, second_allow_ace,
+        inherited_allow_ace, inherited_deny_ace]))
+    self.assertTrue(ACLOperations.aclIsCanonical(acl))
+
+    # An ACL that is already canonical is returned as-is.
+    self.assertIs(ACLOperations.canonicalizeACL(acl), acl)
+    self.assertEqual(ACLOperations.canonicalizeACL(b""), b"")
+
+
+if __name__ == "__main__":
+  unittest.main(verbosity=2)
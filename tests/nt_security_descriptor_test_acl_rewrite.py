@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+#
+# ACL rewrite functions test script
+#
+# Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+#
+# Refer to AUTHORS for acknowledgements.
+#
+# This software is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this software.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import struct
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "nt_security_descriptor"))
+
+import ACEOperations
+import ACLOperations
+import ACLRewriteOperations
+import SDOperations
+import SIDOperations
+
+
+# Security descriptor with a DACL of 2 access allowed ACEs, stored before the
+# owner and group SIDs.
+_SECURITY_DESCRIPTOR_DATA = bytes(bytearray([
+    0x01, 0x00, 0x04, 0x80, 0x48, 0x00, 0x00, 0x00, 0x64, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 0x02, 0x00, 0x34, 0x00,
+    0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x14, 0x00, 0x9f, 0x01, 0x12, 0x00,
+    0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x12, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x18, 0x00, 0x9f, 0x01, 0x12, 0x00, 0x01, 0x02, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x05, 0x20, 0x00, 0x00, 0x00, 0x20, 0x02, 0x00, 0x00,
+    0x01, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x15, 0x00, 0x00, 0x00,
+    0x52, 0xaa, 0xc8, 0x68, 0xdd, 0xe8, 0xe4, 0x1c, 0x8a, 0xa7, 0x32, 0x3f,
+    0xeb, 0x03, 0x00, 0x00, 0x01, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05,
+    0x20, 0x00, 0x00, 0x00, 0x20, 0x02, 0x00, 0x00]))
+
+_EVERYONE_SID = SIDOperations.readableSIDAsBytes("S-1-1-0")
+_LOCAL_SYSTEM_SID = SIDOperations.readableSIDAsBytes("S-1-5-18")
+_ADMINISTRATORS_SID = SIDOperations.readableSIDAsBytes("S-1-5-32-544")
+
+_READ_MASK = 0x0012019f
+_FULL_CONTROL_MASK = 0x001f01ff
+
+
+def _CreateACE(sid_bytes, mask=_READ_MASK,
+               ace_type=ACEOperations.ACE_TYPE_ACCESS_ALLOWED):
+  """Creates an ACE.
+
+  Args:
+    sid_bytes (bytes): trustee SID.
+    mask (Optional[int]): access mask.
+    ace_type (Optional[int]): ACE type.
+
+  Returns:
+    bytes: ACE.
+  """
+  return ACEOperations.constructSimpleACE(ace_type, 0, mask, sid_bytes)
+
+
+def _CreateACL(aces):
+  """Creates an ACL.
+
+  Args:
+    aces (list[bytes]): ACEs in order.
+
+  Returns:
+    bytes: ACL.
+  """
+  aces_data = b"".join(aces)
+  return struct.pack(
+      "<BBHHH", 2, 0, 8 + len(aces_data), len(aces), 0) + aces_data
+
+
+def _CreateSecurityDescriptor(parts):
+  """Creates a self-relative security descriptor with the DACL present.
+
+  Args:
+    parts (list[tuple[int, bytes]]): header offset field (4 owner, 8 group,
+        16 DACL) and data of each part, in the order they are stored.
+
+  Returns:
+    bytes: security descriptor.
+  """
+  header = bytearray(struct.pack("<BBHIIII", 1, 0, 0x8004, 0, 0, 0, 0))
+  data = b""
+  for header_offset, part_data in parts:
+    struct.pack_into("<I", header, header_offset, 20 + len(data))
+    data += part_data
+  return bytes(header) + data
+
+
+class ACLRewriteOperationsTests(unittest.TestCase):
+  """Tests the ACL rewrite functions."""
+
+  def test_rewrite_acl_match_and_transform(self):
+    """Tests rewriteACL with matching and transforming rules."""
+    system_ace = _CreateACE(_LOCAL_SYSTEM_SID)
+    administrators_ace = _CreateACE(_ADMINISTRATORS_SID, _FULL_CONTROL_MASK)
+    deny_ace = _CreateACE(
+        _EVERYONE_SID, ace_type=ACEOperations.ACE_TYPE_ACCESS_DENIED)
+    acl = _CreateACL([deny_ace, system_ace, administrators_ace])
+
+    rules = [
+        ([(ACLRewriteOperations.MATCH_TRUSTEE, _LOCAL_SYSTEM_SID)],
+         [(ACLRewriteOperations.TRANSFORM_REPLACE_TRUSTEE,
+           _ADMINISTRATORS_SID)]),
+        ([(ACLRewriteOperations.MATCH_MASK_ALL, _FULL_CONTROL_MASK)],
+         [(ACLRewriteOperations.TRANSFORM_CLEAR_MASK,
+           ACEOperations.ACCESS_MASK_WRITE_DACL)]),
+        ([(ACLRewriteOperations.MATCH_TYPE,
+           (ACEOperations.ACE_TYPE_ACCESS_DENIED, ))],
+         [(ACLRewriteOperations.TRANSFORM_DROP, )])]
+    new_acl, affected = ACLRewriteOperations.rewriteACL(acl, rules)
+
+    replaced_ace = _CreateACE(_ADMINISTRATORS_SID)
+    cleared_ace = _CreateACE(
+        _ADMINISTRATORS_SID,
+        _FULL_CONTROL_MASK & ~ACEOperations.ACCESS_MASK_WRITE_DACL)
+    self.assertEqual(new_acl, _CreateACL([replaced_ace, cleared_ace]))
+    self.assertEqual(affected, [
+        (ACLOperations.ACL_TYPE_DACL, 0, deny_ace, None),
+        (ACLOperations.ACL_TYPE_DACL, 1, system_ace, replaced_ace),
+        (ACLOperations.ACL_TYPE_DACL, 2, administrators_ace, cleared_ace)])
+
+    # Later rules see the rewritten ACE.
+    rules = [
+        ([(ACLRewriteOperations.MATCH_TRUSTEE, _LOCAL_SYSTEM_SID)],
+         [(ACLRewriteOperations.TRANSFORM_REPLACE_TRUSTEE, _EVERYONE_SID)]),
+        ([(ACLRewriteOperations.MATCH_TRUSTEE, _EVERYONE_SID)],
+         [(ACLRewriteOperations.TRANSFORM_SET_FLAGS,
+           ACEOperations.ACE_FLAG_CONTAINER_INHERIT)])]
+    new_acl, _ = ACLRewriteOperations.rewriteACL(
+        _CreateACL([system_ace]), rules)
+    new_ace = ACLOperations.getACEList(new_acl)[0]
+    self.assertEqual(ACEOperations.getACETrusteeSID(new_ace), _EVERYONE_SID)
+    self.assertEqual(
+        ACEOperations.getACEFlags(new_ace),
+        ACEOperations.ACE_FLAG_CONTAINER_INHERIT)
+
+  def test_rewrite_acl_unaffected(self):
+    """Tests rewriteACL with rules that do not match."""
+    acl = _CreateACL([_CreateACE(_LOCAL_SYSTEM_SID)])
+    rules = [
+        ([(ACLRewriteOperations.MATCH_TRUSTEE, _EVERYONE_SID)],
+         [(ACLRewriteOperations.TRANSFORM_DROP, )])]
+
+    new_acl, affected = ACLRewriteOperations.rewriteACL(acl, rules)
+    self.assertIs(new_acl, acl)
+    self.assertEqual(affected, [])
+
+    self.assertEqual(ACLRewriteOperations.rewriteACL(b"", rules), (b"", []))
+
+    with self.assertRaises(Exception):
+      ACLRewriteOperations.rewriteACL(acl, [([(99, None)], [])])
+
+  def test_rewrite_acl_dry_run(self):
+    """Tests rewriteACL in dry-run mode."""
+    system_ace = _CreateACE(_LOCAL_SYSTEM_SID)
+    acl = _CreateACL([system_ace])
+    rules = [
+        ([(ACLRewriteOperations.MATCH_TRUSTEE, _LOCAL_SYSTEM_SID)],
+         [(ACLRewriteOperations.TRANSFORM_DROP, )])]
+
+    new_acl, affected = ACLRewriteOperations.rewriteACL(acl, rules, dryRun=True)
+    self.assertIsNone(new_acl)
+    self.assertEqual(
+        affected, [(ACLOperations.ACL_TYPE_DACL, 0, system_ace, None)])
+
+    # All ACEs removed leaves an empty ACL rather than no ACL.
+    new_acl, _ = ACLRewriteOperations.rewriteACL(acl, rules)
+    self.assertEqual(new_acl, _CreateACL([]))
+
+  def test_rewrite_acl_maximum_size(self):
+    """Tests rewriteACL on an ACL that grows beyond the maximum size."""
+    # 3276 ACEs of 20 bytes each make an ACL of 65528 bytes, replacing their
+    # trustee with a SID 4 bytes longer grows it beyond 65535 bytes.
+    acl = _CreateACL([_CreateACE(_LOCAL_SYSTEM_SID)] * 3276)
+    rules = [
+        ([(ACLRewriteOperations.MATCH_TRUSTEE, _LOCAL_SYSTEM_SID)],
+         [(ACLRewriteOperations.TRANSFORM_REPLACE_TRUSTEE,
+           _ADMINISTRATORS_SID)])]
+
+    with self.assertRaisesRegexp(Exception, "maximum ACL size"):
+      ACLRewriteOperations.rewriteACL(acl, rules)
+
+    _, affected = ACLRewriteOperations.rewriteACL(acl, rules, dryRun=True)
+    self.assertEqual(len(affected), 3276)
+
+  def test_rewrite_security_descriptor(self):
+    """Tests rewriteSecurityDescriptor."""
+    rules = [
+        ([(ACLRewriteOperations.MATCH_TRUSTEE, _LOCAL_SYSTEM_SID)],
+         [(ACLRewriteOperations.TRANSFORM_SET_MASK, _FULL_CONTROL_MASK)]),
+        ([(ACLRewriteOperations.MATCH_TRUSTEE, _ADMINISTRATORS_SID)],
+         [(ACLRewriteOperations.TRANSFORM_REPLACE_TRUSTEE, _EVERYONE_SID)])]
+
+    new_sd, affected = ACLRewriteOperations.rewriteSecurityDescriptor(
+        _SECURITY_DESCRIPTOR_DATA, rules)
+    self.assertEqual(len(affected), 2)
+
+    new_dacl = SDOperations.aclBytes(new_sd, ACLOperations.ACL_TYPE_DACL)
+    self.assertEqual(new_dacl, _CreateACL([
+        _CreateACE(_LOCAL_SYSTEM_SID, _FULL_CONTROL_MASK),
+        _CreateACE(_EVERYONE_SID)]))
+    self.assertEqual(
+        SDOperations.getOwnerSIDBytes(new_sd),
+        SDOperations.getOwnerSIDBytes(_SECURITY_DESCRIPTOR_DATA))
+    self.assertEqual(SDOperations.getGroupSIDBytes(new_sd), _ADMINISTRATORS_SID)
+    self.assertEqual(new_sd[:4], _SECURITY_DESCRIPTOR_DATA[:4])
+
+    new_sd, affected = ACLRewriteOperations.rewriteSecurityDescriptor(
+        _SECURITY_DESCRIPTOR_DATA, rules, dryRun=True)
+    self.assertIsNone(new_sd)
+    self.assertEqual(len(affected), 2)
+
+    new_sd, affected = ACLRewriteOperations.rewriteSecurityDescriptor(
+        _SECURITY_DESCRIPTOR_DATA, rules,
+        lstACLTypes=(ACLOperations.ACL_TYPE_SACL, ))
+    self.assertIs(new_sd, _SECURITY_DESCRIPTOR_DATA)
+    self.assertEqual(affected, [])
+
+  def test_rewrite_security_descriptor_part_order(self):
+    """Tests that rewriteSecurityDescriptor keeps the original part order."""
+    rules = [
+        ([(ACLRewriteOperations.MATCH_TRUSTEE, _LOCAL_SYSTEM_SID)],
+         [(ACLRewriteOperations.TRANSFORM_REPLACE_TRUSTEE,
+           _ADMINISTRATORS_SID)])]
+    dacl = _CreateACL([_CreateACE(_LOCAL_SYSTEM_SID)])
+    new_dacl = _CreateACL([_CreateACE(_ADMINISTRATORS_SID)])
+
+    # The test descriptor stores the DACL before the owner and group, the
+    # DACL grows by 4 bytes so the SIDs move up.
+    new_sd, _ = ACLRewriteOperations.rewriteSecurityDescriptor(
+        _CreateSecurityDescriptor([
+            (16, dacl), (4, _EVERYONE_SID), (8, _LOCAL_SYSTEM_SID)]), rules)
+    self.assertEqual(new_sd, _CreateSecurityDescriptor([
+        (16, new_dacl), (4, _EVERYONE_SID), (8, _LOCAL_SYSTEM_SID)]))
+
+    new_sd, _ = ACLRewriteOperations.rewriteSecurityDescriptor(
+        _CreateSecurityDescriptor([
+            (4, _EVERYONE_SID), (16, dacl), (8, _LOCAL_SYSTEM_SID)]), rules)
+    self.assertEqual(new_sd, _CreateSecurityDescriptor([
+        (4, _EVERYONE_SID), (16, new_dacl), (8, _LOCAL_SYSTEM_SID)]))
+
+  def test_rewrite_security_descriptors_batch(self):
+    """Tests rewriteSecurityDescriptorsBatch."""
+    rules = [
+        ([(ACLRewriteOperations.MATCH_TRUSTEE, _LOCAL_SYSTEM_SID)],
+         [(ACLRewriteOperations.TRANSFORM_DROP, )])]
+    unaffected_sd = _CreateSecurityDescriptor([
+        (4, _EVERYONE_SID), (8, _EVERYONE_SID),
+        (16, _CreateACL([_CreateACE(_EVERYONE_SID)]))])
+    security_descriptors = [
+        _SECURITY_DESCRIPTOR_DATA, unaffected_sd, _SECURITY_DESCRIPTOR_DATA]
+
+    expected_results = [
+        ACLRewriteOperations.rewriteSecurityDescriptor(sd, rules)
+        for sd in security_descriptors]
+    self.assertEqual(expected_results[1], (unaffected_sd, []))
+
+    for workers in (1, 2):
+      results = ACLRewriteOperations.rewriteSecurityDescriptorsBatch(
+          security_descriptors, rules, workers=workers)
+      self.assertEqual(results, expected_results)
+
+    results = ACLRewriteOperations.rewriteSecurityDescriptorsBatch(
+        security_descriptors, rules, dryRun=True, workers=1)
+    self.assertEqual([new_sd for new_sd, _ in results], [None] * 3)
+    self.assertEqual(
+        [len(affected) for _, affected in results], [1, 0, 1])
+
+
+if __name__ == "__main__":
+  unittest.main(verbosity=2)
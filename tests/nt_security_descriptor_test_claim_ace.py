@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+#
+# Claim ACE functions test script
+#
+# Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+#
+# Refer to AUTHORS for acknowledgements.
+#
+# This software is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this software.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import struct
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "nt_security_descriptor"))
+
+import ACEOperations
+import ClaimACEOperations
+import SIDOperations
+
+
+_EVERYONE_SID = SIDOperations.readableSIDAsBytes("S-1-1-0")
+_USERS_SID = SIDOperations.readableSIDAsBytes("S-1-5-32-545")
+
+
+def _CreateClaimACE(claim_data):
+  """Creates a system resource attribute ACE.
+
+  Args:
+    claim_data (bytes): CLAIM_SECURITY_ATTRIBUTE_RELATIVE_V1 structure.
+
+  Returns:
+    bytes: ACE.
+  """
+  return ACEOperations.constructSystemResourceAttributeACE(
+      0, 0, _EVERYONE_SID, claim_data)
+
+
+def _PatchClaim(claim_data, offset, format_string, value):
+  """Overwrites a value in a claim.
+
+  Args:
+    claim_data (bytes): CLAIM_SECURITY_ATTRIBUTE_RELATIVE_V1 structure.
+    offset (int): offset of the value relative to the start of the claim.
+    format_string (str): struct format of the value.
+    value (int): new value.
+
+  Returns:
+    bytes: claim.
+  """
+  claim_data = bytearray(claim_data)
+  struct.pack_into(format_string, claim_data, offset, value)
+  return bytes(claim_data)
+
+
+class ClaimACEOperationsTests(unittest.TestCase):
+  """Tests the claim ACE functions."""
+
+  def _AssertRoundTrip(self, value_type, values):
+    """Asserts that claim values survive constructing and reading a claim ACE.
+
+    Args:
+      value_type (int): claim value type.
+      values (list[object]): claim values.
+    """
+    claim_data = ClaimACEOperations.constructClaimAttribute(
+        u"Project", value_type, values)
+    ace_data = _CreateClaimACE(claim_data)
+
+    self.assertEqual(len(ace_data) % 4, 0)
+    self.assertEqual(ACEOperations.getACELength(ace_data), len(ace_data))
+
+    claim_attribute = ClaimACEOperations.getClaimAttribute(ace_data)
+    self.assertEqual(claim_attribute.name, u"Project")
+    self.assertEqual(claim_attribute.valueType, value_type)
+    self.assertEqual(
+        claim_attribute.valueTypeString,
+        ClaimACEOperations.CLAIM_VALUE_TYPE_NAMES[value_type])
+    self.assertEqual(len(claim_attribute), len(values))
+    self.assertEqual(list(claim_attribute), values)
+    for index, value in enumerate(values):
+      self.assertEqual(claim_attribute[index], value)
+
+  def test_round_trip_int64(self):
+    """Tests round tripping INT64 claim values."""
+    self._AssertRoundTrip(
+        ClaimACEOperations.CLAIM_SECURITY_ATTRIBUTE_TYPE_INT64,
+        [0, -1, 2**63 - 1, -2**63])
+
+  def test_round_trip_uint64(self):
+    """Tests round tripping UINT64 claim values."""
+    self._AssertRoundTrip(
+        ClaimACEOperations.CLAIM_SECURITY_ATTRIBUTE_TYPE_UINT64,
+        [0, 1, 2**64 - 1])
+
+  def test_round_trip_string(self):
+    """Tests round tripping STRING claim values."""
+    self._AssertRoundTrip(
+        ClaimACEOperations.CLAIM_SECURITY_ATTRIBUTE_TYPE_STRING,
+        [u"Finance", u"", u"R\u00e9sum\u00e9"])
+
+  def test_round_trip_sid(self):
+    """Tests round tripping SID claim values."""
+    self._AssertRoundTrip(
+        ClaimACEOperations.CLAIM_SECURITY_ATTRIBUTE_TYPE_SID,
+        [_EVERYONE_SID, _USERS_SID])
+
+  def test_round_trip_boolean(self):
+    """Tests round tripping BOOLEAN claim values."""
+    self._AssertRoundTrip(
+        ClaimACEOperations.CLAIM_SECURITY_ATTRIBUTE_TYPE_BOOLEAN,
+        [True, False])
+
+  def test_round_trip_octet_string(self):
+    """Tests round tripping OCTET_STRING claim values."""
+    self._AssertRoundTrip(
+        ClaimACEOperations.CLAIM_SECURITY_ATTRIBUTE_TYPE_OCTET_STRING,
+        [b"\x00\x01\xff", b"", b"\x00\x00"])
+
+  def test_contains_value(self):
+    """Tests the containsValue and isDisabled functions."""
+    value_type = ClaimACEOperations.CLAIM_SECURITY_ATTRIBUTE_TYPE_STRING
+    claim_data = ClaimACEOperations.constructClaimAttribute(
+        u"Department", value_type, [u"Finance", u"Sales"])
+    claim_attribute = ClaimACEOperations.getClaimAttribute(
+        _CreateClaimACE(claim_data))
+
+    self.assertTrue(claim_attribute.containsValue(u"SALES"))
+    self.assertFalse(claim_attribute.containsValue(u"Legal"))
+    self.assertFalse(claim_attribute.isDisabled())
+
+    claim_flags = (
+        ClaimACEOperations.CLAIM_SECURITY_ATTRIBUTE_VALUE_CASE_SENSITIVE |
+        ClaimACEOperations.CLAIM_SECURITY_ATTRIBUTE_DISABLED)
+    claim_data = ClaimACEOperations.constructClaimAttribute(
+        u"Department", value_type, [u"Finance", u"Sales"], claim_flags)
+    claim_attribute = ClaimACEOperations.getClaimAttribute(
+        _CreateClaimACE(claim_data))
+
+    self.assertTrue(claim_attribute.containsValue(u"Sales"))
+    self.assertFalse(claim_attribute.containsValue(u"SALES"))
+    self.assertTrue(claim_attribute.isDisabled())
+
+  def test_iter_claim_attributes(self):
+    """Tests the iterClaimAttributes function."""
+    value_type = ClaimACEOperations.CLAIM_SECURITY_ATTRIBUTE_TYPE_INT64
+    ace_data_list = [
+        _CreateClaimACE(ClaimACEOperations.constructClaimAttribute(
+            u"Level", value_type, [1])),
+        ACEOperations.constructSimpleACE(
+            ACEOperations.ACE_TYPE_ACCESS_ALLOWED, 0,
+            ACEOperations.ACCESS_MASK_READ_CONTROL, _USERS_SID),
+        _CreateClaimACE(ClaimACEOperations.constructClaimAttribute(
+            u"Project", value_type, [2]))]
+
+    names = [
+        claim_attribute.name for claim_attribute in
+        ClaimACEOperations.iterClaimAttributes(ace_data_list)]
+    self.assertEqual(names, [u"Level", u"Project"])
+
+    claim_attributes = list(
+        ClaimACEOperations.iterClaimAttributes(ace_data_list, u"PROJECT"))
+    self.assertEqual(len(claim_attributes), 1)
+    self.assertEqual(list(claim_attributes[0]), [2])
+
+  def test_construct_claim_attribute_errors(self):
+    """Tests that constructClaimAttribute rejects invalid arguments."""
+    with self.assertRaises(Exception):
+      ClaimACEOperations.constructClaimAttribute(u"Level", 0x0004, [1])
+
+    with self.assertRaises(Exception):
+      ClaimACEOperations.constructClaimAttribute(
+          u"Level", ClaimACEOperations.CLAIM_SECURITY_ATTRIBUTE_TYPE_INT64,
+          [1], -1)
+
+  def test_out_of_bounds_offsets(self):
+    """Tests that offsets outside of the claim raise."""
+    value_type = ClaimACEOperations.CLAIM_SECURITY_ATTRIBUTE_TYPE_INT64
+    claim_data = ClaimACEOperations.constructClaimAttribute(
+        u"a", value_type, [1])
+
+    malformed_claims = [
+        # Name offset after the end of the claim.
+        _PatchClaim(claim_data, 0, "<I", 0x1000),
+        # Value offset inside the claim header.
+        _PatchClaim(claim_data, 16, "<I", 4),
+        # Value offset after the end of the claim.
+        _PatchClaim(claim_data, 16, "<I", len(claim_data)),
+        # Value offsets exceed the claim.
+        _PatchClaim(claim_data, 12, "<I", 1000),
+        # Unsupported value type.
+        _PatchClaim(claim_data, 4, "<H", 0x0004)]
+
+    for malformed_claim in malformed_claims:
+      with self.assertRaises(Exception):
+        ClaimACEOperations.getClaimAttribute(_CreateClaimACE(malformed_claim))
+
+    # A claim smaller than its header.
+    with self.assertRaises(Exception):
+      ClaimACEOperations.getClaimAttribute(_CreateClaimACE(claim_data[:8]))
+
+    # The ACE size bounds the claim, not the length of the data.
+    ace_data = _CreateClaimACE(claim_data)
+    truncated_ace_data = (
+        ace_data[:2] + struct.pack("<H", len(ace_data) - 4) + ace_data[4:])
+    claim_attribute = ClaimACEOperations.getClaimAttribute(truncated_ace_data)
+    with self.assertRaises(Exception):
+      claim_attribute[0]
+
+    with self.assertRaises(Exception):
+      ClaimACEOperations.getClaimAttribute(ACEOperations.constructSimpleACE(
+          ACEOperations.ACE_TYPE_ACCESS_ALLOWED, 0,
+          ACEOperations.ACCESS_MASK_READ_CONTROL, _USERS_SID))
+
+  def test_truncated_values(self):
+    """Tests that values exceeding the claim raise on access."""
+    # The claims below are multiples of four bytes once truncated, so the ACE
+    # has no padding after them.
+    claim_data = ClaimACEOperations.constructClaimAttribute(
+        u"a", ClaimACEOperations.CLAIM_SECURITY_ATTRIBUTE_TYPE_INT64, [1])
+    claim_attribute = ClaimACEOperations.getClaimAttribute(
+        _CreateClaimACE(claim_data[:-4]))
+    self.assertEqual(claim_attribute.name, u"a")
+    with self.assertRaises(Exception):
+      claim_attribute[0]
+
+    # String without a terminator.
+    claim_data = ClaimACEOperations.constructClaimAttribute(
+        u"a", ClaimACEOperations.CLAIM_SECURITY_ATTRIBUTE_TYPE_STRING, [u"b"])
+    claim_attribute = ClaimACEOperations.getClaimAttribute(
+        _CreateClaimACE(claim_data[:-2] + b"c\x00"))
+    with self.assertRaises(Exception):
+      claim_attribute[0]
+
+    # Octet string length exceeds the claim.
+    value_type = ClaimACEOperations.CLAIM_SECURITY_ATTRIBUTE_TYPE_OCTET_STRING
+    claim_data = ClaimACEOperations.constructClaimAttribute(
+        u"a", value_type, [b"\x01\x02\x03\x04"])
+    claim_data = _PatchClaim(claim_data, 24, "<I", 0x1000)
+    claim_attribute = ClaimACEOperations.getClaimAttribute(
+        _CreateClaimACE(claim_data))
+    with self.assertRaises(Exception):
+      claim_attribute[0]
+
+    # Name without a terminator.
+    claim_data = ClaimACEOperations.constructClaimAttribute(
+        u"a", value_type, [])
+    claim_attribute = ClaimACEOperations.getClaimAttribute(
+        _CreateClaimACE(claim_data[:-2] + b"b\x00"))
+    with self.assertRaises(Exception):
+      claim_attribute.name
+
+
+if __name__ == "__main__":
+  unittest.main(verbosity=2)
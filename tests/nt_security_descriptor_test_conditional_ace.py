@@ -0,0 +1,403 @@
+#!/usr/bin/env python
+#
+# Conditional ACE expression functions test script
+#
+# Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+#
+# Refer to AUTHORS for acknowledgements.
+#
+# This software is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this software.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import struct
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "nt_security_descriptor"))
+
+import ACEOperations
+import ConditionalACEOperations
+import SIDOperations
+
+
+_USERS_SID = SIDOperations.readableSIDAsBytes("S-1-5-32-545")
+_ADMINISTRATORS_SID = SIDOperations.readableSIDAsBytes("S-1-5-32-544")
+
+
+def _LengthPrefixedToken(token_type, value_data):
+  """Creates a length prefixed token.
+
+  Args:
+    token_type (int): token type.
+    value_data (bytes): value of the token.
+
+  Returns:
+    bytes: token.
+  """
+  return struct.pack("<BI", token_type, len(value_data)) + value_data
+
+
+def _Attribute(token_type, name):
+  """Creates an attribute token.
+
+  Args:
+    token_type (int): attribute token type.
+    name (unicode): name of the attribute.
+
+  Returns:
+    bytes: token.
+  """
+  return _LengthPrefixedToken(token_type, name.encode("utf-16-le"))
+
+
+def _UserAttribute(name):
+  """Creates a user attribute token.
+
+  Args:
+    name (unicode): name of the attribute.
+
+  Returns:
+    bytes: token.
+  """
+  return _Attribute(ConditionalACEOperations.TOKEN_USER_ATTRIBUTE, name)
+
+
+def _Integer(value):
+  """Creates a signed 64-bit integer literal token in decimal base.
+
+  Args:
+    value (int): value of the literal.
+
+  Returns:
+    bytes: token.
+  """
+  return struct.pack(
+      "<BqBB", ConditionalACEOperations.TOKEN_INT64, value, 1, 3)
+
+
+def _String(value):
+  """Creates a Unicode string literal token.
+
+  Args:
+    value (unicode): value of the literal.
+
+  Returns:
+    bytes: token.
+  """
+  return _LengthPrefixedToken(
+      ConditionalACEOperations.TOKEN_UNICODE_STRING,
+      value.encode("utf-16-le"))
+
+
+def _Operator(token_type):
+  """Creates an operator token.
+
+  Args:
+    token_type (int): operator token type.
+
+  Returns:
+    bytes: token.
+  """
+  return struct.pack("<B", token_type)
+
+
+def _Expression(*tokens):
+  """Creates conditional expression application data.
+
+  Args:
+    tokens (list[bytes]): tokens in postfix order.
+
+  Returns:
+    bytes: application data.
+  """
+  return ConditionalACEOperations.CONDITIONAL_EXPRESSION_SIGNATURE + b"".join(
+      tokens)
+
+
+class ConditionalACEOperationsTests(unittest.TestCase):
+  """Tests the conditional ACE expression functions."""
+
+  _EQUALS = _Operator(ConditionalACEOperations.TOKEN_EQUALS)
+  _AND = _Operator(ConditionalACEOperations.TOKEN_AND)
+  _OR = _Operator(ConditionalACEOperations.TOKEN_OR)
+  _NOT = _Operator(ConditionalACEOperations.TOKEN_NOT)
+
+  # (@User.title == "Manager"), TRUE for _MANAGER and UNKNOWN for _NO_CLAIMS
+  _TITLE_IS_MANAGER = (_UserAttribute(u"title"), _String(u"Manager"), _EQUALS)
+
+  _MANAGER = ConditionalACEOperations.prepareClaimSet(
+      userClaims={"Title": "MANAGER", "clearance": 3})
+  _NO_CLAIMS = ConditionalACEOperations.prepareClaimSet()
+
+  def _Evaluate(self, claim_set, *tokens):
+    """Evaluates a conditional expression.
+
+    Args:
+      claim_set (tuple): claim set from prepareClaimSet.
+      tokens (list[bytes]): tokens in postfix order.
+
+    Returns:
+      bool: result of the expression or None for UNKNOWN.
+    """
+    return ConditionalACEOperations.evaluateConditionalExpression(
+        _Expression(*tokens), claim_set)
+
+  def test_relational_operators(self):
+    """Tests evaluating relational operators."""
+    # Claim names and string values compare case-insensitively.
+    result = self._Evaluate(self._MANAGER, *self._TITLE_IS_MANAGER)
+    self.assertIs(result, True)
+
+    result = self._Evaluate(
+        self._MANAGER, _UserAttribute(u"title"), _String(u"Clerk"),
+        self._EQUALS)
+    self.assertIs(result, False)
+
+    result = self._Evaluate(
+        self._MANAGER, _UserAttribute(u"clearance"), _Integer(2),
+        _Operator(ConditionalACEOperations.TOKEN_GREATER_THAN_OR_EQUAL))
+    self.assertIs(result, True)
+
+    result = self._Evaluate(
+        self._MANAGER, _UserAttribute(u"clearance"), _Integer(2),
+        _Operator(ConditionalACEOperations.TOKEN_LESS_THAN))
+    self.assertIs(result, False)
+
+    # Values of different kinds are neither equal nor ordered.
+    result = self._Evaluate(
+        self._MANAGER, _UserAttribute(u"clearance"), _String(u"3"),
+        self._EQUALS)
+    self.assertIsNone(result)
+
+    # An absent attribute is UNKNOWN, even when negated.
+    result = self._Evaluate(self._NO_CLAIMS, *self._TITLE_IS_MANAGER)
+    self.assertIsNone(result)
+
+    result = self._Evaluate(
+        self._NO_CLAIMS, _UserAttribute(u"title"), _String(u"Manager"),
+        _Operator(ConditionalACEOperations.TOKEN_NOT_EQUALS))
+    self.assertIsNone(result)
+
+  def test_three_valued_logic(self):
+    """Tests the three-valued logic of the logical operators."""
+    true_tokens = (_Integer(1),)
+    false_tokens = (_Integer(0),)
+    # An absent attribute converts to UNKNOWN.
+    unknown_tokens = (_UserAttribute(u"missing"),)
+
+    expected_results = [
+        (true_tokens, self._AND, true_tokens, True),
+        (true_tokens, self._AND, false_tokens, False),
+        (false_tokens, self._AND, unknown_tokens, False),
+        (unknown_tokens, self._AND, false_tokens, False),
+        (true_tokens, self._AND, unknown_tokens, None),
+        (unknown_tokens, self._AND, unknown_tokens, None),
+        (false_tokens, self._OR, false_tokens, False),
+        (false_tokens, self._OR, true_tokens, True),
+        (true_tokens, self._OR, unknown_tokens, True),
+        (unknown_tokens, self._OR, true_tokens, True),
+        (false_tokens, self._OR, unknown_tokens, None),
+        (unknown_tokens, self._OR, unknown_tokens, None)]
+
+    for lhs_tokens, operator, rhs_tokens, expected_result in expected_results:
+      tokens = lhs_tokens + rhs_tokens + (operator,)
+      result = self._Evaluate(self._NO_CLAIMS, *tokens)
+      self.assertIs(result, expected_result)
+
+    result = self._Evaluate(self._NO_CLAIMS, _Integer(1), self._NOT)
+    self.assertIs(result, False)
+
+    result = self._Evaluate(self._NO_CLAIMS, _Integer(0), self._NOT)
+    self.assertIs(result, True)
+
+    self.assertIsNone(self._Evaluate(
+        self._NO_CLAIMS, _UserAttribute(u"missing"), self._NOT))
+
+    # Relational results combine the same way.
+    tokens = self._TITLE_IS_MANAGER + (_Integer(0), self._AND)
+    self.assertIs(self._Evaluate(self._NO_CLAIMS, *tokens), False)
+
+    tokens = self._TITLE_IS_MANAGER + (_Integer(1), self._AND)
+    self.assertIsNone(self._Evaluate(self._NO_CLAIMS, *tokens))
+
+  def test_exists_and_member_of(self):
+    """Tests evaluating the Exists and Member_of operators."""
+    result = self._Evaluate(
+        self._MANAGER, _UserAttribute(u"title"),
+        _Operator(ConditionalACEOperations.TOKEN_EXISTS))
+    self.assertIs(result, True)
+
+    result = self._Evaluate(
+        self._NO_CLAIMS, _UserAttribute(u"title"),
+        _Operator(ConditionalACEOperations.TOKEN_NOT_EXISTS))
+    self.assertIs(result, True)
+
+    sids_token = _LengthPrefixedToken(
+        ConditionalACEOperations.TOKEN_COMPOSITE,
+        _LengthPrefixedToken(ConditionalACEOperations.TOKEN_SID, _USERS_SID) +
+        _LengthPrefixedToken(
+            ConditionalACEOperations.TOKEN_SID, _ADMINISTRATORS_SID))
+
+    claim_set = ConditionalACEOperations.prepareClaimSet(userSIDs=[_USERS_SID])
+
+    result = self._Evaluate(
+        claim_set, sids_token,
+        _Operator(ConditionalACEOperations.TOKEN_MEMBER_OF))
+    self.assertIs(result, False)
+
+    result = self._Evaluate(
+        claim_set, sids_token,
+        _Operator(ConditionalACEOperations.TOKEN_MEMBER_OF_ANY))
+    self.assertIs(result, True)
+
+    result = self._Evaluate(
+        claim_set, sids_token,
+        _Operator(ConditionalACEOperations.TOKEN_DEVICE_MEMBER_OF_ANY))
+    self.assertIs(result, False)
+
+  def test_octet_claim_names(self):
+    """Tests comparing octet string claims named in octetClaimNames."""
+    octet_data = b"\x01\x02\xff"
+    tokens = (
+        _UserAttribute(u"thumbprint"),
+        _LengthPrefixedToken(
+            ConditionalACEOperations.TOKEN_OCTET_STRING, octet_data),
+        self._EQUALS)
+
+    claim_set = ConditionalACEOperations.prepareClaimSet(
+        userClaims={"Thumbprint": octet_data},
+        octetClaimNames=["THUMBPRINT"])
+    self.assertIs(self._Evaluate(claim_set, *tokens), True)
+
+    # bytearray values are always bytes.
+    claim_set = ConditionalACEOperations.prepareClaimSet(
+        userClaims={"thumbprint": bytearray(octet_data)})
+    self.assertIs(self._Evaluate(claim_set, *tokens), True)
+
+    # Other str values are text, which never equals an octet string.
+    claim_set = ConditionalACEOperations.prepareClaimSet(
+        userClaims={"thumbprint": b"\x01\x02"})
+    self.assertIsNone(self._Evaluate(claim_set, *tokens))
+
+    with self.assertRaises(Exception):
+      ConditionalACEOperations.prepareClaimSet(
+          userClaims={"thumbprint": 1}, octetClaimNames=["thumbprint"])
+
+  def test_conditional_ace_applies(self):
+    """Tests the conditionalACEApplies function."""
+    application_data = _Expression(*self._TITLE_IS_MANAGER)
+    allow_ace = ACEOperations.constructAppDataACE(
+        ACEOperations.ACE_TYPE_ACCESS_ALLOWED_CALLBACK, 0,
+        ACEOperations.ACCESS_MASK_READ_CONTROL, _USERS_SID, application_data)
+    deny_ace = ACEOperations.constructAppDataACE(
+        ACEOperations.ACE_TYPE_ACCESS_DENIED_CALLBACK, 0,
+        ACEOperations.ACCESS_MASK_READ_CONTROL, _USERS_SID, application_data)
+
+    claim_sets = [self._MANAGER, self._NO_CLAIMS]
+
+    # UNKNOWN applies to deny ACEs but not to allow ACEs.
+    results = ConditionalACEOperations.conditionalACEAppliesBatch(
+        allow_ace, claim_sets)
+    self.assertEqual(results, [True, False])
+
+    results = ConditionalACEOperations.conditionalACEAppliesBatch(
+        deny_ace, claim_sets)
+    self.assertEqual(results, [True, True])
+
+    self.assertFalse(ConditionalACEOperations.conditionalACEApplies(
+        allow_ace, self._NO_CLAIMS))
+
+  def test_compiled_expression_cache(self):
+    """Tests that the compiled expression cache is cleared when full."""
+    cache = ConditionalACEOperations._compiledExpressionCache
+    maximum_cached_expressions = (
+        ConditionalACEOperations.MAX_CACHED_EXPRESSIONS)
+
+    cache.clear()
+    ConditionalACEOperations.MAX_CACHED_EXPRESSIONS = 2
+    try:
+      first_expression = _Expression(_Integer(1))
+      evaluate = ConditionalACEOperations.compileConditionalExpression(
+          first_expression)
+      self.assertIs(
+          ConditionalACEOperations.compileConditionalExpression(
+              bytearray(first_expression)), evaluate)
+
+      ConditionalACEOperations.compileConditionalExpression(
+          _Expression(_Integer(2)))
+      self.assertEqual(len(cache), 2)
+
+      third_expression = _Expression(_Integer(3))
+      ConditionalACEOperations.compileConditionalExpression(third_expression)
+      self.assertEqual(list(cache.keys()), [third_expression])
+
+    finally:
+      ConditionalACEOperations.MAX_CACHED_EXPRESSIONS = (
+          maximum_cached_expressions)
+      cache.clear()
+
+  def test_padding(self):
+    """Tests that trailing padding is ignored."""
+    tokens = self._TITLE_IS_MANAGER + (b"\x00\x00\x00",)
+    self.assertIs(self._Evaluate(self._MANAGER, *tokens), True)
+
+  def test_malformed_expressions(self):
+    """Tests that malformed expressions raise."""
+    title_token = _UserAttribute(u"title")
+    string_token = _String(u"Manager")
+
+    malformed_expressions = [
+        # Missing signature.
+        b"xtra" + _Integer(1),
+        # Empty expression.
+        _Expression(),
+        # Attribute name length exceeds the data.
+        _Expression(title_token[:-2]),
+        # Length prefix is truncated.
+        _Expression(title_token[:3]),
+        # Integer value is truncated.
+        _Expression(_Integer(1)[:6]),
+        # Composite element is truncated.
+        _Expression(_LengthPrefixedToken(
+            ConditionalACEOperations.TOKEN_COMPOSITE, _Integer(1)[:6])),
+        # Nested composite.
+        _Expression(_LengthPrefixedToken(
+            ConditionalACEOperations.TOKEN_COMPOSITE,
+            _LengthPrefixedToken(
+                ConditionalACEOperations.TOKEN_COMPOSITE, _Integer(1)))),
+        # Unsupported literal token.
+        _Expression(b"\x30"),
+        # Unsupported operator token.
+        _Expression(_Integer(1), b"\xf0"),
+        # Missing operand.
+        _Expression(string_token, self._EQUALS),
+        # Operands remaining.
+        _Expression(title_token, string_token),
+        # Data after padding.
+        _Expression(_Integer(1), b"\x00", _Integer(1)),
+        # Logical result used as an operand.
+        _Expression(
+            *(self._TITLE_IS_MANAGER + (string_token, self._EQUALS))),
+        # Exists of a literal.
+        _Expression(
+            string_token, _Operator(ConditionalACEOperations.TOKEN_EXISTS))]
+
+    for expression in malformed_expressions:
+      with self.assertRaises(Exception):
+        ConditionalACEOperations.compileConditionalExpression(expression)
+
+
+if __name__ == "__main__":
+  unittest.main(verbosity=2)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+#
+# Pooled attribute writer test script, runs against a local LDAP stand-in
+#
+# Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+#
+# Refer to AUTHORS for acknowledgements.
+#
+# This software is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this software.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "nt_security_descriptor"))
+
+import replace_attrs
+
+
+class FakeLDAPError(Exception):
+  """Stand-in for ldap.LDAPError."""
+
+
+class FakeLDAPConnection(object):
+  """Local LDAP stand-in implementing modify_s.
+
+  Attributes:
+    failures (dict[str, list[type]]): exceptions to raise, in order, for the
+        modifies of a DN.
+    modifications (list[tuple[str, list]]): DN and modification list of each
+        modify that succeeded, in the order they completed.
+  """
+
+  def __init__(self, failures=None, gate=None):
+    """Initializes the connection.
+
+    Args:
+      failures (Optional[dict[str, list[type]]]): exceptions to raise for the
+          modifies of a DN.
+      gate (Optional[threading.Event]): event every modify waits for.
+    """
+    super(FakeLDAPConnection, self).__init__()
+    self._gate = gate
+    self._lock = threading.Lock()
+    self.failures = failures or {}
+    self.modifications = []
+
+  def modify_s(self, dn, modlist):
+    """Modifies an entry or raises its scripted failure."""
+    if self._gate is not None:
+      self._gate.wait()
+    with self._lock:
+      failures = self.failures.get(dn)
+      if failures:
+        raise failures.pop(0)("modify of {0:s} failed".format(dn))
+      self.modifications.append((dn, sorted(modlist)))
+
+
+def _ResolveDN(guid):
+  """Resolves an objectGUID to the DN of its stand-in entry."""
+  if guid == "missing":
+    raise replace_attrs.ADException("Account was not found.")
+  return "CN={0:s},DC=example,DC=com".format(guid)
+
+
+class PooledAttributeWriterTests(unittest.TestCase):
+  """Tests the PooledAttributeWriter class."""
+
+  def test_replace_object_attributes(self):
+    """Tests queued and coalesced writes."""
+    gate = threading.Event()
+    connection = FakeLDAPConnection(gate=gate)
+    writer = replace_attrs.PooledAttributeWriter(
+        lambda: connection, _ResolveDN, poolSize=1)
+
+    # The only connection waits on the gate, so the writes for g2 are merged
+    # before their modify is issued.
+    first_handle = writer.replaceObjectAttributes("g1", {"description": "a"})
+    second_handle = writer.replaceObjectAttributes("g2", {"description": "b"})
+    third_handle = writer.replaceObjectAttributes("g2", {"title": "c"})
+    gate.set()
+    writer.close()
+
+    self.assertIs(second_handle, third_handle)
+    self.assertIn("modified successfully", first_handle.wait())
+    self.assertIn("modified successfully", second_handle.wait())
+    self.assertEqual(connection.modifications[-1], (
+        "CN=g2,DC=example,DC=com",
+        [(2, "description", "b"), (2, "title", "c")]))
+
+    metrics = writer.getMetrics()
+    self.assertEqual(metrics["writesSubmitted"], 3)
+    self.assertEqual(metrics["writesCoalesced"], 1)
+    self.assertEqual(metrics["modifiesIssued"], 2)
+    self.assertEqual(metrics["modifiesFailed"], 0)
+
+  def test_modify_failure(self):
+    """Tests writes whose modify or DN lookup fails."""
+    connection = FakeLDAPConnection(
+        failures={"CN=g1,DC=example,DC=com": [FakeLDAPError]})
+    writer = replace_attrs.PooledAttributeWriter(
+        lambda: connection, _ResolveDN, poolSize=1)
+
+    failed_handle = writer.replaceObjectAttributes("g1", {"description": "a"})
+    missing_handle = writer.replaceObjectAttributes(
+        "missing", {"description": "b"})
+
+    with self.assertRaises(replace_attrs.ADException) as context:
+      failed_handle.wait(5)
+    self.assertIn("could not be modified", str(context.exception))
+    self.assertIn("modify of CN=g1", str(context.exception))
+
+    with self.assertRaises(replace_attrs.ADException) as context:
+      missing_handle.wait(5)
+    self.assertIn("was not found", str(context.exception))
+
+    # The worker survives the failures and keeps serving writes.
+    handle = writer.replaceObjectAttributes("g1", {"description": "c"})
+    self.assertIn("modified successfully", handle.wait(5))
+    writer.close()
+
+    metrics = writer.getMetrics()
+    self.assertEqual(metrics["modifiesIssued"], 3)
+    self.assertEqual(metrics["modifiesFailed"], 2)
+
+    with self.assertRaises(replace_attrs.ADException):
+      writer.replaceObjectAttributes("g1", {"description": "d"})
+
+
+if __name__ == "__main__":
+  unittest.main(verbosity=2)
@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+#
+# Security descriptor diff functions test script
+#
+# Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+#
+# Refer to AUTHORS for acknowledgements.
+#
+# This software is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this software.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import struct
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "nt_security_descriptor"))
+
+import ACEOperations
+import ACLOperations
+import SDDiffOperations
+import SDOperations
+import SIDOperations
+
+
+# Security descriptor with a DACL of 2 access allowed ACEs.
+_SECURITY_DESCRIPTOR_DATA = bytes(bytearray([
+    0x01, 0x00, 0x04, 0x80, 0x48, 0x00, 0x00, 0x00, 0x64, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 0x02, 0x00, 0x34, 0x00,
+    0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x14, 0x00, 0x9f, 0x01, 0x12, 0x00,
+    0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x12, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x18, 0x00, 0x9f, 0x01, 0x12, 0x00, 0x01, 0x02, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x05, 0x20, 0x00, 0x00, 0x00, 0x20, 0x02, 0x00, 0x00,
+    0x01, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x15, 0x00, 0x00, 0x00,
+    0x52, 0xaa, 0xc8, 0x68, 0xdd, 0xe8, 0xe4, 0x1c, 0x8a, 0xa7, 0x32, 0x3f,
+    0xeb, 0x03, 0x00, 0x00, 0x01, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05,
+    0x20, 0x00, 0x00, 0x00, 0x20, 0x02, 0x00, 0x00]))
+
+_EVERYONE_SID = SIDOperations.readableSIDAsBytes("S-1-1-0")
+_LOCAL_SYSTEM_SID = SIDOperations.readableSIDAsBytes("S-1-5-18")
+_ADMINISTRATORS_SID = SIDOperations.readableSIDAsBytes("S-1-5-32-544")
+
+
+def _CreateACE(sid_bytes, mask=0x0012019f,
+               ace_type=ACEOperations.ACE_TYPE_ACCESS_ALLOWED):
+  """Creates an ACE.
+
+  Args:
+    sid_bytes (bytes): trustee SID.
+    mask (Optional[int]): access mask.
+    ace_type (Optional[int]): ACE type.
+
+  Returns:
+    bytes: ACE.
+  """
+  return ACEOperations.constructSimpleACE(ace_type, 0, mask, sid_bytes)
+
+
+def _CreateACL(aces, revision=2):
+  """Creates an ACL.
+
+  Args:
+    aces (list[bytes]): ACEs in order.
+    revision (Optional[int]): ACL revision.
+
+  Returns:
+    bytes: ACL.
+  """
+  aces_data = b"".join(aces)
+  return struct.pack(
+      "<BBHHH", revision, 0, 8 + len(aces_data), len(aces), 0) + aces_data
+
+
+class SDDiffOperationsTests(unittest.TestCase):
+  """Tests the security descriptor diff functions."""
+
+  def test_sd_digest(self):
+    """Tests the sdDigest function."""
+    digest = SDDiffOperations.sdDigest(_SECURITY_DESCRIPTOR_DATA)
+    self.assertEqual(len(digest), 20)
+    self.assertEqual(
+        SDDiffOperations.sdDigest(bytes(bytearray(_SECURITY_DESCRIPTOR_DATA))),
+        digest)
+    self.assertNotEqual(
+        SDDiffOperations.sdDigest(_SECURITY_DESCRIPTOR_DATA[:-1]), digest)
+
+  def test_diff_acls_identical(self):
+    """Tests diffACLs on identical ACLs."""
+    acl = _CreateACL([_CreateACE(_LOCAL_SYSTEM_SID)])
+    self.assertIsNone(SDDiffOperations.diffACLs(acl, acl))
+    self.assertIsNone(SDDiffOperations.diffACLs(b"", b""))
+
+  def test_diff_acls_added_and_removed(self):
+    """Tests diffACLs on added and removed ACEs."""
+    system_ace = _CreateACE(_LOCAL_SYSTEM_SID)
+    administrators_ace = _CreateACE(_ADMINISTRATORS_SID)
+    everyone_ace = _CreateACE(_EVERYONE_SID)
+    old_acl = _CreateACL([system_ace, administrators_ace])
+    new_acl = _CreateACL([system_ace, administrators_ace, everyone_ace])
+
+    diff = SDDiffOperations.diffACLs(old_acl, new_acl)
+    self.assertEqual(diff["added"], [everyone_ace])
+    self.assertEqual(diff["removed"], [])
+    self.assertEqual(diff["modified"], [])
+    self.assertFalse(diff["reordered"])
+    self.assertIsNone(diff["revision"])
+
+    diff = SDDiffOperations.diffACLs(new_acl, old_acl)
+    self.assertEqual(diff["added"], [])
+    self.assertEqual(diff["removed"], [everyone_ace])
+
+    # An ACL that is not present compares as an empty ACL.
+    diff = SDDiffOperations.diffACLs(b"", old_acl)
+    self.assertEqual(diff["added"], [system_ace, administrators_ace])
+    self.assertEqual(diff["removed"], [])
+
+  def test_diff_acls_modified(self):
+    """Tests diffACLs on an ACE of which the mask changed."""
+    old_ace = _CreateACE(_LOCAL_SYSTEM_SID, mask=0x0012019f)
+    new_ace = _CreateACE(_LOCAL_SYSTEM_SID, mask=0x001f01ff)
+    administrators_ace = _CreateACE(_ADMINISTRATORS_SID)
+
+    diff = SDDiffOperations.diffACLs(
+        _CreateACL([old_ace, administrators_ace]),
+        _CreateACL([new_ace, administrators_ace]))
+    self.assertEqual(diff["modified"], [(old_ace, new_ace)])
+    self.assertEqual(diff["added"], [])
+    self.assertEqual(diff["removed"], [])
+    self.assertFalse(diff["reordered"])
+
+    # A different ACE type is a different alignment key.
+    deny_ace = _CreateACE(
+        _LOCAL_SYSTEM_SID, ace_type=ACEOperations.ACE_TYPE_ACCESS_DENIED)
+    diff = SDDiffOperations.diffACLs(
+        _CreateACL([old_ace]), _CreateACL([deny_ace]))
+    self.assertEqual(diff["modified"], [])
+    self.assertEqual(diff["added"], [deny_ace])
+    self.assertEqual(diff["removed"], [old_ace])
+
+  def test_diff_acls_reordered(self):
+    """Tests diffACLs on reordered ACEs."""
+    system_ace = _CreateACE(_LOCAL_SYSTEM_SID)
+    administrators_ace = _CreateACE(_ADMINISTRATORS_SID)
+
+    diff = SDDiffOperations.diffACLs(
+        _CreateACL([system_ace, administrators_ace]),
+        _CreateACL([administrators_ace, system_ace]))
+    self.assertTrue(diff["reordered"])
+    self.assertEqual(diff["added"], [])
+    self.assertEqual(diff["removed"], [])
+    self.assertEqual(diff["modified"], [])
+
+  def test_diff_acls_duplicate_keys(self):
+    """Tests diffACLs on ACEs that share an alignment key."""
+    first_ace = _CreateACE(_LOCAL_SYSTEM_SID, mask=0x00010000)
+    second_ace = _CreateACE(_LOCAL_SYSTEM_SID, mask=0x00020000)
+    third_ace = _CreateACE(_LOCAL_SYSTEM_SID, mask=0x00040000)
+
+    # Duplicates are paired in order of appearance.
+    diff = SDDiffOperations.diffACLs(
+        _CreateACL([first_ace, second_ace]),
+        _CreateACL([first_ace, third_ace]))
+    self.assertEqual(diff["modified"], [(second_ace, third_ace)])
+    self.assertEqual(diff["added"], [])
+    self.assertEqual(diff["removed"], [])
+    self.assertFalse(diff["reordered"])
+
+    diff = SDDiffOperations.diffACLs(
+        _CreateACL([first_ace, second_ace]),
+        _CreateACL([first_ace, second_ace, third_ace]))
+    self.assertEqual(diff["added"], [third_ace])
+    self.assertEqual(diff["modified"], [])
+
+    diff = SDDiffOperations.diffACLs(
+        _CreateACL([first_ace, second_ace]), _CreateACL([second_ace]))
+    self.assertEqual(diff["removed"], [second_ace])
+    self.assertEqual(diff["modified"], [(first_ace, second_ace)])
+
+  def test_diff_acls_revision(self):
+    """Tests diffACLs on an ACL of which only the revision changed."""
+    aces = [_CreateACE(_LOCAL_SYSTEM_SID), _CreateACE(_ADMINISTRATORS_SID)]
+
+    diff = SDDiffOperations.diffACLs(
+        _CreateACL(aces, revision=2), _CreateACL(aces, revision=4))
+    self.assertEqual(diff["revision"], (2, 4))
+    self.assertEqual(diff["added"], [])
+    self.assertEqual(diff["removed"], [])
+    self.assertEqual(diff["modified"], [])
+    self.assertFalse(diff["reordered"])
+
+  def test_diff_security_descriptors(self):
+    """Tests the diffSecurityDescriptors function."""
+    self.assertIsNone(SDDiffOperations.diffSecurityDescriptors(
+        _SECURITY_DESCRIPTOR_DATA, bytes(bytearray(_SECURITY_DESCRIPTOR_DATA))))
+
+    everyone_ace = _CreateACE(_EVERYONE_SID)
+    old_dacl = SDOperations.aclBytes(
+        _SECURITY_DESCRIPTOR_DATA, ACLOperations.ACL_TYPE_DACL)
+    new_dacl = _CreateACL(ACLOperations.getACEList(old_dacl) + [everyone_ace])
+    new_sd = SDOperations.replaceACL(
+        _SECURITY_DESCRIPTOR_DATA, ACLOperations.ACL_TYPE_DACL, new_dacl)
+
+    diff = SDDiffOperations.diffSecurityDescriptors(
+        _SECURITY_DESCRIPTOR_DATA, new_sd)
+    self.assertIsNone(diff["owner"])
+    self.assertIsNone(diff["group"])
+    self.assertIsNone(diff["control"])
+    self.assertEqual(diff["dacl"]["added"], [everyone_ace])
+    self.assertIsNone(diff["sacl"])
+
+    # Owner and control flags changes.
+    changed_sd = (
+        _SECURITY_DESCRIPTOR_DATA[:2] + struct.pack("<H", 0x9004) +
+        struct.pack("<I", 0x64) + _SECURITY_DESCRIPTOR_DATA[8:])
+    diff = SDDiffOperations.diffSecurityDescriptors(
+        _SECURITY_DESCRIPTOR_DATA, changed_sd)
+    self.assertEqual(diff["control"], (0x8004, 0x9004))
+    self.assertEqual(diff["owner"][1], _ADMINISTRATORS_SID)
+    self.assertIsNone(diff["group"])
+    self.assertIsNone(diff["dacl"])
+
+  def test_diff_security_descriptors_digests(self):
+    """Tests that digests decide instead of a byte comparison."""
+    everyone_ace = _CreateACE(_EVERYONE_SID)
+    new_sd = SDOperations.replaceACL(
+        _SECURITY_DESCRIPTOR_DATA, ACLOperations.ACL_TYPE_DACL,
+        _CreateACL([everyone_ace]))
+    old_digest = SDDiffOperations.sdDigest(_SECURITY_DESCRIPTOR_DATA)
+    new_digest = SDDiffOperations.sdDigest(new_sd)
+
+    # Equal digests dismiss the descriptors without looking at their bytes.
+    self.assertIsNone(SDDiffOperations.diffSecurityDescriptors(
+        _SECURITY_DESCRIPTOR_DATA, new_sd, old_digest, old_digest))
+
+    diff = SDDiffOperations.diffSecurityDescriptors(
+        _SECURITY_DESCRIPTOR_DATA, new_sd, old_digest, new_digest)
+    self.assertEqual(diff["dacl"]["added"], [everyone_ace])
+
+    # Different digests of equal bytes still produce a diff without changes.
+    diff = SDDiffOperations.diffSecurityDescriptors(
+        _SECURITY_DESCRIPTOR_DATA, _SECURITY_DESCRIPTOR_DATA,
+        old_digest, new_digest)
+    self.assertEqual(diff, {
+        "owner": None, "group": None, "control": None, "dacl": None,
+        "sacl": None})
+
+    # A single digest falls back to the byte comparison.
+    self.assertIsNone(SDDiffOperations.diffSecurityDescriptors(
+        _SECURITY_DESCRIPTOR_DATA, _SECURITY_DESCRIPTOR_DATA, old_digest))
+
+
+if __name__ == "__main__":
+  unittest.main(verbosity=2)
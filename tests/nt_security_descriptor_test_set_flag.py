@@ -0,0 +1,282 @@
+#!/usr/bin/env python
+#
+# Batch user cannot change password flag test script, runs against a local
+# LDAP stand-in
+#
+# Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+#
+# Refer to AUTHORS for acknowledgements.
+#
+# This software is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this software.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "nt_security_descriptor"))
+
+import ACLOperations
+import SDOperations
+import set_flag
+
+
+# Security descriptor with a DACL of 2 access allowed ACEs.
+_SECURITY_DESCRIPTOR_DATA = bytes(bytearray([
+    0x01, 0x00, 0x04, 0x80, 0x48, 0x00, 0x00, 0x00, 0x64, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 0x02, 0x00, 0x34, 0x00,
+    0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x14, 0x00, 0x9f, 0x01, 0x12, 0x00,
+    0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x12, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x18, 0x00, 0x9f, 0x01, 0x12, 0x00, 0x01, 0x02, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x05, 0x20, 0x00, 0x00, 0x00, 0x20, 0x02, 0x00, 0x00,
+    0x01, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x15, 0x00, 0x00, 0x00,
+    0x52, 0xaa, 0xc8, 0x68, 0xdd, 0xe8, 0xe4, 0x1c, 0x8a, 0xa7, 0x32, 0x3f,
+    0xeb, 0x03, 0x00, 0x00, 0x01, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05,
+    0x20, 0x00, 0x00, 0x00, 0x20, 0x02, 0x00, 0x00]))
+
+
+class FakeLDAPModule(object):
+  """Stand-in for the parts of the python-ldap module used by set_flag."""
+
+  SCOPE_BASE = 0
+
+  class LDAPError(Exception):
+    """Base LDAP error."""
+
+  class ADMINLIMIT_EXCEEDED(LDAPError):
+    """Administrative limit exceeded."""
+
+  class BUSY(LDAPError):
+    """Server busy."""
+
+  class INSUFFICIENT_ACCESS(LDAPError):
+    """Insufficient access."""
+
+  class NO_SUCH_OBJECT(LDAPError):
+    """No such object."""
+
+  class TIMEOUT(LDAPError):
+    """Timeout."""
+
+  class UNAVAILABLE(LDAPError):
+    """Server unavailable."""
+
+
+class FakeADException(Exception):
+  """Stand-in for the ADException of the Active Directory object."""
+
+
+class FakeLDAPConnection(object):
+  """Local LDAP stand-in implementing search_ext, modify and result.
+
+  Attributes:
+    entries (dict[str, tuple[str, dict]]): DN and attributes per objectGUID.
+    failures (dict[tuple[str, str], list[type]]): exceptions to raise, in
+        order, for the results of ("search", objectGUID) or ("modify", DN)
+        requests.
+    modifications (list[tuple[str, list]]): DN and modification list of each
+        modify that succeeded, in the order they completed.
+    submissions (list[tuple[str, str]]): kind and target of each submitted
+        request, in submission order.
+  """
+
+  def __init__(self, entries, failures=None):
+    """Initializes the connection.
+
+    Args:
+      entries (dict[str, tuple[str, dict]]): DN and attributes per objectGUID.
+      failures (Optional[dict[tuple[str, str], list[type]]]): exceptions to
+          raise for the results of requests.
+    """
+    super(FakeLDAPConnection, self).__init__()
+    self._last_message_identifier = 0
+    self._requests = {}
+    self.entries = entries
+    self.failures = failures or {}
+    self.modifications = []
+    self.submissions = []
+
+  def _Submit(self, kind, target, modification_list):
+    """Registers a request and returns its message identifier."""
+    self._last_message_identifier += 1
+    self._requests[self._last_message_identifier] = (
+        kind, target, modification_list)
+    self.submissions.append((kind, target))
+    return self._last_message_identifier
+
+  def search_ext(self, base, scope, filterstr, attrlist):
+    """Submits a base search on a <GUID=...> DN."""
+    assert base.startswith("<GUID=") and scope == FakeLDAPModule.SCOPE_BASE
+    return self._Submit("search", base[6:-1], None)
+
+  def modify(self, dn, modlist):
+    """Submits a modify."""
+    return self._Submit("modify", dn, modlist)
+
+  def result(self, msgid, all, timeout):
+    """Returns the result of a request or raises its scripted failure."""
+    kind, target, modification_list = self._requests.pop(msgid)
+    failures = self.failures.get((kind, target))
+    if failures:
+      raise failures.pop(0)()
+
+    if kind == "search":
+      if target not in self.entries:
+        raise FakeLDAPModule.NO_SUCH_OBJECT()
+      return (101, [self.entries[target]])
+
+    self.modifications.append((target, modification_list))
+    return (103, [])
+
+
+class FakeActiveDirectoryObject(object):
+  """Host object for the set_flag functions."""
+
+  setUserCannotChangePasswordFlagBatch = (
+      set_flag.setUserCannotChangePasswordFlagBatch)
+
+  def __init__(self, connection):
+    """Initializes the object.
+
+    Args:
+      connection (FakeLDAPConnection): LDAP connection.
+    """
+    super(FakeActiveDirectoryObject, self).__init__()
+    self.lConn = connection
+
+
+class SetUserCannotChangePasswordFlagBatchTests(unittest.TestCase):
+  """Tests the setUserCannotChangePasswordFlagBatch function."""
+
+  def setUp(self):
+    """Sets up the LDAP stand-in."""
+    self._ldap_module = set_flag.ldap
+    set_flag.ldap = FakeLDAPModule
+    set_flag.ADException = FakeADException
+
+  def tearDown(self):
+    """Restores the LDAP module."""
+    set_flag.ldap = self._ldap_module
+    del set_flag.ADException
+
+  def _CreateEntries(self, guids):
+    """Creates user entries with the test security descriptor.
+
+    Args:
+      guids (list[str]): objectGUIDs of the users.
+
+    Returns:
+      dict[str, tuple[str, dict]]: DN and attributes per objectGUID.
+    """
+    entries = {}
+    for guid in guids:
+      entries[guid] = ("CN={0:s},DC=example,DC=com".format(guid), {
+          "objectClass": ["top", "person", "user"],
+          "nTSecurityDescriptor": [_SECURITY_DESCRIPTOR_DATA]})
+    return entries
+
+  def _SetFlag(self, connection, guids, **kwargs):
+    """Runs the batch on a single process without retry delays."""
+    kwargs.setdefault("retryDelay", 0)
+    ad_object = FakeActiveDirectoryObject(connection)
+    return ad_object.setUserCannotChangePasswordFlagBatch(
+        guids, True, workers=1, **kwargs)
+
+  def test_success(self):
+    """Tests a batch where every request succeeds."""
+    connection = FakeLDAPConnection(self._CreateEntries(["g1", "g2"]))
+    results = self._SetFlag(connection, ["g1", "g2", "g1"], maxInFlight=1)
+
+    self.assertEqual(sorted(results.keys()), ["g1", "g2"])
+    self.assertIn("modified successfully", results["g1"])
+    self.assertEqual(len(connection.modifications), 2)
+
+    deny_everyone_ace = set_flag.buildUserCannotChangePasswordACEs()[0]
+    dn, modification_list = connection.modifications[0]
+    self.assertEqual(dn, "CN=g1,DC=example,DC=com")
+    dacl = SDOperations.aclBytes(
+        modification_list[0][2], ACLOperations.ACL_TYPE_DACL)
+    self.assertNotEqual(
+        ACLOperations.getACEIndex(dacl, deny_everyone_ace), -1)
+
+    # A user whose descriptor already has the ACEs is not modified.
+    entries = self._CreateEntries(["g1"])
+    entries["g1"][1]["nTSecurityDescriptor"] = [modification_list[0][2]]
+    connection = FakeLDAPConnection(entries)
+    results = self._SetFlag(connection, ["g1"])
+    self.assertIsNone(results["g1"])
+    self.assertEqual(connection.modifications, [])
+
+  def test_retry(self):
+    """Tests a batch where transient errors are retried."""
+    failures = {
+        ("search", "g1"): [FakeLDAPModule.UNAVAILABLE],
+        ("modify", "CN=g2,DC=example,DC=com"): [
+            FakeLDAPModule.BUSY, FakeLDAPModule.TIMEOUT]}
+    connection = FakeLDAPConnection(
+        self._CreateEntries(["g1", "g2", "g3"]), failures)
+    results = self._SetFlag(
+        connection, ["g1", "g2", "g3"], maxRetries=2, retryDelay=0.05)
+
+    for guid in ("g1", "g2", "g3"):
+      self.assertIn("modified successfully", results[guid])
+
+    # The retried modify does not hold back the other requests.
+    self.assertEqual(
+        connection.modifications[-1][0], "CN=g2,DC=example,DC=com")
+    self.assertEqual(connection.submissions.count(("search", "g1")), 2)
+    self.assertEqual(
+        connection.submissions.count(("modify", "CN=g2,DC=example,DC=com")), 3)
+
+  def test_failure(self):
+    """Tests a batch where requests fail."""
+    entries = self._CreateEntries(["g1", "g2", "g3"])
+    entries["g4"] = ("CN=g4,DC=example,DC=com", {
+        "objectClass": ["top", "group"],
+        "nTSecurityDescriptor": [_SECURITY_DESCRIPTOR_DATA]})
+    failures = {
+        ("modify", "CN=g1,DC=example,DC=com"): [FakeLDAPModule.BUSY] * 3,
+        ("modify", "CN=g2,DC=example,DC=com"): [
+            FakeLDAPModule.INSUFFICIENT_ACCESS],
+        ("search", "g3"): [FakeLDAPModule.INSUFFICIENT_ACCESS]}
+    connection = FakeLDAPConnection(entries, failures)
+    results = self._SetFlag(
+        connection, ["g1", "g2", "g3", "g4", "g5"], maxRetries=2)
+
+    for guid in ("g1", "g2", "g3", "g4", "g5"):
+      self.assertIsInstance(results[guid], FakeADException)
+    self.assertIn("could not be modified", str(results["g1"]))
+    self.assertIn("could not be read", str(results["g3"]))
+    self.assertIn("does not represent a user", str(results["g4"]))
+    self.assertIn("was not found", str(results["g5"]))
+
+    # Only transient errors are retried.
+    self.assertEqual(
+        connection.submissions.count(("modify", "CN=g1,DC=example,DC=com")), 3)
+    self.assertEqual(
+        connection.submissions.count(("modify", "CN=g2,DC=example,DC=com")), 1)
+    self.assertEqual(connection.modifications, [])
+
+  def test_missing_ldap_module(self):
+    """Tests a batch without the python-ldap module."""
+    set_flag.ldap = None
+    connection = FakeLDAPConnection(self._CreateEntries(["g1"]))
+
+    with self.assertRaisesRegexp(Exception, "python-ldap"):
+      self._SetFlag(connection, ["g1"])
+    self.assertEqual(connection.submissions, [])
+
+
+if __name__ == "__main__":
+  unittest.main(verbosity=2)
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+#
+# Python-bindings security descriptor type test script
+#
+# Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+#
+# Refer to AUTHORS for acknowledgements.
+#
+# This software is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this software.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+import pyfwnt
+
+
+_SECURITY_DESCRIPTOR_DATA = bytes(bytearray([
+    0x01, 0x00, 0x04, 0x80, 0x48, 0x00, 0x00, 0x00, 0x64, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 0x02, 0x00, 0x34, 0x00,
+    0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x14, 0x00, 0x9f, 0x01, 0x12, 0x00,
+    0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x12, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x18, 0x00, 0x9f, 0x01, 0x12, 0x00, 0x01, 0x02, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x05, 0x20, 0x00, 0x00, 0x00, 0x20, 0x02, 0x00, 0x00,
+    0x01, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x15, 0x00, 0x00, 0x00,
+    0x52, 0xaa, 0xc8, 0x68, 0xdd, 0xe8, 0xe4, 0x1c, 0x8a, 0xa7, 0x32, 0x3f,
+    0xeb, 0x03, 0x00, 0x00, 0x01, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05,
+    0x20, 0x00, 0x00, 0x00, 0x20, 0x02, 0x00, 0x00]))
+
+# ACCESS_DENIED_ACE with access mask 0x00010000 (DELETE) for S-1-1-0.
+_ACCESS_CONTROL_ENTRY_DATA = bytes(bytearray([
+    0x01, 0x00, 0x14, 0x00, 0x00, 0x00, 0x01, 0x00, 0x01, 0x01, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00]))
+
+
+class SecurityDescriptorTypeTests(unittest.TestCase):
+  """Tests the security descriptor type."""
+
+  def _CreateSecurityDescriptor(self):
+    """Creates a security descriptor from the test data.
+
+    Returns:
+      pyfwnt.security_descriptor: security descriptor.
+    """
+    security_descriptor = pyfwnt.security_descriptor()
+    security_descriptor.copy_from_byte_stream(_SECURITY_DESCRIPTOR_DATA)
+    return security_descriptor
+
+  def test_copy_to_byte_stream(self):
+    """Tests the copy_to_byte_stream function."""
+    security_descriptor = self._CreateSecurityDescriptor()
+
+    byte_stream = security_descriptor.copy_to_byte_stream()
+    self.assertEqual(byte_stream, _SECURITY_DESCRIPTOR_DATA)
+
+    discretionary_acl = security_descriptor.discretionary_acl
+    self.assertEqual(
+        discretionary_acl.copy_to_byte_stream(),
+        _SECURITY_DESCRIPTOR_DATA[20:72])
+
+    access_control_entry = discretionary_acl.get_entry(1)
+    self.assertEqual(
+        access_control_entry.copy_to_byte_stream(),
+        _SECURITY_DESCRIPTOR_DATA[48:72])
+
+    security_descriptor = pyfwnt.security_descriptor()
+    with self.assertRaises(ValueError):
+      security_descriptor.copy_to_byte_stream()
+
+  def test_control_flags(self):
+    """Tests the get_control_flags and set_control_flags functions."""
+    security_descriptor = self._CreateSecurityDescriptor()
+    self.assertEqual(security_descriptor.control_flags, 0x8004)
+
+    # The ACL present and self-relative flags are set when stored.
+    security_descriptor.set_control_flags(0x0400)
+    self.assertEqual(security_descriptor.get_control_flags(), 0x0400)
+
+    byte_stream = security_descriptor.copy_to_byte_stream()
+    self.assertEqual(byte_stream[2:4], b"\x04\x84")
+
+    with self.assertRaises(ValueError):
+      security_descriptor.set_control_flags(0x10000)
+
+  def test_set_owner(self):
+    """Tests the set_owner and set_group functions."""
+    security_descriptor = self._CreateSecurityDescriptor()
+    owner = security_descriptor.owner
+
+    security_descriptor.set_owner(security_descriptor.group)
+    self.assertEqual(security_descriptor.owner.get_string(), "S-1-5-32-544")
+
+    # A previously retrieved owner is not affected by the modification.
+    self.assertEqual(
+        owner.get_string(), "S-1-5-21-1757981266-484763869-1060284298-1003")
+
+    byte_stream = security_descriptor.copy_to_byte_stream()
+    self.assertEqual(len(byte_stream), 104)
+    self.assertEqual(byte_stream[72:88], _SECURITY_DESCRIPTOR_DATA[100:116])
+
+    security_descriptor.set_group(None)
+    self.assertIsNone(security_descriptor.group)
+
+    security_identifier = pyfwnt.security_identifier()
+    security_identifier.copy_from_byte_stream(_SECURITY_DESCRIPTOR_DATA[72:100])
+    security_descriptor.set_group(security_identifier)
+    self.assertEqual(
+        security_descriptor.group.get_string(),
+        "S-1-5-21-1757981266-484763869-1060284298-1003")
+
+    with self.assertRaises(TypeError):
+      security_descriptor.set_owner("S-1-5-18")
+
+  def test_set_discretionary_acl(self):
+    """Tests the set_discretionary_acl and set_system_acl functions."""
+    security_descriptor = self._CreateSecurityDescriptor()
+    discretionary_acl = security_descriptor.discretionary_acl
+
+    security_descriptor.set_discretionary_acl(None)
+    self.assertIsNone(security_descriptor.discretionary_acl)
+    self.assertEqual(security_descriptor.control_flags, 0x8000)
+    self.assertEqual(len(security_descriptor.copy_to_byte_stream()), 64)
+
+    security_descriptor.set_system_acl(discretionary_acl)
+    self.assertEqual(security_descriptor.control_flags, 0x8010)
+    self.assertEqual(security_descriptor.system_acl.number_of_entries, 2)
+
+    security_descriptor.set_system_acl(None)
+    security_descriptor.set_discretionary_acl(discretionary_acl)
+    self.assertEqual(
+        security_descriptor.copy_to_byte_stream(), _SECURITY_DESCRIPTOR_DATA)
+
+    with self.assertRaises(TypeError):
+      security_descriptor.set_discretionary_acl(b"\x02\x00\x08\x00")
+
+  def test_insert_discretionary_access_control_entry(self):
+    """Tests the insert and remove access control entry functions."""
+    security_descriptor = self._CreateSecurityDescriptor()
+    discretionary_acl = security_descriptor.discretionary_acl
+
+    security_descriptor.insert_discretionary_access_control_entry(
+        0, _ACCESS_CONTROL_ENTRY_DATA)
+
+    # A previously retrieved access control list is not affected.
+    self.assertEqual(discretionary_acl.number_of_entries, 2)
+
+    entries = list(security_descriptor.discretionary_acl.entries)
+    self.assertEqual(len(entries), 3)
+    self.assertEqual(entries[0].type, 1)
+    self.assertEqual(entries[0].access_mask, 0x00010000)
+    self.assertEqual(entries[0].security_identifier.get_string(), "S-1-1-0")
+
+    byte_stream = security_descriptor.copy_to_byte_stream()
+    self.assertEqual(len(byte_stream), 136)
+    self.assertEqual(byte_stream[20:28], b"\x02\x00\x48\x00\x03\x00\x00\x00")
+    self.assertEqual(byte_stream[28:48], _ACCESS_CONTROL_ENTRY_DATA)
+
+    security_descriptor.remove_discretionary_access_control_entry(0)
+    self.assertEqual(
+        security_descriptor.copy_to_byte_stream(), _SECURITY_DESCRIPTOR_DATA)
+
+    with self.assertRaises(IOError):
+      security_descriptor.remove_discretionary_access_control_entry(2)
+
+    with self.assertRaises(IOError):
+      security_descriptor.insert_discretionary_access_control_entry(
+          0, _ACCESS_CONTROL_ENTRY_DATA[:12])
+
+    with self.assertRaises(IOError):
+      security_descriptor.remove_system_access_control_entry(0)
+
+  def test_insert_system_access_control_entry(self):
+    """Tests inserting into a system access control list that is not set."""
+    security_descriptor = pyfwnt.security_descriptor()
+    security_descriptor.insert_system_access_control_entry(
+        0, _ACCESS_CONTROL_ENTRY_DATA)
+
+    self.assertIsNone(security_descriptor.owner)
+    self.assertEqual(security_descriptor.system_acl.number_of_entries, 1)
+
+    byte_stream = security_descriptor.copy_to_byte_stream()
+    self.assertEqual(byte_stream[:20], bytes(bytearray([
+        0x01, 0x00, 0x10, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+        0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00])))
+    self.assertEqual(byte_stream[28:], _ACCESS_CONTROL_ENTRY_DATA)
+
+
+if __name__ == "__main__":
+  unittest.main(verbosity=2)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+#
+# Python-bindings security identifier type test script
+#
+# Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+#
+# Refer to AUTHORS for acknowledgements.
+#
+# This software is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this software.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+import pyfwnt
+
+
+# S-1-5-18
+_LOCAL_SYSTEM_SID_DATA = bytes(bytearray([
+    0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x12, 0x00, 0x00, 0x00]))
+
+# S-1-5-32-544
+_ADMINISTRATORS_SID_DATA = bytes(bytearray([
+    0x01, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x20, 0x00, 0x00, 0x00,
+    0x20, 0x02, 0x00, 0x00]))
+
+
+class SecurityIdentifierTypeTests(unittest.TestCase):
+  """Tests the security identifier type."""
+
+  def _CreateSecurityIdentifier(self, data):
+    """Creates a security identifier.
+
+    Args:
+      data (bytes): security identifier data.
+
+    Returns:
+      pyfwnt.security_identifier: security identifier.
+    """
+    security_identifier = pyfwnt.security_identifier()
+    security_identifier.copy_from_byte_stream(data)
+    return security_identifier
+
+  def test_hash_and_compare(self):
+    """Tests hashing and comparing set security identifiers."""
+    local_system = self._CreateSecurityIdentifier(_LOCAL_SYSTEM_SID_DATA)
+    administrators = self._CreateSecurityIdentifier(_ADMINISTRATORS_SID_DATA)
+    other_local_system = self._CreateSecurityIdentifier(_LOCAL_SYSTEM_SID_DATA)
+
+    self.assertEqual(local_system, other_local_system)
+    self.assertEqual(hash(local_system), hash(other_local_system))
+    self.assertNotEqual(local_system, administrators)
+    self.assertLess(local_system, administrators)
+    self.assertIn(other_local_system, {local_system: None})
+    self.assertNotEqual(local_system, "S-1-5-18")
+
+  def test_hash_and_compare_unset(self):
+    """Tests hashing and comparing security identifiers that are not set."""
+    unset = pyfwnt.security_identifier()
+    other_unset = pyfwnt.security_identifier()
+    local_system = self._CreateSecurityIdentifier(_LOCAL_SYSTEM_SID_DATA)
+
+    # A security identifier that is not set only equals itself.
+    self.assertTrue(unset == unset)
+    self.assertFalse(unset != unset)
+    self.assertFalse(unset == other_unset)
+    self.assertTrue(unset != other_unset)
+    self.assertFalse(unset == local_system)
+    self.assertFalse(local_system == unset)
+    self.assertIn(unset, [local_system, unset])
+    self.assertNotIn(other_unset, [local_system, unset])
+
+    self.assertEqual(hash(unset), hash(unset))
+    self.assertIn(unset, set([unset]))
+
+    with self.assertRaises(TypeError):
+      _ = unset < local_system
+
+    with self.assertRaises(TypeError):
+      _ = local_system >= unset
+
+
+if __name__ == "__main__":
+  unittest.main(verbosity=2)
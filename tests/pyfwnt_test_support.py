@@ -19,11 +19,46 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this software.  If not, see <http://www.gnu.org/licenses/>.
 
+import struct
 import unittest
 
 import pyfwnt
 
 
+# Security descriptor with a DACL of 2 access allowed ACEs.
+_SECURITY_DESCRIPTOR_DATA = bytes(bytearray([
+    0x01, 0x00, 0x04, 0x80, 0x48, 0x00, 0x00, 0x00, 0x64, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 0x02, 0x00, 0x34, 0x00,
+    0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x14, 0x00, 0x9f, 0x01, 0x12, 0x00,
+    0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x12, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x18, 0x00, 0x9f, 0x01, 0x12, 0x00, 0x01, 0x02, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x05, 0x20, 0x00, 0x00, 0x00, 0x20, 0x02, 0x00, 0x00,
+    0x01, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x15, 0x00, 0x00, 0x00,
+    0x52, 0xaa, 0xc8, 0x68, 0xdd, 0xe8, 0xe4, 0x1c, 0x8a, 0xa7, 0x32, 0x3f,
+    0xeb, 0x03, 0x00, 0x00, 0x01, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05,
+    0x20, 0x00, 0x00, 0x00, 0x20, 0x02, 0x00, 0x00]))
+
+# LZNT1 compressed "abcabcabcabc": a compressed chunk of 3 literals followed
+# by a match of size 9 at offset 3.
+_LZNT1_COMPRESSED_DATA = bytes(bytearray([
+    0x05, 0xb0, 0x08, 0x61, 0x62, 0x63, 0x06, 0x20]))
+
+# LZXPRESS compressed "abcabcabcabc": an indicator of 3 literals followed by
+# a match of size 9 at offset 3.
+_LZXPRESS_COMPRESSED_DATA = bytes(bytearray([
+    0x00, 0x00, 0x00, 0x10, 0x61, 0x62, 0x63, 0x16, 0x00]))
+
+
+class _UnconvertibleToBoolean(object):
+  """Object that raises when it is converted to a boolean."""
+
+  def __bool__(self):
+    """Raises ValueError."""
+    raise ValueError("not a boolean")
+
+  __nonzero__ = __bool__
+
+
 class SupportFunctionsTests(unittest.TestCase):
   """Tests the support functions."""
 
@@ -34,6 +69,326 @@ class SupportFunctionsTests(unittest.TestCase):
     # TODO: check version.
     # self.assertEqual(version, "00000000")
 
+  def test_map_generic_rights(self):
+    """Tests the map_generic_rights function."""
+    file_generic_mapping = (0x00120089, 0x00120116, 0x001200a0, 0x001f01ff)
+
+    access_masks = bytearray(struct.pack(
+        "=6I", 0x80000000, 0x10000000, 0xc0000004, 0xa0000000, 0x00020000,
+        0x01000000))
+    pyfwnt.map_generic_rights(access_masks, file_generic_mapping)
+
+    self.assertEqual(struct.unpack("=6I", bytes(access_masks)), (
+        0x00120089, 0x001f01ff, 0x0012019f, 0x001200a9, 0x00020000,
+        0x01000000))
+
+    with self.assertRaises(ValueError):
+      pyfwnt.map_generic_rights(bytearray(6), file_generic_mapping)
+
+    with self.assertRaises(TypeError):
+      pyfwnt.map_generic_rights(None, file_generic_mapping)
+
+  def test_export_access_control_entries(self):
+    """Tests the export_access_control_entries function."""
+    security_descriptor = pyfwnt.security_descriptor()
+    security_descriptor.copy_from_byte_stream(_SECURITY_DESCRIPTOR_DATA)
+    discretionary_acl = security_descriptor.discretionary_acl
+
+    entries = discretionary_acl.export_entries()
+    self.assertEqual(entries["sids"], ["S-1-5-18", "S-1-5-32-544"])
+    self.assertEqual(bytes(entries["type"]), b"\x00\x00")
+    self.assertEqual(
+        struct.unpack("=2I", bytes(entries["access_mask"])),
+        (0x0012019f, 0x0012019f))
+    self.assertEqual(struct.unpack("=2I", bytes(entries["sid_index"])), (0, 1))
+    self.assertEqual(bytes(entries["object_type"]), b"\x00" * 32)
+
+    entries = pyfwnt.export_access_control_entries(
+        [discretionary_acl, discretionary_acl])
+    self.assertEqual(entries["sids"], ["S-1-5-18", "S-1-5-32-544"])
+    self.assertEqual(
+        struct.unpack("=4I", bytes(entries["acl_index"])), (0, 0, 1, 1))
+    self.assertEqual(
+        struct.unpack("=4I", bytes(entries["sid_index"])), (0, 1, 0, 1))
+
+    with self.assertRaises(TypeError):
+      pyfwnt.export_access_control_entries(None)
+
+    with self.assertRaises(TypeError):
+      pyfwnt.export_access_control_entries([None])
+
+  def test_language_tag_functions(self):
+    """Tests the language tag functions."""
+    self.assertEqual(pyfwnt.get_language_tag_identifier(0x0409), "en-US")
+    self.assertIsNone(pyfwnt.get_language_tag_identifier(0xffff))
+    self.assertEqual(
+        pyfwnt.get_language_tag_description(0x0409), "English, United States")
+    self.assertEqual(pyfwnt.get_language_tag_lcid("EN-us"), 0x0409)
+    self.assertIsNone(pyfwnt.get_language_tag_lcid("xx-YY"))
+    self.assertEqual(
+        pyfwnt.get_language_tag_identifiers([0x0409, 0xffff, 0x0407]),
+        ["en-US", None, "de-DE"])
+
+    with self.assertRaises(ValueError):
+      pyfwnt.get_language_tag_identifier("en-US")
+
+    with self.assertRaises(TypeError):
+      pyfwnt.get_language_tag_lcid(0x0409)
+
+  def test_validate_functions(self):
+    """Tests the security descriptor and access control list validators."""
+    self.assertEqual(
+        pyfwnt.validate_security_descriptor(_SECURITY_DESCRIPTOR_DATA), (0, 0))
+
+    # Data too small for the header.
+    self.assertEqual(
+        pyfwnt.validate_security_descriptor(_SECURITY_DESCRIPTOR_DATA[:10]),
+        (1, 0))
+
+    # Truncated group owner SID.
+    error, offset = pyfwnt.validate_security_descriptor(
+        _SECURITY_DESCRIPTOR_DATA[:-4])
+    self.assertNotEqual(error, 0)
+    self.assertEqual(offset, 100)
+
+    self.assertEqual(
+        pyfwnt.validate_access_control_list(_SECURITY_DESCRIPTOR_DATA[20:72]),
+        (0, 0))
+
+    error, _ = pyfwnt.validate_access_control_list(
+        _SECURITY_DESCRIPTOR_DATA[20:70])
+    self.assertNotEqual(error, 0)
+
+    with self.assertRaises(TypeError):
+      pyfwnt.validate_security_descriptor(None)
+
+    with self.assertRaises(TypeError):
+      pyfwnt.validate_access_control_list(None)
+
+  def test_find_functions(self):
+    """Tests the security descriptor and SID scanning functions."""
+    data = b"\xff" * 13 + _SECURITY_DESCRIPTOR_DATA + b"\xff" * 7
+
+    self.assertEqual(pyfwnt.find_security_descriptor(data), (13, 116))
+    self.assertIsNone(pyfwnt.find_security_descriptor(data, alignment=4))
+    self.assertIsNone(pyfwnt.find_security_descriptor(data, start_offset=14))
+
+    # The local system SID of the first ACE.
+    data = b"\xff" * 5 + _SECURITY_DESCRIPTOR_DATA[36:48] + b"\xff" * 3
+    self.assertEqual(pyfwnt.find_security_identifier(data), (5, 12))
+
+    # The end offset bounds the start of a match, not its end.
+    self.assertIsNone(pyfwnt.find_security_identifier(data, end_offset=5))
+    self.assertEqual(
+        pyfwnt.find_security_identifier(data, end_offset=6), (5, 12))
+
+    with self.assertRaises(ValueError):
+      pyfwnt.find_security_descriptor(b"", 5)
+
+    with self.assertRaises(ValueError):
+      pyfwnt.find_security_identifier(data, alignment=0)
+
+    with self.assertRaises(TypeError):
+      pyfwnt.find_security_descriptor(None)
+
+  def test_statistics_functions(self):
+    """Tests the statistics functions."""
+    compressed_data = pyfwnt.lzxpress_huffman_compress(b"abc" * 1000)
+
+    pyfwnt.set_statistics_enabled(True)
+    try:
+      pyfwnt.reset_statistics()
+      pyfwnt.lzxpress_huffman_decompress(compressed_data, 3000)
+
+      statistics = pyfwnt.get_statistics()["lzxpress_huffman_decompress"]
+      self.assertEqual(statistics["number_of_calls"], 1)
+      self.assertEqual(
+          statistics["number_of_input_bytes"], len(compressed_data))
+      self.assertEqual(statistics["number_of_output_bytes"], 3000)
+
+      pyfwnt.reset_statistics()
+      statistics = pyfwnt.get_statistics()["lzxpress_huffman_decompress"]
+      self.assertEqual(statistics["number_of_calls"], 0)
+
+    finally:
+      pyfwnt.set_statistics_enabled(False)
+
+    pyfwnt.lzxpress_huffman_decompress(compressed_data, 3000)
+    statistics = pyfwnt.get_statistics()["lzxpress_huffman_decompress"]
+    self.assertEqual(statistics["number_of_calls"], 0)
+
+    with self.assertRaises(RuntimeError):
+      pyfwnt.set_statistics_enabled(_UnconvertibleToBoolean())
+
+  def test_lznt1_decompress(self):
+    """Tests the lznt1_decompress function."""
+    uncompressed_data = pyfwnt.lznt1_decompress(_LZNT1_COMPRESSED_DATA, 12)
+    self.assertEqual(uncompressed_data, b"abcabcabcabc")
+
+    # The uncompressed data size is determined from the chunk headers.
+    uncompressed_data = pyfwnt.lznt1_decompress(_LZNT1_COMPRESSED_DATA)
+    self.assertEqual(uncompressed_data, b"abcabcabcabc")
+
+    uncompressed_data = pyfwnt.lznt1_decompress(
+        _LZNT1_COMPRESSED_DATA + b"\x00\x00", uncompressed_data_size=None)
+    self.assertEqual(uncompressed_data, b"abcabcabcabc")
+
+    self.assertEqual(pyfwnt.lznt1_decompress(_LZNT1_COMPRESSED_DATA, 0), b"")
+
+    # Chunk data truncated.
+    with self.assertRaises(IOError):
+      pyfwnt.lznt1_decompress(_LZNT1_COMPRESSED_DATA[:-1])
+
+    # Chunk header truncated.
+    with self.assertRaises(IOError):
+      pyfwnt.lznt1_decompress(_LZNT1_COMPRESSED_DATA[:1])
+
+    # Match offset before the start of the uncompressed data.
+    compressed_data = _LZNT1_COMPRESSED_DATA[:-1] + b"\x50"
+    with self.assertRaises(IOError):
+      pyfwnt.lznt1_decompress(compressed_data)
+
+    with self.assertRaises(IOError):
+      pyfwnt.lznt1_decompress(compressed_data, 12)
+
+    # Uncompressed data size too small for the match.
+    with self.assertRaises(IOError):
+      pyfwnt.lznt1_decompress(_LZNT1_COMPRESSED_DATA, 11)
+
+    with self.assertRaises(ValueError):
+      pyfwnt.lznt1_decompress(_LZNT1_COMPRESSED_DATA, -1)
+
+    with self.assertRaises(TypeError):
+      pyfwnt.lznt1_decompress(None)
+
+  def test_lzxpress_decompress(self):
+    """Tests the lzxpress_decompress function."""
+    uncompressed_data = pyfwnt.lzxpress_decompress(
+        _LZXPRESS_COMPRESSED_DATA, 12)
+    self.assertEqual(uncompressed_data, b"abcabcabcabc")
+
+    # The uncompressed data is shrunk to the size that was decompressed.
+    uncompressed_data = pyfwnt.lzxpress_decompress(
+        _LZXPRESS_COMPRESSED_DATA, uncompressed_data_size=100)
+    self.assertEqual(uncompressed_data, b"abcabcabcabc")
+
+    uncompressed_data = pyfwnt.lzxpress_decompress(
+        _LZXPRESS_COMPRESSED_DATA, 2)
+    self.assertEqual(uncompressed_data, b"ab")
+
+    # Compressed data that ends between tokens.
+    uncompressed_data = pyfwnt.lzxpress_decompress(
+        _LZXPRESS_COMPRESSED_DATA[:6], 12)
+    self.assertEqual(uncompressed_data, b"ab")
+
+    # Match truncated.
+    with self.assertRaises(IOError):
+      pyfwnt.lzxpress_decompress(_LZXPRESS_COMPRESSED_DATA[:8], 12)
+
+    # Indicator truncated.
+    with self.assertRaises(IOError):
+      pyfwnt.lzxpress_decompress(_LZXPRESS_COMPRESSED_DATA[:3], 12)
+
+    # Match offset before the start of the uncompressed data.
+    with self.assertRaises(IOError):
+      pyfwnt.lzxpress_decompress(b"\x00\x00\x00\x80\x16\x00", 12)
+
+    # Uncompressed data size too small for the match.
+    with self.assertRaises(IOError):
+      pyfwnt.lzxpress_decompress(_LZXPRESS_COMPRESSED_DATA, 11)
+
+    with self.assertRaises(ValueError):
+      pyfwnt.lzxpress_decompress(_LZXPRESS_COMPRESSED_DATA, -1)
+
+    with self.assertRaises(TypeError):
+      pyfwnt.lzxpress_decompress(None, 12)
+
+  def test_lzxpress_huffman_compress(self):
+    """Tests the lzxpress_huffman_compress function."""
+    uncompressed_data = b"abc" * 1000
+    compressed_data = pyfwnt.lzxpress_huffman_compress(uncompressed_data)
+    self.assertLess(len(compressed_data), len(uncompressed_data))
+    self.assertEqual(pyfwnt.lzxpress_huffman_decompress(
+        compressed_data, len(uncompressed_data)), uncompressed_data)
+
+    # Data of multiple chunks compressed on multiple threads.
+    uncompressed_data = bytes(bytearray(
+        (index * 7) % 251 for index in range(200000)))
+    compressed_data = pyfwnt.lzxpress_huffman_compress(
+        uncompressed_data, compression_level=9, number_of_threads=3)
+    self.assertEqual(pyfwnt.lzxpress_huffman_decompress(
+        compressed_data, len(uncompressed_data)), uncompressed_data)
+
+    compressed_data = pyfwnt.lzxpress_huffman_compress(b"")
+    self.assertEqual(
+        pyfwnt.lzxpress_huffman_decompress(compressed_data, 0), b"")
+
+    with self.assertRaises(IOError):
+      pyfwnt.lzxpress_huffman_compress(b"abc", compression_level=10)
+
+    with self.assertRaises(IOError):
+      pyfwnt.lzxpress_huffman_compress(b"abc", number_of_threads=-1)
+
+    with self.assertRaises(TypeError):
+      pyfwnt.lzxpress_huffman_compress(u"abc")
+
+  def test_wof_stream(self):
+    """Tests the wof_stream type."""
+    uncompressed_data = bytes(bytearray(
+        ord("a") + ((index * 13) % 7) for index in range(10000)))
+
+    # XPRESS4K chunk offsets table followed by a compressed, an uncompressed
+    # and a compressed chunk.
+    first_chunk = pyfwnt.lzxpress_huffman_compress(uncompressed_data[:4096])
+    second_chunk = uncompressed_data[4096:8192]
+    last_chunk = pyfwnt.lzxpress_huffman_compress(uncompressed_data[8192:])
+    compressed_data = b"".join([
+        struct.pack(
+            "<2I", len(first_chunk), len(first_chunk) + len(second_chunk)),
+        first_chunk, second_chunk, last_chunk])
+
+    wof_stream = pyfwnt.wof_stream()
+
+    with self.assertRaises(IOError):
+      wof_stream.read_buffer(16)
+
+    wof_stream.set_compressed_data(compressed_data, len(uncompressed_data))
+    self.assertEqual(wof_stream.get_size(), len(uncompressed_data))
+    self.assertEqual(wof_stream.read_buffer(), uncompressed_data)
+    self.assertEqual(wof_stream.get_offset(), len(uncompressed_data))
+    self.assertEqual(wof_stream.read_buffer(16), b"")
+
+    wof_stream.seek(4090)
+    self.assertEqual(wof_stream.read(12), uncompressed_data[4090:4102])
+    self.assertEqual(wof_stream.tell(), 4102)
+
+    # Reading at an offset does not change the current offset.
+    self.assertEqual(
+        wof_stream.read_buffer_at_offset(100, 9950), uncompressed_data[9950:])
+    self.assertEqual(wof_stream.tell(), 4102)
+
+    with self.assertRaises(IOError):
+      wof_stream.seek(-1)
+
+    with self.assertRaises(ValueError):
+      wof_stream.read_buffer_at_offset(16, -1)
+
+    with self.assertRaises(IOError):
+      wof_stream.set_compressed_data(compressed_data, len(uncompressed_data))
+
+    wof_stream = pyfwnt.wof_stream()
+
+    with self.assertRaises(IOError):
+      wof_stream.set_compressed_data(
+          compressed_data[:7], len(uncompressed_data))
+
+    with self.assertRaises(IOError):
+      wof_stream.set_compressed_data(
+          compressed_data, len(uncompressed_data), compression_method=99)
+
+    with self.assertRaises(TypeError):
+      wof_stream.set_compressed_data(None, len(uncompressed_data))
+
 
 if __name__ == "__main__":
   unittest.main(verbosity=2)
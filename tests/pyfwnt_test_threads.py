@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+#
+# Python-bindings multi-threading stress test and scaling benchmark script
+#
+# Copyright (C) 2009-2017, Joachim Metz <joachim.metz@gmail.com>
+#
+# Refer to AUTHORS for acknowledgements.
+#
+# This software is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this software.  If not, see <http://www.gnu.org/licenses/>.
+
+import argparse
+import multiprocessing
+import sys
+import threading
+import time
+import unittest
+
+import pyfwnt
+
+
+_SECURITY_DESCRIPTOR_DATA = bytes(bytearray([
+    0x01, 0x00, 0x04, 0x80, 0x48, 0x00, 0x00, 0x00, 0x64, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 0x02, 0x00, 0x34, 0x00,
+    0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x14, 0x00, 0x9f, 0x01, 0x12, 0x00,
+    0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x12, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x18, 0x00, 0x9f, 0x01, 0x12, 0x00, 0x01, 0x02, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x05, 0x20, 0x00, 0x00, 0x00, 0x20, 0x02, 0x00, 0x00,
+    0x01, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x15, 0x00, 0x00, 0x00,
+    0x52, 0xaa, 0xc8, 0x68, 0xdd, 0xe8, 0xe4, 0x1c, 0x8a, 0xa7, 0x32, 0x3f,
+    0xeb, 0x03, 0x00, 0x00, 0x01, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05,
+    0x20, 0x00, 0x00, 0x00, 0x20, 0x02, 0x00, 0x00]))
+
+_SECURITY_IDENTIFIER_DATA = bytes(bytearray([
+    0x01, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x20, 0x00, 0x00, 0x00,
+    0x20, 0x02, 0x00, 0x00]))
+
+_EXPECTED_SUMMARY = (
+    "S-1-5-21-1757981266-484763869-1060284298-1003",
+    "S-1-5-32-544",
+    ((0x00, 0x00, 0x0012019f, "S-1-5-18"),
+     (0x00, 0x00, 0x0012019f, "S-1-5-32-544")))
+
+
+def _SummarizeSecurityDescriptor(security_descriptor):
+  """Retrieves the values of a security descriptor and its children.
+
+  Args:
+    security_descriptor (pyfwnt.security_descriptor): security descriptor.
+
+  Returns:
+    tuple: owner, group and (type, flags, access mask, SID) of every
+        discretionary ACE.
+  """
+  entries = []
+  for access_control_entry in security_descriptor.discretionary_acl.entries:
+    entries.append((
+        access_control_entry.type, access_control_entry.flags,
+        access_control_entry.access_mask,
+        access_control_entry.security_identifier.get_string()))
+
+  return (
+      security_descriptor.owner.get_string(),
+      security_descriptor.group.get_string(), tuple(entries))
+
+
+def _ParseAndSummarize(number_of_iterations):
+  """Parses and summarizes security descriptors.
+
+  Args:
+    number_of_iterations (int): number of security descriptors to parse.
+
+  Returns:
+    bool: True if every summary matched the expected summary.
+  """
+  result = True
+  for _ in range(number_of_iterations):
+    security_descriptor = pyfwnt.security_descriptor()
+    security_descriptor.copy_from_byte_stream(_SECURITY_DESCRIPTOR_DATA)
+    if _SummarizeSecurityDescriptor(security_descriptor) != _EXPECTED_SUMMARY:
+      result = False
+
+  return result
+
+
+def _RunThreads(number_of_threads, target, *arguments):
+  """Runs a function in multiple threads that start at the same time.
+
+  Args:
+    number_of_threads (int): number of threads.
+    target (function): function to run, of which the return value is stored.
+    arguments (list[object]): arguments to pass to the function.
+
+  Returns:
+    tuple[list[object], float]: return values of the function per thread and
+        the number of seconds it took for all threads to finish.
+  """
+  # threading.Barrier is not available on Python 2, the threads count
+  # themselves in on a condition and wait on an event to start instead.
+  ready_condition = threading.Condition()
+  ready_threads = [0]
+  start_event = threading.Event()
+  results = [None] * number_of_threads
+
+  def _Worker(thread_index):
+    with ready_condition:
+      ready_threads[0] += 1
+      ready_condition.notify()
+    start_event.wait()
+    try:
+      results[thread_index] = target(*arguments)
+    except Exception as exception:  # pylint: disable=broad-except
+      results[thread_index] = exception
+
+  threads = [
+      threading.Thread(target=_Worker, args=(thread_index, ))
+      for thread_index in range(number_of_threads)]
+  for thread in threads:
+    thread.start()
+
+  with ready_condition:
+    while ready_threads[0] < number_of_threads:
+      ready_condition.wait()
+
+  start_time = time.time()
+  start_event.set()
+
+  for thread in threads:
+    thread.join()
+
+  return results, time.time() - start_time
+
+
+class ThreadsTests(unittest.TestCase):
+  """Tests sharing pyfwnt objects between threads."""
+
+  _NUMBER_OF_THREADS = 8
+
+  def test_shared_security_descriptor(self):
+    """Tests reading a security descriptor from multiple threads."""
+    security_descriptor = pyfwnt.security_descriptor()
+    security_descriptor.copy_from_byte_stream(_SECURITY_DESCRIPTOR_DATA)
+
+    def _Summarize():
+      return [
+          _SummarizeSecurityDescriptor(security_descriptor)
+          for _ in range(500)]
+
+    results, _ = _RunThreads(self._NUMBER_OF_THREADS, _Summarize)
+    for summaries in results:
+      self.assertEqual(summaries, [_EXPECTED_SUMMARY] * 500)
+
+  def test_shared_access_control_entries_iterator(self):
+    """Tests iterating access control entries from multiple threads."""
+    security_descriptor = pyfwnt.security_descriptor()
+    security_descriptor.copy_from_byte_stream(_SECURITY_DESCRIPTOR_DATA)
+
+    for _ in range(200):
+      iterator = iter(security_descriptor.discretionary_acl.entries)
+      results, _ = _RunThreads(4, list, iterator)
+
+      # Every entry is returned by exactly one of the threads.
+      access_masks = [
+          access_control_entry.access_mask
+          for entries in results for access_control_entry in entries]
+      self.assertEqual(len(access_masks), 2)
+
+  def test_concurrent_copy_from_byte_stream(self):
+    """Tests copying a security identifier from multiple threads."""
+    for _ in range(200):
+      security_identifier = pyfwnt.security_identifier()
+
+      def _Copy():
+        security_identifier.copy_from_byte_stream(_SECURITY_IDENTIFIER_DATA)
+        return True
+
+      results, _ = _RunThreads(4, _Copy)
+
+      # Only one of the threads sets the security identifier.
+      self.assertEqual(results.count(True), 1)
+      for result in results:
+        if result is not True:
+          self.assertIsInstance(result, IOError)
+
+      self.assertEqual(security_identifier.get_string(), "S-1-5-32-544")
+
+  def test_copy_from_byte_stream_is_set_once(self):
+    """Tests that a set security descriptor or identifier is not modified."""
+    security_descriptor = pyfwnt.security_descriptor()
+    security_descriptor.copy_from_byte_stream(_SECURITY_DESCRIPTOR_DATA)
+
+    with self.assertRaises(IOError):
+      security_descriptor.copy_from_byte_stream(_SECURITY_DESCRIPTOR_DATA)
+
+    owner = security_descriptor.owner
+    with self.assertRaises(IOError):
+      owner.copy_from_byte_stream(_SECURITY_IDENTIFIER_DATA)
+
+    self.assertEqual(
+        _SummarizeSecurityDescriptor(security_descriptor), _EXPECTED_SUMMARY)
+
+  def test_parse_in_threads(self):
+    """Tests parsing security descriptors in multiple threads."""
+    results, _ = _RunThreads(self._NUMBER_OF_THREADS, _ParseAndSummarize, 500)
+    self.assertEqual(results, [True] * self._NUMBER_OF_THREADS)
+
+
+def Benchmark(maximum_number_of_threads, number_of_iterations):
+  """Prints the throughput of parsing security descriptors per thread count.
+
+  Args:
+    maximum_number_of_threads (int): maximum number of threads.
+    number_of_iterations (int): number of security descriptors every thread
+        parses.
+  """
+  gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+  print("GIL enabled: {0!s}".format(gil_enabled))
+  print("threads\tdescriptors/s\tscaling")
+
+  single_thread_rate = None
+  number_of_threads = 1
+  while number_of_threads <= maximum_number_of_threads:
+    _, elapsed_time = _RunThreads(
+        number_of_threads, _ParseAndSummarize, number_of_iterations)
+    rate = (number_of_threads * number_of_iterations) / max(elapsed_time, 1e-9)
+    if single_thread_rate is None:
+      single_thread_rate = rate
+
+    print("{0:d}\t{1:.0f}\t{2:.2f}".format(
+        number_of_threads, rate, rate / single_thread_rate))
+    number_of_threads *= 2
+
+
+if __name__ == "__main__":
+  argument_parser = argparse.ArgumentParser()
+  argument_parser.add_argument(
+      "--benchmark", action="store_true", default=False,
+      help="print the scaling of the throughput with the number of threads")
+  argument_parser.add_argument(
+      "--iterations", type=int, default=20000,
+      help="number of security descriptors every benchmark thread parses")
+  argument_parser.add_argument(
+      "--threads", type=int, default=multiprocessing.cpu_count(),
+      help="maximum number of benchmark threads")
+  options, unittest_arguments = argument_parser.parse_known_args()
+
+  if options.benchmark:
+    Benchmark(options.threads, options.iterations)
+  else:
+    unittest.main(argv=[sys.argv[0]] + unittest_arguments, verbosity=2)
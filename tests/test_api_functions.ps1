@@ -10,7 +10,7 @@ $TestPrefix = Split-Path -path ${Pwd}.Path -parent
 $TestPrefix = Split-Path -path ${TestPrefix} -leaf
 $TestPrefix = ${TestPrefix}.Substring(3)
 
-$TestFunctions = "error lznt1 lzxpress support"
+$TestFunctions = "access_mask error locale_identifier lznt1 lzxpress scan statistics support validate"
 $TestFunctionsWithInput = ""
 
 $TestToolDirectory = "..\msvscpp\Release"
@@ -11,7 +11,7 @@ TEST_PREFIX=`dirname ${PWD}`;
 TEST_PREFIX=`basename ${TEST_PREFIX} | sed 's/^lib\([^-]*\).*$/\1/'`;
 
 TEST_PROFILE="lib${TEST_PREFIX}";
-TEST_FUNCTIONS="error lznt1 lzxpress support";
+TEST_FUNCTIONS="access_mask error locale_identifier lz77 lznt1 lzxpress scan statistics support validate";
 TEST_FUNCTIONS_WITH_INPUT="";
 OPTION_SETS="";
 
@@ -10,7 +10,7 @@ $TestPrefix = Split-Path -path ${Pwd}.Path -parent
 $TestPrefix = Split-Path -path ${TestPrefix} -leaf
 $TestPrefix = ${TestPrefix}.Substring(3)
 
-$TestTypes = "access_control_entry access_control_list security_descriptor security_identifier"
+$TestTypes = "access_control_entry access_control_list compressed_attribute lzxpress_huffman_decoder security_descriptor security_identifier wof_stream"
 $TestTypesWithInput = ""
 
 $TestToolDirectory = "..\msvscpp\Release"
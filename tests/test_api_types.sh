@@ -11,7 +11,7 @@ TEST_PREFIX=`dirname ${PWD}`;
 TEST_PREFIX=`basename ${TEST_PREFIX} | sed 's/^lib\([^-]*\).*$/\1/'`;
 
 TEST_PROFILE="lib${TEST_PREFIX}";
-TEST_TYPES="access_control_entry access_control_list security_descriptor security_identifier";
+TEST_TYPES="access_control_entry access_control_list compressed_attribute lzxpress_huffman_decoder security_descriptor security_identifier wof_stream";
 TEST_TYPES_WITH_INPUT="";
 OPTION_SETS="";
 
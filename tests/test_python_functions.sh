@@ -11,8 +11,9 @@ TEST_PREFIX=`dirname ${PWD}`;
 TEST_PREFIX=`basename ${TEST_PREFIX} | sed 's/^lib\([^-]*\).*$/\1/'`;
 
 TEST_PROFILE="py${TEST_PREFIX}";
-TEST_FUNCTIONS="support";
+TEST_FUNCTIONS="security_descriptor security_identifier support threads";
 TEST_FUNCTIONS_WITH_INPUT="";
+TEST_HELPERS="acl acl_rewrite claim_ace conditional_ace replace_attrs sd_diff set_flag";
 OPTION_SETS="";
 
 TEST_TOOL_DIRECTORY=".";
@@ -45,6 +46,20 @@ test_python_function_with_input()
 	return ${RESULT};
 }
 
+test_helper()
+{
+	local TEST_HELPER=$1;
+
+	local TEST_DESCRIPTION="Testing nt_security_descriptor helpers: ${TEST_HELPER}";
+	local TEST_SCRIPT="${TEST_TOOL_DIRECTORY}/nt_security_descriptor_test_${TEST_HELPER}.py";
+
+	# The nt_security_descriptor helpers are written for Python 2.
+	PYTHON_VERSION=2 run_test_with_arguments "${TEST_DESCRIPTION}" "${TEST_SCRIPT}";
+	local RESULT=$?;
+
+	return ${RESULT};
+}
+
 if ! test -z ${SKIP_PYTHON_TESTS};
 then
 	exit ${EXIT_IGNORE};
@@ -84,6 +99,25 @@ then
 	exit ${RESULT};
 fi
 
+if test -x "`which python2 2> /dev/null`";
+then
+	for TEST_HELPER in ${TEST_HELPERS};
+	do
+		test_helper "${TEST_HELPER}";
+		RESULT=$?;
+
+		if test ${RESULT} -ne ${EXIT_SUCCESS};
+		then
+			break;
+		fi
+	done
+
+	if test ${RESULT} -ne ${EXIT_SUCCESS} && test ${RESULT} -ne ${EXIT_IGNORE};
+	then
+		exit ${RESULT};
+	fi
+fi
+
 for TEST_FUNCTION in ${TEST_FUNCTIONS_WITH_INPUT};
 do
 	test_python_function_with_input "${TEST_FUNCTION}";